@@ -0,0 +1,67 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Batch scaling benchmark: 9 weight x 2 casual static instances across
+an increasing number of worker processes.
+
+Usage: python benchmarks/bench_batch.py [FONT_PATH]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from slice.batch import run_jobs
+from slice.engine import SliceJob
+
+DEFAULT_FONT_PATH = Path("tests/assets/fonts/Recursive-VF.subset.ttf")
+
+
+def get_jobs(fontpath, outdir):
+    return [
+        SliceJob(
+            str(fontpath),
+            str(Path(outdir) / f"instance-{weight}-{casual}.ttf"),
+            {"wght": float(weight), "CASL": float(casual)},
+        )
+        for weight in range(300, 1001, 87)
+        for casual in (0, 1)
+    ]
+
+
+def main(argv):
+    fontpath = Path(argv[0]) if argv else DEFAULT_FONT_PATH
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1)))
+
+    print(f"{fontpath.name}, {cpu_count} CPUs")
+    print(f"{'workers':>8} {'jobs':>6} {'wall (s)':>10} {'speedup':>8}")
+    serial = None
+    for workers in worker_counts:
+        with tempfile.TemporaryDirectory() as outdir:
+            jobs = get_jobs(fontpath, outdir)
+            start = time.perf_counter()
+            for _, _, error in run_jobs(jobs, max_workers=workers):
+                if error:
+                    raise error
+            wall = time.perf_counter() - start
+        serial = serial or wall
+        print(f"{workers:8} {len(jobs):6} {wall:10.3f} {serial / wall:7.2f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
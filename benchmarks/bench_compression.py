@@ -0,0 +1,74 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Compression benchmark: WOFF/WOFF2 file size vs. write time for each
+compression profile on a static instance of the test fonts.
+
+Usage: python benchmarks/bench_compression.py [FONT_PATH ...]
+"""
+
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+from slice.compression import CompressionProfile, compression_profile
+from slice.engine import instantiate_variable_font
+from slice.fontsession import FontSession
+
+DEFAULT_FONT_PATHS = [
+    Path("tests/assets/fonts/Recursive-VF.subset.ttf"),
+]
+
+PROFILES = [
+    ("woff", "zlib-fast", CompressionProfile(woff="zlib-fast")),
+    ("woff", "zlib-9", CompressionProfile(woff="zlib-9")),
+    ("woff", "zopfli x1", CompressionProfile(woff="zopfli", zopfli_iterations=1)),
+    ("woff", "zopfli x15", CompressionProfile(woff="zopfli", zopfli_iterations=15)),
+    ("woff", "zopfli x50", CompressionProfile(woff="zopfli", zopfli_iterations=50)),
+    ("woff2", "brotli q1", CompressionProfile(brotli_quality=1)),
+    ("woff2", "brotli q5", CompressionProfile(brotli_quality=5)),
+    ("woff2", "brotli q9", CompressionProfile(brotli_quality=9)),
+    ("woff2", "brotli q11", CompressionProfile(brotli_quality=11)),
+]
+
+
+def time_save(session, flavor, profile, repeat=5):
+    ttfont = session.new_ttfont()
+    instantiate_variable_font(ttfont, {"wght": 700.0})
+    ttfont.flavor = flavor
+    timings = []
+    for _ in range(repeat):
+        buf = BytesIO()
+        start = time.perf_counter()
+        with compression_profile(profile):
+            ttfont.save(buf)
+        timings.append(time.perf_counter() - start)
+    return min(timings), len(buf.getvalue())
+
+
+def main(argv):
+    fontpaths = [Path(arg) for arg in argv] or DEFAULT_FONT_PATHS
+    for fontpath in fontpaths:
+        session = FontSession(fontpath)
+        print(f"\n{fontpath.name}")
+        print(f"{'flavor':>6} {'profile':>12} {'size (B)':>10} {'time (ms)':>10}")
+        for flavor, label, profile in PROFILES:
+            seconds, size = time_save(session, flavor, profile)
+            print(f"{flavor:>6} {label:>12} {size:10} {seconds * 1000:10.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,130 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Daemon benchmark: repeat command line invocations with a new interpreter
+per command (python -m slice.cli) vs. the thin client of a running slice
+daemon (python -m slice.client).  Each invocation writes an instance at a
+different weight so that the retained instance is not re-used.  The
+default font list is the test fonts and a generated stress font.
+
+Usage: python benchmarks/bench_daemon.py [REPEAT] [FONT_PATH ...]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "suite"))
+from stressfont import build_stress_font  # noqa: E402
+
+DEFAULT_FONT_PATHS = [
+    Path("tests/assets/fonts/Recursive-VF.subset.ttf"),
+]
+
+STRESS_GLYPH_COUNT = 2000
+
+# seconds to wait on the daemon socket
+DAEMON_START_TIMEOUT = 30
+
+
+def time_invocations(module, fontpath, outdir, repeat, env):
+    timings = []
+    for x in range(repeat):
+        outpath = os.path.join(outdir, f"{module}-{x}.ttf")
+        start = time.perf_counter()
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                module,
+                str(fontpath),
+                "-o",
+                outpath,
+                "--axis",
+                f"wght={400 + x * 10}",
+            ],
+            check=True,
+            capture_output=True,
+            env=env,
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def start_daemon(socket_path, env):
+    daemon = subprocess.Popen(
+        [sys.executable, "-m", "slice.daemon", "--socket", socket_path],
+        stdout=subprocess.DEVNULL,
+        env=env,
+    )
+    deadline = time.perf_counter() + DAEMON_START_TIMEOUT
+    while not os.path.exists(socket_path):
+        if time.perf_counter() > deadline or daemon.poll() is not None:
+            daemon.kill()
+            raise RuntimeError("The slice daemon did not start")
+        time.sleep(0.05)
+    return daemon
+
+
+def bench_font(fontpath, repeat, env):
+    with tempfile.TemporaryDirectory() as outdir:
+        cli = time_invocations("slice.cli", fontpath, outdir, repeat, env)
+        daemon = start_daemon(env["SLICE_DAEMON_SOCKET"], env)
+        try:
+            client = time_invocations("slice.client", fontpath, outdir, repeat, env)
+        finally:
+            subprocess.run(
+                [sys.executable, "-m", "slice.daemon", "--stop"],
+                env=env,
+                capture_output=True,
+            )
+            daemon.wait()
+
+    print(Path(fontpath).name)
+    print(f"  {'invocation':32} {'first (ms)':>11} {'median (ms)':>12} {'speedup':>8}")
+    for label, timings in (
+        ("python -m slice.cli", cli),
+        ("python -m slice.client (daemon)", client),
+    ):
+        median = statistics.median(timings[1:] if len(timings) > 1 else timings)
+        cli_median = statistics.median(cli[1:] if len(cli) > 1 else cli)
+        print(
+            f"  {label:32} {timings[0] * 1000:11.1f} {median * 1000:12.1f} "
+            f"{cli_median / median:7.2f}x"
+        )
+
+
+def main(argv):
+    repeat = int(argv[0]) if argv else 10
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p and Path(p).is_dir())
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env["SLICE_DAEMON_SOCKET"] = os.path.join(tmpdir, "slice-bench.sock")
+        if len(argv) > 1:
+            fontpaths = [Path(p) for p in argv[1:]]
+        else:
+            stress_path = Path(tmpdir) / "StressVF.ttf"
+            build_stress_font(stress_path, STRESS_GLYPH_COUNT)
+            fontpaths = DEFAULT_FONT_PATHS + [stress_path]
+        for fontpath in fontpaths:
+            bench_font(fontpath, repeat, env)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,65 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Multi-format benchmark: TTF + WOFF + WOFF2 as three single-format jobs
+vs. one multi-format job.
+
+Usage: python benchmarks/bench_fanout.py [FONT_PATH]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from slice.engine import SliceJob, run_job
+from slice.fontsession import FontSession
+
+DEFAULT_FONT_PATH = Path("tests/assets/fonts/Recursive-VF.subset.ttf")
+FLAVORS = ["ttf", "woff", "woff2"]
+
+
+def time_jobs(session, jobs, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for job in jobs:
+            run_job(job, session)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv):
+    fontpath = Path(argv[0]) if argv else DEFAULT_FONT_PATH
+    session = FontSession(fontpath)
+    with tempfile.TemporaryDirectory() as outdir:
+        outpath = str(Path(outdir) / "instance.ttf")
+        axis_data = {"wght": 700.0}
+        single = time_jobs(
+            session,
+            [SliceJob(fontpath, outpath, axis_data, flavors=[f]) for f in FLAVORS],
+        )
+        multi = time_jobs(
+            session, [SliceJob(fontpath, outpath, axis_data, flavors=FLAVORS)]
+        )
+
+    print(f"{fontpath.name}: {', '.join(FLAVORS)}")
+    print(f"{'approach':28} {'wall (s)':>10} {'speedup':>8}")
+    print(f"{'three single-format jobs':28} {single:10.3f} {1:7.2f}x")
+    print(f"{'one multi-format job':28} {multi:10.3f} {single / multi:7.2f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
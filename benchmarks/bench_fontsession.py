@@ -0,0 +1,92 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Font load benchmark: per-model TTFont parses vs. a single FontSession parse.
+
+Usage: python benchmarks/bench_fontsession.py [FONT_PATH ...]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+from fontTools.ttLib import TTFont
+
+from slice.fontsession import FontSession
+
+DEFAULT_FONT_PATHS = [
+    Path("tests/assets/fonts/Recursive-VF.subset.ttf"),
+    Path("tests/assets/fonts/Recursive-VF.subset.woff"),
+    Path("tests/assets/fonts/Recursive-VF.subset.woff2"),
+]
+
+
+def read_all_tables(ttfont):
+    for tag in ttfont.reader.keys():
+        ttfont.getTableData(tag)
+
+
+def load_with_ttfont_per_model(fontpath):
+    # FontModel.is_variable_font
+    "fvar" in TTFont(fontpath)
+    # FontNameModel.load_font
+    TTFont(fontpath)["name"].names
+    # DesignAxisModel.load_font
+    ttfont = TTFont(fontpath)
+    ttfont["fvar"].axes
+    ttfont["name"].names
+    # InstanceWorker.instantiate_ttfont, instancing reads every table
+    read_all_tables(TTFont(fontpath))
+
+
+def load_with_font_session(fontpath):
+    session = FontSession(fontpath)
+    session.is_variable_font()
+    session.get_name_table().names
+    session.get_fvar_table().axes
+    read_all_tables(session.new_ttfont())
+
+
+def main(argv):
+    fontpaths = [Path(arg) for arg in argv] or DEFAULT_FONT_PATHS
+    print(f"{'font':40} {'per-model (ms)':>16} {'session (ms)':>14} {'speedup':>8}")
+    for fontpath in fontpaths:
+        number = 20
+        per_model = (
+            min(
+                timeit.repeat(
+                    lambda: load_with_ttfont_per_model(fontpath),
+                    number=number,
+                    repeat=5,
+                )
+            )
+            / number
+        )
+        session = (
+            min(
+                timeit.repeat(
+                    lambda: load_with_font_session(fontpath), number=number, repeat=5
+                )
+            )
+            / number
+        )
+        print(
+            f"{fontpath.name:40} {per_model * 1000:16.2f} {session * 1000:14.2f} "
+            f"{per_model / session:7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
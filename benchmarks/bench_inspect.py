@@ -0,0 +1,94 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Font load benchmark for the UI inspection path: a full FontSession parse
+vs. a FontInspector table directory read with name and fvar table reads.
+A generated stress font is added to the test fonts in TTF, WOFF and WOFF2
+formats.
+
+Usage: python benchmarks/bench_inspect.py [FONT_PATH ...]
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from fontTools.ttLib import TTFont
+
+from slice.fontinspect import FontInspector
+from slice.fontsession import FontSession
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "suite"))
+from stressfont import build_stress_font  # noqa: E402
+
+DEFAULT_FONT_PATHS = [
+    Path("tests/assets/fonts/Recursive-VF.subset.ttf"),
+    Path("tests/assets/fonts/Recursive-VF.subset.woff"),
+    Path("tests/assets/fonts/Recursive-VF.subset.woff2"),
+]
+
+
+def build_stress_fonts(tmpdir):
+    ttf_path = build_stress_font(Path(tmpdir) / "SliceStress.ttf")
+    fontpaths = [ttf_path]
+    for flavor in ("woff", "woff2"):
+        ttfont = TTFont(ttf_path)
+        ttfont.flavor = flavor
+        fontpaths.append(ttf_path.with_suffix(f".{flavor}"))
+        ttfont.save(fontpaths[-1])
+    return fontpaths
+
+
+def load_with_font_session(fontpath):
+    session = FontSession(fontpath)
+    session.is_variable_font()
+    session.get_name_table().names
+    session.get_fvar_table().axes
+
+
+def load_with_font_inspector(fontpath):
+    inspector = FontInspector(fontpath)
+    inspector.is_variable_font()
+    inspector.get_name_table().names
+    inspector.get_fvar_table().axes
+
+
+def get_time(func, fontpath):
+    number = 5
+    return min(timeit.repeat(lambda: func(fontpath), number=number, repeat=3)) / number
+
+
+def main(argv):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fontpaths = [Path(arg) for arg in argv] or (
+            DEFAULT_FONT_PATHS + build_stress_fonts(tmpdir)
+        )
+        print(
+            f"{'font':32} {'size (KB)':>10} {'session (ms)':>14} "
+            f"{'inspector (ms)':>16} {'speedup':>8}"
+        )
+        for fontpath in fontpaths:
+            session = get_time(load_with_font_session, fontpath)
+            inspector = get_time(load_with_font_inspector, fontpath)
+            print(
+                f"{fontpath.name:32} {fontpath.stat().st_size / 1024:10.0f} "
+                f"{session * 1000:14.2f} {inspector * 1000:16.2f} "
+                f"{session / inspector:7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
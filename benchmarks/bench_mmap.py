@@ -0,0 +1,127 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Concurrent worker memory benchmark: in-memory source reads vs. memory
+mapped FontSession sources.  Each worker process opens the same source,
+reads every table and instantiates a static instance.  Reports the mean
+peak RSS and, on Linux, the private (unshared) memory per worker.  RSS
+includes the mapped source pages that all workers share.
+
+Usage: python benchmarks/bench_mmap.py [FONT_PATH]
+"""
+
+import os
+import sys
+import tempfile
+from io import BytesIO
+from multiprocessing import Barrier, Pool
+from pathlib import Path
+
+from fontTools.ttLib import TTFont
+
+from slice.engine import instantiate_variable_font
+from slice.fontsession import FontSession
+from slice.telemetry import get_peak_rss
+
+sys.path.insert(0, str(Path(__file__).parent / "suite"))
+from stressfont import build_stress_font  # noqa: E402
+
+STRESS_GLYPH_COUNT = 10000
+WORKER_COUNTS = (1, 2, 4, 8)
+
+_barrier = None
+
+
+def init_worker(barrier):
+    global _barrier
+    _barrier = barrier
+
+
+def get_private_memory():
+    """Returns the private memory of the current process in bytes, or None."""
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+    return sum(
+        int(line.split()[1]) * 1024 for line in lines if line.startswith("Private_")
+    )
+
+
+def load_in_memory(fontpath):
+    # the file read that preceded memory mapped sources
+    with open(fontpath, "rb") as f:
+        data = f.read()
+    return TTFont(BytesIO(data))
+
+
+def load_memory_mapped(fontpath):
+    return FontSession(fontpath).new_ttfont()
+
+
+def run_worker(args):
+    fontpath, load = args
+    # all workers hold the source at the same time
+    _barrier.wait()
+    ttfont = load(fontpath)
+    for tag in ttfont.reader.keys():
+        ttfont.getTableData(tag)
+    axis_data = {axis.axisTag: axis.defaultValue for axis in ttfont["fvar"].axes}
+    instance = instantiate_variable_font(ttfont, axis_data)
+    private = get_private_memory()
+    _barrier.wait()
+    del instance
+    return get_peak_rss(), private
+
+
+def main(argv):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if argv:
+            fontpath = argv[0]
+        else:
+            fontpath = os.path.join(tmpdir, "stress.ttf")
+            # built in a child process so that the forked workers do
+            # not inherit the peak RSS of the font build
+            with Pool(1) as pool:
+                pool.apply(build_stress_font, (fontpath, STRESS_GLYPH_COUNT))
+        size = os.path.getsize(fontpath)
+        print(f"{Path(fontpath).name} ({size / 1024 / 1024:.1f} MB)")
+        print(
+            f"{'workers':>8} {'source':>10} {'peak RSS (MB)':>14} "
+            f"{'private (MB)':>13} {'total private (MB)':>19}"
+        )
+        for workers in WORKER_COUNTS:
+            for name, load in (("read", load_in_memory), ("mmap", load_memory_mapped)):
+                barrier = Barrier(workers)
+                with Pool(
+                    workers, initializer=init_worker, initargs=(barrier,)
+                ) as pool:
+                    results = pool.map(run_worker, [(fontpath, load)] * workers)
+                peak_rss = sum(result[0] or 0 for result in results) / workers
+                if results[0][1] is None:
+                    private = total = "n/a"
+                else:
+                    total_private = sum(result[1] for result in results)
+                    private = f"{total_private / workers / 1024 / 1024:.1f}"
+                    total = f"{total_private / 1024 / 1024:.1f}"
+                print(
+                    f"{workers:8} {name:>10} {peak_rss / 1024 / 1024:14.1f} "
+                    f"{private:>13} {total:>19}"
+                )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
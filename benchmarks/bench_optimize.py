@@ -0,0 +1,104 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Optimize level benchmark: instantiation time vs. instance file size for
+each instancer optimize level.  The partial instances retain variation
+data (gvar, HVAR, GDEF/GPOS) and show the optimization tradeoff, the
+static instances drop the variation data.  The default font list is the
+test fonts and a generated stress font.
+
+Usage: python benchmarks/bench_optimize.py [FONT_PATH ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+
+from slice.engine import instantiate_variable_font
+from slice.fontsession import FontSession
+from slice.optimize import OPTIMIZE_LEVELS
+
+sys.path.insert(0, str(Path(__file__).parent / "suite"))
+from stressfont import build_stress_font  # noqa: E402
+
+DEFAULT_FONT_PATHS = [
+    Path("tests/assets/fonts/Recursive-VF.subset.ttf"),
+]
+
+STRESS_GLYPH_COUNT = 2000
+
+
+def get_locations(session):
+    """Returns (label, axis data) tuples for a partial instance with the
+    weight axis (or the first axis) pinned and for a static instance."""
+    axes = session.get_fvar_table().axes
+    axis = next((axis for axis in axes if axis.axisTag == "wght"), axes[0])
+    pinned = (axis.defaultValue + axis.maxValue) / 2
+    return [
+        (f"partial {axis.axisTag}={pinned:g}", {axis.axisTag: pinned}),
+        ("static", {axis.axisTag: axis.defaultValue for axis in axes}),
+    ]
+
+
+def time_instance(session, axis_data, level, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        ttfont = session.new_ttfont()
+        buf = BytesIO()
+        start = time.perf_counter()
+        instantiate_variable_font(ttfont, axis_data, optimize=level)
+        ttfont.save(buf)
+        timings.append(time.perf_counter() - start)
+    return min(timings), len(buf.getvalue())
+
+
+def bench_font(fontpath):
+    session = FontSession(fontpath)
+    print(f"\n{Path(fontpath).name}")
+    print(
+        f"{'instance':>22} {'level':>6} {'time (ms)':>10} {'size (B)':>10} "
+        f"{'vs. full':>9}"
+    )
+    for label, axis_data in get_locations(session):
+        results = {
+            level: time_instance(session, axis_data, level) for level in OPTIMIZE_LEVELS
+        }
+        full_seconds, full_size = results["full"]
+        for level, (seconds, size) in results.items():
+            print(
+                f"{label:>22} {level:>6} {seconds * 1000:10.2f} {size:10} "
+                f"{(size - full_size) / full_size:+9.1%}"
+            )
+
+
+def main(argv):
+    if argv:
+        for fontpath in argv:
+            bench_font(fontpath)
+        return
+
+    for fontpath in DEFAULT_FONT_PATHS:
+        bench_font(fontpath)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fontpath = os.path.join(tmpdir, "stress.ttf")
+        build_stress_font(fontpath, STRESS_GLYPH_COUNT)
+        bench_font(fontpath)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,138 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Startup benchmark: UI font load with an eagerly imported pyrcc5 resource
+module vs. lazy loads from the font files.  Each measurement executes in a
+new interpreter so that module import costs are included.
+
+Usage: python benchmarks/bench_startup.py [REPEAT]
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from slice.ui.fonts import UI_FONT_DIR
+
+QRC_TEMPLATE = """<RCC>
+    <qresource prefix="font">
+        <file alias="RecursiveSans.ttf">{recursive}</file>
+        <file alias="IBMPlexMono-Regular.ttf">{ibmplex}</file>
+    </qresource>
+</RCC>
+"""
+
+# pathlib is imported by slice.__main__ in both approaches
+SETUP = """
+import pathlib
+import time
+from PyQt5.QtWidgets import QApplication
+app = QApplication([])
+start = time.perf_counter()
+"""
+
+PYRCC_RESOURCE_MODULE = (
+    SETUP
+    + """
+from PyQt5.QtGui import QFontDatabase
+import fontresources
+for path in (":/font/RecursiveSans.ttf", ":/font/IBMPlexMono-Regular.ttf"):
+    QFontDatabase.applicationFontFamilies(QFontDatabase.addApplicationFont(path))
+print(time.perf_counter() - start)
+"""
+)
+
+LAZY_FONT_FILES = (
+    SETUP
+    + """
+from slice.ui.fonts import get_ibmplex_mono_font, get_recursive_font
+get_recursive_font()
+get_ibmplex_mono_font()
+print(time.perf_counter() - start)
+"""
+)
+
+
+def build_resource_module(outdir):
+    # the pyrcc5 file paths are relative to the qrc file
+    for filename in ("RecursiveSans-Slice_mod.subset.ttf", "IBMPlexMono-Regular.ttf"):
+        shutil.copy(UI_FONT_DIR / filename, outdir)
+    qrc_path = Path(outdir) / "font-resources.qrc"
+    qrc_path.write_text(
+        QRC_TEMPLATE.format(
+            recursive="RecursiveSans-Slice_mod.subset.ttf",
+            ibmplex="IBMPlexMono-Regular.ttf",
+        )
+    )
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "PyQt5.pyrcc_main",
+            "-o",
+            str(Path(outdir) / "fontresources.py"),
+            str(qrc_path),
+        ],
+        check=True,
+    )
+
+
+def measure(code, repeat, env, cold=False):
+    timings = []
+    for _ in range(repeat):
+        if cold:
+            # first launch without a bytecode cache for the resource module
+            for pycache in Path(env["SLICE_BENCH_DIR"]).glob("__pycache__"):
+                shutil.rmtree(pycache)
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+
+def main(argv):
+    repeat = int(argv[0]) if argv else 5
+    with tempfile.TemporaryDirectory() as outdir:
+        build_resource_module(outdir)
+        env = dict(os.environ)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        env["SLICE_BENCH_DIR"] = outdir
+        env["PYTHONPATH"] = os.pathsep.join(
+            [outdir] + [p for p in sys.path if p and Path(p).is_dir()]
+        )
+        pyrcc_cold = measure(PYRCC_RESOURCE_MODULE, repeat, env, cold=True)
+        pyrcc = measure(PYRCC_RESOURCE_MODULE, repeat, env)
+        lazy = measure(LAZY_FONT_FILES, repeat, env)
+
+    print(f"{'UI font load':40} {'median (ms)':>12} {'speedup':>8}")
+    for label, seconds in (
+        ("pyrcc5 resource module (no .pyc)", pyrcc_cold),
+        ("pyrcc5 resource module (cached .pyc)", pyrcc),
+        ("lazy font file load", lazy),
+    ):
+        print(f"{label:40} {seconds * 1000:12.2f} {pyrcc_cold / seconds:7.2f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,117 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Glyph subset benchmark: subset-then-instance jobs vs. a full instance
+that is subset after it is written (the pyftsubset post-processing
+workflow) for subsets of the first N mapped code points.  The default
+font list is the test fonts and a generated stress font.
+
+Usage: python benchmarks/bench_subset.py [FONT_PATH ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fontTools.subset import Subsetter
+from fontTools.ttLib import TTFont
+
+from slice.engine import SliceJob, run_job
+from slice.fontsession import FontSession
+from slice.glyphsubset import GlyphSubset, get_subset_options
+
+sys.path.insert(0, str(Path(__file__).parent / "suite"))
+from stressfont import build_stress_font  # noqa: E402
+
+DEFAULT_FONT_PATHS = [
+    Path("tests/assets/fonts/Recursive-VF.subset.ttf"),
+]
+
+STRESS_GLYPH_COUNT = 10000
+
+# number of mapped code points in each subset
+SUBSET_SIZES = (100, 1000)
+
+
+def get_axis_data(session):
+    # all axes pinned to the mid-point of the axis range
+    return {
+        axis.axisTag: (axis.minValue + axis.maxValue) / 2
+        for axis in session.get_fvar_table().axes
+    }
+
+
+def time_subset_first(fontpath, outpath, axis_data, unicodes):
+    # fresh sessions so that the retained instance is not re-used
+    session = FontSession(fontpath)
+    start = time.perf_counter()
+    run_job(
+        SliceJob(fontpath, outpath, axis_data, subset=GlyphSubset(unicodes)), session
+    )
+    return time.perf_counter() - start
+
+
+def time_subset_after(fontpath, outpath, axis_data, unicodes):
+    session = FontSession(fontpath)
+    start = time.perf_counter()
+    run_job(SliceJob(fontpath, outpath, axis_data), session)
+    ttfont = TTFont(outpath)
+    subsetter = Subsetter(get_subset_options())
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(ttfont)
+    ttfont.save(outpath)
+    return time.perf_counter() - start
+
+
+def bench_font(fontpath):
+    fontpath = str(fontpath)
+    session = FontSession(fontpath)
+    axis_data = get_axis_data(session)
+    codepoints = sorted(session.ttfont.getBestCmap())
+    print(f"\n{Path(fontpath).name} ({len(session.ttfont.getGlyphOrder())} glyphs)")
+    print(
+        f"{'code points':>12} {'subset first (s)':>17} {'subset after (s)':>17} "
+        f"{'speedup':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        outpath = os.path.join(tmpdir, "instance.ttf")
+        for size in sorted({min(size, len(codepoints)) for size in SUBSET_SIZES}):
+            unicodes = codepoints[:size]
+            first = time_subset_first(fontpath, outpath, axis_data, unicodes)
+            after = time_subset_after(fontpath, outpath, axis_data, unicodes)
+            print(
+                f"{len(unicodes):12} {first:17.3f} {after:17.3f} "
+                f"{after / first:7.1f}x"
+            )
+
+
+def main(argv):
+    if argv:
+        for fontpath in argv:
+            bench_font(fontpath)
+        return
+
+    for fontpath in DEFAULT_FONT_PATHS:
+        bench_font(fontpath)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fontpath = os.path.join(tmpdir, "stress.ttf")
+        build_stress_font(fontpath, STRESS_GLYPH_COUNT)
+        bench_font(fontpath)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
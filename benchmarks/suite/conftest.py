@@ -0,0 +1,73 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import pytest
+from stressfont import build_stress_font
+
+from slice.engine import instantiate_variable_font
+from slice.fontsession import FontSession
+
+FONT_DIR = Path(__file__).resolve().parents[2] / "tests" / "assets" / "fonts"
+
+# benchmark font id : font path, None = generated stress font
+BENCH_FONTS = {
+    "recursive-ttf": FONT_DIR / "Recursive-VF.subset.ttf",
+    "recursive-woff": FONT_DIR / "Recursive-VF.subset.woff",
+    "recursive-woff2": FONT_DIR / "Recursive-VF.subset.woff2",
+    "stress-ttf": None,
+}
+
+
+class BenchFont(object):
+    def __init__(self, fontpath, rounds):
+        self.fontpath = str(fontpath)
+        self.session = FontSession(self.fontpath)
+        # benchmark rounds per test, fewer for slow fonts
+        self.rounds = rounds
+        axes = self.session.get_fvar_table().axes
+        # all axes pinned to the mid-point of the axis range
+        self.static_axis_data = {
+            axis.axisTag: (axis.minValue + axis.maxValue) / 2 for axis in axes
+        }
+        # first axis restricted to the default : maximum range
+        self.range_axis_data = {
+            axes[0].axisTag: (axes[0].defaultValue, axes[0].maxValue)
+        }
+
+    def new_static_instance(self):
+        ttfont = self.session.new_ttfont()
+        instantiate_variable_font(ttfont, self.static_axis_data)
+        return ttfont
+
+
+@pytest.fixture(scope="session")
+def stress_font_path(tmp_path_factory):
+    return build_stress_font(tmp_path_factory.mktemp("stress") / "SliceStress.ttf")
+
+
+@pytest.fixture(scope="session", params=list(BENCH_FONTS))
+def bench_font(request, stress_font_path):
+    fontpath = BENCH_FONTS[request.param]
+    if fontpath is None:
+        return BenchFont(stress_font_path, rounds=3)
+    return BenchFont(fontpath, rounds=10)
+
+
+@pytest.fixture(scope="session")
+def static_instance(bench_font):
+    """Instanced TTFont that is shared by the save benchmarks."""
+    return bench_font.new_static_instance()
@@ -0,0 +1,118 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Generates a large wght/wdth variable TTF stress font for the benchmark suite.
+The outlines are random but deterministic for a given glyph count and seed.
+
+Usage: python benchmarks/suite/stressfont.py OUTPATH [GLYPH_COUNT]
+"""
+
+import random
+import sys
+
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib.tables.TupleVariation import TupleVariation
+
+DEFAULT_GLYPH_COUNT = 2000
+CONTOURS_PER_GLYPH = 3
+POINTS_PER_CONTOUR = 12
+
+# tag, minimum, default, maximum, name
+AXES = [
+    ("wght", 100, 400, 900, "Weight"),
+    ("wdth", 75, 100, 125, "Width"),
+]
+
+# normalized (start, peak, end) regions of the gvar tuple variations
+VARIATION_REGIONS = [
+    {"wght": (-1.0, -1.0, 0.0)},
+    {"wght": (0.0, 0.5, 1.0)},
+    {"wght": (0.0, 1.0, 1.0)},
+    {"wdth": (-1.0, -1.0, 0.0)},
+    {"wdth": (0.0, 1.0, 1.0)},
+    {"wght": (0.0, 1.0, 1.0), "wdth": (0.0, 1.0, 1.0)},
+]
+
+
+def draw_glyph(rng):
+    pen = TTGlyphPen(None)
+    for _ in range(CONTOURS_PER_GLYPH):
+        pen.moveTo((rng.randint(0, 600), rng.randint(0, 700)))
+        for _ in range((POINTS_PER_CONTOUR - 1) // 2):
+            pen.qCurveTo(
+                (rng.randint(0, 600), rng.randint(0, 700)),
+                (rng.randint(0, 600), rng.randint(0, 700)),
+            )
+        pen.closePath()
+    return pen.glyph()
+
+
+def get_glyph_variations(glyph, rng):
+    # the four phantom points follow the outline points
+    point_count = len(glyph.coordinates) + 4
+    return [
+        TupleVariation(
+            region,
+            [(rng.randint(-40, 40), rng.randint(-40, 40)) for _ in range(point_count)],
+        )
+        for region in VARIATION_REGIONS
+    ]
+
+
+def build_stress_font(outpath, glyph_count=DEFAULT_GLYPH_COUNT, seed=0):
+    rng = random.Random(seed)
+    glyph_order = [".notdef"] + [f"glyph{i:05d}" for i in range(1, glyph_count)]
+    glyphs = {name: draw_glyph(rng) for name in glyph_order}
+
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(glyph_order)
+    fb.setupCharacterMap({0x4E00 + i: name for i, name in enumerate(glyph_order[1:])})
+    fb.setupGlyf(glyphs)
+    fb.setupHorizontalMetrics({name: (600, 0) for name in glyph_order})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable(
+        {
+            "familyName": "Slice Stress",
+            "styleName": "Regular",
+            "uniqueFontIdentifier": "SliceStress-Regular",
+            "fullName": "Slice Stress Regular",
+            "psName": "SliceStress-Regular",
+            "version": "Version 1.000",
+        }
+    )
+    fb.setupOS2(
+        sTypoAscender=800, sTypoDescender=-200, usWinAscent=800, usWinDescent=200
+    )
+    fb.setupPost()
+    fb.setupFvar(AXES, [])
+    fb.setupGvar(
+        {name: get_glyph_variations(glyphs[name], rng) for name in glyph_order}
+    )
+    fb.save(str(outpath))
+    return outpath
+
+
+def main(argv):
+    if not argv:
+        sys.stderr.write(__doc__)
+        return 1
+    glyph_count = int(argv[1]) if len(argv) > 1 else DEFAULT_GLYPH_COUNT
+    build_stress_font(argv[0], glyph_count)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
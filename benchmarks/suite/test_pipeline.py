@@ -0,0 +1,134 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Slicing pipeline benchmarks.  The stage benchmarks time the engine
+# functions that InstanceWorker executes.  Each round receives a fresh
+# font object from an untimed setup function.
+
+import pytest
+
+from slice.compression import CompressionProfile
+from slice.engine import (
+    OUTPUT_FLAVORS,
+    SliceJob,
+    edit_bit_flags,
+    edit_name_table,
+    get_name_instance_data,
+    instantiate_variable_font,
+    run_job,
+    save_font,
+)
+from slice.fontsession import FontSession
+from slice.preview import new_preview_instance
+
+
+def test_font_session_parse(benchmark, bench_font):
+    benchmark.pedantic(
+        FontSession, args=(bench_font.fontpath,), rounds=bench_font.rounds
+    )
+
+
+def test_instantiate_static(benchmark, bench_font):
+    def setup():
+        return (bench_font.session.new_ttfont(), bench_font.static_axis_data), {}
+
+    benchmark.pedantic(instantiate_variable_font, setup=setup, rounds=bench_font.rounds)
+
+
+def test_instantiate_l3_range(benchmark, bench_font):
+    def setup():
+        return (bench_font.session.new_ttfont(), bench_font.range_axis_data), {}
+
+    benchmark.pedantic(instantiate_variable_font, setup=setup, rounds=bench_font.rounds)
+
+
+def test_edit_name_table(benchmark, bench_font):
+    name_data = get_name_instance_data(bench_font.session.get_name_table())
+    name_data["nameID1"] = "Slice Benchmark"
+
+    def setup():
+        return (bench_font.new_static_instance(), name_data), {}
+
+    benchmark.pedantic(edit_name_table, setup=setup, rounds=bench_font.rounds)
+
+
+def test_edit_bit_flags(benchmark, bench_font):
+    bit_model = SliceJob(
+        bench_font.fontpath, None, {}, os2_bits={"bit5": True}, head_bits={"bit0": True}
+    ).get_bit_model()
+
+    def setup():
+        return (bench_font.new_static_instance(), bit_model), {}
+
+    benchmark.pedantic(edit_bit_flags, setup=setup, rounds=bench_font.rounds)
+
+
+@pytest.mark.parametrize("flavor", list(OUTPUT_FLAVORS))
+def test_save(benchmark, bench_font, static_instance, flavor, tmp_path):
+    outpath = str(tmp_path / f"instance.{flavor}")
+    # fast zopfli settings keep the woff rounds short
+    compression = CompressionProfile("zopfli", zopfli_iterations=1)
+    source_flavor = static_instance.flavor
+    static_instance.flavor = OUTPUT_FLAVORS[flavor]
+    try:
+        benchmark.pedantic(
+            save_font,
+            args=(static_instance, outpath, compression),
+            rounds=bench_font.rounds,
+        )
+    finally:
+        static_instance.flavor = source_flavor
+
+
+def test_run_job_metadata_edit(benchmark, bench_font, tmp_path):
+    job = SliceJob(
+        bench_font.fontpath,
+        str(tmp_path / "instance.ttf"),
+        bench_font.static_axis_data,
+        name_data={"nameID1": "Slice Benchmark"},
+    )
+    # the session retains the instance of the first run and the timed
+    # rounds only edit the name and bit flag tables and save
+    run_job(job, bench_font.session)
+    benchmark.pedantic(
+        run_job, args=(job, bench_font.session), rounds=bench_font.rounds
+    )
+
+
+def test_run_job_multiple_flavors(benchmark, bench_font, tmp_path):
+    def setup():
+        # drops the retained instance so that each round instantiates
+        bench_font.session.set_instance_data(None, None)
+        return (job, bench_font.session), {}
+
+    job = SliceJob(
+        bench_font.fontpath,
+        str(tmp_path / "instance.ttf"),
+        bench_font.static_axis_data,
+        compression=CompressionProfile("zopfli", zopfli_iterations=1),
+        flavors=list(OUTPUT_FLAVORS),
+    )
+    benchmark.pedantic(run_job, setup=setup, rounds=bench_font.rounds)
+
+
+def test_preview_instance(benchmark, bench_font):
+    # a sample text of 26 mapped characters
+    cmap = bench_font.session.new_ttfont().getBestCmap()
+    text = "".join(chr(codepoint) for codepoint in sorted(cmap)[:26])
+    benchmark.pedantic(
+        new_preview_instance,
+        args=(bench_font.session, text, bench_font.static_axis_data),
+        rounds=bench_font.rounds,
+    )
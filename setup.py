@@ -15,7 +15,7 @@ AUTHOR = "Source Foundry Authors"
 REQUIRES_PYTHON = ">=3.6.0"
 
 INSTALL_REQUIRES = [
-    "fontTools >= 4.21.1",
+    "fontTools >= 4.23.0",
 ]
 # Optional packages
 EXTRAS_REQUIRES = {
@@ -61,7 +61,15 @@ setup(
     install_requires=INSTALL_REQUIRES,
     extras_require=EXTRAS_REQUIRES,
     python_requires=REQUIRES_PYTHON,
-    entry_points={"console_scripts": ["slicegui = slice.__main__:main"]},
+    entry_points={
+        "console_scripts": [
+            "slicegui = slice.__main__:main",
+            "slicecli = slice.cli:main",
+            "sliceserver = slice.server:main",
+            "slicedaemon = slice.daemon:main",
+            "sliceclient = slice.client:main",
+        ]
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
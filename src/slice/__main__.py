@@ -13,15 +13,16 @@
 #    You should have received a copy of the GNU General Public License
 #    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
 
+import multiprocessing
+import os
 import sys
+import time
 import traceback
 from pathlib import Path
 
-from PyQt5.QtCore import Qt, QThreadPool, QUrl
+from PyQt5.QtCore import QStandardPaths, Qt, QThreadPool, QUrl
 from PyQt5.QtGui import (
     QDesktopServices,
-    QFont,
-    QFontDatabase,
     QIcon,
     QImage,
     QKeySequence,
@@ -38,26 +39,45 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QHeaderView,
     QLabel,
+    QLineEdit,
     QMainWindow,
+    QProgressBar,
     QPushButton,
     QSizePolicy,
+    QSpinBox,
     QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from .fontresources import *
+from .batch import get_default_max_workers
+from .batchworker import BatchWorker
+from .cache import InstanceCache
+from .engine import SliceJob
+from .fontloadworker import FontLoadWorker
 from .imageresources import *
 from .instanceworker import InstanceWorker
-from .models import DesignAxisModel, FontBitFlagModel, FontModel, FontNameModel
+from .models import (
+    DesignAxisModel,
+    FontBitFlagModel,
+    FontModel,
+    FontNameModel,
+    JobQueueModel,
+)
+from .preview import DEFAULT_PREVIEW_TEXT
+from .previewworker import PreviewFontWorker
+from .progress import load_job_history
+from .telemetry import TelemetryLog
 from .ui.dialogs import (
     SliceAboutDialog,
     SliceErrorDialog,
+    SliceOpenDirectoryDialog,
     SliceOpenFileDialog,
     SliceProgressDialog,
     SliceSaveFileDialog,
 )
-from .ui.widgets import DragDropLineEdit
+from .ui.fonts import get_ibmplex_mono_font, get_recursive_font
+from .ui.widgets import AxisValueDelegate, DragDropLineEdit, PreviewWidget
 
 __VERSION__ = "0.7.1"
 
@@ -74,13 +94,30 @@ class MainWindow(QMainWindow):
 
         # default FontModel
         self.font_model = FontModel(None)
+        # FontLoadWorker of the font load in progress
+        self.font_load_worker = None
+        # PreviewFontWorker of the loaded font
+        self.preview_font_worker = None
 
         # defined with axis widgets used in the
         # axis editor view
         self.axis_data_dict = {}
 
+        # map of axis editor row : value text that is being typed
+        self.preview_edits = {}
+
+        # telemetry event of the last InstanceWorker job
+        self.instance_telemetry = None
+
+        # BatchWorker of the job queue run in progress
+        self.batch_worker = None
+        # map of job queue row : job start time
+        self.job_start_times = {}
+
         # set up thread pool
         self.setupThreadPool()
+        # set up instance file cache
+        self.setupInstanceCache()
 
         # set up the UI
         self.setWindowIcon(QIcon(":/img/slice-icon.svg"))
@@ -90,9 +127,11 @@ class MainWindow(QMainWindow):
         self.setUIAppIconTitle()
         self.setUIFontPathDataEntry()
         self.setUIAxisValueDataEntry()
+        self.setUIPreview()
         self.setUINameTableDataEntry()
         self.setUIBitSettingsDataEntry()
         self.setUISliceButton()
+        self.setUIJobQueue()
         # self.addStretch()
         self.setUIStatusBar()
 
@@ -112,6 +151,20 @@ class MainWindow(QMainWindow):
     def setupThreadPool(self):
         self.threadpool = QThreadPool()
 
+    def setupInstanceCache(self):
+        cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        try:
+            self.instance_cache = InstanceCache(Path(cache_dir) / "instances")
+        except OSError as e:
+            # slicing works without a cache
+            self.instance_cache = None
+            sys.stderr.write(f"Instance cache disabled: {e}\n")
+        # job history for the progress dialog ETA, the ETA only reads the
+        # most recent events so the log is rotated at the size limit
+        self.telemetry_log = TelemetryLog(
+            Path(cache_dir) / "telemetry.jsonl", max_size=4 * 1024 * 1024
+        )
+
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     #
     # UI definitions
@@ -240,9 +293,7 @@ class MainWindow(QMainWindow):
     def setUIAppIconTitle(self):
         # add the app logo and name view if screen dimensions permit it
         if self.screen_dimensions.height() >= 1000:
-            recursive_id = QFontDatabase.addApplicationFont(":/font/RecursiveSans.ttf")
-            font_family = QFontDatabase.applicationFontFamilies(recursive_id)[0]
-            recursive = QFont(font_family)
+            recursive = get_recursive_font()
             outerHBox = QHBoxLayout()
             titleLabel = QLabel("<h1>Slice</h1>")
             titleLabel.setStyleSheet("QLabel { font-size: 36px;}")
@@ -313,14 +364,21 @@ class MainWindow(QMainWindow):
         self.fvar_table_view.horizontalHeader().setStretchLastSection(True)
         self.fvar_table_view.resizeColumnToContents(0)
         self.fvar_table_view.setAlternatingRowColors(True)
+        # the preview follows the axis values as they are typed
+        self.axis_value_delegate = AxisValueDelegate(self.fvar_table_view)
+        self.axis_value_delegate.valueEdited.connect(self.preview_axis_value_edited)
+        self.axis_value_delegate.editingFinished.connect(
+            self.preview_axis_value_edit_finished
+        )
+        self.fvar_table_view.setItemDelegateForColumn(1, self.axis_value_delegate)
+        self.fvar_table_model.dataChanged.connect(self.update_preview_location)
+        self.fvar_table_model.layoutChanged.connect(self.update_preview_location)
         axisEditGroupBox.setLayout(QVBoxLayout())
         axisEditGroupBox.layout().addWidget(self.fvar_table_view)
         axisEditGroupBox.setMinimumHeight(205)
         axisEditGroupBox.setMaximumHeight(350)
 
-        ibmplex_id = QFontDatabase.addApplicationFont(":/font/IBMPlexMono-Regular.ttf")
-        font_family = QFontDatabase.applicationFontFamilies(ibmplex_id)[0]
-        ibmplex = QFont(font_family)
+        ibmplex = get_ibmplex_mono_font()
         self.fvar_table_view.setFont(ibmplex)
         self.fvar_table_view.resizeColumnToContents(0)
 
@@ -330,6 +388,40 @@ class MainWindow(QMainWindow):
         # self.main_layout.addSpacing(10)
         self.main_layout.addLayout(outerVBox)
 
+    #
+    # Axis location preview
+    #
+
+    def setUIPreview(self):
+        outerVBox = QVBoxLayout()
+        previewLabel = QLabel("<h4>Preview</h4>")
+        previewLabel.setStyleSheet("QLabel { padding-left: 5px;}")
+        previewGroupBox = QGroupBox("")
+
+        self.previewTextLineEdit = QLineEdit(DEFAULT_PREVIEW_TEXT)
+        self.previewTextLineEdit.setClearButtonEnabled(True)
+        self.preview_widget = PreviewWidget()
+        self.preview_widget.set_text(DEFAULT_PREVIEW_TEXT)
+        self.previewTextLineEdit.textChanged.connect(self.preview_widget.set_text)
+        self.previewInstanceCheckBox = QCheckBox("Instance outlines")
+        self.previewInstanceCheckBox.setToolTip(
+            "Draw the sample text from an instance of the sample glyphs"
+        )
+        self.previewInstanceCheckBox.toggled.connect(
+            self.preview_widget.set_use_instance
+        )
+
+        previewTextHBox = QHBoxLayout()
+        previewTextHBox.addWidget(self.previewTextLineEdit)
+        previewTextHBox.addWidget(self.previewInstanceCheckBox)
+        previewGroupBox.setLayout(QVBoxLayout())
+        previewGroupBox.layout().addLayout(previewTextHBox)
+        previewGroupBox.layout().addWidget(self.preview_widget)
+
+        outerVBox.addWidget(previewLabel)
+        outerVBox.addWidget(previewGroupBox)
+        self.main_layout.addLayout(outerVBox)
+
     #
     # Name table record editor table view
     #
@@ -346,9 +438,7 @@ class MainWindow(QMainWindow):
         self.nameTableView.horizontalHeader().setStretchLastSection(True)
         self.nameTableView.setAlternatingRowColors(True)
 
-        ibmplex_id = QFontDatabase.addApplicationFont(":/font/IBMPlexMono-Regular.ttf")
-        font_family = QFontDatabase.applicationFontFamilies(ibmplex_id)[0]
-        ibmplex = QFont(font_family)
+        ibmplex = get_ibmplex_mono_font()
         self.nameTableView.setFont(ibmplex)
 
         nameTableGroupBox.setLayout(QVBoxLayout())
@@ -428,6 +518,60 @@ class MainWindow(QMainWindow):
         # add slot to clicked event
         self.sliceButton.clicked.connect(self.btn_clicked_slice)
 
+    #
+    # Batch job queue view
+    #
+
+    def setUIJobQueue(self):
+        outerVBox = QVBoxLayout()
+        jobQueueLabel = QLabel("<h4>Job Queue</h4>")
+        jobQueueLabel.setStyleSheet("QLabel { padding-left: 5px;}")
+        jobQueueGroupBox = QGroupBox("")
+
+        self.job_queue_view = QTableView()
+        self.job_queue_model = JobQueueModel()
+        self.job_queue_view.setModel(self.job_queue_model)
+        self.job_queue_view.horizontalHeader().setStretchLastSection(True)
+        self.job_queue_view.setAlternatingRowColors(True)
+        self.job_queue_view.setMinimumHeight(120)
+
+        self.queueAddButton = QPushButton("Add to Queue", self)
+        self.queueAddButton.clicked.connect(self.btn_clicked_queue_add)
+        self.queueRunButton = QPushButton("Run Queue", self)
+        self.queueRunButton.clicked.connect(self.btn_clicked_queue_run)
+        self.queueStopButton = QPushButton("Stop", self)
+        self.queueStopButton.clicked.connect(self.btn_clicked_queue_stop)
+        self.queueStopButton.setEnabled(False)
+        self.queueClearButton = QPushButton("Clear", self)
+        self.queueClearButton.clicked.connect(self.btn_clicked_queue_clear)
+        self.queueNamedInstancesButton = QPushButton("Export Named Instances", self)
+        self.queueNamedInstancesButton.clicked.connect(
+            self.btn_clicked_queue_named_instances
+        )
+
+        # maximum number of concurrent job processes
+        self.queueWorkersSpinBox = QSpinBox(self)
+        self.queueWorkersSpinBox.setRange(1, get_default_max_workers())
+        self.queueWorkersSpinBox.setValue(get_default_max_workers())
+
+        row_layout = QHBoxLayout()
+        row_layout.addWidget(self.queueAddButton)
+        row_layout.addWidget(self.queueRunButton)
+        row_layout.addWidget(self.queueStopButton)
+        row_layout.addWidget(self.queueClearButton)
+        row_layout.addWidget(self.queueNamedInstancesButton)
+        row_layout.addStretch()
+        row_layout.addWidget(QLabel("Concurrent jobs:"))
+        row_layout.addWidget(self.queueWorkersSpinBox)
+
+        jobQueueGroupBox.setLayout(QVBoxLayout())
+        jobQueueGroupBox.layout().addWidget(self.job_queue_view)
+        jobQueueGroupBox.layout().addLayout(row_layout)
+
+        outerVBox.addWidget(jobQueueLabel)
+        outerVBox.addWidget(jobQueueGroupBox)
+        self.main_layout.addLayout(outerVBox)
+
     #
     # Status bar view
     #
@@ -438,6 +582,14 @@ class MainWindow(QMainWindow):
         self.statusbar = self.statusBar()
         self.statusbar.showMessage("Ready")
 
+        # font load progress, shown during font loads
+        self.statusbar_progress = QProgressBar()
+        self.statusbar_progress.setRange(0, 100)
+        self.statusbar_progress.setMaximumWidth(150)
+        self.statusbar_progress.setTextVisible(False)
+        self.statusbar_progress.hide()
+        self.statusbar.addPermanentWidget(self.statusbar_progress)
+
         # Version info
         status_version_label = QLabel(f"v{__VERSION__}")
         self.statusbar.addPermanentWidget(status_version_label)
@@ -479,6 +631,49 @@ class MainWindow(QMainWindow):
             "bit1": self.head_macstyle_bit_1_checkbox.isChecked(),
         }
 
+    def validate_instance_request(self):
+        """Validates the loaded font and axis editor data for an instance
+        job.  Presents the validation errors and returns False on failure."""
+        # user did not load font data
+        if not self.font_model.fontpath:
+            self.statusbar.showMessage("Requires a font path")
+            self.statusbar.update()
+            return False
+
+        # validate axis editor instance values
+        # returns True/False response for test of
+        # at least one instance value
+        # raises ValueError on attempt to cast to float
+        # if the entry is a non-numeric value
+        try:
+            instance_values_are_present = (
+                self.fvar_table_model.instance_data_validates_missing_data()
+            )
+        except ValueError as e:
+            SliceErrorDialog(f"{e}")
+            return False
+
+        if not instance_values_are_present:
+            SliceErrorDialog(
+                "You requested the same design space that is supported in the "
+                "font path that you are processing. Please define at least one "
+                "axis location or restricted axis range."
+            )
+            return False
+
+        # validation: confirm that the user did not edit the
+        # file path in the text edit field without initiation
+        # of a font re-load (e.g., manual edit of text without
+        # clicking Return button)
+        if self.fontpathLineEdit.text() != self.font_model.fontpath:
+            SliceErrorDialog(
+                "The file path in the font path field does not match the "
+                "loaded font path.  Please load your font again."
+            )
+            return False
+
+        return True
+
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~
     #
     # Event slots
@@ -557,101 +752,159 @@ class MainWindow(QMainWindow):
         self._open_font_file_action()
 
     def btn_clicked_slice(self):
-        # user did not load font data
-        if not self.font_model.fontpath:
-            self.statusbar.showMessage("Requires a font path")
+        if not self.validate_instance_request():
+            return
+
+        outpath = SliceSaveFileDialog(
+            root_directory=str(Path(self.font_model.fontpath).parent)
+        ).get_file_path()
+
+        # the user did not select a save path
+        # abort instantiation
+        if not outpath:
+            self.statusbar.showMessage("Canceled")
             self.statusbar.update()
-            # must keep this return statement to abort execution!
             return
 
-        # validate axis editor instance values
-        # returns True/False response for test of
-        # at least one instance value
-        # raises ValueError on attempt to cast to float
-        # if the entry is a non-numeric value
+        # Define the FontBitFlagModel
+        bit_model = FontBitFlagModel(
+            self.collect_os2_bit_checkbox_fields(),
+            self.collect_head_bit_checkbox_fields(),
+        )
         try:
-            instance_values_are_present = (
-                self.fvar_table_model.instance_data_validates_missing_data()
+            # set up instance worker
+            instance_worker = InstanceWorker(
+                outpath,
+                self.font_model,
+                self.fvar_table_model,
+                self.name_table_model,
+                bit_model,
+                cache=self.instance_cache,
+                telemetry_log=self.telemetry_log,
+                job_history=load_job_history(self.telemetry_log.logpath),
             )
-        except ValueError as e:
-            SliceErrorDialog(f"{e}")
-            return
 
-        if not instance_values_are_present:
+            # launch progress bar dialog
+            self.progress_dialog = SliceProgressDialog(
+                instance_worker.signals.finished,
+                instance_worker.signals.progress,
+            )
+
+            # attach InstanceWorker signals / slots
+            instance_worker.signals.result.connect(self._instance_worker_output)
+            instance_worker.signals.finished.connect(self._instance_worker_complete)
+            instance_worker.signals.error.connect(self._instance_worker_error)
+            instance_worker.signals.telemetry.connect(self._instance_worker_telemetry)
+
+            # start the worker thread
+            self.threadpool.start(instance_worker)
+            self.statusbar.showMessage("Slicing...")
+            self.sliceButton.setDisabled(True)
+        except Exception as e:
+            # hide progress dialog if exception occurred
+            self.progress_dialog.hide()
             SliceErrorDialog(
-                "You requested the same design space that is supported in the "
-                "font path that you are processing. Please define at least one "
-                "axis location or restricted axis range."
+                "Font processing failed with an error.  See details below.",
+                detailed_text=str(e),
             )
-        else:
-            # validation: confirm that the user did not edit the
-            # file path in the text edit field without initiation
-            # of a font re-load (e.g., manual edit of text without
-            # clicking Return button)
-            if self.fontpathLineEdit.text() != self.font_model.fontpath:
-                SliceErrorDialog(
-                    "The file path in the font path field does not match the "
-                    "loaded font path.  Please load your font again."
-                )
-            else:
-                outpath = SliceSaveFileDialog(
-                    root_directory=str(Path(self.font_model.fontpath).parent)
-                ).get_file_path()
-
-                # the user did not select a save path
-                # abort instantiation
-                if not outpath:
-                    self.statusbar.showMessage("Canceled")
-                    self.statusbar.update()
-                    return
-
-                # Define the FontBitFlagModel
-                bit_model = FontBitFlagModel(
-                    self.collect_os2_bit_checkbox_fields(),
-                    self.collect_head_bit_checkbox_fields(),
-                )
-                try:
-                    # set up instance worker
-                    instance_worker = InstanceWorker(
-                        outpath,
-                        self.font_model,
-                        self.fvar_table_model,
-                        self.name_table_model,
-                        bit_model,
-                    )
-
-                    # launch progress bar dialog
-                    self.progress_dialog = SliceProgressDialog(
-                        instance_worker.signals.finished
-                    )
-
-                    # attach InstanceWorker signals / slots
-                    instance_worker.signals.result.connect(self._instance_worker_output)
-                    instance_worker.signals.finished.connect(
-                        self._instance_worker_complete
-                    )
-                    instance_worker.signals.error.connect(self._instance_worker_error)
-
-                    # start the worker thread
-                    self.threadpool.start(instance_worker)
-                    self.statusbar.showMessage("Slicing...")
-                    self.sliceButton.setDisabled(True)
-                except Exception as e:
-                    # hide progress dialog if exception occurred
-                    self.progress_dialog.hide()
-                    SliceErrorDialog(
-                        "Font processing failed with an error.  See details below.",
-                        detailed_text=str(e),
-                    )
-                    self.statusbar.showMessage("Error")
-                    self.statusbar.update()
-                    # print trace to std error
-                    sys.stderr.write(f"{traceback.format_exc()}\n")
+            self.statusbar.showMessage("Error")
+            self.statusbar.update()
+            # print trace to std error
+            sys.stderr.write(f"{traceback.format_exc()}\n")
 
         # enable the Slice button at end of instantiation
         # attempt irrespective of the error/success outcome
         self.sliceButton.setEnabled(True)
 
+    def btn_clicked_queue_add(self):
+        if not self.validate_instance_request():
+            return
+
+        outpath = SliceSaveFileDialog(
+            root_directory=str(Path(self.font_model.fontpath).parent)
+        ).get_file_path()
+        # the user did not select a save path
+        if not outpath:
+            self.statusbar.showMessage("Canceled")
+            return
+
+        self.job_queue_model.add_job(
+            SliceJob(
+                self.font_model.fontpath,
+                outpath,
+                self.fvar_table_model.get_instance_data(),
+                self.name_table_model.get_instance_data(),
+                self.collect_os2_bit_checkbox_fields(),
+                self.collect_head_bit_checkbox_fields(),
+            )
+        )
+        self.job_queue_view.resizeColumnToContents(0)
+        self.statusbar.showMessage(
+            f"{len(self.job_queue_model.get_queued_jobs())} jobs queued"
+        )
+
+    def btn_clicked_queue_named_instances(self):
+        # user did not load font data
+        if not self.font_model.fontpath:
+            self.statusbar.showMessage("Requires a font path")
+            return
+        named_instances = self.fvar_table_model.named_instances
+        if not named_instances:
+            SliceErrorDialog("The font does not define fvar named instances.")
+            return
+
+        outdir = SliceOpenDirectoryDialog(
+            root_directory=str(Path(self.font_model.fontpath).parent)
+        ).get_directory_path()
+        # the user did not select a directory
+        if not outdir:
+            self.statusbar.showMessage("Canceled")
+            return
+
+        for named_instance in named_instances:
+            self.job_queue_model.add_job(
+                named_instance.get_job(self.font_model.fontpath, outdir)
+            )
+        self.job_queue_view.resizeColumnToContents(0)
+        # a queue run that is in progress does not include the
+        # new jobs, they run with the next Run Queue click
+        if self.batch_worker is None:
+            self.btn_clicked_queue_run()
+
+    def btn_clicked_queue_run(self):
+        jobs = self.job_queue_model.get_queued_jobs()
+        if not jobs:
+            self.statusbar.showMessage("There are no queued jobs")
+            return
+
+        self.batch_worker = BatchWorker(
+            jobs,
+            self.queueWorkersSpinBox.value(),
+            cache=self.instance_cache,
+            telemetry_log=self.telemetry_log,
+        )
+        self.batch_worker.signals.started.connect(self._batch_worker_started)
+        self.batch_worker.signals.result.connect(self._batch_worker_result)
+        self.batch_worker.signals.error.connect(self._batch_worker_error)
+        self.batch_worker.signals.finished.connect(self._batch_worker_complete)
+        self.job_start_times = {}
+
+        self.queueRunButton.setEnabled(False)
+        self.queueClearButton.setEnabled(False)
+        self.queueStopButton.setEnabled(True)
+        self.statusbar.showMessage(f"Running {len(jobs)} queued jobs...")
+        self.threadpool.start(self.batch_worker)
+
+    def btn_clicked_queue_stop(self):
+        if self.batch_worker:
+            self.batch_worker.cancel()
+            self.queueStopButton.setEnabled(False)
+            self.statusbar.showMessage("Stopping after the running jobs...")
+
+    def btn_clicked_queue_clear(self):
+        self.job_queue_model.clear()
+        self.statusbar.showMessage("Job queue cleared")
+
     #
     # Keyboard input press events
     #
@@ -682,10 +935,20 @@ class MainWindow(QMainWindow):
         # prints the out file path to stdout stream on success
         print(f"Write path: {result_string}")
 
+    def _instance_worker_telemetry(self, event):
+        # InstanceWorker job telemetry, emitted before
+        # the result / error and finished signals
+        self.instance_telemetry = event
+
     def _instance_worker_complete(self):
         # Instance worker ended execution
         self.sliceButton.setEnabled(True)
-        self.statusbar.showMessage("Complete")
+        if self.instance_telemetry:
+            self.statusbar.showMessage(
+                f"Complete ({self.instance_telemetry['total_time']:.2f} s)"
+            )
+        else:
+            self.statusbar.showMessage("Complete")
 
     def _instance_worker_error(self, error_string):
         # hide progress dialog before presentation of error dialog
@@ -699,31 +962,94 @@ class MainWindow(QMainWindow):
         self.sliceButton.setEnabled(True)
         self.statusbar.showMessage("Failed")
 
+    #
+    # Batch worker thread events
+    #
+
+    def _batch_worker_started(self, row):
+        self.job_start_times[row] = time.perf_counter()
+        self.job_queue_model.set_status(row, JobQueueModel.RUNNING)
+
+    def _batch_worker_result(self, row, result):
+        size = sum(
+            os.path.getsize(outpath)
+            for outpath in result.outpaths
+            if os.path.isfile(outpath)
+        )
+        self.job_queue_model.set_status(
+            row,
+            JobQueueModel.CACHED if result.cached else JobQueueModel.DONE,
+            duration=result.get_total_time(),
+            size=size,
+        )
+
+    def _batch_worker_error(self, row, error_string):
+        duration = time.perf_counter() - self.job_start_times.get(
+            row, time.perf_counter()
+        )
+        self.job_queue_model.set_status(
+            row, JobQueueModel.FAILED, duration=duration, error=error_string
+        )
+
+    def _batch_worker_complete(self):
+        self.batch_worker = None
+        self.queueRunButton.setEnabled(True)
+        self.queueClearButton.setEnabled(True)
+        self.queueStopButton.setEnabled(False)
+        failed = sum(
+            self.job_queue_model.get_status(row) == JobQueueModel.FAILED
+            for row in range(len(self.job_queue_model.jobs))
+        )
+        queued = len(self.job_queue_model.get_queued_jobs())
+        self.statusbar.showMessage(
+            f"Job queue complete ({failed} failed, {queued} not run)"
+        )
+
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~
     #
     # Font load
     #
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~
     def load_font(self, filepath):
-        """Instantiates default data model values and writes font data to UI."""
-        try:
-            self.font_model = FontModel(filepath)
-            if not self.font_model.is_variable_font():
-                SliceErrorDialog(
-                    "The file does not appear to be a variable font. See details below.",
-                    "The font is missing the OpenType fvar table and is not recognized "
-                    "as a variable font. Please try again with a font that includes the "
-                    "fvar table.",
-                )
-                return False
-        except Exception as e:
-            SliceErrorDialog(
-                "An error was encountered during the attempt to load your font. "
-                "See details below.",
-                detailed_text=str(e),
-            )
-            return False
+        """Starts a FontLoadWorker that reads the font data off of the GUI
+        thread.  A font load that is in progress is canceled."""
+        if self.font_load_worker:
+            self.font_load_worker.cancel()
+        self.font_load_worker = FontLoadWorker(filepath)
+        self.font_load_worker.signals.progress.connect(self._font_load_worker_progress)
+        self.font_load_worker.signals.result.connect(self._font_load_worker_result)
+        self.font_load_worker.signals.error.connect(self._font_load_worker_error)
+        self.font_load_worker.signals.finished.connect(self._font_load_worker_complete)
+        self.statusbar_progress.setValue(0)
+        self.statusbar_progress.show()
+        self.statusbar.showMessage("Loading...")
+        # the Slice button is enabled when the font load ends
+        self.sliceButton.setDisabled(True)
+        self.threadpool.start(self.font_load_worker)
+
+    #
+    # Font load worker thread events
+    #
+
+    def _is_current_font_load(self):
+        # signals of canceled font loads that were
+        # queued before the cancellation are ignored
+        return (
+            self.font_load_worker is not None
+            and self.sender() is self.font_load_worker.signals
+        )
+
+    def _font_load_worker_progress(self, percent, message):
+        if self._is_current_font_load():
+            self.statusbar_progress.setValue(percent)
+            self.statusbar.showMessage(f"{message}...")
 
+    def _font_load_worker_result(self, font_model):
+        """Writes the default data model values and font data to the UI."""
+        if not self._is_current_font_load():
+            return
+        self.font_model = font_model
+        # the tables were read in the worker thread
         name_table_was_set = self.name_table_model.load_font(self.font_model)
         axis_value_table_was_set = self.fvar_table_model.load_font(self.font_model)
 
@@ -740,6 +1066,18 @@ class MainWindow(QMainWindow):
         self.head_macstyle_bit_0_checkbox.setChecked(False)
         self.head_macstyle_bit_1_checkbox.setChecked(False)
 
+        # the preview font is built in a worker thread after the tables
+        # are displayed, fonts without glyf outlines have no preview
+        self.preview_edits = {}
+        self.preview_widget.set_font_model(self.font_model)
+        self.preview_widget.set_preview_font(None)
+        self.update_preview_location()
+        self.preview_font_worker = PreviewFontWorker(self.font_model)
+        self.preview_font_worker.signals.result.connect(
+            self._preview_font_worker_result
+        )
+        self.threadpool.start(self.preview_font_worker)
+
         if name_table_was_set and axis_value_table_was_set:
             # Update status bar with font family name,
             # version, and number of axes
@@ -749,8 +1087,49 @@ class MainWindow(QMainWindow):
                 f"loaded ({self.fvar_table_model.get_number_of_axes()} axes)"
             )
 
+    #
+    # Axis location preview events
+    #
+
+    def _preview_font_worker_result(self, preview_font):
+        # the preview fonts of previous font loads are ignored
+        if (
+            self.preview_font_worker is not None
+            and self.sender() is self.preview_font_worker.signals
+        ):
+            self.preview_font_worker = None
+            self.preview_widget.set_preview_font(preview_font)
+
+    def update_preview_location(self, *args):
+        self.preview_widget.set_location(
+            self.fvar_table_model.get_preview_location(self.preview_edits)
+        )
+
+    def preview_axis_value_edited(self, row, text):
+        self.preview_edits[row] = text
+        self.update_preview_location()
+
+    def preview_axis_value_edit_finished(self, row):
+        # the committed value is read from the model
+        self.preview_edits.pop(row, None)
+        self.update_preview_location()
+
+    def _font_load_worker_error(self, message, detailed_text):
+        if self._is_current_font_load():
+            self.statusbar.showMessage("Failed")
+            SliceErrorDialog(message, detailed_text=detailed_text)
+
+    def _font_load_worker_complete(self):
+        if self._is_current_font_load():
+            self.font_load_worker = None
+            self.statusbar_progress.hide()
+            self.sliceButton.setEnabled(True)
+
 
 def main():
+    # job queue pool processes are spawned, required
+    # for the spawn start method in frozen app builds
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     # fusion_style = QStyleFactory.create("Fusion")
     # app.setStyle(fusion_style)
@@ -0,0 +1,156 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Process pool batch execution of SliceJob objects.  instantiateVariableFont
+# is CPU-bound Python and threads are serialized by the GIL, so jobs are
+# executed in separate processes.  This module must not import PyQt5.
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+from itertools import chain, islice
+
+from .engine import run_job
+from .fontsession import FontSession
+
+# number of FontSession objects that remain resident in a process
+MAX_PROCESS_SESSIONS = 8
+
+# font path : FontSession objects that remain resident in a process for
+# re-use across the jobs that it executes, least recently used first
+_process_sessions = {}
+
+
+def get_process_session(fontpath):
+    """Returns the FontSession for a font path, parsing the file on the first
+    request in the current process and after the file is modified.  The
+    least recently used sessions beyond MAX_PROCESS_SESSIONS are released."""
+    fontpath = os.path.abspath(fontpath)
+    session = _process_sessions.pop(fontpath, None)
+    if session is None or session.is_modified():
+        session = FontSession(fontpath)
+    _process_sessions[fontpath] = session
+    while len(_process_sessions) > MAX_PROCESS_SESSIONS:
+        del _process_sessions[next(iter(_process_sessions))]
+    return session
+
+
+def run_pooled_job(job, cache=None, progress=None):
+    return run_job(job, get_process_session(job.fontpath), cache, progress)
+
+
+def run_pooled_job_from(cwd, job, cache=None):
+    """run_pooled_job from the cwd working directory.  The workers of a
+    long-lived pool keep the working directory of the pool creation."""
+    os.chdir(cwd)
+    return run_pooled_job(job, cache)
+
+
+def get_default_max_workers():
+    return os.cpu_count() or 1
+
+
+def run_jobs(
+    jobs,
+    max_workers=None,
+    cache=None,
+    get_progress=None,
+    on_start=None,
+    mp_context=None,
+    is_canceled=None,
+    executor=None,
+):
+    """Generator that executes an iterable of SliceJob objects across a process
+    pool.  Yields (job, SliceResult, None) on success and (job, None, exception)
+    on failure in order of completion.  The pool size defaults to the number of CPUs.
+    Jobs are served from the InstanceCache cache when it is defined.
+    get_progress(job) returns a ProgressTracker for a job.  Progress is only
+    reported for serial execution, the trackers do not cross processes.
+    on_start(job) is called when a job starts execution.  mp_context is the
+    multiprocessing context of the pool, None = the platform default.
+    is_canceled() returns True when the remaining jobs must not start, the
+    jobs that have started complete and their results are yielded.  Jobs
+    that have not started are not executed when the generator is closed,
+    the results of the executing jobs are not yielded.  executor is a
+    long-lived ProcessPoolExecutor of the pooled jobs that is not shut down,
+    None = a new pool of max_workers processes."""
+    if max_workers is None:
+        max_workers = get_default_max_workers()
+    # jobs can be a lazy iterable, only the jobs that fill
+    # the pool are read before the first submission
+    jobs = iter(jobs)
+    first_jobs = list(islice(jobs, max_workers))
+    max_workers = min(max_workers, len(first_jobs))
+    jobs = chain(first_jobs, jobs)
+
+    # skip the process start cost when there
+    # is nothing to execute in parallel
+    if max_workers <= 1:
+        for job in jobs:
+            if is_canceled and is_canceled():
+                return
+            if on_start:
+                on_start(job)
+            progress = get_progress(job) if get_progress else None
+            try:
+                result = run_pooled_job(job, cache, progress)
+            except Exception as e:
+                yield job, None, e
+            else:
+                yield job, result, None
+        return
+
+    if executor is not None:
+        submit = partial(executor.submit, run_pooled_job_from, os.getcwd())
+        yield from _run_pooled_jobs(
+            submit, jobs, max_workers, cache, on_start, is_canceled
+        )
+        return
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=mp_context
+    ) as executor:
+        submit = partial(executor.submit, run_pooled_job)
+        yield from _run_pooled_jobs(
+            submit, jobs, max_workers, cache, on_start, is_canceled
+        )
+
+
+def _run_pooled_jobs(submit, jobs, max_workers, cache, on_start, is_canceled):
+    futures = {}
+
+    def submit_next():
+        # jobs are submitted as workers become free so that
+        # a submitted job is an executing job
+        if is_canceled and is_canceled():
+            return
+        job = next(jobs, None)
+        if job is not None:
+            if on_start:
+                on_start(job)
+            futures[submit(job, cache)] = job
+
+    for _ in range(max_workers):
+        submit_next()
+    while futures:
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        for future in done:
+            job = futures.pop(future)
+            submit_next()
+            try:
+                result = future.result()
+            except Exception as e:
+                yield job, None, e
+            else:
+                yield job, result, None
@@ -0,0 +1,99 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+import multiprocessing
+import sys
+import threading
+import traceback
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+
+from .batch import run_jobs
+from .telemetry import get_telemetry_event
+
+
+class BatchWorkerSignals(QObject):
+    finished = pyqtSignal()  # no return type, only signal that complete
+    started = pyqtSignal(int)  # returns the queue row of a started job
+    error = pyqtSignal(int, str)  # returns the queue row and the error message
+    result = pyqtSignal(int, object)  # returns the queue row and the SliceResult
+
+
+class BatchWorker(QRunnable):
+    """Executes queued SliceJob objects in a process pool with at most
+    max_workers concurrent jobs.  Job status is emitted by queue row."""
+
+    def __init__(self, jobs, max_workers=1, cache=None, telemetry_log=None):
+        super().__init__()
+        self.signals = BatchWorkerSignals()
+        # list of (queue row, SliceJob) tuples
+        self.jobs = jobs
+        self.max_workers = max_workers
+        # InstanceCache, None = no cache
+        self.cache = cache
+        # TelemetryLog, None = no job telemetry
+        self.telemetry_log = telemetry_log
+        self._canceled = threading.Event()
+
+    def cancel(self):
+        """Requests cancellation.  Jobs that are executing complete and
+        report their results, jobs that have not started are not executed."""
+        self._canceled.set()
+
+    def is_canceled(self):
+        return self._canceled.is_set()
+
+    @pyqtSlot()
+    def run(self):
+        rows = {id(job): row for row, job in self.jobs}
+        try:
+            # pool processes are spawned, a fork of the
+            # multi-threaded GUI process is not safe
+            completed = run_jobs(
+                [job for _, job in self.jobs],
+                self.max_workers,
+                self.cache,
+                on_start=lambda job: self.signals.started.emit(rows[id(job)]),
+                mp_context=multiprocessing.get_context("spawn"),
+                is_canceled=self.is_canceled,
+            )
+            # the executing jobs are reported after a cancellation so
+            # that every started row receives a result or an error
+            for job, result, error in completed:
+                self.emit_job(rows[id(job)], job, result, error)
+        except Exception:
+            sys.stderr.write(f"{traceback.format_exc()}\n")
+
+        self.signals.finished.emit()
+
+    def emit_job(self, row, job, result, error):
+        if error:
+            event = get_telemetry_event(job.fontpath, [job.outpath], {}, error=error)
+            self.signals.error.emit(row, f"{error}")
+        else:
+            event = get_telemetry_event(
+                job.fontpath,
+                result.outpaths,
+                result.timings,
+                result.process_peak_rss,
+                result.cached,
+            )
+            self.signals.result.emit(row, result)
+        if self.telemetry_log:
+            try:
+                self.telemetry_log.write(event)
+            except OSError as e:
+                # a log write failure does not fail the batch
+                sys.stderr.write(f"Telemetry log write failed: {e}\n")
@@ -0,0 +1,54 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+
+class FontBitFlagModel(object):
+    def __init__(self, os2_dict, head_dict):
+        self._os2_dict = os2_dict
+        self._head_dict = head_dict
+
+    def _set_bit(self, int_type, offset):
+        mask = 1 << offset
+        return int_type | mask
+
+    def _clear_bit(self, int_type, offset):
+        mask = ~(1 << offset)
+        return int_type & mask
+
+    def _get_bit_offset_from_key(self, bitkey):
+        # dict key formatted as e.g., `bit0`
+        # grab the integer portion and cast to int
+        return int(bitkey.replace("bit", ""))
+
+    def _edit_bits(self, integer, bit_dict):
+        for bitkey, is_set in bit_dict.items():
+            offset = self._get_bit_offset_from_key(bitkey)
+            if is_set:
+                integer = self._set_bit(integer, offset)
+            else:
+                integer = self._clear_bit(integer, offset)
+        return integer
+
+    def get_os2_instance_data(self):
+        return self._os2_dict
+
+    def get_head_instance_data(self):
+        return self._head_dict
+
+    def edit_os2_fsselection_bits(self, integer):
+        return self._edit_bits(integer, self._os2_dict)
+
+    def edit_head_macstyle_bits(self, integer):
+        return self._edit_bits(integer, self._head_dict)
@@ -0,0 +1,158 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Content-addressed on-disk cache of instance font files.  Entries are keyed
+# by the source font hash and the normalized job parameters.  File writes
+# are atomic so that one cache directory can be shared by several
+# processes.  This module must not import PyQt5.
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from fontTools import version as fonttools_version
+
+DEFAULT_CACHE_SIZE = 512 * 1024 * 1024
+
+
+def hash_file(filepath):
+    sha256 = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def normalize_axis_data(axis_data):
+    """Returns axis definitions with float values and sorted ranges so
+    that equivalent definitions produce the same cache key."""
+    normalized = {}
+    for axistag, value in axis_data.items():
+        if isinstance(value, (tuple, list)):
+            normalized[axistag] = sorted(float(v) for v in value)
+        else:
+            normalized[axistag] = float(value)
+    return normalized
+
+
+class InstanceCache(object):
+    def __init__(self, cache_dir, max_size=DEFAULT_CACHE_SIZE):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # maximum size of the cache entries in bytes
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(
+        self,
+        source_hash,
+        axis_data,
+        name_data,
+        os2_bits,
+        head_bits,
+        flavor,
+        compression=None,
+        optimize="full",
+        subset=None,
+    ):
+        key_data = {
+            "source": source_hash,
+            "axes": normalize_axis_data(axis_data),
+            "names": name_data,
+            "os2_bits": os2_bits,
+            "head_bits": head_bits,
+            "flavor": flavor,
+            "compression": compression.get_data() if compression else None,
+            "optimize": optimize,
+            "subset": subset.get_data() if subset else None,
+            # instancer output changes across fontTools releases
+            "fonttools": fonttools_version,
+        }
+        serialized = json.dumps(key_data, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(serialized).hexdigest()
+
+    def get_path(self, key):
+        return self.cache_dir / key
+
+    def contains(self, key):
+        return self.get_path(key).is_file()
+
+    def fetch(self, key, outpath):
+        """Copies a cache entry to outpath.  Returns True on a cache hit
+        and False on a miss."""
+        cache_path = self.get_path(key)
+        try:
+            shutil.copyfile(cache_path, outpath)
+            # the modification time tracks the least recently used entries
+            os.utime(cache_path)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, key, filepath):
+        """Adds a copy of filepath to the cache and evicts the least
+        recently used entries that exceed the cache size limit."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        os.close(fd)
+        try:
+            shutil.copyfile(filepath, tmp_path)
+            os.replace(tmp_path, self.get_path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def get_entries(self):
+        """Returns a list of (path, size, mtime) tuples for the cache entries
+        ordered from least to most recently used."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # removed by another process
+                continue
+            entries.append((Path(entry.path), stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self):
+        entries = self.get_entries()
+        total_size = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def get_stats(self):
+        entries = self.get_entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "size": sum(size for _, size, _ in entries),
+            "max_size": self.max_size,
+        }
@@ -0,0 +1,517 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Headless command line interface.  Usage:
+#
+#   python -m slice.cli FONT -o OUTPATH --axis wght=700 --axis slnt=-15:0
+#   python -m slice.cli --spec jobs.json
+#   python -m slice.cli FONT -o OUTDIR --named-instances
+#   python -m slice.cli --sweep sweep.json
+#   python -m slice.cli --spec jobs.json --manifest jobs.manifest.jsonl
+#   python -m slice.cli --manifest jobs.manifest.jsonl
+#
+# Job spec JSON format:
+#
+#   {
+#     "font": "Recursive-VF.ttf",
+#     "instances": [
+#       {
+#         "outpath": "Recursive-Bold.ttf",
+#         "axes": {"wght": 700, "slnt": [-15, 0]},
+#         "names": {"1": "Recursive Bold", "2": "Regular"},
+#         "os2_bits": {"bit5": true},
+#         "head_bits": {"bit0": true},
+#         "flavors": ["ttf", "woff", "woff2"]
+#       }
+#     ],
+#     "compression": {"woff": "zopfli", "zopfli_iterations": 15, "brotli_quality": 11},
+#     "optimize": "full",
+#     "subset": {"unicodes": "U+0000-007F,U+20AC", "glyphs": ["fi"]},
+#     "shards": ["latin", "latin-ext", "cyrillic"]
+#   }
+#
+# "compression", "flavors", "optimize", "subset" and "shards" are optional
+# and can be defined per instance or for all instances.  "flavors" writes
+# each format from one instantiation with the outpath file extension replaced.
+# "optimize" (and --optimize) is one of none, iup (gvar IUP deltas only) or
+# full.  Lower levels instantiate faster and write larger files.
+#
+# "subset" (and --unicodes / --glyphs) subsets the variable font to the
+# glyphs of a unicode range and/or glyph name list (and their layout and
+# composite glyph closure) before it is instanced.  The instancer only
+# processes the retained glyphs.
+#
+# "shards" (and --shards / --shard) writes the instance as one file per
+# unicode range shard (see shards.py) in each "flavors" / --format (default
+# woff2) next to the outpath, plus an outpath .css file with an @font-face
+# rule and unicode-range per shard.  The font is instanced one time and the
+# shards are subset from the instance.  "shards" is a list of shard names
+# or a map of shard name : unicode range string.
+#
+# --cache-dir stores instance files in a content-addressed cache so that
+# repeated jobs are copied from the cache instead of re-instantiated.
+# --telemetry-log appends one JSON event per job with the stage timings,
+# peak RSS and output file sizes.  --progress writes percent complete and
+# ETA reports to stderr.  The ETA uses the --telemetry-log job history.
+#
+# --named-instances writes every fvar named instance to the OUTDIR
+# directory with name records and style linking bit flags that are
+# derived from the instance subfamily and PostScript names.
+#
+# --sweep expands a cartesian axis location sweep spec (see sweep.py) and
+# appends each job result to a results log in the sweep output directory.
+# Sweep jobs are expanded as they are submitted, so batch progress reports
+# the complete job count without a total.  A re-run of the sweep skips the
+# jobs that the log records as written.
+#
+# --manifest records the spec, state, output file hashes and timings of
+# each job in a JSON-lines job manifest (see manifest.py).  A re-run skips
+# the completed jobs with unchanged source fonts and output files.  The
+# manifest jobs are re-run when no other jobs are defined.
+
+import argparse
+import os
+import sys
+import time
+from itertools import chain, islice
+
+from .batch import get_default_max_workers, run_jobs
+from .cache import DEFAULT_CACHE_SIZE, InstanceCache
+from .compression import WOFF_COMPRESSION_METHODS, CompressionProfile
+from .engine import (
+    OUTPUT_FLAVORS,
+    SliceJob,
+    get_named_instance_jobs,
+    load_job_spec,
+    parse_axis_value,
+)
+from .glyphsubset import GlyphSubset
+from .manifest import JobManifest
+from .optimize import OPTIMIZE_LEVELS
+from .progress import (
+    ProgressTracker,
+    format_progress,
+    get_expected_time,
+    get_stage_weights,
+    load_job_history,
+)
+from .shards import UNICODE_RANGE_SHARDS, get_shard_ranges
+from .sweep import iter_sweep_jobs, load_completed_outpaths, load_sweep_spec
+from .telemetry import TelemetryLog, get_telemetry_event
+
+
+def parse_key_value(argument):
+    if "=" not in argument:
+        raise argparse.ArgumentTypeError(
+            f"'{argument}' is not a valid definition.  Use the KEY=VALUE format."
+        )
+    key, value = argument.split("=", 1)
+    return key.strip(), value.strip()
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog="slice",
+        description="Create custom font design spaces from variable fonts",
+    )
+    parser.add_argument("font", nargs="?", help="variable font path")
+    parser.add_argument("-o", "--outpath", help="instance font write path")
+    parser.add_argument(
+        "--axis",
+        action="append",
+        default=[],
+        type=parse_key_value,
+        metavar="TAG=VALUE",
+        help="axis location (e.g., wght=700) or restricted range (e.g., wght=300:700)",
+    )
+    parser.add_argument(
+        "--name",
+        action="append",
+        default=[],
+        type=parse_key_value,
+        metavar="ID=STRING",
+        help="name record definition (e.g., 1='Recursive Bold')",
+    )
+    parser.add_argument(
+        "--os2-bit",
+        action="append",
+        default=[],
+        type=int,
+        choices=(0, 5, 6, 8),
+        help="set OS/2.fsSelection bit",
+    )
+    parser.add_argument(
+        "--head-bit",
+        action="append",
+        default=[],
+        type=int,
+        choices=(0, 1),
+        help="set head.macStyle bit",
+    )
+    parser.add_argument(
+        "--format",
+        action="append",
+        dest="flavors",
+        choices=list(OUTPUT_FLAVORS),
+        help="write the instance in this format, repeat for multiple formats from "
+        "one instantiation (default: source font format at --outpath)",
+    )
+    parser.add_argument(
+        "--woff-compression",
+        choices=list(WOFF_COMPRESSION_METHODS),
+        default="zopfli",
+        help="WOFF compression method (default: zopfli)",
+    )
+    parser.add_argument(
+        "--zopfli-iterations",
+        type=int,
+        default=15,
+        help="zopfli iteration count for WOFF compression (default: 15)",
+    )
+    parser.add_argument(
+        "--brotli-quality",
+        type=int,
+        default=11,
+        help="brotli quality (0 - 11) for WOFF2 compression (default: 11)",
+    )
+    parser.add_argument(
+        "--optimize",
+        choices=list(OPTIMIZE_LEVELS),
+        help="instancer optimizations: none, gvar IUP deltas only, or full "
+        "(default: full)",
+    )
+    parser.add_argument(
+        "--unicodes",
+        metavar="RANGES",
+        help="subset the font to these code points before instancing "
+        "(e.g., U+0000-007F,U+20AC)",
+    )
+    parser.add_argument(
+        "--glyphs",
+        metavar="NAMES",
+        help="subset the font to these comma-separated glyph names before "
+        "instancing, combined with --unicodes",
+    )
+    parser.add_argument(
+        "--shards",
+        metavar="NAMES",
+        help="write unicode range shard files and a CSS file: comma-separated "
+        f"shard names or all ({', '.join(UNICODE_RANGE_SHARDS)})",
+    )
+    parser.add_argument(
+        "--shard",
+        action="append",
+        default=[],
+        type=parse_key_value,
+        metavar="NAME=RANGES",
+        help="custom unicode range shard (e.g., basic=U+0000-007F), repeat for "
+        "multiple shards",
+    )
+    parser.add_argument(
+        "--cache-dir", help="instance cache directory (default: no cache)"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+        help=f"instance cache size limit in MB (default: "
+        f"{DEFAULT_CACHE_SIZE // (1024 * 1024)})",
+    )
+    parser.add_argument(
+        "--telemetry-log", help="append JSON-lines job telemetry events to this file"
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="write percent complete and ETA reports to stderr",
+    )
+    parser.add_argument("--spec", help="JSON job spec path")
+    parser.add_argument("--sweep", help="JSON axis location sweep spec path")
+    parser.add_argument(
+        "--manifest",
+        help="record job states in this JSON-lines job manifest and skip "
+        "completed jobs on re-run",
+    )
+    parser.add_argument(
+        "--named-instances",
+        action="store_true",
+        help="write every fvar named instance to the --outpath directory",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of parallel worker processes (default: number of CPUs)",
+    )
+    return parser
+
+
+def get_compression_profile(args):
+    return CompressionProfile(
+        args.woff_compression, args.zopfli_iterations, args.brotli_quality
+    )
+
+
+def get_glyph_subset(args):
+    if not (args.unicodes or args.glyphs):
+        return None
+    return GlyphSubset(args.unicodes, args.glyphs)
+
+
+def get_shards(args):
+    """Returns a map of shard name : code point list of the --shards and
+    --shard definitions, or None."""
+    shards = get_shard_ranges(args.shards) if args.shards else {}
+    if args.shard:
+        shards.update(get_shard_ranges(dict(args.shard)))
+    return shards if shards else None
+
+
+def get_sweep_jobs(args, sweep):
+    os.makedirs(sweep.outdir, exist_ok=True)
+    if sweep.optimize is None:
+        sweep.optimize = args.optimize
+    if sweep.subset is None:
+        sweep.subset = get_glyph_subset(args)
+    completed = load_completed_outpaths(sweep.get_log_path())
+    compression = get_compression_profile(args)
+    # sweep jobs are expanded as the batch submits them
+    for job in iter_sweep_jobs(sweep, completed):
+        if job.compression is None:
+            job.compression = compression
+        yield job
+
+
+def get_jobs(args):
+    optimize = args.optimize if args.optimize else "full"
+    subset = get_glyph_subset(args)
+    shards = get_shards(args)
+    if args.spec:
+        jobs = load_job_spec(args.spec, optimize)
+        # command line compression, optimize and subset settings
+        # apply to jobs that do not define settings in the spec
+        for job in jobs:
+            if job.compression is None:
+                job.compression = get_compression_profile(args)
+            if job.subset is None:
+                job.subset = subset
+            if job.shards is None:
+                job.shards = shards
+        return jobs
+
+    if args.named_instances:
+        os.makedirs(args.outpath, exist_ok=True)
+        jobs = get_named_instance_jobs(
+            args.font, args.outpath, get_compression_profile(args), args.flavors
+        )
+        for job in jobs:
+            job.optimize = optimize
+            job.subset = subset
+            job.shards = shards
+        return jobs
+
+    axis_data = {
+        axistag: parse_axis_value(value, axistag) for axistag, value in args.axis
+    }
+    return [
+        SliceJob(
+            args.font,
+            args.outpath,
+            axis_data,
+            name_data={f"nameID{nameid}": string for nameid, string in args.name},
+            os2_bits={f"bit{bit}": True for bit in args.os2_bit},
+            head_bits={f"bit{bit}": True for bit in args.head_bit},
+            compression=get_compression_profile(args),
+            flavors=args.flavors,
+            optimize=optimize,
+            subset=subset,
+            shards=shards,
+        )
+    ]
+
+
+def format_result(result):
+    timings = "  ".join(
+        f"{stage} {seconds:.3f}s" for stage, seconds in result.timings.items()
+    )
+    outpaths = ", ".join(result.outpaths)
+    cached = "  (cached)" if result.cached else ""
+    return f"{outpaths}  {timings}  total {result.get_total_time():.3f}s{cached}"
+
+
+def format_cache_stats(cache, hits, misses):
+    stats = cache.get_stats()
+    return (
+        f"cache: {hits} hits, {misses} misses, {stats['entries']} entries, "
+        f"{stats['size'] / (1024 * 1024):.1f} of {cache.max_size / (1024 * 1024):.1f} MB"
+    )
+
+
+def write_progress(report):
+    sys.stderr.write(f"\r{format_progress(report):<72}")
+    # the final report of a job
+    if report["stage"] is None:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
+
+
+def get_progress_factory(history):
+    """Returns a function that creates a ProgressTracker for a job
+    with the stage weights and expected time in the job history."""
+    stage_weights = get_stage_weights(history)
+
+    def get_progress(job):
+        font_size = os.path.getsize(job.fontpath) if os.path.isfile(job.fontpath) else 0
+        return ProgressTracker(
+            write_progress, stage_weights, get_expected_time(history, font_size)
+        )
+
+    return get_progress
+
+
+def format_batch_progress(completed, total, elapsed):
+    # the job count of a sweep is unknown until the sweep is expanded
+    if total is None:
+        return f"[{completed}] jobs complete  {elapsed:.0f}s elapsed"
+    eta = elapsed / completed * (total - completed)
+    return (
+        f"[{completed}/{total}] {completed / total:.0%} of jobs complete  "
+        f"ETA {eta:.0f}s"
+    )
+
+
+def main(argv=None, executor=None):
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    if not (args.spec or args.sweep or args.manifest) and not (
+        args.font and args.outpath
+    ):
+        parser.error(
+            "requires a FONT and --outpath, a --spec job file, a --sweep spec file, "
+            "or a --manifest job manifest"
+        )
+    if args.manifest and args.font and not args.outpath:
+        parser.error("FONT requires --outpath")
+    if args.sweep and (
+        args.font or args.spec or args.named_instances or args.axis or args.name
+    ):
+        parser.error(
+            "--sweep defines the font and axis data of each instance and does not "
+            "accept FONT, --spec, --named-instances, --axis, or --name"
+        )
+    if args.named_instances and (
+        args.spec or args.axis or args.name or args.os2_bit or args.head_bit
+    ):
+        parser.error(
+            "--named-instances defines the axis, name, and bit flag data of each "
+            "instance and does not accept --spec, --axis, --name, --os2-bit, or "
+            "--head-bit"
+        )
+
+    try:
+        # job events are written to each log as jobs complete
+        logs = [TelemetryLog(args.telemetry_log)] if args.telemetry_log else []
+        if args.sweep:
+            sweep = load_sweep_spec(args.sweep)
+            jobs = get_sweep_jobs(args, sweep)
+            logs.append(TelemetryLog(sweep.get_log_path()))
+            first_jobs = list(islice(jobs, 2))
+            if not first_jobs:
+                print(f"sweep: all jobs are complete in {sweep.outdir}")
+            # the job count is known when the sweep has fewer than two jobs
+            total = len(first_jobs) if len(first_jobs) < 2 else None
+            jobs = chain(first_jobs, jobs)
+        elif args.manifest and not (args.spec or args.font):
+            jobs = None
+        else:
+            jobs = get_jobs(args)
+        if not args.sweep:
+            total = None if jobs is None else len(jobs)
+        manifest = None
+        if args.manifest:
+            manifest = JobManifest(args.manifest)
+            if jobs is None:
+                jobs = manifest.get_jobs()
+                if not jobs:
+                    raise ValueError(f"{args.manifest} does not define jobs")
+            # the manifest reports the complete job count of the whole batch
+            jobs = list(jobs)
+            pending = manifest.get_pending_jobs(jobs)
+            if len(pending) < len(jobs):
+                print(
+                    f"manifest: {len(jobs) - len(pending)} of {len(jobs)} jobs "
+                    f"are complete"
+                )
+            jobs = pending
+            total = len(jobs)
+        cache = None
+        if args.cache_dir:
+            cache = InstanceCache(args.cache_dir, args.cache_size * 1024 * 1024)
+    except Exception as e:
+        sys.stderr.write(f"[ERROR] {e}\n")
+        return 1
+
+    get_progress = None
+    if args.progress:
+        workers = args.workers if args.workers else get_default_max_workers()
+        # job progress is reported for serial execution, pooled
+        # jobs report progress as jobs complete
+        if workers <= 1 or (total is not None and total <= 1):
+            get_progress = get_progress_factory(load_job_history(args.telemetry_log))
+
+    start = time.perf_counter()
+    completed = 0
+    failures = 0
+    # cache statistics are counted here because pooled
+    # jobs execute on copies of the cache object
+    hits = 0
+    on_start = manifest.start if manifest else None
+    for job, result, error in run_jobs(
+        jobs, args.workers, cache, get_progress, on_start, executor=executor
+    ):
+        completed += 1
+        if error:
+            failures += 1
+            sys.stderr.write(f"[ERROR] {job.outpath}: {error}\n")
+            event = get_telemetry_event(job.fontpath, [job.outpath], {}, error=error)
+            if manifest:
+                manifest.fail(job, error)
+        else:
+            hits += result.cached
+            print(format_result(result))
+            if manifest:
+                manifest.finish(job, result)
+            event = get_telemetry_event(
+                job.fontpath,
+                result.outpaths,
+                result.timings,
+                result.process_peak_rss,
+                result.cached,
+            )
+        for log in logs:
+            log.write(event)
+        if args.progress and (total is None or total > 1):
+            elapsed = time.perf_counter() - start
+            sys.stderr.write(f"{format_batch_progress(completed, total, elapsed)}\n")
+
+    if cache is not None:
+        print(format_cache_stats(cache, hits, completed - failures - hits))
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Thin command line client of the slice daemon (see daemon.py).  Usage:
+#
+#   python -m slice.client FONT -o OUTPATH --axis wght=700
+#
+# The arguments are the slice.cli arguments.  The command executes in the
+# daemon with the client working directory and the daemon output is
+# written to the client stdout and stderr.  The exit status is the command
+# exit status.  The command executes in the client process when the daemon
+# is not running.  SLICE_DAEMON_SOCKET defines the daemon socket path.
+#
+# Protocol: the client sends one JSON line {"argv": [...], "cwd": "..."} (or
+# {"command": "stop"}) and the daemon replies with {"stream": "stdout" |
+# "stderr", "data": "..."} lines as the command writes output and a final
+# {"exit": status} line.
+#
+# This module imports the Python standard library only so that a client
+# invocation does not pay the fontTools import cost.  This module must not
+# import PyQt5.
+
+import json
+import os
+import socket
+import sys
+import tempfile
+
+SOCKET_ENVIRONMENT_VARIABLE = "SLICE_DAEMON_SOCKET"
+
+
+def get_user_socket_path():
+    """Returns the socket path in a per-user directory of the temporary
+    directory.  The daemon creates the directory with owner-only access."""
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"slice-{uid}", "daemon.sock")
+
+
+def get_default_socket_path():
+    """Returns the SLICE_DAEMON_SOCKET path, or the per-user socket path."""
+    socket_path = os.environ.get(SOCKET_ENVIRONMENT_VARIABLE)
+    if socket_path:
+        return socket_path
+    return get_user_socket_path()
+
+
+def send_message(f, message):
+    f.write(json.dumps(message).encode("utf-8") + b"\n")
+    f.flush()
+
+
+def send_request(socket_path, request, stdout=None, stderr=None):
+    """Sends a request to the daemon and writes the command output to the
+    stdout and stderr file objects (default: sys.stdout and sys.stderr).
+    Returns the exit status.  Raises OSError when the daemon is not
+    running."""
+    streams = {
+        "stdout": stdout if stdout is not None else sys.stdout,
+        "stderr": stderr if stderr is not None else sys.stderr,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rwb") as f:
+            send_message(f, request)
+            for line in f:
+                message = json.loads(line)
+                if "exit" in message:
+                    return message["exit"]
+                stream = streams[message["stream"]]
+                stream.write(message["data"])
+                stream.flush()
+    raise ConnectionError("The daemon closed the connection before the command exit.")
+
+
+def run_command(argv, socket_path=None, stdout=None, stderr=None):
+    """Executes slice.cli arguments in the daemon from the current working
+    directory and returns the exit status."""
+    return send_request(
+        socket_path if socket_path else get_default_socket_path(),
+        {"argv": list(argv), "cwd": os.getcwd()},
+        stdout,
+        stderr,
+    )
+
+
+def stop_daemon(socket_path=None):
+    return send_request(
+        socket_path if socket_path else get_default_socket_path(),
+        {"command": "stop"},
+    )
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        return run_command(argv)
+    except (FileNotFoundError, ConnectionRefusedError):
+        # the daemon is not running
+        from .cli import main as cli_main
+
+        return cli_main(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
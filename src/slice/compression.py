@@ -0,0 +1,152 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# WOFF/WOFF2 compression settings.  fontTools 4.23 writers do not accept
+# compression arguments, they call the fontTools.ttLib.sfnt compress function
+# and the fontTools.ttLib.woff2 brotli module at write time.  While a profile
+# is active in any thread, these are replaced with functions that compress
+# with the profile of the calling thread, and with the fontTools defaults in
+# threads without a profile.  Concurrent writes do not wait on each other
+# and a profile never applies to the writes of other threads.  This module
+# must not import PyQt5.
+
+import threading
+import zlib
+from contextlib import contextmanager
+
+from fontTools.ttLib import sfnt, woff2
+
+# WOFF compression methods : zlib compression level
+WOFF_COMPRESSION_METHODS = {
+    "zlib-fast": 1,
+    "zlib-9": 9,
+    "zopfli": 9,
+}
+
+# CompressionProfile of the writes in each thread
+_compression_local = threading.local()
+
+# the fontTools compression functions are replaced while a
+# compression_profile context is active in any thread
+_compression_patch = {"count": 0}
+_compression_lock = threading.Lock()
+
+
+class CompressionProfile(object):
+    def __init__(self, woff="zopfli", zopfli_iterations=15, brotli_quality=11):
+        if woff not in WOFF_COMPRESSION_METHODS:
+            raise ValueError(
+                f"'{woff}' is not a valid WOFF compression method.  Use one of "
+                f"{', '.join(WOFF_COMPRESSION_METHODS)}."
+            )
+        if int(zopfli_iterations) < 1:
+            raise ValueError(
+                f"The zopfli iteration count must be at least 1, "
+                f"received {zopfli_iterations}."
+            )
+        if not 0 <= int(brotli_quality) <= 11:
+            raise ValueError(
+                f"The WOFF2 brotli quality must be in the range 0 - 11, "
+                f"received {brotli_quality}."
+            )
+        self.woff = woff
+        self.zopfli_iterations = int(zopfli_iterations)
+        self.brotli_quality = int(brotli_quality)
+
+    def __repr__(self):
+        return (
+            f"CompressionProfile(woff={self.woff!r}, "
+            f"zopfli_iterations={self.zopfli_iterations}, "
+            f"brotli_quality={self.brotli_quality})"
+        )
+
+    def get_data(self):
+        return {
+            "woff": self.woff,
+            "zopfli_iterations": self.zopfli_iterations,
+            "brotli_quality": self.brotli_quality,
+        }
+
+
+def compress_woff_data(data, profile):
+    """Returns the zlib stream of WOFF table data with a CompressionProfile."""
+    if profile.woff == "zopfli":
+        from zopfli.zlib import compress
+
+        return compress(data, numiterations=profile.zopfli_iterations)
+    return zlib.compress(data, WOFF_COMPRESSION_METHODS[profile.woff])
+
+
+def _compress(data, *args, **kwargs):
+    # stands in for fontTools.ttLib.sfnt.compress
+    profile = getattr(_compression_local, "profile", None)
+    if profile is None:
+        return _compression_patch["compress"](data, *args, **kwargs)
+    return compress_woff_data(data, profile)
+
+
+class _BrotliQualityProxy(object):
+    """Stands in for the brotli module in fontTools.ttLib.woff2 to define
+    the compression quality of the writes in the calling thread."""
+
+    def __init__(self, brotli):
+        self._brotli = brotli
+
+    def compress(self, data, **kwargs):
+        profile = getattr(_compression_local, "profile", None)
+        if profile is not None:
+            kwargs.setdefault("quality", profile.brotli_quality)
+        return self._brotli.compress(data, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self._brotli, attr)
+
+
+def _install_compression_patch():
+    with _compression_lock:
+        if _compression_patch["count"] == 0:
+            brotli = getattr(woff2, "brotli", None)
+            _compression_patch.update(compress=sfnt.compress, brotli=brotli)
+            sfnt.compress = _compress
+            if brotli is not None:
+                woff2.brotli = _BrotliQualityProxy(brotli)
+        _compression_patch["count"] += 1
+
+
+def _remove_compression_patch():
+    with _compression_lock:
+        _compression_patch["count"] -= 1
+        if _compression_patch["count"] == 0:
+            sfnt.compress = _compression_patch["compress"]
+            if _compression_patch["brotli"] is not None:
+                woff2.brotli = _compression_patch["brotli"]
+
+
+@contextmanager
+def compression_profile(profile=None):
+    """Context manager that applies a CompressionProfile to the fontTools
+    WOFF/WOFF2 writes of the calling thread.  The default profile is used
+    when profile is None.  Writes in worker threads must enter the context
+    in the worker thread."""
+    if profile is None:
+        profile = CompressionProfile()
+    saved_profile = getattr(_compression_local, "profile", None)
+    _install_compression_patch()
+    _compression_local.profile = profile
+    try:
+        yield profile
+    finally:
+        _compression_local.profile = saved_profile
+        _remove_compression_patch()
@@ -0,0 +1,268 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Long-lived slice daemon on a Unix socket.  Usage:
+#
+#   python -m slice.daemon [--socket PATH] [--max-sessions 8] [--workers N]
+#   python -m slice.client FONT -o OUTPATH --axis wght=700
+#   python -m slice.daemon --stop
+#
+# The daemon executes slice.cli commands that are sent by the thin client
+# (see client.py for the protocol).  The fontTools modules are imported one
+# time and the recently used source fonts remain parsed in the batch process
+# FontSession pool, so that repeat commands only pay the instancing work.
+# Sessions are re-parsed when the source file changes.  Commands execute one
+# at a time with the client working directory.  Batch commands execute in a
+# long-lived process pool whose worker processes keep their own resident
+# sessions.  The socket is created with owner-only access, and the default
+# socket is in a per-user directory that is only accessible to the daemon
+# user.  This module must not import PyQt5.
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stderr, redirect_stdout
+
+# imported at daemon start so that commands do not pay the import cost
+import fontTools.subset  # noqa: F401
+import fontTools.ttLib.woff2  # noqa: F401
+
+from . import batch
+from .batch import get_default_max_workers
+from .cli import main as cli_main
+from .client import (
+    get_default_socket_path,
+    get_user_socket_path,
+    send_message,
+    stop_daemon,
+)
+
+
+class _MessageStream(object):
+    """File object that sends writes to the client as stream messages."""
+
+    def __init__(self, f, name):
+        self.f = f
+        self.name = name
+
+    def write(self, data):
+        if data:
+            try:
+                send_message(self.f, {"stream": self.name, "data": data})
+            except OSError:
+                # the client disconnected, the command runs to completion
+                pass
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+class SliceDaemonHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        if request.get("command") == "stop":
+            send_message(self.wfile, {"exit": 0})
+            # shutdown waits on the serve_forever loop of this request
+            threading.Thread(target=self.server.shutdown).start()
+            return
+        status = self.server.run_command(
+            request.get("argv", []),
+            request.get("cwd"),
+            _MessageStream(self.wfile, "stdout"),
+            _MessageStream(self.wfile, "stderr"),
+        )
+        try:
+            send_message(self.wfile, {"exit": status})
+        except OSError:
+            pass
+
+
+class SliceDaemon(socketserver.UnixStreamServer):
+    """Serves slice.cli commands on a Unix socket, one command at a time.
+    max_workers is the process pool size of batch commands, None = the
+    number of CPUs."""
+
+    def __init__(self, socket_path=None, max_workers=None):
+        socket_path = socket_path if socket_path else get_default_socket_path()
+        if socket_path == get_user_socket_path():
+            make_socket_directory(socket_path)
+        remove_stale_socket(socket_path)
+        # the socket file is created without group and other access, a chmod
+        # after the bind leaves a window where other users can connect
+        umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, SliceDaemonHandler)
+        finally:
+            os.umask(umask)
+        self.commands = 0
+        self.max_workers = max_workers if max_workers else get_default_max_workers()
+        # worker processes start on the first pooled job
+        self.executor = self.new_executor()
+        # the working directory and standard streams are process-wide
+        self._lock = threading.Lock()
+
+    def run_command(self, argv, cwd, stdout, stderr):
+        """Executes slice.cli arguments from the cwd directory with output to
+        the stdout and stderr file objects.  Returns the exit status."""
+        with self._lock:
+            saved_cwd = os.getcwd()
+            status = 1
+            try:
+                with redirect_stdout(stdout), redirect_stderr(stderr):
+                    try:
+                        if cwd:
+                            os.chdir(cwd)
+                        status = cli_main(argv, self.executor)
+                    except SystemExit as e:
+                        # argparse usage errors and --help
+                        if e.code is None or isinstance(e.code, int):
+                            status = e.code if e.code else 0
+                        else:
+                            sys.stderr.write(f"{e.code}\n")
+                    except Exception as e:
+                        sys.stderr.write(f"[ERROR] {e}\n")
+                return status
+            finally:
+                os.chdir(saved_cwd)
+                self.commands += 1
+                # job failures include the jobs of a broken pool
+                if status == 1 and self.executor is not None:
+                    self.check_executor()
+
+    def new_executor(self):
+        if self.max_workers <= 1:
+            return None
+        # forked workers would inherit the client connection and the
+        # redirected standard streams of the command that starts them
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def check_executor(self):
+        """Replaces the process pool after a worker process terminated
+        abruptly.  The pool does not accept jobs after that."""
+        try:
+            self.executor.submit(os.getpid).result()
+        except BrokenProcessPool:
+            self.executor.shutdown(wait=False)
+            self.executor = self.new_executor()
+
+    def server_close(self):
+        super().server_close()
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        try:
+            os.remove(self.server_address)
+        except OSError:
+            pass
+
+
+def make_socket_directory(socket_path):
+    """Creates the directory of a socket path with owner-only access.
+    Raises OSError when the directory is accessible to other users."""
+    directory = os.path.dirname(socket_path)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    stat = os.stat(directory)
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+        raise OSError(
+            f"The socket directory {directory} must only be accessible "
+            f"to the daemon user."
+        )
+
+
+def remove_stale_socket(socket_path):
+    """Removes the socket file of a daemon that is no longer running.
+    Raises OSError when a daemon is listening on the socket."""
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            os.remove(socket_path)
+            return
+    raise OSError(f"A slice daemon is already running on {socket_path}")
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog="slicedaemon",
+        description="Slice command daemon with resident fontTools modules "
+        "and parsed source fonts",
+    )
+    parser.add_argument(
+        "--socket",
+        help="Unix socket path (default: $SLICE_DAEMON_SOCKET or "
+        f"{get_default_socket_path()})",
+    )
+    parser.add_argument(
+        "--max-sessions",
+        type=int,
+        default=batch.MAX_PROCESS_SESSIONS,
+        help="number of parsed source fonts that remain resident "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="process pool size of batch commands (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--stop", action="store_true", help="stop the daemon on the socket"
+    )
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    if args.stop:
+        try:
+            return stop_daemon(args.socket)
+        except OSError:
+            sys.stderr.write("[ERROR] The slice daemon is not running\n")
+            return 1
+
+    batch.MAX_PROCESS_SESSIONS = args.max_sessions
+    try:
+        daemon = SliceDaemon(args.socket, args.workers)
+    except OSError as e:
+        sys.stderr.write(f"[ERROR] {e}\n")
+        return 1
+    print(f"slice daemon listening on {daemon.server_address}")
+    sys.stdout.flush()
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,771 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Headless slicing engine.  This module (and its imports) must
+# not import PyQt5 so that it can be used without a display.
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO
+from pathlib import Path
+
+from fontTools.ttLib import TTFont
+from fontTools.varLib.instancer import instantiateVariableFont
+
+from .bitflags import FontBitFlagModel
+from .cache import hash_file, normalize_axis_data
+from .compression import CompressionProfile, compression_profile
+from .fontinspect import FontInspector
+from .fontsession import FontSession
+from .glyphsubset import GlyphSubset, subset_variable_font
+from .optimize import optimize_level, validate_optimize_level
+from .progress import ProgressTracker, instancer_progress
+from .shards import (
+    format_font_face_rule,
+    get_css_font_properties,
+    get_css_path,
+    get_shard_codepoints,
+    get_shard_outpath,
+    get_shard_ranges,
+    subset_shard,
+)
+from .telemetry import get_peak_rss
+
+# platformID, platEncID, langID of the name records that are edited
+NAME_RECORD_PLAT_ENC_LANG = (3, 1, 1033)
+# name records that are always written
+MANDATORY_NAME_IDS = (1, 2, 3, 4, 6)
+# name records that are written when defined, else removed
+OPTIONAL_NAME_IDS = (16, 17, 21, 22)
+
+OS2_FSSELECTION_BITS = ("bit0", "bit5", "bit6", "bit8")
+HEAD_MACSTYLE_BITS = ("bit0", "bit1")
+
+# fvar named instance subfamily names that are style linked with the
+# nameID 2 record and bit flags : (OS/2.fsSelection bits, head.macStyle bits)
+RIBBI_STYLE_BITS = {
+    "Regular": ({"bit6": True}, {}),
+    "Italic": ({"bit0": True}, {"bit1": True}),
+    "Bold": ({"bit5": True}, {"bit0": True}),
+    "Bold Italic": ({"bit0": True, "bit5": True}, {"bit0": True, "bit1": True}),
+}
+
+# fvar InstanceRecord postscriptNameID value for undefined names
+UNDEFINED_NAME_ID = 0xFFFF
+
+# output flavor name : fontTools.ttLib.TTFont flavor
+OUTPUT_FLAVORS = {
+    "ttf": None,
+    "woff": "woff",
+    "woff2": "woff2",
+}
+
+
+class SliceJob(object):
+    def __init__(
+        self,
+        fontpath,
+        outpath,
+        axis_data,
+        name_data=None,
+        os2_bits=None,
+        head_bits=None,
+        compression=None,
+        flavors=None,
+        optimize="full",
+        subset=None,
+        shards=None,
+    ):
+        self.fontpath = fontpath
+        self.outpath = outpath
+        # map of "axis_tag": float location or (min, max) range
+        self.axis_data = axis_data
+        # map of "nameIDx": string.  Records that are not defined
+        # here use the source font values
+        self.name_data = name_data if name_data else {}
+        # bit flags that are not defined here are cleared, the
+        # same as an unchecked box in the GUI bit flag editor
+        self.os2_bits = {bit: False for bit in OS2_FSSELECTION_BITS}
+        self.os2_bits.update(os2_bits if os2_bits else {})
+        self.head_bits = {bit: False for bit in HEAD_MACSTYLE_BITS}
+        self.head_bits.update(head_bits if head_bits else {})
+        # WOFF/WOFF2 CompressionProfile, None = default profile
+        self.compression = compression
+        # list of OUTPUT_FLAVORS names.  None = one write to
+        # outpath in the source font flavor
+        self.flavors = flavors
+        for flavor in flavors if flavors else []:
+            if flavor not in OUTPUT_FLAVORS:
+                raise ValueError(
+                    f"'{flavor}' is not a valid output format.  Use one of "
+                    f"{', '.join(OUTPUT_FLAVORS)}."
+                )
+        # OPTIMIZE_LEVELS name of the instancer optimizations
+        self.optimize = validate_optimize_level(optimize)
+        # GlyphSubset that the font is subset to before
+        # it is instanced, None = all glyphs
+        self.subset = subset
+        # map of shard name : code point list.  The instance is written as
+        # one file per unicode range shard (in each flavor, default woff2)
+        # with a CSS file of @font-face rules.  None = one instance file
+        self.shards = get_shard_ranges(shards) if shards else None
+
+    def get_shard_flavors(self):
+        return self.flavors if self.flavors else ["woff2"]
+
+    def get_bit_model(self):
+        return FontBitFlagModel(self.os2_bits, self.head_bits)
+
+    def get_outputs(self, sfnt_version="\000\001\000\000"):
+        """Returns a list of (outpath, fontTools flavor) tuples for multi-format
+        jobs.  The out path file extension is replaced for each flavor."""
+        outputs = []
+        for flavor in self.flavors:
+            if flavor == "ttf":
+                suffix = ".otf" if sfnt_version == "OTTO" else ".ttf"
+            else:
+                suffix = f".{flavor}"
+            outputs.append(
+                (str(Path(self.outpath).with_suffix(suffix)), OUTPUT_FLAVORS[flavor])
+            )
+        return outputs
+
+
+class NamedInstance(object):
+    """An fvar named instance with the static font name records and style
+    linking bit flags that are derived from the instance subfamily name."""
+
+    def __init__(self, subfamily_name, postscript_name, coordinates, name_data):
+        self.subfamily_name = subfamily_name
+        self.postscript_name = postscript_name
+        # map of "axis_tag": float location for every fvar axis
+        self.coordinates = coordinates
+        # map of "nameIDx": string
+        self.name_data = name_data
+        style = name_data["nameID2"]
+        self.os2_bits, self.head_bits = RIBBI_STYLE_BITS[style]
+
+    def get_job(self, fontpath, outdir, compression=None, flavors=None):
+        """Returns a SliceJob that writes the instance to a file in outdir
+        that is named with the PostScript name and the source file extension."""
+        outpath = Path(outdir) / f"{self.postscript_name}{Path(fontpath).suffix}"
+        return SliceJob(
+            str(fontpath),
+            str(outpath),
+            dict(self.coordinates),
+            name_data=dict(self.name_data),
+            os2_bits=dict(self.os2_bits),
+            head_bits=dict(self.head_bits),
+            compression=compression,
+            flavors=flavors,
+        )
+
+
+class SliceResult(object):
+    def __init__(
+        self, outpath, timings, outpaths=None, cached=False, process_peak_rss=None
+    ):
+        self.outpath = outpath
+        # all file writes, including multi-format job writes
+        self.outpaths = outpaths if outpaths else [outpath]
+        # ordered map of "stage": seconds
+        self.timings = timings
+        # True when the files were copied from an InstanceCache
+        self.cached = cached
+        # peak resident set size in bytes over the lifetime of the process
+        # that ran the job, including the jobs that it ran before
+        self.process_peak_rss = process_peak_rss
+
+    def get_total_time(self):
+        return sum(self.timings.values())
+
+
+#
+# Job definitions
+#
+
+
+def parse_axis_value(value, axistag):
+    """Returns a float for a fixed axis location or a sorted (min, max) tuple
+    for a restricted axis range.  Accepts numbers, [min, max] sequences, and
+    the axis editor string syntax (e.g., "400" or "300:700")."""
+    values = value
+    if isinstance(value, str):
+        if ":" in value:
+            values = value.split(":")
+        else:
+            values = [value]
+    elif isinstance(value, (int, float)):
+        values = [value]
+
+    try:
+        float_values = [float(v) for v in values]
+    except (TypeError, ValueError):
+        raise ValueError(f"'{value}' is not a valid {axistag} axis value.")
+
+    if len(float_values) == 1:
+        return float_values[0]
+    elif len(float_values) == 2:
+        return tuple(sorted(float_values))
+    else:
+        raise ValueError(f"'{value}' is not a valid {axistag} axis value.")
+
+
+def validate_axis_data(axis_data, fvar):
+    """Validates that the axis tags are in the font and that Level 3
+    restricted axis ranges include the default axis value."""
+    fvar_axes = {axis.axisTag: axis for axis in fvar.axes}
+    for axistag, value in axis_data.items():
+        if axistag not in fvar_axes:
+            raise ValueError(f"The font does not include a {axistag} axis.")
+        if isinstance(value, tuple):
+            default = fvar_axes[axistag].defaultValue
+            if default < value[0] or default > value[1]:
+                raise ValueError(
+                    f"The {axistag} range {value[0]}:{value[1]} does not "
+                    f"include the default axis value ({default}).  This is "
+                    f"currently a requirement."
+                )
+
+
+def get_name_instance_data(name_table):
+    """Returns the source font name records in the
+    FontNameModel.get_instance_data format."""
+    name_instance_data = {}
+    for nameid in MANDATORY_NAME_IDS:
+        record = name_table.getName(nameid, *NAME_RECORD_PLAT_ENC_LANG)
+        name_instance_data[f"nameID{nameid}"] = record.toUnicode() if record else ""
+    # the GUI name editor does not pre-populate the optional
+    # records, the blank fields remove them from the instance
+    for nameid in OPTIONAL_NAME_IDS:
+        name_instance_data[f"nameID{nameid}"] = ""
+    return name_instance_data
+
+
+def get_name_string(name_table, nameid):
+    record = name_table.getName(nameid, *NAME_RECORD_PLAT_ENC_LANG)
+    if record:
+        return record.toUnicode()
+    # fall back to the first English or any platform record
+    return name_table.getDebugName(nameid)
+
+
+def get_named_instance_name_data(name_table, subfamily_name, postscript_name):
+    """Returns the FontNameModel.get_instance_data format name records of a
+    static font that is instantiated at an fvar named instance."""
+    family_name = get_name_string(name_table, 16) or get_name_string(name_table, 1)
+    version = (get_name_string(name_table, 5) or "").split(";")[0]
+    version = version.replace("Version ", "").strip()
+    full_name = f"{family_name} {subfamily_name}"
+    if subfamily_name in RIBBI_STYLE_BITS:
+        # style linked family, no typographic family records
+        name_data = {
+            "nameID1": family_name,
+            "nameID2": subfamily_name,
+            "nameID16": "",
+            "nameID17": "",
+        }
+    else:
+        # e.g., "Light Italic" = "Family Light" + "Italic"
+        if subfamily_name.endswith(" Italic"):
+            style_name = "Italic"
+            family_style_name = subfamily_name[: -len(" Italic")]
+        else:
+            style_name = "Regular"
+            family_style_name = subfamily_name
+        name_data = {
+            "nameID1": f"{family_name} {family_style_name}",
+            "nameID2": style_name,
+            "nameID16": family_name,
+            "nameID17": subfamily_name,
+        }
+    name_data.update(
+        {
+            "nameID3": f"{version};{postscript_name}" if version else postscript_name,
+            "nameID4": full_name,
+            "nameID6": postscript_name,
+            "nameID21": "",
+            "nameID22": "",
+        }
+    )
+    return name_data
+
+
+def get_named_instances(fvar, name_table):
+    """Returns a list of NamedInstance objects for the fvar named instances.
+    PostScript names that are not defined in the font are derived from the
+    family and subfamily names."""
+    family_name = get_name_string(name_table, 16) or get_name_string(name_table, 1)
+    named_instances = []
+    for instance in fvar.instances:
+        subfamily_name = get_name_string(name_table, instance.subfamilyNameID)
+        if not subfamily_name:
+            raise ValueError(
+                f"The fvar named instance at {instance.coordinates} does not "
+                f"have a subfamily name record (nameID {instance.subfamilyNameID})."
+            )
+        postscript_name = None
+        if instance.postscriptNameID not in (None, UNDEFINED_NAME_ID):
+            postscript_name = get_name_string(name_table, instance.postscriptNameID)
+        if not postscript_name:
+            postscript_name = (
+                f"{family_name.replace(' ', '')}-{subfamily_name.replace(' ', '')}"
+            )
+        named_instances.append(
+            NamedInstance(
+                subfamily_name,
+                postscript_name,
+                {
+                    axistag: float(value)
+                    for axistag, value in instance.coordinates.items()
+                },
+                get_named_instance_name_data(
+                    name_table, subfamily_name, postscript_name
+                ),
+            )
+        )
+    return named_instances
+
+
+def get_named_instance_jobs(fontpath, outdir, compression=None, flavors=None):
+    """Returns a list of SliceJob objects that write every fvar
+    named instance of a variable font to outdir."""
+    inspector = FontInspector(fontpath)
+    if not inspector.is_variable_font():
+        raise ValueError(f"{fontpath} is not a variable font (missing fvar table).")
+    named_instances = get_named_instances(
+        inspector.get_fvar_table(), inspector.get_name_table()
+    )
+    if not named_instances:
+        raise ValueError(f"{fontpath} does not define fvar named instances.")
+    return [
+        named_instance.get_job(fontpath, outdir, compression, flavors)
+        for named_instance in named_instances
+    ]
+
+
+def load_job_spec(specpath, optimize="full"):
+    """Returns a list of SliceJob objects from a JSON job spec file.
+    Relative paths are resolved from the job spec file directory.  optimize
+    is the optimize level of the instances that do not define a level."""
+    specpath = Path(specpath)
+    with open(specpath) as f:
+        spec = json.load(f)
+
+    spec_dir = specpath.parent
+    jobs = []
+    for instance in spec["instances"]:
+        compression_data = instance.get("compression", spec.get("compression"))
+        subset_data = instance.get("subset", spec.get("subset"))
+        shards = instance.get("shards", spec.get("shards"))
+        fontpath = spec_dir / instance.get("font", spec.get("font", ""))
+        axis_data = {
+            axistag: parse_axis_value(value, axistag)
+            for axistag, value in instance.get("axes", {}).items()
+        }
+        jobs.append(
+            SliceJob(
+                str(fontpath),
+                str(spec_dir / instance["outpath"]),
+                axis_data,
+                name_data={
+                    f"nameID{str(nameid).replace('nameID', '')}": string
+                    for nameid, string in instance.get("names", {}).items()
+                },
+                os2_bits=instance.get("os2_bits"),
+                head_bits=instance.get("head_bits"),
+                compression=(
+                    CompressionProfile(**compression_data) if compression_data else None
+                ),
+                flavors=instance.get("flavors", spec.get("flavors")),
+                optimize=instance.get("optimize", spec.get("optimize", optimize)),
+                subset=GlyphSubset(**subset_data) if subset_data else None,
+                shards=shards,
+            )
+        )
+    return jobs
+
+
+#
+# Slicing steps
+#
+
+
+def instantiate_variable_font(
+    ttfont, axis_instance_data, progress=None, optimize="full"
+):
+    """Instantiates the variable font in place.  progress is an optional
+    callback(fraction, message) for glyph and table progress reports.
+    optimize is an OPTIMIZE_LEVELS name."""
+    with optimize_level(optimize) as iup:
+        if progress is None:
+            instantiateVariableFont(
+                ttfont, axis_instance_data, inplace=True, optimize=iup
+            )
+        else:
+            with instancer_progress(ttfont, progress):
+                instantiateVariableFont(
+                    ttfont, axis_instance_data, inplace=True, optimize=iup
+                )
+
+
+def get_instance_key(axis_instance_data, optimize="full", subset=None):
+    """Returns a key for an axis location, optimize level and GlyphSubset
+    that is the same for equivalent axis definitions."""
+    return json.dumps(
+        [
+            normalize_axis_data(axis_instance_data),
+            optimize,
+            subset.get_data() if subset else None,
+        ],
+        sort_keys=True,
+    )
+
+
+def new_instance_ttfont(
+    session,
+    axis_instance_data,
+    progress=None,
+    ttfont=None,
+    optimize="full",
+    subset=None,
+):
+    """Returns a private TTFont of the FontSession font instantiated at an axis
+    location.  The instance tables are compiled and retained in the session so
+    that a later request at the same location (e.g., after a name record or
+    bit flag edit) re-opens the instance instead of re-instantiating the font.
+    ttfont is an optional private session TTFont that is instantiated in place
+    when the location is not retained.  progress is an optional
+    callback(fraction, message) for glyph and table progress reports.
+    optimize is an OPTIMIZE_LEVELS name.  subset is an optional GlyphSubset
+    that the font is subset to before it is instanced."""
+    key = get_instance_key(axis_instance_data, optimize, subset)
+    data = session.get_instance_data(key)
+    if data is None:
+        if ttfont is None:
+            ttfont = session.new_ttfont()
+        if subset is not None:
+            if progress is not None:
+                progress(0.0, "subsetting glyphs")
+            # the instancer only processes the retained glyphs
+            subset_variable_font(ttfont, subset)
+        instantiate_variable_font(ttfont, axis_instance_data, progress, optimize)
+        buf = BytesIO()
+        # retained as uncompressed sfnt data, the flavor is applied on save
+        ttfont.flavor = None
+        ttfont.save(buf)
+        data = buf.getvalue()
+        session.set_instance_data(key, data)
+
+    # tables are decompiled on demand, the tables that are not edited
+    # are copied to the instance file without a re-compile.  The bounding
+    # boxes were calculated when the instance was compiled
+    instance = TTFont(BytesIO(data), lazy=True, recalcBBoxes=False)
+    instance.lazy = None
+    instance.flavor = session.flavor
+    instance.flavorData = session.flavorData
+    return instance
+
+
+def edit_name_table(ttfont, name_instance_data):
+    name_table = ttfont["name"]
+    # set 3, 1, 1033 name records (only!)
+    # mandatory writes
+    for nameid in MANDATORY_NAME_IDS:
+        name_table.setName(
+            name_instance_data[f"nameID{nameid}"], nameid, *NAME_RECORD_PLAT_ENC_LANG
+        )
+
+    # optional writes
+    # Approach:
+    # (1) if user text data exists, write it
+    # (2) if user text data does not exist but record does, delete it
+    # (3) otherwise do nothing
+    for nameid in OPTIONAL_NAME_IDS:
+        if name_instance_data[f"nameID{nameid}"] != "":
+            name_table.setName(
+                name_instance_data[f"nameID{nameid}"],
+                nameid,
+                *NAME_RECORD_PLAT_ENC_LANG,
+            )
+        elif name_table.getName(nameid, *NAME_RECORD_PLAT_ENC_LANG):
+            name_table.removeNames(nameid, *NAME_RECORD_PLAT_ENC_LANG)
+
+    # update name table data
+    ttfont["name"] = name_table
+
+
+def edit_bit_flags(ttfont, bit_model):
+    # edit the OS/2.fsSelection bit flag
+    ttfont["OS/2"].fsSelection = bit_model.edit_os2_fsselection_bits(
+        ttfont["OS/2"].fsSelection
+    )
+    # edit head.macstyle bit flag
+    ttfont["head"].macStyle = bit_model.edit_head_macstyle_bits(ttfont["head"].macStyle)
+
+
+def save_font(ttfont, outpath, compression=None):
+    # the compression profile only applies to woff and woff2 writes
+    with compression_profile(compression):
+        ttfont.save(outpath)
+
+
+def save_font_flavors(ttfont, outputs, compression=None, progress=None):
+    """Writes one instance to several (outpath, flavor) outputs.  The tables are
+    compiled one time to uncompressed sfnt data and the flavor writes execute
+    in parallel threads.  Returns the list of out paths.  progress is an optional
+    callback(fraction, message) for write progress reports."""
+    source_flavor = ttfont.flavor
+    ttfont.flavor = None
+    buf = BytesIO()
+    try:
+        ttfont.save(buf)
+    finally:
+        ttfont.flavor = source_flavor
+    sfnt_data = buf.getvalue()
+    if progress is not None:
+        progress(1 / (len(outputs) + 1), "compressing")
+
+    def write(outpath, flavor):
+        if flavor is None:
+            with open(outpath, "wb") as f:
+                f.write(sfnt_data)
+        else:
+            # tables that are not transformed by the flavor
+            # writer are copied without decompilation
+            flavor_ttfont = TTFont(BytesIO(sfnt_data), recalcTimestamp=False)
+            flavor_ttfont.flavor = flavor
+            # the profile applies to the writes of the worker thread
+            with compression_profile(compression):
+                flavor_ttfont.save(outpath)
+        return outpath
+
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        futures = [executor.submit(write, *output) for output in outputs]
+        if progress is not None:
+            for written, future in enumerate(as_completed(futures), start=2):
+                outname = Path(future.result()).name
+                progress(written / (len(outputs) + 1), f"wrote {outname}")
+        return [future.result() for future in futures]
+
+
+def save_font_shards(ttfont, job, progress=None):
+    """Writes an instance as unicode range shard files in the flavors of a
+    SliceJob and a CSS file with one @font-face rule per shard.  The instance
+    tables are compiled one time and the shards are subset from the compiled
+    data one after another.  The subsetter is pure Python and does not run in
+    parallel in threads, batch jobs execute in parallel in the process pool
+    (see batch.py).  Returns the list of out paths, the CSS file path last.
+    progress is an optional callback(fraction, message) for write progress
+    reports."""
+    source_flavor = ttfont.flavor
+    ttfont.flavor = None
+    buf = BytesIO()
+    try:
+        ttfont.save(buf)
+    finally:
+        ttfont.flavor = source_flavor
+    sfnt_data = buf.getvalue()
+    cmap = ttfont.getBestCmap() or {}
+    # shards that the font does not map are not written
+    shards = {
+        name: get_shard_codepoints(cmap, unicodes)
+        for name, unicodes in job.shards.items()
+    }
+    shards = {name: unicodes for name, unicodes in shards.items() if unicodes}
+    if not shards:
+        raise ValueError("The font does not map code points in the shard ranges.")
+    flavors = job.get_shard_flavors()
+    if progress is not None:
+        progress(1 / (len(shards) + 1), "subsetting shards")
+
+    def write(name, unicodes):
+        shard_ttfont = subset_shard(sfnt_data, unicodes)
+        outpaths = []
+        for flavor in flavors:
+            outpath = get_shard_outpath(job.outpath, name, flavor)
+            shard_ttfont.flavor = OUTPUT_FLAVORS[flavor]
+            shard_ttfont.save(outpath)
+            outpaths.append(outpath)
+        return outpaths
+
+    shard_outpaths = []
+    with compression_profile(job.compression):
+        for written, (name, unicodes) in enumerate(shards.items(), start=2):
+            shard_outpaths.append(write(name, unicodes))
+            if progress is not None:
+                progress(written / (len(shards) + 1), f"wrote {name}")
+
+    family_name, font_weight, font_style = get_css_font_properties(
+        ttfont, job.axis_data
+    )
+    rules = [
+        format_font_face_rule(
+            name,
+            family_name,
+            font_weight,
+            font_style,
+            [
+                (Path(outpath).name, flavor)
+                for outpath, flavor in zip(outpaths, flavors)
+            ],
+            unicodes,
+        )
+        for (name, unicodes), outpaths in zip(shards.items(), shard_outpaths)
+    ]
+    css_path = get_css_path(job.outpath)
+    with open(css_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(rules))
+    return [outpath for outpaths in shard_outpaths for outpath in outpaths] + [css_path]
+
+
+def read_sfnt_version(fontpath):
+    """Returns the sfnt version tag of a TTF, OTF, WOFF or WOFF2 file
+    without a parse of the table directory."""
+    with open(fontpath, "rb") as f:
+        header = f.read(8)
+    if header[:4] in (b"wOFF", b"wOF2"):
+        return header[4:8].decode("latin-1")
+    return header[:4].decode("latin-1")
+
+
+def get_cache_outputs(job, cache, source_hash, sfnt_version):
+    """Returns a list of (InstanceCache key, outpath) tuples for the
+    files that a SliceJob writes."""
+    if job.flavors:
+        outputs = zip(job.flavors, job.get_outputs(sfnt_version))
+        outputs = [(flavor, outpath) for flavor, (outpath, _) in outputs]
+    else:
+        # the source font flavor is defined by the source hash
+        outputs = [(None, job.outpath)]
+    return [
+        (
+            cache.get_key(
+                source_hash,
+                job.axis_data,
+                job.name_data,
+                job.os2_bits,
+                job.head_bits,
+                flavor,
+                job.compression,
+                job.optimize,
+                job.subset,
+            ),
+            outpath,
+        )
+        for flavor, outpath in outputs
+    ]
+
+
+def get_save_message(flavor):
+    return f"compressing {flavor}" if flavor else "writing"
+
+
+def run_job(job, session=None, cache=None, progress=None):
+    """Executes the InstanceWorker slicing steps for a SliceJob and returns
+    a SliceResult with per-stage timings.  A FontSession for the job font
+    path can be passed to share one source parse across jobs.  The job
+    files are copied from an InstanceCache on a cache hit.  progress is an
+    optional ProgressTracker for percent complete reports."""
+    timings = {}
+    if progress is None:
+        progress = ProgressTracker()
+
+    # shard files are not cached
+    if job.shards:
+        cache = None
+    if cache is not None:
+        progress.start_stage("cache", "checking the instance cache")
+        start = time.perf_counter()
+        if session is None:
+            # hash the file without a full parse so that
+            # cache hits do not pay the source parse cost
+            cache_outputs = get_cache_outputs(
+                job, cache, hash_file(job.fontpath), read_sfnt_version(job.fontpath)
+            )
+        else:
+            cache_outputs = get_cache_outputs(
+                job, cache, session.source_hash, session.ttfont.sfntVersion
+            )
+        if all(cache.fetch(key, outpath) for key, outpath in cache_outputs):
+            timings["cache"] = time.perf_counter() - start
+            outpaths = [outpath for _, outpath in cache_outputs]
+            progress.finish()
+            return SliceResult(
+                job.outpath,
+                timings,
+                outpaths,
+                cached=True,
+                process_peak_rss=get_peak_rss(),
+            )
+        timings["cache"] = time.perf_counter() - start
+
+    progress.start_stage("parse", "reading the source font")
+    start = time.perf_counter()
+    if session is None:
+        session = FontSession(job.fontpath)
+    if not session.is_variable_font():
+        raise ValueError(f"{job.fontpath} is not a variable font (missing fvar table).")
+    validate_axis_data(job.axis_data, session.get_fvar_table())
+    name_instance_data = get_name_instance_data(session.get_name_table())
+    name_instance_data.update(job.name_data)
+    ttfont = session.new_ttfont()
+    timings["parse"] = time.perf_counter() - start
+
+    progress.start_stage("instance", "instancing")
+    start = time.perf_counter()
+    ttfont = new_instance_ttfont(
+        session, job.axis_data, progress.update, ttfont, job.optimize, job.subset
+    )
+    timings["instance"] = time.perf_counter() - start
+
+    progress.start_stage("names", "editing name records")
+    start = time.perf_counter()
+    edit_name_table(ttfont, name_instance_data)
+    timings["names"] = time.perf_counter() - start
+
+    progress.start_stage("bits", "editing bit flags")
+    start = time.perf_counter()
+    edit_bit_flags(ttfont, job.get_bit_model())
+    timings["bits"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if job.shards:
+        progress.start_stage("save", "compiling")
+        outpaths = save_font_shards(ttfont, job, progress.update)
+    elif job.flavors:
+        progress.start_stage("save", "compiling")
+        outpaths = save_font_flavors(
+            ttfont,
+            job.get_outputs(ttfont.sfntVersion),
+            job.compression,
+            progress.update,
+        )
+    else:
+        progress.start_stage("save", get_save_message(ttfont.flavor))
+        save_font(ttfont, job.outpath, job.compression)
+        outpaths = [job.outpath]
+    timings["save"] = time.perf_counter() - start
+
+    if cache is not None:
+        progress.start_stage("cache", "storing the instance in the cache")
+        start = time.perf_counter()
+        for key, outpath in cache_outputs:
+            cache.store(key, outpath)
+        timings["cache"] += time.perf_counter() - start
+
+    progress.finish()
+    return SliceResult(job.outpath, timings, outpaths, process_peak_rss=get_peak_rss())
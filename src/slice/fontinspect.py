@@ -0,0 +1,227 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Font inspection without a full font parse.  The sfnt, WOFF or WOFF2
+# table directory is read on open and table data is read and decompressed
+# on request.  Glyph data is never decompiled or reconstructed.  This
+# module must not import PyQt5.
+
+import zlib
+
+from fontTools.misc import sstruct
+from fontTools.ttLib import TTFont, TTLibError, newTable
+from fontTools.ttLib.sfnt import (
+    SFNTDirectoryEntry,
+    WOFFDirectoryEntry,
+    sfntDirectoryEntrySize,
+    sfntDirectoryFormat,
+    sfntDirectorySize,
+    woffDirectoryEntrySize,
+    woffDirectoryFormat,
+    woffDirectorySize,
+)
+from fontTools.ttLib.woff2 import (
+    WOFF2DirectoryEntry,
+    woff2DirectoryFormat,
+    woff2DirectorySize,
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# tables that are retained when a WOFF2 stream is decompressed to read
+# an inspection table so that later inspection reads do not restart
+# the stream decompression
+WOFF2_RETAINED_TABLES = {"OS/2", "STAT", "avar", "fvar", "head", "name"}
+
+# WOFF2 compressed stream read size in bytes
+WOFF2_STREAM_CHUNK_SIZE = 64 * 1024
+
+# largest WOFF2 table directory entry in bytes: flags, an arbitrary tag and
+# the UIntBase128 origLength and transformLength values (5 bytes each)
+WOFF2_DIRECTORY_ENTRY_MAX_SIZE = 1 + 4 + 5 + 5
+
+
+def _to_tag(value):
+    # sstruct unpacks 4 byte tags as bytes
+    return value.decode("latin-1") if isinstance(value, bytes) else value
+
+
+class InspectionReader(object):
+    """Reads a font file table directory and the data of individual tables
+    on request.  Table data is accessed by tag like a fontTools SFNTReader."""
+
+    def __init__(self, fontpath):
+        self.fontpath = fontpath
+        self.flavor = None
+        self.flavorData = None
+        # tag : directory entry
+        self.tables = {}
+        # tag : table data read from the file
+        self._data = {}
+        with open(fontpath, "rb") as f:
+            signature = f.read(4)
+            f.seek(0)
+            if signature == b"wOFF":
+                self._read_woff_directory(f)
+            elif signature == b"wOF2":
+                self._read_woff2_directory(f)
+            elif signature == b"ttcf":
+                raise TTLibError("Font collections are not supported")
+            else:
+                self._read_sfnt_directory(f)
+
+    def _read_header(self, f, header_format, header_size):
+        header = f.read(header_size)
+        if len(header) != header_size:
+            raise TTLibError("Not a supported font file (not enough data)")
+        sstruct.unpack(header_format, header, self)
+        self.sfntVersion = _to_tag(self.sfntVersion)
+        if self.sfntVersion not in ("\000\001\000\000", "OTTO", "true"):
+            raise TTLibError("Not a TrueType or OpenType font (bad sfntVersion)")
+
+    def _read_sfnt_directory(self, f):
+        self._read_header(f, sfntDirectoryFormat, sfntDirectorySize)
+        self._read_directory_entries(f, SFNTDirectoryEntry, sfntDirectoryEntrySize)
+
+    def _read_woff_directory(self, f):
+        self.flavor = "woff"
+        self._read_header(f, woffDirectoryFormat, woffDirectorySize)
+        self._read_directory_entries(f, WOFFDirectoryEntry, woffDirectoryEntrySize)
+
+    def _read_directory_entries(self, f, entry_class, entry_size):
+        for _ in range(self.numTables):
+            entry = entry_class()
+            entry.fromString(f.read(entry_size))
+            self.tables[_to_tag(entry.tag)] = entry
+
+    def _read_woff2_directory(self, f):
+        if brotli is None:
+            raise ImportError("The brotli package is required for WOFF2 fonts")
+        self.flavor = "woff2"
+        self._read_header(f, woff2DirectoryFormat, woff2DirectorySize)
+        # the directory entries are variable length, only the bytes of the
+        # largest possible directory are read, not the compressed data
+        data = f.read(self.numTables * WOFF2_DIRECTORY_ENTRY_MAX_SIZE)
+        remaining = data
+        stream_offset = 0
+        for _ in range(self.numTables):
+            entry = WOFF2DirectoryEntry()
+            remaining = entry.fromString(remaining)
+            # offset of the table data in the decompressed stream
+            entry.offset = stream_offset
+            stream_offset += entry.length
+            self.tables[_to_tag(entry.tag)] = entry
+        self._woff2_stream_start = woff2DirectorySize + len(data) - len(remaining)
+
+    def _read_woff2_tables(self, tag):
+        # streams the brotli compressed data up to the end of the requested
+        # table and keeps the data of the retained inspection tables
+        entry = self.tables[tag]
+        if entry.transformed:
+            raise TTLibError(
+                f"The '{tag}' table is transformed in WOFF2 fonts and is not "
+                f"available for inspection"
+            )
+        end = entry.offset + entry.length
+        buffers = {
+            t: bytearray()
+            for t in WOFF2_RETAINED_TABLES | {tag}
+            if t in self.tables and t not in self._data
+        }
+        decompressor = brotli.Decompressor()
+        position = 0
+        with open(self.fontpath, "rb") as f:
+            f.seek(self._woff2_stream_start)
+            remaining = self.totalCompressedSize
+            while position < end and remaining > 0:
+                chunk = f.read(min(WOFF2_STREAM_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                output = decompressor.process(chunk)
+                for t, buf in buffers.items():
+                    t_entry = self.tables[t]
+                    start = max(t_entry.offset - position, 0)
+                    stop = min(t_entry.offset + t_entry.length - position, len(output))
+                    if start < stop:
+                        buf += output[start:stop]
+                position += len(output)
+
+        for t, buf in buffers.items():
+            if len(buf) == self.tables[t].length:
+                self._data[t] = bytes(buf)
+        if tag not in self._data:
+            raise TTLibError(f"Unable to read the '{tag}' table (not enough data)")
+
+    def keys(self):
+        return list(self.tables.keys())
+
+    def __contains__(self, tag):
+        return tag in self.tables
+
+    def __getitem__(self, tag):
+        if tag not in self._data:
+            entry = self.tables[tag]
+            if self.flavor == "woff2":
+                self._read_woff2_tables(tag)
+            else:
+                with open(self.fontpath, "rb") as f:
+                    f.seek(entry.offset)
+                    data = f.read(entry.length)
+                if self.flavor == "woff" and entry.length < entry.origLength:
+                    data = zlib.decompress(data)
+                self._data[tag] = data
+        return self._data[tag]
+
+
+class FontInspector(object):
+    """Read-only access to the font tables that the UI displays.  Only the
+    table directory is read on instantiation and tables are read, decompressed
+    and decompiled on first access."""
+
+    def __init__(self, fontpath):
+        self.fontpath = fontpath
+        self.reader = InspectionReader(fontpath)
+        self.flavor = self.reader.flavor
+        self.sfntVersion = self.reader.sfntVersion
+        # holds the decompiled tables, tables that reference
+        # other tables during decompilation find them here
+        self.ttfont = TTFont(sfntVersion=self.sfntVersion, flavor=self.flavor)
+
+    def get_table(self, tag):
+        if tag not in self.ttfont.tables:
+            table = newTable(tag)
+            table.decompile(self.reader[tag], self.ttfont)
+            self.ttfont[tag] = table
+        return self.ttfont[tag]
+
+    def is_variable_font(self):
+        """Check for fvar table to validate that a font is a variable font"""
+        return "fvar" in self.reader
+
+    def get_fvar_table(self):
+        return self.get_table("fvar")
+
+    def get_name_table(self):
+        return self.get_table("name")
+
+    def get_os2_table(self):
+        return self.get_table("OS/2")
+
+    def get_head_table(self):
+        return self.get_table("head")
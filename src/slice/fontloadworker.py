@@ -0,0 +1,96 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+import sys
+import threading
+import traceback
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+
+from .models import FontModel
+
+
+class FontLoadWorkerSignals(QObject):
+    finished = pyqtSignal()  # no return type, only signal that complete
+    error = pyqtSignal(str, str)  # returns the error message and details
+    result = pyqtSignal(object)  # returns the loaded FontModel
+    progress = pyqtSignal(int, str)  # returns percent complete and a message
+
+
+class FontLoadCanceled(Exception):
+    pass
+
+
+class FontLoadWorker(QRunnable):
+    """Reads the font data that the main window models display off of
+    the GUI thread.  The FontModel that is emitted with the result signal
+    holds decompiled name and fvar tables so that the models load without
+    file reads on the GUI thread."""
+
+    def __init__(self, fontpath):
+        super().__init__()
+        self.signals = FontLoadWorkerSignals()
+        self.fontpath = fontpath
+        self.font_model = FontModel(fontpath)
+        self._canceled = threading.Event()
+
+    def cancel(self):
+        """Requests cancellation.  A table read that is in progress
+        completes and the result of a canceled load is not emitted."""
+        self._canceled.set()
+
+    def is_canceled(self):
+        return self._canceled.is_set()
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            self.step(10, "Reading the font table directory")
+            inspector = self.font_model.get_inspector()
+            self.step(40, "Reading the fvar table")
+            if not inspector.is_variable_font():
+                self.signals.error.emit(
+                    "The file does not appear to be a variable font. "
+                    "See details below.",
+                    "The font is missing the OpenType fvar table and is not "
+                    "recognized as a variable font. Please try again with a font "
+                    "that includes the fvar table.",
+                )
+            else:
+                inspector.get_fvar_table()
+                self.step(70, "Reading the name table")
+                inspector.get_name_table()
+                # the preview font is built by a PreviewFontWorker after
+                # the result so that the tables display without a full parse
+                self.step(100, "Loaded")
+                self.signals.result.emit(self.font_model)
+        except FontLoadCanceled:
+            pass
+        except Exception as e:
+            if not self.is_canceled():
+                self.signals.error.emit(
+                    "An error was encountered during the attempt to load your "
+                    "font. See details below.",
+                    f"{e}",
+                )
+                sys.stderr.write(f"{traceback.format_exc()}\n")
+
+        self.signals.finished.emit()
+
+    def step(self, percent, message):
+        # cancellation is checked between the file reads
+        if self.is_canceled():
+            raise FontLoadCanceled()
+        self.signals.progress.emit(percent, message)
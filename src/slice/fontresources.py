@@ -1,7252 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x0a\xf4\
-\x00\
-\x01\x00\x00\x00\x0f\x00\x80\x00\x03\x00\x70\x47\x44\x45\x46\x00\
-\x26\x00\x1c\x00\x00\x09\x8c\x00\x00\x00\x22\x47\x50\x4f\x53\x2c\
-\xa4\x24\xdc\x00\x00\x09\xb0\x00\x00\x00\xe0\x47\x53\x55\x42\x2b\
-\xb2\x2b\x90\x00\x00\x0a\x90\x00\x00\x00\x64\x4f\x53\x2f\x32\x66\
-\x9f\xb0\x1e\x00\x00\x07\x20\x00\x00\x00\x60\x63\x6d\x61\x70\x00\
-\xea\x01\xa6\x00\x00\x07\x80\x00\x00\x00\x54\x67\x61\x73\x70\x00\
-\x00\x00\x10\x00\x00\x09\x84\x00\x00\x00\x08\x67\x6c\x79\x66\x4d\
-\x1c\x69\x01\x00\x00\x00\xfc\x00\x00\x05\x5e\x68\x65\x61\x64\x20\
-\x2a\x68\x5c\x00\x00\x06\x98\x00\x00\x00\x36\x68\x68\x65\x61\x0b\
-\xc5\x06\xed\x00\x00\x06\xfc\x00\x00\x00\x24\x68\x6d\x74\x78\x10\
-\xe7\x01\x27\x00\x00\x06\xd0\x00\x00\x00\x2c\x6c\x6f\x63\x61\x09\
-\x70\x07\xf2\x00\x00\x06\x7c\x00\x00\x00\x1a\x6d\x61\x78\x70\x00\
-\x2d\x02\xad\x00\x00\x06\x5c\x00\x00\x00\x20\x6e\x61\x6d\x65\x20\
-\xf8\x37\xf9\x00\x00\x07\xdc\x00\x00\x01\x86\x70\x6f\x73\x74\xff\
-\x54\x00\x6e\x00\x00\x09\x64\x00\x00\x00\x20\x70\x72\x65\x70\x68\
-\x06\x8c\x85\x00\x00\x07\xd4\x00\x00\x00\x07\x00\x01\x00\x3a\xff\
-\xec\x02\x27\x02\xd0\x00\x50\x00\x00\x41\x32\x16\x17\x16\x16\x15\
-\x1c\x02\x15\x06\x06\x23\x22\x26\x35\x34\x3e\x02\x37\x17\x26\x26\
-\x23\x22\x0e\x02\x15\x15\x14\x16\x16\x17\x17\x1e\x03\x15\x15\x14\
-\x06\x06\x23\x22\x26\x26\x27\x26\x26\x35\x34\x36\x36\x37\x33\x16\
-\x16\x33\x32\x36\x37\x35\x34\x26\x26\x27\x27\x2e\x03\x35\x35\x34\
-\x3e\x02\x01\x59\x37\x4e\x18\x0f\x09\x15\x2f\x19\x19\x1c\x01\x03\
-\x04\x02\x18\x12\x1c\x13\x1a\x2e\x24\x15\x0d\x22\x1f\x5e\x30\x3e\
-\x23\x0e\x3b\x72\x56\x2f\x56\x3f\x11\x09\x0c\x01\x01\x01\x0d\x2c\
-\x6b\x49\x2e\x37\x0b\x0e\x1f\x1c\x5d\x36\x44\x25\x0e\x2a\x4a\x64\
-\x02\xd0\x1f\x19\x0e\x23\x16\x12\x2a\x29\x14\x02\x03\x13\x17\x08\
-\x14\x17\x1d\x12\x2b\x08\x06\x0f\x1a\x22\x15\x0c\x11\x17\x12\x0b\
-\x1f\x10\x26\x2b\x30\x1b\x20\x39\x54\x2d\x0e\x18\x10\x0a\x22\x1a\
-\x10\x1f\x1e\x0f\x24\x25\x18\x10\x15\x0f\x18\x15\x09\x1f\x12\x29\
-\x2b\x2e\x19\x20\x2d\x53\x42\x25\x00\x00\x01\x00\x35\xff\xf4\x01\
-\xca\x02\x28\x00\x31\x00\x00\x41\x32\x16\x16\x17\x16\x16\x15\x14\
-\x06\x07\x23\x26\x26\x23\x22\x06\x06\x15\x15\x14\x16\x17\x16\x16\
-\x33\x32\x36\x36\x37\x33\x16\x16\x15\x14\x06\x07\x0e\x02\x23\x22\
-\x2e\x02\x35\x35\x34\x36\x36\x01\x43\x1f\x30\x21\x06\x07\x07\x04\
-\x05\x0d\x1c\x35\x23\x22\x32\x1c\x0b\x0b\x11\x2b\x19\x19\x2c\x29\
-\x15\x0d\x01\x01\x08\x09\x08\x24\x36\x23\x38\x5d\x45\x25\x44\x79\
-\x02\x28\x07\x0b\x08\x06\x13\x10\x1d\x35\x1a\x0f\x0c\x1f\x3b\x2b\
-\x21\x1a\x29\x10\x0c\x0b\x06\x0f\x0c\x15\x2c\x18\x14\x1e\x0a\x07\
-\x0d\x08\x1f\x3f\x5f\x3f\x28\x50\x7b\x45\x00\x00\x01\x00\x3a\xff\
-\xf2\x02\x1d\x02\x2a\x00\x3c\x00\x00\x41\x32\x16\x16\x15\x15\x14\
-\x06\x06\x23\x23\x22\x26\x27\x07\x37\x33\x36\x36\x35\x34\x26\x27\
-\x26\x26\x23\x22\x06\x15\x15\x14\x16\x17\x16\x16\x33\x32\x36\x36\
-\x37\x33\x16\x16\x15\x14\x06\x07\x0e\x02\x23\x22\x2e\x02\x35\x35\
-\x34\x3e\x02\x01\x39\x47\x66\x37\x06\x0b\x06\xd6\x19\x2c\x11\x21\
-\x03\xcd\x01\x01\x09\x0b\x0b\x18\x15\x35\x3a\x09\x08\x13\x36\x26\
-\x22\x3b\x36\x19\x0d\x01\x01\x0a\x0a\x0b\x35\x45\x23\x42\x67\x47\
-\x25\x24\x43\x5f\x02\x2a\x3a\x66\x42\x2e\x16\x15\x06\x09\x07\x05\
-\x4d\x05\x0a\x05\x16\x26\x0e\x07\x06\x45\x49\x41\x19\x27\x0e\x0d\
-\x0a\x07\x0f\x0a\x13\x26\x13\x12\x18\x0a\x0b\x11\x0a\x24\x42\x5d\
-\x39\x3c\x37\x5d\x46\x26\x00\xff\xff\x00\x24\xff\xfd\x01\x21\x03\
-\x11\x06\x26\x00\x06\x00\x00\x00\x07\x00\x07\x00\xbe\x00\x00\x00\
-\x01\x00\x08\xff\xfb\x01\x40\x02\xf3\x00\x3a\x00\x00\x53\x3e\x03\
-\x32\x33\x32\x16\x16\x15\x1c\x04\x15\x14\x16\x17\x16\x16\x33\x32\
-\x36\x37\x33\x16\x16\x15\x14\x06\x06\x07\x0e\x02\x23\x22\x2e\x02\
-\x35\x3c\x04\x35\x27\x0e\x02\x23\x22\x26\x35\x34\x36\x0c\x0a\x22\
-\x28\x28\x20\x0a\x13\x19\x0d\x02\x04\x05\x0c\x0a\x0b\x17\x08\x08\
-\x01\x01\x05\x08\x06\x07\x1b\x1e\x0d\x25\x34\x22\x10\x05\x04\x12\
-\x14\x06\x0a\x0e\x03\x02\xee\x01\x02\x01\x01\x0d\x18\x12\x33\x65\
-\x64\x65\x65\x33\x0f\x16\x09\x04\x04\x05\x05\x14\x2e\x17\x0e\x16\
-\x10\x04\x04\x05\x02\x19\x2b\x3a\x22\x2d\x5a\x5c\x5b\x5b\x2d\x01\
-\x02\x03\x01\x19\x1e\x17\x2f\x00\x01\x00\x24\xff\xfd\x01\x18\x02\
-\x21\x00\x2a\x00\x00\x77\x3c\x04\x35\x23\x0e\x03\x23\x22\x26\x35\
-\x34\x36\x37\x3e\x03\x32\x33\x32\x16\x16\x15\x1c\x03\x15\x14\x16\
-\x16\x17\x06\x06\x23\x22\x26\x78\x05\x04\x0b\x0c\x0e\x07\x0e\x11\
-\x03\x02\x0d\x20\x23\x22\x1e\x0c\x15\x21\x13\x02\x04\x04\x1a\x2d\
-\x1b\x23\x1b\x40\x17\x42\x4a\x4c\x44\x19\x01\x03\x02\x01\x1a\x1a\
-\x19\x33\x17\x01\x02\x01\x01\x0c\x18\x13\x2a\x5f\x63\x5e\x29\x15\
-\x25\x26\x17\x01\x02\x1d\x00\x00\x01\xff\x9d\x02\x76\x00\x64\x03\
-\x11\x00\x11\x00\x00\x43\x3e\x03\x33\x32\x16\x15\x15\x0e\x03\x23\
-\x22\x26\x35\x63\x0f\x22\x25\x24\x11\x1a\x22\x0f\x21\x23\x22\x11\
-\x1c\x25\x03\x09\x02\x03\x02\x01\x12\x17\x6a\x02\x03\x02\x01\x1b\
-\x16\x00\x01\x00\x3a\xff\xf2\x02\x22\x02\x2a\x00\x41\x00\x00\x41\
-\x32\x1e\x02\x15\x15\x14\x06\x06\x23\x22\x26\x26\x27\x07\x35\x1e\
-\x02\x33\x32\x36\x35\x34\x26\x27\x26\x26\x23\x22\x06\x06\x15\x15\
-\x14\x16\x17\x16\x16\x33\x32\x36\x36\x37\x33\x16\x16\x15\x14\x06\
-\x07\x0e\x02\x23\x22\x2e\x02\x35\x35\x34\x3e\x02\x01\x46\x33\x51\
-\x3a\x1e\x28\x51\x3f\x23\x3c\x32\x14\x2e\x1b\x32\x38\x22\x26\x2a\
-\x04\x06\x0b\x1d\x13\x26\x37\x1c\x07\x08\x14\x38\x29\x20\x3b\x36\
-\x19\x0d\x01\x01\x09\x09\x09\x33\x46\x29\x42\x68\x47\x25\x25\x45\
-\x64\x02\x2a\x1c\x32\x42\x27\x05\x31\x3f\x1e\x03\x05\x03\x0e\x61\
-\x02\x03\x02\x1b\x1a\x0f\x17\x09\x06\x06\x1d\x3d\x2f\x41\x19\x26\
-\x0e\x0c\x0b\x09\x11\x0c\x13\x27\x13\x13\x1f\x09\x09\x11\x0b\x24\
-\x42\x5d\x39\x3c\x37\x5d\x46\x26\x00\xff\xff\x00\x1a\xff\xfb\x01\
-\x4d\x03\x11\x06\x26\x00\x0a\x00\x00\x00\x07\x00\x07\x00\xb0\x00\
-\x00\x00\x01\x00\x1a\xff\xfb\x01\x4d\x02\x21\x00\x35\x00\x00\x53\
-\x3e\x02\x33\x32\x16\x16\x15\x1c\x03\x15\x14\x16\x17\x16\x16\x33\
-\x32\x36\x37\x33\x16\x16\x15\x14\x06\x07\x0e\x02\x23\x22\x2e\x02\
-\x35\x3c\x03\x35\x27\x0e\x02\x23\x22\x26\x35\x34\x36\x1d\x12\x27\
-\x35\x24\x1c\x22\x0f\x01\x02\x04\x0d\x08\x0b\x0e\x0d\x0d\x01\x01\
-\x0b\x08\x09\x11\x13\x10\x24\x39\x26\x14\x06\x03\x10\x13\x0a\x0a\
-\x0c\x01\x02\x1c\x02\x02\x01\x0b\x10\x0b\x2c\x51\x4d\x4a\x27\x0e\
-\x18\x09\x03\x03\x04\x05\x14\x2d\x13\x16\x1d\x06\x04\x06\x02\x17\
-\x26\x34\x1c\x29\x46\x3f\x3d\x1f\x01\x02\x04\x03\x1c\x17\x17\x30\
-\x00\x00\x01\x00\x3d\xff\xfb\x01\x39\x02\xf1\x00\x33\x00\x00\x53\
-\x34\x26\x27\x3e\x02\x32\x32\x33\x32\x16\x16\x15\x1c\x04\x15\x14\
-\x16\x17\x16\x16\x33\x32\x3e\x02\x37\x33\x16\x16\x15\x14\x06\x07\
-\x0e\x03\x23\x22\x2e\x02\x35\x3c\x03\x45\x04\x04\x13\x13\x0b\x0b\
-\x14\x14\x10\x19\x11\x02\x04\x04\x0d\x0a\x06\x0f\x0e\x0d\x04\x07\
-\x01\x01\x0a\x0a\x05\x0b\x11\x1a\x14\x26\x36\x24\x11\x02\x7b\x20\
-\x3b\x18\x01\x01\x01\x0d\x1d\x1b\x31\x63\x62\x62\x62\x32\x0e\x16\
-\x09\x04\x04\x01\x03\x03\x03\x14\x2e\x18\x14\x1b\x07\x03\x04\x02\
-\x01\x19\x2b\x3a\x22\x3d\x7a\x79\x76\x00\x00\x00\x01\x00\x00\x00\
-\x0c\x01\x88\x00\x16\x01\x23\x00\x06\x00\x01\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x04\x00\x01\x00\x00\x00\x00\x00\
-\x6f\x00\xb8\x01\x0e\x01\x1a\x01\x66\x01\x9e\x01\xbb\x02\x17\x02\
-\x23\x02\x6b\x02\xaf\x00\x00\x00\x01\x00\x00\x00\x01\x13\xb6\x40\
-\x06\x18\x47\x5f\x0f\x3c\xf5\x00\x03\x03\xe8\x00\x00\x00\x00\xdc\
-\x73\x36\xbf\x00\x00\x00\x00\xdc\x93\xda\x1a\xfe\xd7\xfe\x6a\x09\
-\x35\x04\x80\x00\x00\x00\x06\x00\x02\x00\x00\x00\x00\x00\x00\x02\
-\x58\x00\x00\x02\x58\x00\x3a\x01\xf4\x00\x35\x02\x58\x00\x3a\x01\
-\x5e\x00\x24\x01\x5e\x00\x08\x01\x5e\x00\x24\x00\x00\xff\x9d\x02\
-\x58\x00\x3a\x01\x5e\x00\x1a\x00\x1a\x00\x3d\x00\x01\x00\x00\x03\
-\xb6\xff\x06\x00\x00\x09\x60\xfe\xd7\xfe\x7c\x09\x35\x00\x01\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0a\x00\
-\x04\x02\x74\x03\x20\x00\x05\x00\x00\x02\x8a\x02\x58\x00\x00\x00\
-\x4b\x02\x8a\x02\x58\x00\x00\x01\x5e\x00\x6e\x01\x42\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x41\x52\x52\x57\x00\x80\x00\
-\x53\x00\x6c\x03\xb6\xff\x06\x00\x00\x04\xb7\x01\x0f\x60\x00\x01\
-\x93\x00\x00\x00\x00\x02\x1c\x02\xbc\x00\x00\x00\x20\x00\x0c\x00\
-\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x14\x00\x03\x00\x01\x00\
-\x00\x00\x14\x00\x04\x00\x40\x00\x00\x00\x0c\x00\x08\x00\x02\x00\
-\x04\x00\x53\x00\x63\x00\x65\x00\x69\x00\x6c\xff\xff\x00\x00\x00\
-\x53\x00\x63\x00\x65\x00\x69\x00\x6c\xff\xff\xff\xae\xff\x9f\xff\
-\x9e\xff\x9b\xff\x99\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xb8\x01\xff\x85\xb0\x04\x8d\x00\x00\x00\x00\x07\x00\
-\x5a\x00\x03\x00\x01\x04\x09\x00\x00\x00\x9a\x00\x00\x00\x03\x00\
-\x01\x04\x09\x00\x01\x00\x1c\x00\x9a\x00\x03\x00\x01\x04\x09\x00\
-\x02\x00\x0e\x00\xb6\x00\x03\x00\x01\x04\x09\x00\x03\x00\x32\x00\
-\xc4\x00\x03\x00\x01\x04\x09\x00\x04\x00\x1c\x00\x9a\x00\x03\x00\
-\x01\x04\x09\x00\x05\x00\x1a\x00\xf6\x00\x03\x00\x01\x04\x09\x00\
-\x06\x00\x1c\x01\x10\x00\x43\x00\x6f\x00\x70\x00\x79\x00\x72\x00\
-\x69\x00\x67\x00\x68\x00\x74\x00\x20\x00\x32\x00\x30\x00\x31\x00\
-\x39\x00\x20\x00\x54\x00\x68\x00\x65\x00\x20\x00\x52\x00\x65\x00\
-\x63\x00\x75\x00\x72\x00\x73\x00\x69\x00\x76\x00\x65\x00\x20\x00\
-\x50\x00\x72\x00\x6f\x00\x6a\x00\x65\x00\x63\x00\x74\x00\x20\x00\
-\x41\x00\x75\x00\x74\x00\x68\x00\x6f\x00\x72\x00\x73\x00\x20\x00\
-\x28\x00\x67\x00\x69\x00\x74\x00\x68\x00\x75\x00\x62\x00\x2e\x00\
-\x63\x00\x6f\x00\x6d\x00\x2f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\
-\x77\x00\x74\x00\x79\x00\x70\x00\x65\x00\x2f\x00\x72\x00\x65\x00\
-\x63\x00\x75\x00\x72\x00\x73\x00\x69\x00\x76\x00\x65\x00\x29\x00\
-\x52\x00\x65\x00\x63\x00\x75\x00\x72\x00\x73\x00\x69\x00\x76\x00\
-\x65\x00\x20\x00\x53\x00\x61\x00\x6e\x00\x73\x00\x52\x00\x65\x00\
-\x67\x00\x75\x00\x6c\x00\x61\x00\x72\x00\x31\x00\x2e\x00\x30\x00\
-\x37\x00\x37\x00\x3b\x00\x41\x00\x52\x00\x52\x00\x57\x00\x3b\x00\
-\x52\x00\x65\x00\x63\x00\x75\x00\x72\x00\x73\x00\x69\x00\x76\x00\
-\x65\x00\x2d\x00\x53\x00\x61\x00\x6e\x00\x73\x00\x56\x00\x65\x00\
-\x72\x00\x73\x00\x69\x00\x6f\x00\x6e\x00\x20\x00\x31\x00\x2e\x00\
-\x30\x00\x37\x00\x37\x00\x52\x00\x65\x00\x63\x00\x75\x00\x72\x00\
-\x73\x00\x69\x00\x76\x00\x65\x00\x2d\x00\x53\x00\x61\x00\x6e\x00\
-\x73\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\xff\x51\x00\x6e\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x01\x00\x01\xff\xff\x00\x0f\x00\x01\x00\x00\x00\
-\x0c\x00\x00\x00\x00\x00\x00\x00\x02\x00\x03\x00\x01\x00\x05\x00\
-\x01\x00\x08\x00\x09\x00\x01\x00\x0b\x00\x0b\x00\x01\x00\x00\x00\
-\x01\x00\x00\x00\x0a\x00\x24\x00\x32\x00\x02\x44\x46\x4c\x54\x00\
-\x0e\x6c\x61\x74\x6e\x00\x0e\x00\x04\x00\x00\x00\x00\xff\xff\x00\
-\x01\x00\x00\x00\x01\x6b\x65\x72\x6e\x00\x08\x00\x00\x00\x01\x00\
-\x00\x00\x01\x00\x04\x00\x02\x00\x08\x00\x01\x00\x08\x00\x02\x00\
-\x56\x00\x04\x00\x00\x00\x6a\x00\x86\x00\x05\x00\x07\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xe2\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x0a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xf6\x00\x00\x00\
-\x00\xff\xec\x00\x01\x00\x08\x00\x01\x00\x02\x00\x03\x00\x04\x00\
-\x05\x00\x08\x00\x09\x00\x0b\x00\x01\x00\x01\x00\x0b\x00\x04\x00\
-\x03\x00\x02\x00\x00\x00\x01\x00\x00\x00\x00\x00\x02\x00\x01\x00\
-\x00\x00\x01\x00\x01\x00\x01\x00\x0b\x00\x06\x00\x02\x00\x03\x00\
-\x01\x00\x04\x00\x00\x00\x00\x00\x03\x00\x01\x00\x00\x00\x05\x00\
-\x01\x00\x00\x00\x0a\x00\x24\x00\x34\x00\x02\x44\x46\x4c\x54\x00\
-\x0e\x6c\x61\x74\x6e\x00\x0e\x00\x04\x00\x00\x00\x00\xff\xff\x00\
-\x01\x00\x00\x00\x01\x72\x76\x72\x6e\x00\x08\x00\x00\x00\x02\x00\
-\x01\x00\x00\x00\x02\x00\x06\x00\x1c\x00\x01\x00\x00\x00\x01\x00\
-\x08\x00\x01\x00\x06\x00\x05\x00\x01\x00\x02\x00\x03\x00\x04\x00\
-\x01\x00\x00\x00\x01\x00\x08\x00\x01\x00\x06\x00\x06\x00\x01\x00\
-\x01\x00\x05\
-\x00\x01\xb6\x0c\
-\x00\
-\x01\x00\x00\x00\x13\x01\x00\x00\x04\x00\x30\x44\x53\x49\x47\x00\
-\x00\x00\x01\x00\x01\xb6\x04\x00\x00\x00\x08\x47\x44\x45\x46\x2f\
-\xb0\x2f\xa5\x00\x01\xa6\x4c\x00\x00\x00\xb2\x47\x50\x4f\x53\x18\
-\x9a\x5a\x9f\x00\x01\xa7\x00\x00\x00\x05\x0c\x47\x53\x55\x42\x31\
-\x6e\x81\x6a\x00\x01\xac\x0c\x00\x00\x09\xba\x4f\x53\x2f\x32\x8b\
-\xfb\x6a\x66\x00\x00\x01\xb8\x00\x00\x00\x60\x63\x6d\x61\x70\x98\
-\x4e\x99\xa9\x00\x00\x0f\x64\x00\x00\x09\xa0\x63\x76\x74\x20\x0e\
-\x36\x02\xa2\x00\x00\x1c\x2c\x00\x00\x00\x40\x66\x70\x67\x6d\x06\
-\x59\x9c\x37\x00\x00\x19\x04\x00\x00\x01\x73\x67\x61\x73\x70\x00\
-\x18\x00\x21\x00\x01\xa6\x3c\x00\x00\x00\x10\x67\x6c\x79\x66\x47\
-\x9d\xcb\x9a\x00\x00\x23\x14\x00\x01\x5e\x48\x68\x65\x61\x64\x15\
-\xd7\x42\xaa\x00\x00\x01\x3c\x00\x00\x00\x36\x68\x68\x65\x61\x05\
-\x88\x03\x95\x00\x00\x01\x74\x00\x00\x00\x24\x68\x6d\x74\x78\x5c\
-\x91\xd1\xd8\x00\x00\x02\x18\x00\x00\x0d\x4c\x6c\x6f\x63\x61\x98\
-\xab\xee\x9e\x00\x00\x1c\x6c\x00\x00\x06\xa8\x6d\x61\x78\x70\x05\
-\x6d\x02\x74\x00\x00\x01\x98\x00\x00\x00\x20\x6d\x65\x74\x61\x96\
-\x7c\x77\x17\x00\x01\xb5\xc8\x00\x00\x00\x3a\x6e\x61\x6d\x65\x60\
-\x4e\x0e\x6b\x00\x01\x81\x5c\x00\x00\x08\xe1\x70\x6f\x73\x74\x85\
-\xfe\x39\x79\x00\x01\x8a\x40\x00\x00\x1b\xfb\x70\x72\x65\x70\xec\
-\x27\x46\xc7\x00\x00\x1a\x78\x00\x00\x01\xb4\x00\x01\x00\x00\x00\
-\x02\x00\x41\x89\x9e\xcb\xce\x5f\x0f\x3c\xf5\x00\x09\x03\xe8\x00\
-\x00\x00\x00\xda\x9a\x86\x15\x00\x00\x00\x00\xda\x9a\x78\x0a\xfe\
-\xfc\xff\x05\x02\x88\x04\x5f\x00\x00\x00\x09\x00\x02\x00\x00\x00\
-\x00\x00\x00\x00\x01\x00\x00\x04\x01\xfe\xed\x00\x00\x02\x58\xfe\
-\xfc\xfe\xfc\x02\x88\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x03\x53\x00\x01\x00\x00\x03\x53\x00\x55\x00\
-\x06\x00\x69\x00\x06\x00\x01\x00\x00\x00\x00\x00\x0a\x00\x00\x02\
-\x00\x01\xb4\x00\x03\x00\x01\x00\x04\x02\x58\x01\x90\x00\x05\x00\
-\x00\x02\x8a\x02\x58\x00\x00\x00\x4b\x02\x8a\x02\x58\x00\x00\x01\
-\x5e\x00\x3c\x01\x35\x00\x00\x02\x0b\x05\x09\x05\x02\x03\x00\x02\
-\x03\xa0\x00\x02\x6f\x50\x00\x20\x7b\x00\x00\x00\x00\x00\x00\x00\
-\x00\x49\x42\x4d\x20\x01\x40\x00\x00\xfb\x02\x03\x0c\xff\x24\x01\
-\x2c\x04\x01\x01\x13\x20\x00\x01\x97\x00\x00\x00\x00\x02\x04\x02\
-\xba\x00\x00\x00\x20\x00\x03\x02\x58\x00\x20\x00\x00\x00\x00\x02\
-\x58\x00\x00\x02\x58\x00\x00\x02\x58\x00\x42\x02\x58\x00\x3c\x02\
-\x58\x00\x5f\x02\x58\x00\x54\x02\x58\x00\x3c\x02\x58\x00\x43\x02\
-\x58\x00\x49\x02\x58\x00\x43\x02\x58\x00\x3c\x02\x58\x00\x43\x02\
-\x58\x00\x62\x02\x58\x00\x6a\x02\x58\x00\x5d\x02\x58\x00\x69\x02\
-\x58\x00\x50\x02\x58\x00\x36\x02\x58\x00\x62\x02\x58\x00\x42\x02\
-\x58\x00\x5f\x02\x58\x00\x3c\x02\x58\x00\x4d\x02\x58\x00\x43\x02\
-\x58\x00\x27\x02\x58\x00\x5c\x02\x58\x00\x40\x02\x58\x00\x1e\x02\
-\x58\x00\x3d\x02\x58\x00\x35\x02\x58\x00\x55\x02\x58\x00\x1f\x02\
-\x58\x00\x58\x02\x58\x00\x46\x02\x58\x00\x5f\x02\x58\x00\x5a\x02\
-\x58\x00\x5a\x02\x58\x00\x38\x02\x58\x00\x50\x02\x58\x00\x54\x02\
-\x58\x00\x4a\x02\x58\x00\x55\x02\x58\x00\x78\x02\x58\x00\x44\x02\
-\x58\x00\x50\x02\x58\x00\x38\x02\x58\x00\x5a\x02\x58\x00\x38\x02\
-\x58\x00\x5a\x02\x58\x00\x2d\x02\x58\x00\x19\x02\x58\x00\x50\x02\
-\x58\x00\x24\x02\x58\x00\x23\x02\x58\x00\x1a\x02\x58\x00\x11\x02\
-\x58\x00\x30\x02\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x38\x02\
-\x58\x00\x35\x02\x58\x00\x41\x02\x58\x00\x30\x02\x58\x00\x22\x02\
-\x58\x00\x49\x02\x58\x00\x40\x02\x58\x00\x41\x02\x58\x00\x37\x02\
-\x58\x00\x40\x02\x58\x00\x19\x02\x58\x00\x3e\x02\x58\x00\x9b\x02\
-\x58\x00\x9b\x02\x58\x00\x3c\x02\x58\x00\x00\x02\x58\x00\x3c\x02\
-\x58\x00\xe2\x02\x58\x00\x2c\x02\x58\x00\xe2\x02\x58\x00\xcc\x02\
-\x58\x00\xcc\x02\x58\x01\x06\x02\x58\x00\xae\x02\x58\x00\xc3\x02\
-\x58\x00\xdf\x02\x58\x00\x52\x02\x58\x00\x6e\x02\x58\x00\xcc\x02\
-\x58\x00\x6e\x02\x58\x00\xaa\x02\x58\x00\xc7\x02\x58\x00\x4a\x02\
-\x58\x00\x43\x02\x58\x00\xe2\x02\x58\x00\xe2\x02\x58\x00\x5a\x02\
-\x58\x00\x4d\x02\x58\x00\xcd\x02\x58\x00\x6a\x02\x58\x00\xe1\x02\
-\x58\x00\x5f\x02\x58\x00\x69\x02\x58\x00\x69\x02\x58\x00\x5a\x02\
-\x58\x00\x5a\x02\x58\x00\x12\x02\x58\x00\x12\x02\x58\x00\x00\x02\
-\x58\x01\x09\x02\x58\x01\x09\x02\x58\x00\x51\x02\x58\x00\x2d\x02\
-\x58\x00\x00\x02\x58\x00\x75\x02\x58\x00\x10\x02\x58\x00\x8a\x02\
-\x58\x00\x8c\x02\x58\x00\x81\x02\x58\x00\x2b\x02\x58\x00\x46\x02\
-\x58\x00\x46\x02\x58\x00\x10\x02\x58\x00\x2d\x02\x58\x00\x34\x02\
-\x58\x00\x3e\x02\x58\x00\x3e\x02\x58\x00\x3e\x02\x58\x00\x58\x02\
-\x58\x00\x3e\x02\x58\x00\x3e\x02\x58\x00\x34\x02\x58\x00\x3e\x02\
-\x58\x00\x55\x02\x58\x00\x55\x02\x58\x00\x55\x02\x58\x00\x55\x02\
-\x58\x00\xe2\x02\x58\x00\xb2\x02\x58\x00\x2a\x02\x58\x00\x3e\x02\
-\x58\x00\x18\x02\x58\x00\x23\x02\x58\x00\x0b\x02\x58\x00\x1a\x02\
-\x58\x00\x46\x02\x58\x00\x2b\x02\x58\x00\x42\x02\x58\x00\x54\x02\
-\x58\x00\x46\x02\x58\xff\xd5\x02\x58\x00\x34\x02\x58\x00\x32\x02\
-\x58\x00\x16\x02\x58\x00\x58\x02\x58\x00\x46\x02\x58\x00\x34\x02\
-\x58\x00\x1b\x02\x58\x00\x31\x02\x58\x00\x1a\x02\x58\x00\x3b\x02\
-\x58\x00\x52\x02\x58\x00\x1c\x02\x58\x00\x1a\x02\x58\x00\x1c\x02\
-\x58\x00\x38\x02\x58\x00\x1b\x02\x58\x00\x46\x02\x58\x00\x2d\x02\
-\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x2d\x02\x58\x00\x58\x02\
-\x58\x00\x26\x02\x58\x00\x26\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x42\x02\x58\x00\x17\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x3c\x02\
-\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x3c\x02\
-\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x3c\x02\
-\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x3c\x02\
-\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x1b\x02\
-\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x0a\x02\x58\x00\x0a\x02\
-\x58\x00\x54\x02\x58\x00\x54\x02\x58\x00\x54\x02\x58\x00\x54\x02\
-\x58\x00\x54\x02\x58\x00\x2d\x02\x58\x00\x3c\x02\x58\x00\x42\x02\
-\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x43\x02\
-\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x43\x02\
-\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x43\x02\
-\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x2a\x02\x58\x00\x43\x02\
-\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x43\x02\
-\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x3c\x02\x58\x00\x3c\x02\
-\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x21\x02\x58\xff\xea\x02\
-\x58\x00\x6a\x02\x58\x00\x6a\x02\x58\x00\x6a\x02\x58\x00\x6a\x02\
-\x58\x00\x6a\x02\x58\x00\x6a\x02\x58\x00\x6a\x02\x58\x00\x6a\x02\
-\x58\x00\x6a\x02\x58\x00\x6a\x02\x58\x00\x6a\x02\x58\x00\x52\x02\
-\x58\x00\x64\x02\x58\x00\x5d\x02\x58\x00\x5d\x02\x58\x00\x5d\x02\
-\x58\x00\x69\x02\x58\x00\x6a\x02\x58\x00\x50\x02\x58\x00\x50\x02\
-\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x62\x02\
-\x58\x00\x62\x02\x58\x00\x62\x02\x58\x00\x62\x02\x58\x00\x00\x02\
-\x58\x00\x62\x02\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x2f\x02\x58\x00\x2f\x02\
-\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x42\x02\x58\x00\x28\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x0e\x02\x58\x00\x4d\x02\x58\x00\x4d\x02\x58\x00\x4d\x02\
-\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x43\x02\
-\x58\x00\x43\x02\x58\x00\x66\x02\x58\x00\x1c\x02\x58\x00\x27\x02\
-\x58\x00\x27\x02\x58\x00\x27\x02\x58\x00\x27\x02\x58\x00\x5f\x02\
-\x58\x00\x5c\x02\x58\x00\x5c\x02\x58\x00\x5c\x02\x58\x00\x5c\x02\
-\x58\x00\x5c\x02\x58\x00\x5c\x02\x58\x00\x5c\x02\x58\x00\x5c\x02\
-\x58\x00\x5c\x02\x58\x00\x5c\x02\x58\x00\x5c\x02\x58\x00\x5c\x02\
-\x58\x00\x5c\x02\x58\x00\x5c\x02\x58\x00\x5c\x02\x58\x00\x5c\x02\
-\x58\x00\x5c\x02\x58\x00\x5c\x02\x58\x00\x1e\x02\x58\x00\x1e\x02\
-\x58\x00\x1e\x02\x58\x00\x1e\x02\x58\x00\x35\x02\x58\x00\x35\x02\
-\x58\x00\x35\x02\x58\x00\x35\x02\x58\x00\x35\x02\x58\x00\x35\x02\
-\x58\x00\x35\x02\x58\x00\x55\x02\x58\x00\x55\x02\x58\x00\x55\x02\
-\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x1f\x02\
-\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x1f\x02\
-\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x1f\x02\
-\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x1f\x02\
-\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x1f\x02\
-\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x14\x02\x58\x00\x14\x02\
-\x58\x00\x46\x02\x58\x00\x46\x02\x58\x00\x46\x02\x58\x00\x46\x02\
-\x58\x00\x46\x02\x58\x00\x5f\x02\x58\x00\x16\x02\x58\x00\x16\x02\
-\x58\x00\x5a\x02\x58\x00\x5a\x02\x58\x00\x5a\x02\x58\x00\x5a\x02\
-\x58\x00\x5a\x02\x58\x00\x5a\x02\x58\x00\x5a\x02\x58\x00\x5a\x02\
-\x58\x00\x5a\x02\x58\x00\x5a\x02\x58\x00\x5a\x02\x58\x00\x5a\x02\
-\x58\x00\x5a\x02\x58\x00\x5a\x02\x58\x00\x2d\x02\x58\x00\x5a\x02\
-\x58\x00\x5a\x02\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x38\x02\
-\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x0a\x02\x58\x00\x50\x02\
-\x58\x00\x54\x02\x58\x00\x54\x02\x58\x00\x54\x02\x58\x00\x54\x02\
-\x58\x00\x54\x02\x58\x00\x54\x02\x58\x00\x54\x02\x58\x00\x54\x02\
-\x58\x00\x54\x02\x58\x00\x54\x02\x58\x00\x54\x02\x58\x00\x55\x02\
-\x58\x00\x55\x02\x58\x00\x4a\x02\x58\x00\x4a\x02\x58\x00\x55\x02\
-\x58\x00\x76\x02\x58\x00\x78\x02\x58\x00\x78\x02\x58\x00\x78\x02\
-\x58\x00\x28\x02\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x50\x02\
-\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x38\x02\x58\x00\x38\x02\
-\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x38\x02\
-\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x2f\x02\
-\x58\x00\x2f\x02\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x38\x02\
-\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x38\x02\
-\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x28\x02\x58\x00\x38\x02\
-\x58\x00\x38\x02\x58\x00\x25\x02\x58\x00\x5a\x02\x58\x00\x5a\x02\
-\x58\x00\x5a\x02\x58\x00\x2d\x02\x58\x00\x2d\x02\x58\x00\x2d\x02\
-\x58\x00\x2d\x02\x58\x00\x2d\x02\x58\x00\x3f\x02\x58\x00\x19\x02\
-\x58\x00\x19\x02\x58\x00\x19\x02\x58\x00\x19\x02\x58\x00\x5a\x02\
-\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x50\x02\
-\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x50\x02\
-\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x50\x02\
-\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x50\x02\
-\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x23\x02\x58\x00\x23\x02\
-\x58\x00\x23\x02\x58\x00\x23\x02\x58\x00\x11\x02\x58\x00\x11\x02\
-\x58\x00\x11\x02\x58\x00\x11\x02\x58\x00\x11\x02\x58\x00\x11\x02\
-\x58\x00\x11\x02\x58\x00\x30\x02\x58\x00\x30\x02\x58\x00\x30\x02\
-\x58\x00\x62\x02\x58\x00\x2e\x02\x58\x00\x4e\x02\x58\x00\x3f\x02\
-\x58\x00\x36\x02\x58\x00\x14\x02\x58\x00\x42\x02\x58\x00\x3c\x02\
-\x58\x00\x45\x02\x58\x00\x6b\x02\x58\x00\x87\x02\x58\x00\x16\x02\
-\x58\x00\x43\x02\x58\x00\x1e\x02\x58\x00\x3d\x02\x58\x00\x5f\x02\
-\x58\x00\x5f\x02\x58\x00\x6b\x02\x58\x00\x1a\x02\x58\x00\x48\x02\
-\x58\x00\x5f\x02\x58\x00\x42\x02\x58\x00\x61\x02\x58\x00\x5f\x02\
-\x58\x00\x54\x02\x58\x00\x46\x02\x58\x00\x35\x02\x58\x00\x2c\x02\
-\x58\x00\x3d\x02\x58\x00\x54\x02\x58\x00\x50\x02\x58\x00\x36\x02\
-\x58\x00\x36\x02\x58\x00\x0b\x02\x58\x00\x36\x02\x58\x00\x6f\x02\
-\x58\x00\x54\x02\x58\x00\x36\x02\x58\x00\x44\x02\x58\x00\x1f\x02\
-\x58\x00\x55\x02\x58\x00\x58\x02\x58\x00\x84\x02\x58\x00\x0e\x02\
-\x58\x00\x5a\x02\x58\x00\x02\x02\x58\x00\x28\x02\x58\x00\x50\x02\
-\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x05\x02\x58\x00\x44\x02\
-\x58\x00\x50\x02\x58\x00\x38\x02\x58\x00\x53\x02\x58\x00\x5a\x02\
-\x58\x00\x46\x02\x58\x00\x19\x02\x58\x00\x2c\x02\x58\x00\x1a\x02\
-\x58\x00\x1a\x02\x58\x00\x50\x02\x58\x00\x3c\x02\x58\x00\x30\x02\
-\x58\x00\x30\x02\x58\x00\x0a\x02\x58\x00\x30\x02\x58\x00\x5c\x02\
-\x58\x00\x3b\x02\x58\x00\x30\x02\x58\x00\x27\x02\x58\x00\x42\x02\
-\x58\x00\x42\x02\x58\x00\x3c\x02\x58\x00\x3c\x02\x58\x00\x0a\x02\
-\x58\x00\x87\x02\x58\x00\x87\x02\x58\x00\x2c\x02\x58\x00\x6e\x02\
-\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x43\x02\x58\x00\x54\x02\
-\x58\x00\x1e\x02\x58\x00\x1e\x02\x58\x00\x16\x02\x58\x00\x3d\x02\
-\x58\x00\x3d\x02\x58\x00\x50\x02\x58\x00\x5f\x02\x58\x00\x5f\x02\
-\x58\x00\x5f\x02\x58\x00\x6b\x02\x58\x00\x63\x02\x58\x00\x57\x02\
-\x58\x00\x0b\x02\x58\x00\x02\x02\x58\x00\x54\x02\x58\x00\x36\x02\
-\x58\x00\x36\x02\x58\x00\x42\x02\x58\x00\x42\x02\x58\x00\x42\x02\
-\x58\x00\x54\x02\x58\x00\x35\x02\x58\x00\x35\x02\x58\x00\x35\x02\
-\x58\x00\x35\x02\x58\x00\x40\x02\x58\x00\x40\x02\x58\x00\x3d\x02\
-\x58\x00\x50\x02\x58\x00\x4b\x02\x58\x00\x50\x02\x58\x00\x36\x02\
-\x58\x00\x43\x02\x58\x00\x61\x02\x58\x00\x6a\x02\x58\x00\x6a\x02\
-\x58\x00\x5d\x02\x58\x00\x21\x02\x58\x00\x21\x02\x58\x00\x62\x02\
-\x58\x00\x43\x02\x58\x00\x1f\x02\x58\x00\x1f\x02\x58\x00\x14\x02\
-\x58\x00\x84\x02\x58\x00\x84\x02\x58\x00\x33\x02\x58\x00\x58\x02\
-\x58\x00\x5a\x02\x58\x00\x5a\x02\x58\x00\x5a\x02\x58\x00\x43\x02\
-\x58\x00\x02\x02\x58\x00\x02\x02\x58\xff\xf8\x02\x58\x00\x28\x02\
-\x58\x00\x28\x02\x58\x00\x54\x02\x58\x00\x50\x02\x58\x00\x50\x02\
-\x58\x00\x50\x02\x58\x00\x50\x02\x58\x00\x48\x02\x58\x00\x3c\x02\
-\x58\x00\x02\x02\x58\xff\xfe\x02\x58\x00\x50\x02\x58\x00\x30\x02\
-\x58\x00\x31\x02\x58\x00\x38\x02\x58\x00\x38\x02\x58\x00\x38\x02\
-\x58\x00\x46\x02\x58\x00\x2c\x02\x58\x00\x2c\x02\x58\x00\x2c\x02\
-\x58\x00\x2c\x02\x58\x00\x11\x02\x58\x00\x11\x02\x58\x00\x14\x02\
-\x58\x00\x3c\x02\x58\x00\x35\x02\x58\x00\x3c\x02\x58\x00\x30\x02\
-\x58\x00\x2d\x02\x58\x00\x53\x02\x58\x00\x54\x02\x58\x00\x54\x02\
-\x58\x00\x4a\x02\x58\x00\x0a\x02\x58\x00\x0a\x02\x58\x00\x58\x02\
-\x58\x00\x38\x02\x58\x00\x9b\x02\x58\x00\x9a\x02\x58\x00\xa1\x02\
-\x58\x00\x97\x02\x58\x00\x93\x02\x58\x00\xa0\x02\x58\x00\xa1\x02\
-\x58\x00\xa4\x02\x58\x00\x9c\x02\x58\x00\x9d\x02\x58\x00\x9b\x02\
-\x58\x00\x9a\x02\x58\x00\xa1\x02\x58\x00\x97\x02\x58\x00\x93\x02\
-\x58\x00\xa0\x02\x58\x00\xa1\x02\x58\x00\xa4\x02\x58\x00\x9c\x02\
-\x58\x00\x9d\x02\x58\x00\xa8\x02\x58\x00\xaa\x02\x58\x00\xad\x02\
-\x58\x00\xa7\x02\x58\x00\xa4\x02\x58\x00\xb2\x02\x58\x00\xad\x02\
-\x58\x00\xb2\x02\x58\x00\xad\x02\x58\x00\xab\x02\x58\x00\xa8\x02\
-\x58\x00\xaa\x02\x58\x00\xad\x02\x58\x00\xa7\x02\x58\x00\xa4\x02\
-\x58\x00\xb2\x02\x58\x00\xad\x02\x58\x00\xb2\x02\x58\x00\xad\x02\
-\x58\x00\xab\x02\x58\x00\x12\x02\x58\x00\x12\x02\x58\x00\x12\x02\
-\x58\x00\x12\x02\x58\x00\x12\x02\x58\x00\x12\x02\x58\x00\x12\x02\
-\x58\x00\x12\x02\x58\x00\x0f\x02\x58\x00\x12\x02\x58\x00\x12\x02\
-\x58\x00\x12\x02\x58\x00\x12\x02\x58\x00\x12\x02\x58\x00\x12\x02\
-\x58\x00\x12\x02\x58\x00\x12\x02\x58\x00\x2e\x02\x58\x00\x32\x02\
-\x58\x00\x14\x02\x58\x00\x5d\x02\x58\x00\x5d\x02\x58\x00\x1d\x02\
-\x58\x00\x3b\x02\x58\x00\x1c\x02\x58\x00\x3b\x02\x58\x00\x1c\x02\
-\x58\x00\x29\x02\x58\x00\x29\x02\x58\x00\x1d\x02\x58\x00\x1a\x02\
-\x58\x00\x1d\x02\x58\x00\x1a\x02\x58\x00\x52\x02\x58\x00\x52\x02\
-\x58\x00\x14\x02\x58\x00\x14\x02\x58\x00\x00\x02\x58\x00\x5d\x02\
-\x58\x00\x04\x02\x58\x00\x0e\x02\x58\x00\x14\x02\x58\x00\x14\x02\
-\x58\x00\x1a\x02\x58\x00\x1a\x02\x58\x00\x84\x02\x58\x00\x92\x02\
-\x58\x00\xa0\x02\x58\x00\xed\x02\x58\x00\x96\x02\x58\x00\xb3\x02\
-\x58\x00\xff\x02\x58\x00\xbb\x02\x58\x00\x8b\x02\x58\x00\x8b\x02\
-\x58\x00\x8b\x02\x58\x00\x85\x02\x58\x00\xb8\x02\x58\x00\xb8\x02\
-\x58\x00\xf3\x02\x58\x00\xbe\x02\x58\x00\xd5\x02\x58\x00\x77\x00\
-\x00\xff\x59\x00\x00\xff\x75\x00\x00\xff\xc2\x00\x00\xff\x6b\x00\
-\x00\xff\x88\x00\x00\xff\xd4\x00\x00\xff\x90\x00\x00\xff\x60\x00\
-\x00\xff\x60\x00\x00\xff\x60\x00\x00\xff\x8d\x00\x00\xff\xac\x00\
-\x00\xff\xc8\x00\x00\x00\x01\x00\x00\xff\xb3\x00\x00\xff\xaa\x00\
-\x00\xff\xc7\x00\x00\xff\xb0\x00\x00\xff\x4c\x00\x00\xff\x5a\x00\
-\x00\xff\x5a\x00\x00\xff\x5a\x00\x00\xff\x59\x00\x00\xff\x64\x00\
-\x00\xff\x60\x00\x00\xff\x64\x00\x00\xff\x60\x00\x00\xff\x61\x00\
-\x00\xfe\xfc\x00\x00\xff\x60\x00\x00\xff\x64\x00\x00\xff\x59\x02\
-\x58\x00\x84\x02\x58\x00\x92\x02\x58\x00\xa0\x02\x58\x00\xed\x02\
-\x58\x00\x96\x02\x58\x00\xb3\x02\x58\x00\xff\x02\x58\x00\xbb\x02\
-\x58\x00\x8b\x02\x58\x00\x8b\x02\x58\x00\x8b\x02\x58\x00\x85\x02\
-\x58\x00\xb8\x02\x58\x00\xb8\x00\x00\xff\xac\x00\x00\xff\x5a\x00\
-\x00\xff\x5a\x00\x00\xff\x5a\x00\x00\xff\x59\x00\x00\xff\x64\x00\
-\x00\xff\x60\x00\x00\xff\x64\x00\x00\xff\x60\x00\x00\xff\x61\x00\
-\x00\xfe\xfc\x00\x00\xff\x60\x00\x00\xff\x64\x00\x00\xff\x59\x02\
-\x58\x00\x00\x00\x00\x00\x03\x00\x00\x00\x03\x00\x00\x00\x1c\x00\
-\x01\x00\x00\x00\x00\x07\xa8\x00\x03\x00\x01\x00\x00\x00\x1c\x00\
-\x04\x07\x8c\x00\x00\x00\xcc\x00\x80\x00\x06\x00\x4c\x00\x00\x00\
-\x0d\x00\x30\x00\x39\x00\x40\x00\x5a\x00\x67\x00\x7a\x00\x7e\x00\
-\xa3\x01\x7e\x01\x8f\x01\x92\x01\xa1\x01\xb0\x01\xff\x02\x1b\x02\
-\x37\x02\x59\x02\xbc\x02\xc7\x02\xdd\x03\x04\x03\x0c\x03\x12\x03\
-\x15\x03\x1b\x03\x23\x03\x28\x03\xc0\x04\x0f\x04\x2f\x04\x30\x04\
-\x4f\x04\x5f\x04\x73\x04\x9d\x04\xa5\x04\xab\x04\xb3\x04\xbb\x04\
-\xc2\x04\xd9\x04\xdf\x04\xe9\x04\xf5\x04\xf9\x0e\x3f\x1e\x85\x1e\
-\x9e\x1e\xf9\x20\x14\x20\x1a\x20\x1e\x20\x22\x20\x26\x20\x30\x20\
-\x3a\x20\x44\x20\x70\x20\x79\x20\x89\x20\xa1\x20\xa4\x20\xa6\x20\
-\xae\x20\xb2\x20\xb5\x20\xba\x20\xbd\x20\xbf\x21\x13\x21\x16\x21\
-\x22\x21\x26\x21\x2e\x21\x51\x21\x5e\x21\x99\x21\xaa\x21\xb3\x21\
-\xb7\x21\xbb\x21\xc4\x21\xc6\x22\x02\x22\x06\x22\x0f\x22\x12\x22\
-\x1a\x22\x1e\x22\x2b\x22\x48\x22\x60\x22\x65\x25\xca\x27\x13\x27\
-\x4c\x2b\x11\xf6\xd8\xfb\x02\xff\xff\x00\x00\x00\x00\x00\x0d\x00\
-\x20\x00\x31\x00\x3a\x00\x41\x00\x5b\x00\x68\x00\x7b\x00\xa0\x00\
-\xa5\x01\x8f\x01\x92\x01\xa0\x01\xaf\x01\xfa\x02\x18\x02\x37\x02\
-\x59\x02\xbb\x02\xc6\x02\xd8\x03\x00\x03\x06\x03\x12\x03\x15\x03\
-\x1b\x03\x23\x03\x26\x03\xc0\x04\x00\x04\x10\x04\x30\x04\x31\x04\
-\x50\x04\x72\x04\x90\x04\xa0\x04\xaa\x04\xae\x04\xb6\x04\xc0\x04\
-\xcf\x04\xdc\x04\xe2\x04\xee\x04\xf8\x0e\x3f\x1e\x80\x1e\x9e\x1e\
-\xa0\x20\x13\x20\x18\x20\x1c\x20\x20\x20\x26\x20\x30\x20\x39\x20\
-\x44\x20\x70\x20\x74\x20\x80\x20\xa1\x20\xa4\x20\xa6\x20\xa8\x20\
-\xb1\x20\xb4\x20\xb8\x20\xbd\x20\xbf\x21\x13\x21\x16\x21\x22\x21\
-\x26\x21\x2e\x21\x50\x21\x53\x21\x90\x21\xa9\x21\xb0\x21\xb6\x21\
-\xba\x21\xc4\x21\xc6\x22\x02\x22\x06\x22\x0f\x22\x11\x22\x1a\x22\
-\x1e\x22\x2b\x22\x48\x22\x60\x22\x64\x25\xca\x27\x13\x27\x4c\x2b\
-\x0e\xf6\xd7\xfb\x01\xff\xff\x00\x01\xff\xf5\x00\x00\x00\x0d\x00\
-\x00\xff\xe0\x00\x00\xff\xa6\x00\x00\x00\x00\x00\x00\x00\x08\xff\
-\x05\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xd8\xfe\x9e\x00\x57\x00\
-\x46\x00\x00\x00\x00\x00\x00\x00\x10\x00\x0e\x00\x09\x00\x03\x00\
-\x00\xfe\x43\x00\x00\xfe\x15\xfd\xd4\xfd\xd5\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xf2\x5c\x00\x00\xe3\x3a\x00\x00\xe0\x38\x00\
-\x00\x00\x00\x00\x00\xe0\x29\xe0\x3d\xe0\x22\xe0\x27\xe2\x3f\xe2\
-\x3f\xe2\x39\xdf\xfb\xdf\xf9\xdf\xf8\x00\x00\xdf\xf4\xdf\xf3\xdf\
-\xf1\xdf\xef\xdf\xee\xdf\x7f\xdf\x7d\xdf\x52\xe0\xdc\xdf\x63\x00\
-\x00\x00\x00\x00\x00\xe1\x57\x00\x00\xe1\x48\xe1\x48\xe1\x37\xe1\
-\x34\xde\x92\xdf\xf9\xdf\xf1\x00\x00\xde\x74\xde\x72\xde\x64\xde\
-\x3c\xde\x25\xde\x24\xda\xc2\xdb\xd5\xdb\x9d\x00\x00\x00\x00\x05\
-\xad\x00\x01\x00\x00\x00\x00\x00\xc8\x00\x00\x00\xe6\x00\x00\x00\
-\xf0\x00\x00\x01\x06\x01\x0c\x01\x12\x00\x00\x00\x00\x02\xc0\x02\
-\xc2\x02\xc4\x02\xce\x00\x00\x00\x00\x00\x00\x00\x00\x02\xcc\x02\
-\xd6\x02\xde\x00\x00\x00\x00\x00\x00\x00\x00\x02\xe2\x00\x00\x02\
-\xe4\x00\x00\x00\x00\x00\x00\x02\xfc\x03\x1a\x03\x1c\x03\x36\x03\
-\x40\x03\x42\x03\x4c\x03\x56\x03\x5a\x03\x6e\x03\x74\x03\x82\x03\
-\x90\x00\x00\x03\x90\x00\x00\x03\x98\x00\x00\x04\x48\x04\x4c\x04\
-\x50\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x04\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x38\x04\x3a\x04\
-\x50\x00\x00\x04\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x04\x58\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x04\x48\x04\x4e\x00\x00\x00\x00\x00\
-\x03\x00\x60\x00\x54\x00\x7b\x00\x99\x00\x6c\x00\x47\x00\x53\x00\
-\x63\x00\x64\x00\x78\x00\x7e\x00\x51\x00\x49\x00\x4e\x00\x69\x00\
-\x3b\x00\x50\x00\x52\x00\x86\x00\x83\x00\x87\x00\x62\x00\x48\x00\
-\x65\x00\x6a\x00\x66\x00\x7c\x00\x4d\x03\x0b\x00\x04\x00\x06\x00\
-\x07\x00\x08\x00\x09\x00\x0a\x00\x0b\x00\x67\x00\x6e\x00\x68\x00\
-\x7d\x03\x52\x00\x5f\x00\x95\x00\x98\x00\x9a\x00\x6f\x00\x70\x03\
-\x08\x00\x72\x00\x75\x00\x5d\x00\x8d\x00\x4a\x00\x73\x03\x06\x00\
-\x77\x00\x80\x02\xb1\x02\xb2\x03\x0a\x01\xfe\x00\x71\x00\x8a\x03\
-\x14\x02\xb0\x00\x76\x00\x5e\x02\xda\x02\xd7\x02\xdb\x00\x61\x01\
-\x6b\x01\x66\x01\x68\x01\x71\x01\x69\x01\x6f\x01\x7c\x01\x80\x01\
-\x8d\x01\x86\x01\x89\x01\x8a\x01\xa4\x01\x9e\x01\xa0\x01\xa1\x01\
-\x85\x01\xb6\x01\xbd\x01\xb8\x01\xba\x01\xc3\x01\xbb\x00\x81\x01\
-\xc1\x01\xe3\x01\xde\x01\xe0\x01\xe1\x01\xf4\x01\xdd\x01\x3f\x00\
-\xb5\x00\xb0\x00\xb2\x00\xbb\x00\xb3\x00\xb9\x00\xdc\x00\xe0\x00\
-\xed\x00\xe6\x00\xe9\x00\xea\x01\x08\x01\x03\x01\x05\x01\x06\x00\
-\xe5\x01\x1c\x01\x24\x01\x1f\x01\x21\x01\x2a\x01\x22\x00\x82\x01\
-\x28\x01\x4b\x01\x46\x01\x48\x01\x49\x01\x5c\x01\x45\x01\x5e\x01\
-\x6d\x00\xb7\x01\x67\x00\xb1\x01\x6e\x00\xb8\x01\x7e\x00\xde\x01\
-\x81\x00\xe1\x01\x82\x00\xe2\x01\x7f\x00\xdf\x01\x83\x00\xe3\x01\
-\x84\x00\xe4\x01\x8f\x00\xef\x01\x87\x00\xe7\x01\x8b\x00\xeb\x01\
-\x90\x00\xf0\x01\x88\x00\xe8\x01\x99\x00\xf9\x01\x98\x00\xf8\x01\
-\x9b\x00\xfb\x01\x9a\x00\xfa\x01\x9d\x01\x01\x01\x9c\x01\x00\x01\
-\xa8\x01\x0c\x01\xa6\x01\x0a\x01\x9f\x01\x04\x01\xa7\x01\x0b\x01\
-\xa2\x01\x02\x01\xa9\x01\x0d\x01\xac\x01\x11\x01\xad\x01\x12\x01\
-\x13\x01\xae\x01\x14\x01\xb0\x01\x16\x01\xaf\x01\x15\x01\xb1\x01\
-\x17\x01\xb2\x01\x18\x01\xb3\x01\x19\x01\xb5\x01\x1b\x01\xb4\x01\
-\x1a\x01\x1d\x01\xb7\x01\x1e\x01\xc0\x01\x27\x01\xb9\x01\x20\x01\
-\xbf\x01\x26\x01\xcf\x01\x36\x01\xd0\x01\x37\x01\xd2\x01\x39\x01\
-\xd1\x01\x38\x01\xd3\x01\x3a\x01\xd6\x01\x3d\x01\xd5\x01\x3c\x01\
-\xd4\x01\x3b\x01\xdb\x01\x43\x01\xda\x01\x42\x01\xd9\x01\x41\x01\
-\xe9\x01\x51\x01\xe6\x01\x4e\x01\xdf\x01\x47\x01\xe8\x01\x50\x01\
-\xe5\x01\x4d\x01\xe7\x01\x4f\x01\xf1\x01\x59\x01\xf5\x01\x5d\x01\
-\xf7\x01\xfb\x01\x63\x01\xfd\x01\x65\x01\xfc\x01\x64\x01\xc4\x01\
-\x2b\x01\xea\x01\x52\x01\x70\x00\xba\x01\x7d\x00\xdd\x01\xc2\x01\
-\x29\x01\xd7\x01\x3e\x01\xdc\x01\x44\x03\x0e\x03\x07\x03\x10\x03\
-\x15\x03\x04\x03\x09\x03\x1c\x03\x1b\x03\x1d\x03\x16\x03\x17\x03\
-\x1f\x03\x18\x03\x19\x03\x21\x03\x20\x03\x1a\x03\x1e\x03\x27\x03\
-\x25\x03\x28\x02\x82\x02\x83\x02\xab\x02\x7e\x02\x85\x02\xa6\x02\
-\xa8\x02\xa9\x02\xaa\x02\x93\x02\x95\x02\xac\x02\x8f\x02\x8d\x02\
-\x9e\x02\xa7\x02\x4e\x02\x4f\x02\x77\x02\x4a\x02\x51\x02\x72\x02\
-\x74\x02\x75\x02\x76\x02\x5f\x02\x61\x02\x78\x02\x5b\x02\x59\x02\
-\x6a\x02\x73\x02\x98\x02\x64\x02\x7f\x02\x4b\x02\x80\x02\x4c\x02\
-\x81\x02\x4d\x02\x88\x02\x54\x02\x8a\x02\x56\x02\x90\x02\x5c\x02\
-\x91\x02\x5d\x02\x92\x02\x5e\x02\x94\x02\x60\x02\x96\x02\x62\x02\
-\x9a\x02\x66\x02\x9f\x02\x6b\x02\xa0\x02\x6c\x02\xa1\x02\x6d\x02\
-\xa3\x02\x6f\x02\xa4\x02\x70\x02\xad\x02\x79\x02\x8b\x02\x87\x02\
-\x53\x02\x57\x02\x7c\x02\x46\x02\x7b\x02\x45\x02\x7d\x02\x49\x02\
-\x84\x02\x50\x02\xae\x02\x7a\x02\x86\x02\x52\x02\x89\x02\x55\x02\
-\x8e\x02\x5a\x02\x8c\x02\x58\x02\x97\x02\x63\x02\x99\x02\x65\x02\
-\x9b\x02\x67\x02\x9c\x02\x68\x02\x9d\x02\x69\x02\xa2\x02\x6e\x02\
-\xa5\x02\x71\x01\xf3\x01\x5b\x01\xf0\x01\x58\x01\xf2\x01\x5a\x01\
-\x6a\x00\xb4\x01\x6c\x00\xb6\x01\x77\x00\xc1\x01\x79\x00\xc3\x01\
-\x7a\x00\xc4\x01\x7b\x00\xc5\x01\x78\x00\xc2\x01\x72\x00\xbc\x01\
-\x74\x00\xbe\x01\x75\x00\xbf\x01\x76\x00\xc0\x01\x73\x00\xbd\x01\
-\x8c\x00\xec\x01\x8e\x00\xee\x01\x91\x00\xf1\x01\x92\x00\xf2\x01\
-\x94\x00\xf4\x01\x95\x00\xf5\x01\x96\x00\xf6\x01\x93\x00\xf3\x01\
-\xa5\x01\x09\x01\xa3\x01\x07\x01\xbc\x01\x23\x01\xbe\x01\x25\x01\
-\xca\x01\x31\x01\xcc\x01\x33\x01\xcd\x01\x34\x01\xce\x01\x35\x01\
-\xcb\x01\x32\x01\xc5\x01\x2c\x01\xc7\x01\x2e\x01\xc8\x01\x2f\x01\
-\xc9\x01\x30\x01\xc6\x01\x2d\x01\xe2\x01\x4a\x01\xe4\x01\x4c\x01\
-\xeb\x01\x53\x01\xed\x01\x55\x01\xee\x01\x56\x01\xef\x01\x57\x01\
-\xec\x01\x54\x01\xf8\x01\x60\x01\xf6\x01\x5f\x01\xf9\x01\x61\x01\
-\xfa\x01\x62\x00\x55\x00\x56\x00\x59\x00\x57\x00\x58\x00\x5a\x00\
-\x79\x00\x7a\x00\x8b\x00\x9f\x00\xa0\x00\xa1\x00\xa2\x00\x96\x00\
-\xa3\x00\xa4\x02\xe2\x02\xe7\x02\xd8\x02\xd9\x02\xdc\x02\xdd\x02\
-\xde\x02\xdf\x02\xe0\x02\xe1\x02\xe3\x02\xe4\x02\xe5\x02\xe6\x02\
-\xea\x02\xeb\x02\xed\x02\xec\x02\xfc\x02\xfd\x02\xee\x02\xef\x02\
-\xf1\x02\xf0\x02\xf2\x02\xf8\x02\xf3\x02\xf9\x02\x01\x00\x7f\x02\
-\xf7\x02\xf5\x02\xf6\x02\xf4\x03\x2d\x03\x2f\x00\x06\x01\xf8\x00\
-\x00\x00\x09\x00\xf7\x00\x03\x00\x00\x00\x00\x00\x00\x00\x03\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x03\x00\x60\x00\x54\x00\x7b\x00\x99\x00\x6c\x00\
-\x47\x00\x53\x00\x63\x00\x64\x00\x78\x00\x7e\x00\x51\x00\x49\x00\
-\x4e\x00\x69\x00\x3b\x00\x3e\x00\x3f\x00\x40\x00\x41\x00\x42\x00\
-\x43\x00\x44\x00\x45\x00\x46\x00\x50\x00\x52\x00\x86\x00\x83\x00\
-\x87\x00\x62\x00\x48\x00\x21\x00\x22\x00\x23\x00\x24\x00\x25\x00\
-\x26\x00\x27\x00\x28\x00\x29\x00\x2a\x00\x2b\x00\x2c\x00\x2d\x00\
-\x2e\x00\x2f\x00\x30\x00\x31\x00\x32\x00\x33\x00\x34\x00\x35\x00\
-\x36\x00\x37\x00\x38\x00\x39\x00\x3a\x00\x65\x00\x6a\x00\x66\x00\
-\x7c\x00\x4d\x03\x0b\x00\x04\x00\x06\x00\x07\x00\x08\x00\x09\x00\
-\x0a\x00\x0b\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\x13\x00\
-\x14\x00\x15\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a\x00\x1b\x00\
-\x1c\x00\x1d\x00\x1e\x00\x1f\x00\x20\x00\x67\x00\x6e\x00\x68\x00\
-\x7d\x00\x00\x01\x69\x01\x6f\x01\x80\x01\x86\x01\xb6\x01\xbb\x01\
-\xe1\x00\xb0\x00\xb5\x00\xb2\x00\xb3\x00\xbb\x00\xb9\x00\xe0\x00\
-\xe6\x00\xed\x00\xe9\x00\xea\x01\x03\x01\x08\x01\x05\x01\x06\x01\
-\x1c\x01\x1f\x01\x24\x01\x21\x01\x22\x01\x2a\x01\x46\x01\x4b\x01\
-\x48\x01\x49\x00\x79\x00\x77\x00\x95\x00\x98\x00\x70\x00\x8b\x00\
-\x71\x01\x3f\x00\x73\x00\x72\x00\x74\x03\x0a\x03\x08\x00\x85\x01\
-\x7c\x01\xc1\x00\x90\x00\x80\x00\x88\x00\x89\x00\x9a\x01\xfe\x00\
-\x94\x02\x01\x02\x00\x02\x03\x00\x8f\x00\x75\x00\x76\x00\x00\x00\
-\xdc\x01\x28\x00\x61\x00\x5f\x00\x8d\x00\x8e\x00\x97\x00\x84\x01\
-\xff\x00\x5d\x00\x5e\x00\x4f\x03\x52\x01\x6b\x01\x71\x01\xc3\x01\
-\xcf\x01\x36\x00\x4b\x00\x4c\x00\x57\x00\x58\x00\x55\x00\x56\x00\
-\x82\x00\x8c\x01\x5e\x01\xf7\x00\x6b\x00\x96\x00\x5b\x00\x5c\x00\
-\xae\x00\xaf\x00\x7a\x00\x8a\x00\x59\x00\x5a\x00\x6d\x01\x68\x01\
-\x89\x01\x66\x01\x8a\x01\x8d\x01\x9e\x01\xa0\x01\xa1\x01\xa4\x01\
-\xb8\x01\xba\x00\x00\x01\xbd\x01\xde\x01\xe0\x01\xe3\x01\x02\x03\
-\x0c\x03\x04\x03\x06\x03\x0e\x03\x07\x03\x10\x03\x14\x03\x09\x03\
-\x15\x03\x0d\xb8\x00\x00\x2c\x4b\xb8\x00\x09\x50\x58\xb1\x01\x01\
-\x8e\x59\xb8\x01\xff\x85\xb8\x00\x44\x1d\xb9\x00\x09\x00\x03\x5f\
-\x5e\x2d\xb8\x00\x01\x2c\x20\x20\x45\x69\x44\xb0\x01\x60\x2d\xb8\
-\x00\x02\x2c\xb8\x00\x01\x2a\x21\x2d\xb8\x00\x03\x2c\x20\x46\xb0\
-\x03\x25\x46\x52\x58\x23\x59\x20\x8a\x20\x8a\x49\x64\x8a\x20\x46\
-\x20\x68\x61\x64\xb0\x04\x25\x46\x20\x68\x61\x64\x52\x58\x23\x65\
-\x8a\x59\x2f\x20\xb0\x00\x53\x58\x69\x20\xb0\x00\x54\x58\x21\xb0\
-\x40\x59\x1b\x69\x20\xb0\x00\x54\x58\x21\xb0\x40\x65\x59\x59\x3a\
-\x2d\xb8\x00\x04\x2c\x20\x46\xb0\x04\x25\x46\x52\x58\x23\x8a\x59\
-\x20\x46\x20\x6a\x61\x64\xb0\x04\x25\x46\x20\x6a\x61\x64\x52\x58\
-\x23\x8a\x59\x2f\xfd\x2d\xb8\x00\x05\x2c\x4b\x20\xb0\x03\x26\x50\
-\x58\x51\x58\xb0\x80\x44\x1b\xb0\x40\x44\x59\x1b\x21\x21\x20\x45\
-\xb0\xc0\x50\x58\xb0\xc0\x44\x1b\x21\x59\x59\x2d\xb8\x00\x06\x2c\
-\x20\x20\x45\x69\x44\xb0\x01\x60\x20\x20\x45\x7d\x69\x18\x44\xb0\
-\x01\x60\x2d\xb8\x00\x07\x2c\xb8\x00\x06\x2a\x2d\xb8\x00\x08\x2c\
-\x4b\x20\xb0\x03\x26\x53\x58\xb0\x40\x1b\xb0\x00\x59\x8a\x8a\x20\
-\xb0\x03\x26\x53\x58\x23\x21\xb0\x80\x8a\x8a\x1b\x8a\x23\x59\x20\
-\xb0\x03\x26\x53\x58\x23\x21\xb8\x00\xc0\x8a\x8a\x1b\x8a\x23\x59\
-\x20\xb0\x03\x26\x53\x58\x23\x21\xb8\x01\x00\x8a\x8a\x1b\x8a\x23\
-\x59\x20\xb0\x03\x26\x53\x58\x23\x21\xb8\x01\x40\x8a\x8a\x1b\x8a\
-\x23\x59\x20\xb8\x00\x03\x26\x53\x58\xb0\x03\x25\x45\xb8\x01\x80\
-\x50\x58\x23\x21\xb8\x01\x80\x23\x21\x1b\xb0\x03\x25\x45\x23\x21\
-\x23\x21\x59\x1b\x21\x59\x44\x2d\xb8\x00\x09\x2c\x4b\x53\x58\x45\
-\x44\x1b\x21\x21\x59\x2d\x00\xb8\x00\x00\x2b\x00\xba\x00\x01\x00\
-\x0b\x00\x02\x2b\x01\xba\x00\x0c\x00\x02\x00\x02\x2b\x01\xbf\x00\
-\x0c\x00\x44\x00\x37\x00\x2b\x00\x1f\x00\x13\x00\x00\x00\x08\x2b\
-\xbf\x00\x0d\x00\x40\x00\x35\x00\x29\x00\x1e\x00\x12\x00\x00\x00\
-\x08\x2b\x00\xbf\x00\x01\x00\x5c\x00\x4b\x00\x3b\x00\x2a\x00\x16\
-\x00\x00\x00\x08\x2b\xbf\x00\x02\x00\x51\x00\x43\x00\x34\x00\x26\
-\x00\x18\x00\x00\x00\x08\x2b\xbf\x00\x03\x00\x68\x00\x55\x00\x43\
-\x00\x2c\x00\x1e\x00\x00\x00\x08\x2b\xbf\x00\x04\x00\x3e\x00\x32\
-\x00\x2a\x00\x20\x00\x14\x00\x00\x00\x08\x2b\xbf\x00\x05\x00\x50\
-\x00\x42\x00\x33\x00\x25\x00\x16\x00\x00\x00\x08\x2b\xbf\x00\x06\
-\x00\x2f\x00\x27\x00\x1e\x00\x17\x00\x0c\x00\x00\x00\x08\x2b\xbf\
-\x00\x07\x00\x31\x00\x26\x00\x23\x00\x15\x00\x10\x00\x00\x00\x08\
-\x2b\xbf\x00\x08\x00\x4e\x00\x40\x00\x32\x00\x24\x00\x16\x00\x00\
-\x00\x08\x2b\xbf\x00\x09\x00\x2a\x00\x22\x00\x1a\x00\x13\x00\x0b\
-\x00\x00\x00\x08\x2b\xbf\x00\x0a\x00\x91\x00\x77\x00\x5d\x00\x42\
-\x00\x28\x00\x00\x00\x08\x2b\xbf\x00\x0b\x00\x4b\x00\x3e\x00\x30\
-\x00\x24\x00\x16\x00\x00\x00\x08\x2b\x00\xba\x00\x0e\x00\x09\x00\
-\x07\x2b\xb8\x00\x00\x20\x45\x7d\x69\x18\x44\xba\x00\x40\x00\x12\
-\x00\x01\x75\xba\x00\x10\x00\x12\x00\x01\x74\xba\x00\x3f\x00\x12\
-\x00\x01\x74\xba\x00\x40\x00\x12\x00\x01\x74\xba\x00\x70\x00\x12\
-\x00\x01\x74\xba\x00\xa0\x00\x12\x00\x01\x74\xba\x00\x10\x00\x12\
-\x00\x01\x75\xba\x00\x3f\x00\x12\x00\x01\x75\xba\x00\x40\x00\x14\
-\x00\x01\x74\xba\x00\x3f\x00\x14\x00\x01\x74\xba\x00\x9f\x00\x14\
-\x00\x01\x74\xba\x00\xa0\x00\x14\x00\x01\x74\xba\x00\xcf\x00\x14\
-\x00\x01\x74\xba\x00\x70\x00\x14\x00\x01\x74\xba\x00\x6f\x00\x16\
-\x00\x01\x74\xba\x00\x60\x00\x18\x00\x01\x73\xba\x00\x6f\x00\x18\
-\x00\x01\x74\xba\x00\x0f\x00\x18\x00\x01\x75\xba\x00\x6f\x00\x18\
-\x00\x01\x75\xba\x00\x9f\x00\x18\x00\x01\x75\x00\x17\x00\x3c\x00\
-\x44\x00\x35\x00\x5a\x00\x42\x00\x76\x00\x72\x00\x45\x00\x8a\x00\
-\x26\x00\x49\x00\x52\x00\x56\x00\x00\x00\x0c\xff\x38\x00\x0c\x01\
-\x49\x00\x06\x01\x6b\x00\x06\x01\x4f\x00\x06\x01\x71\x00\x06\x02\
-\x04\x00\x0c\x02\xba\x00\x0c\x02\xe4\x00\x0c\x00\x00\x00\x32\x00\
-\x32\x00\x32\x00\x32\x00\xba\x01\x2e\x01\xa2\x01\xf8\x02\x6c\x02\
-\xe0\x03\x38\x04\x0c\x04\x96\x05\x64\x05\xc0\x06\x1a\x06\x6e\x06\
-\xba\x06\xf2\x07\x7a\x07\xd6\x08\x2a\x08\x9e\x09\x12\x09\x6a\x09\
-\xea\x0a\x3a\x0a\x96\x0a\xce\x0b\x2a\x0b\x86\x0b\xd2\x0c\x12\x0c\
-\x5e\x0c\xcc\x0d\x22\x0d\x68\x0d\xaa\x0d\xe6\x0e\x5c\x0e\xb4\x0e\
-\xee\x0f\x32\x0f\x80\x0f\xaa\x10\x02\x10\x4a\x10\xa8\x10\xf4\x11\
-\x68\x11\xc6\x12\x38\x12\x6a\x12\xb6\x12\xf0\x13\x4e\x13\xaa\x13\
-\xf0\x14\x30\x14\xae\x15\x32\x15\x3a\x15\x7e\x15\xd8\x16\x58\x16\
-\xa4\x17\x0e\x17\x82\x17\xba\x18\x4c\x18\xc0\x19\x7a\x1a\x12\x1a\
-\x2a\x1a\x32\x1a\x4a\x1a\x5e\x1a\x76\x1a\xa0\x1b\x0c\x1b\x18\x1b\
-\x30\x1b\x3c\x1b\x5a\x1b\x66\x1b\x84\x1b\xa2\x1b\xae\x1b\xba\x1b\
-\xd2\x1b\xde\x1b\xfa\x1c\x16\x1c\x22\x1c\x2e\x1c\x6a\x1c\xae\x1d\
-\x0a\x1d\x70\x1d\xa0\x1d\xd0\x1d\xf6\x1e\x1c\x1e\x90\x1f\x06\x1f\
-\x20\x1f\x3a\x1f\x78\x20\x2c\x21\x0c\x21\x24\x21\x4c\x21\xf8\x22\
-\x30\x22\xc6\x23\x94\x23\xf8\x24\x82\x24\xd6\x25\x28\x25\x4e\x25\
-\x90\x25\xec\x26\x60\x26\x84\x26\xd4\x26\xfc\x27\x14\x27\x50\x27\
-\x82\x27\xd4\x27\xfc\x28\x08\x28\x50\x28\x6e\x28\x8c\x28\xbc\x28\
-\xec\x29\x10\x29\x34\x29\x76\x29\x92\x29\xd4\x2a\x0c\x2a\x90\x2b\
-\x04\x2b\x7a\x2c\x12\x2c\x82\x2c\xf6\x2d\x74\x2d\xc8\x2e\x38\x2e\
-\xe0\x2f\x3c\x2f\xe0\x30\x98\x31\x20\x31\xb4\x32\x64\x32\xfe\x33\
-\x6e\x34\x0e\x34\x70\x34\xfa\x36\x0c\x36\xae\x37\x68\x37\xf2\x38\
-\x32\x38\xae\x39\x46\x39\xb0\x3a\x46\x3a\xbe\x3b\x26\x3b\x32\x3b\
-\x3e\x3b\x4a\x3b\x56\x3b\x62\x3b\x6e\x3b\x7a\x3b\x86\x3c\x34\x3c\
-\x40\x3c\x4c\x3c\x58\x3c\x64\x3c\x74\x3c\x80\x3c\x8c\x3c\x98\x3c\
-\xa4\x3c\xb4\x3c\xc0\x3c\xcc\x3c\xd8\x3c\xe4\x3c\xf0\x3c\xfc\x3d\
-\x08\x3d\x14\x3d\x20\x3d\x2c\x3d\x38\x3d\xd4\x3d\xe0\x3d\xec\x3d\
-\xf8\x3e\x04\x3e\x14\x3e\x20\x3e\x2c\x3e\x38\x3e\x44\x3e\x54\x3e\
-\x60\x3e\x6c\x3e\x78\x3f\x48\x3f\x54\x3f\x60\x3f\x6c\x3f\xfc\x40\
-\x08\x40\x14\x40\x9a\x41\x2e\x41\xaa\x41\xb6\x41\xc2\x41\xce\x41\
-\xda\x41\xe6\x41\xf2\x41\xfe\x42\x0a\x42\x16\x42\x22\x42\xc2\x42\
-\xce\x42\xda\x42\xea\x42\xf6\x43\x02\x43\x0e\x43\x80\x43\x8c\x43\
-\x98\x43\xa4\x43\xb0\x43\xbc\x43\xc8\x43\xd4\x43\xe0\x44\x5c\x44\
-\x68\x44\xa0\x44\xac\x44\xb8\x44\xc4\x44\xd0\x44\xdc\x44\xe8\x44\
-\xf4\x45\x00\x45\x88\x45\x94\x46\x1a\x46\x80\x46\xb6\x46\xc2\x46\
-\xce\x46\xda\x47\x26\x47\x3a\x47\x46\x47\x52\x47\x5e\x47\xca\x47\
-\xd6\x47\xe2\x47\xee\x47\xfa\x48\x68\x48\xcc\x48\xd8\x48\xe4\x48\
-\xf0\x48\xfc\x49\x08\x49\x14\x49\x20\x49\x2c\x49\x38\x49\xd0\x49\
-\xdc\x49\xe8\x4a\x5e\x4a\x6a\x4a\x76\x4a\x82\x4a\x8e\x4a\x9a\x4a\
-\xa6\x4a\xb6\x4a\xc2\x4a\xce\x4a\xda\x4b\x8c\x4b\x98\x4b\xa4\x4b\
-\xb0\x4b\xbc\x4b\xc8\x4c\x82\x4c\x8e\x4c\x9a\x4d\x12\x4d\xb0\x4e\
-\x1a\x4e\x26\x4e\x32\x4e\x3e\x4e\xb2\x4e\xbe\x4e\xca\x4e\xd6\x4e\
-\xe2\x4e\xee\x4e\xfa\x4f\x06\x4f\x12\x4f\x1e\x4f\x9e\x4f\xaa\x4f\
-\xb6\x50\x24\x50\x30\x50\x3c\x50\x48\x50\x54\x50\x60\x50\x6c\x50\
-\x78\x50\x84\x50\x90\x50\x9c\x50\xa8\x50\xb4\x50\xc0\x50\xcc\x50\
-\xd8\x50\xe4\x50\xf0\x50\xfc\x51\x08\x51\x14\x51\x20\x51\x2c\x51\
-\x38\x51\x44\x51\x50\x51\x5c\x51\x68\x51\xda\x51\xe6\x51\xf2\x51\
-\xfe\x52\x0a\x52\x1a\x52\x26\x52\x32\x52\x3e\x52\x4a\x52\x5a\x52\
-\x66\x52\x72\x52\x7e\x52\xe6\x52\xf2\x52\xfe\x53\x0a\x53\x9c\x53\
-\xa8\x53\xb4\x53\xc0\x54\x20\x54\x28\x54\x34\x54\x40\x54\x4c\x54\
-\x58\x54\x64\x54\x70\x54\x7c\x54\x88\x54\x94\x54\xa0\x55\x10\x55\
-\x1c\x55\x28\x55\x38\x55\x44\x55\x50\x55\x5c\x55\xca\x55\xd6\x55\
-\xe2\x55\xee\x55\xfa\x56\x7a\x56\x86\x56\x92\x56\x9e\x56\xaa\x56\
-\xb6\x56\xc2\x56\xce\x56\xda\x56\xe6\x56\xf2\x57\x58\x57\x64\x57\
-\xb4\x57\xc4\x57\xd0\x57\xdc\x57\xe8\x57\xf4\x58\x00\x58\x0c\x58\
-\x18\x58\x7c\x58\x88\x58\x94\x58\xa0\x58\xac\x59\x0a\x59\x16\x59\
-\x22\x59\x2e\x59\x3a\x59\x46\x59\x52\x59\x5e\x59\x6a\x59\x76\x5a\
-\x16\x5a\x22\x5a\x2e\x5a\xae\x5a\xba\x5a\xc6\x5a\xd2\x5a\xde\x5a\
-\xea\x5a\xf6\x5b\x06\x5b\x12\x5b\x1e\x5b\x2a\x5b\x86\x5b\x92\x5b\
-\x9e\x5b\xaa\x5b\xb6\x5b\xc2\x5c\x68\x5c\x74\x5c\x80\x5c\xe8\x5d\
-\x34\x5d\x40\x5d\x4c\x5d\x58\x5d\xac\x5d\xb8\x5d\xc4\x5d\xd0\x5d\
-\xdc\x5d\xe8\x5d\xf4\x5e\x00\x5e\x0c\x5e\x18\x5e\x98\x5e\xa4\x5e\
-\xb0\x5f\x0e\x5f\x1a\x5f\x26\x5f\x32\x5f\x3e\x5f\x4a\x5f\x56\x5f\
-\x62\x5f\x6e\x5f\x7a\x5f\x86\x5f\x92\x5f\x9e\x5f\xaa\x5f\xb6\x5f\
-\xc2\x5f\xce\x5f\xda\x5f\xe6\x5f\xf2\x60\x5c\x60\x9a\x60\xd2\x61\
-\x1e\x61\x88\x61\xd2\x61\xda\x61\xe2\x62\x56\x62\xc4\x62\xf0\x63\
-\x44\x63\x4c\x63\xd6\x64\x42\x64\x8c\x64\x98\x65\x00\x65\x4c\x65\
-\xa2\x65\xee\x65\xf6\x66\x2e\x66\x36\x66\x3e\x66\x6e\x66\x76\x67\
-\x46\x67\x4e\x67\x8e\x67\xe8\x68\x2e\x68\x80\x68\xda\x69\x48\x69\
-\x9a\x69\xfe\x6a\x88\x6a\xf8\x6b\x00\x6b\x54\x6b\x5c\x6b\x88\x6b\
-\xf0\x6b\xf8\x6c\x96\x6d\x04\x6d\x4e\x6d\x5a\x6d\xca\x6e\x18\x6e\
-\x20\x6e\x28\x6e\x30\x6e\x68\x6e\x70\x6e\x78\x6e\x80\x6e\xcc\x6f\
-\x50\x6f\x58\x6f\xac\x70\x02\x70\x48\x70\xae\x71\x02\x71\x68\x71\
-\xb2\x72\x14\x72\x9a\x73\x0a\x73\x16\x73\x22\x73\x2e\x73\x3a\x73\
-\x42\x73\x4e\x73\x80\x73\xda\x74\x4e\x74\x5a\x74\x66\x74\x72\x74\
-\xd6\x74\xe2\x74\xee\x75\x84\x75\x90\x76\x08\x76\x44\x76\x50\x76\
-\x5c\x76\x68\x76\x74\x76\xde\x77\x5c\x77\xcc\x78\x48\x78\xa2\x79\
-\x1c\x79\x70\x79\x7c\x79\xe2\x79\xea\x7a\x4a\x7a\x56\x7a\x62\x7a\
-\x6e\x7a\x7a\x7a\xc0\x7b\x18\x7b\x82\x7b\x8e\x7b\xf6\x7c\x64\x7c\
-\x70\x7c\x78\x7c\xba\x7c\xc2\x7c\xce\x7c\xd6\x7d\x5a\x7d\x62\x7d\
-\x6a\x7d\x72\x7d\x7e\x7d\x8a\x7d\x92\x7d\x9e\x7d\xd0\x7e\x20\x7e\
-\x94\x7e\xa0\x7e\xac\x7e\xb8\x7f\x1e\x7f\x2a\x7f\x36\x7f\xf4\x80\
-\x00\x80\x78\x80\x80\x80\x8c\x80\x98\x80\xa4\x80\xb0\x81\x38\x81\
-\xc0\x82\x36\x82\xac\x83\x20\x83\x9c\x83\xf6\x84\x02\x84\x74\x84\
-\x7c\x84\xde\x84\xea\x84\xf6\x85\x02\x85\x0e\x85\x16\x85\x6a\x85\
-\xe8\x85\xf4\x86\x70\x86\xe0\x86\xec\x86\xf4\x87\x4a\x87\x52\x87\
-\x5e\x87\x66\x87\xd8\x88\x42\x88\xa8\x88\xb0\x89\x1a\x89\x5e\x89\
-\xb6\x8a\x2a\x8a\x7a\x8a\xd8\x8b\x3c\x8b\x6e\x8b\xee\x8c\x56\x8c\
-\xc0\x8d\x02\x8d\x58\x8d\xc8\x8e\x18\x8e\x76\x8e\xda\x8f\x0c\x8f\
-\x8c\x8f\xf4\x90\x70\x90\xb4\x91\x08\x91\x82\x91\xd2\x92\x2e\x92\
-\x92\x92\xc4\x93\x4a\x93\xb0\x94\x1a\x94\x5c\x94\xae\x95\x28\x95\
-\x78\x95\xd4\x96\x38\x96\x6a\x96\xf0\x97\x54\x97\x64\x97\x74\x97\
-\x84\x97\x94\x97\xa4\x97\xb4\x97\xc4\x97\xd4\x97\xe4\x97\xf4\x98\
-\x04\x98\x14\x98\x24\x98\x34\x98\x44\x98\x54\x98\x64\x98\x90\x98\
-\xb4\x98\xde\x99\x14\x99\x4a\x99\x74\x99\x9e\x99\xc8\x99\xf2\x9a\
-\x1c\x9a\x50\x9a\x84\x9a\xb0\x9a\xdc\x9b\x08\x9b\x34\x9b\x6a\x9b\
-\x9e\x9b\xac\x9b\xba\x9b\xf4\x9c\x3a\x9c\x7c\x9c\xbe\x9c\xfe\x9d\
-\x3e\x9d\xae\x9e\x1e\x9e\x8a\x9e\xf2\x9f\x22\x9f\x46\x9f\x86\x9f\
-\xb8\x9f\xd8\x9f\xf8\xa0\x2c\xa0\x62\xa0\x9e\xa0\xd0\xa1\x2a\xa1\
-\x98\xa1\xb8\xa1\xe4\xa2\x2a\xa2\x62\xa2\x6c\xa2\x76\xa2\x80\xa2\
-\x8a\xa2\x94\xa2\x9e\xa2\xa8\xa2\xb2\xa2\xbc\xa2\xc6\xa2\xd0\xa3\
-\x18\xa3\x22\xa3\x2c\xa3\x4e\xa3\x58\xa3\x76\xa3\x86\xa3\x90\xa3\
-\xd0\xa4\x10\xa4\x60\xa4\xdc\xa5\x22\xa5\x6c\xa5\xb2\xa5\xe8\xa6\
-\x34\xa6\x6a\xa6\xb2\xa6\xfa\xa7\x66\xa7\xc6\xa8\x26\xa8\x56\xa8\
-\x8a\xa8\xe0\xa9\x0c\xa9\x2c\xa9\x4c\xa9\x7c\xa9\xae\xa9\xf4\xaa\
-\x2a\xaa\x8e\xaa\xf8\xab\x2e\xab\x6a\xab\xa6\xab\xf0\xac\x6a\xac\
-\xbe\xad\x16\xad\x6a\xad\xa0\xad\xec\xae\x22\xae\x68\xae\xba\xaf\
-\x24\xaf\x24\x00\x02\x00\x20\x00\x00\x02\x38\x03\x0c\x00\x03\x00\
-\x07\x00\x3a\xba\x00\x04\x00\x08\x00\x09\x11\x12\x39\xb8\x00\x04\
-\x10\xb8\x00\x00\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\
-\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x01\xdc\xb8\x00\x00\x10\xb8\
-\x00\x04\xdc\xb8\x00\x01\x10\xb8\x00\x07\xdc\x30\x31\x33\x11\x21\
-\x11\x25\x21\x11\x21\x20\x02\x18\xfe\x24\x01\xa0\xfe\x60\x03\x0c\
-\xfc\xf4\x3c\x02\x94\x00\x00\x00\x02\x00\x42\xff\xf4\x02\x26\x02\
-\x10\x00\x21\x00\x2f\x00\x8a\xba\x00\x29\x00\x30\x00\x31\x11\x12\
-\x39\xb8\x00\x29\x10\xb8\x00\x0d\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x1b\x2f\x1b\xb9\x00\x1b\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x0e\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x07\
-\x10\xb9\x00\x22\x00\x08\xf4\xba\x00\x0d\x00\x07\x00\x1b\x11\x12\
-\x39\xb8\x00\x0d\x2f\xb9\x00\x29\x00\x08\xf4\xba\x00\x04\x00\x22\
-\x00\x29\x11\x12\x39\x7c\xb8\x00\x04\x2f\x18\xb8\x00\x1b\x10\xb9\
-\x00\x12\x00\x08\xf4\xb8\x00\x00\x10\xb9\x00\x1f\x00\x08\xf4\x30\
-\x31\x21\x22\x26\x27\x23\x0e\x01\x23\x22\x26\x35\x34\x36\x3b\x01\
-\x35\x34\x26\x23\x22\x06\x07\x27\x3e\x03\x33\x32\x16\x15\x11\x33\
-\x15\x25\x32\x3e\x02\x3d\x01\x23\x22\x06\x1d\x01\x14\x16\x01\xef\
-\x2f\x28\x05\x05\x11\x4b\x3f\x51\x60\x69\x75\x6e\x40\x3b\x34\x42\
-\x14\x36\x0a\x22\x32\x40\x27\x5b\x6b\x48\xfe\xdb\x1f\x33\x26\x15\
-\x6e\x48\x42\x39\x30\x24\x2d\x33\x54\x49\x48\x4e\x33\x39\x39\x29\
-\x23\x28\x14\x26\x1d\x11\x5c\x52\xfe\xe4\x46\x37\x0f\x19\x23\x14\
-\x55\x28\x26\x15\x28\x29\x00\x00\x02\x00\x3c\xff\xf4\x01\xf9\x02\
-\x10\x00\x10\x00\x22\x00\x81\xba\x00\x11\x00\x23\x00\x24\x11\x12\
-\x39\xb8\x00\x11\x10\xb8\x00\x03\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1a\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x10\x2f\x1b\xb9\x00\x10\x00\x0e\x3e\x59\xb8\x00\
-\x09\x10\xb9\x00\x1c\x00\x08\xf4\xb8\x00\x03\x10\xb9\x00\x11\x00\
-\x08\xf4\xba\x00\x01\x00\x1c\x00\x11\x11\x12\x39\xba\x00\x0b\x00\
-\x11\x00\x1c\x11\x12\x39\x30\x31\x25\x23\x06\x23\x22\x26\x35\x34\
-\x36\x33\x32\x17\x33\x35\x33\x11\x23\x27\x32\x3e\x02\x3d\x01\x34\
-\x2e\x02\x23\x22\x06\x1d\x01\x14\x16\x01\xa9\x04\x32\x6d\x5f\x6b\
-\x6b\x5f\x6d\x32\x04\x50\x50\x84\x1b\x30\x24\x15\x15\x24\x30\x1b\
-\x46\x4d\x4d\x54\x60\x8e\x80\x80\x8e\x60\x54\xfd\xfc\x3b\x0e\x1b\
-\x27\x1a\xba\x1a\x27\x1b\x0e\x55\x46\x58\x46\x55\x00\x00\x00\x00\
-\x02\x00\x5f\xff\xf4\x02\x1c\x02\xe4\x00\x10\x00\x22\x00\x81\xba\
-\x00\x11\x00\x23\x00\x24\x11\x12\x39\xb8\x00\x11\x10\xb8\x00\x0b\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\
-\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\
-\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\
-\x0b\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0f\x2f\x1b\xb9\
-\x00\x0f\x00\x0e\x3e\x59\xb8\x00\x05\x10\xb9\x00\x18\x00\x08\xf4\
-\xb8\x00\x0b\x10\xb9\x00\x11\x00\x08\xf4\xba\x00\x03\x00\x18\x00\
-\x11\x11\x12\x39\xba\x00\x0d\x00\x11\x00\x18\x11\x12\x39\x30\x31\
-\x13\x33\x11\x33\x36\x33\x32\x16\x15\x14\x06\x23\x22\x27\x23\x15\
-\x23\x37\x32\x36\x3d\x01\x34\x26\x23\x22\x0e\x02\x1d\x01\x14\x1e\
-\x02\x5f\x50\x04\x32\x6d\x5f\x6b\x6b\x5f\x6d\x32\x04\x50\xd4\x46\
-\x4d\x4d\x46\x1b\x30\x24\x15\x15\x24\x30\x02\xe4\xfe\xcc\x60\x8e\
-\x80\x80\x8e\x60\x54\x3b\x55\x46\x58\x46\x55\x0e\x1b\x27\x1a\xba\
-\x1a\x27\x1b\x0e\x00\x00\x00\x00\x01\x00\x54\xff\xf4\x02\x04\x02\
-\x10\x00\x22\x00\x43\xba\x00\x11\x00\x23\x00\x24\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb8\x00\x0a\x10\xb9\x00\x11\x00\x08\xf4\xb8\x00\x00\x10\
-\xb9\x00\x1c\x00\x08\xf4\x30\x31\x05\x22\x2e\x02\x35\x34\x3e\x02\
-\x33\x32\x16\x17\x07\x2e\x01\x23\x22\x0e\x02\x1d\x01\x14\x1e\x02\
-\x33\x32\x36\x37\x17\x0e\x01\x01\x3e\x38\x57\x3c\x1f\x20\x3c\x56\
-\x37\x4b\x5e\x16\x40\x0e\x41\x30\x23\x37\x26\x13\x13\x26\x38\x24\
-\x34\x44\x14\x39\x17\x61\x0c\x27\x46\x64\x3d\x3d\x64\x47\x26\x42\
-\x35\x22\x28\x2c\x17\x2a\x3a\x22\x58\x22\x3a\x2a\x17\x30\x2a\x27\
-\x34\x44\x00\x00\x02\x00\x3c\xff\xf4\x01\xf9\x02\xe4\x00\x10\x00\
-\x22\x00\x81\xba\x00\x11\x00\x23\x00\x24\x11\x12\x39\xb8\x00\x11\
-\x10\xb8\x00\x03\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\
-\xb9\x00\x0e\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\
-\x1b\xb9\x00\x09\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\
-\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x10\x2f\x1b\xb9\x00\x10\x00\x0e\x3e\x59\xb8\x00\x03\x10\xb9\x00\
-\x11\x00\x08\xf4\xb8\x00\x09\x10\xb9\x00\x1c\x00\x08\xf4\xba\x00\
-\x01\x00\x11\x00\x1c\x11\x12\x39\xba\x00\x0b\x00\x1c\x00\x11\x11\
-\x12\x39\x30\x31\x25\x23\x06\x23\x22\x26\x35\x34\x36\x33\x32\x17\
-\x33\x11\x33\x11\x23\x27\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\
-\x06\x1d\x01\x14\x16\x01\xa9\x04\x32\x6d\x5f\x6b\x6b\x5f\x6d\x32\
-\x04\x50\x50\x84\x1b\x30\x24\x15\x15\x24\x30\x1b\x46\x4d\x4d\x54\
-\x60\x8e\x80\x80\x8e\x60\x01\x34\xfd\x1c\x3b\x0e\x1b\x27\x1a\xba\
-\x1a\x27\x1b\x0e\x55\x46\x58\x46\x55\x00\x00\x00\x02\x00\x43\xff\
-\xf4\x02\x15\x02\x10\x00\x1d\x00\x2a\x00\x6b\xba\x00\x1e\x00\x2b\
-\x00\x2c\x11\x12\x39\xb8\x00\x1e\x10\xb8\x00\x0a\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1a\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\
-\xb9\x00\x17\x00\x08\xf4\xb8\x00\x0a\x10\xb9\x00\x1e\x00\x08\xf4\
-\xba\x00\x11\x00\x17\x00\x1e\x11\x12\x39\xb8\x00\x11\x2f\xb8\x00\
-\x10\xd0\xb8\x00\x1a\xd0\xb8\x00\x1a\x2f\xb8\x00\x11\x10\xb9\x00\
-\x24\x00\x08\xf4\x30\x31\x05\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\
-\x1e\x02\x1d\x01\x21\x15\x14\x1e\x02\x33\x32\x36\x37\x17\x0e\x01\
-\x03\x22\x0e\x02\x1d\x01\x21\x35\x34\x2e\x02\x01\x35\x38\x59\x3f\
-\x22\x23\x3e\x57\x35\x34\x55\x3c\x20\xfe\x82\x16\x29\x3b\x24\x34\
-\x4c\x14\x3b\x17\x6b\x52\x21\x38\x29\x17\x01\x28\x15\x25\x35\x0c\
-\x26\x47\x63\x3d\x3e\x64\x47\x26\x26\x43\x5c\x37\x26\x18\x22\x3a\
-\x2a\x17\x30\x2a\x28\x34\x43\x01\xda\x18\x2a\x39\x22\x07\x0b\x22\
-\x38\x29\x16\x00\x01\x00\x49\x00\x00\x02\x20\x02\xe4\x00\x14\x00\
-\x72\xba\x00\x11\x00\x15\x00\x16\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1e\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x14\x2f\x1b\xb9\x00\x14\x00\x0e\x3e\x59\xb9\
-\x00\x00\x00\x08\xf4\xb8\x00\x04\x10\xb9\x00\x03\x00\x08\xf4\xb8\
-\x00\x09\x10\xb9\x00\x0c\x00\x08\xf4\xb8\x00\x04\x10\xb8\x00\x0d\
-\xd0\xb8\x00\x03\x10\xb8\x00\x10\xd0\xb8\x00\x00\x10\xb8\x00\x11\
-\xd0\x30\x31\x37\x33\x11\x23\x35\x33\x35\x34\x36\x3b\x01\x15\x23\
-\x15\x33\x15\x23\x11\x33\x15\x21\x53\xae\xb8\xb8\x37\x3b\xad\xcf\
-\xcf\xcf\xb8\xfe\x4a\x44\x01\x7c\x44\x6a\x34\x42\x44\x9c\x44\xfe\
-\x84\x44\x00\x00\x03\x00\x43\xff\x2c\x02\x31\x02\x4a\x00\x39\x00\
-\x46\x00\x54\x00\xc6\xba\x00\x03\x00\x55\x00\x56\x11\x12\x39\xb8\
-\x00\x03\x10\xb8\x00\x44\xd0\xb8\x00\x03\x10\xb8\x00\x47\xd0\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x19\x2f\x1b\xb9\x00\x19\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x21\x2f\x1b\xb9\x00\x21\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\
-\x10\x3e\x59\xb8\x00\x21\x10\xb9\x00\x20\x00\x08\xf4\xba\x00\x2b\
-\x00\x03\x00\x19\x11\x12\x39\xb8\x00\x2b\x2f\x41\x03\x00\x10\x00\
-\x2b\x00\x01\x72\x41\x05\x00\x60\x00\x2b\x00\x70\x00\x2b\x00\x02\
-\x5d\xba\x00\x3d\x00\x03\x00\x2b\x11\x12\x39\xb8\x00\x3d\x2f\x41\
-\x05\x00\x9f\x00\x3d\x00\xaf\x00\x3d\x00\x02\x71\x41\x03\x00\xd0\
-\x00\x3d\x00\x01\x5d\xb9\x00\x37\x00\x0b\xf4\xb8\x00\x03\x10\xb9\
-\x00\x43\x00\x08\xf4\xb8\x00\x2b\x10\xb9\x00\x47\x00\x08\xf4\xb8\
-\x00\x19\x10\xb9\x00\x4e\x00\x08\xf4\x30\x31\x05\x14\x06\x23\x22\
-\x26\x35\x34\x36\x37\x35\x2e\x01\x35\x34\x36\x37\x35\x2e\x01\x35\
-\x34\x3e\x02\x33\x32\x17\x35\x34\x36\x3b\x01\x15\x23\x15\x1e\x01\
-\x15\x14\x0e\x02\x23\x22\x26\x27\x0e\x03\x15\x14\x16\x3b\x01\x32\
-\x16\x07\x34\x26\x2b\x01\x06\x15\x14\x16\x3b\x01\x32\x36\x03\x32\
-\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x02\x31\x82\x82\
-\x7d\x6d\x2c\x28\x16\x18\x35\x28\x30\x35\x1c\x35\x4a\x2d\x3a\x2c\
-\x1c\x22\x5f\x74\x1c\x1e\x1d\x34\x4b\x2d\x0d\x18\x0c\x0c\x1a\x16\
-\x0e\x2e\x25\x72\x64\x5a\x4b\x32\x3e\xb3\x34\x36\x3f\x4e\x46\x4e\
-\xbd\x3c\x39\x39\x3c\x3c\x38\x38\x3b\x4e\x4b\x42\x3e\x2a\x2e\x0b\
-\x0c\x0b\x22\x1a\x28\x28\x0a\x04\x15\x52\x37\x27\x42\x2f\x1a\x15\
-\x09\x1e\x28\x46\x23\x18\x42\x29\x27\x42\x2f\x1a\x02\x02\x02\x09\
-\x0f\x14\x0d\x17\x0f\x4b\x43\x1f\x25\x15\x31\x22\x31\x2b\x01\x53\
-\x38\x2e\x1d\x2e\x37\x37\x2e\x1d\x2e\x38\x00\x00\x02\x00\x3c\xff\
-\x2c\x01\xf9\x02\x10\x00\x1f\x00\x31\x00\x87\xba\x00\x20\x00\x32\
-\x00\x33\x11\x12\x39\xb8\x00\x20\x10\xb8\x00\x0a\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x1e\x2f\x1b\xb9\x00\x1e\x00\x1a\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x1a\x2f\x1b\xb9\x00\x1a\x00\x1a\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x10\x2f\x1b\xb9\x00\x10\x00\x0e\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x10\
-\x3e\x59\xb9\x00\x0a\x00\x08\xf4\xb8\x00\x10\x10\xb9\x00\x20\x00\
-\x08\xf4\xb8\x00\x1a\x10\xb9\x00\x2b\x00\x08\xf4\xba\x00\x0d\x00\
-\x20\x00\x2b\x11\x12\x39\xba\x00\x1d\x00\x2b\x00\x20\x11\x12\x39\
-\x30\x31\x25\x14\x06\x23\x22\x26\x27\x37\x1e\x01\x33\x32\x3d\x01\
-\x23\x06\x23\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x17\x33\x35\x33\
-\x03\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\x06\x1d\x01\x14\x16\
-\x01\xf9\x76\x6d\x3f\x5b\x1f\x2f\x1a\x44\x2d\x92\x04\x32\x6d\x2f\
-\x4b\x34\x1c\x1c\x34\x4b\x2f\x6d\x32\x04\x50\xd4\x1b\x30\x24\x15\
-\x15\x24\x30\x1b\x46\x4d\x4d\x11\x6b\x7a\x27\x20\x37\x1b\x1d\x9a\
-\x56\x60\x25\x44\x61\x3d\x3d\x61\x44\x25\x60\x54\xfe\x45\x0e\x1b\
-\x27\x1a\xac\x1a\x27\x1b\x0e\x55\x46\x4a\x46\x55\x00\x00\x00\x00\
-\x03\x00\x43\xff\x2c\x02\x31\x02\x10\x00\x34\x00\x42\x00\x4f\x00\
-\xc2\xba\x00\x00\x00\x50\x00\x51\x11\x12\x39\xb8\x00\x35\xd0\xb8\
-\x00\x00\x10\xb8\x00\x4d\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x16\
-\x2f\x1b\xb9\x00\x16\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x19\x2f\x1b\xb9\x00\x19\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x00\x2f\x1b\xb9\x00\x00\x00\x10\x3e\x59\xb8\x00\x19\x10\xb9\
-\x00\x1a\x00\x08\xf4\xba\x00\x23\x00\x00\x00\x16\x11\x12\x39\xb8\
-\x00\x23\x2f\x41\x03\x00\x10\x00\x23\x00\x01\x72\x41\x05\x00\x60\
-\x00\x23\x00\x70\x00\x23\x00\x02\x5d\xba\x00\x46\x00\x00\x00\x23\
-\x11\x12\x39\xb8\x00\x46\x2f\x41\x05\x00\x9f\x00\x46\x00\xaf\x00\
-\x46\x00\x02\x71\x41\x03\x00\xd0\x00\x46\x00\x01\x5d\xb9\x00\x2f\
-\x00\x0b\xf4\xb8\x00\x23\x10\xb9\x00\x35\x00\x08\xf4\xb8\x00\x16\
-\x10\xb9\x00\x3c\x00\x08\xf4\xb8\x00\x00\x10\xb9\x00\x4d\x00\x08\
-\xf4\x30\x31\x05\x22\x26\x35\x34\x36\x37\x35\x2e\x01\x35\x34\x36\
-\x37\x35\x2e\x01\x35\x34\x3e\x02\x33\x32\x17\x33\x15\x23\x1e\x01\
-\x15\x14\x0e\x02\x23\x22\x26\x27\x0e\x03\x15\x14\x16\x3b\x01\x32\
-\x16\x15\x14\x06\x03\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\
-\x14\x16\x13\x34\x26\x2b\x01\x06\x15\x14\x16\x3b\x01\x32\x36\x01\
-\x2d\x7d\x6d\x2c\x28\x16\x18\x35\x28\x30\x35\x1c\x35\x4a\x2d\x2b\
-\x23\xb5\x5e\x13\x11\x1d\x34\x4b\x2d\x0d\x18\x0c\x0c\x1a\x16\x0e\
-\x2e\x25\x72\x64\x5a\x82\x86\x3c\x39\x39\x3c\x3c\x38\x38\xf9\x32\
-\x3e\xb3\x34\x36\x3f\x4e\x46\x4e\xd4\x42\x3e\x2a\x2e\x0b\x0c\x0b\
-\x22\x1a\x28\x28\x0a\x04\x15\x52\x37\x27\x42\x2f\x1a\x0c\x40\x14\
-\x35\x1d\x27\x42\x2f\x1a\x02\x02\x02\x09\x0f\x14\x0d\x17\x0f\x4b\
-\x3f\x4e\x4b\x01\xbe\x38\x2e\x1d\x2e\x37\x37\x2e\x1d\x2e\x38\xfe\
-\xd7\x1f\x25\x15\x31\x22\x31\x2b\x00\x00\x00\x00\x01\x00\x62\x00\
-\x00\x01\xfc\x02\xe4\x00\x18\x00\x6b\xba\x00\x11\x00\x19\x00\x1a\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\
-\x01\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\
-\x00\x08\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x17\x2f\x1b\
-\xb9\x00\x17\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\
-\x1b\xb9\x00\x0c\x00\x0e\x3e\x59\xb8\x00\x08\x10\xb9\x00\x11\x00\
-\x08\xf4\xba\x00\x02\x00\x11\x00\x17\x11\x12\x39\x7d\xb8\x00\x02\
-\x2f\x18\x30\x31\x13\x33\x11\x33\x3e\x03\x33\x32\x16\x15\x11\x23\
-\x11\x34\x26\x23\x22\x0e\x02\x15\x11\x23\x62\x50\x04\x08\x18\x23\
-\x30\x20\x51\x62\x50\x3e\x3c\x18\x2e\x24\x16\x50\x02\xe4\xfe\xcc\
-\x13\x23\x1a\x10\x67\x5e\xfe\xb5\x01\x3d\x47\x45\x0c\x18\x26\x19\
-\xfe\x9a\x00\x00\x02\x00\x6a\x00\x00\x02\x22\x02\xec\x00\x0d\x00\
-\x17\x00\x63\xba\x00\x0f\x00\x18\x00\x19\x11\x12\x39\xb8\x00\x0f\
-\x10\xb8\x00\x03\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x12\x2f\x1b\
-\xb9\x00\x12\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x17\x2f\
-\x1b\xb9\x00\x17\x00\x0e\x3e\x59\xb8\x00\x12\x10\xb9\x00\x00\x00\
-\x07\xf4\xb9\x00\x07\x00\x06\xf4\xb8\x00\x17\x10\xb9\x00\x0e\x00\
-\x08\xf4\xb8\x00\x12\x10\xb9\x00\x11\x00\x08\xf4\xb8\x00\x0e\x10\
-\xb8\x00\x14\xd0\x30\x31\x01\x22\x26\x3d\x01\x34\x36\x33\x32\x16\
-\x1d\x01\x14\x06\x01\x33\x11\x23\x35\x21\x11\x33\x15\x21\x01\x4c\
-\x23\x1c\x1c\x23\x23\x1c\x1c\xfe\xfb\xba\xba\x01\x0a\xae\xfe\x48\
-\x02\x76\x1d\x16\x10\x16\x1d\x1d\x16\x10\x16\x1d\xfd\xce\x01\x7c\
-\x44\xfe\x40\x44\x00\x00\x00\x00\x02\x00\x5d\xff\x38\x01\xc7\x02\
-\xec\x00\x0a\x00\x18\x00\x57\xba\x00\x09\x00\x19\x00\x1a\x11\x12\
-\x39\xb8\x00\x09\x10\xb8\x00\x0e\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x10\x3e\x59\xb9\x00\x00\x00\
-\x08\xf4\xb8\x00\x04\x10\xb9\x00\x03\x00\x08\xf4\xb8\x00\x04\x10\
-\xb9\x00\x0b\x00\x07\xf4\xb9\x00\x12\x00\x06\xf4\x30\x31\x17\x33\
-\x11\x21\x35\x21\x11\x14\x06\x2b\x01\x01\x22\x26\x3d\x01\x34\x36\
-\x33\x32\x16\x1d\x01\x14\x06\x66\xfa\xfe\xfd\x01\x53\x37\x3b\xd8\
-\x01\x22\x23\x1c\x1c\x23\x23\x1c\x1c\x84\x02\x44\x44\xfd\xaa\x34\
-\x42\x03\x3e\x1d\x16\x10\x16\x1d\x1d\x16\x10\x16\x1d\x00\x00\x00\
-\x01\x00\x69\x00\x00\x02\x3e\x02\xe4\x00\x0d\x00\x63\xba\x00\x04\
-\x00\x0e\x00\x0f\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\
-\x2f\x1b\xb9\x00\x00\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x05\x2f\x1b\xb9\x00\x05\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x09\x2f\x1b\xb9\x00\x09\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x0e\x3e\x59\xba\x00\x02\x00\
-\x05\x00\x0d\x11\x12\x39\xb8\x00\x02\x10\xb8\x00\x0b\xd0\x30\x31\
-\x13\x33\x11\x33\x3f\x01\x33\x07\x13\x23\x03\x07\x15\x23\x69\x50\
-\x04\x5a\xac\x62\xd6\xef\x63\xc9\x59\x50\x02\xe4\xfe\x2d\x55\x9e\
-\xca\xfe\xc6\x01\x0c\x51\xbb\x00\x01\x00\x50\x00\x00\x02\x08\x02\
-\xe4\x00\x09\x00\x47\xba\x00\x01\x00\x0a\x00\x0b\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1e\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x0e\
-\x3e\x59\xb9\x00\x00\x00\x08\xf4\xb8\x00\x04\x10\xb9\x00\x03\x00\
-\x08\xf4\xb8\x00\x00\x10\xb8\x00\x06\xd0\x30\x31\x37\x33\x11\x23\
-\x35\x21\x11\x33\x15\x21\x50\xb4\xb4\x01\x04\xb4\xfe\x48\x44\x02\
-\x5c\x44\xfd\x60\x44\x00\x00\x00\x01\x00\x36\x00\x00\x02\x22\x02\
-\x10\x00\x24\x00\xa7\xba\x00\x0a\x00\x25\x00\x26\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\
-\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\
-\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x1c\x2f\x1b\xb9\x00\
-\x1c\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x13\x2f\x1b\xb9\
-\x00\x13\x00\x0e\x3e\x59\xb8\x00\x07\x10\xb9\x00\x20\x00\x08\xf4\
-\xba\x00\x03\x00\x20\x00\x00\x11\x12\x39\x7d\xb8\x00\x03\x2f\x18\
-\xb8\x00\x0e\x10\xb9\x00\x17\x00\x08\xf4\xba\x00\x0a\x00\x17\x00\
-\x1c\x11\x12\x39\x7d\xb8\x00\x0a\x2f\x18\x30\x31\x33\x11\x33\x15\
-\x33\x3e\x01\x33\x32\x16\x17\x33\x3e\x01\x33\x32\x16\x15\x11\x23\
-\x11\x34\x26\x23\x22\x06\x15\x11\x23\x11\x34\x26\x23\x22\x06\x15\
-\x11\x36\x4a\x04\x0c\x2c\x2b\x2d\x2c\x05\x03\x0e\x34\x2e\x3f\x2b\
-\x4a\x1b\x24\x20\x28\x4a\x1b\x23\x20\x29\x02\x04\x3c\x1e\x2a\x2d\
-\x24\x23\x2e\x58\x52\xfe\x9a\x01\x59\x42\x33\x29\x2a\xfe\x85\x01\
-\x59\x42\x33\x29\x2a\xfe\x85\x00\x01\x00\x62\x00\x00\x01\xfc\x02\
-\x10\x00\x18\x00\x6b\xba\x00\x12\x00\x19\x00\x1a\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\
-\x00\x0e\x3e\x59\xb8\x00\x09\x10\xb9\x00\x12\x00\x08\xf4\xba\x00\
-\x03\x00\x12\x00\x00\x11\x12\x39\x7d\xb8\x00\x03\x2f\x18\x30\x31\
-\x33\x11\x33\x15\x33\x3e\x03\x33\x32\x16\x15\x11\x23\x11\x34\x26\
-\x23\x22\x0e\x02\x15\x11\x62\x50\x04\x08\x18\x23\x30\x20\x51\x62\
-\x50\x3e\x3c\x18\x2e\x24\x16\x02\x04\x54\x13\x23\x1a\x10\x67\x5e\
-\xfe\xb5\x01\x3d\x47\x45\x0c\x18\x26\x19\xfe\x9a\x00\x00\x00\x00\
-\x02\x00\x42\xff\xf4\x02\x16\x02\x10\x00\x13\x00\x21\x00\x43\xba\
-\x00\x00\x00\x22\x00\x23\x11\x12\x39\xb8\x00\x14\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1a\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\
-\xb9\x00\x14\x00\x08\xf4\xb8\x00\x0a\x10\xb9\x00\x1b\x00\x08\xf4\
-\x30\x31\x05\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\
-\x0e\x02\x27\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\
-\x01\x2c\x36\x57\x3d\x20\x20\x3d\x57\x36\x36\x57\x3d\x20\x20\x3d\
-\x57\x36\x43\x52\x52\x43\x43\x52\x52\x0c\x26\x47\x63\x3e\x3d\x64\
-\x47\x26\x26\x47\x64\x3d\x3e\x63\x47\x26\x45\x50\x54\x4a\x54\x50\
-\x50\x54\x4a\x54\x50\x00\x00\x00\x02\x00\x5f\xff\x38\x02\x1c\x02\
-\x10\x00\x10\x00\x22\x00\x81\xba\x00\x11\x00\x23\x00\x24\x11\x12\
-\x39\xb8\x00\x11\x10\xb8\x00\x0b\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x1a\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x10\x2f\x1b\xb9\x00\x10\x00\x10\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x0e\x3e\x59\xb8\x00\
-\x05\x10\xb9\x00\x18\x00\x08\xf4\xb8\x00\x0b\x10\xb9\x00\x11\x00\
-\x08\xf4\xba\x00\x02\x00\x18\x00\x11\x11\x12\x39\xba\x00\x0e\x00\
-\x11\x00\x18\x11\x12\x39\x30\x31\x13\x33\x15\x33\x36\x33\x32\x16\
-\x15\x14\x06\x23\x22\x27\x23\x11\x23\x13\x32\x36\x3d\x01\x34\x26\
-\x23\x22\x0e\x02\x1d\x01\x14\x1e\x02\x5f\x50\x04\x32\x6d\x5f\x6b\
-\x6b\x5f\x6d\x32\x04\x50\xd4\x46\x4d\x4d\x46\x1b\x30\x24\x15\x15\
-\x24\x30\x02\x04\x54\x60\x8e\x80\x80\x8e\x60\xfe\xe4\x01\x03\x55\
-\x46\x58\x46\x55\x0e\x1b\x27\x1a\xba\x1a\x27\x1b\x0e\x00\x00\x00\
-\x02\x00\x3c\xff\x38\x01\xf9\x02\x10\x00\x10\x00\x22\x00\x81\xba\
-\x00\x11\x00\x23\x00\x24\x11\x12\x39\xb8\x00\x11\x10\xb8\x00\x03\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\
-\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\
-\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\
-\x03\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x10\x2f\x1b\xb9\
-\x00\x10\x00\x10\x3e\x59\xb8\x00\x03\x10\xb9\x00\x11\x00\x08\xf4\
-\xb8\x00\x09\x10\xb9\x00\x1c\x00\x08\xf4\xba\x00\x00\x00\x11\x00\
-\x1c\x11\x12\x39\xba\x00\x0c\x00\x1c\x00\x11\x11\x12\x39\x30\x31\
-\x25\x23\x06\x23\x22\x26\x35\x34\x36\x33\x32\x17\x33\x35\x33\x11\
-\x23\x03\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\x06\x1d\x01\x14\
-\x16\x01\xa9\x04\x32\x6d\x5f\x6b\x6b\x5f\x6d\x32\x04\x50\x50\x84\
-\x1b\x30\x24\x15\x15\x24\x30\x1b\x46\x4d\x4d\x54\x60\x8e\x80\x80\
-\x8e\x60\x54\xfd\x34\x01\x03\x0e\x1b\x27\x1a\xba\x1a\x27\x1b\x0e\
-\x55\x46\x58\x46\x55\x00\x00\x00\x01\x00\x4d\x00\x00\x02\x2f\x02\
-\x04\x00\x14\x00\x72\xba\x00\x11\x00\x15\x00\x16\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x14\x2f\x1b\xb9\x00\x14\x00\
-\x0e\x3e\x59\xb9\x00\x00\x00\x08\xf4\xb8\x00\x04\x10\xb9\x00\x03\
-\x00\x08\xf4\xb8\x00\x0a\x10\xb9\x00\x0d\x00\x0b\xf4\xba\x00\x06\
-\x00\x0d\x00\x00\x11\x12\x39\x7d\xb8\x00\x06\x2f\x18\xb8\x00\x00\
-\x10\xb8\x00\x11\xd0\x30\x31\x37\x33\x11\x23\x35\x33\x15\x33\x3e\
-\x01\x3b\x01\x15\x23\x22\x06\x1d\x01\x33\x15\x21\x4d\x97\x97\xe7\
-\x05\x10\x59\x45\x48\x61\x45\x55\xc8\xfe\x51\x44\x01\x7c\x44\x82\
-\x3d\x45\x50\x50\x41\xdf\x44\x00\x01\x00\x43\xff\xf4\x02\x0c\x02\
-\x10\x00\x33\x00\x6b\xba\x00\x23\x00\x34\x00\x35\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x1a\x2f\x1b\xb9\x00\x1a\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb8\x00\x1a\x10\xb9\x00\x23\x00\x08\xf4\xba\x00\x10\x00\
-\x23\x00\x00\x11\x12\x39\xb8\x00\x00\x10\xb9\x00\x07\x00\x08\xf4\
-\xba\x00\x04\x00\x10\x00\x07\x11\x12\x39\xba\x00\x2b\x00\x07\x00\
-\x1a\x11\x12\x39\xba\x00\x1e\x00\x23\x00\x2b\x11\x12\x39\x30\x31\
-\x05\x22\x26\x27\x37\x1e\x01\x33\x32\x36\x35\x34\x2e\x02\x2f\x01\
-\x2e\x03\x35\x34\x3e\x02\x33\x32\x16\x17\x07\x2e\x03\x23\x22\x06\
-\x15\x14\x1e\x02\x1f\x01\x1e\x03\x15\x14\x06\x01\x32\x51\x75\x29\
-\x36\x25\x58\x3e\x3c\x4d\x0f\x1a\x20\x12\x51\x1b\x3f\x34\x23\x1f\
-\x38\x4c\x2d\x46\x67\x25\x34\x09\x1b\x27\x34\x22\x3d\x41\x0f\x1a\
-\x21\x11\x51\x1c\x3e\x34\x23\x77\x0c\x37\x2e\x2f\x27\x2a\x2b\x2e\
-\x14\x1b\x10\x09\x03\x0c\x04\x0e\x1f\x34\x2a\x27\x39\x27\x13\x2c\
-\x27\x31\x0b\x17\x13\x0c\x2a\x28\x14\x1b\x10\x09\x03\x0c\x04\x0e\
-\x1f\x34\x2a\x4d\x54\x00\x00\x00\x01\x00\x27\x00\x00\x02\x0e\x02\
-\xba\x00\x13\x00\x64\xba\x00\x11\x00\x14\x00\x15\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\
-\x0e\x3e\x59\xb8\x00\x06\x10\xb9\x00\x05\x00\x08\xf4\xb8\x00\x06\
-\x10\xb8\x00\x0d\xd0\xb8\x00\x05\x10\xb8\x00\x10\xd0\xb8\x00\x00\
-\x10\xb9\x00\x11\x00\x08\xf4\x30\x31\x21\x22\x26\x35\x11\x23\x35\
-\x33\x32\x36\x3d\x01\x33\x15\x33\x15\x23\x11\x33\x15\x01\x45\x3b\
-\x37\xac\x80\x1a\x15\x4d\xeb\xeb\xeb\x42\x34\x01\x4a\x44\x15\x1a\
-\x87\xb6\x44\xfe\x84\x44\x00\x00\x01\x00\x5c\xff\xf4\x01\xf6\x02\
-\x04\x00\x18\x00\x69\xba\x00\x0f\x00\x19\x00\x1a\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x15\x2f\x1b\xb9\x00\x15\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\xb9\x00\x18\
-\x00\x0e\x3e\x59\xb8\x00\x06\x10\xb9\x00\x0f\x00\x08\xf4\xba\x00\
-\x00\x00\x0f\x00\x0a\x11\x12\x39\xb8\x00\x00\x2f\x30\x31\x25\x23\
-\x0e\x03\x23\x22\x26\x35\x11\x33\x11\x14\x16\x33\x32\x3e\x02\x35\
-\x11\x33\x11\x23\x01\xa6\x04\x08\x18\x23\x30\x20\x51\x62\x50\x3e\
-\x3c\x18\x2e\x24\x16\x50\x50\x54\x13\x23\x1a\x10\x67\x5e\x01\x4b\
-\xfe\xc3\x47\x45\x0c\x18\x25\x1a\x01\x66\xfd\xfc\x00\x00\x00\x00\
-\x01\x00\x40\x00\x00\x02\x18\x02\x04\x00\x09\x00\x44\xba\x00\x04\
-\x00\x0a\x00\x0b\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x01\
-\x2f\x1b\xb9\x00\x01\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x08\x2f\x1b\xb9\x00\x08\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x05\xd0\x30\
-\x31\x33\x03\x33\x1f\x01\x33\x3f\x01\x33\x03\xf9\xb9\x51\x4a\x50\
-\x04\x50\x4a\x4f\xb9\x02\x04\xd8\xe9\xe9\xd8\xfd\xfc\x00\x00\x00\
-\x01\x00\x1e\x00\x00\x02\x3a\x02\x04\x00\x0f\x00\x7a\xba\x00\x0d\
-\x00\x10\x00\x11\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\
-\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x0e\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x0e\x3e\x59\xb8\x00\x0f\
-\x10\xb8\x00\x02\xd0\xb8\x00\x02\x2f\xb8\x00\x06\xd0\xb8\x00\x04\
-\x10\xb8\x00\x0d\xd0\x30\x31\x13\x33\x13\x33\x13\x33\x13\x33\x13\
-\x33\x03\x23\x03\x23\x03\x23\x1e\x47\x3b\x09\x58\x58\x58\x09\x3b\
-\x45\x4f\x68\x52\x08\x54\x68\x02\x04\xfe\x42\x01\xbe\xfe\x42\x01\
-\xbe\xfd\xfc\x01\xb0\xfe\x50\x00\x01\x00\x3d\x00\x00\x02\x1c\x02\
-\x04\x00\x11\x00\x77\xba\x00\x0e\x00\x12\x00\x13\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\
-\x00\x0e\x3e\x59\xba\x00\x05\x00\x02\x00\x00\x11\x12\x39\xba\x00\
-\x0e\x00\x08\x00\x0c\x11\x12\x39\xba\x00\x01\x00\x05\x00\x0e\x11\
-\x12\x39\xb8\x00\x01\x10\xb8\x00\x0a\xd0\x30\x31\x33\x13\x27\x33\
-\x1f\x01\x33\x3f\x01\x33\x07\x13\x23\x2f\x01\x23\x0f\x01\x3d\xc0\
-\xbb\x60\x4e\x3e\x04\x3c\x4d\x5c\xbd\xc2\x60\x57\x3b\x04\x39\x54\
-\x01\x06\xfe\x6d\x56\x56\x6d\xfd\xfe\xf9\x79\x52\x52\x79\x00\x00\
-\x01\x00\x35\xff\x38\x02\x23\x02\x04\x00\x11\x00\x58\xba\x00\x0f\
-\x00\x12\x00\x13\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0c\
-\x2f\x1b\xb9\x00\x0c\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x08\x2f\x1b\xb9\x00\x08\x00\x10\x3e\x59\xb9\x00\x09\x00\x08\
-\xf4\xba\x00\x0f\x00\x0c\x00\x08\x11\x12\x39\xb8\x00\x0f\x10\xb8\
-\x00\x0b\xd0\x30\x31\x01\x33\x01\x0e\x03\x2b\x01\x35\x33\x37\x03\
-\x33\x1f\x01\x33\x37\x01\xd3\x50\xff\x00\x09\x16\x1e\x2a\x1d\x4c\
-\x78\x3a\xd0\x52\x57\x4d\x04\x4d\x02\x04\xfd\x8b\x16\x21\x15\x0b\
-\x44\x8e\x01\xfa\xd8\xc4\xc4\x00\x01\x00\x55\x00\x00\x02\x03\x02\
-\x04\x00\x09\x00\x53\xba\x00\x02\x00\x0a\x00\x0b\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x0e\
-\x3e\x59\xb9\x00\x08\x00\x08\xf4\xb8\x00\x04\x10\xb9\x00\x03\x00\
-\x08\xf4\xba\x00\x01\x00\x08\x00\x03\x11\x12\x39\xba\x00\x06\x00\
-\x03\x00\x08\x11\x12\x39\x30\x31\x33\x35\x01\x21\x35\x21\x15\x01\
-\x21\x15\x55\x01\x4d\xfe\xbe\x01\x99\xfe\xb3\x01\x57\x4d\x01\x73\
-\x44\x4d\xfe\x8d\x44\x00\x00\x00\x02\x00\x1f\x00\x00\x02\x3a\x02\
-\xba\x00\x07\x00\x0b\x00\x64\xba\x00\x08\x00\x0c\x00\x0d\x11\x12\
-\x39\xb8\x00\x08\x10\xb8\x00\x05\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x05\x2f\x1b\xb9\x00\x05\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x0e\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xba\x00\x0a\
-\x00\x05\x00\x04\x11\x12\x39\xb8\x00\x0a\x2f\xb9\x00\x02\x00\x0b\
-\xf4\xb8\x00\x05\x10\xb8\x00\x09\xd0\x30\x31\x21\x27\x23\x07\x23\
-\x13\x33\x13\x01\x23\x03\x33\x01\xe1\x3b\xf5\x3b\x57\xd6\x6f\xd6\
-\xfe\xf6\x09\x62\xcd\xc7\xc7\x02\xba\xfd\x46\x02\x61\xfe\xaf\x00\
-\x03\x00\x58\x00\x00\x02\x1f\x02\xba\x00\x11\x00\x1b\x00\x25\x00\
-\x6d\xba\x00\x1c\x00\x26\x00\x27\x11\x12\x39\xb8\x00\x1c\x10\xb8\
-\x00\x01\xd0\xb8\x00\x1c\x10\xb8\x00\x12\xd0\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\x0e\x3e\x59\xb9\x00\
-\x1b\x00\x0b\xf4\xba\x00\x25\x00\x00\x00\x1b\x11\x12\x39\xb8\x00\
-\x25\x2f\xb9\x00\x1a\x00\x08\xf4\xba\x00\x07\x00\x25\x00\x1a\x11\
-\x12\x39\xb8\x00\x00\x10\xb9\x00\x24\x00\x0b\xf4\x30\x31\x13\x33\
-\x32\x16\x15\x14\x06\x07\x15\x1e\x01\x15\x14\x0e\x02\x23\x21\x37\
-\x32\x36\x3d\x01\x34\x26\x2b\x01\x15\x13\x32\x36\x3d\x01\x34\x26\
-\x2b\x01\x15\x58\xed\x5a\x66\x3d\x30\x3b\x4c\x1c\x33\x45\x28\xfe\
-\xf5\xf2\x3a\x42\x42\x3a\x9e\x90\x35\x3c\x3c\x35\x90\x02\xba\x62\
-\x52\x3f\x48\x0f\x03\x0e\x4d\x49\x2a\x4a\x36\x1f\x49\x34\x36\x29\
-\x35\x35\xfd\x01\x42\x2f\x30\x27\x30\x30\xe6\x00\x01\x00\x46\xff\
-\xf4\x02\x1a\x02\xc6\x00\x22\x00\x43\xba\x00\x00\x00\x23\x00\x24\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\
-\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\
-\x00\x00\x00\x0e\x3e\x59\xb8\x00\x06\x10\xb9\x00\x11\x00\x0b\xf4\
-\xb8\x00\x00\x10\xb9\x00\x18\x00\x0b\xf4\x30\x31\x05\x22\x26\x35\
-\x34\x36\x33\x32\x1e\x02\x17\x07\x2e\x03\x23\x22\x06\x1d\x01\x14\
-\x16\x33\x32\x3e\x02\x37\x17\x0e\x03\x01\x43\x80\x7d\x7d\x80\x30\
-\x46\x32\x22\x0d\x48\x09\x18\x21\x2d\x20\x53\x51\x51\x53\x20\x2d\
-\x21\x18\x09\x48\x0d\x22\x32\x46\x0c\xba\xaf\xaf\xba\x1a\x2c\x37\
-\x1c\x21\x17\x29\x1f\x12\x7e\x69\x72\x69\x7e\x12\x1f\x29\x17\x21\
-\x1d\x36\x2c\x1a\x00\x00\x00\x00\x02\x00\x5f\x00\x00\x02\x20\x02\
-\xba\x00\x08\x00\x12\x00\x4b\xba\x00\x07\x00\x13\x00\x14\x11\x12\
-\x39\xb8\x00\x07\x10\xb8\x00\x09\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x0e\x3e\x59\xb8\x00\x00\x10\
-\xb9\x00\x11\x00\x0b\xf4\xb8\x00\x08\x10\xb9\x00\x12\x00\x0b\xf4\
-\x30\x31\x13\x33\x32\x16\x15\x14\x06\x2b\x01\x37\x32\x36\x3d\x01\
-\x34\x26\x2b\x01\x11\x5f\xc3\x80\x7e\x7e\x80\xc3\xbf\x54\x55\x55\
-\x54\x6b\x02\xba\xb0\xad\xad\xb0\x49\x74\x6a\x6c\x6a\x74\xfd\xd8\
-\x00\x00\x00\x00\x01\x00\x5a\x00\x00\x02\x08\x02\xba\x00\x0b\x00\
-\x57\xba\x00\x09\x00\x0c\x00\x0d\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\
-\x01\x10\xb9\x00\x04\x00\x0b\xf4\xba\x00\x08\x00\x04\x00\x00\x11\
-\x12\x39\xb8\x00\x08\x2f\xb9\x00\x05\x00\x0b\xf4\xb8\x00\x00\x10\
-\xb9\x00\x09\x00\x0b\xf4\x30\x31\x33\x11\x21\x15\x21\x15\x21\x15\
-\x21\x15\x21\x15\x5a\x01\xae\xfe\xa6\x01\x4e\xfe\xb2\x01\x5a\x02\
-\xba\x49\xeb\x49\xf4\x49\x00\x00\x01\x00\x5a\x00\x00\x02\x12\x02\
-\xba\x00\x09\x00\x4d\xba\x00\x09\x00\x0a\x00\x0b\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb8\x00\x01\x10\xb9\x00\x04\x00\x0b\xf4\xba\x00\x08\x00\
-\x04\x00\x00\x11\x12\x39\xb8\x00\x08\x2f\xb9\x00\x05\x00\x0b\xf4\
-\x30\x31\x33\x11\x21\x15\x21\x15\x21\x15\x21\x11\x5a\x01\xb8\xfe\
-\x9c\x01\x46\xfe\xba\x02\xba\x49\xeb\x49\xfe\xc3\x00\x00\x00\x00\
-\x01\x00\x38\xff\xf4\x02\x0a\x02\xc6\x00\x29\x00\x76\xba\x00\x20\
-\x00\x2a\x00\x2b\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0c\
-\x2f\x1b\xb9\x00\x0c\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x06\x2f\x1b\xb9\x00\x06\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x29\x2f\x1b\xb9\x00\x29\x00\x0e\x3e\x59\xb8\x00\x0c\x10\xb9\
-\x00\x17\x00\x0b\xf4\xba\x00\x25\x00\x17\x00\x06\x11\x12\x39\xb8\
-\x00\x25\x2f\xb8\x00\x06\x10\xb9\x00\x20\x00\x0b\xf4\xba\x00\x00\
-\x00\x25\x00\x20\x11\x12\x39\xb8\x00\x25\x10\xb9\x00\x26\x00\x0b\
-\xf4\x30\x31\x25\x23\x0e\x03\x23\x22\x26\x35\x34\x36\x33\x32\x1e\
-\x02\x17\x07\x2e\x03\x23\x22\x06\x1d\x01\x14\x1e\x02\x33\x32\x36\
-\x3d\x01\x23\x35\x33\x11\x23\x01\xbc\x05\x09\x18\x25\x34\x24\x72\
-\x6f\x7a\x7f\x31\x48\x33\x22\x0b\x48\x09\x17\x21\x2e\x1f\x54\x4f\
-\x10\x25\x3b\x2b\x44\x4c\x93\xe1\x4e\x5d\x14\x26\x1d\x12\xb8\xac\
-\xb4\xba\x1a\x2c\x37\x1c\x21\x17\x29\x1f\x12\x7e\x69\x6c\x35\x57\
-\x40\x23\x52\x41\x48\x43\xfe\xa7\x00\x00\x00\x00\x01\x00\x50\x00\
-\x00\x02\x08\x02\xba\x00\x0b\x00\x80\xba\x00\x02\x00\x0c\x00\x0d\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\
-\x04\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\
-\x00\x08\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\x2f\x1b\
-\xb9\x00\x03\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\
-\x1b\xb9\x00\x0b\x00\x0e\x3e\x59\xba\x00\x01\x00\x04\x00\x03\x11\
-\x12\x39\xb8\x00\x01\x2f\x41\x03\x00\x8f\x00\x01\x00\x01\x71\x41\
-\x03\x00\x8f\x00\x01\x00\x01\x5d\x41\x03\x00\xbf\x00\x01\x00\x01\
-\x5d\xb9\x00\x06\x00\x0b\xf4\x30\x31\x01\x21\x11\x23\x11\x33\x11\
-\x21\x11\x33\x11\x23\x01\xb4\xfe\xf0\x54\x54\x01\x10\x54\x54\x01\
-\x3d\xfe\xc3\x02\xba\xfe\xcc\x01\x34\xfd\x46\x00\x01\x00\x54\x00\
-\x00\x02\x04\x02\xba\x00\x0b\x00\x4b\xba\x00\x02\x00\x0c\x00\x0d\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\
-\x05\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\
-\x00\x00\x00\x0e\x3e\x59\xb9\x00\x01\x00\x0b\xf4\xb8\x00\x05\x10\
-\xb9\x00\x04\x00\x0b\xf4\xb8\x00\x08\xd0\xb8\x00\x01\x10\xb8\x00\
-\x09\xd0\x30\x31\x33\x35\x33\x11\x23\x35\x21\x15\x23\x11\x33\x15\
-\x54\xae\xae\x01\xb0\xae\xae\x43\x02\x34\x43\x43\xfd\xcc\x43\x00\
-\x01\x00\x4a\xff\xf4\x01\xe0\x02\xba\x00\x15\x00\x3f\xba\x00\x0f\
-\x00\x16\x00\x17\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x15\
-\x2f\x1b\xb9\x00\x15\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x06\x2f\x1b\xb9\x00\x06\x00\x0e\x3e\x59\xb9\x00\x0f\x00\x0b\xf4\
-\xb8\x00\x15\x10\xb9\x00\x14\x00\x0b\xf4\x30\x31\x01\x11\x14\x0e\
-\x02\x23\x22\x26\x27\x37\x1e\x03\x33\x32\x36\x35\x11\x23\x35\x01\
-\xe0\x1e\x37\x4c\x2d\x50\x68\x10\x50\x05\x11\x1d\x2a\x1d\x39\x3f\
-\xfc\x02\xba\xfd\xfb\x2c\x48\x32\x1b\x53\x4b\x11\x15\x25\x1b\x10\
-\x41\x45\x01\xad\x49\x00\x00\x00\x01\x00\x55\x00\x00\x02\x42\x02\
-\xba\x00\x0d\x00\x63\xba\x00\x0b\x00\x0e\x00\x0f\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1c\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\
-\x00\x0e\x3e\x59\xba\x00\x06\x00\x04\x00\x03\x11\x12\x39\xb8\x00\
-\x06\x10\xb8\x00\x01\xd0\x30\x31\x01\x07\x15\x23\x11\x33\x11\x33\
-\x3f\x01\x33\x03\x13\x23\x01\x0d\x64\x54\x54\x03\x5c\xce\x65\xf5\
-\xfc\x62\x01\x56\x76\xe0\x02\xba\xfe\x94\x74\xf8\xfe\xda\xfe\x6c\
-\x00\x00\x00\x00\x01\x00\x78\x00\x00\x02\x17\x02\xba\x00\x05\x00\
-\x35\xba\x00\x03\x00\x06\x00\x07\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\
-\x03\x00\x0b\xf4\x30\x31\x33\x11\x33\x11\x21\x15\x78\x54\x01\x4b\
-\x02\xba\xfd\x8f\x49\x00\x00\x00\x01\x00\x44\x00\x00\x02\x14\x02\
-\xba\x00\x10\x00\x71\xba\x00\x03\x00\x11\x00\x12\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x1c\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x10\x2f\x1b\xb9\x00\x10\
-\x00\x0e\x3e\x59\xb8\x00\x0d\x10\xb8\x00\x02\xd0\xb8\x00\x08\x10\
-\xb8\x00\x03\xdc\xb8\x00\x09\x10\xb8\x00\x05\xd0\xb8\x00\x03\x10\
-\xb8\x00\x0b\xd0\x30\x31\x01\x35\x23\x0b\x01\x23\x15\x11\x23\x11\
-\x33\x13\x33\x13\x33\x11\x23\x01\xc7\x08\x93\x93\x08\x4d\x6c\x7b\
-\x06\x7b\x68\x4d\x01\x5e\xdd\xfe\x99\x01\x67\xdd\xfe\xa2\x02\xba\
-\xfe\xcc\x01\x34\xfd\x46\x00\x00\x01\x00\x50\x00\x00\x02\x08\x02\
-\xba\x00\x0b\x00\x61\xba\x00\x0b\x00\x0c\x00\x0d\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1c\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\
-\x00\x0e\x3e\x59\xb8\x00\x04\x10\xb8\x00\x00\xd0\xb8\x00\x0b\x10\
-\xb8\x00\x07\xd0\x30\x31\x13\x23\x11\x23\x11\x33\x13\x33\x11\x33\
-\x11\x23\xa3\x07\x4c\x77\xee\x07\x4c\x77\x02\x4f\xfd\xb1\x02\xba\
-\xfd\xb7\x02\x49\xfd\x46\x00\x00\x02\x00\x38\xff\xf4\x02\x20\x02\
-\xc6\x00\x13\x00\x29\x00\x43\xba\x00\x00\x00\x2a\x00\x2b\x11\x12\
-\x39\xb8\x00\x14\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\
-\xb9\x00\x0a\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\
-\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\x14\x00\x0b\xf4\xb8\x00\
-\x0a\x10\xb9\x00\x1f\x00\x0b\xf4\x30\x31\x05\x22\x2e\x02\x35\x34\
-\x3e\x02\x33\x32\x1e\x02\x15\x14\x0e\x02\x27\x32\x3e\x02\x3d\x01\
-\x34\x2e\x02\x23\x22\x0e\x02\x1d\x01\x14\x1e\x02\x01\x2c\x40\x5c\
-\x3c\x1c\x1c\x3c\x5c\x40\x40\x5c\x3c\x1c\x1c\x3c\x5c\x40\x2a\x3a\
-\x26\x11\x11\x26\x3a\x2a\x2a\x3a\x26\x11\x11\x26\x3a\x0c\x31\x5c\
-\x86\x56\x55\x87\x5c\x31\x31\x5c\x87\x55\x56\x86\x5c\x31\x49\x21\
-\x3c\x55\x35\x72\x34\x56\x3c\x21\x21\x3c\x56\x34\x72\x35\x55\x3c\
-\x21\x00\x00\x00\x02\x00\x5a\x00\x00\x02\x1f\x02\xba\x00\x0a\x00\
-\x14\x00\x55\xba\x00\x0c\x00\x15\x00\x16\x11\x12\x39\xb8\x00\x0c\
-\x10\xb8\x00\x08\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\
-\xb9\x00\x01\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\
-\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xba\x00\x0b\x00\x01\x00\x00\x11\
-\x12\x39\xb8\x00\x0b\x2f\xb9\x00\x09\x00\x0b\xf4\xb8\x00\x01\x10\
-\xb9\x00\x14\x00\x0b\xf4\x30\x31\x33\x11\x33\x32\x16\x15\x14\x06\
-\x2b\x01\x19\x01\x33\x32\x36\x3d\x01\x34\x26\x2b\x01\x5a\xfe\x61\
-\x66\x66\x61\xaa\xa8\x35\x3b\x3b\x35\xa8\x02\xba\x6a\x5f\x5f\x6a\
-\xfe\xd8\x01\x71\x35\x31\x34\x31\x35\x00\x00\x00\x02\x00\x38\xff\
-\x5c\x02\x20\x02\xc6\x00\x19\x00\x2f\x00\x61\xba\x00\x1a\x00\x30\
-\x00\x31\x11\x12\x39\xb8\x00\x1a\x10\xb8\x00\x0f\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x0e\x3e\x59\
-\xb8\x00\x18\xd0\xb8\x00\x18\x2f\xb9\x00\x01\x00\x0b\xf4\xb8\x00\
-\x05\x10\xb8\x00\x17\xd0\xb8\x00\x05\x10\xb9\x00\x1a\x00\x0b\xf4\
-\xb8\x00\x0f\x10\xb9\x00\x25\x00\x0b\xf4\x30\x31\x05\x23\x22\x26\
-\x3d\x01\x2e\x03\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x06\x07\
-\x15\x33\x27\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\x0e\x02\x1d\
-\x01\x14\x1e\x02\x01\xeb\x75\x3b\x37\x35\x4d\x32\x18\x1c\x3c\x5c\
-\x40\x40\x5c\x3c\x1c\x62\x6a\x97\xbf\x2a\x3a\x26\x11\x11\x26\x3a\
-\x2a\x2a\x3a\x26\x11\x11\x26\x3a\xa4\x42\x34\x25\x07\x37\x5b\x7f\
-\x4e\x55\x87\x5c\x31\x31\x5c\x87\x55\x9d\xbb\x0e\x57\x9d\x21\x3c\
-\x55\x35\x72\x34\x56\x3c\x21\x21\x3c\x56\x34\x72\x35\x55\x3c\x21\
-\x00\x00\x00\x00\x02\x00\x5a\x00\x00\x02\x25\x02\xba\x00\x0d\x00\
-\x17\x00\x70\xba\x00\x0c\x00\x18\x00\x19\x11\x12\x39\xb8\x00\x0c\
-\x10\xb8\x00\x0e\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\
-\xb9\x00\x02\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\
-\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\
-\x2f\x1b\xb9\x00\x0b\x00\x0e\x3e\x59\xba\x00\x17\x00\x02\x00\x01\
-\x11\x12\x39\xb8\x00\x17\x2f\xb9\x00\x0d\x00\x08\xf4\xba\x00\x09\
-\x00\x17\x00\x0d\x11\x12\x39\xb8\x00\x02\x10\xb9\x00\x16\x00\x0b\
-\xf4\x30\x31\x33\x23\x11\x33\x32\x16\x15\x14\x06\x07\x13\x23\x03\
-\x23\x37\x32\x36\x3d\x01\x34\x26\x2b\x01\x11\xae\x54\xfe\x61\x66\
-\x58\x54\xb2\x5e\xaa\x6f\xa8\x35\x3b\x3b\x35\xa8\x02\xba\x6a\x5f\
-\x55\x66\x08\xfe\xd2\x01\x2a\x47\x35\x31\x34\x31\x35\xff\x00\x00\
-\x01\x00\x2d\xff\xf4\x02\x1e\x02\xc6\x00\x2b\x00\x63\xba\x00\x07\
-\x00\x2c\x00\x2d\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x16\
-\x2f\x1b\xb9\x00\x16\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\x07\x00\x0b\xf4\
-\xb8\x00\x16\x10\xb9\x00\x1d\x00\x0b\xf4\xba\x00\x0e\x00\x1d\x00\
-\x00\x11\x12\x39\xb8\x00\x0e\x10\xb8\x00\x0d\xd0\xba\x00\x23\x00\
-\x16\x00\x07\x11\x12\x39\xb8\x00\x23\x10\xb8\x00\x24\xd0\x30\x31\
-\x05\x22\x26\x27\x37\x1e\x01\x33\x32\x36\x35\x34\x26\x2f\x01\x2e\
-\x03\x35\x34\x36\x33\x32\x16\x17\x07\x2e\x01\x23\x22\x06\x15\x14\
-\x16\x1f\x01\x1e\x03\x15\x14\x06\x01\x2a\x5e\x78\x27\x3d\x29\x5b\
-\x3f\x4c\x50\x3a\x48\x4e\x33\x45\x2a\x12\x7e\x6b\x54\x73\x23\x3b\
-\x1d\x52\x41\x47\x4c\x39\x4a\x4b\x33\x46\x2b\x12\x7f\x0c\x45\x36\
-\x32\x33\x32\x46\x3f\x33\x39\x0c\x0d\x09\x24\x33\x3d\x21\x60\x62\
-\x38\x33\x33\x26\x30\x3c\x3c\x2f\x3b\x0d\x0d\x09\x24\x32\x3e\x22\
-\x61\x6e\x00\x00\x01\x00\x19\x00\x00\x02\x3f\x02\xba\x00\x07\x00\
-\x3d\xba\x00\x02\x00\x08\x00\x09\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x0e\x3e\x59\xb8\x00\
-\x05\x10\xb9\x00\x04\x00\x0b\xf4\xb8\x00\x00\xd0\x30\x31\x01\x11\
-\x23\x11\x23\x35\x21\x15\x01\x56\x54\xe9\x02\x26\x02\x71\xfd\x8f\
-\x02\x71\x49\x49\x00\x00\x00\x00\x01\x00\x50\xff\xf4\x02\x08\x02\
-\xba\x00\x19\x00\x46\xba\x00\x13\x00\x1a\x00\x1b\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x19\x2f\x1b\xb9\x00\x19\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x1c\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\
-\x0e\x3e\x59\xb9\x00\x06\x00\x0b\xf4\x30\x31\x13\x11\x14\x1e\x02\
-\x33\x32\x3e\x02\x35\x11\x33\x11\x14\x0e\x02\x23\x22\x2e\x02\x35\
-\x11\xa4\x06\x1a\x37\x31\x31\x37\x1a\x06\x54\x0f\x2f\x57\x47\x47\
-\x57\x2f\x0f\x02\xba\xfe\x5d\x33\x50\x39\x1e\x1e\x39\x50\x33\x01\
-\xa3\xfe\x71\x4e\x74\x4e\x27\x27\x4e\x74\x4e\x01\x8f\x00\x00\x00\
-\x01\x00\x24\x00\x00\x02\x34\x02\xba\x00\x09\x00\x44\xba\x00\x04\
-\x00\x0a\x00\x0b\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x01\
-\x2f\x1b\xb9\x00\x01\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x07\x2f\x1b\xb9\x00\x07\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x04\xd0\x30\
-\x31\x33\x03\x33\x1b\x01\x33\x1b\x01\x33\x03\xf3\xcf\x59\x63\x4b\
-\x05\x4b\x63\x56\xcf\x02\xba\xfe\xa3\xfe\xf8\x01\x08\x01\x5d\xfd\
-\x46\x00\x00\x00\x01\x00\x23\x00\x00\x02\x35\x02\xba\x00\x11\x00\
-\x77\xba\x00\x10\x00\x12\x00\x13\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\x0e\x3e\x59\
-\xb8\x00\x00\x10\xb8\x00\x04\xd0\xba\x00\x06\x00\x01\x00\x00\x11\
-\x12\x39\xb8\x00\x06\x2f\xb8\x00\x04\x10\xb8\x00\x08\xd0\xb8\x00\
-\x06\x10\xb8\x00\x10\xd0\x30\x31\x33\x03\x33\x13\x17\x33\x13\x33\
-\x13\x33\x37\x13\x33\x03\x23\x03\x23\x03\x5a\x37\x4b\x1d\x0f\x08\
-\x5c\x5e\x5c\x08\x0f\x1d\x49\x37\x79\x55\x08\x55\x02\xba\xfe\x70\
-\xd3\x01\xad\xfe\x53\xd3\x01\x90\xfd\x46\x01\xa1\xfe\x5f\x00\x00\
-\x01\x00\x1a\x00\x00\x02\x3f\x02\xba\x00\x11\x00\x77\xba\x00\x04\
-\x00\x12\x00\x13\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x09\
-\x2f\x1b\xb9\x00\x09\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x0f\x2f\x1b\xb9\x00\x0f\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x07\x2f\x1b\xb9\x00\x07\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xba\x00\x04\x00\
-\x0f\x00\x01\x11\x12\x39\xba\x00\x0c\x00\x09\x00\x07\x11\x12\x39\
-\xba\x00\x08\x00\x0c\x00\x04\x11\x12\x39\xb8\x00\x08\x10\xb8\x00\
-\x11\xd0\x30\x31\x21\x23\x2f\x01\x23\x0f\x01\x23\x13\x03\x33\x1f\
-\x01\x33\x3f\x01\x33\x03\x02\x3f\x5f\x53\x5c\x04\x5f\x58\x5c\xe4\
-\xd7\x5f\x51\x57\x04\x56\x54\x5c\xd8\x8b\x98\x98\x8b\x01\x64\x01\
-\x56\x87\x8d\x8d\x87\xfe\xab\x00\x01\x00\x11\x00\x00\x02\x47\x02\
-\xba\x00\x0b\x00\x5a\xba\x00\x05\x00\x0c\x00\x0d\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1c\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\
-\x0e\x3e\x59\xba\x00\x05\x00\x02\x00\x00\x11\x12\x39\xb8\x00\x05\
-\x2f\xb8\x00\x01\xd0\xb8\x00\x05\x10\xb8\x00\x0a\xd0\x30\x31\x21\
-\x11\x03\x33\x1f\x01\x33\x3f\x01\x33\x03\x11\x01\x02\xf1\x60\x64\
-\x55\x04\x57\x64\x5e\xf1\x01\x12\x01\xa8\xb6\x9f\x9f\xb6\xfe\x58\
-\xfe\xee\x00\x00\x01\x00\x30\x00\x00\x02\x28\x02\xba\x00\x09\x00\
-\x53\xba\x00\x03\x00\x0a\x00\x0b\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xb9\x00\
-\x08\x00\x0b\xf4\xb8\x00\x05\x10\xb9\x00\x04\x00\x0b\xf4\xba\x00\
-\x07\x00\x04\x00\x08\x11\x12\x39\xba\x00\x02\x00\x08\x00\x07\x11\
-\x12\x39\x30\x31\x29\x01\x35\x01\x21\x35\x21\x15\x01\x21\x02\x28\
-\xfe\x08\x01\x8b\xfe\x86\x01\xd6\xfe\x74\x01\x9d\x4b\x02\x26\x49\
-\x4b\xfd\xda\x00\x03\x00\x38\xff\xf4\x02\x20\x02\xc6\x00\x13\x00\
-\x29\x00\x37\x00\x5f\xba\x00\x00\x00\x38\x00\x39\x11\x12\x39\xb8\
-\x00\x14\xd0\xb8\x00\x00\x10\xb8\x00\x2a\xd0\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\
-\x14\x00\x0b\xf4\xb8\x00\x0a\x10\xb9\x00\x1f\x00\x0b\xf4\xba\x00\
-\x2a\x00\x1f\x00\x00\x11\x12\x39\xb8\x00\x2a\x2f\xb9\x00\x31\x00\
-\x06\xf4\x30\x31\x05\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\
-\x15\x14\x0e\x02\x27\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\x0e\
-\x02\x1d\x01\x14\x1e\x02\x37\x22\x26\x3d\x01\x34\x36\x33\x32\x16\
-\x1d\x01\x14\x06\x01\x2c\x40\x5c\x3c\x1c\x1c\x3c\x5c\x40\x40\x5c\
-\x3c\x1c\x1c\x3c\x5c\x40\x2a\x3c\x25\x12\x12\x25\x3c\x2a\x2a\x3c\
-\x25\x12\x12\x25\x3c\x2a\x23\x1b\x1b\x23\x23\x1b\x1b\x0c\x31\x5c\
-\x86\x56\x55\x87\x5c\x31\x31\x5c\x87\x55\x56\x86\x5c\x31\x49\x21\
-\x3c\x55\x35\x72\x34\x56\x3c\x21\x21\x3c\x56\x34\x72\x35\x55\x3c\
-\x21\xe5\x1c\x14\x16\x14\x1c\x1c\x14\x16\x14\x1c\x00\x00\x00\x00\
-\x03\x00\x38\xff\xf4\x02\x20\x02\xc6\x00\x13\x00\x20\x00\x2d\x00\
-\x77\xba\x00\x00\x00\x2e\x00\x2f\x11\x12\x39\xb8\x00\x14\xd0\xb8\
-\x00\x00\x10\xb8\x00\x21\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\
-\x2f\x1b\xb9\x00\x0a\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x0a\x10\xb9\x00\
-\x14\x00\x0b\xf4\xb8\x00\x00\x10\xb9\x00\x21\x00\x0b\xf4\xba\x00\
-\x1d\x00\x0a\x00\x21\x11\x12\x39\xba\x00\x1e\x00\x0a\x00\x21\x11\
-\x12\x39\xba\x00\x2a\x00\x14\x00\x00\x11\x12\x39\xba\x00\x2b\x00\
-\x00\x00\x14\x11\x12\x39\x30\x31\x05\x22\x2e\x02\x35\x34\x3e\x02\
-\x33\x32\x1e\x02\x15\x14\x0e\x02\x03\x22\x0e\x02\x1d\x01\x14\x16\
-\x17\x01\x2e\x01\x03\x32\x3e\x02\x3d\x01\x34\x26\x27\x01\x1e\x01\
-\x01\x2c\x40\x5c\x3c\x1c\x1c\x3c\x5c\x40\x40\x5c\x3c\x1c\x1c\x3c\
-\x5c\x40\x2a\x3c\x25\x12\x02\x02\x01\x21\x11\x43\x34\x2a\x3c\x25\
-\x12\x02\x02\xfe\xdf\x11\x43\x0c\x31\x5c\x86\x56\x55\x87\x5c\x31\
-\x31\x5c\x87\x55\x56\x86\x5c\x31\x02\x89\x21\x3c\x56\x34\x72\x11\
-\x21\x0f\x01\x3c\x2d\x31\xfd\xc0\x21\x3c\x55\x35\x72\x11\x21\x0f\
-\xfe\xc4\x2d\x31\x00\x00\x00\xff\xff\x00\x38\xff\xf4\x02\x20\x02\
-\xc6\x02\x06\x00\x2f\x00\x00\x00\x01\x00\x35\x00\x00\x02\x29\x02\
-\xba\x00\x0b\x00\x5b\xba\x00\x02\x00\x0c\x00\x0d\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb9\x00\x01\x00\x0b\xf4\xb8\x00\x08\x10\xb9\x00\x04\x00\
-\x0b\xf4\xba\x00\x06\x00\x04\x00\x01\x11\x12\x39\xb8\x00\x06\x10\
-\xb9\x00\x05\x00\x08\xf4\xb8\x00\x01\x10\xb8\x00\x09\xd0\x30\x31\
-\x33\x35\x33\x11\x23\x07\x27\x37\x33\x11\x33\x15\x55\xc8\x07\xb0\
-\x31\xb9\x83\xb8\x49\x02\x33\xa4\x35\xad\xfd\x8f\x49\x00\x00\x00\
-\x01\x00\x41\x00\x00\x02\x19\x02\xc6\x00\x1f\x00\x53\xba\x00\x03\
-\x00\x20\x00\x21\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x13\
-\x2f\x1b\xb9\x00\x13\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xb9\x00\x1e\x00\x0b\xf4\
-\xba\x00\x03\x00\x13\x00\x1e\x11\x12\x39\xb8\x00\x13\x10\xb9\x00\
-\x0a\x00\x0b\xf4\xba\x00\x1d\x00\x0a\x00\x01\x11\x12\x39\x30\x31\
-\x29\x01\x35\x37\x3e\x01\x3d\x01\x34\x26\x23\x22\x06\x07\x27\x3e\
-\x03\x33\x32\x1e\x02\x15\x14\x0e\x02\x0f\x01\x21\x02\x19\xfe\x2e\
-\xe9\x33\x42\x42\x41\x40\x45\x11\x4b\x0a\x23\x36\x4d\x33\x34\x51\
-\x37\x1d\x17\x29\x39\x23\xc3\x01\x7b\x56\xd2\x2e\x61\x36\x0c\x3f\
-\x45\x41\x36\x1c\x1f\x3b\x2e\x1c\x1e\x36\x4a\x2c\x28\x46\x40\x3d\
-\x1e\xaa\x00\x00\x01\x00\x30\xff\xf4\x02\x06\x02\xc6\x00\x39\x00\
-\x61\xba\x00\x10\x00\x3a\x00\x3b\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x10\x2f\x1b\xb9\x00\x10\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x25\x2f\x1b\xb9\x00\x25\x00\x0e\x3e\x59\xb8\x00\
-\x10\x10\xb9\x00\x07\x00\x0b\xf4\xba\x00\x38\x00\x10\x00\x25\x11\
-\x12\x39\xb8\x00\x38\x2f\xb9\x00\x39\x00\x0b\xf4\xba\x00\x1a\x00\
-\x39\x00\x38\x11\x12\x39\xb8\x00\x25\x10\xb9\x00\x30\x00\x0b\xf4\
-\x30\x31\x01\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x07\x27\x3e\x03\
-\x33\x32\x1e\x02\x15\x14\x0e\x02\x07\x15\x1e\x03\x15\x14\x0e\x02\
-\x23\x22\x2e\x02\x27\x37\x1e\x03\x33\x32\x36\x3d\x01\x34\x26\x2b\
-\x01\x35\x01\x0e\x49\x49\x47\x39\x38\x45\x16\x3f\x0d\x26\x33\x43\
-\x2b\x2d\x4e\x3a\x21\x15\x25\x32\x1c\x1d\x36\x2a\x19\x23\x3f\x59\
-\x36\x2e\x47\x37\x29\x10\x3f\x0e\x1e\x27\x32\x21\x4a\x4f\x4d\x4d\
-\x53\x01\x92\x41\x33\x07\x38\x38\x31\x28\x30\x15\x29\x20\x14\x17\
-\x2d\x42\x2a\x22\x36\x28\x1c\x07\x04\x06\x1b\x2b\x3d\x27\x2d\x4b\
-\x35\x1e\x14\x22\x2a\x17\x30\x15\x22\x19\x0e\x44\x3f\x08\x3e\x44\
-\x48\x00\x00\x00\x02\x00\x22\x00\x00\x02\x32\x02\xba\x00\x0a\x00\
-\x0e\x00\x5f\xba\x00\x04\x00\x0f\x00\x10\x11\x12\x39\xb8\x00\x04\
-\x10\xb8\x00\x0e\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\
-\xb9\x00\x05\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\
-\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xba\x00\x01\x00\x05\x00\x00\x11\
-\x12\x39\xb8\x00\x01\x2f\xb9\x00\x0c\x00\x0b\xf4\xb8\x00\x06\xd0\
-\xb8\x00\x01\x10\xb8\x00\x09\xd0\xb8\x00\x05\x10\xb8\x00\x0d\xd0\
-\x30\x31\x21\x35\x21\x35\x01\x33\x11\x33\x15\x23\x15\x25\x21\x11\
-\x23\x01\x7a\xfe\xa8\x01\x2e\x7a\x68\x68\xfe\xa3\x01\x0d\x04\x89\
-\x4a\x01\xe7\xfe\x14\x45\x89\xce\x01\xab\x00\x00\x01\x00\x49\xff\
-\xf4\x02\x15\x02\xba\x00\x28\x00\x57\xba\x00\x1b\x00\x29\x00\x2a\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x27\x2f\x1b\xb9\x00\
-\x27\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x10\x2f\x1b\xb9\
-\x00\x10\x00\x0e\x3e\x59\xb8\x00\x27\x10\xb9\x00\x01\x00\x0b\xf4\
-\xba\x00\x22\x00\x10\x00\x27\x11\x12\x39\xb8\x00\x22\x2f\xb9\x00\
-\x06\x00\x0b\xf4\xb8\x00\x10\x10\xb9\x00\x1b\x00\x0b\xf4\x30\x31\
-\x01\x21\x03\x33\x3e\x01\x33\x32\x1e\x02\x15\x14\x0e\x02\x23\x22\
-\x2e\x02\x27\x37\x1e\x03\x33\x32\x36\x3d\x01\x34\x26\x23\x22\x06\
-\x07\x27\x13\x21\x01\xf5\xfe\xc8\x14\x07\x1a\x40\x38\x2e\x4d\x38\
-\x20\x20\x3e\x58\x38\x2c\x45\x35\x28\x10\x3f\x0e\x1d\x26\x30\x20\
-\x48\x4d\x4e\x49\x32\x37\x17\x47\x19\x01\x7c\x02\x71\xfe\xf5\x23\
-\x29\x1d\x38\x4f\x33\x33\x55\x3d\x22\x14\x22\x2a\x17\x30\x15\x22\
-\x19\x0e\x4e\x45\x08\x45\x4e\x22\x19\x0a\x01\x80\x00\x00\x00\x00\
-\x02\x00\x40\xff\xf4\x02\x18\x02\xba\x00\x1d\x00\x2b\x00\x67\xba\
-\x00\x1e\x00\x2c\x00\x2d\x11\x12\x39\xb8\x00\x1e\x10\xb8\x00\x00\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\
-\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\
-\x00\x0e\x3e\x59\xba\x00\x25\x00\x0a\x00\x00\x11\x12\x39\xb8\x00\
-\x25\x2f\xb8\x00\x00\x10\xb9\x00\x1e\x00\x0b\xf4\xba\x00\x11\x00\
-\x25\x00\x1e\x11\x12\x39\xb8\x00\x11\x2f\xb8\x00\x25\x10\xb9\x00\
-\x14\x00\x0b\xf4\x30\x31\x05\x22\x2e\x02\x35\x34\x3e\x02\x37\x33\
-\x0e\x03\x07\x17\x3e\x01\x33\x32\x1e\x02\x15\x14\x0e\x02\x27\x32\
-\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x01\x2d\x37\x58\
-\x3d\x21\x2f\x49\x5a\x2b\x6c\x39\x59\x44\x2e\x0f\x05\x19\x52\x41\
-\x2e\x4c\x38\x1f\x22\x3d\x57\x36\x48\x4f\x4f\x48\x48\x4f\x4f\x0c\
-\x25\x45\x64\x3e\x4e\x89\x71\x57\x1b\x29\x4e\x55\x61\x3d\x02\x2b\
-\x39\x1e\x38\x50\x31\x33\x55\x3d\x22\x47\x4e\x47\x08\x47\x4e\x4e\
-\x47\x08\x47\x4e\x00\x00\x00\x00\x01\x00\x41\x00\x00\x02\x13\x02\
-\xba\x00\x08\x00\x47\xba\x00\x08\x00\x09\x00\x0a\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb8\x00\x05\x10\xb9\x00\x02\x00\x0b\xf4\xba\x00\x04\x00\
-\x00\x00\x02\x11\x12\x39\xb8\x00\x04\x2f\x30\x31\x33\x01\x21\x15\
-\x23\x35\x21\x15\x01\xad\x01\x11\xfe\xce\x4b\x01\xd2\xfe\xf4\x02\
-\x72\x82\xca\x4a\xfd\x90\x00\x00\x03\x00\x37\xff\xf4\x02\x21\x02\
-\xc6\x00\x1d\x00\x2b\x00\x39\x00\x80\xba\x00\x00\x00\x3a\x00\x3b\
-\x11\x12\x39\xb8\x00\x1e\xd0\xb8\x00\x00\x10\xb8\x00\x2c\xd0\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb8\x00\x0f\x10\xb9\x00\x33\x00\x0b\xf4\xb8\x00\x00\x10\
-\xb9\x00\x1e\x00\x0b\xf4\xba\x00\x25\x00\x33\x00\x1e\x11\x12\x39\
-\xb8\x00\x25\x2f\x41\x03\x00\xe0\x00\x25\x00\x01\x5d\xb9\x00\x2c\
-\x00\x0b\xf4\xba\x00\x08\x00\x2c\x00\x25\x11\x12\x39\xba\x00\x16\
-\x00\x2c\x00\x25\x11\x12\x39\x30\x31\x05\x22\x2e\x02\x35\x34\x36\
-\x37\x35\x2e\x01\x35\x34\x36\x33\x32\x16\x15\x14\x06\x07\x15\x1e\
-\x01\x15\x14\x0e\x02\x27\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\
-\x01\x14\x16\x13\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\
-\x16\x01\x2c\x3d\x5c\x3d\x1f\x4e\x40\x38\x41\x76\x6a\x6a\x76\x41\
-\x38\x40\x4e\x1f\x3e\x5b\x3d\x4a\x54\x53\x4b\x4b\x53\x54\x4a\x44\
-\x47\x49\x42\x42\x49\x47\x0c\x1f\x36\x4a\x2b\x48\x54\x11\x08\x13\
-\x55\x3c\x50\x5f\x5f\x50\x3c\x55\x13\x08\x11\x54\x48\x2b\x4a\x36\
-\x1f\x47\x42\x3c\x16\x3c\x42\x42\x3c\x16\x3c\x42\x01\x56\x3a\x36\
-\x0e\x36\x3a\x3a\x36\x0e\x36\x3a\x00\x00\x00\x00\x02\x00\x40\x00\
-\x00\x02\x18\x02\xc6\x00\x1d\x00\x2b\x00\x67\xba\x00\x1e\x00\x2c\
-\x00\x2d\x11\x12\x39\xb8\x00\x1e\x10\xb8\x00\x19\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x19\x2f\x1b\xb9\x00\x19\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x0e\x3e\x59\
-\xb8\x00\x19\x10\xb9\x00\x25\x00\x0b\xf4\xba\x00\x1e\x00\x19\x00\
-\x05\x11\x12\x39\xb8\x00\x1e\x2f\xba\x00\x0c\x00\x25\x00\x1e\x11\
-\x12\x39\xb8\x00\x0c\x2f\xb8\x00\x1e\x10\xb9\x00\x0f\x00\x0b\xf4\
-\x30\x31\x01\x14\x0e\x02\x07\x23\x3e\x03\x37\x27\x0e\x01\x23\x22\
-\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x07\x32\x36\x3d\x01\x34\
-\x26\x23\x22\x06\x1d\x01\x14\x16\x02\x18\x2f\x4a\x59\x2b\x6c\x39\
-\x59\x44\x2e\x0f\x05\x1a\x51\x41\x2e\x4d\x37\x1f\x21\x3e\x57\x35\
-\x37\x58\x3d\x21\xec\x48\x4f\x4f\x48\x48\x4f\x4f\x01\xba\x4e\x89\
-\x71\x57\x1b\x29\x4e\x55\x61\x3d\x02\x2b\x39\x1e\x38\x4f\x32\x33\
-\x55\x3d\x22\x25\x45\x64\xab\x4e\x47\x08\x47\x4e\x4e\x47\x08\x47\
-\x4e\x00\x00\x00\x02\x00\x19\xff\xf4\x02\x3c\x02\xc6\x00\x38\x00\
-\x43\x00\xb6\xba\x00\x25\x00\x44\x00\x45\x11\x12\x39\xb8\x00\x25\
-\x10\xb8\x00\x39\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x12\x2f\x1b\
-\xb9\x00\x12\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\
-\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x34\
-\x2f\x1b\xb9\x00\x34\x00\x0e\x3e\x59\xb8\x00\x00\x10\xb9\x00\x39\
-\x00\x08\xf4\xba\x00\x24\x00\x12\x00\x39\x11\x12\x39\xb8\x00\x12\
-\x10\xb9\x00\x1b\x00\x08\xf4\xba\x00\x3d\x00\x1b\x00\x00\x11\x12\
-\x39\xba\x00\x0a\x00\x24\x00\x3d\x11\x12\x39\xba\x00\x26\x00\x12\
-\x00\x39\x11\x12\x39\xba\x00\x2d\x00\x12\x00\x00\x11\x12\x39\xb8\
-\x00\x2d\x2f\xb9\x00\x2b\x00\x08\xf4\xba\x00\x35\x00\x1b\x00\x00\
-\x11\x12\x39\xba\x00\x32\x00\x26\x00\x35\x11\x12\x39\xba\x00\x3c\
-\x00\x26\x00\x35\x11\x12\x39\x30\x31\x17\x22\x2e\x02\x35\x34\x3e\
-\x02\x37\x2e\x01\x35\x34\x3e\x02\x33\x32\x1e\x02\x17\x07\x2e\x01\
-\x23\x22\x06\x1d\x01\x14\x1e\x02\x1f\x02\x33\x3e\x01\x37\x33\x15\
-\x23\x0e\x03\x07\x17\x23\x27\x23\x0e\x01\x27\x32\x36\x37\x27\x0e\
-\x01\x1d\x01\x14\x16\xd9\x2e\x47\x31\x1a\x0c\x1e\x31\x26\x1c\x25\
-\x1d\x31\x42\x25\x21\x37\x2a\x1d\x07\x42\x0d\x34\x27\x2d\x35\x08\
-\x11\x1b\x13\x5a\x49\x05\x07\x04\x02\x8d\x4b\x03\x06\x08\x0a\x09\
-\x7a\x5f\x57\x05\x0e\x56\x2f\x2b\x42\x13\xae\x2e\x26\x48\x0c\x1e\
-\x35\x46\x28\x1a\x38\x35\x31\x13\x24\x4c\x2d\x26\x3e\x2d\x18\x13\
-\x1e\x26\x13\x22\x1f\x29\x37\x2b\x08\x10\x1e\x21\x26\x18\x6f\x5a\
-\x27\x64\x30\x43\x18\x2a\x28\x29\x17\x90\x67\x34\x3f\x47\x24\x20\
-\xd2\x1d\x49\x2b\x0f\x36\x40\x00\x02\x00\x3e\xff\x90\x02\x0d\x02\
-\xc6\x00\x31\x00\x3f\x00\x86\xba\x00\x0b\x00\x40\x00\x41\x11\x12\
-\x39\xb8\x00\x0b\x10\xb8\x00\x3d\xd0\x00\xb8\x00\x41\x2f\xb8\x00\
-\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x1c\x3e\x59\xb8\
-\x00\x41\x10\xb8\x00\x01\xdc\xba\x00\x11\x00\x0b\x00\x41\x11\x12\
-\x39\xb8\x00\x11\x2f\xb8\x00\x17\xd0\xb9\x00\x32\x00\x08\xf4\xba\
-\x00\x1d\x00\x17\x00\x0b\x11\x12\x39\xb8\x00\x1d\x2f\xb9\x00\x39\
-\x00\x08\xf4\xba\x00\x13\x00\x32\x00\x39\x11\x12\x39\xba\x00\x22\
-\x00\x39\x00\x32\x11\x12\x39\xb8\x00\x0b\x10\xb9\x00\x27\x00\x08\
-\xf4\xb8\x00\x01\x10\xb9\x00\x30\x00\x08\xf4\x30\x31\x05\x23\x22\
-\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x11\x23\x35\x23\x0e\
-\x01\x23\x22\x26\x35\x34\x36\x33\x32\x1e\x02\x17\x33\x35\x34\x26\
-\x23\x22\x06\x1d\x01\x14\x1e\x02\x3b\x01\x27\x32\x36\x3d\x01\x34\
-\x26\x23\x22\x06\x1d\x01\x14\x16\x01\xc6\x7b\x4c\x67\x3f\x1b\x1f\
-\x3c\x59\x3b\x3c\x55\x36\x19\x47\x05\x0a\x2e\x2c\x3d\x48\x48\x3d\
-\x16\x21\x18\x10\x05\x05\x47\x50\x59\x4d\x10\x2b\x4b\x3c\x7b\x4f\
-\x24\x2b\x2b\x24\x2a\x2b\x2b\x70\x33\x67\x9a\x68\x74\x9d\x60\x29\
-\x26\x42\x5b\x34\xfe\x8c\x39\x1a\x2b\x67\x6f\x6f\x68\x0c\x14\x18\
-\x0d\x18\x55\x62\x89\x97\x81\x3a\x65\x4b\x2b\xbb\x28\x26\x99\x26\
-\x28\x39\x43\x3d\x43\x39\x00\x00\x01\x00\x9b\x01\x06\x01\xbd\x01\
-\x5a\x00\x03\x00\x17\xba\x00\x00\x00\x04\x00\x05\x11\x12\x39\x00\
-\xbb\x00\x01\x00\x0b\x00\x00\x00\x04\x2b\x30\x31\x13\x35\x21\x15\
-\x9b\x01\x22\x01\x06\x54\x54\xff\xff\x00\x9b\x01\x06\x01\xbd\x01\
-\x5a\x02\x06\x00\x49\x00\x00\x00\x01\x00\x3c\x01\x0b\x02\x1c\x01\
-\x55\x00\x03\x00\x17\xba\x00\x00\x00\x04\x00\x05\x11\x12\x39\x00\
-\xbb\x00\x01\x00\x0b\x00\x00\x00\x04\x2b\x30\x31\x13\x35\x21\x15\
-\x3c\x01\xe0\x01\x0b\x4a\x4a\x00\x01\x00\x00\x01\x0b\x02\x58\x01\
-\x55\x00\x03\x00\x0d\x00\xbb\x00\x01\x00\x0b\x00\x00\x00\x04\x2b\
-\x30\x31\x11\x35\x21\x15\x02\x58\x01\x0b\x4a\x4a\x00\x00\x00\x00\
-\x01\x00\x3c\xff\x57\x02\x1c\xff\xa1\x00\x03\x00\x17\xba\x00\x01\
-\x00\x04\x00\x05\x11\x12\x39\x00\xbb\x00\x01\x00\x0b\x00\x00\x00\
-\x04\x2b\x30\x31\x17\x35\x21\x15\x3c\x01\xe0\xa9\x4a\x4a\x00\x00\
-\x01\x00\xe2\xff\xf7\x01\x76\x00\x81\x00\x0d\x00\x24\xba\x00\x00\
-\x00\x0e\x00\x0f\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\
-\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\x07\x00\x09\xf4\x30\
-\x31\x05\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x01\
-\x2c\x29\x21\x21\x29\x29\x21\x21\x09\x22\x1a\x12\x1a\x22\x22\x1a\
-\x12\x1a\x22\x00\x03\x00\x2c\xff\xfc\x02\x2c\x00\x7f\x00\x0d\x00\
-\x1b\x00\x29\x00\x64\xba\x00\x0e\x00\x2a\x00\x2b\x11\x12\x39\xb8\
-\x00\x0e\x10\xb8\x00\x0b\xd0\xb8\x00\x0e\x10\xb8\x00\x1f\xd0\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\x0e\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x1c\x2f\x1b\xb9\x00\x1c\x00\
-\x0e\x3e\x59\xb8\x00\x00\x10\xb8\x00\x07\xdc\xb8\x00\x15\xd0\xb8\
-\x00\x07\x10\xb8\x00\x23\xd0\x30\x31\x17\x22\x26\x3d\x01\x34\x36\
-\x33\x32\x16\x1d\x01\x14\x06\x33\x22\x26\x3d\x01\x34\x36\x33\x32\
-\x16\x1d\x01\x14\x06\x33\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\
-\x01\x14\x06\x6b\x23\x1c\x1c\x23\x23\x1c\x1c\x9e\x23\x1c\x1c\x23\
-\x23\x1c\x1c\x9e\x23\x1c\x1c\x23\x23\x1c\x1c\x04\x1d\x16\x1d\x16\
-\x1d\x1d\x16\x1d\x16\x1d\x1d\x16\x1d\x16\x1d\x1d\x16\x1d\x16\x1d\
-\x1d\x16\x1d\x16\x1d\x1d\x16\x1d\x16\x1d\x00\xff\xff\x00\xe2\xff\
-\xf7\x01\x76\x02\x0d\x02\x26\x00\x4e\x00\x00\x00\x07\x00\x4e\x00\
-\x00\x01\x8c\x00\x01\x00\xcc\xff\x73\x01\x82\x00\x88\x00\x03\x00\
-\x15\xba\x00\x02\x00\x04\x00\x05\x11\x12\x39\x00\xb8\x00\x00\x2f\
-\xb8\x00\x03\x2f\x30\x31\x25\x33\x03\x23\x01\x01\x81\x73\x43\x88\
-\xfe\xeb\x00\xff\xff\x00\xcc\xff\x73\x01\x82\x02\x0d\x02\x26\x00\
-\x51\x00\x00\x00\x07\x00\x4e\x00\x00\x01\x8c\x00\x01\x01\x06\x01\
-\xcf\x01\x52\x02\xe4\x00\x03\x00\x1e\xba\x00\x00\x00\x04\x00\x05\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\
-\x01\x00\x1e\x3e\x59\x30\x31\x01\x11\x33\x11\x01\x06\x4c\x01\xcf\
-\x01\x15\xfe\xeb\x00\x00\x00\xff\xff\x00\xae\x01\xcf\x01\xab\x02\
-\xe4\x02\x26\x00\x53\xa8\x00\x00\x06\x00\x53\x59\x00\x00\x00\x00\
-\x01\x00\xc3\x01\xcf\x01\x79\x02\xe4\x00\x03\x00\x1e\xba\x00\x00\
-\x00\x04\x00\x05\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\
-\x2f\x1b\xb9\x00\x00\x00\x1e\x3e\x59\x30\x31\x01\x33\x03\x23\x01\
-\x36\x43\x35\x81\x02\xe4\xfe\xeb\x00\x00\x00\x00\x01\x00\xdf\x01\
-\xcf\x01\x95\x02\xe4\x00\x03\x00\x1e\xba\x00\x02\x00\x04\x00\x05\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\
-\x00\x00\x1e\x3e\x59\x30\x31\x01\x33\x03\x23\x01\x14\x81\x73\x43\
-\x02\xe4\xfe\xeb\x00\x00\x00\xff\xff\x00\x52\x01\xcf\x01\xf7\x02\
-\xe4\x02\x26\x00\x55\x8f\x00\x00\x06\x00\x55\x7e\x00\x00\x00\xff\
-\xff\x00\x6e\x01\xcf\x02\x13\x02\xe4\x02\x26\x00\x56\x8f\x00\x00\
-\x06\x00\x56\x7e\x00\x00\x00\x00\x01\x00\xcc\xff\x73\x01\x82\x00\
-\x88\x00\x03\x00\x15\xba\x00\x02\x00\x04\x00\x05\x11\x12\x39\x00\
-\xb8\x00\x00\x2f\xb8\x00\x03\x2f\x30\x31\x25\x33\x03\x23\x01\x01\
-\x81\x73\x43\x88\xfe\xeb\x00\xff\xff\x00\x6e\xff\x73\x02\x13\x00\
-\x88\x02\x26\x00\x59\xa2\x00\x00\x07\x00\x59\x00\x91\x00\x00\x00\
-\x01\x00\xaa\x00\x38\x01\x91\x01\xe4\x00\x06\x00\x15\xba\x00\x05\
-\x00\x07\x00\x08\x11\x12\x39\x00\xb8\x00\x03\x2f\xb8\x00\x00\x2f\
-\x30\x31\x25\x27\x35\x37\x17\x07\x17\x01\x78\xce\xce\x19\x94\x94\
-\x38\xae\x50\xae\x39\x9d\x9d\x00\x01\x00\xc7\x00\x38\x01\xae\x01\
-\xe4\x00\x06\x00\x15\xba\x00\x01\x00\x07\x00\x08\x11\x12\x39\x00\
-\xb8\x00\x03\x2f\xb8\x00\x06\x2f\x30\x31\x3f\x01\x27\x37\x17\x15\
-\x07\xc7\x94\x94\x19\xce\xce\x71\x9d\x9d\x39\xae\x50\xae\x00\xff\
-\xff\x00\x4a\x00\x38\x02\x16\x01\xe4\x02\x26\x00\x5b\xa0\x00\x00\
-\x07\x00\x5b\x00\x85\x00\x00\xff\xff\x00\x43\x00\x38\x02\x0f\x01\
-\xe4\x02\x27\x00\x5c\xff\x7c\x00\x00\x00\x06\x00\x5c\x61\x00\x00\
-\x02\x00\xe2\xff\x4a\x01\x76\x02\x0d\x00\x05\x00\x13\x00\x32\xba\
-\x00\x06\x00\x14\x00\x15\x11\x12\x39\xb8\x00\x06\x10\xb8\x00\x02\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\
-\x1a\x3e\x59\xb9\x00\x06\x00\x09\xf4\xb9\x00\x03\x00\x07\xf4\x30\
-\x31\x05\x35\x13\x33\x13\x15\x03\x22\x26\x3d\x01\x34\x36\x33\x32\
-\x16\x1d\x01\x14\x06\x01\x00\x1c\x20\x1c\x2c\x29\x21\x21\x29\x29\
-\x21\x21\xb6\xcb\x01\x06\xfe\xfa\xcb\x02\x39\x22\x1a\x12\x1a\x22\
-\x22\x1a\x12\x1a\x22\x00\x00\x00\x02\x00\xe2\xff\xf7\x01\x76\x02\
-\xba\x00\x05\x00\x13\x00\x43\xba\x00\x06\x00\x14\x00\x15\x11\x12\
-\x39\xb8\x00\x06\x10\xb8\x00\x00\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x02\x2f\x1b\xb9\x00\x02\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x0e\x3e\x59\xb9\x00\x0d\x00\
-\x09\xf4\xb9\x00\x05\x00\x07\xf4\x30\x31\x25\x03\x35\x33\x15\x03\
-\x07\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x01\x1c\
-\x1c\x58\x1c\x10\x29\x21\x21\x29\x29\x21\x21\xe9\x01\x06\xcb\xcb\
-\xfe\xfa\xf2\x22\x1a\x12\x1a\x22\x22\x1a\x12\x1a\x22\x00\x00\x00\
-\x02\x00\x5a\xff\x3e\x02\x0b\x02\x0d\x00\x1c\x00\x2a\x00\x3c\xba\
-\x00\x00\x00\x2b\x00\x2c\x11\x12\x39\xb8\x00\x1d\xd0\x00\xb8\x00\
-\x00\x2f\xb8\x00\x00\x45\x58\xb8\x00\x24\x2f\x1b\xb9\x00\x24\x00\
-\x1a\x3e\x59\xb9\x00\x1d\x00\x09\xf4\xb9\x00\x0c\x00\x07\xf4\xb8\
-\x00\x00\x10\xb9\x00\x14\x00\x0b\xf4\x30\x31\x05\x22\x2e\x02\x35\
-\x34\x3e\x02\x37\x35\x33\x15\x0e\x01\x1d\x01\x14\x16\x33\x32\x36\
-\x37\x17\x0e\x03\x03\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\
-\x14\x06\x01\x2b\x30\x4d\x36\x1e\x22\x36\x45\x23\x4f\x56\x62\x43\
-\x3a\x3c\x48\x0e\x4b\x0a\x24\x37\x4b\x1d\x29\x21\x21\x29\x29\x21\
-\x21\xc2\x1b\x31\x46\x2b\x2f\x47\x32\x1f\x06\x65\x9d\x04\x43\x44\
-\x0e\x38\x38\x42\x33\x1c\x21\x3b\x2c\x1a\x02\x45\x22\x1a\x12\x1a\
-\x22\x22\x1a\x12\x1a\x22\x00\x00\x02\x00\x4d\xff\xf7\x01\xfe\x02\
-\xc6\x00\x1c\x00\x2a\x00\x51\xba\x00\x11\x00\x2b\x00\x2c\x11\x12\
-\x39\xb8\x00\x11\x10\xb8\x00\x1d\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x11\x2f\x1b\xb9\x00\x11\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x1d\x2f\x1b\xb9\x00\x1d\x00\x0e\x3e\x59\xb8\x00\x11\x10\
-\xb9\x00\x08\x00\x0b\xf4\xb8\x00\x1d\x10\xb9\x00\x24\x00\x09\xf4\
-\xb9\x00\x1c\x00\x07\xf4\x30\x31\x37\x35\x3e\x01\x3d\x01\x34\x26\
-\x23\x22\x06\x07\x27\x3e\x03\x33\x32\x1e\x02\x15\x14\x0e\x02\x07\
-\x15\x07\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\xef\
-\x56\x62\x43\x3a\x3c\x48\x0e\x4b\x0a\x24\x37\x4b\x30\x30\x4d\x36\
-\x1e\x22\x36\x45\x23\x24\x29\x21\x21\x29\x29\x21\x21\xd7\x9d\x04\
-\x43\x44\x0e\x38\x38\x42\x33\x1c\x21\x3b\x2c\x1a\x1b\x31\x46\x2b\
-\x2f\x47\x32\x1f\x06\x65\xe0\x22\x1a\x12\x1a\x22\x22\x1a\x12\x1a\
-\x22\x00\x00\x00\x01\x00\xcd\xff\x76\x01\xee\x02\xf8\x00\x16\x00\
-\x15\xba\x00\x0c\x00\x17\x00\x18\x11\x12\x39\x00\xb8\x00\x05\x2f\
-\xb8\x00\x12\x2f\x30\x31\x13\x34\x3e\x02\x37\x33\x0e\x03\x1d\x01\
-\x14\x1e\x02\x17\x23\x2e\x03\xcd\x21\x39\x4c\x2a\x51\x2c\x4d\x3b\
-\x22\x22\x3b\x4d\x2c\x51\x2a\x4c\x39\x21\x01\x37\x49\x87\x74\x5d\
-\x20\x21\x57\x67\x77\x40\x56\x40\x77\x67\x57\x21\x1f\x5e\x74\x87\
-\x00\x00\x00\x00\x01\x00\x6a\xff\x76\x01\x8b\x02\xf8\x00\x16\x00\
-\x15\xba\x00\x0b\x00\x17\x00\x18\x11\x12\x39\x00\xb8\x00\x11\x2f\
-\xb8\x00\x06\x2f\x30\x31\x01\x14\x0e\x02\x07\x23\x3e\x03\x3d\x01\
-\x34\x2e\x02\x27\x33\x1e\x03\x01\x8b\x21\x39\x4c\x2a\x51\x2b\x4e\
-\x3b\x22\x22\x3b\x4e\x2b\x51\x2a\x4c\x39\x21\x01\x37\x49\x87\x74\
-\x5e\x1f\x21\x57\x67\x77\x40\x56\x40\x77\x67\x57\x21\x20\x5d\x74\
-\x87\x00\x00\x00\x01\x00\xe1\xff\x76\x01\xf9\x02\xf8\x00\x07\x00\
-\x29\xba\x00\x05\x00\x08\x00\x09\x11\x12\x39\x00\xb8\x00\x01\x2f\
-\xb8\x00\x00\x2f\xb8\x00\x01\x10\xb9\x00\x04\x00\x08\xf4\xb8\x00\
-\x00\x10\xb9\x00\x05\x00\x08\xf4\x30\x31\x17\x11\x21\x15\x23\x11\
-\x33\x15\xe1\x01\x18\xd3\xd3\x8a\x03\x82\x3e\xfc\xfa\x3e\x00\x00\
-\x01\x00\x5f\xff\x76\x01\x77\x02\xf8\x00\x07\x00\x25\xba\x00\x04\
-\x00\x08\x00\x09\x11\x12\x39\x00\xb8\x00\x07\x2f\xb8\x00\x02\x2f\
-\xb9\x00\x03\x00\x08\xf4\xb8\x00\x07\x10\xb9\x00\x06\x00\x08\xf4\
-\x30\x31\x01\x11\x21\x35\x33\x11\x23\x35\x01\x77\xfe\xe8\xd3\xd3\
-\x02\xf8\xfc\x7e\x3e\x03\x06\x3e\x00\x00\x00\x00\x01\x00\x69\xff\
-\x76\x01\xef\x02\xf8\x00\x3b\x00\x47\xba\x00\x38\x00\x3c\x00\x3d\
-\x11\x12\x39\x00\xb8\x00\x21\x2f\xb8\x00\x00\x2f\xb8\x00\x21\x10\
-\xb9\x00\x24\x00\x08\xf4\xba\x00\x0f\x00\x24\x00\x00\x11\x12\x39\
-\xb8\x00\x0f\x2f\xb9\x00\x12\x00\x08\xf4\xba\x00\x2e\x00\x12\x00\
-\x0f\x11\x12\x39\xb8\x00\x00\x10\xb9\x00\x39\x00\x08\xf4\x30\x31\
-\x05\x22\x26\x3d\x01\x34\x3e\x02\x37\x3e\x01\x35\x34\x26\x2b\x01\
-\x35\x33\x32\x36\x35\x34\x26\x27\x2e\x03\x3d\x01\x34\x36\x3b\x01\
-\x15\x23\x15\x14\x16\x17\x1e\x01\x15\x14\x06\x07\x15\x1e\x01\x15\
-\x14\x06\x07\x0e\x01\x1d\x01\x33\x15\x01\x3f\x2a\x2a\x0b\x10\x14\
-\x09\x11\x0d\x46\x44\x4e\x4e\x44\x46\x0d\x11\x09\x14\x10\x0b\x2a\
-\x2a\xb0\xbf\x18\x10\x11\x1e\x3b\x33\x33\x3b\x1e\x11\x10\x18\xbf\
-\x8a\x2f\x23\x3f\x1b\x28\x20\x19\x0b\x14\x1d\x10\x26\x23\x3e\x23\
-\x26\x10\x1d\x14\x0b\x19\x1f\x29\x1b\x3f\x23\x2f\x3e\x4d\x29\x2c\
-\x15\x16\x2f\x20\x2a\x34\x07\x04\x07\x34\x2a\x20\x2f\x16\x15\x2c\
-\x29\x4d\x3e\x00\x01\x00\x69\xff\x76\x01\xef\x02\xf8\x00\x3b\x00\
-\x47\xba\x00\x25\x00\x3c\x00\x3d\x11\x12\x39\x00\xb8\x00\x3b\x2f\
-\xb8\x00\x22\x2f\xb8\x00\x3b\x10\xb9\x00\x3a\x00\x08\xf4\xba\x00\
-\x12\x00\x3a\x00\x22\x11\x12\x39\xb8\x00\x12\x2f\xb9\x00\x0f\x00\
-\x08\xf4\xb8\x00\x22\x10\xb9\x00\x23\x00\x08\xf4\xba\x00\x2e\x00\
-\x0f\x00\x12\x11\x12\x39\x30\x31\x01\x32\x16\x1d\x01\x14\x0e\x02\
-\x07\x0e\x01\x15\x14\x16\x3b\x01\x15\x23\x22\x06\x15\x14\x16\x17\
-\x1e\x03\x1d\x01\x14\x06\x2b\x01\x35\x33\x35\x34\x26\x27\x2e\x01\
-\x35\x34\x36\x37\x35\x2e\x01\x35\x34\x36\x37\x3e\x01\x3d\x01\x23\
-\x35\x01\x19\x2a\x2a\x0b\x10\x14\x09\x11\x0d\x46\x44\x4e\x4e\x44\
-\x46\x0d\x11\x09\x14\x10\x0b\x2a\x2a\xb0\xbf\x18\x10\x11\x1e\x3b\
-\x33\x33\x3b\x1e\x11\x10\x18\xbf\x02\xf8\x2f\x23\x3f\x1b\x29\x1f\
-\x19\x0b\x14\x1d\x10\x26\x23\x3e\x23\x26\x10\x1d\x14\x0b\x19\x20\
-\x28\x1b\x3f\x23\x2f\x3e\x4d\x29\x2c\x15\x16\x2f\x20\x2a\x34\x07\
-\x04\x07\x34\x2a\x20\x2f\x16\x15\x2c\x29\x4d\x3e\x00\x00\x00\x00\
-\x01\x00\x5a\xff\x76\x01\xfe\x02\xf8\x00\x03\x00\x15\xba\x00\x03\
-\x00\x04\x00\x05\x11\x12\x39\x00\xb8\x00\x01\x2f\xb8\x00\x00\x2f\
-\x30\x31\x17\x01\x33\x01\x5a\x01\x5c\x48\xfe\xa4\x8a\x03\x82\xfc\
-\x7e\x00\x00\x00\x01\x00\x5a\xff\x76\x01\xfe\x02\xf8\x00\x03\x00\
-\x15\xba\x00\x00\x00\x04\x00\x05\x11\x12\x39\x00\xb8\x00\x01\x2f\
-\xb8\x00\x00\x2f\x30\x31\x05\x01\x33\x01\x01\xb6\xfe\xa4\x48\x01\
-\x5c\x8a\x03\x82\xfc\x7e\x00\x00\x02\x00\x12\x00\x00\x02\x46\x02\
-\xba\x00\x03\x00\x07\x00\x53\xba\x00\x05\x00\x08\x00\x09\x11\x12\
-\x39\xb8\x00\x05\x10\xb8\x00\x03\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x0e\x3e\x59\xba\x00\x03\x00\
-\x07\x00\x00\x11\x12\x39\xb8\x00\x03\x2f\xba\x00\x04\x00\x07\x00\
-\x00\x11\x12\x39\xb8\x00\x04\x2f\x30\x31\x01\x33\x03\x23\x07\x33\
-\x03\x23\x01\xfe\x48\xa0\x48\xac\x48\xa0\x48\x02\xba\xfe\xd4\x62\
-\xfe\xd4\x00\x00\x06\x00\x12\xff\xf4\x02\x46\x02\xc6\x00\x0b\x00\
-\x19\x00\x1d\x00\x21\x00\x2d\x00\x3b\x00\xb9\xba\x00\x25\x00\x3c\
-\x00\x3d\x11\x12\x39\xb8\x00\x25\x10\xb8\x00\x09\xd0\xb8\x00\x25\
-\x10\xb8\x00\x0f\xd0\xb8\x00\x25\x10\xb8\x00\x1d\xd0\xb8\x00\x25\
-\x10\xb8\x00\x1f\xd0\xb8\x00\x25\x10\xb8\x00\x39\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x1a\x2f\x1b\xb9\x00\x1a\x00\x1c\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x21\x2f\x1b\xb9\x00\x21\x00\x0e\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x22\x2f\x1b\xb9\x00\x22\x00\x0e\
-\x3e\x59\xba\x00\x00\x00\x21\x00\x06\x11\x12\x39\xb8\x00\x00\x2f\
-\xb9\x00\x0c\x00\x08\xf4\xb8\x00\x06\x10\xb9\x00\x13\x00\x08\xf4\
-\xba\x00\x28\x00\x1a\x00\x22\x11\x12\x39\xb8\x00\x28\x2f\xb8\x00\
-\x22\x10\xb9\x00\x2e\x00\x08\xf4\xb8\x00\x28\x10\xb9\x00\x35\x00\
-\x08\xf4\x30\x31\x13\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\
-\x27\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x01\x33\
-\x03\x23\x07\x33\x03\x23\x05\x22\x26\x35\x34\x36\x33\x32\x16\x15\
-\x14\x06\x27\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\
-\xa9\x42\x53\x53\x42\x42\x53\x53\x42\x24\x2d\x2d\x24\x24\x2d\x2d\
-\x01\x79\x48\xa0\x48\xac\x48\xa0\x48\x01\x9d\x42\x53\x53\x42\x42\
-\x53\x53\x42\x24\x2d\x2d\x24\x24\x2d\x2d\x01\x64\x59\x58\x58\x59\
-\x59\x58\x58\x59\x36\x32\x30\x32\x30\x32\x32\x30\x32\x30\x32\x01\
-\x20\xfe\xd4\x62\xfe\xd4\x0c\x59\x58\x58\x59\x59\x58\x58\x59\x36\
-\x32\x30\x32\x30\x32\x32\x30\x32\x30\x32\x00\x00\x06\x00\x00\xff\
-\xf4\x02\x58\x02\xc6\x00\x0b\x00\x19\x00\x1d\x00\x34\x00\x42\x00\
-\x50\x00\xe0\xba\x00\x38\x00\x51\x00\x52\x11\x12\x39\xb8\x00\x38\
-\x10\xb8\x00\x09\xd0\xb8\x00\x38\x10\xb8\x00\x0f\xd0\xb8\x00\x38\
-\x10\xb8\x00\x1b\xd0\xb8\x00\x38\x10\xb8\x00\x1e\xd0\xb8\x00\x38\
-\x10\xb8\x00\x4e\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\
-\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x1e\x2f\
-\x1b\xb9\x00\x1e\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x2f\
-\x2f\x1b\xb9\x00\x2f\x00\x0e\x3e\x59\xba\x00\x00\x00\x06\x00\x1e\
-\x11\x12\x39\x7c\xb8\x00\x00\x2f\x18\xb9\x00\x0c\x00\x08\xf4\xb8\
-\x00\x06\x10\xb9\x00\x13\x00\x08\xf4\xba\x00\x24\x00\x06\x00\x1e\
-\x11\x12\x39\x7d\xb8\x00\x24\x2f\x18\xb9\x00\x3c\x00\x08\xf4\xba\
-\x00\x1a\x00\x0c\x00\x3c\x11\x12\x39\xb8\x00\x1e\x10\xb9\x00\x35\
-\x00\x08\xf4\xba\x00\x26\x00\x3c\x00\x35\x11\x12\x39\xb8\x00\x24\
-\x10\xb8\x00\x29\xd0\xba\x00\x32\x00\x3c\x00\x35\x11\x12\x39\xb8\
-\x00\x2f\x10\xb9\x00\x43\x00\x08\xf4\xb8\x00\x3c\x10\xb8\x00\x4a\
-\xd0\x30\x31\x13\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x27\
-\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x07\x25\x17\
-\x05\x13\x22\x26\x35\x34\x36\x33\x32\x17\x33\x36\x33\x32\x16\x15\
-\x14\x06\x23\x22\x27\x23\x0e\x01\x27\x32\x36\x3d\x01\x34\x26\x23\
-\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x3d\x01\x34\x26\x23\x22\x06\
-\x1d\x01\x14\x16\x8b\x41\x4a\x49\x42\x41\x4a\x49\x42\x22\x25\x25\
-\x22\x22\x25\x25\x2c\x01\xc2\x14\xfe\x3e\xa7\x3f\x49\x49\x3f\x43\
-\x27\x05\x25\x44\x3f\x49\x49\x3f\x44\x25\x06\x12\x35\x1f\x22\x25\
-\x25\x22\x22\x25\x25\xf4\x22\x25\x25\x22\x22\x25\x25\x01\x90\x4d\
-\x4e\x4d\x4e\x4d\x4e\x4d\x4e\x32\x2d\x24\x30\x24\x2d\x2d\x24\x30\
-\x24\x2d\x7a\xb0\x32\xb0\xfe\xde\x4e\x4d\x4d\x4e\x32\x32\x4e\x4d\
-\x4d\x4e\x32\x18\x1a\x32\x2d\x24\x30\x24\x2d\x2d\x24\x30\x24\x2d\
-\x2d\x24\x30\x24\x2d\x2d\x24\x30\x24\x2d\x00\x00\x01\x01\x09\xff\
-\x76\x01\x4f\x02\xf8\x00\x03\x00\x15\xba\x00\x00\x00\x04\x00\x05\
-\x11\x12\x39\x00\xb8\x00\x01\x2f\xb8\x00\x00\x2f\x30\x31\x05\x11\
-\x33\x11\x01\x09\x46\x8a\x03\x82\xfc\x7e\x00\x00\x02\x01\x09\xff\
-\x76\x01\x4f\x02\xf8\x00\x03\x00\x07\x00\x25\xba\x00\x04\x00\x08\
-\x00\x09\x11\x12\x39\xb8\x00\x04\x10\xb8\x00\x00\xd0\x00\xb8\x00\
-\x01\x2f\xb8\x00\x04\x2f\xba\x00\x00\x00\x05\x00\x03\x2b\x30\x31\
-\x01\x11\x33\x11\x03\x11\x33\x11\x01\x09\x46\x46\x46\x01\x91\x01\
-\x67\xfe\x99\xfd\xe5\x01\x67\xfe\x99\x00\x00\x00\x02\x00\x51\xff\
-\x65\x02\x0b\x02\xc6\x00\x39\x00\x4b\x00\x7a\xba\x00\x12\x00\x4c\
-\x00\x4d\x11\x12\x39\xb8\x00\x12\x10\xb8\x00\x46\xd0\x00\xb8\x00\
-\x05\x2f\xb8\x00\x00\x45\x58\xb8\x00\x22\x2f\x1b\xb9\x00\x22\x00\
-\x1c\x3e\x59\xb8\x00\x05\x10\xb9\x00\x0c\x00\x08\xf4\xb8\x00\x22\
-\x10\xb9\x00\x29\x00\x08\xf4\xba\x00\x12\x00\x29\x00\x05\x11\x12\
-\x39\xba\x00\x2f\x00\x22\x00\x0c\x11\x12\x39\xba\x00\x40\x00\x29\
-\x00\x05\x11\x12\x39\xba\x00\x1a\x00\x2f\x00\x40\x11\x12\x39\xba\
-\x00\x49\x00\x22\x00\x0c\x11\x12\x39\xba\x00\x36\x00\x49\x00\x12\
-\x11\x12\x39\x30\x31\x25\x14\x0e\x02\x23\x22\x26\x27\x37\x1e\x01\
-\x33\x32\x36\x35\x34\x26\x2f\x01\x2e\x01\x35\x34\x36\x37\x35\x2e\
-\x01\x35\x34\x3e\x02\x33\x32\x16\x17\x07\x2e\x01\x23\x22\x06\x15\
-\x14\x16\x1f\x01\x1e\x01\x15\x14\x06\x07\x15\x1e\x01\x27\x34\x26\
-\x2f\x01\x26\x27\x0e\x01\x15\x14\x16\x1f\x01\x16\x17\x3e\x01\x01\
-\xe7\x1d\x35\x4a\x2d\x2e\x59\x23\x2f\x18\x3e\x26\x39\x40\x37\x33\
-\x40\x53\x4a\x3a\x36\x27\x25\x1d\x35\x4a\x2d\x2e\x59\x23\x2f\x18\
-\x3e\x26\x39\x40\x37\x33\x40\x53\x4a\x3a\x36\x27\x25\x2b\x3a\x3e\
-\x3f\x11\x11\x1f\x24\x3a\x3e\x3f\x11\x11\x1f\x24\x03\x24\x3a\x2a\
-\x16\x1a\x1e\x38\x14\x17\x2f\x29\x26\x2d\x0e\x12\x17\x51\x33\x30\
-\x4a\x15\x05\x18\x44\x28\x24\x3a\x2a\x16\x1a\x1e\x38\x14\x17\x2f\
-\x29\x26\x2d\x0e\x12\x17\x51\x33\x30\x4a\x15\x05\x18\x44\xdc\x2b\
-\x34\x11\x11\x04\x07\x15\x37\x23\x2b\x34\x11\x11\x04\x07\x15\x37\
-\x00\x00\x00\x00\x01\x00\x2d\xff\x6b\x01\xf8\x02\xba\x00\x11\x00\
-\x34\xba\x00\x11\x00\x12\x00\x13\x11\x12\x39\x00\xb8\x00\x11\x2f\
-\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1c\x3e\
-\x59\xb9\x00\x0f\x00\x08\xf4\xb8\x00\x00\xdc\xb8\x00\x11\x10\xb8\
-\x00\x0d\xd0\x30\x31\x25\x22\x2e\x02\x35\x34\x3e\x02\x3b\x01\x11\
-\x23\x11\x23\x11\x23\x01\x0e\x2f\x51\x3e\x23\x23\x3e\x51\x2f\xea\
-\x48\x5a\x48\xf6\x22\x3c\x53\x31\x31\x53\x3c\x22\xfc\xb1\x03\x0f\
-\xfc\xf1\x00\x00\x03\x00\x00\x00\x12\x02\x58\x02\xa8\x00\x13\x00\
-\x29\x00\x44\x00\x6d\xba\x00\x00\x00\x45\x00\x46\x11\x12\x39\xb8\
-\x00\x14\xd0\xb8\x00\x00\x10\xb8\x00\x2a\xd0\x00\xb8\x00\x0a\x2f\
-\xb8\x00\x00\x2f\xb9\x00\x14\x00\x03\xf4\xb8\x00\x0a\x10\xb9\x00\
-\x1f\x00\x03\xf4\xb8\x00\x14\x10\xb8\x00\x2a\xdc\xb8\x00\x1f\x10\
-\xb8\x00\x30\xdc\xb9\x00\x37\x00\x03\xf4\xb8\x00\x2a\x10\xb9\x00\
-\x3e\x00\x03\xf4\xba\x00\x34\x00\x37\x00\x3e\x11\x12\x39\xb8\x00\
-\x34\x2f\xba\x00\x41\x00\x37\x00\x3e\x11\x12\x39\xb8\x00\x41\x2f\
-\x30\x31\x25\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\
-\x0e\x02\x27\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\x0e\x02\x1d\
-\x01\x14\x1e\x02\x37\x22\x26\x35\x34\x36\x33\x32\x16\x17\x07\x2e\
-\x01\x23\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x37\x17\x0e\x01\x01\
-\x2c\x3f\x6d\x51\x2f\x2f\x51\x6d\x3f\x3f\x6d\x51\x2f\x2f\x51\x6d\
-\x3f\x33\x57\x3f\x24\x24\x3f\x57\x33\x33\x57\x3f\x24\x24\x3f\x57\
-\x38\x49\x51\x52\x48\x30\x3d\x11\x35\x0b\x22\x1c\x27\x2b\x2a\x29\
-\x1e\x24\x0e\x32\x11\x41\x12\x2e\x56\x7a\x4d\x4c\x7b\x56\x2e\x2e\
-\x56\x7b\x4c\x4d\x7a\x56\x2e\x37\x26\x43\x5a\x33\x3c\x33\x5a\x43\
-\x26\x26\x43\x5a\x33\x3c\x33\x5a\x43\x26\x62\x61\x51\x52\x60\x2c\
-\x24\x1d\x18\x1c\x33\x29\x39\x2a\x33\x1e\x19\x1f\x23\x2e\x00\x00\
-\x04\x00\x75\x01\x5a\x01\xe3\x02\xc6\x00\x13\x00\x29\x00\x36\x00\
-\x3e\x00\xed\xba\x00\x00\x00\x3f\x00\x40\x11\x12\x39\xb8\x00\x14\
-\xd0\xb8\x00\x00\x10\xb8\x00\x35\xd0\xb8\x00\x00\x10\xb8\x00\x37\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\
-\x1c\x3e\x59\xb9\x00\x1f\x00\x0a\xf4\xba\x00\x2b\x00\x1f\x00\x14\
-\x11\x12\x39\x7c\xb8\x00\x2b\x2f\x18\x41\x09\x00\xa0\x00\x2b\x00\
-\xb0\x00\x2b\x00\xc0\x00\x2b\x00\xd0\x00\x2b\x00\x04\x5d\x41\x03\
-\x00\x10\x00\x2b\x00\x01\x72\x41\x07\x00\xa0\x00\x2b\x00\xb0\x00\
-\x2b\x00\xc0\x00\x2b\x00\x03\x71\x41\x03\x00\x30\x00\x2b\x00\x01\
-\x5d\x41\x03\x00\xf0\x00\x2b\x00\x01\x5d\x41\x05\x00\x00\x00\x2b\
-\x00\x10\x00\x2b\x00\x02\x71\xba\x00\x14\x00\x2b\x00\x3f\x11\x12\
-\x39\xb8\x00\x14\x2f\x41\x03\x00\x40\x00\x14\x00\x01\x71\xb9\x00\
-\x00\x00\x0a\xf4\xba\x00\x2c\x00\x1f\x00\x14\x11\x12\x39\xb8\x00\
-\x2c\x2f\xb9\x00\x3d\x00\x0a\xf4\xba\x00\x3e\x00\x3d\x00\x2b\x11\
-\x12\x39\xb8\x00\x3e\x2f\xb9\x00\x36\x00\x0a\xf4\xba\x00\x32\x00\
-\x3e\x00\x36\x11\x12\x39\xb8\x00\x2b\x10\xb8\x00\x34\xd0\x30\x31\
-\x01\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x0e\x02\
-\x27\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\x0e\x02\x1d\x01\x14\
-\x1e\x02\x27\x23\x35\x33\x32\x16\x15\x14\x07\x17\x23\x27\x23\x37\
-\x32\x3d\x01\x34\x2b\x01\x15\x01\x2c\x26\x43\x32\x1c\x1c\x32\x43\
-\x26\x26\x43\x31\x1d\x1d\x31\x43\x26\x1d\x31\x24\x15\x15\x24\x31\
-\x1d\x1d\x31\x24\x15\x15\x24\x31\x01\x28\x55\x1c\x1f\x25\x2e\x2d\
-\x27\x1d\x24\x1a\x1a\x24\x01\x5a\x1c\x30\x43\x27\x27\x43\x30\x1c\
-\x1c\x30\x43\x27\x27\x43\x30\x1c\x29\x13\x22\x30\x1e\x14\x1e\x30\
-\x22\x13\x13\x22\x30\x1e\x14\x1e\x30\x22\x13\x31\xb9\x1f\x1a\x27\
-\x0d\x4c\x46\x1d\x18\x07\x18\x37\x00\x00\x00\x00\x02\x00\x10\x01\
-\xa3\x02\x1e\x02\xba\x00\x07\x00\x18\x00\x7a\xba\x00\x08\x00\x19\
-\x00\x1a\x11\x12\x39\xb8\x00\x08\x10\xb8\x00\x05\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1c\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x1c\x3e\
-\x59\xb8\x00\x03\x10\xb8\x00\x00\xdc\xb8\x00\x03\x10\xb9\x00\x02\
-\x00\x0a\xf4\xb8\x00\x06\xd0\xb8\x00\x00\x10\xb8\x00\x08\xd0\xb8\
-\x00\x00\x10\xb8\x00\x10\xd0\xb8\x00\x09\x10\xb8\x00\x16\xd0\xb8\
-\x00\x13\xd0\x30\x31\x13\x35\x23\x35\x33\x15\x23\x15\x33\x11\x33\
-\x17\x33\x37\x33\x11\x23\x35\x37\x23\x07\x27\x23\x17\x15\x66\x56\
-\xe0\x56\x80\x41\x41\x03\x41\x3e\x30\x01\x04\x4f\x4f\x04\x01\x01\
-\xa3\xe9\x2e\x2e\xe9\x01\x17\x86\x86\xfe\xe9\x7f\x53\x9c\x9c\x53\
-\x7f\x00\x00\x00\x02\x00\x8a\x01\x5d\x01\xcf\x02\xc6\x00\x20\x00\
-\x2b\x00\x9a\xba\x00\x0d\x00\x2c\x00\x2d\x11\x12\x39\xb8\x00\x0d\
-\x10\xb8\x00\x21\xd0\x00\xb8\x00\x20\x2f\xb8\x00\x00\x45\x58\xb8\
-\x00\x1a\x2f\x1b\xb9\x00\x1a\x00\x1c\x3e\x59\x41\x03\x00\xa0\x00\
-\x20\x00\x01\x5d\x41\x03\x00\xd0\x00\x20\x00\x01\x5d\x41\x03\x00\
-\x10\x00\x20\x00\x01\x5d\x41\x03\x00\x20\x00\x20\x00\x01\x71\xb8\
-\x00\x20\x10\xb9\x00\x1f\x00\x03\xf4\xba\x00\x03\x00\x1f\x00\x20\
-\x11\x12\x39\xba\x00\x27\x00\x1f\x00\x20\x11\x12\x39\x7c\xb8\x00\
-\x27\x2f\x18\xb9\x00\x07\x00\x03\xf4\xba\x00\x0d\x00\x1a\x00\x1f\
-\x11\x12\x39\xb8\x00\x0d\x2f\xb8\x00\x1a\x10\xb9\x00\x11\x00\x03\
-\xf4\xb8\x00\x0d\x10\xb9\x00\x21\x00\x03\xf4\x30\x31\x01\x22\x26\
-\x27\x23\x0e\x01\x23\x22\x26\x35\x34\x36\x3b\x01\x35\x34\x23\x22\
-\x06\x07\x27\x3e\x03\x33\x32\x16\x1d\x01\x33\x15\x27\x22\x06\x1d\
-\x01\x14\x33\x32\x36\x3d\x01\x01\xad\x21\x1c\x02\x04\x0b\x37\x2f\
-\x36\x39\x4f\x48\x49\x4d\x23\x2f\x0b\x2a\x07\x19\x22\x2c\x1c\x40\
-\x49\x26\xb0\x2a\x2c\x3d\x28\x3c\x01\x65\x1c\x19\x17\x26\x36\x2d\
-\x36\x32\x1c\x4e\x1d\x17\x22\x0d\x19\x14\x0c\x42\x3d\xaa\x38\x95\
-\x18\x17\x0a\x31\x23\x1e\x29\x00\x02\x00\x8c\x01\x5d\x01\xcc\x02\
-\xc6\x00\x0b\x00\x19\x00\x55\xba\x00\x00\x00\x1a\x00\x1b\x11\x12\
-\x39\xb8\x00\x0c\xd0\x00\xb8\x00\x00\x2f\xb8\x00\x00\x45\x58\xb8\
-\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\x41\x03\x00\xff\x00\
-\x00\x00\x01\x5d\x41\x03\x00\xd0\x00\x00\x00\x01\x5d\x41\x03\x00\
-\xa0\x00\x00\x00\x01\x5d\xb8\x00\x00\x10\xb9\x00\x0c\x00\x03\xf4\
-\xb8\x00\x06\x10\xb9\x00\x13\x00\x03\xf4\x30\x31\x01\x22\x26\x35\
-\x34\x36\x33\x32\x16\x15\x14\x06\x27\x32\x36\x3d\x01\x34\x26\x23\
-\x22\x06\x1d\x01\x14\x16\x01\x2c\x4c\x54\x55\x4b\x4b\x55\x55\x4b\
-\x2d\x2e\x2e\x2d\x2d\x2e\x2e\x01\x5d\x60\x55\x54\x60\x60\x54\x55\
-\x60\x35\x37\x2b\x3b\x2b\x37\x37\x2b\x3b\x2b\x37\x00\x00\x00\x00\
-\x02\x00\x81\x01\x70\x01\xd7\x02\xc6\x00\x13\x00\x1f\x00\x43\xba\
-\x00\x00\x00\x20\x00\x21\x11\x12\x39\xb8\x00\x14\xd0\x00\xb8\x00\
-\x00\x2f\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\
-\x1c\x3e\x59\x41\x03\x00\x60\x00\x00\x00\x01\x5d\xb8\x00\x00\x10\
-\xb9\x00\x14\x00\x03\xf4\xb8\x00\x0a\x10\xb9\x00\x1a\x00\x03\xf4\
-\x30\x31\x01\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\
-\x0e\x02\x27\x32\x36\x35\x34\x26\x23\x22\x06\x15\x14\x16\x01\x2c\
-\x24\x3e\x2f\x1a\x1a\x2f\x3e\x24\x24\x3e\x2f\x1a\x1a\x2f\x3e\x24\
-\x2e\x37\x37\x2e\x2e\x37\x37\x01\x70\x1a\x2e\x3f\x24\x24\x3f\x2e\
-\x1a\x1a\x2e\x3f\x24\x24\x3f\x2e\x1a\x40\x3e\x2d\x2d\x3e\x3e\x2d\
-\x2d\x3e\x00\x00\x01\x00\x2b\x00\x48\x02\x2d\x02\x38\x00\x0e\x00\
-\x11\xba\x00\x0e\x00\x0f\x00\x10\x11\x12\x39\x00\xb8\x00\x06\x2f\
-\x30\x31\x37\x27\x37\x27\x37\x17\x35\x33\x15\x37\x17\x07\x17\x07\
-\x27\xaf\x39\x7c\xc7\x15\xc7\x4a\xc7\x15\xc7\x7c\x39\x7d\x48\x2a\
-\xaa\x42\x42\x40\xd8\xd8\x40\x42\x42\xaa\x2a\xac\x00\x00\x00\x00\
-\x01\x00\x46\xff\x38\x02\x12\x02\xe4\x00\x0b\x00\x5a\xba\x00\x00\
-\x00\x0c\x00\x0d\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x05\
-\x2f\x1b\xb9\x00\x05\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x00\x2f\x1b\xb9\x00\x00\x00\x10\x3e\x59\xb8\x00\x04\x10\xb9\
-\x00\x01\x00\x08\xf4\xb8\x00\x04\x10\xb8\x00\x07\xd0\xb8\x00\x01\
-\x10\xb8\x00\x0a\xd0\x30\x31\x05\x11\x23\x35\x33\x35\x33\x15\x33\
-\x15\x23\x11\x01\x09\xc3\xc3\x46\xc3\xc3\xc8\x02\x8c\x40\xe0\xe0\
-\x40\xfd\x74\x00\x01\x00\x46\xff\x38\x02\x12\x02\xe4\x00\x13\x00\
-\x7e\xba\x00\x01\x00\x14\x00\x15\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1e\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1a\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x10\x3e\x59\xba\
-\x00\x04\x00\x08\x00\x00\x11\x12\x39\xb8\x00\x04\x2f\xb9\x00\x01\
-\x00\x08\xf4\xb8\x00\x08\x10\xb9\x00\x05\x00\x08\xf4\xb8\x00\x08\
-\x10\xb8\x00\x0b\xd0\xb8\x00\x05\x10\xb8\x00\x0e\xd0\xb8\x00\x04\
-\x10\xb8\x00\x0f\xd0\xb8\x00\x01\x10\xb8\x00\x12\xd0\x30\x31\x05\
-\x35\x23\x35\x33\x11\x23\x35\x33\x35\x33\x15\x33\x15\x23\x11\x33\
-\x15\x23\x15\x01\x09\xc3\xc3\xc3\xc3\x46\xc3\xc3\xc3\xc3\xc8\xe0\
-\x40\x01\x6c\x40\xe0\xe0\x40\xfe\x94\x40\xe0\x00\x02\x00\x10\x00\
-\x00\x02\x48\x02\xba\x00\x0b\x00\x17\x00\x9d\xba\x00\x17\x00\x18\
-\x00\x19\x11\x12\x39\xb8\x00\x17\x10\xb8\x00\x09\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x1c\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x0e\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x17\x2f\x1b\xb9\x00\x17\x00\x0e\
-\x3e\x59\xba\x00\x03\x00\x08\x00\x0b\x11\x12\x39\xb8\x00\x03\x2f\
-\xb9\x00\x00\x00\x08\xf4\xba\x00\x04\x00\x08\x00\x0b\x11\x12\x39\
-\xb8\x00\x04\x2f\xb9\x00\x07\x00\x08\xf4\xb8\x00\x0e\xd0\xb8\x00\
-\x04\x10\xb8\x00\x11\xd0\xb8\x00\x03\x10\xb8\x00\x12\xd0\xb8\x00\
-\x00\x10\xb8\x00\x15\xd0\x30\x31\x37\x23\x35\x33\x37\x23\x35\x33\
-\x37\x33\x03\x23\x01\x33\x07\x33\x15\x23\x07\x33\x15\x23\x07\x23\
-\x94\x84\x90\x17\x83\x8f\x26\x49\x7b\x49\x01\x33\x49\x26\x84\x90\
-\x17\x83\x8f\x26\x49\xd8\x42\x86\x42\xd8\xfd\x46\x02\xba\xd8\x42\
-\x86\x42\xd8\x00\x01\x00\x2d\x01\x1f\x02\x2b\x02\xba\x00\x07\x00\
-\x1e\xba\x00\x01\x00\x08\x00\x09\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x1c\x3e\x59\x30\x31\x01\
-\x03\x23\x03\x27\x13\x33\x13\x01\xe9\xbd\x04\xbd\x3e\xd2\x5a\xd2\
-\x01\x1f\x01\x56\xfe\xaa\x1f\x01\x7c\xfe\x84\x00\x01\x00\x34\x00\
-\xed\x02\x24\x01\x75\x00\x19\x00\x49\xba\x00\x03\x00\x1a\x00\x1b\
-\x11\x12\x39\x00\xbb\x00\x06\x00\x08\x00\x0d\x00\x04\x2b\xb8\x00\
-\x06\x10\xb8\x00\x00\xdc\xba\x00\x09\x00\x06\x00\x00\x11\x12\x39\
-\x7d\xb8\x00\x09\x2f\x18\xb8\x00\x00\x10\xb9\x00\x13\x00\x08\xf4\
-\xba\x00\x16\x00\x0d\x00\x13\x11\x12\x39\x7c\xb8\x00\x16\x2f\x18\
-\x30\x31\x25\x22\x26\x27\x2e\x01\x23\x22\x06\x07\x27\x3e\x01\x33\
-\x32\x16\x17\x1e\x01\x33\x32\x36\x37\x17\x0e\x01\x01\x98\x1f\x38\
-\x1a\x1a\x35\x19\x1d\x24\x0d\x3d\x0e\x46\x38\x1f\x38\x1a\x1a\x35\
-\x19\x1d\x24\x0d\x3d\x0e\x46\xed\x13\x0d\x0d\x18\x27\x1e\x19\x30\
-\x3f\x13\x0d\x0d\x18\x27\x1e\x19\x30\x3f\x00\x00\x01\x00\x3e\x00\
-\x3e\x02\x1a\x02\x24\x00\x0b\x00\x27\xba\x00\x00\x00\x0c\x00\x0d\
-\x11\x12\x39\x00\xbb\x00\x02\x00\x08\x00\x03\x00\x04\x2b\xb8\x00\
-\x03\x10\xb8\x00\x07\xd0\xb8\x00\x02\x10\xb8\x00\x0a\xd0\x30\x31\
-\x25\x35\x23\x35\x33\x35\x33\x15\x33\x15\x23\x15\x01\x06\xc8\xc8\
-\x4c\xc8\xc8\x3e\xd1\x44\xd1\xd1\x44\xd1\x00\x00\x01\x00\x3e\x01\
-\x0f\x02\x1a\x01\x53\x00\x03\x00\x17\xba\x00\x00\x00\x04\x00\x05\
-\x11\x12\x39\x00\xbb\x00\x01\x00\x08\x00\x00\x00\x04\x2b\x30\x31\
-\x13\x35\x21\x15\x3e\x01\xdc\x01\x0f\x44\x44\x00\x02\x00\x3e\x00\
-\x00\x02\x1a\x02\x6a\x00\x0b\x00\x0f\x00\x43\xba\x00\x00\x00\x10\
-\x00\x11\x11\x12\x39\xb8\x00\x0c\xd0\x00\xbb\x00\x03\x00\x08\x00\
-\x02\x00\x04\x2b\xbb\x00\x0d\x00\x08\x00\x0c\x00\x04\x2b\xba\x00\
-\x00\x00\x02\x00\x0d\x11\x12\x39\xb8\x00\x00\x2f\xb8\x00\x03\x10\
-\xb8\x00\x07\xd0\xb8\x00\x02\x10\xb8\x00\x0a\xd0\x30\x31\x25\x35\
-\x23\x35\x33\x35\x33\x15\x33\x15\x23\x15\x05\x35\x21\x15\x01\x06\
-\xc8\xc8\x4c\xc8\xc8\xfe\xec\x01\xdc\x98\xc7\x44\xc7\xc7\x44\xc7\
-\x98\x44\x44\x00\x01\x00\x58\x00\x5d\x02\x00\x02\x05\x00\x0b\x00\
-\x2f\xba\x00\x00\x00\x0c\x00\x0d\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x1a\x3e\x59\x30\x31\
-\x01\x07\x27\x37\x27\x37\x17\x37\x17\x07\x17\x07\x01\x2c\xa3\x31\
-\xa3\xa3\x31\xa3\xa3\x31\xa3\xa3\x31\x01\x00\xa3\x31\xa3\xa3\x31\
-\xa3\xa3\x31\xa3\xa3\x31\x00\x00\x03\x00\x3e\x00\x34\x02\x1a\x02\
-\x2e\x00\x03\x00\x11\x00\x1f\x00\x43\xba\x00\x04\x00\x20\x00\x21\
-\x11\x12\x39\xb8\x00\x04\x10\xb8\x00\x00\xd0\xb8\x00\x04\x10\xb8\
-\x00\x12\xd0\x00\xbb\x00\x01\x00\x08\x00\x00\x00\x04\x2b\xb8\x00\
-\x00\x10\xb8\x00\x0b\xdc\xb9\x00\x04\x00\x06\xf4\xb8\x00\x01\x10\
-\xb8\x00\x12\xdc\xb9\x00\x19\x00\x06\xf4\x30\x31\x13\x35\x21\x15\
-\x07\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x03\x22\
-\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x3e\x01\xdc\xee\
-\x23\x1b\x1b\x23\x23\x1b\x1b\x23\x23\x1b\x1b\x23\x23\x1b\x1b\x01\
-\x0f\x44\x44\xdb\x1c\x14\x16\x14\x1c\x1c\x14\x16\x14\x1c\x01\x84\
-\x1c\x14\x16\x14\x1c\x1c\x14\x16\x14\x1c\x00\x00\x02\x00\x3e\x00\
-\xac\x02\x1a\x01\xb8\x00\x03\x00\x07\x00\x29\xba\x00\x04\x00\x08\
-\x00\x09\x11\x12\x39\xb8\x00\x04\x10\xb8\x00\x00\xd0\x00\xbb\x00\
-\x01\x00\x08\x00\x00\x00\x04\x2b\xbb\x00\x05\x00\x08\x00\x04\x00\
-\x04\x2b\x30\x31\x13\x35\x21\x15\x05\x35\x21\x15\x3e\x01\xdc\xfe\
-\x24\x01\xdc\x01\x74\x44\x44\xc8\x44\x44\x00\xff\xff\x00\x34\x00\
-\x8b\x02\x24\x01\xd9\x02\x26\x00\x7d\x00\x64\x00\x06\x00\x7d\x00\
-\x9e\x00\x00\x00\x01\x00\x3e\x00\x48\x02\x1a\x02\x1c\x00\x13\x00\
-\x51\xba\x00\x0f\x00\x14\x00\x15\x11\x12\x39\x00\xbb\x00\x07\x00\
-\x08\x00\x06\x00\x04\x2b\xbb\x00\x03\x00\x08\x00\x02\x00\x04\x2b\
-\xb8\x00\x02\x10\xb8\x00\x00\xdc\xb8\x00\x07\x10\xb8\x00\x09\xdc\
-\xb8\x00\x07\x10\xb8\x00\x0b\xd0\xb8\x00\x06\x10\xb8\x00\x0e\xd0\
-\xb8\x00\x03\x10\xb8\x00\x0f\xd0\xb8\x00\x02\x10\xb8\x00\x12\xd0\
-\x30\x31\x3f\x01\x23\x35\x33\x37\x23\x35\x21\x37\x33\x07\x33\x15\
-\x23\x07\x33\x15\x21\x07\x89\x37\x82\xa7\x47\xee\x01\x13\x36\x48\
-\x37\x82\xa7\x47\xee\xfe\xed\x36\x48\x64\x44\x84\x44\x64\x64\x44\
-\x84\x44\x64\x00\x01\x00\x55\x00\x10\x02\x03\x02\x52\x00\x07\x00\
-\x15\xba\x00\x05\x00\x08\x00\x09\x11\x12\x39\x00\xba\x00\x07\x00\
-\x02\x00\x03\x2b\x30\x31\x13\x35\x25\x15\x05\x15\x05\x15\x55\x01\
-\xae\xfe\x9d\x01\x63\x01\x09\x50\xf9\x53\xc9\x08\xc9\x55\x00\x00\
-\x01\x00\x55\x00\x10\x02\x03\x02\x52\x00\x07\x00\x15\xba\x00\x01\
-\x00\x08\x00\x09\x11\x12\x39\x00\xba\x00\x07\x00\x04\x00\x03\x2b\
-\x30\x31\x37\x25\x35\x25\x35\x05\x15\x05\x55\x01\x63\xfe\x9d\x01\
-\xae\xfe\x52\x63\xc9\x08\xc9\x55\xf9\x50\xf9\x00\x02\x00\x55\x00\
-\x00\x02\x03\x02\x51\x00\x03\x00\x0b\x00\x2c\xba\x00\x06\x00\x0c\
-\x00\x0d\x11\x12\x39\xb8\x00\x06\x10\xb8\x00\x00\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\
-\x00\x01\x00\x08\xf4\x30\x31\x33\x35\x21\x15\x11\x05\x15\x05\x15\
-\x25\x35\x25\x55\x01\xae\xfe\x9d\x01\x63\xfe\x52\x01\xae\x44\x44\
-\x02\x01\x98\x07\x97\x52\xbf\x59\xc0\x00\x00\x00\x02\x00\x55\x00\
-\x00\x02\x03\x02\x51\x00\x07\x00\x0b\x00\x2c\xba\x00\x01\x00\x0c\
-\x00\x0d\x11\x12\x39\xb8\x00\x01\x10\xb8\x00\x0b\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x0e\x3e\x59\xb9\
-\x00\x08\x00\x08\xf4\x30\x31\x37\x25\x35\x25\x35\x05\x15\x05\x15\
-\x21\x15\x21\x55\x01\x63\xfe\x9d\x01\xae\xfe\x52\x01\xae\xfe\x52\
-\xc9\x98\x07\x97\x52\xbf\x59\xc0\x35\x44\x00\x00\x01\x00\xe2\x00\
-\xeb\x01\x76\x01\x75\x00\x0d\x00\x17\xba\x00\x00\x00\x0e\x00\x0f\
-\x11\x12\x39\x00\xbb\x00\x07\x00\x09\x00\x00\x00\x04\x2b\x30\x31\
-\x25\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x01\x2c\
-\x29\x21\x21\x29\x29\x21\x21\xeb\x22\x1a\x12\x1a\x22\x22\x1a\x12\
-\x1a\x22\x00\x00\x01\x00\xb2\x00\xba\x01\xa6\x01\xa6\x00\x0d\x00\
-\x15\xba\x00\x00\x00\x0e\x00\x0f\x11\x12\x39\x00\xba\x00\x07\x00\
-\x00\x00\x03\x2b\x30\x31\x25\x22\x26\x3d\x01\x34\x36\x33\x32\x16\
-\x1d\x01\x14\x06\x01\x2c\x43\x37\x37\x43\x43\x37\x37\xba\x3c\x2c\
-\x1c\x2c\x3c\x3c\x2c\x1c\x2c\x3c\x00\x00\x00\x00\x02\x00\x2a\x00\
-\x00\x02\x2f\x02\xba\x00\x05\x00\x0b\x00\x47\xba\x00\x0b\x00\x0c\
-\x00\x0d\x11\x12\x39\xb8\x00\x0b\x10\xb8\x00\x00\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\
-\xb8\x00\x02\x10\xb8\x00\x09\xd0\xb8\x00\x00\x10\xb8\x00\x0b\xd0\
-\x30\x31\x21\x03\x13\x33\x13\x03\x27\x13\x03\x23\x03\x13\x01\x04\
-\xda\xda\x51\xda\xda\x25\xab\xab\x07\xab\xab\x01\x5d\x01\x5d\xfe\
-\xa3\xfe\xa3\x4b\x01\x12\x01\x12\xfe\xee\xfe\xee\x00\x00\x00\x00\
-\x01\x00\x3e\x00\x4e\x02\x0a\x01\x53\x00\x05\x00\x17\xba\x00\x00\
-\x00\x06\x00\x07\x11\x12\x39\x00\xbb\x00\x03\x00\x08\x00\x02\x00\
-\x04\x2b\x30\x31\x25\x35\x21\x35\x21\x11\x01\xc5\xfe\x79\x01\xcc\
-\x4e\xc1\x44\xfe\xfb\x00\x00\x00\x01\x00\x18\x00\x00\x02\x3c\x02\
-\xba\x00\x0b\x00\x52\xba\x00\x06\x00\x0c\x00\x0d\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1c\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\
-\x0e\x3e\x59\xb8\x00\x03\x10\xb9\x00\x02\x00\x08\xf4\xb8\x00\x00\
-\x10\xb8\x00\x06\xdc\x30\x31\x33\x03\x23\x35\x33\x17\x13\x33\x1b\
-\x01\x33\x03\xfd\x7f\x66\xa3\x2d\x4d\x05\x51\x63\x4e\xcd\x01\xc4\
-\x40\xa5\xfe\xe4\x01\x1c\x01\x5b\xfd\x46\x00\x00\x01\x00\x23\xff\
-\x38\x02\x1b\x02\xe4\x00\x0d\x00\x3f\xba\x00\x09\x00\x0e\x00\x0f\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\
-\x06\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\
-\x00\x0d\x00\x10\x3e\x59\xb9\x00\x00\x00\x08\xf4\xb8\x00\x06\x10\
-\xb9\x00\x07\x00\x08\xf4\x30\x31\x17\x33\x11\x34\x36\x3b\x01\x15\
-\x23\x11\x14\x06\x2b\x01\x23\xd4\x37\x3b\xb2\xd4\x37\x3b\xb2\x84\
-\x02\xf2\x34\x42\x45\xfd\x0f\x34\x42\x00\x00\x00\x03\x00\x0b\x00\
-\x7e\x02\x4d\x01\xe4\x00\x19\x00\x26\x00\x33\x00\x71\xba\x00\x16\
-\x00\x34\x00\x35\x11\x12\x39\xb8\x00\x16\x10\xb8\x00\x1d\xd0\xb8\
-\x00\x16\x10\xb8\x00\x31\xd0\x00\xbb\x00\x20\x00\x08\x00\x06\x00\
-\x04\x2b\xbb\x00\x00\x00\x08\x00\x1a\x00\x04\x2b\xb8\x00\x1a\x10\
-\xb8\x00\x27\xd0\xba\x00\x09\x00\x20\x00\x27\x11\x12\x39\x7d\xb8\
-\x00\x09\x2f\x18\xb8\x00\x06\x10\xb8\x00\x0d\xd0\xb8\x00\x00\x10\
-\xb8\x00\x13\xd0\xb8\x00\x20\x10\xb8\x00\x2e\xd0\xba\x00\x16\x00\
-\x1a\x00\x2e\x11\x12\x39\x7c\xb8\x00\x16\x2f\x18\x30\x31\x37\x22\
-\x26\x35\x34\x36\x33\x32\x16\x17\x33\x3e\x01\x33\x32\x16\x15\x14\
-\x06\x23\x22\x26\x27\x23\x0e\x01\x27\x32\x36\x37\x2e\x01\x23\x22\
-\x06\x1d\x01\x14\x16\x21\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x07\
-\x1e\x01\x9d\x46\x4c\x52\x48\x36\x4b\x16\x04\x0d\x42\x2b\x46\x4d\
-\x52\x48\x36\x4b\x16\x04\x0d\x43\x22\x22\x35\x10\x10\x35\x22\x24\
-\x2b\x2b\x01\x30\x24\x2b\x2b\x24\x22\x35\x10\x10\x35\x7e\x5e\x55\
-\x55\x5e\x3f\x46\x42\x43\x5e\x55\x55\x5e\x3f\x46\x42\x43\x3e\x40\
-\x37\x36\x3d\x2e\x2c\x36\x2c\x2e\x2e\x2c\x36\x2c\x2e\x40\x37\x36\
-\x3d\x00\x00\x00\x02\x00\x1a\xff\xf4\x02\x3e\x02\xc6\x00\x1e\x00\
-\x27\x00\x6f\xba\x00\x0e\x00\x28\x00\x29\x11\x12\x39\xb8\x00\x0e\
-\x10\xb8\x00\x23\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\
-\xb9\x00\x18\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\
-\x1b\xb9\x00\x0e\x00\x0e\x3e\x59\xb9\x00\x03\x00\x0a\xf4\xba\x00\
-\x1e\x00\x18\x00\x03\x11\x12\x39\xb8\x00\x1e\x2f\xb9\x00\x27\x00\
-\x0a\xf4\xba\x00\x08\x00\x03\x00\x27\x11\x12\x39\xba\x00\x09\x00\
-\x0e\x00\x1e\x11\x12\x39\xb8\x00\x18\x10\xb9\x00\x23\x00\x0a\xf4\
-\x30\x31\x37\x1e\x01\x33\x32\x3e\x02\x37\x17\x0e\x03\x23\x22\x2e\
-\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x21\x25\x35\x2e\x01\x23\
-\x22\x06\x07\x15\x91\x18\x4f\x34\x26\x3e\x31\x28\x10\x29\x12\x2e\
-\x3c\x4c\x2e\x3e\x65\x48\x27\x27\x48\x65\x3e\x3e\x65\x48\x27\xfe\
-\x53\x01\x36\x1a\x4e\x33\x33\x4e\x1a\x6d\x1e\x2d\x14\x24\x32\x1e\
-\x17\x21\x39\x2c\x19\x37\x60\x84\x4e\x4e\x84\x60\x37\x37\x60\x84\
-\x4e\x28\xcd\x1f\x29\x29\x1f\xcd\x00\x00\x00\x00\x02\x00\x46\xff\
-\xf4\x01\xfe\x02\xf0\x00\x23\x00\x2e\x00\x5f\xba\x00\x11\x00\x2f\
-\x00\x30\x11\x12\x39\xb8\x00\x11\x10\xb8\x00\x24\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\x1e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\
-\xb8\x00\x11\x10\xb9\x00\x24\x00\x08\xf4\xba\x00\x17\x00\x24\x00\
-\x00\x11\x12\x39\xb8\x00\x00\x10\xb9\x00\x1b\x00\x08\xf4\xba\x00\
-\x28\x00\x11\x00\x1b\x11\x12\x39\x30\x31\x05\x22\x26\x3d\x01\x0e\
-\x01\x07\x27\x3e\x01\x37\x11\x34\x3e\x02\x33\x32\x16\x15\x14\x06\
-\x07\x15\x14\x16\x33\x32\x36\x37\x17\x0e\x03\x03\x22\x06\x1d\x01\
-\x3e\x01\x3d\x01\x34\x26\x01\x41\x50\x52\x0e\x1b\x0f\x21\x16\x2e\
-\x15\x15\x27\x37\x21\x45\x48\x6c\x66\x2d\x2a\x2c\x37\x1c\x3a\x0c\
-\x21\x2f\x3c\x32\x1f\x27\x42\x45\x24\x0c\x5f\x4c\x18\x0b\x11\x09\
-\x36\x0e\x1c\x11\x01\x28\x36\x4b\x2f\x15\x56\x51\x63\xad\x5a\x2d\
-\x44\x37\x38\x33\x23\x1d\x33\x25\x16\x02\xb9\x35\x46\xfd\x43\x84\
-\x43\x11\x33\x2a\x00\x00\x00\x00\x04\x00\x2b\x00\x00\x02\x4d\x02\
-\xc2\x00\x07\x00\x15\x00\x23\x00\x27\x00\xb0\xba\x00\x10\x00\x28\
-\x00\x29\x11\x12\x39\xb8\x00\x10\x10\xb8\x00\x02\xd0\xb8\x00\x10\
-\x10\xb8\x00\x21\xd0\xb8\x00\x10\x10\xb8\x00\x24\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1c\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x0e\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\
-\x0e\x3e\x59\xbb\x00\x25\x00\x03\x00\x24\x00\x04\x2b\xb8\x00\x25\
-\x10\xb8\x00\x00\xdc\xb8\x00\x11\x10\xb8\x00\x0c\xdc\xb8\x00\x09\
-\x10\xb8\x00\x14\xdc\xb8\x00\x00\x10\xb9\x00\x16\x00\x03\xf4\xb8\
-\x00\x04\x10\xb9\x00\x1d\x00\x03\xf4\x30\x31\x01\x22\x35\x34\x33\
-\x32\x15\x14\x01\x11\x33\x1b\x01\x33\x11\x33\x11\x23\x0b\x01\x23\
-\x11\x01\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x07\
-\x35\x33\x15\x01\xe1\x6c\x6c\x6c\xfd\xde\x7f\x33\x26\x06\x44\x7f\
-\x33\x26\x06\x01\x72\x1c\x12\x12\x1c\x1d\x11\x11\x4b\xd0\x01\x59\
-\xb5\xb4\xb4\xb5\xfe\xa7\x02\xba\xfe\xa3\xfe\xfd\x02\x60\xfd\x46\
-\x01\x5d\x01\x03\xfd\xa0\x01\x8f\x2e\x2b\x4b\x2b\x2e\x2e\x2b\x4b\
-\x2b\x2e\x8f\x39\x39\x00\x00\x00\x02\x00\x42\xff\xf4\x02\x16\x02\
-\xba\x00\x1d\x00\x2b\x00\x5f\xba\x00\x1e\x00\x2c\x00\x2d\x11\x12\
-\x39\xb8\x00\x1e\x10\xb8\x00\x05\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x18\x2f\x1b\xb9\x00\x18\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x0e\x3e\x59\xba\x00\x0f\x00\
-\x18\x00\x05\x11\x12\x39\xb8\x00\x0f\x2f\xb9\x00\x25\x00\x08\xf4\
-\xb8\x00\x05\x10\xb9\x00\x1e\x00\x08\xf4\xba\x00\x12\x00\x25\x00\
-\x1e\x11\x12\x39\x30\x31\x01\x14\x0e\x02\x23\x22\x2e\x02\x35\x34\
-\x3e\x02\x33\x32\x16\x17\x37\x2e\x03\x27\x33\x1e\x03\x03\x32\x36\
-\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x02\x16\x20\x3c\x55\
-\x35\x38\x59\x3d\x20\x20\x39\x4e\x2e\x3e\x4f\x19\x04\x11\x3d\x51\
-\x60\x34\x83\x27\x5b\x4e\x35\xea\x43\x52\x52\x43\x43\x52\x52\x01\
-\x10\x49\x6b\x46\x22\x24\x44\x5f\x3b\x3b\x60\x43\x24\x39\x27\x02\
-\x30\x53\x48\x3c\x19\x17\x43\x63\x8c\xfe\xc8\x4c\x4e\x46\x4e\x4c\
-\x4c\x4e\x46\x4e\x4c\x00\x00\x00\x02\x00\x54\xff\x8e\x02\x04\x02\
-\x76\x00\x1a\x00\x22\x00\x73\xba\x00\x1e\x00\x23\x00\x24\x11\x12\
-\x39\xb8\x00\x1e\x10\xb8\x00\x01\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x07\x2f\x1b\xb9\x00\x07\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xb8\x00\x07\x10\
-\xb8\x00\x09\xdc\xb8\x00\x07\x10\xb8\x00\x0a\xd0\xb8\x00\x07\x10\
-\xb9\x00\x1f\x00\x08\xf4\xb8\x00\x11\xd0\xb8\x00\x01\x10\xb9\x00\
-\x1e\x00\x08\xf4\xb8\x00\x12\xd0\xb8\x00\x01\x10\xb8\x00\x19\xd0\
-\xb8\x00\x01\x10\xb8\x00\x1a\xdc\x30\x31\x05\x35\x2e\x01\x35\x34\
-\x36\x37\x35\x33\x15\x1e\x01\x17\x07\x2e\x01\x27\x11\x3e\x01\x37\
-\x17\x0e\x01\x07\x15\x03\x14\x16\x17\x11\x0e\x01\x15\x01\x17\x5e\
-\x65\x66\x5d\x3e\x41\x52\x14\x40\x0d\x34\x27\x2b\x3b\x11\x39\x15\
-\x56\x44\xab\x38\x36\x36\x38\x72\x69\x0d\x8e\x70\x70\x8e\x0d\x69\
-\x67\x05\x41\x30\x22\x23\x2b\x05\xfe\x70\x05\x2e\x26\x27\x30\x42\
-\x05\x67\x01\x48\x3b\x53\x0b\x01\x8a\x0b\x53\x3b\x00\x00\x00\x00\
-\x01\x00\x46\xff\xf4\x02\x1a\x02\xc6\x00\x28\x00\x86\xba\x00\x00\
-\x00\x29\x00\x2a\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\
-\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x06\x10\xb9\x00\
-\x11\x00\x0b\xf4\xb8\x00\x00\x10\xb9\x00\x1e\x00\x0b\xf4\xba\x00\
-\x16\x00\x1e\x00\x11\x11\x12\x39\xb8\x00\x16\x2f\x41\x05\x00\x2f\
-\x00\x16\x00\x3f\x00\x16\x00\x02\x5d\xb9\x00\x15\x00\x08\xf4\xb8\
-\x00\x16\x10\xb9\x00\x19\x00\x04\xf4\x41\x03\x00\xdf\x00\x19\x00\
-\x01\x5d\x41\x03\x00\x0f\x00\x19\x00\x01\x5d\xb9\x00\x1a\x00\x08\
-\xf4\x30\x31\x05\x22\x26\x35\x34\x36\x33\x32\x1e\x02\x17\x07\x2e\
-\x03\x23\x22\x06\x07\x33\x15\x23\x15\x33\x15\x23\x1e\x01\x33\x32\
-\x3e\x02\x37\x17\x0e\x03\x01\x43\x80\x7d\x7d\x80\x30\x46\x32\x22\
-\x0d\x46\x09\x18\x21\x2f\x20\x48\x50\x0b\xe4\xe7\xe7\xe4\x0b\x50\
-\x48\x20\x2f\x21\x18\x09\x46\x0d\x22\x32\x46\x0c\xba\xaf\xaf\xba\
-\x1a\x2c\x37\x1c\x20\x18\x29\x1f\x12\x5e\x51\x45\x5c\x45\x51\x5e\
-\x12\x1f\x29\x18\x20\x1d\x36\x2c\x1a\x00\x00\x00\x01\xff\xd5\xff\
-\x38\x02\x62\x02\xba\x00\x15\x00\x5f\xba\x00\x06\x00\x16\x00\x17\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\
-\x09\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x14\x2f\x1b\xb9\
-\x00\x14\x00\x10\x3e\x59\xb9\x00\x01\x00\x08\xf4\xb8\x00\x09\x10\
-\xb9\x00\x0c\x00\x08\xf4\xba\x00\x03\x00\x0c\x00\x01\x11\x12\x39\
-\xb8\x00\x03\x2f\xb9\x00\x04\x00\x08\xf4\xb8\x00\x0d\xd0\xb8\x00\
-\x03\x10\xb8\x00\x10\xd0\x30\x31\x07\x33\x13\x23\x37\x33\x37\x3e\
-\x01\x3b\x01\x07\x23\x07\x33\x07\x23\x03\x0e\x01\x2b\x01\x1f\xd3\
-\x53\xb9\x0b\xba\x18\x09\x3c\x3b\xb7\x0c\xd4\x20\xb9\x0b\xb9\x4c\
-\x09\x3c\x3b\xb6\x84\x01\xf6\x44\x93\x34\x3d\x45\xbf\x44\xfe\x37\
-\x34\x3d\x00\x00\x01\x00\x34\x00\x00\x02\x26\x02\xc6\x00\x2c\x00\
-\x63\xba\x00\x19\x00\x2d\x00\x2e\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x12\x2f\x1b\xb9\x00\x12\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\
-\x12\x10\xb9\x00\x19\x00\x0b\xf4\xb8\x00\x00\x10\xb9\x00\x2a\x00\
-\x0b\xf4\xba\x00\x08\x00\x19\x00\x2a\x11\x12\x39\xb8\x00\x08\x2f\
-\xb9\x00\x09\x00\x08\xf4\xb8\x00\x1f\xd0\xb8\x00\x08\x10\xb8\x00\
-\x22\xd0\x30\x31\x33\x35\x3e\x01\x35\x34\x26\x27\x23\x35\x33\x2e\
-\x01\x35\x34\x3e\x02\x33\x32\x16\x17\x07\x2e\x01\x23\x22\x06\x15\
-\x14\x16\x17\x33\x15\x23\x16\x15\x14\x0e\x02\x07\x15\x21\x15\x4b\
-\x2a\x25\x03\x02\x61\x4e\x0b\x15\x20\x3d\x57\x36\x50\x69\x21\x3f\
-\x1c\x4b\x39\x42\x4d\x13\x0b\xc9\xb6\x03\x0f\x18\x1d\x0e\x01\x80\
-\x69\x11\x44\x2f\x0d\x18\x0c\x45\x22\x44\x2a\x2e\x4e\x38\x1f\x3f\
-\x33\x2d\x29\x2d\x42\x4d\x29\x42\x20\x45\x14\x13\x1f\x33\x29\x1e\
-\x09\x05\x50\x00\x03\x00\x32\xff\x8f\x02\x28\x03\x2b\x00\x27\x00\
-\x2e\x00\x35\x00\xa7\xba\x00\x07\x00\x36\x00\x37\x11\x12\x39\xb8\
-\x00\x07\x10\xb8\x00\x2b\xd0\xb8\x00\x07\x10\xb8\x00\x33\xd0\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb9\x00\x07\x00\x0b\xf4\xb8\x00\x11\x10\xb9\x00\x2c\x00\
-\x0b\xf4\xba\x00\x08\x00\x2c\x00\x00\x11\x12\x39\xb8\x00\x11\x10\
-\xb8\x00\x12\xdc\xb8\x00\x11\x10\xb8\x00\x14\xd0\xb8\x00\x2c\x10\
-\xb8\x00\x1b\xd0\xb8\x00\x07\x10\xb8\x00\x33\xd0\xba\x00\x1c\x00\
-\x14\x00\x33\x11\x12\x39\xb8\x00\x00\x10\xb8\x00\x25\xd0\xb8\x00\
-\x00\x10\xb8\x00\x27\xdc\xba\x00\x2b\x00\x11\x00\x07\x11\x12\x39\
-\xba\x00\x32\x00\x1b\x00\x25\x11\x12\x39\x30\x31\x05\x2e\x01\x27\
-\x37\x1e\x01\x17\x11\x27\x2e\x03\x35\x34\x36\x37\x35\x33\x15\x1e\
-\x01\x17\x07\x2e\x01\x27\x15\x17\x1e\x03\x15\x14\x06\x07\x15\x23\
-\x03\x14\x16\x17\x35\x0e\x01\x01\x34\x26\x27\x15\x3e\x01\x01\x17\
-\x53\x6e\x24\x3d\x24\x50\x35\x17\x34\x46\x2a\x12\x6d\x5f\x3e\x45\
-\x65\x26\x3f\x1b\x45\x32\x1e\x33\x46\x2b\x12\x6d\x66\x3e\x7b\x39\
-\x43\x3c\x40\x01\x3b\x3d\x46\x3f\x44\x0b\x05\x43\x32\x32\x2d\x32\
-\x05\x01\x05\x04\x09\x25\x33\x3f\x22\x55\x61\x07\x66\x66\x05\x39\
-\x33\x2d\x24\x2c\x05\xf5\x05\x09\x24\x33\x40\x23\x58\x6a\x08\x66\
-\x02\x79\x31\x38\x0e\xec\x06\x3b\xfe\x82\x36\x38\x0c\xfa\x07\x42\
-\x00\x00\x00\x00\x01\x00\x16\x00\x00\x02\x42\x02\xba\x00\x13\x00\
-\x76\xba\x00\x08\x00\x14\x00\x15\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\x0e\x3e\x59\xb9\
-\x00\x00\x00\x0b\xf4\xba\x00\x03\x00\x06\x00\x13\x11\x12\x39\xb8\
-\x00\x03\x2f\xb9\x00\x04\x00\x0b\xf4\xb8\x00\x08\xd0\xb8\x00\x04\
-\x10\xb8\x00\x0c\xd0\xb8\x00\x03\x10\xb8\x00\x0f\xd0\xb8\x00\x00\
-\x10\xb8\x00\x10\xd0\x30\x31\x37\x33\x35\x23\x35\x33\x03\x33\x13\
-\x33\x13\x33\x03\x33\x15\x23\x15\x33\x15\x21\x4b\xb9\xb9\x8d\xc2\
-\x5d\xb8\x04\xb8\x5b\xc2\x8d\xb9\xb9\xfe\x3e\x45\xba\x45\x01\x76\
-\xfe\x8a\x01\x76\xfe\x8a\x45\xba\x45\x00\x00\x00\x05\x00\x58\xff\
-\x8f\x02\x1a\x03\x2b\x00\x1b\x00\x1f\x00\x27\x00\x2b\x00\x33\x00\
-\xb5\xba\x00\x2c\x00\x34\x00\x35\x11\x12\x39\xb8\x00\x2c\x10\xb8\
-\x00\x1b\xd0\xb8\x00\x2c\x10\xb8\x00\x1c\xd0\xb8\x00\x2c\x10\xb8\
-\x00\x20\xd0\xb8\x00\x2c\x10\xb8\x00\x28\xd0\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\x00\
-\x01\xdc\xb8\x00\x04\x10\xb8\x00\x06\xdc\xb8\x00\x04\x10\xb8\x00\
-\x08\xd0\xb8\x00\x03\x10\xb9\x00\x2b\x00\x08\xf4\xba\x00\x1f\x00\
-\x04\x00\x2b\x11\x12\x39\xb8\x00\x1f\x2f\xb8\x00\x20\xd0\xb8\x00\
-\x1f\x10\xb9\x00\x2a\x00\x08\xf4\xb8\x00\x33\xd0\xba\x00\x0f\x00\
-\x20\x00\x33\x11\x12\x39\xb8\x00\x03\x10\xb8\x00\x1b\xd0\xb8\x00\
-\x04\x10\xb9\x00\x1e\x00\x08\xf4\xb8\x00\x27\xd0\xb8\x00\x2b\x10\
-\xb8\x00\x2c\xd0\x30\x31\x05\x23\x35\x23\x11\x33\x35\x33\x15\x33\
-\x32\x16\x15\x14\x06\x07\x15\x1e\x03\x15\x14\x0e\x02\x2b\x01\x03\
-\x35\x23\x15\x33\x32\x36\x3d\x01\x34\x26\x23\x03\x11\x23\x11\x33\
-\x32\x36\x3d\x01\x34\x26\x23\x01\x46\x3e\xb0\xb0\x3e\x08\x5a\x66\
-\x40\x31\x1a\x2e\x22\x13\x1c\x33\x45\x28\x18\x3d\x5f\x9b\x39\x3c\
-\x3c\x39\x3c\x5f\x9b\x3f\x41\x41\x3f\x71\x71\x02\xba\x71\x71\x62\
-\x52\x43\x47\x10\x03\x08\x1a\x27\x34\x23\x2a\x4a\x36\x1f\x01\x8a\
-\xe9\xe9\x2f\x30\x29\x30\x31\xfd\xd4\x01\x00\xff\x00\x34\x36\x2c\
-\x35\x35\x00\x00\x03\x00\x46\xff\x8f\x02\x1a\x03\x2b\x00\x28\x00\
-\x32\x00\x39\x00\xb7\xba\x00\x00\x00\x3a\x00\x3b\x11\x12\x39\xb8\
-\x00\x2c\xd0\xb8\x00\x00\x10\xb8\x00\x36\xd0\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\
-\x03\xdc\xb8\x00\x0f\x10\xb9\x00\x29\x00\x08\xf4\xba\x00\x05\x00\
-\x00\x00\x29\x11\x12\x39\xb8\x00\x00\x10\xb9\x00\x2f\x00\x08\xf4\
-\xba\x00\x0b\x00\x0f\x00\x2f\x11\x12\x39\xb8\x00\x0f\x10\xb8\x00\
-\x0d\xdc\xb8\x00\x13\xd0\xba\x00\x15\x00\x0f\x00\x2f\x11\x12\x39\
-\xba\x00\x1c\x00\x29\x00\x00\x11\x12\x39\xba\x00\x1d\x00\x2f\x00\
-\x0f\x11\x12\x39\xba\x00\x26\x00\x00\x00\x29\x11\x12\x39\xb8\x00\
-\x03\x10\xb8\x00\x28\xd0\xba\x00\x35\x00\x2f\x00\x0f\x11\x12\x39\
-\xba\x00\x36\x00\x29\x00\x00\x11\x12\x39\x30\x31\x05\x26\x27\x07\
-\x23\x37\x2e\x01\x35\x34\x36\x3f\x01\x33\x07\x33\x32\x16\x17\x37\
-\x33\x07\x1e\x01\x17\x07\x2e\x01\x27\x03\x3e\x01\x37\x17\x0e\x03\
-\x0f\x01\x23\x13\x2a\x01\x07\x03\x16\x17\x13\x2e\x01\x03\x14\x17\
-\x13\x0e\x01\x15\x01\x28\x20\x19\x0c\x3e\x0f\x38\x36\x59\x5b\x0c\
-\x3e\x0b\x0a\x0d\x18\x0b\x0b\x3e\x0d\x29\x31\x11\x44\x09\x17\x11\
-\x3a\x2d\x2e\x10\x44\x0c\x1e\x2a\x39\x27\x0b\x3e\x26\x05\x09\x05\
-\x3b\x19\x23\x3d\x0a\x15\xb6\x27\x34\x2e\x2d\x0b\x03\x09\x72\x91\
-\x2a\xa0\x73\x94\xb3\x19\x6e\x65\x02\x02\x69\x7d\x16\x45\x26\x1e\
-\x17\x29\x0f\xfd\xdf\x0b\x3d\x27\x1f\x1a\x32\x29\x1d\x05\x67\x02\
-\xf2\x01\xfd\xcc\x0f\x03\x02\x42\x02\x03\xfe\xa3\x69\x3d\x01\xf0\
-\x1a\x6f\x4f\x00\x01\x00\x34\x00\x00\x02\x26\x02\xc6\x00\x31\x00\
-\x82\xba\x00\x1d\x00\x32\x00\x33\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x16\x2f\x1b\xb9\x00\x16\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xbb\x00\
-\x2a\x00\x04\x00\x25\x00\x04\x2b\x41\x03\x00\x0f\x00\x2a\x00\x01\
-\x5d\xb8\x00\x2a\x10\xb9\x00\x2b\x00\x08\xf4\xb8\x00\x06\xd0\xb8\
-\x00\x2a\x10\xb8\x00\x07\xd0\xb8\x00\x25\x10\xb8\x00\x0c\xd0\xb8\
-\x00\x25\x10\xb9\x00\x24\x00\x08\xf4\xb8\x00\x0d\xd0\xb8\x00\x16\
-\x10\xb9\x00\x1d\x00\x0b\xf4\xb8\x00\x01\x10\xb9\x00\x30\x00\x0b\
-\xf4\x30\x31\x29\x01\x35\x3e\x01\x37\x23\x35\x33\x2e\x01\x27\x23\
-\x35\x33\x2e\x01\x35\x34\x3e\x02\x33\x32\x16\x17\x07\x2e\x01\x23\
-\x22\x06\x15\x14\x16\x17\x33\x15\x23\x1e\x01\x17\x33\x15\x23\x0e\
-\x01\x07\x15\x21\x02\x1a\xfe\x31\x23\x25\x05\x64\x63\x03\x0b\x07\
-\x4e\x39\x05\x06\x20\x3d\x57\x36\x50\x69\x21\x3f\x1c\x4b\x39\x42\
-\x4d\x05\x04\xde\xca\x07\x0c\x02\xb5\xb6\x08\x2f\x18\x01\x80\x69\
-\x0e\x36\x24\x41\x16\x28\x14\x41\x12\x27\x15\x2e\x4e\x38\x1f\x3f\
-\x33\x2d\x29\x2d\x42\x4d\x14\x24\x11\x41\x14\x28\x16\x41\x2e\x3e\
-\x10\x05\x00\x00\x03\x00\x1b\x00\x00\x02\x3d\x02\xba\x00\x1b\x00\
-\x1f\x00\x23\x00\xc3\xba\x00\x00\x00\x24\x00\x25\x11\x12\x39\xb8\
-\x00\x1c\xd0\xb8\x00\x00\x10\xb8\x00\x23\xd0\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x10\x2f\x1b\xb9\x00\x10\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x1b\x2f\x1b\xb9\x00\x1b\x00\x0e\x3e\x59\
-\xbb\x00\x09\x00\x04\x00\x06\x00\x04\x2b\xb8\x00\x06\x10\xb9\x00\
-\x05\x00\x08\xf4\xb8\x00\x01\xd0\xb8\x00\x09\x10\xb9\x00\x0a\x00\
-\x08\xf4\xb8\x00\x0e\xd0\xb8\x00\x0a\x10\xb8\x00\x12\xd0\xb8\x00\
-\x09\x10\xb8\x00\x15\xd0\xb8\x00\x06\x10\xb8\x00\x16\xd0\xb8\x00\
-\x05\x10\xb8\x00\x19\xd0\xb8\x00\x0c\x10\xb8\x00\x1e\xd0\xb8\x00\
-\x06\x10\xb8\x00\x1f\xd0\xb8\x00\x1b\x10\xb8\x00\x20\xd0\xb8\x00\
-\x09\x10\xb8\x00\x23\xd0\x30\x31\x25\x23\x15\x23\x35\x23\x35\x33\
-\x35\x23\x35\x33\x35\x33\x17\x33\x35\x33\x15\x33\x15\x23\x15\x33\
-\x15\x23\x15\x23\x0b\x01\x23\x11\x05\x33\x11\x23\x01\x2a\x88\x46\
-\x41\x41\x41\x41\x7d\x55\x88\x46\x41\x41\x41\x41\x7d\x69\x6d\x07\
-\x01\x0d\x07\x74\xf8\xf8\xf4\x41\x50\x41\xf4\xf8\xf8\xf4\x41\x50\
-\x41\xf4\x01\x30\x01\x3e\xfe\xc2\xe4\x01\x3e\x00\x02\x00\x31\xff\
-\xf4\x02\x4d\x02\xba\x00\x39\x00\x43\x00\xa2\xba\x00\x3d\x00\x44\
-\x00\x45\x11\x12\x39\xb8\x00\x3d\x10\xb8\x00\x36\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x33\x2f\x1b\xb9\x00\x33\x00\x0e\x3e\
-\x59\xba\x00\x43\x00\x01\x00\x00\x11\x12\x39\xb8\x00\x43\x2f\xb9\
-\x00\x38\x00\x08\xf4\xba\x00\x08\x00\x43\x00\x38\x11\x12\x39\xb8\
-\x00\x33\x10\xb9\x00\x0c\x00\x08\xf4\xba\x00\x1b\x00\x01\x00\x43\
-\x11\x12\x39\xb8\x00\x1b\x2f\xb9\x00\x22\x00\x08\xf4\xba\x00\x14\
-\x00\x22\x00\x33\x11\x12\x39\xba\x00\x2a\x00\x1b\x00\x0c\x11\x12\
-\x39\xb8\x00\x01\x10\xb9\x00\x42\x00\x0b\xf4\x30\x31\x33\x11\x33\
-\x32\x16\x15\x14\x06\x07\x17\x1e\x01\x33\x32\x36\x35\x34\x2e\x02\
-\x2f\x01\x2e\x01\x35\x34\x36\x33\x32\x16\x17\x07\x2e\x01\x23\x22\
-\x06\x15\x14\x1e\x02\x1f\x01\x1e\x03\x15\x14\x06\x23\x22\x26\x2f\
-\x01\x23\x11\x13\x32\x36\x3d\x01\x34\x26\x2b\x01\x15\x31\x81\x5c\
-\x50\x2e\x36\x58\x11\x2d\x26\x24\x28\x07\x0e\x14\x0d\x13\x20\x2a\
-\x3f\x3b\x19\x30\x17\x20\x0d\x1e\x11\x19\x1a\x06\x0d\x14\x0f\x0f\
-\x10\x1d\x15\x0c\x4d\x51\x3a\x53\x18\x5d\x2c\x2a\x33\x2e\x2e\x33\
-\x2a\x02\xba\x61\x5a\x44\x58\x11\xd0\x27\x24\x21\x21\x0e\x15\x13\
-\x13\x0d\x13\x20\x3d\x2a\x31\x42\x0f\x11\x36\x0a\x0c\x1b\x18\x0b\
-\x13\x13\x16\x0f\x0f\x10\x1d\x20\x25\x19\x3c\x49\x2e\x3b\xe5\xfe\
-\xbe\x01\x88\x30\x2e\x2e\x2e\x30\xea\x00\x00\x00\x03\x00\x1a\x00\
-\x00\x02\x3e\x02\xba\x00\x1b\x00\x1f\x00\x23\x00\xc3\xba\x00\x19\
-\x00\x24\x00\x25\x11\x12\x39\xb8\x00\x19\x10\xb8\x00\x1d\xd0\xb8\
-\x00\x19\x10\xb8\x00\x22\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x08\
-\x2f\x1b\xb9\x00\x08\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x0c\x2f\x1b\xb9\x00\x0c\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x1b\x2f\x1b\xb9\x00\x1b\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x17\x2f\x1b\xb9\x00\x17\x00\x0e\x3e\x59\xbb\x00\x05\x00\
-\x04\x00\x02\x00\x04\x2b\xb8\x00\x02\x10\xb9\x00\x01\x00\x08\xf4\
-\xb8\x00\x05\x10\xb9\x00\x06\x00\x08\xf4\xb8\x00\x0a\xd0\xb8\x00\
-\x06\x10\xb8\x00\x0e\xd0\xb8\x00\x05\x10\xb8\x00\x11\xd0\xb8\x00\
-\x02\x10\xb8\x00\x12\xd0\xb8\x00\x01\x10\xb8\x00\x15\xd0\xb8\x00\
-\x05\x10\xb8\x00\x1e\xd0\xb8\x00\x1b\x10\xb8\x00\x1f\xd0\xb8\x00\
-\x1e\x10\xb8\x00\x22\xd0\xb8\x00\x1f\x10\xb8\x00\x23\xd0\x30\x31\
-\x37\x23\x35\x33\x27\x23\x35\x33\x27\x33\x17\x21\x37\x33\x07\x33\
-\x15\x23\x07\x33\x15\x23\x07\x23\x03\x23\x03\x23\x37\x13\x23\x13\
-\x21\x13\x23\x13\x59\x3f\x3d\x03\x3a\x38\x07\x4b\x03\x01\x28\x03\
-\x49\x07\x38\x3a\x03\x3d\x3f\x08\x82\x41\x10\x41\x82\x50\x36\x4d\
-\x06\x01\x1a\x06\x4d\x36\xf8\x41\x56\x41\xea\xef\xef\xea\x41\x56\
-\x41\xf8\x01\x94\xfe\x6c\x4a\x01\x4a\xfe\xb6\x01\x4a\xfe\xb6\x00\
-\x02\x00\x3b\x00\x00\x02\x21\x02\xba\x00\x11\x00\x23\x00\x75\xba\
-\x00\x02\x00\x24\x00\x25\x11\x12\x39\xb8\x00\x02\x10\xb8\x00\x1b\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\
-\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\
-\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x12\x2f\x1b\xb9\x00\
-\x12\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\
-\x00\x11\x00\x0e\x3e\x59\xb8\x00\x13\x10\xb9\x00\x22\x00\x08\xf4\
-\xb8\x00\x00\xdc\xb8\x00\x11\x10\xb9\x00\x02\x00\x08\xf4\xb8\x00\
-\x1b\xdc\x30\x31\x13\x33\x11\x33\x32\x3e\x02\x35\x11\x33\x11\x14\
-\x0e\x02\x2b\x02\x11\x33\x32\x1e\x02\x15\x11\x23\x11\x34\x2e\x02\
-\x2b\x01\x11\xc4\x4c\x54\x15\x28\x20\x13\x4d\x1c\x32\x46\x29\xa0\
-\x89\xa2\x29\x45\x31\x1c\x4c\x13\x1f\x28\x15\x55\x02\x27\xfe\x19\
-\x0c\x1c\x2d\x21\x02\x04\xfe\x0c\x32\x4a\x32\x18\x02\xba\x18\x32\
-\x4a\x32\xfe\x9f\x01\x71\x21\x2d\x1c\x0c\xfd\x86\x00\x00\x00\x00\
-\x03\x00\x52\x00\x00\x02\x2c\x02\xe4\x00\x1a\x00\x2c\x00\x30\x00\
-\xb7\xba\x00\x1b\x00\x31\x00\x32\x11\x12\x39\xb8\x00\x1b\x10\xb8\
-\x00\x04\xd0\xb8\x00\x1b\x10\xb8\x00\x2d\xd0\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\x1e\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x2d\x2f\x1b\xb9\x00\x2d\x00\x0e\x3e\x59\xb8\x00\
-\x13\x10\xb8\x00\x12\xdc\xb9\x00\x0f\x00\x08\xf4\xb8\x00\x0a\xdc\
-\x41\x03\x00\xc0\x00\x0a\x00\x01\x5d\xb9\x00\x26\x00\x08\xf4\xb8\
-\x00\x2d\x10\xb9\x00\x2e\x00\x08\xf4\xb8\x00\x04\xdc\x41\x07\x00\
-\xaf\x00\x04\x00\xbf\x00\x04\x00\xcf\x00\x04\x00\x03\x5d\xba\x00\
-\x00\x00\x26\x00\x04\x11\x12\x39\xb9\x00\x1b\x00\x08\xf4\xba\x00\
-\x0e\x00\x0a\x00\x1b\x11\x12\x39\xb8\x00\x12\x10\xb8\x00\x15\xd0\
-\xb8\x00\x0f\x10\xb8\x00\x18\xd0\xba\x00\x1a\x00\x1b\x00\x04\x11\
-\x12\x39\xb8\x00\x1a\x2f\x30\x31\x25\x23\x0e\x01\x23\x22\x26\x35\
-\x34\x36\x33\x32\x16\x17\x33\x35\x23\x35\x33\x35\x33\x15\x33\x15\
-\x23\x11\x23\x27\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\x06\x1d\
-\x01\x14\x16\x07\x35\x21\x15\x01\x9b\x04\x16\x47\x32\x55\x60\x60\
-\x55\x32\x47\x16\x04\x99\x99\x4c\x45\x45\x4c\x75\x18\x2a\x20\x13\
-\x13\x20\x2a\x18\x3e\x44\x44\x96\x01\xb4\xd0\x26\x28\x6f\x68\x69\
-\x6f\x28\x26\x88\x3d\x3c\x3c\x3d\xfe\x20\x37\x0d\x18\x22\x15\x77\
-\x15\x22\x18\x0d\x3f\x36\x45\x36\x3f\xc2\x44\x44\x00\x00\x00\x00\
-\x01\x00\x1c\x00\x00\x02\x32\x02\xba\x00\x13\x00\x81\xba\x00\x0c\
-\x00\x14\x00\x15\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\
-\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x0a\x2f\x1b\xb9\x00\x0a\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\x0e\x3e\x59\xba\x00\x03\x00\
-\x06\x00\x01\x11\x12\x39\xb8\x00\x03\x2f\xb9\x00\x04\x00\x08\xf4\
-\xb8\x00\x08\xd0\xb8\x00\x04\x10\xb8\x00\x0c\xd0\xb8\x00\x03\x10\
-\xb8\x00\x0f\xd0\xb8\x00\x03\x10\xb8\x00\x13\xd0\x30\x31\x33\x23\
-\x11\x23\x35\x33\x11\x33\x11\x33\x13\x33\x03\x33\x15\x23\x13\x23\
-\x03\x23\xb8\x54\x48\x48\x54\x36\xd5\x5f\xd8\xd8\xd1\xe1\x66\xdc\
-\x38\x01\x47\x45\x01\x2e\xfe\xd2\x01\x2e\xfe\xd2\x45\xfe\xb9\x01\
-\x47\x00\x00\x00\x01\x00\x1a\x00\x00\x02\x3f\x02\xba\x00\x17\x00\
-\xc9\xba\x00\x02\x00\x18\x00\x19\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x0e\x3e\x59\xbb\x00\
-\x08\x00\x04\x00\x05\x00\x04\x2b\xbb\x00\x13\x00\x04\x00\x16\x00\
-\x04\x2b\xb8\x00\x05\x10\xb9\x00\x04\x00\x08\xf4\xb8\x00\x16\x10\
-\xb9\x00\x17\x00\x08\xf4\xba\x00\x00\x00\x04\x00\x17\x11\x12\x39\
-\xba\x00\x03\x00\x04\x00\x17\x11\x12\x39\xba\x00\x06\x00\x05\x00\
-\x16\x11\x12\x39\xba\x00\x07\x00\x08\x00\x13\x11\x12\x39\xb8\x00\
-\x08\x10\xb9\x00\x09\x00\x08\xf4\xb8\x00\x13\x10\xb9\x00\x12\x00\
-\x08\xf4\xba\x00\x0a\x00\x09\x00\x12\x11\x12\x39\xb8\x00\x0d\x10\
-\xb9\x00\x0c\x00\x0b\xf4\xb8\x00\x10\xd0\xba\x00\x11\x00\x09\x00\
-\x12\x11\x12\x39\xba\x00\x14\x00\x08\x00\x13\x11\x12\x39\xba\x00\
-\x15\x00\x05\x00\x16\x11\x12\x39\x30\x31\x25\x15\x23\x35\x07\x35\
-\x37\x35\x07\x35\x37\x35\x23\x35\x21\x15\x23\x15\x37\x15\x07\x15\
-\x37\x15\x01\x57\x55\x8c\x8c\x8c\x8c\xe8\x02\x25\xe8\x8c\x8c\x8c\
-\xd9\xd9\xb1\x41\x45\x41\x5b\x41\x45\x41\xdb\x49\x49\xb3\x41\x45\
-\x41\x5b\x41\x45\x00\x00\x00\x00\x04\x00\x1c\x00\x00\x02\x3e\x02\
-\xba\x00\x1e\x00\x24\x00\x28\x00\x2e\x01\x9f\xba\x00\x29\x00\x2f\
-\x00\x30\x11\x12\x39\xb8\x00\x29\x10\xb8\x00\x1d\xd0\xb8\x00\x29\
-\x10\xb8\x00\x23\xd0\xb8\x00\x29\x10\xb8\x00\x28\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\
-\xb8\x00\x0a\x10\xb9\x00\x24\x00\x08\xf4\xba\x00\x08\x00\x24\x00\
-\x01\x11\x12\x39\xb8\x00\x08\x2f\x41\x05\x00\xdf\x00\x08\x00\xef\
-\x00\x08\x00\x02\x5d\x41\x09\x00\xbf\x00\x08\x00\xcf\x00\x08\x00\
-\xdf\x00\x08\x00\xef\x00\x08\x00\x04\x71\x41\x07\x00\x80\x00\x08\
-\x00\x90\x00\x08\x00\xa0\x00\x08\x00\x03\x5d\x41\x05\x00\x60\x00\
-\x08\x00\x70\x00\x08\x00\x02\x71\xb9\x00\x07\x00\x08\xf4\x41\x03\
-\x00\x1f\x00\x07\x00\x01\x5d\xba\x00\x04\x00\x07\x00\x01\x11\x12\
-\x39\xb8\x00\x04\x2f\x41\x09\x00\xbf\x00\x04\x00\xcf\x00\x04\x00\
-\xdf\x00\x04\x00\xef\x00\x04\x00\x04\x71\x41\x09\x00\x0f\x00\x04\
-\x00\x1f\x00\x04\x00\x2f\x00\x04\x00\x3f\x00\x04\x00\x04\x5d\x41\
-\x07\x00\xdf\x00\x04\x00\xef\x00\x04\x00\xff\x00\x04\x00\x03\x5d\
-\x41\x05\x00\x0f\x00\x04\x00\x1f\x00\x04\x00\x02\x71\xb9\x00\x03\
-\x00\x08\xf4\x41\x05\x00\x2f\x00\x03\x00\x3f\x00\x03\x00\x02\x5d\
-\xb8\x00\x08\x10\xb8\x00\x0e\xd0\xb8\x00\x07\x10\xb8\x00\x11\xd0\
-\xb8\x00\x04\x10\xb8\x00\x17\xd0\xb8\x00\x03\x10\xb8\x00\x1a\xd0\
-\xba\x00\x2e\x00\x03\x00\x01\x11\x12\x39\xb8\x00\x2e\x2f\x41\x05\
-\x00\xdf\x00\x2e\x00\xef\x00\x2e\x00\x02\x5d\x41\x03\x00\x5f\x00\
-\x2e\x00\x01\x71\x41\x09\x00\xbf\x00\x2e\x00\xcf\x00\x2e\x00\xdf\
-\x00\x2e\x00\xef\x00\x2e\x00\x04\x71\x41\x03\x00\x80\x00\x2e\x00\
-\x01\x5d\xb9\x00\x1e\x00\x08\xf4\xb8\x00\x08\x10\xb8\x00\x1f\xd0\
-\xb8\x00\x07\x10\xb8\x00\x27\xd0\xb8\x00\x04\x10\xb8\x00\x28\xd0\
-\xb8\x00\x03\x10\xb8\x00\x2d\xd0\x30\x31\x33\x23\x11\x23\x35\x33\
-\x35\x23\x35\x33\x35\x33\x32\x16\x17\x33\x15\x23\x16\x14\x15\x1c\
-\x01\x07\x33\x15\x23\x0e\x01\x2b\x01\x11\x21\x2e\x01\x2b\x01\x05\
-\x35\x21\x15\x17\x32\x36\x37\x21\x15\xa5\x52\x37\x37\x37\x37\xf1\
-\x4e\x58\x11\x43\x39\x01\x01\x39\x43\x11\x58\x4e\x9f\x01\x0b\x09\
-\x36\x2f\x9d\x01\x0f\xfe\xf1\x9d\x2f\x36\x09\xfe\xf5\x01\x55\x41\
-\x50\x41\x93\x4e\x45\x41\x0a\x13\x0b\x0b\x13\x0a\x41\x45\x4e\x01\
-\x63\x26\x2a\xe1\x54\x54\x8d\x2a\x26\x50\x00\x00\x03\x00\x38\xff\
-\x8f\x02\x0c\x03\x2b\x00\x22\x00\x2e\x00\x37\x00\x9f\xba\x00\x1d\
-\x00\x38\x00\x39\x11\x12\x39\xb8\x00\x1d\x10\xb8\x00\x25\xd0\xb8\
-\x00\x1d\x10\xb8\x00\x2f\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\
-\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x1d\x2f\x1b\xb9\x00\x1d\x00\x0e\x3e\x59\xb8\x00\x06\x10\xb9\x00\
-\x25\x00\x0b\xf4\xba\x00\x00\x00\x1d\x00\x25\x11\x12\x39\xb8\x00\
-\x06\x10\xb8\x00\x0a\xdc\xb8\x00\x1d\x10\xb9\x00\x2f\x00\x0b\xf4\
-\xba\x00\x0c\x00\x06\x00\x2f\x11\x12\x39\xba\x00\x15\x00\x25\x00\
-\x2f\x11\x12\x39\xba\x00\x34\x00\x06\x00\x1d\x11\x12\x39\xb8\x00\
-\x34\x2f\xb9\x00\x16\x00\x0b\xf4\xb8\x00\x1d\x10\xb8\x00\x21\xdc\
-\xba\x00\x2e\x00\x2f\x00\x06\x11\x12\x39\x30\x31\x37\x2e\x01\x35\
-\x34\x36\x33\x3a\x01\x17\x37\x33\x07\x1e\x03\x17\x07\x2e\x01\x27\
-\x03\x33\x15\x14\x0e\x02\x23\x22\x26\x27\x07\x23\x13\x26\x23\x22\
-\x0e\x02\x1d\x01\x14\x16\x1f\x01\x32\x36\x3d\x01\x23\x07\x1e\x01\
-\xd2\x4d\x4d\x7d\x7f\x07\x0d\x06\x12\x3f\x14\x1a\x28\x1e\x18\x09\
-\x44\x0d\x21\x1d\x31\xbe\x1a\x36\x52\x38\x09\x11\x08\x12\x3f\x86\
-\x04\x0a\x2b\x40\x2a\x15\x2a\x2a\x52\x44\x49\x7e\x27\x05\x0d\x05\
-\x20\xae\x8a\xb0\xb9\x01\x66\x73\x0a\x1e\x25\x29\x15\x1e\x1f\x34\
-\x0f\xfe\xe8\x65\x38\x5e\x44\x26\x01\x01\x67\x02\xf1\x01\x21\x3e\
-\x56\x36\x72\x4d\x6e\x1b\x17\x5c\x51\x34\xdf\x01\x01\x00\x00\x00\
-\x01\x00\x1b\xff\xf4\x02\x3d\x02\xc6\x00\x39\x00\xcf\xba\x00\x1d\
-\x00\x3a\x00\x3b\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x1d\
-\x2f\x1b\xb9\x00\x1d\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xbb\x00\x0a\x00\x04\x00\
-\x0e\x00\x04\x2b\x41\x03\x00\x80\x00\x0a\x00\x01\x71\x41\x05\x00\
-\x40\x00\x0a\x00\x50\x00\x0a\x00\x02\x71\xb8\x00\x0a\x10\xb9\x00\
-\x09\x00\x08\xf4\x41\x03\x00\x6f\x00\x0e\x00\x01\x71\x41\x03\x00\
-\xaf\x00\x0e\x00\x01\x5d\x41\x03\x00\x80\x00\x0e\x00\x01\x71\x41\
-\x03\x00\xd0\x00\x0e\x00\x01\x5d\xb8\x00\x0e\x10\xb9\x00\x0f\x00\
-\x08\xf4\xb8\x00\x1d\x10\xb9\x00\x16\x00\x0b\xf4\xba\x00\x19\x00\
-\x16\x00\x0f\x11\x12\x39\xb8\x00\x0f\x10\xb8\x00\x25\xd0\xb8\x00\
-\x0e\x10\xb8\x00\x28\xd0\xb8\x00\x0a\x10\xb8\x00\x2a\xd0\xb8\x00\
-\x09\x10\xb8\x00\x2d\xd0\xb8\x00\x00\x10\xb9\x00\x33\x00\x0b\xf4\
-\xba\x00\x36\x00\x09\x00\x33\x11\x12\x39\x30\x31\x05\x22\x2e\x02\
-\x35\x34\x36\x37\x23\x35\x33\x37\x35\x21\x35\x21\x3e\x01\x35\x34\
-\x26\x23\x22\x06\x07\x27\x3e\x01\x33\x32\x1e\x02\x15\x14\x06\x07\
-\x33\x15\x23\x07\x15\x21\x15\x21\x0e\x01\x15\x14\x16\x33\x32\x36\
-\x37\x17\x0e\x01\x01\x30\x2f\x4b\x34\x1c\x0b\x08\x5e\x91\x90\xfe\
-\xdf\x01\x6f\x08\x07\x3e\x38\x26\x47\x1f\x35\x2b\x67\x36\x2b\x47\
-\x32\x1c\x08\x06\x61\x94\x90\x01\x24\xfe\x91\x0b\x0c\x42\x3c\x29\
-\x4d\x2a\x33\x29\x70\x0c\x1c\x31\x43\x28\x1b\x27\x10\x41\x57\x03\
-\x41\x0c\x1b\x12\x36\x37\x1e\x23\x31\x2e\x28\x18\x2d\x3e\x27\x16\
-\x1f\x0d\x41\x57\x03\x41\x0f\x24\x17\x3a\x40\x23\x2b\x33\x30\x31\
-\x00\x00\x00\x00\x02\x00\x46\xff\x8f\x02\x1a\x03\x2b\x00\x25\x00\
-\x2f\x00\x83\xba\x00\x14\x00\x30\x00\x31\x11\x12\x39\xb8\x00\x14\
-\x10\xb8\x00\x26\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\
-\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x21\x2f\
-\x1b\xb9\x00\x21\x00\x0e\x3e\x59\xb8\x00\x06\x10\xb9\x00\x26\x00\
-\x0b\xf4\xba\x00\x00\x00\x21\x00\x26\x11\x12\x39\xb8\x00\x06\x10\
-\xb8\x00\x08\xdc\xb8\x00\x21\x10\xb9\x00\x16\x00\x0b\xf4\xba\x00\
-\x0a\x00\x06\x00\x16\x11\x12\x39\xba\x00\x13\x00\x26\x00\x21\x11\
-\x12\x39\xb8\x00\x21\x10\xb8\x00\x24\xdc\xba\x00\x2f\x00\x16\x00\
-\x06\x11\x12\x39\x30\x31\x37\x2e\x01\x35\x34\x36\x3b\x01\x37\x33\
-\x07\x1e\x03\x17\x07\x2e\x01\x27\x03\x16\x33\x32\x3e\x02\x37\x17\
-\x0e\x03\x23\x22\x27\x07\x23\x13\x22\x0e\x02\x1d\x01\x14\x16\x17\
-\xd8\x4a\x48\x7d\x80\x10\x12\x3f\x14\x1c\x2a\x21\x19\x0a\x44\x0e\
-\x25\x20\x65\x10\x15\x21\x2f\x22\x18\x09\x44\x0d\x22\x32\x46\x30\
-\x1b\x14\x13\x3f\x86\x2d\x42\x2b\x15\x26\x27\x0a\x22\xab\x86\xaf\
-\xba\x65\x70\x09\x1e\x26\x2b\x16\x1e\x21\x37\x0e\xfd\xc8\x04\x12\
-\x20\x2a\x17\x1f\x1d\x36\x2c\x1a\x04\x69\x02\xf2\x21\x3e\x56\x36\
-\x72\x48\x6a\x1d\x00\x00\x00\x00\x02\x00\x2d\x00\x00\x02\x2b\x02\
-\xba\x00\x03\x00\x0b\x00\x51\xba\x00\x06\x00\x0c\x00\x0d\x11\x12\
-\x39\xb8\x00\x06\x10\xb8\x00\x00\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x0e\x3e\x59\xb8\x00\x01\x10\
-\xb9\x00\x00\x00\x0b\xf4\xb9\x00\x09\x00\x04\xf4\xb9\x00\x08\x00\
-\x0b\xf4\xb8\x00\x04\xd0\x30\x31\x13\x35\x21\x15\x07\x11\x23\x11\
-\x23\x35\x21\x15\x2d\x01\xfe\xd5\x54\xd5\x01\xfe\x02\x75\x45\x45\
-\x9f\xfe\x2a\x01\xd6\x45\x45\x00\x01\x00\x38\x00\x00\x02\x2a\x02\
-\xba\x00\x1d\x00\x9b\xba\x00\x1c\x00\x1e\x00\x1f\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb8\x00\x0f\x10\xb9\x00\x0e\x00\x08\xf4\xb8\x00\x09\xdc\
-\x41\x03\x00\x70\x00\x09\x00\x01\x5d\x41\x07\x00\x80\x00\x09\x00\
-\x90\x00\x09\x00\xa0\x00\x09\x00\x03\x71\xb9\x00\x08\x00\x08\xf4\
-\xb8\x00\x03\xdc\x41\x03\x00\x60\x00\x03\x00\x01\x71\x41\x03\x00\
-\xc0\x00\x03\x00\x01\x5d\xb9\x00\x02\x00\x08\xf4\xb8\x00\x0e\x10\
-\xb8\x00\x12\xd0\xb8\x00\x09\x10\xb8\x00\x16\xd0\xb8\x00\x08\x10\
-\xb8\x00\x19\xd0\xba\x00\x1c\x00\x03\x00\x02\x11\x12\x39\x30\x31\
-\x21\x03\x23\x35\x33\x32\x36\x35\x21\x35\x21\x2e\x01\x2b\x01\x35\
-\x21\x15\x23\x15\x1e\x01\x17\x33\x15\x23\x0e\x01\x07\x13\x01\x93\
-\xde\x7d\xac\x37\x45\xfe\xd8\x01\x25\x05\x43\x31\xac\x01\xf2\xbf\
-\x14\x24\x09\x7e\x78\x05\x50\x46\xe3\x01\x23\x45\x36\x38\x45\x2b\
-\x2f\x45\x45\x05\x09\x28\x24\x45\x42\x5e\x0e\xfe\xd8\x00\x00\x00\
-\x01\x00\x38\x00\x00\x02\x2a\x02\xba\x00\x1f\x00\xd3\xba\x00\x1e\
-\x00\x20\x00\x21\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x08\
-\x2f\x1b\xb9\x00\x08\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x1f\x2f\x1b\xb9\x00\x1f\x00\x0e\x3e\x59\xbb\x00\x02\x00\x04\x00\
-\x05\x00\x04\x2b\xbb\x00\x0c\x00\x04\x00\x0f\x00\x04\x2b\xb8\x00\
-\x02\x10\xb9\x00\x01\x00\x08\xf4\xb8\x00\x0f\x10\xb9\x00\x10\x00\
-\x08\xf4\xba\x00\x00\x00\x01\x00\x10\x11\x12\x39\xba\x00\x03\x00\
-\x02\x00\x0f\x11\x12\x39\xba\x00\x04\x00\x05\x00\x0c\x11\x12\x39\
-\xb8\x00\x05\x10\xb9\x00\x06\x00\x08\xf4\xb8\x00\x0c\x10\xb9\x00\
-\x0b\x00\x08\xf4\xba\x00\x07\x00\x06\x00\x0b\x11\x12\x39\xba\x00\
-\x0a\x00\x06\x00\x0b\x11\x12\x39\xba\x00\x0d\x00\x05\x00\x0c\x11\
-\x12\x39\xba\x00\x0e\x00\x02\x00\x0f\x11\x12\x39\xba\x00\x11\x00\
-\x01\x00\x10\x11\x12\x39\xb8\x00\x1f\x10\xb9\x00\x12\x00\x0b\xf4\
-\xba\x00\x18\x00\x12\x00\x08\x11\x12\x39\xb8\x00\x18\x2f\x30\x31\
-\x37\x07\x35\x37\x35\x07\x35\x37\x35\x33\x15\x37\x15\x07\x15\x37\
-\x15\x07\x15\x33\x32\x3e\x02\x35\x33\x14\x0e\x02\x2b\x01\x9b\x63\
-\x63\x63\x63\x54\xb6\xb6\xb6\xb6\x34\x2a\x44\x2e\x19\x52\x21\x40\
-\x61\x40\x8d\xf7\x2e\x45\x2e\x5b\x2e\x45\x2e\xde\xb7\x55\x45\x55\
-\x5b\x55\x45\x55\xd5\x21\x3c\x56\x35\x40\x6f\x53\x2f\x00\x00\x00\
-\x02\x00\x2d\x00\x00\x02\x2b\x02\xba\x00\x16\x00\x20\x00\x7b\xba\
-\x00\x12\x00\x21\x00\x22\x11\x12\x39\xb8\x00\x12\x10\xb8\x00\x18\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\
-\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\
-\x00\x0e\x3e\x59\xbb\x00\x05\x00\x04\x00\x08\x00\x04\x2b\xb8\x00\
-\x05\x10\xb9\x00\x04\x00\x08\xf4\xb8\x00\x00\xd0\xb8\x00\x08\x10\
-\xb9\x00\x09\x00\x08\xf4\xb8\x00\x08\x10\xb8\x00\x13\xd0\xb8\x00\
-\x05\x10\xb8\x00\x14\xd0\xb8\x00\x09\x10\xb8\x00\x17\xd0\xb8\x00\
-\x0b\x10\xb9\x00\x20\x00\x0b\xf4\x30\x31\x37\x15\x23\x35\x23\x35\
-\x33\x35\x23\x35\x33\x11\x33\x32\x16\x15\x14\x06\x2b\x01\x15\x33\
-\x15\x27\x33\x32\x36\x3d\x01\x34\x26\x2b\x01\xd4\x54\x53\x53\x53\
-\x53\xe4\x61\x66\x67\x61\x8f\xe3\xe3\x90\x35\x3b\x3b\x35\x90\x86\
-\x86\x86\x45\x5b\x45\x01\x4f\x6c\x60\x60\x68\x5b\x45\xe5\x34\x30\
-\x3e\x30\x34\x00\x03\x00\x58\xff\x8f\x02\x1f\x03\x2b\x00\x1f\x00\
-\x29\x00\x33\x00\x9d\xba\x00\x21\x00\x34\x00\x35\x11\x12\x39\xb8\
-\x00\x21\x10\xb8\x00\x00\xd0\xb8\x00\x21\x10\xb8\x00\x2b\xd0\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x0e\
-\x3e\x59\xb8\x00\x01\xd0\xb8\x00\x05\x10\xb8\x00\x03\xdc\xb8\x00\
-\x06\x10\xb8\x00\x08\xdc\xb8\x00\x06\x10\xb8\x00\x0a\xd0\xb8\x00\
-\x08\x10\xb8\x00\x0c\xd0\xb8\x00\x05\x10\xb9\x00\x2a\x00\x0b\xf4\
-\xba\x00\x20\x00\x06\x00\x2a\x11\x12\x39\xb8\x00\x20\x2f\xb9\x00\
-\x33\x00\x08\xf4\xba\x00\x14\x00\x20\x00\x33\x11\x12\x39\xb8\x00\
-\x03\x10\xb8\x00\x1f\xd0\xb8\x00\x06\x10\xb9\x00\x29\x00\x0b\xf4\
-\x30\x31\x21\x23\x15\x23\x35\x23\x11\x33\x35\x33\x15\x33\x35\x33\
-\x15\x1e\x01\x15\x14\x06\x07\x15\x1e\x01\x15\x14\x0e\x02\x07\x15\
-\x23\x03\x33\x32\x36\x3d\x01\x34\x26\x2b\x01\x11\x33\x32\x36\x3d\
-\x01\x34\x26\x2b\x01\x01\x3f\x45\x3e\x64\x64\x3e\x45\x3e\x40\x48\
-\x3b\x32\x3d\x4a\x18\x2b\x3b\x24\x3e\x93\x91\x35\x3b\x3b\x35\x91\
-\x9f\x3a\x41\x41\x3a\x9f\x71\x71\x02\xba\x71\x71\x71\x77\x0e\x5b\
-\x45\x3e\x47\x11\x03\x0e\x4e\x48\x27\x44\x35\x22\x05\x73\x01\xfc\
-\x2f\x30\x27\x30\x31\xfd\xd6\x35\x36\x29\x35\x35\x00\x00\x00\x00\
-\x02\x00\x26\x00\x00\x02\x0d\x02\xec\x00\x12\x00\x20\x00\x8d\xba\
-\x00\x09\x00\x21\x00\x22\x11\x12\x39\xb8\x00\x09\x10\xb8\x00\x16\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\
-\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\
-\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x12\x2f\x1b\xb9\x00\
-\x12\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\
-\x00\x0e\x00\x0e\x3e\x59\xb8\x00\x03\x10\xb9\x00\x00\x00\x08\xf4\
-\xb8\x00\x08\x10\xb9\x00\x09\x00\x08\xf4\xb8\x00\x03\x10\xb8\x00\
-\x0b\xd0\xb8\x00\x00\x10\xb8\x00\x10\xd0\xb8\x00\x03\x10\xb9\x00\
-\x13\x00\x07\xf4\xb9\x00\x1a\x00\x06\xf4\x30\x31\x13\x23\x35\x33\
-\x35\x34\x36\x3b\x01\x15\x23\x15\x21\x11\x23\x11\x23\x11\x23\x01\
-\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x6c\x46\x46\
-\x37\x3b\x71\x93\x01\x3a\x50\xea\x50\x01\x62\x23\x1c\x1c\x23\x23\
-\x1c\x1c\x01\xc0\x44\x6a\x34\x42\x44\x9c\xfd\xfc\x01\xc0\xfe\x40\
-\x02\x76\x1d\x16\x10\x16\x1d\x1d\x16\x10\x16\x1d\x00\x00\x00\x00\
-\x02\x00\x26\x00\x00\x01\xf6\x02\xe4\x00\x10\x00\x14\x00\x8e\xba\
-\x00\x0d\x00\x15\x00\x16\x11\x12\x39\xb8\x00\x0d\x10\xb8\x00\x14\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\
-\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\
-\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\
-\x11\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x10\x2f\x1b\xb9\
-\x00\x10\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x14\x2f\x1b\
-\xb9\x00\x14\x00\x0e\x3e\x59\xb8\x00\x02\x10\xb9\x00\x01\x00\x08\
-\xf4\xb8\x00\x07\x10\xb9\x00\x0a\x00\x08\xf4\xb8\x00\x02\x10\xb8\
-\x00\x0b\xd0\xb8\x00\x01\x10\xb8\x00\x0e\xd0\x30\x31\x13\x23\x35\
-\x33\x35\x34\x36\x3b\x01\x15\x23\x15\x33\x15\x23\x11\x23\x01\x33\
-\x11\x23\x6c\x46\x46\x37\x3b\x7b\x9d\x9d\x9d\x50\x01\x3a\x50\x50\
-\x01\xc0\x44\x6a\x34\x42\x44\x9c\x44\xfe\x40\x02\xe4\xfd\x1c\xff\
-\xff\x00\x42\xff\xf4\x02\x26\x03\x0b\x02\x26\x00\x04\x00\x00\x00\
-\x06\x03\x0a\xf0\x00\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x26\x03\
-\x00\x02\x26\x00\x04\x00\x00\x00\x06\x03\x0e\xf0\x00\x00\x00\xff\
-\xff\x00\x42\xff\xf4\x02\x26\x02\xfd\x02\x26\x00\x04\x00\x00\x00\
-\x06\x03\x0c\xf0\x00\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x26\x02\
-\xd4\x02\x26\x00\x04\x00\x00\x00\x06\x03\x08\xf0\x00\x00\x00\xff\
-\xff\x00\x42\xff\x54\x02\x26\x02\x10\x02\x26\x00\x04\x00\x00\x00\
-\x07\x03\x26\x01\x1b\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x26\x03\
-\x0b\x02\x26\x00\x04\x00\x00\x00\x06\x03\x0b\xf0\x00\x00\x00\xff\
-\xff\x00\x42\xff\xf4\x02\x26\x02\xfd\x02\x26\x00\x04\x00\x00\x00\
-\x07\x03\x21\x01\x1b\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x26\x02\
-\xc1\x02\x26\x00\x04\x00\x00\x00\x06\x03\x06\xf0\x00\x00\x00\x00\
-\x02\x00\x42\xff\x31\x02\x3b\x02\x10\x00\x35\x00\x43\x00\xa1\xba\
-\x00\x36\x00\x44\x00\x45\x11\x12\x39\xb8\x00\x36\x10\xb8\x00\x22\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x30\x2f\x1b\xb9\x00\x30\x00\
-\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x1c\x2f\x1b\xb9\x00\x1c\
-\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x15\x2f\x1b\xb9\x00\
-\x15\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\
-\x00\x0e\x00\x10\x3e\x59\xb9\x00\x08\x00\x03\xf4\xba\x00\x22\x00\
-\x30\x00\x1c\x11\x12\x39\xb8\x00\x22\x2f\xb9\x00\x36\x00\x08\xf4\
-\xb8\x00\x1c\x10\xb9\x00\x3d\x00\x08\xf4\xba\x00\x19\x00\x36\x00\
-\x3d\x11\x12\x39\x7c\xb8\x00\x19\x2f\x18\xb8\x00\x30\x10\xb9\x00\
-\x27\x00\x08\xf4\xb8\x00\x15\x10\xb9\x00\x34\x00\x08\xf4\x30\x31\
-\x21\x0e\x03\x15\x14\x16\x33\x32\x37\x17\x0e\x01\x23\x22\x26\x35\
-\x34\x36\x37\x27\x2e\x01\x27\x23\x0e\x01\x23\x22\x26\x35\x34\x36\
-\x3b\x01\x35\x34\x26\x23\x22\x06\x07\x27\x3e\x03\x33\x32\x16\x15\
-\x11\x33\x25\x22\x06\x1d\x01\x14\x16\x33\x32\x3e\x02\x3d\x01\x02\
-\x26\x27\x2d\x17\x06\x1a\x10\x1f\x15\x28\x0a\x2d\x26\x2e\x3f\x3a\
-\x39\x01\x25\x28\x03\x05\x11\x4b\x3f\x51\x60\x69\x75\x6e\x40\x3c\
-\x33\x42\x14\x36\x0a\x22\x32\x40\x27\x5b\x6b\x48\xfe\xfa\x48\x42\
-\x39\x32\x1f\x33\x26\x15\x18\x24\x1b\x14\x07\x15\x10\x1a\x29\x11\
-\x18\x28\x28\x24\x3d\x1b\x03\x03\x2e\x23\x2d\x33\x54\x49\x48\x4e\
-\x33\x39\x39\x29\x23\x28\x14\x26\x1d\x11\x5c\x52\xfe\xe4\xa5\x28\
-\x26\x15\x28\x29\x0f\x19\x23\x14\x55\x00\x00\xff\xff\x00\x42\xff\
-\xf4\x02\x26\x03\x26\x02\x26\x00\x04\x00\x00\x00\x06\x03\x10\xf0\
-\x00\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x26\x03\xbc\x02\x26\x00\
-\x04\x00\x00\x00\x06\x03\x11\xf0\x00\x00\x00\xff\xff\x00\x42\xff\
-\xf4\x02\x26\x02\xd8\x02\x26\x00\x04\x00\x00\x00\x06\x03\x04\xf0\
-\x00\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x26\x03\x85\x02\x26\x00\
-\x04\x00\x00\x00\x07\x03\x29\x01\x1b\x00\x00\xff\xff\x00\x42\xff\
-\x54\x02\x26\x03\x00\x02\x26\x00\x04\x00\x00\x00\x26\x03\x0e\xf0\
-\x00\x00\x07\x03\x26\x01\x1b\x00\x00\x00\x00\xff\xff\x00\x42\xff\
-\xf4\x02\x26\x03\x85\x02\x26\x00\x04\x00\x00\x00\x07\x03\x2a\x01\
-\x1b\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x26\x03\x7a\x02\x26\x00\
-\x04\x00\x00\x00\x07\x03\x2b\x01\x1b\x00\x00\xff\xff\x00\x42\xff\
-\xf4\x02\x26\x03\x71\x02\x26\x00\x04\x00\x00\x00\x07\x03\x2c\x01\
-\x1b\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x26\x03\x89\x02\x26\x00\
-\x04\x00\x00\x00\x07\x03\x30\x01\x1b\x00\x00\xff\xff\x00\x42\xff\
-\x54\x02\x26\x02\xfd\x02\x26\x00\x04\x00\x00\x00\x26\x03\x0c\xf0\
-\x00\x00\x07\x03\x26\x01\x1b\x00\x00\x00\x00\xff\xff\x00\x17\xff\
-\xf4\x02\x26\x03\x89\x02\x26\x00\x04\x00\x00\x00\x07\x03\x32\x01\
-\x1b\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x26\x03\x7e\x02\x26\x00\
-\x04\x00\x00\x00\x07\x03\x33\x01\x1b\x00\x00\xff\xff\x00\x42\xff\
-\xf4\x02\x26\x03\x7c\x02\x26\x00\x04\x00\x00\x00\x07\x03\x35\x01\
-\x1b\x00\x00\xff\xff\x00\x3c\xff\xf4\x01\xf9\x03\x0b\x02\x26\x00\
-\x05\x00\x00\x00\x06\x03\x0a\xf4\x00\x00\x00\xff\xff\x00\x3c\xff\
-\xf4\x01\xf9\x03\x00\x02\x26\x00\x05\x00\x00\x00\x06\x03\x0e\xf4\
-\x00\x00\x00\xff\xff\x00\x3c\xff\xf4\x01\xf9\x02\xfd\x02\x26\x00\
-\x05\x00\x00\x00\x06\x03\x0c\xf4\x00\x00\x00\xff\xff\x00\x3c\xff\
-\xf4\x01\xf9\x02\xd4\x02\x26\x00\x05\x00\x00\x00\x06\x03\x08\xf4\
-\x00\x00\x00\xff\xff\x00\x3c\xff\x54\x01\xf9\x02\x10\x02\x26\x00\
-\x05\x00\x00\x00\x07\x03\x26\x01\x1f\x00\x00\xff\xff\x00\x3c\xff\
-\xf4\x01\xf9\x03\x0b\x02\x26\x00\x05\x00\x00\x00\x06\x03\x0b\xf4\
-\x00\x00\x00\xff\xff\x00\x3c\xff\xf4\x01\xf9\x02\xfd\x02\x26\x00\
-\x05\x00\x00\x00\x07\x03\x21\x01\x1f\x00\x00\xff\xff\x00\x3c\xff\
-\xf4\x01\xf9\x02\xc1\x02\x26\x00\x05\x00\x00\x00\x06\x03\x06\xf4\
-\x00\x00\x00\x00\x02\x00\x3c\xff\x31\x02\x0e\x02\x10\x00\x25\x00\
-\x37\x00\x9c\xba\x00\x26\x00\x38\x00\x39\x11\x12\x39\xb8\x00\x26\
-\x10\xb8\x00\x03\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x16\x2f\x1b\
-\xb9\x00\x16\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x12\x2f\
-\x1b\xb9\x00\x12\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\
-\x2f\x1b\xb9\x00\x18\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x0c\x2f\x1b\xb9\x00\x0c\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x00\x2f\x1b\xb9\x00\x00\x00\x10\x3e\x59\xb8\x00\x12\x10\xb9\
-\x00\x31\x00\x08\xf4\xb8\x00\x0c\x10\xb9\x00\x26\x00\x08\xf4\xba\
-\x00\x09\x00\x31\x00\x26\x11\x12\x39\xba\x00\x15\x00\x26\x00\x31\
-\x11\x12\x39\xb8\x00\x00\x10\xb9\x00\x20\x00\x03\xf4\x30\x31\x05\
-\x22\x26\x35\x34\x36\x37\x27\x23\x35\x23\x06\x23\x22\x26\x35\x34\
-\x36\x33\x32\x17\x33\x35\x33\x11\x0e\x03\x15\x14\x16\x33\x32\x37\
-\x17\x0e\x01\x03\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\x06\x1d\
-\x01\x14\x16\x01\xb1\x2e\x3f\x3a\x39\x01\x0d\x04\x32\x6d\x5f\x6b\
-\x6b\x5f\x6d\x32\x04\x50\x27\x2d\x17\x06\x1a\x10\x1f\x15\x28\x0a\
-\x2d\xb2\x1b\x30\x24\x15\x15\x24\x30\x1b\x46\x4d\x4d\xcf\x28\x28\
-\x24\x3d\x1b\x03\x54\x60\x8e\x80\x80\x8e\x60\x54\xfd\xfc\x18\x24\
-\x1b\x14\x07\x15\x10\x1a\x29\x11\x18\x01\x0a\x0e\x1b\x27\x1a\xba\
-\x1a\x27\x1b\x0e\x55\x46\x58\x46\x55\x00\x00\xff\xff\x00\x3c\xff\
-\xf4\x01\xf9\x03\x26\x02\x26\x00\x05\x00\x00\x00\x06\x03\x10\xf4\
-\x00\x00\x00\xff\xff\x00\x3c\xff\xf4\x01\xf9\x03\xbc\x02\x26\x00\
-\x05\x00\x00\x00\x06\x03\x11\xf4\x00\x00\x00\xff\xff\x00\x3c\xff\
-\xf4\x01\xf9\x02\xd8\x02\x26\x00\x05\x00\x00\x00\x06\x03\x04\xf4\
-\x00\x00\x00\xff\xff\x00\x3c\xff\xf4\x01\xf9\x03\x85\x02\x26\x00\
-\x05\x00\x00\x00\x07\x03\x29\x01\x1f\x00\x00\xff\xff\x00\x3c\xff\
-\x54\x01\xf9\x03\x00\x02\x26\x00\x05\x00\x00\x00\x26\x03\x0e\xf4\
-\x00\x00\x07\x03\x26\x01\x1f\x00\x00\x00\x00\xff\xff\x00\x3c\xff\
-\xf4\x01\xf9\x03\x85\x02\x26\x00\x05\x00\x00\x00\x07\x03\x2a\x01\
-\x1f\x00\x00\xff\xff\x00\x3c\xff\xf4\x01\xf9\x03\x7a\x02\x26\x00\
-\x05\x00\x00\x00\x07\x03\x2b\x01\x1f\x00\x00\xff\xff\x00\x3c\xff\
-\xf4\x01\xf9\x03\x71\x02\x26\x00\x05\x00\x00\x00\x07\x03\x2c\x01\
-\x1f\x00\x00\xff\xff\x00\x3c\xff\xf4\x02\x23\x03\x89\x02\x26\x00\
-\x05\x00\x00\x00\x07\x03\x30\x01\x1f\x00\x00\xff\xff\x00\x3c\xff\
-\x54\x01\xf9\x02\xfd\x02\x26\x00\x05\x00\x00\x00\x26\x03\x0c\xf4\
-\x00\x00\x07\x03\x26\x01\x1f\x00\x00\x00\x00\xff\xff\x00\x1b\xff\
-\xf4\x01\xf9\x03\x89\x02\x26\x00\x05\x00\x00\x00\x07\x03\x32\x01\
-\x1f\x00\x00\xff\xff\x00\x3c\xff\xf4\x02\x07\x03\x7e\x02\x26\x00\
-\x05\x00\x00\x00\x07\x03\x33\x01\x1f\x00\x00\xff\xff\x00\x3c\xff\
-\xf4\x01\xf9\x03\x7c\x02\x26\x00\x05\x00\x00\x00\x07\x03\x35\x01\
-\x1f\x00\x00\x00\x03\x00\x0a\xff\xf4\x02\x46\x02\x10\x00\x35\x00\
-\x43\x00\x4c\x00\xcd\xba\x00\x18\x00\x4d\x00\x4e\x11\x12\x39\xb8\
-\x00\x18\x10\xb8\x00\x3b\xd0\xb8\x00\x18\x10\xb8\x00\x48\xd0\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x14\x2f\x1b\xb9\x00\x14\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x1b\x2f\x1b\xb9\x00\x1b\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x2f\x2f\x1b\xb9\x00\x2f\
-\x00\x0e\x3e\x59\xb8\x00\x14\x10\xb9\x00\x0b\x00\x01\xf4\xb8\x00\
-\x00\x10\xb9\x00\x36\x00\x01\xf4\xba\x00\x06\x00\x0b\x00\x36\x11\
-\x12\x39\xb8\x00\x06\x2f\xba\x00\x17\x00\x0b\x00\x36\x11\x12\x39\
-\xb8\x00\x2f\x10\xb9\x00\x24\x00\x01\xf4\xb8\x00\x1b\x10\xb9\x00\
-\x44\x00\x01\xf4\xba\x00\x1f\x00\x24\x00\x44\x11\x12\x39\xb8\x00\
-\x1f\x2f\xba\x00\x33\x00\x36\x00\x0b\x11\x12\x39\xb8\x00\x06\x10\
-\xb9\x00\x3d\x00\x01\xf4\xb8\x00\x1f\x10\xb9\x00\x49\x00\x01\xf4\
-\x30\x31\x17\x22\x26\x35\x34\x36\x3b\x01\x35\x34\x26\x23\x22\x06\
-\x07\x27\x3e\x03\x33\x32\x16\x17\x33\x3e\x01\x33\x32\x16\x1d\x01\
-\x21\x15\x14\x16\x33\x32\x3e\x02\x37\x17\x0e\x03\x23\x22\x26\x27\
-\x23\x0e\x01\x27\x32\x3e\x02\x3d\x01\x23\x22\x06\x1d\x01\x14\x16\
-\x01\x22\x06\x1d\x01\x33\x35\x34\x26\x8d\x39\x4a\x5b\x57\x3f\x2b\
-\x26\x26\x2b\x0e\x35\x08\x1b\x25\x31\x1e\x2d\x3e\x11\x03\x14\x41\
-\x27\x4e\x50\xfe\xfe\x31\x2f\x13\x1f\x17\x11\x06\x3a\x08\x1b\x27\
-\x33\x1f\x33\x4a\x15\x03\x0e\x43\x21\x18\x24\x18\x0c\x34\x37\x3d\
-\x20\x01\x31\x2e\x32\xc0\x32\x0c\x4c\x4a\x4e\x4f\x35\x43\x35\x2c\
-\x23\x21\x14\x26\x1e\x12\x28\x26\x2b\x23\x77\x75\x36\x19\x47\x5a\
-\x0f\x19\x20\x11\x1b\x17\x2d\x24\x16\x3c\x36\x3b\x37\x3e\x11\x1d\
-\x25\x15\x54\x28\x2e\x0f\x29\x2e\x01\xa4\x45\x48\x22\x22\x48\x45\
-\x00\x00\x00\xff\xff\x00\x0a\xff\xf4\x02\x46\x03\x0b\x02\x26\x00\
-\xdc\x00\x00\x00\x06\x03\x0a\x00\x00\x00\x00\xff\xff\x00\x54\xff\
-\xf4\x02\x04\x03\x0b\x02\x26\x00\x07\x00\x00\x00\x06\x03\x0a\x0d\
-\x00\x00\x00\xff\xff\x00\x54\xff\xf4\x02\x04\x03\x05\x02\x26\x00\
-\x07\x00\x00\x00\x06\x03\x0d\x0d\x00\x00\x00\x00\x01\x00\x54\xff\
-\x31\x02\x04\x02\x10\x00\x3b\x00\x72\xba\x00\x32\x00\x3c\x00\x3d\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\
-\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x34\x2f\x1b\xb9\
-\x00\x34\x00\x0e\x3e\x59\xb8\x00\x00\x10\xb9\x00\x07\x00\x08\xf4\
-\xb8\x00\x34\x10\xb9\x00\x12\x00\x08\xf4\xb8\x00\x34\x10\xb8\x00\
-\x19\xd0\xb8\x00\x34\x10\xb8\x00\x1d\xdc\x41\x07\x00\x0f\x00\x1d\
-\x00\x1f\x00\x1d\x00\x2f\x00\x1d\x00\x03\x5d\xb8\x00\x32\xdc\xb8\
-\x00\x2c\xdc\xb9\x00\x25\x00\x03\xf4\x30\x31\x01\x32\x16\x17\x07\
-\x2e\x01\x23\x22\x0e\x02\x1d\x01\x14\x1e\x02\x33\x32\x36\x37\x17\
-\x0e\x01\x0f\x01\x17\x36\x33\x32\x16\x15\x14\x0e\x02\x23\x22\x26\
-\x27\x37\x1e\x01\x33\x32\x36\x35\x34\x26\x2f\x01\x37\x2e\x01\x35\
-\x34\x3e\x02\x01\x3d\x4b\x5e\x16\x40\x0e\x41\x30\x23\x37\x26\x13\
-\x13\x26\x38\x24\x34\x44\x14\x39\x17\x5c\x4b\x0a\x03\x13\x14\x1d\
-\x27\x12\x1f\x28\x16\x29\x2f\x0b\x26\x09\x1e\x16\x13\x19\x1a\x2a\
-\x1c\x0e\x5c\x65\x20\x3c\x56\x02\x10\x42\x35\x22\x28\x2c\x17\x2a\
-\x3a\x22\x58\x22\x3a\x2a\x17\x30\x2a\x27\x33\x43\x02\x31\x03\x06\
-\x22\x20\x15\x20\x14\x0a\x1b\x0e\x29\x0b\x11\x0f\x10\x0e\x15\x06\
-\x04\x44\x0e\x8e\x6f\x3d\x64\x47\x26\x00\x00\xff\xff\x00\x54\xff\
-\xf4\x02\x04\x02\xfd\x02\x26\x00\x07\x00\x00\x00\x06\x03\x0c\x0d\
-\x00\x00\x00\xff\xff\x00\x54\xff\xf4\x02\x04\x02\xda\x02\x26\x00\
-\x07\x00\x00\x00\x06\x03\x07\x0d\x00\x00\x00\x00\x03\x00\x2d\xff\
-\xf4\x02\x88\x02\xe4\x00\x10\x00\x22\x00\x26\x00\x9a\xba\x00\x11\
-\x00\x27\x00\x28\x11\x12\x39\xb8\x00\x11\x10\xb8\x00\x00\xd0\xb8\
-\x00\x11\x10\xb8\x00\x26\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\
-\x2f\x1b\xb9\x00\x0a\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x23\x2f\x1b\xb9\x00\x23\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x0e\x3e\x59\xb8\x00\x06\
-\x10\xb9\x00\x1c\x00\x08\xf4\xb8\x00\x00\x10\xb9\x00\x11\x00\x08\
-\xf4\xba\x00\x09\x00\x1c\x00\x11\x11\x12\x39\xba\x00\x0e\x00\x1c\
-\x00\x11\x11\x12\x39\x30\x31\x17\x22\x26\x35\x34\x36\x33\x32\x17\
-\x33\x11\x33\x11\x23\x35\x23\x06\x27\x32\x3e\x02\x3d\x01\x34\x2e\
-\x02\x23\x22\x06\x1d\x01\x14\x16\x01\x33\x07\x23\xed\x5b\x65\x65\
-\x5b\x66\x2f\x04\x50\x50\x04\x2f\x4c\x19\x2e\x23\x15\x15\x23\x2e\
-\x19\x42\x42\x42\x01\x5c\x67\x31\x3d\x0c\x8e\x80\x80\x8e\x60\x01\
-\x34\xfd\x1c\x54\x60\x47\x0e\x1b\x27\x1a\xba\x1a\x27\x1b\x0e\x53\
-\x48\x58\x48\x53\x02\xa9\xbd\x00\x02\x00\x3c\xff\xf4\x02\x3a\x02\
-\xe4\x00\x18\x00\x2a\x00\xb2\xba\x00\x19\x00\x2b\x00\x2c\x11\x12\
-\x39\xb8\x00\x19\x10\xb8\x00\x0e\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x11\x2f\x1b\xb9\x00\x11\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1a\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x17\x2f\x1b\xb9\x00\x17\x00\x0e\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb9\x00\
-\x19\x00\x08\xf4\x41\x07\x00\x00\x00\x09\x00\x10\x00\x09\x00\x20\
-\x00\x09\x00\x03\x5d\xb8\x00\x09\x10\xb9\x00\x24\x00\x08\xf4\xba\
-\x00\x00\x00\x19\x00\x24\x11\x12\x39\xba\x00\x0c\x00\x24\x00\x19\
-\x11\x12\x39\xba\x00\x0f\x00\x09\x00\x11\x11\x12\x39\xb8\x00\x0f\
-\x2f\xb9\x00\x0e\x00\x08\xf4\xb8\x00\x0f\x10\xb8\x00\x13\xd0\xb8\
-\x00\x0e\x10\xb8\x00\x16\xd0\x30\x31\x25\x23\x06\x23\x22\x26\x35\
-\x34\x36\x33\x32\x17\x33\x35\x23\x35\x33\x35\x33\x15\x33\x15\x23\
-\x11\x23\x27\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\x06\x1d\x01\
-\x14\x16\x01\xa9\x04\x32\x6d\x5f\x6b\x6b\x5f\x6d\x32\x04\x99\x99\
-\x50\x41\x41\x50\x84\x1b\x30\x24\x15\x15\x24\x30\x1b\x46\x4d\x4d\
-\x54\x60\x8e\x80\x80\x8e\x60\xb0\x3e\x46\x46\x3e\xfd\xa0\x3b\x0e\
-\x1b\x27\x1a\xba\x1a\x27\x1b\x0e\x55\x46\x58\x46\x55\x00\x00\x00\
-\x02\x00\x42\xff\xf4\x02\x16\x02\xf1\x00\x25\x00\x33\x00\x5f\xba\
-\x00\x26\x00\x34\x00\x35\x11\x12\x39\xb8\x00\x26\x10\xb8\x00\x09\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x20\x2f\x1b\xb9\x00\x20\x00\
-\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\
-\x00\x0e\x3e\x59\xba\x00\x13\x00\x20\x00\x09\x11\x12\x39\xb8\x00\
-\x13\x2f\xb9\x00\x2d\x00\x08\xf4\xb8\x00\x09\x10\xb9\x00\x26\x00\
-\x08\xf4\xba\x00\x16\x00\x2d\x00\x26\x11\x12\x39\x30\x31\x01\x07\
-\x1e\x03\x15\x14\x06\x23\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x16\
-\x17\x37\x2e\x01\x27\x07\x27\x37\x2e\x01\x27\x33\x1e\x01\x17\x37\
-\x03\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x01\xcb\
-\x57\x1f\x3b\x2d\x1b\x7c\x6b\x38\x58\x3d\x20\x20\x39\x4e\x2f\x3d\
-\x50\x18\x04\x19\x43\x2a\x63\x26\x5c\x21\x48\x26\x7e\x11\x25\x14\
-\x5e\x79\x43\x52\x52\x43\x43\x52\x52\x02\xc4\x3d\x1f\x4e\x5e\x71\
-\x41\x8c\x8a\x24\x44\x5f\x3b\x3b\x5f\x44\x24\x38\x28\x02\x3e\x60\
-\x28\x46\x2d\x40\x1a\x2e\x15\x0b\x19\x10\x41\xfd\x48\x4c\x4e\x46\
-\x4e\x4c\x4c\x4e\x46\x4e\x4c\xff\xff\x00\x43\xff\xf4\x02\x15\x03\
-\x0b\x02\x26\x00\x09\x00\x00\x00\x06\x03\x0a\x02\x00\x00\x00\xff\
-\xff\x00\x43\xff\xf4\x02\x15\x03\x00\x02\x26\x00\x09\x00\x00\x00\
-\x06\x03\x0e\x02\x00\x00\x00\xff\xff\x00\x43\xff\xf4\x02\x15\x03\
-\x05\x02\x26\x00\x09\x00\x00\x00\x06\x03\x0d\x02\x00\x00\x00\xff\
-\xff\x00\x43\xff\xf4\x02\x15\x02\xfd\x02\x26\x00\x09\x00\x00\x00\
-\x06\x03\x0c\x02\x00\x00\x00\xff\xff\x00\x43\xff\xf4\x02\x15\x02\
-\xd4\x02\x26\x00\x09\x00\x00\x00\x06\x03\x08\x02\x00\x00\x00\xff\
-\xff\x00\x43\xff\xf4\x02\x15\x02\xda\x02\x26\x00\x09\x00\x00\x00\
-\x06\x03\x07\x02\x00\x00\x00\xff\xff\x00\x43\xff\x54\x02\x15\x02\
-\x10\x02\x26\x00\x09\x00\x00\x00\x07\x03\x26\x01\x35\x00\x00\xff\
-\xff\x00\x43\xff\xf4\x02\x15\x03\x0b\x02\x26\x00\x09\x00\x00\x00\
-\x06\x03\x0b\x02\x00\x00\x00\xff\xff\x00\x43\xff\xf4\x02\x15\x02\
-\xfd\x02\x26\x00\x09\x00\x00\x00\x07\x03\x21\x01\x2e\x00\x00\xff\
-\xff\x00\x43\xff\xf4\x02\x15\x02\xc1\x02\x26\x00\x09\x00\x00\x00\
-\x06\x03\x06\x02\x00\x00\x00\x00\x02\x00\x43\xff\x31\x02\x15\x02\
-\x10\x00\x36\x00\x43\x00\x82\xba\x00\x09\x00\x44\x00\x45\x11\x12\
-\x39\xb8\x00\x09\x10\xb8\x00\x3d\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x13\x2f\x1b\xb9\x00\x13\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x0e\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x10\x3e\x59\xb8\x00\x09\
-\x10\xb9\x00\x20\x00\x08\xf4\xb8\x00\x13\x10\xb9\x00\x3d\x00\x08\
-\xf4\xba\x00\x1a\x00\x20\x00\x3d\x11\x12\x39\xb8\x00\x1a\x2f\xb8\
-\x00\x23\xd0\xb8\x00\x00\x10\xb9\x00\x31\x00\x03\xf4\xb8\x00\x1a\
-\x10\xb9\x00\x43\x00\x08\xf4\x30\x31\x05\x22\x26\x35\x34\x37\x27\
-\x0e\x01\x23\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x1d\x01\
-\x21\x15\x14\x1e\x02\x33\x32\x36\x37\x17\x0e\x03\x07\x0e\x03\x15\
-\x14\x16\x33\x32\x37\x17\x0e\x01\x13\x35\x34\x2e\x02\x23\x22\x0e\
-\x02\x1d\x01\x01\x69\x2e\x3f\x71\x02\x0a\x1f\x14\x34\x56\x3e\x23\
-\x23\x3e\x57\x35\x34\x55\x3c\x20\xfe\x82\x16\x29\x3b\x24\x34\x4c\
-\x14\x3b\x07\x19\x1e\x21\x10\x17\x21\x14\x09\x1a\x10\x1f\x15\x28\
-\x0a\x2d\x30\x15\x25\x35\x20\x21\x38\x29\x17\xcf\x28\x28\x44\x35\
-\x03\x04\x05\x26\x47\x63\x3e\x3d\x64\x46\x27\x26\x43\x5c\x37\x26\
-\x18\x22\x3a\x2a\x17\x30\x2a\x28\x10\x1f\x1f\x1c\x0d\x13\x1d\x17\
-\x14\x0b\x15\x10\x1a\x29\x11\x18\x01\xf9\x0b\x22\x38\x29\x16\x18\
-\x2a\x39\x22\x07\x00\x00\x00\xff\xff\x00\x43\xff\xf4\x02\x15\x02\
-\xd8\x02\x26\x00\x09\x00\x00\x00\x06\x03\x04\x02\x00\x00\x00\xff\
-\xff\x00\x43\xff\xf4\x02\x32\x03\x89\x02\x26\x00\x09\x00\x00\x00\
-\x07\x03\x30\x01\x2e\x00\x00\xff\xff\x00\x43\xff\x54\x02\x15\x02\
-\xfd\x02\x26\x00\x09\x00\x00\x00\x26\x03\x0c\x02\x00\x00\x07\x03\
-\x26\x01\x35\x00\x00\x00\x00\xff\xff\x00\x2a\xff\xf4\x02\x15\x03\
-\x89\x02\x26\x00\x09\x00\x00\x00\x07\x03\x32\x01\x2e\x00\x00\xff\
-\xff\x00\x43\xff\xf4\x02\x16\x03\x7e\x02\x26\x00\x09\x00\x00\x00\
-\x07\x03\x33\x01\x2e\x00\x00\xff\xff\x00\x43\xff\xf4\x02\x15\x03\
-\x7c\x02\x26\x00\x09\x00\x00\x00\x07\x03\x35\x01\x2e\x00\x00\x00\
-\x02\x00\x43\xff\xf4\x02\x15\x02\x10\x00\x1d\x00\x2a\x00\x67\xba\
-\x00\x17\x00\x2b\x00\x2c\x11\x12\x39\xb8\x00\x17\x10\xb8\x00\x23\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\
-\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x17\x2f\x1b\xb9\x00\x17\
-\x00\x0e\x3e\x59\xb8\x00\x0d\x10\xb9\x00\x06\x00\x08\xf4\xb8\x00\
-\x17\x10\xb9\x00\x23\x00\x08\xf4\xba\x00\x00\x00\x06\x00\x23\x11\
-\x12\x39\xb8\x00\x00\x2f\xb8\x00\x09\xd0\xb8\x00\x00\x10\xb9\x00\
-\x29\x00\x08\xf4\x30\x31\x01\x35\x34\x2e\x02\x23\x22\x06\x07\x27\
-\x3e\x01\x33\x32\x1e\x02\x15\x14\x0e\x02\x23\x22\x2e\x02\x3d\x01\
-\x17\x14\x1e\x02\x33\x32\x3e\x02\x3d\x01\x21\x01\xc1\x16\x29\x3b\
-\x24\x34\x4c\x14\x3b\x17\x6b\x4d\x37\x5a\x3f\x22\x23\x3e\x58\x34\
-\x34\x55\x3c\x20\x56\x15\x25\x35\x20\x21\x38\x29\x17\xfe\xd8\x01\
-\x16\x18\x22\x3a\x2a\x17\x30\x2a\x28\x34\x43\x26\x47\x63\x3d\x3e\
-\x64\x47\x26\x26\x43\x5c\x37\x26\x47\x22\x38\x29\x16\x18\x2a\x39\
-\x22\x07\x00\xff\xff\x00\x43\xff\x2c\x02\x31\x03\x00\x02\x26\x00\
-\x0d\x00\x00\x00\x06\x03\x0e\xfe\x00\x00\x00\xff\xff\x00\x43\xff\
-\x2c\x02\x31\x02\xfd\x02\x26\x00\x0d\x00\x00\x00\x06\x03\x0c\xfe\
-\x00\x00\x00\xff\xff\x00\x43\xff\x2c\x02\x31\x03\x08\x02\x26\x00\
-\x0b\x00\x00\x00\x06\x03\x12\xfe\x00\x00\x00\xff\xff\x00\x43\xff\
-\x2c\x02\x31\x02\xda\x02\x26\x00\x0b\x00\x00\x00\x06\x03\x07\xfe\
-\x00\x00\x00\xff\xff\x00\x3c\xff\x2c\x01\xf9\x03\x00\x02\x26\x00\
-\x0c\x00\x00\x00\x06\x03\x0e\xf4\x00\x00\x00\xff\xff\x00\x3c\xff\
-\x2c\x01\xf9\x02\xfd\x02\x26\x00\x0c\x00\x00\x00\x06\x03\x0c\xf4\
-\x00\x00\x00\xff\xff\x00\x3c\xff\x2c\x01\xf9\x03\x08\x02\x26\x00\
-\x0c\x00\x00\x00\x06\x03\x12\xf4\x00\x00\x00\xff\xff\x00\x3c\xff\
-\x2c\x01\xf9\x02\xda\x02\x26\x00\x0c\x00\x00\x00\x06\x03\x07\xf4\
-\x00\x00\x00\x00\x01\x00\x21\x00\x00\x01\xfc\x02\xe4\x00\x20\x00\
-\x9c\xba\x00\x1a\x00\x21\x00\x22\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1e\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x16\x2f\x1b\xb9\x00\x16\x00\x0e\x3e\x59\
-\x41\x07\x00\x00\x00\x11\x00\x10\x00\x11\x00\x20\x00\x11\x00\x03\
-\x5d\xba\x00\x08\x00\x06\x00\x11\x11\x12\x39\xb8\x00\x08\x2f\xb9\
-\x00\x09\x00\x08\xf4\xb8\x00\x01\xd0\xb8\x00\x08\x10\xb8\x00\x04\
-\xd0\xb8\x00\x11\x10\xb9\x00\x1a\x00\x08\xf4\xba\x00\x0b\x00\x1a\
-\x00\x00\x11\x12\x39\x7d\xb8\x00\x0b\x2f\x18\x30\x31\x33\x11\x23\
-\x35\x33\x35\x33\x15\x33\x15\x23\x15\x33\x3e\x03\x33\x32\x16\x15\
-\x11\x23\x11\x34\x26\x23\x22\x0e\x02\x15\x11\x62\x41\x41\x50\x99\
-\x99\x04\x08\x18\x23\x30\x20\x51\x62\x50\x3e\x3c\x18\x2e\x24\x16\
-\x02\x60\x3e\x46\x46\x3e\xb0\x13\x23\x1a\x10\x67\x5e\xfe\xb5\x01\
-\x3d\x47\x45\x0c\x18\x26\x19\xfe\x9a\x00\x00\xff\xff\xff\xea\x00\
-\x00\x01\xfc\x03\xb3\x02\x26\x00\x0e\x00\x00\x00\x07\x03\x0c\xff\
-\x5f\x00\xb6\x00\x01\x00\x6a\x00\x00\x02\x22\x02\x04\x00\x09\x00\
-\x47\xba\x00\x01\x00\x0a\x00\x0b\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x0e\x3e\x59\xb9\x00\
-\x00\x00\x08\xf4\xb8\x00\x04\x10\xb9\x00\x03\x00\x08\xf4\xb8\x00\
-\x00\x10\xb8\x00\x06\xd0\x30\x31\x37\x33\x11\x23\x35\x21\x11\x33\
-\x15\x21\x6a\xba\xba\x01\x0a\xae\xfe\x48\x44\x01\x7c\x44\xfe\x40\
-\x44\x00\x00\xff\xff\x00\x6a\x00\x00\x02\x22\x03\x0b\x02\x26\x01\
-\x02\x00\x00\x00\x06\x03\x0a\x20\x00\x00\x00\xff\xff\x00\x6a\x00\
-\x00\x02\x22\x03\x00\x02\x26\x01\x02\x00\x00\x00\x06\x03\x0e\x20\
-\x00\x00\x00\xff\xff\x00\x6a\x00\x00\x02\x22\x02\xfd\x02\x26\x01\
-\x02\x00\x00\x00\x06\x03\x0c\x20\x00\x00\x00\xff\xff\x00\x6a\x00\
-\x00\x02\x22\x02\xd4\x02\x26\x01\x02\x00\x00\x00\x06\x03\x08\x20\
-\x00\x00\x00\xff\xff\x00\x6a\xff\x54\x02\x22\x02\xec\x02\x26\x00\
-\x0f\x00\x00\x00\x07\x03\x26\x01\x4c\x00\x00\xff\xff\x00\x6a\x00\
-\x00\x02\x22\x03\x0b\x02\x26\x01\x02\x00\x00\x00\x06\x03\x0b\x20\
-\x00\x00\x00\xff\xff\x00\x6a\x00\x00\x02\x22\x02\xfd\x02\x26\x01\
-\x02\x00\x00\x00\x07\x03\x21\x01\x4c\x00\x00\xff\xff\x00\x6a\x00\
-\x00\x02\x22\x02\xc1\x02\x26\x01\x02\x00\x00\x00\x06\x03\x06\x20\
-\x00\x00\x00\x00\x02\x00\x6a\xff\x31\x02\x37\x02\xec\x00\x1e\x00\
-\x2c\x00\x8f\xba\x00\x0a\x00\x2d\x00\x2e\x11\x12\x39\xb8\x00\x0a\
-\x10\xb8\x00\x22\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\
-\xb9\x00\x0d\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\
-\x1b\xb9\x00\x08\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\
-\x2f\x1b\xb9\x00\x00\x00\x10\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x11\x2f\x1b\xb9\x00\x11\x00\x0e\x3e\x59\xb8\x00\x08\x10\xb9\x00\
-\x09\x00\x08\xf4\xb8\x00\x0d\x10\xb9\x00\x0c\x00\x08\xf4\xb8\x00\
-\x09\x10\xb8\x00\x0f\xd0\xb8\x00\x00\x10\xb9\x00\x19\x00\x03\xf4\
-\xb8\x00\x0d\x10\xb9\x00\x1f\x00\x07\xf4\xb9\x00\x26\x00\x06\xf4\
-\x30\x31\x05\x22\x26\x35\x34\x36\x37\x27\x21\x35\x33\x11\x23\x35\
-\x21\x11\x33\x15\x0e\x03\x15\x14\x16\x33\x32\x37\x17\x0e\x01\x03\
-\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x01\xda\x2e\
-\x3f\x3a\x39\x01\xfe\x8b\xba\xba\x01\x0a\xae\x27\x2d\x17\x06\x1a\
-\x10\x1f\x15\x28\x0a\x2d\xb4\x23\x1c\x1c\x23\x23\x1c\x1c\xcf\x28\
-\x28\x24\x3d\x1b\x03\x44\x01\x7c\x44\xfe\x40\x44\x18\x24\x1b\x14\
-\x07\x15\x10\x1a\x29\x11\x18\x03\x45\x1d\x16\x10\x16\x1d\x1d\x16\
-\x10\x16\x1d\xff\xff\x00\x6a\x00\x00\x02\x22\x02\xd8\x02\x26\x01\
-\x02\x00\x00\x00\x06\x03\x04\x20\x00\x00\x00\x00\x04\x00\x52\xff\
-\x38\x02\x06\x02\xec\x00\x03\x00\x0c\x00\x1a\x00\x28\x00\x93\xba\
-\x00\x0b\x00\x29\x00\x2a\x11\x12\x39\xb8\x00\x0b\x10\xb8\x00\x02\
-\xd0\xb8\x00\x0b\x10\xb8\x00\x18\xd0\xb8\x00\x0b\x10\xb8\x00\x1e\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\
-\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\
-\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\
-\x0c\x00\x10\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\
-\x00\x02\x00\x0e\x3e\x59\xb8\x00\x0c\x10\xb9\x00\x04\x00\x08\xf4\
-\xb8\x00\x00\x10\xb9\x00\x0d\x00\x07\xf4\xb9\x00\x14\x00\x06\xf4\
-\xb8\x00\x0d\x10\xb8\x00\x1b\xd0\xb8\x00\x14\x10\xb8\x00\x22\xd0\
-\x30\x31\x13\x33\x11\x23\x17\x33\x11\x33\x11\x14\x06\x2b\x01\x03\
-\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x21\x22\x26\
-\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x69\x50\x50\x50\xe6\
-\x50\x37\x3b\xc4\x28\x23\x1c\x1c\x23\x23\x1c\x1c\x01\x13\x23\x1c\
-\x1c\x23\x23\x1c\x1c\x02\x04\xfd\xfc\x84\x02\x88\xfd\xaa\x34\x42\
-\x03\x3e\x1d\x16\x10\x16\x1d\x1d\x16\x10\x16\x1d\x1d\x16\x10\x16\
-\x1d\x1d\x16\x10\x16\x1d\x00\x00\x04\x00\x64\xff\x38\x02\x38\x03\
-\x0b\x00\x03\x00\x0c\x00\x10\x00\x14\x00\x7b\xba\x00\x0f\x00\x15\
-\x00\x16\x11\x12\x39\xb8\x00\x0f\x10\xb8\x00\x02\xd0\xb8\x00\x0f\
-\x10\xb8\x00\x0b\xd0\xb8\x00\x0f\x10\xb8\x00\x11\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1a\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x0e\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x10\
-\x3e\x59\xb9\x00\x04\x00\x08\xf4\xb8\x00\x00\x10\xb8\x00\x10\xdc\
-\xb8\x00\x14\xd0\x30\x31\x13\x33\x11\x23\x17\x33\x11\x33\x11\x14\
-\x06\x2b\x01\x03\x37\x17\x07\x25\x37\x17\x07\x69\x50\x50\x50\xe6\
-\x50\x37\x3b\xc4\x55\x55\x49\x6a\x01\x02\x55\x49\x6a\x02\x04\xfd\
-\xfc\x84\x02\x88\xfd\xaa\x34\x42\x03\x29\xaa\x23\x9f\x18\xaa\x23\
-\x9f\x00\x00\x00\x01\x00\x5d\xff\x38\x01\xb0\x02\x04\x00\x0a\x00\
-\x3f\xba\x00\x09\x00\x0b\x00\x0c\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x10\x3e\x59\xb9\x00\
-\x00\x00\x08\xf4\xb8\x00\x04\x10\xb9\x00\x03\x00\x08\xf4\x30\x31\
-\x17\x33\x11\x21\x35\x21\x11\x14\x06\x2b\x01\x66\xfa\xfe\xfd\x01\
-\x53\x37\x3b\xd8\x84\x02\x44\x44\xfd\xaa\x34\x42\x00\x00\x00\xff\
-\xff\x00\x5d\xff\x38\x01\xf9\x03\x0b\x02\x26\x01\x0f\x00\x00\x00\
-\x06\x03\x0a\x5c\x00\x00\x00\xff\xff\x00\x5d\xff\x38\x02\x29\x02\
-\xfd\x02\x26\x01\x0f\x00\x00\x00\x06\x03\x0c\x5c\x00\x00\x00\xff\
-\xff\x00\x69\xff\x05\x02\x3e\x02\xe4\x02\x26\x00\x11\x00\x00\x00\
-\x07\x03\x27\x01\x43\x00\x00\x00\x01\x00\x6a\x00\x00\x02\x42\x02\
-\x04\x00\x0d\x00\x63\xba\x00\x08\x00\x0e\x00\x0f\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\
-\x00\x0e\x3e\x59\xba\x00\x06\x00\x04\x00\x03\x11\x12\x39\xb8\x00\
-\x06\x10\xb8\x00\x01\xd0\x30\x31\x25\x07\x15\x23\x11\x33\x11\x33\
-\x3f\x01\x33\x07\x13\x23\x01\x1b\x61\x50\x50\x04\x5f\xaa\x62\xd6\
-\xef\x63\xfd\x58\xa5\x02\x04\xfe\xfb\x5d\xa8\xd2\xfe\xce\x00\xff\
-\xff\x00\x50\x00\x00\x02\x08\x03\xc1\x02\x26\x00\x12\x00\x00\x01\
-\x07\x03\x0a\x00\x00\x00\xb6\x00\x0b\x00\xba\x00\x0a\x00\x05\x00\
-\x03\x2b\x30\x31\x00\x00\x00\xff\xff\x00\x50\x00\x00\x02\x18\x02\
-\xe4\x02\x26\x00\x12\x00\x00\x00\x07\x03\x13\x00\xec\x00\x00\xff\
-\xff\x00\x50\xff\x05\x02\x08\x02\xe4\x02\x26\x00\x12\x00\x00\x00\
-\x07\x03\x27\x01\x2c\x00\x00\xff\xff\x00\x50\x00\x00\x02\x41\x02\
-\xe4\x02\x26\x00\x12\x00\x00\x00\x07\x03\x07\x00\xd6\xfe\x93\x00\
-\x01\x00\x50\x00\x00\x02\x08\x02\xe4\x00\x11\x00\x9b\xba\x00\x01\
-\x00\x12\x00\x13\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x08\
-\x2f\x1b\xb9\x00\x08\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x11\x2f\x1b\xb9\x00\x11\x00\x0e\x3e\x59\xb9\x00\x00\x00\x08\xf4\
-\xb8\x00\x08\x10\xb9\x00\x07\x00\x08\xf4\xba\x00\x03\x00\x07\x00\
-\x00\x11\x12\x39\xb8\x00\x03\x2f\xba\x00\x0b\x00\x07\x00\x00\x11\
-\x12\x39\xb8\x00\x0b\x2f\xb9\x00\x0c\x00\x08\xf4\xba\x00\x02\x00\
-\x03\x00\x0c\x11\x12\x39\xb8\x00\x03\x10\xb9\x00\x04\x00\x08\xf4\
-\xba\x00\x05\x00\x04\x00\x0b\x11\x12\x39\xba\x00\x0a\x00\x04\x00\
-\x0b\x11\x12\x39\xba\x00\x0d\x00\x03\x00\x0c\x11\x12\x39\xb8\x00\
-\x00\x10\xb8\x00\x0e\xd0\x30\x31\x37\x33\x35\x07\x35\x37\x11\x23\
-\x35\x21\x11\x37\x15\x07\x15\x33\x15\x21\x50\xb4\x99\x99\xb4\x01\
-\x04\x99\x99\xb4\xfe\x48\x44\xdc\x32\x43\x32\x01\x3d\x44\xfe\x96\
-\x32\x43\x32\xf3\x44\x00\x00\xff\xff\x00\x62\x00\x00\x01\xfc\x03\
-\x0b\x02\x26\x00\x14\x00\x00\x00\x06\x03\x0a\x03\x00\x00\x00\xff\
-\xff\x00\x62\x00\x00\x01\xfc\x03\x05\x02\x26\x00\x14\x00\x00\x00\
-\x06\x03\x0d\x03\x00\x00\x00\xff\xff\x00\x62\xff\x05\x01\xfc\x02\
-\x10\x02\x26\x00\x14\x00\x00\x00\x07\x03\x27\x01\x2f\x00\x00\xff\
-\xff\x00\x62\x00\x00\x01\xfc\x02\xd8\x02\x26\x00\x14\x00\x00\x00\
-\x06\x03\x04\x03\x00\x00\x00\x00\x02\x00\x00\x00\x00\x01\xfc\x02\
-\xe4\x00\x18\x00\x1c\x00\x84\xba\x00\x11\x00\x1d\x00\x1e\x11\x12\
-\x39\xb8\x00\x11\x10\xb8\x00\x1a\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1a\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x19\x2f\x1b\xb9\x00\x19\x00\x1e\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x18\x2f\x1b\xb9\x00\x18\x00\x0e\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x0e\x3e\x59\xb8\
-\x00\x08\x10\xb9\x00\x11\x00\x08\xf4\xba\x00\x02\x00\x11\x00\x18\
-\x11\x12\x39\x7d\xb8\x00\x02\x2f\x18\x30\x31\x13\x33\x15\x33\x3e\
-\x03\x33\x32\x16\x15\x11\x23\x11\x34\x26\x23\x22\x0e\x02\x15\x11\
-\x23\x03\x33\x07\x23\x62\x50\x04\x08\x18\x23\x30\x20\x51\x62\x50\
-\x3e\x3c\x18\x2e\x24\x16\x50\x56\x5d\x34\x35\x02\x04\x54\x13\x23\
-\x1a\x10\x67\x5e\xfe\xb5\x01\x3d\x47\x45\x0c\x18\x26\x19\xfe\x9a\
-\x02\xe4\xb9\x00\x01\x00\x62\xff\x38\x01\xfc\x02\x10\x00\x1d\x00\
-\x71\xba\x00\x05\x00\x1e\x00\x1f\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x15\x2f\x1b\xb9\x00\x15\x00\x1a\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x1c\x2f\x1b\xb9\x00\x1c\x00\x10\x3e\x59\
-\xb9\x00\x01\x00\x08\xf4\xb8\x00\x15\x10\xb9\x00\x05\x00\x08\xf4\
-\xba\x00\x0f\x00\x05\x00\x0c\x11\x12\x39\x7d\xb8\x00\x0f\x2f\x18\
-\x30\x31\x17\x33\x11\x34\x26\x23\x22\x0e\x02\x15\x11\x23\x11\x33\
-\x15\x33\x3e\x03\x33\x32\x16\x15\x11\x14\x06\x2b\x01\xb2\xfa\x3e\
-\x3c\x18\x2e\x24\x16\x50\x50\x04\x08\x18\x23\x30\x20\x51\x62\x37\
-\x3b\xd8\x84\x01\xc1\x47\x45\x0c\x18\x26\x19\xfe\x9a\x02\x04\x54\
-\x13\x23\x1a\x10\x67\x5e\xfe\x63\x34\x42\x00\xff\xff\x00\x42\xff\
-\xf4\x02\x16\x03\x0b\x02\x26\x00\x15\x00\x00\x00\x06\x03\x0a\x00\
-\x00\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x16\x03\x00\x02\x26\x00\
-\x15\x00\x00\x00\x06\x03\x0e\x00\x00\x00\x00\xff\xff\x00\x42\xff\
-\xf4\x02\x16\x02\xfd\x02\x26\x00\x15\x00\x00\x00\x06\x03\x0c\x00\
-\x00\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x16\x02\xd4\x02\x26\x00\
-\x15\x00\x00\x00\x06\x03\x08\x00\x00\x00\x00\xff\xff\x00\x42\xff\
-\x54\x02\x16\x02\x10\x02\x26\x00\x15\x00\x00\x00\x07\x03\x26\x01\
-\x2c\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x16\x03\x0b\x02\x26\x00\
-\x15\x00\x00\x00\x06\x03\x0b\x00\x00\x00\x00\xff\xff\x00\x42\xff\
-\xf4\x02\x16\x02\xfd\x02\x26\x00\x15\x00\x00\x00\x07\x03\x21\x01\
-\x2c\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x16\x03\x0a\x02\x26\x00\
-\x15\x00\x00\x00\x06\x03\x09\x00\x00\x00\x00\xff\xff\x00\x42\xff\
-\xf4\x02\x16\x02\xc1\x02\x26\x00\x15\x00\x00\x00\x06\x03\x06\x00\
-\x00\x00\x00\x00\x03\x00\x2f\xff\xd8\x02\x29\x02\x2c\x00\x1b\x00\
-\x24\x00\x2d\x00\x9f\xba\x00\x17\x00\x2e\x00\x2f\x11\x12\x39\xb8\
-\x00\x17\x10\xb8\x00\x1c\xd0\xb8\x00\x17\x10\xb8\x00\x25\xd0\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x17\x2f\x1b\xb9\x00\x17\x00\x0e\
-\x3e\x59\xba\x00\x01\x00\x09\x00\x17\x11\x12\x39\xb9\x00\x25\x00\
-\x08\xf4\xba\x00\x0c\x00\x09\x00\x25\x11\x12\x39\xba\x00\x0f\x00\
-\x09\x00\x25\x11\x12\x39\xba\x00\x1a\x00\x09\x00\x17\x11\x12\x39\
-\xb8\x00\x09\x10\xb9\x00\x1c\x00\x08\xf4\xba\x00\x22\x00\x09\x00\
-\x25\x11\x12\x39\xba\x00\x23\x00\x1c\x00\x17\x11\x12\x39\xba\x00\
-\x2b\x00\x1c\x00\x17\x11\x12\x39\xba\x00\x2c\x00\x09\x00\x25\x11\
-\x12\x39\x30\x31\x17\x37\x2e\x01\x35\x34\x3e\x02\x33\x32\x16\x17\
-\x37\x17\x07\x1e\x01\x15\x14\x0e\x02\x23\x22\x26\x27\x07\x13\x22\
-\x06\x1d\x01\x14\x17\x13\x26\x03\x32\x36\x3d\x01\x34\x27\x03\x16\
-\x2f\x45\x18\x1a\x20\x3d\x57\x36\x2c\x48\x1d\x3f\x2d\x45\x18\x1a\
-\x20\x3d\x57\x36\x2c\x48\x1d\x3f\xd0\x43\x52\x0f\xeb\x25\x40\x43\
-\x52\x0f\xeb\x25\x06\x54\x23\x5b\x36\x3d\x64\x47\x26\x1a\x17\x4d\
-\x22\x54\x23\x5b\x36\x3e\x63\x47\x26\x1a\x17\x4d\x01\xf3\x50\x54\
-\x4a\x32\x21\x01\x1f\x22\xfe\x6e\x50\x54\x4a\x32\x21\xfe\xe1\x22\
-\x00\x00\x00\xff\xff\x00\x2f\xff\xd8\x02\x29\x03\x0b\x02\x26\x01\
-\x28\x00\x00\x00\x06\x03\x0a\x00\x00\x00\x00\xff\xff\x00\x42\xff\
-\xf4\x02\x16\x02\xd8\x02\x26\x00\x15\x00\x00\x00\x06\x03\x04\x00\
-\x00\x00\x00\x00\x02\x00\x42\xff\xf4\x02\x1c\x02\x74\x00\x1b\x00\
-\x29\x00\x72\xba\x00\x0d\x00\x2a\x00\x2b\x11\x12\x39\xb8\x00\x0d\
-\x10\xb8\x00\x1c\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x17\x2f\x1b\
-\xb9\x00\x17\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x19\x2f\
-\x1b\xb9\x00\x19\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0d\
-\x2f\x1b\xb9\x00\x0d\x00\x0e\x3e\x59\xb8\x00\x17\x10\xb9\x00\x23\
-\x00\x08\xf4\xba\x00\x05\x00\x17\x00\x23\x11\x12\x39\xb8\x00\x05\
-\x2f\xb8\x00\x17\x10\xb8\x00\x1b\xdc\xb8\x00\x0d\x10\xb9\x00\x1c\
-\x00\x08\xf4\x30\x31\x01\x15\x14\x06\x2b\x01\x1e\x01\x15\x14\x0e\
-\x02\x23\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x17\x33\x35\x03\x32\
-\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x02\x1c\x19\x26\
-\x16\x26\x29\x20\x3d\x57\x36\x36\x57\x3d\x20\x20\x3d\x57\x36\x2b\
-\x24\x5a\xa9\x43\x52\x52\x43\x43\x52\x52\x02\x74\x64\x19\x24\x23\
-\x6a\x44\x3e\x63\x47\x26\x26\x47\x63\x3e\x3d\x64\x47\x26\x0c\x70\
-\xfd\xc5\x50\x54\x4a\x54\x50\x50\x54\x4a\x54\x50\x00\x00\x00\xff\
-\xff\x00\x42\xff\xf4\x02\x1c\x03\x0b\x02\x26\x01\x2b\x00\x00\x00\
-\x06\x03\x0a\x00\x00\x00\x00\xff\xff\x00\x42\xff\x54\x02\x1c\x02\
-\x74\x02\x26\x01\x2b\x00\x00\x00\x07\x03\x26\x01\x2c\x00\x00\xff\
-\xff\x00\x42\xff\xf4\x02\x1c\x03\x0b\x02\x26\x01\x2b\x00\x00\x00\
-\x06\x03\x0b\x00\x00\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x1c\x02\
-\xfd\x02\x26\x01\x2b\x00\x00\x00\x07\x03\x21\x01\x2c\x00\x00\xff\
-\xff\x00\x42\xff\xf4\x02\x1c\x02\xd4\x02\x26\x01\x2b\x00\x00\x00\
-\x06\x03\x05\x00\x00\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x30\x03\
-\x89\x02\x26\x00\x15\x00\x00\x00\x07\x03\x30\x01\x2c\x00\x00\xff\
-\xff\x00\x42\xff\x54\x02\x16\x02\xfd\x02\x26\x00\x15\x00\x00\x00\
-\x26\x03\x0c\x00\x00\x00\x07\x03\x26\x01\x2c\x00\x00\x00\x00\xff\
-\xff\x00\x28\xff\xf4\x02\x16\x03\x89\x02\x26\x00\x15\x00\x00\x00\
-\x07\x03\x32\x01\x2c\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x16\x03\
-\x7e\x02\x26\x00\x15\x00\x00\x00\x07\x03\x33\x01\x2c\x00\x00\xff\
-\xff\x00\x42\xff\xf4\x02\x16\x03\x7c\x02\x26\x00\x15\x00\x00\x00\
-\x07\x03\x35\x01\x2c\x00\x00\x00\x03\x00\x0e\xff\xf4\x02\x46\x02\
-\x10\x00\x0d\x00\x16\x00\x41\x00\xad\xba\x00\x2b\x00\x42\x00\x43\
-\x11\x12\x39\xb8\x00\x2b\x10\xb8\x00\x03\xd0\xb8\x00\x2b\x10\xb8\
-\x00\x16\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x27\x2f\x1b\xb9\x00\
-\x27\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x2e\x2f\x1b\xb9\
-\x00\x2e\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x17\x2f\x1b\
-\xb9\x00\x17\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x1d\x2f\
-\x1b\xb9\x00\x1d\x00\x0e\x3e\x59\xb9\x00\x00\x00\x01\xf4\xb8\x00\
-\x27\x10\xb9\x00\x07\x00\x01\xf4\xb8\x00\x2e\x10\xb9\x00\x12\x00\
-\x01\xf4\xb8\x00\x17\x10\xb9\x00\x37\x00\x01\xf4\xba\x00\x33\x00\
-\x12\x00\x37\x11\x12\x39\xb8\x00\x33\x2f\xb9\x00\x16\x00\x01\xf4\
-\xba\x00\x1b\x00\x00\x00\x27\x11\x12\x39\xba\x00\x2a\x00\x07\x00\
-\x1d\x11\x12\x39\x30\x31\x37\x32\x36\x3d\x01\x34\x26\x23\x22\x06\
-\x1d\x01\x14\x16\x25\x35\x34\x26\x23\x22\x06\x1d\x01\x13\x22\x26\
-\x27\x23\x06\x23\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x16\x17\x33\
-\x3e\x01\x33\x32\x16\x1d\x01\x23\x15\x14\x16\x33\x32\x3e\x02\x37\
-\x17\x0e\x03\xb0\x28\x2d\x2d\x28\x28\x2d\x2d\x01\x7c\x2f\x2c\x2c\
-\x2f\x5d\x2a\x42\x17\x03\x28\x53\x28\x3a\x27\x13\x13\x27\x3a\x28\
-\x2c\x41\x12\x03\x16\x44\x2a\x4b\x4b\xf8\x31\x2e\x12\x1c\x15\x0e\
-\x06\x3a\x07\x19\x24\x31\x30\x47\x56\x6a\x56\x47\x47\x56\x6a\x56\
-\x47\xf7\x22\x48\x45\x45\x48\x22\xfe\xcd\x2c\x29\x55\x26\x47\x63\
-\x3e\x3d\x64\x47\x26\x2f\x2f\x34\x2a\x77\x75\x36\x19\x48\x59\x0f\
-\x19\x20\x11\x1b\x17\x2d\x24\x16\x00\x00\x00\xff\xff\x00\x4d\x00\
-\x00\x02\x2f\x03\x0b\x02\x26\x00\x18\x00\x00\x00\x06\x03\x0a\x35\
-\x00\x00\x00\xff\xff\x00\x4d\x00\x00\x02\x2f\x03\x05\x02\x26\x00\
-\x18\x00\x00\x00\x06\x03\x0d\x35\x00\x00\x00\xff\xff\x00\x4d\xff\
-\x05\x02\x2f\x02\x04\x02\x26\x00\x18\x00\x00\x00\x07\x03\x27\x01\
-\x0c\x00\x00\xff\xff\x00\x43\xff\xf4\x02\x0c\x03\x0b\x02\x26\x00\
-\x19\x00\x00\x00\x06\x03\x0a\xff\x00\x00\x00\xff\xff\x00\x43\xff\
-\xf4\x02\x0c\x03\x05\x02\x26\x00\x19\x00\x00\x00\x06\x03\x0d\xff\
-\x00\x00\x00\x00\x01\x00\x43\xff\x31\x02\x0c\x02\x10\x00\x4e\x00\
-\x96\xba\x00\x32\x00\x4f\x00\x50\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x29\x2f\x1b\xb9\x00\x29\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x43\x2f\x1b\xb9\x00\x43\x00\x0e\x3e\x59\xb8\x00\
-\x47\xdc\x41\x07\x00\x0f\x00\x47\x00\x1f\x00\x47\x00\x2f\x00\x47\
-\x00\x03\x5d\xb8\x00\x0d\xdc\xb8\x00\x07\xdc\xb9\x00\x00\x00\x03\
-\xf4\xb8\x00\x43\x10\xb8\x00\x0f\xd0\xb8\x00\x29\x10\xb9\x00\x32\
-\x00\x08\xf4\xba\x00\x1f\x00\x32\x00\x43\x11\x12\x39\xb8\x00\x43\
-\x10\xb9\x00\x16\x00\x08\xf4\xba\x00\x13\x00\x1f\x00\x16\x11\x12\
-\x39\xba\x00\x3a\x00\x29\x00\x16\x11\x12\x39\xba\x00\x2d\x00\x32\
-\x00\x3a\x11\x12\x39\x30\x31\x05\x22\x26\x27\x37\x1e\x01\x33\x32\
-\x36\x35\x34\x26\x2f\x01\x37\x2e\x01\x27\x37\x1e\x01\x33\x32\x36\
-\x35\x34\x2e\x02\x2f\x01\x2e\x03\x35\x34\x3e\x02\x33\x32\x16\x17\
-\x07\x2e\x03\x23\x22\x06\x15\x14\x1e\x02\x1f\x01\x1e\x03\x15\x14\
-\x06\x0f\x01\x17\x36\x33\x32\x16\x15\x14\x0e\x02\x01\x36\x29\x2f\
-\x0b\x26\x09\x1e\x16\x13\x19\x1a\x2a\x1c\x0d\x44\x64\x24\x36\x25\
-\x58\x3e\x3c\x4d\x0f\x1a\x20\x12\x51\x1b\x3f\x34\x23\x1f\x38\x4c\
-\x2d\x46\x67\x25\x34\x09\x1b\x27\x34\x22\x3d\x41\x0f\x1a\x21\x11\
-\x51\x1c\x3e\x34\x23\x6e\x5e\x09\x03\x13\x14\x1d\x27\x12\x1f\x28\
-\xcf\x1b\x0e\x29\x0b\x11\x0f\x10\x0e\x15\x06\x04\x43\x05\x35\x29\
-\x2f\x27\x2a\x2b\x2e\x14\x1b\x10\x09\x03\x0c\x04\x0e\x1f\x34\x2a\
-\x27\x39\x27\x13\x2c\x27\x31\x0b\x17\x13\x0c\x2a\x28\x14\x1b\x10\
-\x09\x03\x0c\x04\x0e\x1f\x34\x2a\x4a\x54\x03\x31\x03\x06\x22\x20\
-\x15\x20\x14\x0a\x00\x00\x00\xff\xff\x00\x43\xff\xf4\x02\x0c\x02\
-\xfd\x02\x26\x00\x19\x00\x00\x00\x06\x03\x0c\xff\x00\x00\x00\xff\
-\xff\x00\x43\xff\x05\x02\x0c\x02\x10\x02\x26\x00\x19\x00\x00\x00\
-\x07\x03\x27\x01\x26\x00\x00\x00\x01\x00\x66\xff\x38\x02\x3c\x02\
-\xe4\x00\x22\x00\x8d\xba\x00\x1d\x00\x23\x00\x24\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1e\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\
-\x10\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x22\x2f\x1b\xb9\x00\x22\
-\x00\x0e\x3e\x59\xb8\x00\x04\x10\xb9\x00\x07\x00\x08\xf4\xba\x00\
-\x1f\x00\x08\x00\x22\x11\x12\x39\xb8\x00\x1f\x2f\xb9\x00\x1e\x00\
-\x08\xf4\xba\x00\x0b\x00\x1f\x00\x1e\x11\x12\x39\xb8\x00\x13\x10\
-\xb9\x00\x16\x00\x08\xf4\xb8\x00\x08\x10\xb9\x00\x21\x00\x08\xf4\
-\x30\x31\x33\x11\x34\x36\x3b\x01\x15\x23\x15\x21\x15\x07\x1e\x01\
-\x15\x14\x0e\x02\x2b\x01\x35\x33\x32\x36\x3d\x01\x34\x26\x2b\x01\
-\x35\x37\x21\x11\x66\x37\x3b\x89\xab\x01\x57\xad\x67\x75\x25\x44\
-\x61\x3c\x42\x42\x5a\x57\x5d\x66\x10\xb0\xfe\xf2\x02\x6e\x34\x42\
-\x45\x9b\x4f\xe1\x07\x60\x5f\x34\x50\x36\x1c\x44\x40\x47\x19\x43\
-\x39\x44\xe4\xfe\x40\x00\x00\x00\x01\x00\x1c\xff\xf4\x02\x3c\x02\
-\xf0\x00\x39\x00\x9e\xba\x00\x35\x00\x3a\x00\x3b\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1e\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x31\x2f\x1b\xb9\x00\x31\x00\
-\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x1b\x2f\x1b\xb9\x00\x1b\
-\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x39\x2f\x1b\xb9\x00\
-\x39\x00\x0e\x3e\x59\xb8\x00\x02\x10\xb9\x00\x01\x00\x08\xf4\xb8\
-\x00\x31\x10\xb9\x00\x0e\x00\x08\xf4\xb8\x00\x1b\x10\xb9\x00\x22\
-\x00\x08\xf4\xba\x00\x14\x00\x31\x00\x22\x11\x12\x39\xba\x00\x29\
-\x00\x0e\x00\x1b\x11\x12\x39\xb8\x00\x09\x10\xb9\x00\x35\x00\x08\
-\xf4\x30\x31\x13\x23\x35\x33\x35\x34\x3e\x02\x33\x32\x16\x1d\x01\
-\x23\x22\x06\x15\x14\x16\x1f\x01\x1e\x01\x15\x14\x06\x23\x22\x26\
-\x27\x37\x1e\x01\x33\x32\x36\x35\x34\x26\x2f\x01\x2e\x03\x35\x34\
-\x36\x37\x35\x34\x26\x23\x22\x15\x11\x23\x66\x4a\x4a\x1b\x35\x4c\
-\x30\x60\x66\x2f\x3c\x40\x29\x24\x18\x47\x43\x5b\x51\x37\x4f\x20\
-\x33\x17\x3c\x25\x2d\x2f\x1b\x29\x19\x1c\x35\x28\x19\x5a\x4e\x3a\
-\x3f\x7c\x4f\x01\xc0\x44\x05\x34\x56\x3c\x21\x7e\x69\x3d\x26\x2d\
-\x24\x1e\x0c\x08\x17\x41\x3f\x4d\x4b\x24\x28\x2e\x20\x1a\x26\x2a\
-\x1c\x30\x0d\x08\x09\x14\x1f\x30\x25\x46\x4a\x02\x08\x51\x4c\x9d\
-\xfd\xf0\x00\x00\x01\x00\x27\x00\x00\x02\x0e\x02\xba\x00\x1b\x00\
-\x88\xba\x00\x1a\x00\x1c\x00\x1d\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x10\x2f\x1b\xb9\x00\x10\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x1a\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xba\
-\x00\x06\x00\x0b\x00\x00\x11\x12\x39\xb8\x00\x06\x2f\xb9\x00\x07\
-\x00\x08\xf4\xb8\x00\x0b\x10\xb9\x00\x0a\x00\x08\xf4\xb8\x00\x0b\
-\x10\xb8\x00\x12\xd0\xb8\x00\x0a\x10\xb8\x00\x15\xd0\xb8\x00\x07\
-\x10\xb8\x00\x16\xd0\xb8\x00\x06\x10\xb8\x00\x19\xd0\xb8\x00\x00\
-\x10\xb9\x00\x1b\x00\x08\xf4\x30\x31\x21\x23\x22\x26\x3d\x01\x23\
-\x35\x33\x35\x23\x35\x33\x32\x36\x3d\x01\x33\x15\x33\x15\x23\x15\
-\x33\x15\x23\x15\x33\x02\x0c\xc7\x3b\x37\x6d\x6d\xac\x80\x1a\x15\
-\x4d\xeb\xeb\xad\xad\xe9\x42\x34\x81\x3e\x8b\x44\x15\x1a\x87\xb6\
-\x44\x8b\x3e\xb3\x00\x00\x00\xff\xff\x00\x27\x00\x00\x02\x0e\x02\
-\xf8\x02\x26\x00\x1a\x00\x00\x00\x07\x03\x13\x00\xc5\x00\x14\xff\
-\xff\x00\x27\xff\x05\x02\x0e\x02\xba\x02\x26\x00\x1a\x00\x00\x00\
-\x07\x03\x27\x01\x77\x00\x00\xff\xff\x00\x27\xff\x05\x02\x0e\x02\
-\xba\x02\x26\x00\x1a\x00\x00\x00\x07\x03\x27\x01\x77\x00\x00\x00\
-\x02\x00\x5f\xff\x38\x02\x1c\x02\xe4\x00\x10\x00\x22\x00\x81\xba\
-\x00\x11\x00\x23\x00\x24\x11\x12\x39\xb8\x00\x11\x10\xb8\x00\x0b\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\
-\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\
-\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x10\x2f\x1b\xb9\x00\
-\x10\x00\x10\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\
-\x00\x0b\x00\x0e\x3e\x59\xb8\x00\x05\x10\xb9\x00\x18\x00\x08\xf4\
-\xb8\x00\x0b\x10\xb9\x00\x11\x00\x08\xf4\xba\x00\x02\x00\x18\x00\
-\x11\x11\x12\x39\xba\x00\x0d\x00\x11\x00\x18\x11\x12\x39\x30\x31\
-\x13\x33\x11\x33\x36\x33\x32\x16\x15\x14\x06\x23\x22\x27\x23\x11\
-\x23\x13\x32\x36\x3d\x01\x34\x26\x23\x22\x0e\x02\x1d\x01\x14\x1e\
-\x02\x5f\x50\x04\x32\x6d\x5f\x6b\x6b\x5f\x6d\x32\x04\x50\xd4\x46\
-\x4d\x4d\x46\x1b\x30\x24\x15\x15\x24\x30\x02\xe4\xfe\xcc\x60\x8e\
-\x80\x80\x8e\x60\xfe\xe4\x01\x03\x55\x46\x58\x46\x55\x0e\x1b\x27\
-\x1a\xba\x1a\x27\x1b\x0e\x00\xff\xff\x00\x5c\xff\xf4\x01\xf6\x03\
-\x0b\x02\x26\x00\x1b\x00\x00\x00\x06\x03\x0a\xfe\x00\x00\x00\xff\
-\xff\x00\x5c\xff\xf4\x01\xf6\x03\x00\x02\x26\x00\x1b\x00\x00\x00\
-\x06\x03\x0e\xfe\x00\x00\x00\xff\xff\x00\x5c\xff\xf4\x01\xf6\x02\
-\xfd\x02\x26\x00\x1b\x00\x00\x00\x06\x03\x0c\xfe\x00\x00\x00\xff\
-\xff\x00\x5c\xff\xf4\x01\xf6\x02\xd4\x02\x26\x00\x1b\x00\x00\x00\
-\x06\x03\x08\xfe\x00\x00\x00\xff\xff\x00\x5c\xff\x54\x01\xf6\x02\
-\x04\x02\x26\x00\x1b\x00\x00\x00\x07\x03\x26\x01\x29\x00\x00\xff\
-\xff\x00\x5c\xff\xf4\x01\xf6\x03\x0b\x02\x26\x00\x1b\x00\x00\x00\
-\x06\x03\x0b\xfe\x00\x00\x00\xff\xff\x00\x5c\xff\xf4\x01\xf6\x02\
-\xfd\x02\x26\x00\x1b\x00\x00\x00\x07\x03\x21\x01\x29\x00\x00\xff\
-\xff\x00\x5c\xff\xf4\x01\xf6\x03\x0a\x02\x26\x00\x1b\x00\x00\x00\
-\x06\x03\x09\xfe\x00\x00\x00\xff\xff\x00\x5c\xff\xf4\x01\xf6\x02\
-\xc1\x02\x26\x00\x1b\x00\x00\x00\x06\x03\x06\xfe\x00\x00\x00\x00\
-\x01\x00\x5c\xff\x31\x02\x0b\x02\x04\x00\x2d\x00\x80\xba\x00\x26\
-\x00\x2e\x00\x2f\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x21\
-\x2f\x1b\xb9\x00\x21\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x2c\x2f\x1b\xb9\x00\x2c\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x1d\x2f\x1b\xb9\x00\x1d\x00\x0e\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\x10\x3e\x59\xb9\x00\x08\
-\x00\x03\xf4\xb8\x00\x1d\x10\xb9\x00\x26\x00\x08\xf4\xba\x00\x17\
-\x00\x26\x00\x21\x11\x12\x39\xb8\x00\x17\x2f\x30\x31\x21\x0e\x03\
-\x15\x14\x16\x33\x32\x37\x17\x0e\x01\x23\x22\x26\x35\x34\x36\x37\
-\x27\x23\x35\x23\x0e\x03\x23\x22\x26\x35\x11\x33\x11\x14\x16\x33\
-\x32\x3e\x02\x35\x11\x33\x01\xf6\x27\x2d\x17\x06\x1a\x10\x1f\x15\
-\x28\x0a\x2d\x26\x2e\x3f\x3a\x39\x01\x0d\x04\x08\x18\x23\x30\x20\
-\x51\x62\x50\x3e\x3c\x18\x2e\x24\x16\x50\x18\x24\x1b\x14\x07\x15\
-\x10\x1a\x29\x11\x18\x28\x28\x24\x3d\x1b\x03\x54\x13\x23\x1a\x10\
-\x67\x5e\x01\x4b\xfe\xc3\x47\x45\x0c\x18\x25\x1a\x01\x66\x00\xff\
-\xff\x00\x5c\xff\xf4\x01\xf6\x03\x26\x02\x26\x00\x1b\x00\x00\x00\
-\x06\x03\x10\xfe\x00\x00\x00\xff\xff\x00\x5c\xff\xf4\x01\xf6\x02\
-\xd8\x02\x26\x00\x1b\x00\x00\x00\x06\x03\x04\xfe\x00\x00\x00\x00\
-\x01\x00\x5c\xff\xf4\x02\x4b\x02\x74\x00\x1f\x00\x7f\xba\x00\x16\
-\x00\x20\x00\x21\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x11\
-\x2f\x1b\xb9\x00\x11\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x1c\x2f\x1b\xb9\x00\x1c\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x06\x2f\x1b\xb9\x00\x06\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x0e\x3e\x59\xba\x00\x04\x00\
-\x1c\x00\x0d\x11\x12\x39\xb8\x00\x04\x2f\xb8\x00\x0d\x10\xb9\x00\
-\x16\x00\x08\xf4\xba\x00\x07\x00\x11\x00\x16\x11\x12\x39\xb8\x00\
-\x07\x2f\xb8\x00\x1c\x10\xb8\x00\x1e\xdc\x30\x31\x01\x14\x06\x2b\
-\x01\x11\x23\x35\x23\x0e\x03\x23\x22\x26\x35\x11\x33\x11\x14\x16\
-\x33\x32\x3e\x02\x35\x11\x33\x35\x33\x02\x4b\x19\x26\x16\x50\x04\
-\x08\x18\x23\x30\x20\x51\x62\x50\x3e\x3c\x18\x2e\x24\x16\x5e\x47\
-\x02\x0e\x1a\x25\xfe\x31\x54\x13\x23\x1a\x10\x67\x5e\x01\x4b\xfe\
-\xc3\x47\x45\x0c\x18\x25\x1a\x01\x66\x70\x00\xff\xff\x00\x5c\xff\
-\xf4\x02\x4b\x03\x0b\x02\x26\x01\x52\x00\x00\x00\x06\x03\x0a\xfe\
-\x00\x00\x00\xff\xff\x00\x5c\xff\x54\x02\x4b\x02\x74\x02\x26\x01\
-\x52\x00\x00\x00\x07\x03\x26\x01\x29\x00\x00\xff\xff\x00\x5c\xff\
-\xf4\x02\x4b\x03\x0b\x02\x26\x01\x52\x00\x00\x00\x06\x03\x0b\xfe\
-\x00\x00\x00\xff\xff\x00\x5c\xff\xf4\x02\x4b\x02\xfd\x02\x26\x01\
-\x52\x00\x00\x00\x07\x03\x21\x01\x29\x00\x00\xff\xff\x00\x5c\xff\
-\xf4\x02\x4b\x02\xd4\x02\x26\x01\x52\x00\x00\x00\x06\x03\x05\xfe\
-\x00\x00\x00\xff\xff\x00\x1e\x00\x00\x02\x3a\x03\x0b\x02\x26\x00\
-\x1d\x00\x00\x00\x06\x03\x0a\x00\x00\x00\x00\xff\xff\x00\x1e\x00\
-\x00\x02\x3a\x02\xfd\x02\x26\x00\x1d\x00\x00\x00\x06\x03\x0c\x00\
-\x00\x00\x00\xff\xff\x00\x1e\x00\x00\x02\x3a\x02\xd4\x02\x26\x00\
-\x1d\x00\x00\x00\x06\x03\x08\x00\x00\x00\x00\xff\xff\x00\x1e\x00\
-\x00\x02\x3a\x03\x0b\x02\x26\x00\x1d\x00\x00\x00\x06\x03\x0b\x00\
-\x00\x00\x00\xff\xff\x00\x35\xff\x38\x02\x23\x03\x0b\x02\x26\x00\
-\x1f\x00\x00\x00\x06\x03\x0a\x00\x00\x00\x00\xff\xff\x00\x35\xff\
-\x38\x02\x23\x02\xfd\x02\x26\x00\x1f\x00\x00\x00\x06\x03\x0c\x00\
-\x00\x00\x00\xff\xff\x00\x35\xff\x38\x02\x23\x02\xd4\x02\x26\x00\
-\x1f\x00\x00\x00\x06\x03\x08\x00\x00\x00\x00\xff\xff\x00\x35\xff\
-\x38\x02\x23\x02\x04\x02\x26\x00\x1f\x00\x00\x00\x07\x03\x26\x01\
-\xcc\x00\x00\xff\xff\x00\x35\xff\x38\x02\x23\x03\x0b\x02\x26\x00\
-\x1f\x00\x00\x00\x06\x03\x0b\x00\x00\x00\x00\xff\xff\x00\x35\xff\
-\x38\x02\x23\x02\xfd\x02\x26\x00\x1f\x00\x00\x00\x07\x03\x21\x01\
-\x2c\x00\x00\xff\xff\x00\x35\xff\x38\x02\x23\x02\xd8\x02\x26\x00\
-\x1f\x00\x00\x00\x06\x03\x04\x00\x00\x00\x00\xff\xff\x00\x55\x00\
-\x00\x02\x03\x03\x0b\x02\x26\x00\x20\x00\x00\x00\x06\x03\x0a\x00\
-\x00\x00\x00\xff\xff\x00\x55\x00\x00\x02\x03\x03\x05\x02\x26\x00\
-\x20\x00\x00\x00\x06\x03\x0d\x00\x00\x00\x00\xff\xff\x00\x55\x00\
-\x00\x02\x03\x02\xda\x02\x26\x00\x20\x00\x00\x00\x06\x03\x07\x00\
-\x00\x00\x00\xff\xff\x00\x1f\x00\x00\x02\x3a\x03\xb5\x02\x26\x00\
-\x21\x00\x00\x00\x06\x03\x3c\x00\x00\x00\x00\xff\xff\x00\x1f\x00\
-\x00\x02\x3a\x03\xaa\x02\x26\x00\x21\x00\x00\x00\x06\x03\x40\x00\
-\x00\x00\x00\xff\xff\x00\x1f\x00\x00\x02\x3a\x03\xa7\x02\x26\x00\
-\x21\x00\x00\x00\x06\x03\x3e\x00\x00\x00\x00\xff\xff\x00\x1f\x00\
-\x00\x02\x3a\x03\x7e\x02\x26\x00\x21\x00\x00\x00\x06\x03\x3a\x00\
-\x00\x00\x00\xff\xff\x00\x1f\xff\x54\x02\x3a\x02\xba\x02\x26\x00\
-\x21\x00\x00\x00\x07\x03\x26\x01\x2c\x00\x00\xff\xff\x00\x1f\x00\
-\x00\x02\x3a\x03\xb5\x02\x26\x00\x21\x00\x00\x00\x06\x03\x3d\x00\
-\x00\x00\x00\xff\xff\x00\x1f\x00\x00\x02\x3a\x03\xa7\x02\x26\x00\
-\x21\x00\x00\x00\x07\x03\x44\x01\x2c\x00\x00\xff\xff\x00\x1f\x00\
-\x00\x02\x3a\x03\x6b\x02\x26\x00\x21\x00\x00\x00\x06\x03\x38\x00\
-\x00\x00\x00\x00\x02\x00\x1f\xff\x31\x02\x4f\x02\xba\x00\x1c\x00\
-\x20\x00\x7b\xba\x00\x1d\x00\x21\x00\x22\x11\x12\x39\xb8\x00\x1d\
-\x10\xb8\x00\x00\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\
-\xb9\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x1c\x2f\
-\x1b\xb9\x00\x1c\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\
-\x2f\x1b\xb9\x00\x18\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x10\x2f\x1b\xb9\x00\x10\x00\x10\x3e\x59\xb9\x00\x0a\x00\x03\xf4\
-\xba\x00\x1f\x00\x00\x00\x1c\x11\x12\x39\xb8\x00\x1f\x2f\xb9\x00\
-\x1a\x00\x0b\xf4\xb8\x00\x00\x10\xb8\x00\x1e\xd0\x30\x31\x13\x33\
-\x13\x0e\x03\x15\x14\x16\x33\x32\x37\x17\x0e\x01\x23\x22\x26\x35\
-\x34\x36\x37\x27\x23\x27\x23\x07\x23\x01\x23\x03\x33\xf5\x6f\xd6\
-\x27\x2d\x17\x06\x1a\x10\x1f\x15\x28\x0a\x2d\x26\x2e\x3f\x3a\x39\
-\x01\x16\x3b\xf5\x3b\x57\x01\x11\x09\x62\xcd\x02\xba\xfd\x46\x18\
-\x24\x1b\x14\x07\x15\x10\x1a\x29\x11\x18\x28\x28\x24\x3d\x1b\x03\
-\xc7\xc7\x02\x61\xfe\xaf\x00\xff\xff\x00\x1f\x00\x00\x02\x3a\x03\
-\xd0\x02\x26\x00\x21\x00\x00\x00\x06\x03\x42\x00\x00\x00\x00\xff\
-\xff\x00\x1f\x00\x00\x02\x3a\x04\x5f\x02\x26\x00\x21\x00\x00\x00\
-\x06\x03\x43\x00\x00\x00\x00\xff\xff\x00\x1f\x00\x00\x02\x3a\x03\
-\x82\x02\x26\x00\x21\x00\x00\x00\x06\x03\x36\x00\x00\x00\x00\xff\
-\xff\x00\x1f\x00\x00\x02\x3a\x04\x2f\x02\x26\x00\x21\x00\x00\x00\
-\x07\x03\x45\x01\x2c\x00\x00\xff\xff\x00\x1f\xff\x54\x02\x3a\x03\
-\xaa\x02\x26\x00\x21\x00\x00\x00\x26\x03\x40\x00\x00\x00\x07\x03\
-\x26\x01\x2c\x00\x00\x00\x00\xff\xff\x00\x1f\x00\x00\x02\x3a\x04\
-\x2f\x02\x26\x00\x21\x00\x00\x00\x07\x03\x46\x01\x2c\x00\x00\xff\
-\xff\x00\x1f\x00\x00\x02\x3a\x04\x24\x02\x26\x00\x21\x00\x00\x00\
-\x07\x03\x47\x01\x2c\x00\x00\xff\xff\x00\x1f\x00\x00\x02\x3a\x04\
-\x1b\x02\x26\x00\x21\x00\x00\x00\x07\x03\x48\x01\x2c\x00\x00\xff\
-\xff\x00\x1f\x00\x00\x02\x3a\x04\x33\x02\x26\x00\x21\x00\x00\x00\
-\x07\x03\x4c\x01\x2c\x00\x00\xff\xff\x00\x1f\xff\x54\x02\x3a\x03\
-\xa7\x02\x26\x00\x21\x00\x00\x00\x26\x03\x3e\x00\x00\x00\x07\x03\
-\x26\x01\x2c\x00\x00\x00\x00\xff\xff\x00\x1f\x00\x00\x02\x3a\x04\
-\x33\x02\x26\x00\x21\x00\x00\x00\x07\x03\x4e\x01\x2c\x00\x00\xff\
-\xff\x00\x1f\x00\x00\x02\x3a\x04\x28\x02\x26\x00\x21\x00\x00\x00\
-\x07\x03\x4f\x01\x2c\x00\x00\xff\xff\x00\x1f\x00\x00\x02\x3a\x04\
-\x26\x02\x26\x00\x21\x00\x00\x00\x07\x03\x51\x01\x2c\x00\x00\x00\
-\x02\x00\x14\x00\x00\x02\x30\x02\xba\x00\x0f\x00\x13\x00\x8c\xba\
-\x00\x0f\x00\x14\x00\x15\x11\x12\x39\xb8\x00\x0f\x10\xb8\x00\x12\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\
-\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\
-\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\
-\x02\x00\x0e\x3e\x59\xba\x00\x11\x00\x05\x00\x0e\x11\x12\x39\xb8\
-\x00\x11\x2f\xb9\x00\x01\x00\x0b\xf4\xb8\x00\x05\x10\xb9\x00\x06\
-\x00\x0b\xf4\xba\x00\x0b\x00\x06\x00\x0e\x11\x12\x39\xb8\x00\x0b\
-\x2f\xb9\x00\x08\x00\x0b\xf4\xb8\x00\x0e\x10\xb9\x00\x0d\x00\x0b\
-\xf4\xb8\x00\x06\x10\xb8\x00\x13\xd0\x30\x31\x25\x23\x07\x23\x13\
-\x21\x15\x23\x15\x33\x15\x23\x15\x33\x15\x23\x0b\x01\x33\x11\x01\
-\x38\x98\x38\x54\xce\x01\x4e\xa8\x9c\x9c\xa8\xf8\x1f\x67\x86\xc9\
-\xc9\x02\xba\x45\xf1\x45\xfa\x45\x02\x7e\xfe\x90\x01\x70\x00\xff\
-\xff\x00\x14\x00\x00\x02\x30\x03\xb5\x02\x26\x01\x7c\x00\x00\x00\
-\x06\x03\x3c\x5d\x00\x00\x00\xff\xff\x00\x46\xff\xf4\x02\x1a\x03\
-\xb5\x02\x26\x00\x23\x00\x00\x00\x06\x03\x3c\x1c\x00\x00\x00\xff\
-\xff\x00\x46\xff\xf4\x02\x1a\x03\xaf\x02\x26\x00\x23\x00\x00\x00\
-\x06\x03\x3f\x1c\x00\x00\x00\x00\x01\x00\x46\xff\x31\x02\x1a\x02\
-\xc6\x00\x3d\x00\x72\xba\x00\x2b\x00\x3e\x00\x3f\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x33\x2f\x1b\xb9\x00\x33\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x12\x2f\x1b\xb9\x00\x12\x00\x0e\
-\x3e\x59\xb8\x00\x33\x10\xb9\x00\x00\x00\x0b\xf4\xb8\x00\x12\x10\
-\xb9\x00\x07\x00\x0b\xf4\xb8\x00\x12\x10\xb8\x00\x16\xdc\x41\x07\
-\x00\x0f\x00\x16\x00\x1f\x00\x16\x00\x2f\x00\x16\x00\x03\x5d\xb8\
-\x00\x2b\xdc\xb8\x00\x25\xdc\xb9\x00\x1e\x00\x03\xf4\xb8\x00\x12\
-\x10\xb8\x00\x2d\xd0\x30\x31\x01\x22\x06\x1d\x01\x14\x16\x33\x32\
-\x3e\x02\x37\x17\x0e\x03\x0f\x01\x17\x36\x33\x32\x16\x15\x14\x0e\
-\x02\x23\x22\x26\x27\x37\x1e\x01\x33\x32\x36\x35\x34\x26\x2f\x01\
-\x37\x2e\x01\x35\x34\x36\x33\x32\x1e\x02\x17\x07\x2e\x03\x01\x43\
-\x53\x51\x51\x53\x20\x2d\x21\x18\x09\x48\x0d\x21\x31\x43\x2e\x09\
-\x03\x13\x14\x1d\x27\x12\x1f\x28\x16\x29\x2f\x0b\x26\x09\x1e\x16\
-\x13\x19\x1a\x2a\x1c\x0d\x6b\x68\x7d\x80\x30\x46\x32\x22\x0d\x48\
-\x09\x18\x21\x2d\x02\x7d\x7e\x69\x72\x69\x7e\x12\x1f\x29\x17\x21\
-\x1c\x36\x2b\x1b\x01\x31\x03\x06\x22\x20\x15\x20\x14\x0a\x1b\x0e\
-\x29\x0b\x11\x0f\x10\x0e\x15\x06\x04\x44\x0f\xb6\xa1\xaf\xba\x1a\
-\x2c\x37\x1c\x21\x17\x29\x1f\x12\x00\x00\x00\xff\xff\x00\x46\xff\
-\xf4\x02\x1a\x03\xa7\x02\x26\x00\x23\x00\x00\x00\x06\x03\x3e\x1c\
-\x00\x00\x00\xff\xff\x00\x46\xff\xf4\x02\x1a\x03\x84\x02\x26\x00\
-\x23\x00\x00\x00\x06\x03\x39\x1c\x00\x00\x00\xff\xff\x00\x5f\x00\
-\x00\x02\x20\x03\xaf\x02\x26\x00\x24\x00\x00\x00\x06\x03\x3f\xea\
-\x00\x00\x00\x00\x02\x00\x16\x00\x00\x02\x20\x02\xba\x00\x0c\x00\
-\x1a\x00\x6f\xba\x00\x0b\x00\x1b\x00\x1c\x11\x12\x39\xb8\x00\x0b\
-\x10\xb8\x00\x0d\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\
-\xb9\x00\x04\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\
-\x1b\xb9\x00\x0c\x00\x0e\x3e\x59\xba\x00\x00\x00\x04\x00\x0c\x11\
-\x12\x39\xb8\x00\x00\x2f\xb9\x00\x03\x00\x08\xf4\xb8\x00\x04\x10\
-\xb9\x00\x15\x00\x0b\xf4\xb8\x00\x03\x10\xb8\x00\x16\xd0\xb8\x00\
-\x00\x10\xb8\x00\x19\xd0\xb8\x00\x0c\x10\xb9\x00\x1a\x00\x0b\xf4\
-\x30\x31\x13\x23\x35\x33\x11\x33\x32\x16\x15\x14\x06\x2b\x01\x37\
-\x32\x36\x3d\x01\x34\x26\x2b\x01\x15\x33\x15\x23\x11\x66\x50\x50\
-\xbc\x80\x7e\x7e\x80\xbc\xb8\x54\x55\x55\x54\x64\x8d\x8d\x01\x50\
-\x40\x01\x2a\xb0\xad\xad\xb0\x49\x74\x6a\x6c\x6a\x74\xe1\x40\xfe\
-\xf9\x00\x00\xff\xff\x00\x16\x00\x00\x02\x20\x02\xba\x02\x06\x01\
-\x84\x00\x00\xff\xff\x00\x5a\x00\x00\x02\x08\x03\xb5\x02\x26\x00\
-\x25\x00\x00\x00\x06\x03\x3c\x05\x00\x00\x00\xff\xff\x00\x5a\x00\
-\x00\x02\x08\x03\xaa\x02\x26\x00\x25\x00\x00\x00\x06\x03\x40\x05\
-\x00\x00\x00\xff\xff\x00\x5a\x00\x00\x02\x08\x03\xaf\x02\x26\x00\
-\x25\x00\x00\x00\x06\x03\x3f\x05\x00\x00\x00\xff\xff\x00\x5a\x00\
-\x00\x02\x08\x03\xa7\x02\x26\x00\x25\x00\x00\x00\x06\x03\x3e\x05\
-\x00\x00\x00\xff\xff\x00\x5a\x00\x00\x02\x08\x03\x7e\x02\x26\x00\
-\x25\x00\x00\x00\x06\x03\x3a\x05\x00\x00\x00\xff\xff\x00\x5a\x00\
-\x00\x02\x08\x03\x84\x02\x26\x00\x25\x00\x00\x00\x06\x03\x39\x05\
-\x00\x00\x00\xff\xff\x00\x5a\xff\x54\x02\x08\x02\xba\x02\x26\x00\
-\x25\x00\x00\x00\x07\x03\x26\x01\x31\x00\x00\xff\xff\x00\x5a\x00\
-\x00\x02\x08\x03\xb5\x02\x26\x00\x25\x00\x00\x00\x06\x03\x3d\x05\
-\x00\x00\x00\xff\xff\x00\x5a\x00\x00\x02\x08\x03\xa7\x02\x26\x00\
-\x25\x00\x00\x00\x07\x03\x44\x01\x31\x00\x00\xff\xff\x00\x5a\x00\
-\x00\x02\x08\x03\x6b\x02\x26\x00\x25\x00\x00\x00\x06\x03\x38\x05\
-\x00\x00\x00\x00\x01\x00\x5a\xff\x31\x02\x1d\x02\xba\x00\x20\x00\
-\x7a\xba\x00\x1b\x00\x21\x00\x22\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x20\x2f\x1b\xb9\x00\x20\x00\x0e\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x18\x2f\x1b\xb9\x00\x18\x00\x10\x3e\x59\xb8\
-\x00\x00\x10\xb9\x00\x03\x00\x0b\xf4\xba\x00\x07\x00\x03\x00\x20\
-\x11\x12\x39\xb8\x00\x07\x2f\xb9\x00\x04\x00\x0b\xf4\xb8\x00\x20\
-\x10\xb9\x00\x08\x00\x0b\xf4\xb8\x00\x20\x10\xb8\x00\x0a\xd0\xb8\
-\x00\x18\x10\xb9\x00\x12\x00\x03\xf4\x30\x31\x13\x21\x15\x21\x15\
-\x21\x15\x21\x15\x21\x15\x0e\x03\x15\x14\x16\x33\x32\x37\x17\x0e\
-\x01\x23\x22\x26\x35\x34\x36\x37\x27\x21\x5a\x01\xae\xfe\xa6\x01\
-\x4e\xfe\xb2\x01\x5a\x27\x2d\x17\x06\x1a\x10\x1f\x15\x28\x0a\x2d\
-\x26\x2e\x3f\x3a\x39\x01\xfe\x95\x02\xba\x49\xeb\x49\xf4\x49\x18\
-\x24\x1b\x14\x07\x15\x10\x1a\x29\x11\x18\x28\x28\x24\x3d\x1b\x03\
-\x00\x00\x00\xff\xff\x00\x5a\x00\x00\x02\x08\x03\x82\x02\x26\x00\
-\x25\x00\x00\x00\x06\x03\x36\x05\x00\x00\x00\xff\xff\x00\x5a\x00\
-\x00\x02\x35\x04\x33\x02\x26\x00\x25\x00\x00\x00\x07\x03\x4c\x01\
-\x31\x00\x00\xff\xff\x00\x5a\xff\x54\x02\x08\x03\xa7\x02\x26\x00\
-\x25\x00\x00\x00\x26\x03\x3e\x05\x00\x00\x07\x03\x26\x01\x31\x00\
-\x00\x00\x00\xff\xff\x00\x2d\x00\x00\x02\x08\x04\x33\x02\x26\x00\
-\x25\x00\x00\x00\x07\x03\x4e\x01\x31\x00\x00\xff\xff\x00\x5a\x00\
-\x00\x02\x19\x04\x28\x02\x26\x00\x25\x00\x00\x00\x07\x03\x4f\x01\
-\x31\x00\x00\xff\xff\x00\x5a\x00\x00\x02\x08\x04\x26\x02\x26\x00\
-\x25\x00\x00\x00\x07\x03\x51\x01\x31\x00\x00\x00\x02\x00\x38\xff\
-\xf4\x02\x20\x02\xc6\x00\x1d\x00\x2a\x00\x5f\xba\x00\x00\x00\x2b\
-\x00\x2c\x11\x12\x39\xb8\x00\x1e\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x16\x2f\x1b\xb9\x00\x16\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xba\x00\x06\x00\
-\x16\x00\x00\x11\x12\x39\xb8\x00\x06\x2f\xb8\x00\x16\x10\xb9\x00\
-\x0d\x00\x0b\xf4\xb8\x00\x00\x10\xb9\x00\x1e\x00\x0b\xf4\xb8\x00\
-\x06\x10\xb9\x00\x25\x00\x0b\xf4\x30\x31\x05\x22\x2e\x02\x3d\x01\
-\x21\x35\x34\x2e\x02\x23\x22\x0e\x02\x07\x27\x3e\x01\x33\x32\x1e\
-\x02\x15\x14\x06\x27\x32\x3e\x02\x3d\x01\x21\x15\x14\x1e\x02\x01\
-\x2c\x40\x5c\x3c\x1c\x01\x8f\x11\x27\x40\x2e\x15\x2c\x29\x24\x0e\
-\x46\x17\x76\x5b\x43\x5f\x3c\x1b\x75\x80\x2a\x3b\x25\x12\xfe\xc8\
-\x12\x25\x3b\x0c\x31\x5c\x86\x56\x16\x21\x34\x56\x3e\x21\x0a\x1d\
-\x36\x2d\x21\x57\x5b\x32\x5d\x85\x54\xac\xbe\x49\x21\x3c\x55\x35\
-\x0a\x0a\x35\x55\x3c\x21\x00\xff\xff\x00\x38\xff\xf4\x02\x0a\x03\
-\xaa\x02\x26\x00\x27\x00\x00\x00\x06\x03\x40\x06\x00\x00\x00\xff\
-\xff\x00\x38\xff\xf4\x02\x0a\x03\xa7\x02\x26\x00\x27\x00\x00\x00\
-\x06\x03\x3e\x06\x00\x00\x00\xff\xff\x00\x38\xff\x05\x02\x0a\x02\
-\xc6\x02\x26\x00\x27\x00\x00\x00\x07\x03\x27\x01\x2c\x00\x00\xff\
-\xff\x00\x38\xff\xf4\x02\x0a\x03\x84\x02\x26\x00\x27\x00\x00\x00\
-\x06\x03\x39\x06\x00\x00\x00\x00\x02\x00\x0a\x00\x00\x02\x4e\x02\
-\xba\x00\x13\x00\x17\x00\xb3\xba\x00\x02\x00\x18\x00\x19\x11\x12\
-\x39\xb8\x00\x02\x10\xb8\x00\x17\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x1c\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\x0e\x3e\x59\xba\x00\
-\x17\x00\x08\x00\x03\x11\x12\x39\xb8\x00\x17\x2f\x41\x05\x00\x2f\
-\x00\x17\x00\x3f\x00\x17\x00\x02\x5d\x41\x03\x00\xdf\x00\x17\x00\
-\x01\x5d\xb9\x00\x01\x00\x0b\xf4\xba\x00\x04\x00\x08\x00\x03\x11\
-\x12\x39\xb8\x00\x04\x2f\xb9\x00\x07\x00\x08\xf4\xb8\x00\x0a\xd0\
-\xb8\x00\x07\x10\xb8\x00\x0e\xd0\xb8\x00\x04\x10\xb8\x00\x11\xd0\
-\xb8\x00\x04\x10\xb8\x00\x16\xd0\x30\x31\x01\x21\x11\x23\x11\x23\
-\x35\x33\x35\x33\x15\x21\x35\x33\x15\x33\x15\x23\x11\x23\x11\x35\
-\x21\x15\x01\xb4\xfe\xf0\x54\x46\x46\x54\x01\x10\x54\x46\x46\x54\
-\xfe\xf0\x01\x3d\xfe\xc3\x02\x06\x40\x74\x74\x74\x74\x40\xfd\xfa\
-\x01\x86\x80\x80\x00\x00\x00\xff\xff\x00\x50\x00\x00\x02\x08\x03\
-\xa7\x02\x26\x00\x28\x00\x00\x00\x06\x03\x3e\x00\x00\x00\x00\xff\
-\xff\x00\x54\x00\x00\x02\x04\x03\xb5\x02\x26\x00\x29\x00\x00\x00\
-\x06\x03\x3c\x00\x00\x00\x00\xff\xff\x00\x54\x00\x00\x02\x04\x03\
-\xaa\x02\x26\x00\x29\x00\x00\x00\x06\x03\x40\x00\x00\x00\x00\xff\
-\xff\x00\x54\x00\x00\x02\x04\x03\xa7\x02\x26\x00\x29\x00\x00\x00\
-\x06\x03\x3e\x00\x00\x00\x00\xff\xff\x00\x54\x00\x00\x02\x04\x03\
-\x7e\x02\x26\x00\x29\x00\x00\x00\x06\x03\x3a\x00\x00\x00\x00\xff\
-\xff\x00\x54\x00\x00\x02\x04\x03\x84\x02\x26\x00\x29\x00\x00\x00\
-\x06\x03\x39\x00\x00\x00\x00\xff\xff\x00\x54\xff\x54\x02\x04\x02\
-\xba\x02\x26\x00\x29\x00\x00\x00\x07\x03\x26\x01\x2c\x00\x00\xff\
-\xff\x00\x54\x00\x00\x02\x04\x03\xb5\x02\x26\x00\x29\x00\x00\x00\
-\x06\x03\x3d\x00\x00\x00\x00\xff\xff\x00\x54\x00\x00\x02\x04\x03\
-\xa7\x02\x26\x00\x29\x00\x00\x00\x07\x03\x44\x01\x2c\x00\x00\xff\
-\xff\x00\x54\x00\x00\x02\x04\x03\x6b\x02\x26\x00\x29\x00\x00\x00\
-\x06\x03\x38\x00\x00\x00\x00\x00\x01\x00\x54\xff\x31\x02\x19\x02\
-\xba\x00\x20\x00\x6a\xba\x00\x1b\x00\x21\x00\x22\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x20\x2f\x1b\xb9\x00\x20\x00\x0e\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\xb9\x00\x18\x00\
-\x10\x3e\x59\xb8\x00\x20\x10\xb9\x00\x00\x00\x08\xf4\xb8\x00\x04\
-\x10\xb9\x00\x03\x00\x08\xf4\xb8\x00\x07\xd0\xb8\x00\x00\x10\xb8\
-\x00\x08\xd0\xb8\x00\x18\x10\xb9\x00\x12\x00\x03\xf4\x30\x31\x37\
-\x33\x11\x23\x35\x21\x15\x23\x11\x33\x15\x0e\x03\x15\x14\x16\x33\
-\x32\x37\x17\x0e\x01\x23\x22\x26\x35\x34\x36\x37\x27\x21\x54\xae\
-\xae\x01\xb0\xae\xae\x27\x2d\x17\x06\x1a\x10\x1f\x15\x28\x0a\x2d\
-\x26\x2e\x3f\x3a\x39\x01\xfe\x93\x43\x02\x34\x43\x43\xfd\xcc\x43\
-\x18\x24\x1b\x14\x07\x15\x10\x1a\x29\x11\x18\x28\x28\x24\x3d\x1b\
-\x03\x00\x00\xff\xff\x00\x54\x00\x00\x02\x04\x03\x82\x02\x26\x00\
-\x29\x00\x00\x00\x06\x03\x36\x00\x00\x00\x00\x00\x02\x00\x55\xff\
-\xf4\x01\xfe\x02\xba\x00\x13\x00\x17\x00\x4e\xba\x00\x0f\x00\x18\
-\x00\x19\x11\x12\x39\xb8\x00\x0f\x10\xb8\x00\x16\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x14\x2f\x1b\xb9\x00\x14\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\x1c\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x0e\x3e\
-\x59\xb9\x00\x0f\x00\x0b\xf4\x30\x31\x01\x11\x14\x0e\x02\x23\x22\
-\x26\x27\x37\x1e\x03\x33\x32\x36\x35\x11\x21\x33\x11\x23\x01\xfe\
-\x20\x39\x50\x30\x52\x6e\x10\x54\x04\x11\x1d\x2c\x21\x3e\x44\xfe\
-\xb0\x54\x54\x02\xba\xfe\x05\x2f\x4b\x34\x1d\x52\x4b\x15\x14\x25\
-\x1d\x12\x46\x4a\x01\xec\xfe\x68\x00\x00\x00\xff\xff\x00\x55\xff\
-\xf4\x02\x45\x03\xb5\x02\x26\x01\xa9\x00\x00\x00\x27\x03\x3c\xff\
-\x59\x00\x00\x00\x07\x03\x3c\x00\xa8\x00\x00\xff\xff\x00\x4a\xff\
-\xf4\x01\xe0\x03\xb5\x02\x26\x00\x2a\x00\x00\x00\x06\x03\x3c\x0d\
-\x00\x00\x00\xff\xff\x00\x4a\xff\xf4\x01\xe0\x03\xa7\x02\x26\x00\
-\x2a\x00\x00\x00\x06\x03\x3e\x0d\x00\x00\x00\xff\xff\x00\x55\xff\
-\x05\x02\x42\x02\xba\x02\x26\x00\x2b\x00\x00\x00\x07\x03\x27\x01\
-\x42\x00\x00\xff\xff\x00\x76\x00\x00\x02\x17\x03\xb5\x02\x26\x00\
-\x2c\x00\x00\x00\x07\x03\x3c\xff\x77\x00\x00\xff\xff\x00\x78\x00\
-\x00\x02\x17\x02\xe4\x02\x26\x00\x2c\x00\x00\x00\x06\x03\x13\x64\
-\x00\x00\x00\xff\xff\x00\x78\xff\x05\x02\x17\x02\xba\x02\x26\x00\
-\x2c\x00\x00\x00\x07\x03\x27\x01\x47\x00\x00\xff\xff\x00\x78\x00\
-\x00\x02\x17\x02\xba\x02\x26\x00\x2c\x00\x00\x00\x07\x03\x07\x00\
-\x87\xfe\xa7\x00\x01\x00\x28\x00\x00\x02\x17\x02\xba\x00\x0d\x00\
-\x91\xba\x00\x0c\x00\x0e\x00\x0f\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xba\x00\
-\x03\x00\x06\x00\x01\x11\x12\x39\xb8\x00\x03\x2f\xba\x00\x0a\x00\
-\x06\x00\x01\x11\x12\x39\xb8\x00\x0a\x2f\xba\x00\x02\x00\x03\x00\
-\x0a\x11\x12\x39\xb8\x00\x03\x10\xb9\x00\x04\x00\x08\xf4\xb8\x00\
-\x0a\x10\xb9\x00\x09\x00\x08\xf4\xba\x00\x05\x00\x04\x00\x09\x11\
-\x12\x39\xba\x00\x08\x00\x04\x00\x09\x11\x12\x39\xba\x00\x0b\x00\
-\x03\x00\x0a\x11\x12\x39\xb8\x00\x01\x10\xb9\x00\x0c\x00\x0b\xf4\
-\x30\x31\x29\x01\x11\x07\x35\x37\x11\x33\x11\x37\x15\x07\x15\x21\
-\x02\x17\xfe\x61\x50\x50\x54\xd3\xd3\x01\x4b\x01\x0f\x1a\x45\x1a\
-\x01\x66\xfe\xb2\x45\x45\x45\xde\x00\x00\x00\xff\xff\x00\x50\x00\
-\x00\x02\x08\x03\xb5\x02\x26\x00\x2e\x00\x00\x00\x06\x03\x3c\x00\
-\x00\x00\x00\xff\xff\x00\x50\x00\x00\x02\x08\x03\xaf\x02\x26\x00\
-\x2e\x00\x00\x00\x06\x03\x3f\x00\x00\x00\x00\xff\xff\x00\x50\xff\
-\x05\x02\x08\x02\xba\x02\x26\x00\x2e\x00\x00\x00\x07\x03\x27\x01\
-\x2c\x00\x00\xff\xff\x00\x50\x00\x00\x02\x08\x03\x82\x02\x26\x00\
-\x2e\x00\x00\x00\x06\x03\x36\x00\x00\x00\x00\x00\x01\x00\x50\xff\
-\x38\x02\x08\x02\xba\x00\x12\x00\x7c\xba\x00\x0f\x00\x13\x00\x14\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\
-\x01\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\
-\x00\x05\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\
-\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0f\x2f\
-\x1b\xb9\x00\x0f\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\
-\x2f\x1b\xb9\x00\x0b\x00\x10\x3e\x59\xb8\x00\x0f\x10\xb8\x00\x04\
-\xd0\xb8\x00\x0b\x10\xb9\x00\x0c\x00\x08\xf4\xb8\x00\x01\x10\xb8\
-\x00\x10\xd0\x30\x31\x33\x11\x33\x13\x33\x11\x33\x11\x14\x06\x2b\
-\x01\x35\x21\x35\x23\x03\x23\x11\x50\x77\xee\x07\x4c\x37\x3b\xf9\
-\x01\x1f\x2b\xee\x07\x02\xba\xfd\xb7\x02\x49\xfc\xf4\x34\x42\x44\
-\x84\x02\x4f\xfd\xb1\x00\x00\xff\xff\x00\x38\xff\xf4\x02\x20\x03\
-\xb5\x02\x26\x00\x2f\x00\x00\x00\x06\x03\x3c\x00\x00\x00\x00\xff\
-\xff\x00\x38\xff\xf4\x02\x20\x03\xaa\x02\x26\x00\x2f\x00\x00\x00\
-\x06\x03\x40\x00\x00\x00\x00\xff\xff\x00\x38\xff\xf4\x02\x20\x03\
-\xa7\x02\x26\x00\x2f\x00\x00\x00\x06\x03\x3e\x00\x00\x00\x00\xff\
-\xff\x00\x38\xff\xf4\x02\x20\x03\x7e\x02\x26\x00\x2f\x00\x00\x00\
-\x06\x03\x3a\x00\x00\x00\x00\xff\xff\x00\x38\xff\x54\x02\x20\x02\
-\xc6\x02\x26\x00\x2f\x00\x00\x00\x07\x03\x26\x01\x2c\x00\x00\xff\
-\xff\x00\x38\xff\xf4\x02\x20\x03\xb5\x02\x26\x00\x2f\x00\x00\x00\
-\x06\x03\x3d\x00\x00\x00\x00\xff\xff\x00\x38\xff\xf4\x02\x20\x03\
-\xa7\x02\x26\x00\x2f\x00\x00\x00\x07\x03\x44\x01\x2c\x00\x00\xff\
-\xff\x00\x38\xff\xf4\x02\x20\x03\xb4\x02\x26\x00\x2f\x00\x00\x00\
-\x06\x03\x3b\x00\x00\x00\x00\xff\xff\x00\x38\xff\xf4\x02\x20\x03\
-\x6b\x02\x26\x00\x2f\x00\x00\x00\x06\x03\x38\x00\x00\x00\x00\x00\
-\x03\x00\x2f\xff\xd4\x02\x29\x02\xe6\x00\x19\x00\x26\x00\x33\x00\
-\x9f\xba\x00\x00\x00\x34\x00\x35\x11\x12\x39\xb8\x00\x21\xd0\xb8\
-\x00\x00\x10\xb8\x00\x27\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0d\
-\x2f\x1b\xb9\x00\x0d\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x0d\x10\xb9\x00\
-\x21\x00\x0b\xf4\xba\x00\x02\x00\x00\x00\x21\x11\x12\x39\xba\x00\
-\x05\x00\x00\x00\x21\x11\x12\x39\xb8\x00\x00\x10\xb9\x00\x27\x00\
-\x0b\xf4\xba\x00\x0f\x00\x0d\x00\x27\x11\x12\x39\xba\x00\x12\x00\
-\x0d\x00\x27\x11\x12\x39\xba\x00\x1d\x00\x27\x00\x0d\x11\x12\x39\
-\xba\x00\x1e\x00\x21\x00\x00\x11\x12\x39\xba\x00\x30\x00\x21\x00\
-\x00\x11\x12\x39\xba\x00\x31\x00\x27\x00\x0d\x11\x12\x39\x30\x31\
-\x05\x22\x27\x07\x27\x37\x2e\x01\x35\x34\x3e\x02\x33\x32\x17\x37\
-\x17\x07\x1e\x01\x15\x14\x0e\x02\x03\x14\x16\x17\x13\x2e\x01\x23\
-\x22\x0e\x02\x15\x13\x32\x3e\x02\x3d\x01\x34\x26\x27\x03\x1e\x01\
-\x01\x2c\x5b\x37\x2f\x3c\x3c\x1a\x19\x1c\x3c\x5c\x40\x5a\x38\x2f\
-\x3c\x3c\x1a\x19\x1c\x3c\x5c\xdb\x06\x08\xf8\x13\x35\x23\x2a\x3a\
-\x26\x11\x9b\x2a\x3a\x26\x11\x06\x08\xf8\x13\x35\x0c\x30\x50\x24\
-\x66\x2e\x80\x51\x55\x87\x5c\x31\x30\x50\x24\x66\x2e\x80\x51\x56\
-\x86\x5c\x31\x01\x30\x22\x3b\x19\x01\xa1\x16\x18\x21\x3c\x56\x34\
-\xfe\xa7\x21\x3c\x55\x35\x72\x22\x3b\x19\xfe\x5f\x16\x18\x00\xff\
-\xff\x00\x2f\xff\xd4\x02\x29\x03\xb5\x02\x26\x01\xc1\x00\x00\x00\
-\x06\x03\x3c\x00\x00\x00\x00\xff\xff\x00\x38\xff\xf4\x02\x20\x03\
-\x82\x02\x26\x00\x2f\x00\x00\x00\x06\x03\x36\x00\x00\x00\x00\x00\
-\x02\x00\x38\xff\xf4\x02\x25\x03\x2a\x00\x1b\x00\x31\x00\x72\xba\
-\x00\x0c\x00\x32\x00\x33\x11\x12\x39\xb8\x00\x0c\x10\xb8\x00\x1c\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x16\x2f\x1b\xb9\x00\x16\x00\
-\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\xb9\x00\x18\
-\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\
-\x0c\x00\x0e\x3e\x59\xb8\x00\x16\x10\xb9\x00\x27\x00\x0b\xf4\xba\
-\x00\x04\x00\x27\x00\x16\x11\x12\x39\xb8\x00\x04\x2f\xb8\x00\x16\
-\x10\xb8\x00\x1a\xdc\xb8\x00\x0c\x10\xb9\x00\x1c\x00\x0b\xf4\x30\
-\x31\x01\x14\x06\x2b\x01\x1e\x01\x15\x14\x0e\x02\x23\x22\x2e\x02\
-\x35\x34\x3e\x02\x33\x32\x17\x33\x35\x33\x03\x32\x3e\x02\x3d\x01\
-\x34\x2e\x02\x23\x22\x0e\x02\x1d\x01\x14\x1e\x02\x02\x25\x19\x26\
-\x1c\x2e\x28\x1c\x3c\x5c\x40\x40\x5c\x3c\x1c\x1c\x3c\x5c\x40\x2c\
-\x24\x62\x47\xf9\x2a\x3a\x26\x11\x11\x26\x3a\x2a\x2a\x3a\x26\x11\
-\x11\x26\x3a\x02\xc6\x1a\x25\x2c\x95\x69\x56\x86\x5c\x31\x31\x5c\
-\x86\x56\x55\x87\x5c\x31\x0c\x70\xfd\x13\x21\x3c\x55\x35\x72\x34\
-\x56\x3c\x21\x21\x3c\x56\x34\x72\x35\x55\x3c\x21\x00\x00\x00\xff\
-\xff\x00\x38\xff\xf4\x02\x25\x03\xb5\x02\x26\x01\xc4\x00\x00\x00\
-\x06\x03\x3c\x00\x00\x00\x00\xff\xff\x00\x38\xff\x54\x02\x25\x03\
-\x2a\x02\x26\x01\xc4\x00\x00\x00\x07\x03\x26\x01\x2c\x00\x00\xff\
-\xff\x00\x38\xff\xf4\x02\x25\x03\xb5\x02\x26\x01\xc4\x00\x00\x00\
-\x06\x03\x3d\x00\x00\x00\x00\xff\xff\x00\x38\xff\xf4\x02\x25\x03\
-\xa7\x02\x26\x01\xc4\x00\x00\x00\x07\x03\x44\x01\x2c\x00\x00\xff\
-\xff\x00\x38\xff\xf4\x02\x25\x03\x7e\x02\x26\x01\xc4\x00\x00\x00\
-\x06\x03\x37\x00\x00\x00\x00\xff\xff\x00\x38\xff\xf4\x02\x30\x04\
-\x33\x02\x26\x00\x2f\x00\x00\x00\x07\x03\x4c\x01\x2c\x00\x00\xff\
-\xff\x00\x38\xff\x54\x02\x20\x03\xa7\x02\x26\x00\x2f\x00\x00\x00\
-\x26\x03\x3e\x00\x00\x00\x07\x03\x26\x01\x2c\x00\x00\x00\x00\xff\
-\xff\x00\x28\xff\xf4\x02\x20\x04\x33\x02\x26\x00\x2f\x00\x00\x00\
-\x07\x03\x4e\x01\x2c\x00\x00\xff\xff\x00\x38\xff\xf4\x02\x20\x04\
-\x28\x02\x26\x00\x2f\x00\x00\x00\x07\x03\x4f\x01\x2c\x00\x00\xff\
-\xff\x00\x38\xff\xf4\x02\x20\x04\x26\x02\x26\x00\x2f\x00\x00\x00\
-\x07\x03\x51\x01\x2c\x00\x00\x00\x02\x00\x25\x00\x00\x02\x30\x02\
-\xba\x00\x10\x00\x1a\x00\x67\xba\x00\x1a\x00\x1b\x00\x1c\x11\x12\
-\x39\xb8\x00\x1a\x10\xb8\x00\x00\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x06\x10\
-\xb9\x00\x13\x00\x0b\xf4\xb8\x00\x09\xd0\xba\x00\x0d\x00\x13\x00\
-\x00\x11\x12\x39\xb8\x00\x0d\x2f\xb9\x00\x0a\x00\x0b\xf4\xb8\x00\
-\x00\x10\xb9\x00\x1a\x00\x0b\xf4\xb8\x00\x0e\xd0\x30\x31\x21\x22\
-\x26\x35\x34\x36\x33\x21\x15\x23\x15\x33\x15\x23\x15\x33\x15\x27\
-\x11\x23\x22\x06\x1d\x01\x14\x16\x33\x01\x21\x80\x7c\x7c\x80\x01\
-\x0f\xa8\x9c\x9c\xa8\xf8\x13\x55\x56\x56\x55\xb0\xad\xad\xb0\x45\
-\xf1\x45\xfa\x45\x45\x02\x30\x76\x6c\x6c\x6c\x76\x00\x00\x00\xff\
-\xff\x00\x5a\x00\x00\x02\x25\x03\xb5\x02\x26\x00\x32\x00\x00\x00\
-\x06\x03\x3c\x08\x00\x00\x00\xff\xff\x00\x5a\x00\x00\x02\x25\x03\
-\xaf\x02\x26\x00\x32\x00\x00\x00\x06\x03\x3f\x08\x00\x00\x00\xff\
-\xff\x00\x5a\xff\x05\x02\x25\x02\xba\x02\x26\x00\x32\x00\x00\x00\
-\x07\x03\x27\x01\x34\x00\x00\xff\xff\x00\x2d\xff\xf4\x02\x1e\x03\
-\xb5\x02\x26\x00\x33\x00\x00\x00\x06\x03\x3c\xff\x00\x00\x00\xff\
-\xff\x00\x2d\xff\xf4\x02\x1e\x03\xaf\x02\x26\x00\x33\x00\x00\x00\
-\x06\x03\x3f\xff\x00\x00\x00\x00\x01\x00\x2d\xff\x31\x02\x1e\x02\
-\xc6\x00\x46\x00\x82\xba\x00\x16\x00\x47\x00\x48\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x25\x2f\x1b\xb9\x00\x25\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x0e\
-\x3e\x59\xb8\x00\x3f\xdc\x41\x07\x00\x0f\x00\x3f\x00\x1f\x00\x3f\
-\x00\x2f\x00\x3f\x00\x03\x5d\xb8\x00\x0d\xdc\xb8\x00\x07\xdc\xb9\
-\x00\x00\x00\x03\xf4\xb8\x00\x0f\x10\xb9\x00\x16\x00\x0b\xf4\xb8\
-\x00\x25\x10\xb9\x00\x2c\x00\x0b\xf4\xba\x00\x1d\x00\x2c\x00\x0f\
-\x11\x12\x39\xba\x00\x32\x00\x25\x00\x16\x11\x12\x39\xb8\x00\x0f\
-\x10\xb8\x00\x3b\xd0\x30\x31\x05\x22\x26\x27\x37\x1e\x01\x33\x32\
-\x36\x35\x34\x26\x2f\x01\x37\x2e\x01\x27\x37\x1e\x01\x33\x32\x36\
-\x35\x34\x26\x2f\x01\x2e\x03\x35\x34\x36\x33\x32\x16\x17\x07\x2e\
-\x01\x23\x22\x06\x15\x14\x16\x1f\x01\x1e\x03\x15\x14\x06\x0f\x01\
-\x17\x36\x33\x32\x16\x15\x14\x0e\x02\x01\x35\x29\x2f\x0b\x26\x09\
-\x1e\x16\x13\x19\x1a\x2a\x1c\x0d\x52\x6b\x24\x3d\x29\x5b\x3f\x4c\
-\x50\x3a\x48\x4e\x33\x45\x2a\x12\x7e\x6b\x54\x73\x23\x3b\x1d\x52\
-\x41\x47\x4c\x39\x4a\x4b\x33\x46\x2b\x12\x74\x6a\x0a\x03\x13\x14\
-\x1d\x27\x12\x1f\x28\xcf\x1b\x0e\x29\x0b\x11\x0f\x10\x0e\x15\x06\
-\x04\x42\x05\x42\x33\x32\x33\x32\x46\x3f\x33\x39\x0c\x0d\x09\x24\
-\x33\x3d\x21\x60\x62\x38\x33\x33\x26\x30\x3c\x3c\x2f\x3b\x0d\x0d\
-\x09\x24\x32\x3e\x22\x5d\x6c\x05\x32\x03\x06\x22\x20\x15\x20\x14\
-\x0a\x00\x00\xff\xff\x00\x2d\xff\xf4\x02\x1e\x03\xa7\x02\x26\x00\
-\x33\x00\x00\x00\x06\x03\x3e\xff\x00\x00\x00\xff\xff\x00\x2d\xff\
-\x05\x02\x1e\x02\xc6\x02\x26\x00\x33\x00\x00\x00\x07\x03\x27\x01\
-\x29\x00\x00\x00\x01\x00\x3f\xff\xf4\x02\x44\x02\xba\x00\x1e\x00\
-\x70\xba\x00\x19\x00\x1f\x00\x20\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x0e\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x1e\x2f\x1b\xb9\x00\x1e\x00\x0e\x3e\x59\xb8\
-\x00\x0a\x10\xb9\x00\x11\x00\x08\xf4\xba\x00\x1a\x00\x00\x00\x11\
-\x11\x12\x39\xb8\x00\x1a\x2f\xb8\x00\x04\xd0\xb8\x00\x1a\x10\xb9\
-\x00\x19\x00\x08\xf4\xb8\x00\x00\x10\xb9\x00\x1c\x00\x0b\xf4\x30\
-\x31\x13\x21\x15\x07\x15\x1e\x01\x15\x14\x06\x23\x22\x26\x27\x37\
-\x1e\x01\x33\x32\x36\x3d\x01\x34\x26\x2b\x01\x35\x37\x21\x11\x23\
-\x3f\x01\xd9\xa9\x64\x71\x71\x61\x39\x5c\x20\x3a\x17\x41\x26\x36\
-\x40\x40\x37\x5e\xad\xfe\xd0\x54\x02\xba\x52\xd3\x04\x02\x69\x63\
-\x62\x6d\x29\x2c\x31\x1f\x21\x40\x37\x24\x37\x40\x4d\xd8\xfd\x8f\
-\x00\x00\x00\x00\x01\x00\x19\x00\x00\x02\x3f\x02\xba\x00\x0f\x00\
-\x61\xba\x00\x02\x00\x10\x00\x11\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x0e\x3e\x59\xba\x00\
-\x03\x00\x09\x00\x02\x11\x12\x39\xb8\x00\x03\x10\xb8\x00\x00\xd0\
-\xb8\x00\x03\x10\xb9\x00\x06\x00\x08\xf4\xb8\x00\x09\x10\xb9\x00\
-\x08\x00\x0b\xf4\xb8\x00\x0c\xd0\xb8\x00\x06\x10\xb8\x00\x0d\xd0\
-\x30\x31\x01\x11\x23\x11\x23\x35\x33\x35\x23\x35\x21\x15\x23\x15\
-\x33\x15\x01\x56\x54\xad\xad\xe9\x02\x26\xe9\xad\x01\x50\xfe\xb0\
-\x01\x50\x40\xe1\x49\x49\xe1\x40\x00\x00\x00\xff\xff\x00\x19\x00\
-\x00\x02\x3f\x03\xaf\x02\x26\x00\x34\x00\x00\x00\x06\x03\x3f\x00\
-\x00\x00\x00\xff\xff\x00\x19\xff\x05\x02\x3f\x02\xba\x02\x26\x00\
-\x34\x00\x00\x00\x07\x03\x27\x01\x2c\x00\x00\xff\xff\x00\x19\xff\
-\x05\x02\x3f\x02\xba\x02\x26\x00\x34\x00\x00\x00\x07\x03\x27\x01\
-\x2c\x00\x00\x00\x02\x00\x5a\x00\x00\x02\x1f\x02\xba\x00\x0c\x00\
-\x16\x00\x63\xba\x00\x0a\x00\x17\x00\x18\x11\x12\x39\xb8\x00\x0a\
-\x10\xb8\x00\x0e\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\
-\xb9\x00\x01\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\
-\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xba\x00\x03\x00\x01\x00\x00\x11\
-\x12\x39\xb8\x00\x03\x2f\xba\x00\x0b\x00\x00\x00\x01\x11\x12\x39\
-\xb8\x00\x0b\x2f\xb9\x00\x0d\x00\x0b\xf4\xb8\x00\x03\x10\xb9\x00\
-\x16\x00\x0b\xf4\x30\x31\x33\x11\x33\x15\x33\x32\x16\x15\x14\x06\
-\x2b\x01\x15\x35\x33\x32\x36\x3d\x01\x34\x26\x2b\x01\x5a\x54\xaa\
-\x61\x66\x66\x61\xaa\xaa\x35\x3b\x3b\x35\xaa\x02\xba\x91\x6b\x5c\
-\x5c\x6b\x9b\xe4\x34\x30\x34\x30\x34\x00\x00\xff\xff\x00\x50\xff\
-\xf4\x02\x08\x03\xb5\x02\x26\x00\x35\x00\x00\x00\x06\x03\x3c\x00\
-\x00\x00\x00\xff\xff\x00\x50\xff\xf4\x02\x08\x03\xaa\x02\x26\x00\
-\x35\x00\x00\x00\x06\x03\x40\x00\x00\x00\x00\xff\xff\x00\x50\xff\
-\xf4\x02\x08\x03\xa7\x02\x26\x00\x35\x00\x00\x00\x06\x03\x3e\x00\
-\x00\x00\x00\xff\xff\x00\x50\xff\xf4\x02\x08\x03\x7e\x02\x26\x00\
-\x35\x00\x00\x00\x06\x03\x3a\x00\x00\x00\x00\xff\xff\x00\x50\xff\
-\x54\x02\x08\x02\xba\x02\x26\x00\x35\x00\x00\x00\x07\x03\x26\x01\
-\x2c\x00\x00\xff\xff\x00\x50\xff\xf4\x02\x08\x03\xb5\x02\x26\x00\
-\x35\x00\x00\x00\x06\x03\x3d\x00\x00\x00\x00\xff\xff\x00\x50\xff\
-\xf4\x02\x08\x03\xa7\x02\x26\x00\x35\x00\x00\x00\x07\x03\x44\x01\
-\x2c\x00\x00\xff\xff\x00\x50\xff\xf4\x02\x08\x03\xb4\x02\x26\x00\
-\x35\x00\x00\x00\x06\x03\x3b\x00\x00\x00\x00\xff\xff\x00\x50\xff\
-\xf4\x02\x08\x03\x6b\x02\x26\x00\x35\x00\x00\x00\x06\x03\x38\x00\
-\x00\x00\x00\x00\x01\x00\x50\xff\x31\x02\x08\x02\xba\x00\x31\x00\
-\x6f\xba\x00\x06\x00\x32\x00\x33\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x31\x2f\x1b\xb9\x00\x31\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x2b\x2f\x1b\xb9\x00\x2b\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x21\x2f\x1b\xb9\x00\x21\x00\x10\x3e\x59\
-\xb8\x00\x2b\x10\xb9\x00\x06\x00\x0b\xf4\xba\x00\x13\x00\x06\x00\
-\x2b\x11\x12\x39\xb8\x00\x21\x10\xb9\x00\x1b\x00\x03\xf4\x30\x31\
-\x13\x11\x14\x1e\x02\x33\x32\x3e\x02\x35\x11\x33\x11\x14\x0e\x02\
-\x07\x0e\x03\x15\x14\x16\x33\x32\x37\x17\x0e\x01\x23\x22\x26\x35\
-\x34\x36\x37\x27\x0e\x01\x23\x22\x2e\x02\x35\x11\xa4\x06\x1a\x37\
-\x31\x31\x37\x1a\x06\x54\x06\x16\x2b\x24\x11\x27\x22\x17\x19\x11\
-\x1f\x15\x28\x0a\x2d\x26\x2e\x3f\x3a\x39\x02\x0c\x18\x0e\x45\x55\
-\x2e\x0f\x02\xba\xfe\x5d\x33\x50\x39\x1e\x1e\x39\x50\x33\x01\xa3\
-\xfe\x71\x39\x58\x46\x39\x1b\x0c\x1b\x1d\x20\x10\x12\x11\x1a\x29\
-\x11\x18\x29\x26\x23\x38\x1a\x04\x03\x02\x28\x4e\x74\x4d\x01\x8f\
-\x00\x00\x00\xff\xff\x00\x50\xff\xf4\x02\x08\x03\xd0\x02\x26\x00\
-\x35\x00\x00\x00\x06\x03\x42\x00\x00\x00\x00\xff\xff\x00\x50\xff\
-\xf4\x02\x08\x03\x82\x02\x26\x00\x35\x00\x00\x00\x06\x03\x36\x00\
-\x00\x00\x00\x00\x01\x00\x50\xff\xf4\x02\x58\x03\x2a\x00\x20\x00\
-\x5c\xba\x00\x1a\x00\x21\x00\x22\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x20\x2f\x1b\xb9\x00\x20\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x1a\x2f\x1b\xb9\x00\x1a\x00\x0e\x3e\x59\xb9\
-\x00\x06\x00\x0b\xf4\xb8\x00\x0c\x10\xb8\x00\x0e\xdc\xba\x00\x14\
-\x00\x0c\x00\x1a\x11\x12\x39\xb8\x00\x14\x2f\x30\x31\x13\x11\x14\
-\x1e\x02\x33\x32\x3e\x02\x35\x11\x33\x35\x33\x15\x14\x06\x2b\x01\
-\x11\x14\x0e\x02\x23\x22\x2e\x02\x35\x11\xa4\x06\x1a\x37\x31\x31\
-\x37\x1a\x06\x5d\x47\x19\x26\x11\x0f\x2f\x57\x47\x47\x57\x2f\x0f\
-\x02\xba\xfe\x5d\x33\x50\x39\x1e\x1e\x39\x50\x33\x01\xa3\x70\x66\
-\x1a\x25\xfe\xa6\x4e\x74\x4e\x27\x27\x4e\x74\x4e\x01\x8f\x00\xff\
-\xff\x00\x50\xff\xf4\x02\x58\x03\xb5\x02\x26\x01\xea\x00\x00\x00\
-\x06\x03\x3c\x00\x00\x00\x00\xff\xff\x00\x50\xff\x54\x02\x58\x03\
-\x2a\x02\x26\x01\xea\x00\x00\x00\x07\x03\x26\x01\x2c\x00\x00\xff\
-\xff\x00\x50\xff\xf4\x02\x58\x03\xb5\x02\x26\x01\xea\x00\x00\x00\
-\x06\x03\x3d\x00\x00\x00\x00\xff\xff\x00\x50\xff\xf4\x02\x58\x03\
-\xa7\x02\x26\x01\xea\x00\x00\x00\x07\x03\x44\x01\x2c\x00\x00\xff\
-\xff\x00\x50\xff\xf4\x02\x58\x03\x7e\x02\x26\x01\xea\x00\x00\x00\
-\x06\x03\x37\x00\x00\x00\x00\xff\xff\x00\x23\x00\x00\x02\x35\x03\
-\xb5\x02\x26\x00\x37\x00\x00\x00\x06\x03\x3c\x00\x00\x00\x00\xff\
-\xff\x00\x23\x00\x00\x02\x35\x03\xa7\x02\x26\x00\x37\x00\x00\x00\
-\x06\x03\x3e\x00\x00\x00\x00\xff\xff\x00\x23\x00\x00\x02\x35\x03\
-\x7e\x02\x26\x00\x37\x00\x00\x00\x06\x03\x3a\x00\x00\x00\x00\xff\
-\xff\x00\x23\x00\x00\x02\x35\x03\xb5\x02\x26\x00\x37\x00\x00\x00\
-\x06\x03\x3d\x00\x00\x00\x00\xff\xff\x00\x11\x00\x00\x02\x47\x03\
-\xb5\x02\x26\x00\x39\x00\x00\x00\x06\x03\x3c\x00\x00\x00\x00\xff\
-\xff\x00\x11\x00\x00\x02\x47\x03\xa7\x02\x26\x00\x39\x00\x00\x00\
-\x06\x03\x3e\x00\x00\x00\x00\xff\xff\x00\x11\xff\x54\x02\x47\x02\
-\xba\x02\x26\x00\x39\x00\x00\x00\x07\x03\x26\x01\x2c\x00\x00\xff\
-\xff\x00\x11\x00\x00\x02\x47\x03\x7e\x02\x26\x00\x39\x00\x00\x00\
-\x06\x03\x3a\x00\x00\x00\x00\xff\xff\x00\x11\x00\x00\x02\x47\x03\
-\xb5\x02\x26\x00\x39\x00\x00\x00\x06\x03\x3d\x00\x00\x00\x00\xff\
-\xff\x00\x11\x00\x00\x02\x47\x03\xa7\x02\x26\x00\x39\x00\x00\x00\
-\x07\x03\x44\x01\x2c\x00\x00\xff\xff\x00\x11\x00\x00\x02\x47\x03\
-\x82\x02\x26\x00\x39\x00\x00\x00\x06\x03\x36\x00\x00\x00\x00\xff\
-\xff\x00\x30\x00\x00\x02\x28\x03\xb5\x02\x26\x00\x3a\x00\x00\x00\
-\x06\x03\x3c\x00\x00\x00\x00\xff\xff\x00\x30\x00\x00\x02\x28\x03\
-\xaf\x02\x26\x00\x3a\x00\x00\x00\x06\x03\x3f\x00\x00\x00\x00\xff\
-\xff\x00\x30\x00\x00\x02\x28\x03\x84\x02\x26\x00\x3a\x00\x00\x00\
-\x06\x03\x39\x00\x00\x00\x00\x00\x01\x00\x62\xff\x38\x01\xf6\x02\
-\x04\x00\x1a\x00\x82\xba\x00\x05\x00\x1b\x00\x1c\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\
-\x00\x10\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x15\x2f\x1b\xb9\x00\
-\x15\x00\x0e\x3e\x59\xb9\x00\x05\x00\x08\xf4\xba\x00\x0f\x00\x01\
-\x00\x05\x11\x12\x39\x7c\xb8\x00\x0f\x2f\x18\xba\x00\x17\x00\x05\
-\x00\x15\x11\x12\x39\x30\x31\x17\x11\x33\x11\x14\x33\x32\x3e\x02\
-\x35\x11\x33\x11\x23\x35\x23\x0e\x03\x23\x22\x27\x23\x17\x15\x62\
-\x50\x77\x18\x2d\x23\x15\x50\x50\x04\x09\x17\x21\x2d\x1e\x4b\x1c\
-\x04\x07\xc8\x02\xcc\xfe\xc3\x8c\x0c\x18\x25\x1a\x01\x66\xfd\xfc\
-\x54\x14\x23\x1a\x0f\x34\x54\x9c\x00\x00\x00\x00\x02\x00\x2e\x00\
-\x00\x02\x2a\x02\xba\x00\x05\x00\x09\x00\x49\xba\x00\x06\x00\x0a\
-\x00\x0b\x11\x12\x39\xb8\x00\x06\x10\xb8\x00\x01\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x0e\x3e\x59\
-\xb8\x00\x01\x10\xb8\x00\x07\xd0\xb8\x00\x05\x10\xb9\x00\x08\x00\
-\x0b\xf4\x30\x31\x37\x13\x33\x13\x15\x21\x01\x23\x03\x21\x2e\xc7\
-\x6f\xc6\xfe\x04\x01\x02\x09\xa4\x01\x50\x4b\x02\x6f\xfd\x91\x4b\
-\x02\x62\xfd\xe7\x00\x00\x00\x00\x01\x00\x4e\x00\x00\x02\x0a\x02\
-\xba\x00\x07\x00\x4a\xba\x00\x06\x00\x08\x00\x09\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x0e\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\
-\x0e\x3e\x59\xb8\x00\x00\x10\xb9\x00\x05\x00\x0b\xf4\x30\x31\x13\
-\x21\x11\x23\x11\x21\x11\x23\x4e\x01\xbc\x54\xfe\xec\x54\x02\xba\
-\xfd\x46\x02\x71\xfd\x8f\x00\x00\x01\x00\x3f\xff\x38\x02\x13\x02\
-\xba\x00\x0d\x00\x5b\xba\x00\x03\x00\x0e\x00\x0f\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x10\
-\x3e\x59\xba\x00\x0b\x00\x0a\x00\x03\x2b\xb8\x00\x0b\x10\xb8\x00\
-\x03\xd0\xb8\x00\x0a\x10\xb8\x00\x04\xd0\xb8\x00\x06\x10\xb9\x00\
-\x09\x00\x0b\xf4\xb8\x00\x01\x10\xb9\x00\x0c\x00\x0b\xf4\x30\x31\
-\x05\x21\x35\x01\x35\x01\x35\x21\x15\x21\x13\x15\x03\x21\x02\x13\
-\xfe\x2c\x01\x0b\xfe\xf5\x01\xd4\xfe\x86\xfb\xfb\x01\x7a\xc8\x4b\
-\x01\x74\x04\x01\x74\x4b\x49\xfe\xa3\x36\xfe\xa3\x00\x00\x00\x00\
-\x01\x00\x36\x00\x00\x02\x22\x02\xc6\x00\x2b\x00\x5e\xba\x00\x20\
-\x00\x2c\x00\x2d\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\
-\x2f\x1b\xb9\x00\x0a\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x2b\x2f\x1b\xb9\x00\x2b\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x16\x2f\x1b\xb9\x00\x16\x00\x0e\x3e\x59\xb8\x00\x2b\x10\xb9\
-\x00\x00\x00\x08\xf4\xb8\x00\x16\x10\xb9\x00\x13\x00\x08\xf4\xb8\
-\x00\x0a\x10\xb9\x00\x20\x00\x0b\xf4\x30\x31\x37\x33\x35\x2e\x01\
-\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x06\x07\x15\x33\x15\x23\
-\x35\x3e\x03\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x1e\x02\x17\
-\x15\x23\x36\x89\x41\x3e\x1b\x39\x5a\x3e\x3e\x5a\x39\x1b\x3e\x41\
-\x89\xd0\x18\x29\x1c\x10\x43\x50\x4f\x44\x10\x1c\x29\x18\xd0\x44\
-\x0a\x26\xa5\x70\x4a\x75\x52\x2c\x2c\x52\x75\x4a\x70\xa5\x26\x0a\
-\x44\x68\x09\x2c\x3e\x4a\x26\x6b\x5f\x69\x69\x5f\x6b\x26\x4a\x3e\
-\x2c\x09\x68\x00\x01\x00\x14\x00\x00\x02\x35\x02\x04\x00\x10\x00\
-\x5c\xba\x00\x0c\x00\x11\x00\x12\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x0e\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x10\x2f\x1b\xb9\x00\x10\x00\x0e\x3e\x59\xb8\
-\x00\x02\x10\xb9\x00\x01\x00\x08\xf4\xb8\x00\x0e\xd0\xb8\x00\x05\
-\xd0\xb8\x00\x09\x10\xb9\x00\x06\x00\x08\xf4\x30\x31\x13\x23\x35\
-\x21\x15\x23\x11\x33\x15\x23\x22\x26\x35\x11\x23\x11\x23\x70\x5c\
-\x02\x21\x5c\x5c\x3a\x3b\x37\xc9\x50\x01\xc0\x44\x44\xfe\x84\x44\
-\x42\x34\x01\x4a\xfe\x40\x00\xff\xff\x00\x42\xff\xf4\x02\x26\x02\
-\x10\x02\x06\x00\x04\x00\x00\xff\xff\x00\x3c\xff\xf4\x01\xf9\x02\
-\x10\x02\x06\x00\x05\x00\x00\x00\x02\x00\x45\xff\xf4\x02\x16\x02\
-\xec\x00\x1f\x00\x2d\x00\x65\xba\x00\x00\x00\x2e\x00\x2f\x11\x12\
-\x39\xb8\x00\x20\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\
-\xb9\x00\x0b\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\
-\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x0b\x10\xb9\x00\x0c\x00\
-\x08\xf4\xb8\x00\x00\x10\xb9\x00\x20\x00\x08\xf4\xba\x00\x16\x00\
-\x20\x00\x0b\x11\x12\x39\xb8\x00\x16\x2f\xb9\x00\x27\x00\x08\xf4\
-\xba\x00\x13\x00\x27\x00\x20\x11\x12\x39\x30\x31\x05\x22\x2e\x02\
-\x35\x34\x3e\x02\x3f\x01\x15\x07\x0e\x03\x07\x33\x3e\x01\x33\x32\
-\x1e\x02\x15\x14\x0e\x02\x27\x32\x36\x3d\x01\x34\x26\x23\x22\x06\
-\x1d\x01\x14\x16\x01\x2d\x34\x55\x3d\x22\x1f\x41\x65\x46\x9e\xa6\
-\x2b\x3d\x29\x18\x06\x05\x15\x4c\x39\x31\x52\x3a\x21\x22\x3e\x55\
-\x34\x41\x53\x51\x41\x4c\x49\x51\x0c\x26\x4e\x77\x52\x72\xa0\x68\
-\x32\x05\x0a\x4f\x0b\x03\x1a\x39\x5c\x45\x32\x37\x24\x43\x63\x3f\
-\x3b\x60\x46\x26\x45\x51\x4e\x3f\x54\x54\x49\x39\x65\x4e\x51\x00\
-\x03\x00\x6b\x00\x00\x02\x0b\x02\x04\x00\x10\x00\x1a\x00\x24\x00\
-\x6d\xba\x00\x1b\x00\x25\x00\x26\x11\x12\x39\xb8\x00\x1b\x10\xb8\
-\x00\x01\xd0\xb8\x00\x1b\x10\xb8\x00\x11\xd0\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x10\x2f\x1b\xb9\x00\x10\x00\x0e\x3e\x59\xb9\x00\
-\x1a\x00\x08\xf4\xba\x00\x24\x00\x1a\x00\x00\x11\x12\x39\xb8\x00\
-\x24\x2f\xb9\x00\x19\x00\x08\xf4\xba\x00\x06\x00\x24\x00\x19\x11\
-\x12\x39\xb8\x00\x00\x10\xb9\x00\x23\x00\x08\xf4\x30\x31\x13\x21\
-\x32\x16\x15\x14\x07\x15\x1e\x01\x15\x14\x0e\x02\x23\x21\x37\x32\
-\x36\x3d\x01\x34\x26\x2b\x01\x15\x37\x32\x36\x3d\x01\x34\x26\x2b\
-\x01\x15\x6b\x01\x07\x3f\x48\x65\x3c\x3b\x14\x26\x38\x24\xfe\xf6\
-\xf6\x29\x2c\x2b\x24\xac\xa2\x21\x26\x26\x21\xa2\x02\x04\x47\x3c\
-\x61\x0c\x04\x05\x41\x30\x1f\x38\x2a\x19\x40\x28\x23\x17\x23\x27\
-\xac\xeb\x22\x1f\x16\x1f\x23\x99\x00\x00\x00\x00\x01\x00\x87\x00\
-\x00\x01\xf9\x02\x04\x00\x05\x00\x39\xba\x00\x04\x00\x06\x00\x07\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\
-\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\
-\x00\x05\x00\x0e\x3e\x59\xb8\x00\x00\x10\xb9\x00\x03\x00\x08\xf4\
-\x30\x31\x13\x21\x15\x21\x11\x23\x87\x01\x72\xfe\xde\x50\x02\x04\
-\x44\xfe\x40\x00\x02\x00\x16\xff\x74\x02\x37\x02\x04\x00\x0e\x00\
-\x15\x00\x5f\xba\x00\x12\x00\x16\x00\x17\x11\x12\x39\xb8\x00\x12\
-\x10\xb8\x00\x04\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\
-\xb9\x00\x05\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\
-\x1b\xb9\x00\x0c\x00\x0e\x3e\x59\xb9\x00\x00\x00\x08\xf4\xb8\x00\
-\x07\xd0\xb8\x00\x0c\x10\xb8\x00\x0e\xdc\xb8\x00\x0a\xd0\xb8\x00\
-\x05\x10\xb9\x00\x11\x00\x08\xf4\xb8\x00\x00\x10\xb8\x00\x15\xd0\
-\x30\x31\x37\x33\x3e\x01\x3d\x01\x21\x11\x33\x15\x23\x35\x21\x15\
-\x23\x25\x11\x23\x15\x14\x06\x07\x16\x3a\x20\x25\x01\x4d\x55\x49\
-\xfe\x71\x49\x01\x7c\xaf\x1e\x1e\x44\x33\x8b\x5e\xa4\xfe\x40\xd0\
-\x8c\x8c\xd0\x01\x7c\x64\x5d\x85\x36\x00\x00\xff\xff\x00\x43\xff\
-\xf4\x02\x15\x02\x10\x02\x06\x00\x09\x00\x00\x00\x01\x00\x1e\x00\
-\x00\x02\x3a\x02\x04\x00\x20\x00\xb0\xba\x00\x20\x00\x21\x00\x22\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\
-\x0a\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\
-\x00\x0e\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x12\x2f\x1b\
-\xb9\x00\x12\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\x2f\
-\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x20\
-\x2f\x1b\xb9\x00\x20\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x1c\x2f\x1b\xb9\x00\x1c\x00\x0e\x3e\x59\xba\x00\x01\x00\x03\x00\
-\x0a\x11\x12\x39\xb8\x00\x01\x2f\x41\x03\x00\xb0\x00\x01\x00\x01\
-\x71\xb9\x00\x0c\x00\x08\xf4\xba\x00\x07\x00\x0c\x00\x01\x11\x12\
-\x39\xb8\x00\x10\xd0\xba\x00\x17\x00\x11\x00\x1d\x11\x12\x39\xb8\
-\x00\x01\x10\xb8\x00\x1e\xd0\x30\x31\x25\x23\x07\x23\x37\x36\x37\
-\x35\x26\x2f\x01\x33\x17\x33\x35\x33\x15\x33\x37\x33\x07\x0e\x01\
-\x07\x15\x16\x1f\x01\x23\x27\x23\x15\x23\x01\x07\x58\x41\x50\x39\
-\x10\x28\x26\x0e\x37\x4c\x3f\x58\x4a\x58\x40\x4b\x38\x08\x17\x14\
-\x2b\x0e\x38\x51\x40\x58\x4a\xe9\xe9\xcb\x37\x06\x04\x09\x32\xbd\
-\xd9\xd9\xd9\xd9\xbd\x1a\x1c\x05\x04\x06\x37\xcb\xe9\xe9\x00\x00\
-\x01\x00\x3d\xff\xf4\x01\xf4\x02\x10\x00\x2a\x00\x5d\xba\x00\x11\
-\x00\x2b\x00\x2c\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x1e\
-\x2f\x1b\xb9\x00\x1e\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\x07\x00\x08\xf4\
-\xba\x00\x10\x00\x07\x00\x1e\x11\x12\x39\xb8\x00\x10\x2f\xb9\x00\
-\x0f\x00\x08\xf4\xb8\x00\x1e\x10\xb9\x00\x17\x00\x08\xf4\xba\x00\
-\x24\x00\x10\x00\x0f\x11\x12\x39\x30\x31\x05\x22\x26\x27\x37\x1e\
-\x01\x33\x32\x36\x3d\x01\x34\x26\x2b\x01\x35\x33\x32\x3d\x01\x34\
-\x26\x23\x22\x06\x07\x27\x3e\x01\x33\x32\x16\x15\x14\x06\x07\x15\
-\x1e\x01\x15\x14\x06\x01\x17\x50\x69\x21\x3b\x18\x4e\x39\x48\x40\
-\x33\x30\x8b\x81\x62\x37\x44\x3c\x49\x17\x38\x23\x64\x51\x67\x65\
-\x32\x2d\x34\x36\x73\x0c\x34\x30\x30\x26\x29\x2e\x24\x0e\x27\x29\
-\x43\x49\x0c\x21\x29\x28\x24\x26\x33\x38\x4a\x41\x30\x38\x0b\x04\
-\x08\x3f\x31\x4b\x57\x00\x00\x00\x01\x00\x5f\x00\x00\x01\xf9\x02\
-\x04\x00\x0d\x00\x5d\xba\x00\x08\x00\x0e\x00\x0f\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\
-\x00\x0e\x3e\x59\xb8\x00\x03\xd0\xb8\x00\x05\x10\xb8\x00\x0b\xd0\
-\x30\x31\x13\x33\x11\x07\x33\x01\x33\x11\x23\x11\x37\x23\x01\x23\
-\x5f\x50\x08\x04\x01\x03\x4b\x50\x08\x04\xfe\xfd\x4b\x02\x04\xfe\
-\xf9\x84\x01\x8b\xfd\xfc\x01\x07\x84\xfe\x75\xff\xff\x00\x5f\x00\
-\x00\x01\xf9\x03\x00\x02\x26\x02\x0d\x00\x00\x00\x06\x03\x0f\xfd\
-\x00\x00\x00\x00\x01\x00\x6b\x00\x00\x02\x19\x02\x04\x00\x18\x00\
-\x82\xba\x00\x15\x00\x19\x00\x1a\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\xb9\x00\x18\x00\x0e\x3e\x59\
-\xba\x00\x16\x00\x18\x00\x00\x11\x12\x39\xb8\x00\x16\x2f\x41\x03\
-\x00\xb0\x00\x16\x00\x01\x71\xb9\x00\x02\x00\x08\xf4\xba\x00\x09\
-\x00\x02\x00\x16\x11\x12\x39\xb8\x00\x11\x10\xb9\x00\x0e\x00\x08\
-\xf4\x30\x31\x13\x33\x15\x33\x37\x33\x07\x0e\x01\x07\x15\x1e\x01\
-\x1f\x01\x33\x15\x23\x22\x26\x2f\x01\x23\x15\x23\x6b\x50\x6e\x8b\
-\x53\x7e\x11\x1a\x12\x14\x1c\x0f\x54\x3a\x3a\x1a\x26\x13\x63\x6e\
-\x50\x02\x04\xd8\xd8\xc4\x1a\x15\x05\x04\x03\x15\x1a\x92\x44\x1c\
-\x20\xac\xe8\x00\x01\x00\x1a\x00\x00\x01\xee\x02\x04\x00\x14\x00\
-\x54\xba\x00\x0d\x00\x15\x00\x16\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x14\x2f\x1b\xb9\x00\x14\x00\x0e\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x0e\x3e\x59\xb8\
-\x00\x14\x10\xb9\x00\x01\x00\x08\xf4\xb8\x00\x07\x10\xb9\x00\x0c\
-\x00\x08\xf4\x30\x31\x37\x33\x3e\x03\x3d\x01\x21\x11\x23\x11\x23\
-\x15\x14\x06\x07\x0e\x01\x2b\x01\x1a\x40\x0f\x17\x0f\x08\x01\x57\
-\x50\xb9\x29\x22\x13\x2e\x20\x1f\x44\x13\x34\x48\x5f\x3f\x93\xfd\
-\xfc\x01\xc0\x51\x8c\x9f\x22\x13\x0f\x00\x00\x00\x01\x00\x48\x00\
-\x00\x02\x10\x02\x04\x00\x10\x00\x6d\xba\x00\x0b\x00\x11\x00\x12\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\
-\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\
-\x00\x04\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x10\x2f\x1b\
-\xb9\x00\x10\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x07\x2f\
-\x1b\xb9\x00\x07\x00\x0e\x3e\x59\xb8\x00\x10\x10\xb8\x00\x0b\xdc\
-\xb8\x00\x02\xd0\xb8\x00\x04\x10\xb8\x00\x0a\xd0\xb8\x00\x00\x10\
-\xb8\x00\x0d\xd0\x30\x31\x13\x33\x13\x33\x13\x33\x11\x23\x11\x37\
-\x23\x0b\x01\x23\x17\x11\x23\x48\x6e\x77\x06\x77\x66\x4d\x03\x06\
-\x94\x94\x06\x03\x4d\x02\x04\xfe\xf9\x01\x07\xfd\xfc\x01\x43\x5c\
-\xfe\xb9\x01\x47\x5c\xfe\xbd\x00\x01\x00\x5f\x00\x00\x01\xf9\x02\
-\x04\x00\x0b\x00\x6e\xba\x00\x0a\x00\x0c\x00\x0d\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\
-\x00\x0e\x3e\x59\xba\x00\x09\x00\x0b\x00\x00\x11\x12\x39\xb8\x00\
-\x09\x2f\x41\x03\x00\xb0\x00\x09\x00\x01\x71\xb9\x00\x02\x00\x08\
-\xf4\x30\x31\x13\x33\x15\x33\x35\x33\x11\x23\x35\x23\x15\x23\x5f\
-\x50\xfa\x50\x50\xfa\x50\x02\x04\xd8\xd8\xfd\xfc\xe8\xe8\x00\xff\
-\xff\x00\x42\xff\xf4\x02\x16\x02\x10\x02\x06\x00\x15\x00\x00\x00\
-\x01\x00\x61\x00\x00\x01\xf7\x02\x04\x00\x07\x00\x4a\xba\x00\x06\
-\x00\x08\x00\x09\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\
-\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x07\x2f\x1b\xb9\x00\x07\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x03\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\x00\x00\x10\xb9\
-\x00\x05\x00\x08\xf4\x30\x31\x13\x21\x11\x23\x11\x23\x11\x23\x61\
-\x01\x96\x50\xf6\x50\x02\x04\xfd\xfc\x01\xc0\xfe\x40\x00\x00\xff\
-\xff\x00\x5f\xff\x38\x02\x1c\x02\x10\x02\x06\x00\x16\x00\x00\xff\
-\xff\x00\x54\xff\xf4\x02\x04\x02\x10\x02\x06\x00\x07\x00\x00\x00\
-\x01\x00\x46\x00\x00\x02\x12\x02\x04\x00\x07\x00\x3d\xba\x00\x07\
-\x00\x08\x00\x09\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x02\
-\x2f\x1b\xb9\x00\x02\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x07\x2f\x1b\xb9\x00\x07\x00\x0e\x3e\x59\xb8\x00\x02\x10\xb9\x00\
-\x01\x00\x08\xf4\xb8\x00\x05\xd0\x30\x31\x01\x23\x35\x21\x15\x23\
-\x11\x23\x01\x04\xbe\x01\xcc\xbe\x50\x01\xc0\x44\x44\xfe\x40\xff\
-\xff\x00\x35\xff\x38\x02\x23\x02\x04\x02\x06\x00\x1f\x00\x00\x00\
-\x03\x00\x2c\xff\x38\x02\x2c\x02\xc6\x00\x11\x00\x3b\x00\x4d\x00\
-\xd3\xba\x00\x12\x00\x4e\x00\x4f\x11\x12\x39\xb8\x00\x12\x10\xb8\
-\x00\x03\xd0\xb8\x00\x12\x10\xb8\x00\x4b\xd0\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x25\x2f\x1b\xb9\x00\x25\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x20\x2f\x1b\xb9\x00\x20\x00\x1a\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x2b\x2f\x1b\xb9\x00\x2b\x00\x1a\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x3b\x2f\x1b\xb9\x00\x3b\x00\x10\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x16\x2f\x1b\xb9\x00\x16\x00\x0e\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x35\x2f\x1b\xb9\x00\x35\x00\x0e\
-\x3e\x59\xb8\x00\x16\x10\xb9\x00\x00\x00\x08\xf4\xb8\x00\x20\x10\
-\xb9\x00\x07\x00\x08\xf4\xba\x00\x13\x00\x00\x00\x16\x11\x12\x39\
-\xba\x00\x23\x00\x20\x00\x07\x11\x12\x39\xb8\x00\x2b\x10\xb9\x00\
-\x47\x00\x08\xf4\xba\x00\x28\x00\x2b\x00\x47\x11\x12\x39\xb8\x00\
-\x35\x10\xb9\x00\x3c\x00\x08\xf4\xba\x00\x38\x00\x3c\x00\x35\x11\
-\x12\x39\x30\x31\x37\x32\x36\x3d\x01\x34\x26\x23\x22\x0e\x02\x1d\
-\x01\x14\x1e\x02\x17\x23\x0e\x01\x23\x22\x2e\x02\x35\x34\x3e\x02\
-\x33\x32\x16\x17\x33\x35\x33\x15\x33\x3e\x01\x33\x32\x1e\x02\x15\
-\x14\x0e\x02\x23\x22\x26\x27\x23\x15\x23\x37\x32\x3e\x02\x3d\x01\
-\x34\x2e\x02\x23\x22\x06\x1d\x01\x14\x16\xc2\x21\x24\x24\x21\x12\
-\x1c\x12\x0a\x0a\x12\x1c\x57\x03\x11\x2d\x1d\x1e\x2f\x20\x10\x10\
-\x20\x2f\x1e\x1d\x2d\x11\x03\x4a\x03\x11\x2d\x1d\x1e\x2f\x20\x10\
-\x10\x20\x2f\x1e\x1d\x2d\x11\x03\x4a\x8f\x12\x1c\x12\x0a\x0a\x12\
-\x1c\x12\x21\x24\x24\x37\x26\x26\xfe\x26\x26\x0e\x24\x3d\x2f\x5a\
-\x2f\x3d\x24\x0e\x02\x23\x1e\x19\x3e\x68\x4f\x4f\x68\x3e\x19\x1e\
-\x23\xf7\xf7\x23\x1e\x19\x3e\x68\x4f\x4f\x68\x3e\x19\x1e\x23\xfd\
-\xff\x0e\x24\x3d\x2f\x5a\x2f\x3d\x24\x0e\x26\x26\xfe\x26\x26\xff\
-\xff\x00\x3d\x00\x00\x02\x1c\x02\x04\x02\x06\x00\x1e\x00\x00\x00\
-\x01\x00\x54\xff\x74\x02\x3a\x02\x04\x00\x0b\x00\x52\xba\x00\x05\
-\x00\x0c\x00\x0d\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x02\
-\x2f\x1b\xb9\x00\x02\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x06\x2f\x1b\xb9\x00\x06\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xb9\x00\x04\x00\x08\
-\xf4\xb8\x00\x08\xd0\xb8\x00\x01\x10\xb8\x00\x0b\xdc\x30\x31\x29\
-\x01\x11\x33\x11\x33\x11\x33\x11\x33\x15\x23\x01\xf1\xfe\x63\x50\
-\xf1\x50\x55\x49\x02\x04\xfe\x40\x01\xc0\xfe\x40\xd0\x00\x00\x00\
-\x01\x00\x50\x00\x00\x01\xea\x02\x04\x00\x14\x00\x74\xba\x00\x0d\
-\x00\x15\x00\x16\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x08\
-\x2f\x1b\xb9\x00\x08\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x11\x2f\x1b\xb9\x00\x11\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x14\x2f\x1b\xb9\x00\x14\x00\x0e\x3e\x59\xba\x00\x0d\x00\x08\
-\x00\x14\x11\x12\x39\xb8\x00\x0d\x2f\x41\x03\x00\x4f\x00\x0d\x00\
-\x01\x5d\x41\x05\x00\x0f\x00\x0d\x00\x1f\x00\x0d\x00\x02\x5d\xb9\
-\x00\x04\x00\x08\xf4\xba\x00\x01\x00\x0d\x00\x04\x11\x12\x39\x30\
-\x31\x25\x23\x0e\x01\x23\x22\x26\x3d\x01\x33\x15\x14\x16\x33\x32\
-\x36\x3d\x01\x33\x11\x23\x01\x9a\x05\x1c\x47\x37\x54\x57\x50\x36\
-\x3d\x3c\x4b\x50\x50\xed\x1f\x1f\x4f\x50\xb6\xaf\x30\x2e\x1f\x20\
-\xce\xfd\xfc\x00\x01\x00\x36\x00\x00\x02\x22\x02\x04\x00\x0b\x00\
-\x5b\xba\x00\x03\x00\x0c\x00\x0d\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1a\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x0e\x3e\x59\
-\xb9\x00\x02\x00\x08\xf4\xb8\x00\x06\xd0\x30\x31\x13\x33\x11\x33\
-\x11\x33\x11\x33\x11\x33\x11\x21\x36\x4a\x87\x4a\x87\x4a\xfe\x14\
-\x02\x04\xfe\x3e\x01\xc2\xfe\x3e\x01\xc2\xfd\xfc\x00\x00\x00\x00\
-\x01\x00\x36\xff\x74\x02\x58\x02\x04\x00\x0f\x00\x6b\xba\x00\x05\
-\x00\x10\x00\x11\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x02\
-\x2f\x1b\xb9\x00\x02\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x06\x2f\x1b\xb9\x00\x06\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xb9\x00\x04\x00\
-\x08\xf4\xb8\x00\x08\xd0\xb8\x00\x04\x10\xb8\x00\x0c\xd0\xb8\x00\
-\x01\x10\xb8\x00\x0f\xdc\x30\x31\x29\x01\x11\x33\x11\x33\x11\x33\
-\x11\x33\x11\x33\x11\x33\x15\x23\x02\x12\xfe\x24\x4a\x87\x4a\x87\
-\x4a\x36\x46\x02\x04\xfe\x3e\x01\xc2\xfe\x3e\x01\xc2\xfe\x40\xd0\
-\x00\x00\x00\x00\x02\x00\x0b\x00\x00\x02\x2d\x02\x04\x00\x0c\x00\
-\x16\x00\x6c\xba\x00\x16\x00\x17\x00\x18\x11\x12\x39\xb8\x00\x16\
-\x10\xb8\x00\x04\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\
-\xb9\x00\x02\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\
-\x1b\xb9\x00\x0c\x00\x0e\x3e\x59\xb8\x00\x02\x10\xb9\x00\x01\x00\
-\x08\xf4\xba\x00\x15\x00\x0c\x00\x02\x11\x12\x39\xb8\x00\x15\x2f\
-\x41\x05\x00\x00\x00\x15\x00\x10\x00\x15\x00\x02\x5d\xb9\x00\x04\
-\x00\x08\xf4\xb8\x00\x0c\x10\xb9\x00\x16\x00\x08\xf4\x30\x31\x13\
-\x23\x35\x33\x15\x33\x32\x16\x15\x14\x06\x2b\x01\x37\x32\x36\x3d\
-\x01\x34\x26\x2b\x01\x15\xa1\x96\xe6\x92\x4e\x5c\x5a\x4f\xe3\xd7\
-\x2d\x33\x33\x2d\x87\x01\xc0\x44\xbb\x58\x4d\x4e\x56\x44\x24\x28\
-\x2a\x28\x23\xc1\x00\x00\x00\x00\x03\x00\x36\x00\x00\x02\x22\x02\
-\x04\x00\x0a\x00\x14\x00\x18\x00\x8c\xba\x00\x0e\x00\x19\x00\x1a\
-\x11\x12\x39\xb8\x00\x0e\x10\xb8\x00\x09\xd0\xb8\x00\x0e\x10\xb8\
-\x00\x18\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\
-\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x15\x2f\x1b\xb9\
-\x00\x15\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\
-\xb9\x00\x0a\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\
-\x1b\xb9\x00\x18\x00\x0e\x3e\x59\xba\x00\x13\x00\x0a\x00\x00\x11\
-\x12\x39\xb8\x00\x13\x2f\x41\x05\x00\x00\x00\x13\x00\x10\x00\x13\
-\x00\x02\x5d\xb9\x00\x02\x00\x08\xf4\xb8\x00\x0a\x10\xb9\x00\x14\
-\x00\x08\xf4\x30\x31\x13\x33\x15\x33\x32\x16\x15\x14\x06\x2b\x01\
-\x37\x32\x36\x3d\x01\x34\x26\x2b\x01\x15\x01\x33\x11\x23\x36\x50\
-\x57\x4e\x5c\x5a\x4f\xa8\x9c\x2d\x33\x33\x2d\x4c\x01\x4c\x50\x50\
-\x02\x04\xbb\x58\x4d\x4e\x56\x44\x24\x28\x2a\x28\x23\xc1\x01\xc0\
-\xfd\xfc\x00\x00\x02\x00\x6f\x00\x00\x02\x09\x02\x04\x00\x0a\x00\
-\x14\x00\x62\xba\x00\x0b\x00\x15\x00\x16\x11\x12\x39\xb8\x00\x0b\
-\x10\xb8\x00\x03\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\
-\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\
-\x1b\xb9\x00\x0a\x00\x0e\x3e\x59\xba\x00\x13\x00\x0a\x00\x00\x11\
-\x12\x39\xb8\x00\x13\x2f\x41\x05\x00\x00\x00\x13\x00\x10\x00\x13\
-\x00\x02\x5d\xb9\x00\x02\x00\x08\xf4\xb8\x00\x0a\x10\xb9\x00\x14\
-\x00\x08\xf4\x30\x31\x13\x33\x15\x33\x32\x16\x15\x14\x06\x2b\x01\
-\x37\x32\x36\x3d\x01\x34\x26\x2b\x01\x15\x6f\x50\xa0\x4e\x5c\x5a\
-\x4f\xf1\xe5\x2d\x33\x33\x2d\x95\x02\x04\xbb\x58\x4d\x4e\x56\x44\
-\x24\x28\x2a\x28\x23\xc1\x00\x00\x01\x00\x54\xff\xf4\x02\x04\x02\
-\x10\x00\x26\x00\x57\xba\x00\x18\x00\x27\x00\x28\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\xb9\x00\x18\x00\x0e\
-\x3e\x59\xb9\x00\x1f\x00\x08\xf4\xba\x00\x00\x00\x1f\x00\x0e\x11\
-\x12\x39\xb8\x00\x00\x2f\xb8\x00\x0e\x10\xb9\x00\x07\x00\x08\xf4\
-\xb8\x00\x00\x10\xb9\x00\x26\x00\x08\xf4\x30\x31\x13\x33\x35\x34\
-\x2e\x02\x23\x22\x06\x07\x27\x3e\x01\x33\x32\x1e\x02\x15\x14\x0e\
-\x02\x23\x22\x26\x27\x37\x1e\x01\x33\x32\x3e\x02\x3d\x01\x23\xce\
-\xe0\x13\x26\x38\x24\x35\x40\x12\x3e\x17\x5e\x51\x37\x57\x3c\x20\
-\x20\x3c\x56\x37\x4e\x62\x17\x3b\x14\x42\x36\x23\x37\x25\x14\xe0\
-\x01\x26\x08\x22\x3a\x2a\x17\x2b\x29\x21\x34\x44\x27\x46\x64\x3d\
-\x3e\x63\x47\x26\x44\x32\x29\x2a\x30\x17\x2a\x3a\x22\x0d\x00\x00\
-\x02\x00\x36\xff\xf4\x02\x2a\x02\x10\x00\x1a\x00\x30\x00\x8a\xba\
-\x00\x2c\x00\x31\x00\x32\x11\x12\x39\xb8\x00\x2c\x10\xb8\x00\x0c\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\
-\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\
-\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\
-\x00\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\
-\x00\x08\x00\x0e\x3e\x59\xba\x00\x06\x00\x08\x00\x09\x11\x12\x39\
-\xb8\x00\x06\x2f\x41\x03\x00\xb0\x00\x06\x00\x01\x71\xb9\x00\x0b\
-\x00\x08\xf4\xb8\x00\x00\x10\xb9\x00\x1b\x00\x08\xf4\xb8\x00\x11\
-\x10\xb9\x00\x26\x00\x08\xf4\x30\x31\x05\x22\x2e\x02\x27\x23\x15\
-\x23\x11\x33\x15\x33\x3e\x03\x33\x32\x1e\x02\x15\x14\x0e\x02\x27\
-\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\x0e\x02\x1d\x01\x14\x1e\
-\x02\x01\x85\x26\x3c\x2a\x17\x02\x60\x4a\x4a\x61\x03\x17\x2a\x3a\
-\x26\x28\x3d\x2a\x16\x16\x2a\x3d\x28\x16\x21\x16\x0b\x0b\x16\x21\
-\x16\x16\x21\x16\x0b\x0b\x16\x21\x0c\x15\x37\x60\x4a\xea\x02\x04\
-\xdb\x45\x5a\x34\x14\x17\x3c\x69\x52\x52\x69\x3c\x17\x42\x0e\x23\
-\x3d\x2f\x5e\x2f\x3d\x23\x0e\x0e\x23\x3d\x2f\x5e\x2f\x3d\x23\x0e\
-\x00\x00\x00\x00\x02\x00\x44\x00\x00\x01\xea\x02\x04\x00\x16\x00\
-\x20\x00\x7a\xba\x00\x11\x00\x21\x00\x22\x11\x12\x39\xb8\x00\x11\
-\x10\xb8\x00\x1f\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\
-\xb9\x00\x0c\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x16\x2f\
-\x1b\xb9\x00\x16\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0f\
-\x2f\x1b\xb9\x00\x0f\x00\x0e\x3e\x59\xb8\x00\x16\x10\xb9\x00\x01\
-\x00\x08\xf4\xba\x00\x1f\x00\x0c\x00\x16\x11\x12\x39\xb8\x00\x1f\
-\x2f\xb9\x00\x11\x00\x08\xf4\xba\x00\x06\x00\x1f\x00\x11\x11\x12\
-\x39\xb8\x00\x0c\x10\xb9\x00\x18\x00\x08\xf4\x30\x31\x37\x33\x37\
-\x3e\x01\x37\x35\x2e\x01\x35\x34\x36\x3b\x01\x11\x23\x35\x23\x07\
-\x0e\x01\x2b\x01\x01\x23\x22\x06\x1d\x01\x14\x16\x3b\x01\x44\x3a\
-\x2d\x0c\x1c\x14\x3f\x4f\x5a\x4f\xe8\x50\x7d\x47\x12\x29\x20\x37\
-\x01\x56\x8c\x2d\x33\x33\x2d\x8c\x44\x55\x17\x18\x03\x04\x03\x4b\
-\x48\x4a\x55\xfd\xfc\xc7\x85\x21\x21\x01\xc0\x24\x28\x1f\x28\x24\
-\x00\x00\x00\xff\xff\x00\x1f\x00\x00\x02\x3a\x02\xba\x02\x06\x00\
-\x21\x00\x00\x00\x02\x00\x55\x00\x00\x02\x18\x02\xba\x00\x0c\x00\
-\x16\x00\x5f\xba\x00\x0d\x00\x17\x00\x18\x11\x12\x39\xb8\x00\x0d\
-\x10\xb8\x00\x0b\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\
-\xb9\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\
-\x1b\xb9\x00\x0c\x00\x0e\x3e\x59\xb8\x00\x00\x10\xb9\x00\x03\x00\
-\x0b\xf4\xb8\x00\x0c\x10\xb9\x00\x16\x00\x0b\xf4\xba\x00\x04\x00\
-\x16\x00\x00\x11\x12\x39\xb8\x00\x04\x2f\xb9\x00\x15\x00\x0b\xf4\
-\x30\x31\x13\x21\x15\x21\x15\x33\x32\x16\x15\x14\x06\x23\x21\x37\
-\x32\x36\x3d\x01\x34\x26\x2b\x01\x11\x55\x01\x8a\xfe\xca\xac\x5e\
-\x65\x65\x5e\xff\x00\xfe\x32\x3a\x3a\x32\xaa\x02\xba\x49\xcf\x6c\
-\x65\x65\x6c\x49\x35\x39\x34\x39\x35\xfe\xf0\xff\xff\x00\x58\x00\
-\x00\x02\x1f\x02\xba\x02\x06\x00\x22\x00\x00\x00\x01\x00\x84\x00\
-\x00\x02\x0b\x02\xba\x00\x05\x00\x39\xba\x00\x04\x00\x06\x00\x07\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\
-\x00\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\
-\x00\x05\x00\x0e\x3e\x59\xb8\x00\x00\x10\xb9\x00\x03\x00\x0b\xf4\
-\x30\x31\x13\x21\x15\x21\x11\x23\x84\x01\x87\xfe\xcd\x54\x02\xba\
-\x49\xfd\x8f\x00\x02\x00\x0e\xff\x6a\x02\x40\x02\xba\x00\x0e\x00\
-\x15\x00\x87\xba\x00\x11\x00\x16\x00\x17\x11\x12\x39\xb8\x00\x11\
-\x10\xb8\x00\x04\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\
-\xb9\x00\x05\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\
-\x1b\xb9\x00\x0c\x00\x0e\x3e\x59\xb9\x00\x01\x00\x0b\xf4\xb8\x00\
-\x07\xd0\xb8\x00\x0c\x10\xb8\x00\x0e\xdc\x41\x03\x00\xff\x00\x0e\
-\x00\x01\x5d\x41\x05\x00\x5f\x00\x0e\x00\x6f\x00\x0e\x00\x02\x71\
-\x41\x03\x00\x8f\x00\x0e\x00\x01\x5d\x41\x03\x00\x1f\x00\x0e\x00\
-\x01\x5d\xb8\x00\x0a\xd0\xb8\x00\x05\x10\xb9\x00\x10\x00\x0b\xf4\
-\xb8\x00\x01\x10\xb8\x00\x14\xd0\x30\x31\x37\x33\x3e\x01\x3d\x01\
-\x21\x11\x33\x15\x23\x35\x21\x15\x23\x01\x23\x15\x14\x06\x07\x33\
-\x0e\x3c\x2d\x2e\x01\x46\x55\x4d\xfe\x68\x4d\x01\x89\xa0\x2b\x22\
-\xed\x49\x40\xc9\x9b\xcd\xfd\x8f\xdf\x96\x96\x03\x07\x8a\x9f\xc8\
-\x37\x00\x00\xff\xff\x00\x5a\x00\x00\x02\x08\x02\xba\x02\x06\x00\
-\x25\x00\x00\x00\x01\x00\x02\x00\x00\x02\x56\x02\xba\x00\x27\x00\
-\xb9\xba\x00\x27\x00\x28\x00\x29\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x12\x2f\x1b\xb9\x00\x12\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x16\x2f\x1b\xb9\x00\x16\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x27\x2f\x1b\xb9\x00\x27\x00\x0e\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x23\x2f\x1b\xb9\x00\x23\x00\x0e\
-\x3e\x59\xba\x00\x01\x00\x03\x00\x0e\x11\x12\x39\xb8\x00\x01\x2f\
-\x41\x03\x00\x8f\x00\x01\x00\x01\x5d\x41\x03\x00\xbf\x00\x01\x00\
-\x01\x5d\xb9\x00\x10\x00\x0b\xf4\xba\x00\x0a\x00\x10\x00\x01\x11\
-\x12\x39\xb8\x00\x14\xd0\xb8\x00\x01\x10\xb8\x00\x25\xd0\xba\x00\
-\x1b\x00\x14\x00\x25\x11\x12\x39\x30\x31\x01\x23\x03\x23\x13\x3e\
-\x03\x37\x35\x2e\x01\x27\x03\x33\x13\x33\x11\x33\x11\x33\x13\x33\
-\x03\x0e\x01\x07\x15\x1e\x03\x17\x13\x23\x03\x23\x11\x23\x01\x03\
-\x45\x66\x56\x54\x08\x10\x11\x13\x0b\x15\x20\x0c\x4a\x52\x5a\x45\
-\x52\x45\x5b\x51\x4b\x0d\x1e\x15\x0b\x14\x12\x0f\x08\x53\x57\x65\
-\x45\x52\x01\x3e\xfe\xc2\x01\x09\x18\x20\x13\x0a\x02\x05\x05\x22\
-\x2b\x01\x03\xfe\xcc\x01\x34\xfe\xcc\x01\x34\xfe\xfe\x2c\x22\x05\
-\x05\x02\x0a\x14\x1f\x18\xfe\xf7\x01\x3e\xfe\xc2\x00\x00\x00\x00\
-\x01\x00\x28\xff\xf4\x02\x09\x02\xc6\x00\x2d\x00\x5d\xba\x00\x0d\
-\x00\x2e\x00\x2f\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x1d\
-\x2f\x1b\xb9\x00\x1d\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\x06\x00\x0b\xf4\
-\xba\x00\x0f\x00\x06\x00\x1d\x11\x12\x39\xb8\x00\x0f\x2f\xb9\x00\
-\x0e\x00\x0b\xf4\xb8\x00\x1d\x10\xb9\x00\x16\x00\x0b\xf4\xba\x00\
-\x23\x00\x0f\x00\x0e\x11\x12\x39\x30\x31\x05\x22\x26\x27\x37\x16\
-\x33\x32\x36\x3d\x01\x34\x26\x2b\x01\x35\x33\x32\x3d\x01\x34\x26\
-\x23\x22\x06\x07\x27\x3e\x01\x33\x32\x16\x15\x14\x06\x07\x15\x1e\
-\x03\x15\x14\x0e\x02\x01\x19\x56\x75\x26\x3d\x4a\x6a\x45\x52\x46\
-\x4a\x62\x5c\x87\x43\x42\x3a\x4a\x18\x3f\x24\x69\x4e\x6e\x6f\x4c\
-\x39\x1f\x36\x28\x18\x21\x3e\x59\x0c\x46\x35\x32\x65\x42\x3d\x15\
-\x33\x41\x49\x72\x15\x30\x3a\x2a\x24\x29\x35\x38\x64\x54\x49\x4f\
-\x09\x05\x04\x16\x28\x3b\x27\x2e\x4d\x37\x1e\x00\x01\x00\x50\x00\
-\x00\x02\x08\x02\xba\x00\x0d\x00\x5d\xba\x00\x08\x00\x0e\x00\x0f\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\
-\x00\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\
-\x00\x05\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x07\x2f\x1b\
-\xb9\x00\x07\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\
-\x1b\xb9\x00\x0d\x00\x0e\x3e\x59\xb8\x00\x03\xd0\xb8\x00\x05\x10\
-\xb8\x00\x0b\xd0\x30\x31\x13\x33\x11\x07\x33\x01\x33\x11\x23\x11\
-\x37\x23\x01\x23\x50\x54\x0e\x05\x01\x1d\x50\x54\x0e\x05\xfe\xe3\
-\x50\x02\xba\xfe\xa0\xca\x02\x2a\xfd\x46\x01\x60\xca\xfd\xd6\xff\
-\xff\x00\x50\x00\x00\x02\x08\x03\xaa\x02\x26\x02\x2d\x00\x00\x00\
-\x06\x03\x41\x00\x00\x00\x00\x00\x01\x00\x50\x00\x00\x02\x27\x02\
-\xba\x00\x18\x00\x8b\xba\x00\x15\x00\x19\x00\x1a\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1c\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\xb9\x00\x18\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\
-\x00\x0e\x3e\x59\xba\x00\x16\x00\x18\x00\x00\x11\x12\x39\xb8\x00\
-\x16\x2f\x41\x03\x00\x8f\x00\x16\x00\x01\x5d\x41\x03\x00\xbf\x00\
-\x16\x00\x01\x5d\xb9\x00\x02\x00\x0b\xf4\xba\x00\x09\x00\x16\x00\
-\x02\x11\x12\x39\xb8\x00\x11\x10\xb9\x00\x0e\x00\x0b\xf4\x30\x31\
-\x13\x33\x11\x33\x13\x33\x03\x0e\x01\x07\x15\x1e\x01\x1f\x01\x33\
-\x15\x23\x22\x26\x2f\x01\x23\x11\x23\x50\x54\x7b\x94\x59\x85\x11\
-\x1e\x12\x16\x1e\x12\x5a\x41\x3f\x1e\x2e\x11\x6c\x7b\x54\x02\xba\
-\xfe\xcc\x01\x34\xfe\xec\x23\x1b\x03\x05\x05\x1f\x29\xca\x49\x23\
-\x27\xf4\xfe\xc2\x00\x00\x00\x00\x01\x00\x05\x00\x00\x02\x09\x02\
-\xba\x00\x16\x00\x54\xba\x00\x02\x00\x17\x00\x18\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x0e\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x16\x2f\x1b\xb9\x00\x16\x00\
-\x0e\x3e\x59\xb8\x00\x13\x10\xb9\x00\x01\x00\x0b\xf4\xb8\x00\x0b\
-\x10\xb9\x00\x0c\x00\x0b\xf4\x30\x31\x01\x23\x15\x14\x0e\x02\x07\
-\x0e\x01\x2b\x01\x35\x33\x3e\x03\x3d\x01\x21\x11\x23\x01\xb5\xc4\
-\x0d\x18\x24\x17\x15\x34\x24\x1f\x43\x17\x21\x15\x0a\x01\x6a\x54\
-\x02\x71\x7e\x6c\x9a\x6a\x44\x17\x15\x13\x49\x16\x3f\x63\x90\x68\
-\xc1\xfd\x46\xff\xff\x00\x44\x00\x00\x02\x14\x02\xba\x02\x06\x00\
-\x2d\x00\x00\xff\xff\x00\x50\x00\x00\x02\x08\x02\xba\x02\x06\x00\
-\x28\x00\x00\xff\xff\x00\x38\xff\xf4\x02\x20\x02\xc6\x02\x06\x00\
-\x2f\x00\x00\x00\x01\x00\x53\x00\x00\x02\x05\x02\xba\x00\x07\x00\
-\x4a\xba\x00\x06\x00\x08\x00\x09\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x0e\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\
-\x00\x00\x10\xb9\x00\x05\x00\x0b\xf4\x30\x31\x13\x21\x11\x23\x11\
-\x21\x11\x23\x53\x01\xb2\x54\xfe\xf6\x54\x02\xba\xfd\x46\x02\x71\
-\xfd\x8f\x00\xff\xff\x00\x5a\x00\x00\x02\x1f\x02\xba\x02\x06\x00\
-\x30\x00\x00\xff\xff\x00\x46\xff\xf4\x02\x1a\x02\xc6\x02\x06\x00\
-\x23\x00\x00\xff\xff\x00\x19\x00\x00\x02\x3f\x02\xba\x02\x06\x00\
-\x34\x00\x00\x00\x01\x00\x2c\x00\x00\x02\x32\x02\xba\x00\x11\x00\
-\x58\xba\x00\x06\x00\x12\x00\x13\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\x0e\x3e\x59\xb9\
-\x00\x00\x00\x0b\xf4\xba\x00\x02\x00\x03\x00\x11\x11\x12\x39\xb8\
-\x00\x02\x2f\xb8\x00\x06\xd0\x30\x31\x37\x33\x37\x03\x33\x13\x17\
-\x33\x37\x13\x33\x03\x0e\x03\x2b\x01\x8b\x68\x23\xea\x5a\x8b\x29\
-\x02\x26\x7a\x56\xe4\x0b\x18\x1f\x29\x1c\x3c\x49\x5a\x02\x17\xfe\
-\xb8\x70\x6f\x01\x49\xfd\xa6\x1e\x26\x15\x07\x00\x03\x00\x1a\xff\
-\xe3\x02\x3e\x02\xd5\x00\x19\x00\x21\x00\x29\x00\x89\xba\x00\x21\
-\x00\x2a\x00\x2b\x11\x12\x39\xb8\x00\x21\x10\xb8\x00\x19\xd0\xb8\
-\x00\x21\x10\xb8\x00\x22\xd0\x00\xb8\x00\x0a\x2f\xb8\x00\x00\x2f\
-\x41\x03\x00\x60\x00\x0a\x00\x01\x5d\x41\x03\x00\x9f\x00\x0a\x00\
-\x01\x5d\x41\x03\x00\x30\x00\x0a\x00\x01\x5d\x41\x03\x00\x00\x00\
-\x0a\x00\x01\x5d\xb8\x00\x0a\x10\xb8\x00\x0b\xdc\xb8\x00\x0a\x10\
-\xb8\x00\x0d\xd0\xb8\x00\x00\x10\xb8\x00\x17\xd0\xb8\x00\x00\x10\
-\xb8\x00\x19\xdc\xb8\x00\x0a\x10\xb9\x00\x1a\x00\x0b\xf4\xb8\x00\
-\x00\x10\xb9\x00\x21\x00\x0b\xf4\xb8\x00\x22\xd0\xb8\x00\x1a\x10\
-\xb8\x00\x29\xd0\x30\x31\x25\x2e\x03\x35\x34\x3e\x02\x37\x35\x33\
-\x15\x1e\x03\x15\x14\x0e\x02\x07\x15\x23\x13\x0e\x01\x1d\x01\x14\
-\x16\x17\x33\x3e\x01\x3d\x01\x34\x26\x27\x01\x02\x3e\x57\x39\x1a\
-\x1a\x39\x57\x3e\x54\x3d\x58\x39\x1a\x1a\x39\x58\x3d\x54\x02\x4f\
-\x44\x44\x4f\x50\x4f\x44\x44\x4f\x3d\x04\x2f\x4d\x65\x3a\x3a\x65\
-\x4d\x2f\x04\x5a\x5a\x04\x2f\x4d\x65\x3a\x3a\x65\x4d\x2f\x04\x5a\
-\x02\x51\x08\x5f\x48\x52\x48\x5f\x08\x08\x5f\x48\x52\x48\x5f\x08\
-\x00\x00\x00\xff\xff\x00\x1a\x00\x00\x02\x3f\x02\xba\x02\x06\x00\
-\x38\x00\x00\x00\x01\x00\x50\xff\x6a\x02\x3e\x02\xba\x00\x0b\x00\
-\x7a\xba\x00\x05\x00\x0c\x00\x0d\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xb9\
-\x00\x04\x00\x0b\xf4\xb8\x00\x08\xd0\xb8\x00\x01\x10\xb8\x00\x0b\
-\xdc\x41\x03\x00\x8f\x00\x0b\x00\x01\x5d\x41\x03\x00\xff\x00\x0b\
-\x00\x01\x5d\x41\x03\x00\x1f\x00\x0b\x00\x01\x5d\x41\x05\x00\x5f\
-\x00\x0b\x00\x6f\x00\x0b\x00\x02\x71\x30\x31\x29\x01\x11\x33\x11\
-\x33\x11\x33\x11\x33\x15\x23\x01\xf1\xfe\x5f\x54\xfb\x54\x4b\x4d\
-\x02\xba\xfd\x8f\x02\x71\xfd\x8f\xdf\x00\x00\x00\x01\x00\x3c\x00\
-\x00\x02\x00\x02\xba\x00\x18\x00\x5d\xba\x00\x11\x00\x19\x00\x1a\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\
-\x0a\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x15\x2f\x1b\xb9\
-\x00\x15\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\
-\xb9\x00\x18\x00\x0e\x3e\x59\xba\x00\x11\x00\x0a\x00\x18\x11\x12\
-\x39\xb8\x00\x11\x2f\x41\x03\x00\xb0\x00\x11\x00\x01\x5d\xb9\x00\
-\x04\x00\x0b\xf4\x30\x31\x01\x23\x0e\x01\x23\x22\x2e\x02\x3d\x01\
-\x33\x15\x14\x1e\x02\x33\x32\x36\x37\x11\x33\x11\x23\x01\xac\x05\
-\x1b\x47\x2a\x3e\x56\x34\x17\x54\x0e\x21\x37\x28\x2d\x41\x20\x54\
-\x54\x01\x13\x0b\x0c\x1e\x3e\x5d\x3f\xc6\xc6\x30\x43\x29\x13\x0c\
-\x0c\x01\x5d\xfd\x46\x00\x00\x00\x01\x00\x30\x00\x00\x02\x28\x02\
-\xba\x00\x0b\x00\x5b\xba\x00\x03\x00\x0c\x00\x0d\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1c\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\
-\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\
-\x00\x0e\x3e\x59\xb9\x00\x02\x00\x0b\xf4\xb8\x00\x06\xd0\x30\x31\
-\x13\x33\x11\x33\x11\x33\x11\x33\x11\x33\x11\x21\x30\x52\x81\x52\
-\x81\x52\xfe\x08\x02\xba\xfd\x8f\x02\x71\xfd\x8f\x02\x71\xfd\x46\
-\x00\x00\x00\x00\x01\x00\x30\xff\x6a\x02\x53\x02\xba\x00\x0f\x00\
-\x93\xba\x00\x08\x00\x10\x00\x11\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\
-\xb9\x00\x04\x00\x0b\xf4\xb8\x00\x08\xd0\xb8\x00\x04\x10\xb8\x00\
-\x0c\xd0\xb8\x00\x01\x10\xb8\x00\x0f\xdc\x41\x03\x00\x8f\x00\x0f\
-\x00\x01\x5d\x41\x03\x00\xff\x00\x0f\x00\x01\x5d\x41\x03\x00\x1f\
-\x00\x0f\x00\x01\x5d\x41\x05\x00\x5f\x00\x0f\x00\x6f\x00\x0f\x00\
-\x02\x71\x30\x31\x29\x01\x11\x33\x11\x33\x11\x33\x11\x33\x11\x33\
-\x11\x33\x15\x23\x02\x08\xfe\x28\x52\x71\x52\x71\x52\x4b\x4b\x02\
-\xba\xfd\x8f\x02\x71\xfd\x8f\x02\x71\xfd\x8f\xdf\x00\x00\x00\x00\
-\x02\x00\x0a\x00\x00\x02\x44\x02\xba\x00\x0c\x00\x16\x00\x5f\xba\
-\x00\x16\x00\x17\x00\x18\x11\x12\x39\xb8\x00\x16\x10\xb8\x00\x04\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\
-\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\
-\x00\x0e\x3e\x59\xb8\x00\x02\x10\xb9\x00\x01\x00\x0b\xf4\xb8\x00\
-\x0c\x10\xb9\x00\x16\x00\x0b\xf4\xba\x00\x04\x00\x16\x00\x02\x11\
-\x12\x39\xb8\x00\x04\x2f\xb9\x00\x15\x00\x0b\xf4\x30\x31\x13\x23\
-\x35\x33\x11\x33\x32\x16\x15\x14\x06\x2b\x01\x37\x32\x36\x3d\x01\
-\x34\x26\x2b\x01\x11\xaa\xa0\xf4\x83\x5e\x65\x65\x5e\xd7\xd5\x32\
-\x3a\x3a\x32\x81\x02\x71\x49\xfe\xe8\x6c\x65\x65\x6c\x49\x35\x39\
-\x34\x39\x35\xfe\xf0\x00\x00\x00\x03\x00\x30\x00\x00\x02\x28\x02\
-\xba\x00\x0a\x00\x14\x00\x18\x00\x7b\xba\x00\x0e\x00\x19\x00\x1a\
-\x11\x12\x39\xb8\x00\x0e\x10\xb8\x00\x06\xd0\xb8\x00\x0e\x10\xb8\
-\x00\x18\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\
-\x00\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x15\x2f\x1b\xb9\
-\x00\x15\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\
-\xb9\x00\x18\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\
-\x1b\xb9\x00\x0a\x00\x0e\x3e\x59\xb9\x00\x14\x00\x0b\xf4\xba\x00\
-\x02\x00\x14\x00\x00\x11\x12\x39\xb8\x00\x02\x2f\xb9\x00\x13\x00\
-\x0b\xf4\x30\x31\x13\x33\x11\x33\x32\x16\x15\x14\x06\x2b\x01\x37\
-\x32\x36\x3d\x01\x34\x26\x2b\x01\x11\x01\x33\x11\x23\x30\x52\x46\
-\x5e\x65\x65\x5e\x98\x98\x32\x3a\x3a\x32\x46\x01\x54\x52\x52\x02\
-\xba\xfe\xe8\x6c\x65\x65\x6c\x49\x35\x39\x34\x39\x35\xfe\xf0\x02\
-\x71\xfd\x46\x00\x02\x00\x5c\x00\x00\x02\x1e\x02\xba\x00\x0a\x00\
-\x14\x00\x51\xba\x00\x0b\x00\x15\x00\x16\x11\x12\x39\xb8\x00\x0b\
-\x10\xb8\x00\x09\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\
-\xb9\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\
-\x1b\xb9\x00\x0a\x00\x0e\x3e\x59\xb9\x00\x14\x00\x0b\xf4\xba\x00\
-\x02\x00\x14\x00\x00\x11\x12\x39\xb8\x00\x02\x2f\xb9\x00\x13\x00\
-\x0b\xf4\x30\x31\x13\x33\x11\x33\x32\x16\x15\x14\x06\x2b\x01\x37\
-\x32\x36\x3d\x01\x34\x26\x2b\x01\x11\x5c\x54\xab\x5e\x65\x65\x5e\
-\xff\xfd\x32\x3a\x3a\x32\xa9\x02\xba\xfe\xe8\x6c\x65\x65\x6c\x49\
-\x35\x39\x34\x39\x35\xfe\xf0\x00\x01\x00\x3b\xff\xf4\x02\x15\x02\
-\xc6\x00\x26\x00\x53\xba\x00\x00\x00\x27\x00\x28\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x21\x2f\x1b\xb9\x00\x21\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb9\x00\x0b\x00\x0b\xf4\xba\x00\x11\x00\x0b\x00\x21\x11\
-\x12\x39\xb8\x00\x11\x2f\xb9\x00\x10\x00\x0b\xf4\xb8\x00\x21\x10\
-\xb9\x00\x16\x00\x0b\xf4\x30\x31\x05\x22\x2e\x02\x27\x37\x1e\x03\
-\x33\x32\x36\x3d\x01\x23\x35\x33\x35\x34\x26\x23\x22\x0e\x02\x07\
-\x27\x3e\x03\x33\x32\x16\x15\x14\x06\x01\x15\x31\x47\x33\x22\x0d\
-\x48\x09\x18\x22\x2e\x21\x55\x52\xe7\xe7\x52\x55\x21\x2e\x22\x18\
-\x09\x48\x0d\x22\x33\x47\x31\x82\x7e\x7e\x0c\x1a\x2c\x36\x1d\x21\
-\x17\x29\x1f\x12\x7e\x69\x19\x49\x10\x69\x7e\x12\x1f\x29\x17\x21\
-\x1c\x37\x2c\x1a\xba\xaf\xaf\xba\x00\x00\x00\x00\x02\x00\x30\xff\
-\xf4\x02\x2c\x02\xc6\x00\x1a\x00\x30\x00\x81\xba\x00\x2c\x00\x31\
-\x00\x32\x11\x12\x39\xb8\x00\x2c\x10\xb8\x00\x00\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\x1c\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x0e\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xba\x00\x06\x00\x09\x00\x08\x11\x12\x39\xb8\x00\x06\x2f\
-\xb9\x00\x0b\x00\x0b\xf4\xb8\x00\x00\x10\xb9\x00\x1b\x00\x0b\xf4\
-\xb8\x00\x11\x10\xb9\x00\x26\x00\x0b\xf4\x30\x31\x05\x22\x2e\x02\
-\x27\x23\x11\x23\x11\x33\x11\x33\x3e\x03\x33\x32\x1e\x02\x15\x14\
-\x0e\x02\x27\x32\x3e\x02\x3d\x01\x34\x2e\x02\x23\x22\x0e\x02\x1d\
-\x01\x14\x1e\x02\x01\x7e\x2f\x40\x29\x14\x02\x4e\x52\x52\x4e\x02\
-\x14\x29\x41\x2e\x2e\x42\x2a\x14\x14\x2a\x42\x2e\x16\x21\x15\x0b\
-\x0b\x15\x21\x16\x16\x21\x15\x0b\x0b\x15\x21\x0c\x1c\x49\x80\x64\
-\xfe\xc3\x02\xba\xfe\xcc\x60\x7c\x48\x1c\x1c\x50\x8d\x70\x71\x8c\
-\x50\x1c\x49\x0e\x2b\x4f\x41\xae\x41\x4f\x2b\x0e\x0e\x2b\x4f\x41\
-\xae\x41\x4f\x2b\x0e\x00\x00\x00\x02\x00\x27\x00\x00\x02\x02\x02\
-\xba\x00\x16\x00\x20\x00\x7a\xba\x00\x11\x00\x21\x00\x22\x11\x12\
-\x39\xb8\x00\x11\x10\xb8\x00\x1f\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x16\x2f\x1b\xb9\x00\x16\x00\x0e\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x0e\x3e\x59\xb8\x00\x16\
-\x10\xb9\x00\x00\x00\x0b\xf4\xba\x00\x1f\x00\x0c\x00\x16\x11\x12\
-\x39\xb8\x00\x1f\x2f\xb9\x00\x11\x00\x0b\xf4\xba\x00\x06\x00\x11\
-\x00\x1f\x11\x12\x39\xb8\x00\x0c\x10\xb9\x00\x18\x00\x0b\xf4\x30\
-\x31\x37\x33\x37\x3e\x01\x37\x35\x2e\x01\x35\x34\x36\x3b\x01\x11\
-\x23\x11\x23\x07\x0e\x01\x2b\x01\x01\x23\x22\x06\x1d\x01\x14\x16\
-\x3b\x01\x27\x40\x52\x0f\x20\x18\x5c\x5a\x65\x5e\xf5\x54\x7e\x6e\
-\x14\x2b\x1d\x3f\x01\x87\x9f\x32\x3a\x3a\x32\x9f\x49\xab\x20\x1b\
-\x05\x05\x05\x63\x53\x5b\x6b\xfd\x46\x01\x2c\xe5\x29\x1e\x02\x71\
-\x35\x39\x21\x39\x35\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x26\x02\
-\xd4\x02\x26\x00\x04\x00\x00\x00\x06\x03\x08\xf0\x00\x00\x00\xff\
-\xff\x00\x42\xff\xf4\x02\x26\x03\x00\x02\x26\x00\x04\x00\x00\x00\
-\x06\x03\x0f\xf0\x00\x00\x00\xff\xff\x00\x3c\xff\xf4\x01\xf9\x02\
-\xd4\x02\x26\x00\x05\x00\x00\x00\x06\x03\x08\xf4\x00\x00\x00\xff\
-\xff\x00\x3c\xff\xf4\x01\xf9\x03\x00\x02\x26\x00\x05\x00\x00\x00\
-\x06\x03\x0f\xf4\x00\x00\x00\xff\xff\x00\x0a\xff\xf4\x02\x46\x02\
-\x10\x02\x06\x00\xdc\x00\x00\xff\xff\x00\x87\x00\x00\x01\xf9\x03\
-\x0b\x02\x26\x02\x08\x00\x00\x00\x06\x03\x0a\x14\x00\x00\x00\x00\
-\x01\x00\x87\x00\x00\x01\xf9\x02\x90\x00\x07\x00\x41\xba\x00\x06\
-\x00\x08\x00\x09\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\
-\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x07\x2f\x1b\xb9\x00\x07\x00\x0e\x3e\x59\xb8\x00\x00\x10\xb8\x00\
-\x02\xdc\xb8\x00\x00\x10\xb9\x00\x05\x00\x08\xf4\x30\x31\x13\x21\
-\x35\x33\x15\x21\x11\x23\x87\x01\x29\x49\xfe\xde\x50\x02\x04\x8c\
-\xd0\xfe\x40\x00\x01\x00\x2c\x00\x00\x02\x0b\x02\x04\x00\x0d\x00\
-\x84\xba\x00\x0c\x00\x0e\x00\x0f\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x0e\x3e\x59\xb8\x00\
-\x04\x10\xb9\x00\x07\x00\x08\xf4\xba\x00\x02\x00\x0d\x00\x07\x11\
-\x12\x39\xb8\x00\x02\x2f\x41\x05\x00\xef\x00\x02\x00\xff\x00\x02\
-\x00\x02\x5d\x41\x05\x00\x6f\x00\x02\x00\x7f\x00\x02\x00\x02\x5d\
-\x41\x05\x00\x2f\x00\x02\x00\x3f\x00\x02\x00\x02\x5d\xb9\x00\x01\
-\x00\x08\xf4\xb8\x00\x02\x10\xb8\x00\x08\xd0\xb8\x00\x01\x10\xb8\
-\x00\x0b\xd0\x30\x31\x37\x23\x35\x33\x35\x21\x15\x21\x15\x33\x15\
-\x23\x15\x23\x99\x6d\x6d\x01\x72\xfe\xde\xc1\xc1\x50\xdf\x3e\xe7\
-\x44\xa3\x3e\xdf\x00\x00\x00\x00\x01\x00\x6e\xff\x38\x02\x08\x02\
-\x04\x00\x20\x00\x88\xba\x00\x00\x00\x21\x00\x22\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x0e\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x20\x2f\x1b\xb9\x00\x20\x00\
-\x10\x3e\x59\xb9\x00\x00\x00\x08\xf4\xb8\x00\x0e\x10\xb9\x00\x11\
-\x00\x08\xf4\xba\x00\x16\x00\x11\x00\x0d\x11\x12\x39\xb8\x00\x16\
-\x2f\x41\x05\x00\x6f\x00\x16\x00\x7f\x00\x16\x00\x02\x5d\x41\x05\
-\x00\x2f\x00\x16\x00\x3f\x00\x16\x00\x02\x5d\xb9\x00\x08\x00\x08\
-\xf4\xba\x00\x13\x00\x16\x00\x08\x11\x12\x39\x30\x31\x05\x33\x3e\
-\x01\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x23\x11\x21\x15\x23\x15\
-\x33\x3e\x01\x33\x32\x16\x1d\x01\x14\x0e\x02\x2b\x01\x01\x43\x54\
-\x0f\x12\x36\x3d\x3c\x4b\x50\x01\x46\xf6\x05\x1c\x47\x37\x54\x57\
-\x16\x28\x37\x22\x2e\x84\x12\x40\x2d\x61\x44\x35\x1f\x20\x96\x02\
-\x04\x44\xe1\x1f\x1f\x55\x62\x77\x31\x45\x2c\x15\x00\x00\x00\xff\
-\xff\x00\x43\xff\xf4\x02\x15\x03\x0b\x02\x26\x00\x09\x00\x00\x00\
-\x06\x03\x0b\x02\x00\x00\x00\xff\xff\x00\x43\xff\xf4\x02\x15\x02\
-\xd4\x02\x26\x00\x09\x00\x00\x00\x06\x03\x08\x02\x00\x00\x00\xff\
-\xff\x00\x43\xff\xf4\x02\x15\x03\x00\x02\x26\x00\x09\x00\x00\x00\
-\x06\x03\x0f\x02\x00\x00\x00\x00\x01\x00\x54\xff\xf4\x02\x04\x02\
-\x10\x00\x26\x00\x57\xba\x00\x11\x00\x27\x00\x28\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb8\x00\x0a\x10\xb9\x00\x11\x00\x08\xf4\xb8\x00\x00\x10\
-\xb9\x00\x20\x00\x08\xf4\xba\x00\x17\x00\x20\x00\x0a\x11\x12\x39\
-\xb8\x00\x17\x2f\xb9\x00\x1a\x00\x08\xf4\x30\x31\x05\x22\x2e\x02\
-\x35\x34\x3e\x02\x33\x32\x16\x17\x07\x2e\x01\x23\x22\x0e\x02\x1d\
-\x01\x33\x15\x23\x15\x14\x1e\x02\x33\x32\x36\x37\x17\x0e\x01\x01\
-\x3e\x38\x57\x3c\x1f\x20\x3c\x56\x37\x4b\x5e\x16\x40\x0e\x41\x30\
-\x23\x37\x26\x13\xe0\xe0\x13\x26\x38\x24\x34\x44\x14\x39\x17\x61\
-\x0c\x27\x46\x64\x3d\x3d\x64\x47\x26\x42\x35\x22\x28\x2c\x17\x2a\
-\x3a\x22\x08\x43\x0d\x22\x3a\x2a\x17\x30\x2a\x27\x34\x44\x00\xff\
-\xff\x00\x1e\x00\x00\x02\x3a\x02\xd4\x02\x26\x02\x0b\x00\x00\x00\
-\x06\x03\x08\x00\x00\x00\x00\xff\xff\x00\x1e\x00\x00\x02\x3a\x03\
-\x00\x02\x26\x02\x0b\x00\x00\x00\x06\x03\x0f\x00\x00\x00\x00\x00\
-\x01\x00\x16\xff\x74\x02\x55\x02\x04\x00\x24\x00\xc2\xba\x00\x04\
-\x00\x25\x00\x26\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x10\
-\x2f\x1b\xb9\x00\x10\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x14\x2f\x1b\xb9\x00\x14\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x18\x2f\x1b\xb9\x00\x18\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x0e\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x0e\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xba\x00\
-\x07\x00\x09\x00\x10\x11\x12\x39\xb8\x00\x07\x2f\x41\x03\x00\xb0\
-\x00\x07\x00\x01\x71\xb8\x00\x03\xd0\xb8\x00\x07\x10\xb9\x00\x12\
-\x00\x08\xf4\xba\x00\x0d\x00\x07\x00\x12\x11\x12\x39\xb8\x00\x16\
-\xd0\xba\x00\x1d\x00\x03\x00\x16\x11\x12\x39\xb8\x00\x01\x10\xb9\
-\x00\x21\x00\x08\xf4\xb8\x00\x09\x10\xb8\x00\x24\xdc\x30\x31\x21\
-\x23\x27\x23\x15\x23\x35\x23\x07\x23\x37\x36\x37\x35\x26\x2f\x01\
-\x33\x17\x33\x35\x33\x15\x33\x37\x33\x07\x0e\x01\x07\x15\x16\x1f\
-\x01\x33\x15\x23\x02\x0f\x2e\x40\x58\x4a\x58\x41\x50\x39\x10\x28\
-\x26\x0e\x37\x4c\x3f\x58\x4a\x58\x40\x4b\x38\x08\x17\x14\x2b\x0e\
-\x25\x36\x46\xe9\xe9\xe9\xe9\xcb\x37\x06\x04\x09\x32\xbd\xd9\xd9\
-\xd9\xd9\xbd\x1a\x1c\x05\x04\x06\x37\x87\xd0\xff\xff\x00\x3d\xff\
-\xf4\x01\xf4\x02\xd4\x02\x26\x02\x0c\x00\x00\x00\x06\x03\x08\xf2\
-\x00\x00\x00\x00\x01\x00\x3d\xff\x74\x01\xf4\x02\x10\x00\x2d\x00\
-\x6d\xba\x00\x11\x00\x2e\x00\x2f\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x1e\x2f\x1b\xb9\x00\x1e\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\
-\x07\x00\x08\xf4\xba\x00\x11\x00\x07\x00\x1e\x11\x12\x39\xb8\x00\
-\x11\x2f\xb9\x00\x0e\x00\x08\xf4\xb8\x00\x1e\x10\xb9\x00\x17\x00\
-\x08\xf4\xba\x00\x24\x00\x11\x00\x0e\x11\x12\x39\xb8\x00\x00\x10\
-\xb8\x00\x2b\xd0\xb8\x00\x00\x10\xb8\x00\x2c\xdc\x30\x31\x17\x2e\
-\x01\x27\x37\x1e\x01\x33\x32\x36\x3d\x01\x34\x26\x2b\x01\x35\x33\
-\x32\x3d\x01\x34\x26\x23\x22\x06\x07\x27\x3e\x01\x33\x32\x16\x15\
-\x14\x06\x07\x15\x1e\x01\x15\x14\x06\x07\x15\x23\xf3\x41\x58\x1d\
-\x3b\x18\x4e\x39\x48\x40\x33\x30\x8b\x81\x62\x37\x44\x3c\x49\x17\
-\x38\x23\x64\x51\x67\x65\x32\x2d\x34\x36\x60\x58\x49\x0a\x05\x32\
-\x2b\x30\x26\x29\x2e\x24\x0e\x27\x29\x43\x49\x0c\x21\x29\x28\x24\
-\x26\x33\x38\x4a\x41\x30\x38\x0b\x04\x08\x3f\x31\x44\x54\x08\x82\
-\x00\x00\x00\x00\x01\x00\x50\x00\x00\x02\x08\x02\xe4\x00\x0b\x00\
-\x4b\xba\x00\x01\x00\x0c\x00\x0d\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1e\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x0e\x3e\x59\xb9\x00\
-\x00\x00\x08\xf4\xb8\x00\x04\x10\xb9\x00\x03\x00\x08\xf4\xb8\x00\
-\x07\xd0\xb8\x00\x00\x10\xb8\x00\x08\xd0\x30\x31\x37\x33\x11\x23\
-\x35\x21\x15\x23\x11\x33\x15\x21\x50\xb4\xb4\x01\xb8\xb4\xb4\xfe\
-\x48\x44\x02\x5c\x44\x44\xfd\xa4\x44\x00\x00\xff\xff\x00\x5f\x00\
-\x00\x01\xf9\x02\xd4\x02\x26\x02\x0d\x00\x00\x00\x06\x03\x08\xfd\
-\x00\x00\x00\xff\xff\x00\x5f\x00\x00\x01\xf9\x03\x0b\x02\x26\x02\
-\x0d\x00\x00\x00\x06\x03\x0b\xfd\x00\x00\x00\xff\xff\x00\x5f\x00\
-\x00\x01\xf9\x02\xc1\x02\x26\x02\x0d\x00\x00\x00\x06\x03\x06\xfd\
-\x00\x00\x00\xff\xff\x00\x6b\x00\x00\x02\x19\x03\x0b\x02\x26\x02\
-\x0f\x00\x00\x00\x06\x03\x0a\xfd\x00\x00\x00\x00\x01\x00\x63\xff\
-\x74\x02\x17\x02\x04\x00\x19\x00\x82\xba\x00\x04\x00\x1a\x00\x1b\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\
-\x08\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\
-\x00\x0c\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x07\x2f\x1b\
-\xb9\x00\x07\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\
-\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xba\x00\x05\x00\x08\x00\x07\x11\
-\x12\x39\xb8\x00\x05\x2f\x41\x03\x00\xb0\x00\x05\x00\x01\x71\xb9\
-\x00\x0a\x00\x08\xf4\xba\x00\x11\x00\x0a\x00\x05\x11\x12\x39\xb8\
-\x00\x00\x10\xb9\x00\x16\x00\x08\xf4\x30\x31\x21\x2e\x01\x2f\x01\
-\x23\x15\x23\x11\x33\x15\x33\x37\x33\x07\x0e\x01\x07\x15\x1e\x01\
-\x1f\x01\x33\x15\x23\x01\xce\x17\x22\x11\x63\x6e\x50\x50\x6e\x8b\
-\x53\x7e\x11\x1a\x12\x14\x1c\x0f\x54\x40\x49\x03\x1c\x1d\xac\xe8\
-\x02\x04\xd8\xd8\xc4\x1a\x15\x05\x04\x03\x15\x1a\x92\xd0\x00\x00\
-\x01\x00\x57\x00\x00\x02\x2d\x02\x04\x00\x20\x00\x9e\xba\x00\x1f\
-\x00\x21\x00\x22\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x04\
-\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x0c\x2f\x1b\xb9\x00\x0c\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x03\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x19\x2f\x1b\xb9\x00\x19\x00\x0e\x3e\x59\xba\x00\x01\x00\
-\x03\x00\x04\x11\x12\x39\xb8\x00\x01\x2f\x41\x03\x00\xb0\x00\x01\
-\x00\x01\x71\xb9\x00\x06\x00\x08\xf4\xb8\x00\x08\xdc\xb8\x00\x06\
-\x10\xb8\x00\x0a\xd0\xb8\x00\x01\x10\xb8\x00\x1e\xd0\xba\x00\x11\
-\x00\x0a\x00\x1e\x11\x12\x39\xb8\x00\x19\x10\xb9\x00\x16\x00\x08\
-\xf4\xb8\x00\x01\x10\xb8\x00\x20\xdc\x30\x31\x37\x23\x15\x23\x11\
-\x33\x15\x33\x35\x33\x15\x33\x37\x33\x07\x0e\x01\x07\x15\x1e\x01\
-\x1f\x01\x33\x15\x23\x22\x26\x2f\x01\x23\x15\x23\xdd\x36\x50\x50\
-\x36\x3e\x28\x85\x53\x78\x11\x1a\x12\x14\x1c\x0e\x4f\x3a\x3a\x1a\
-\x27\x14\x5b\x28\x3e\xe8\xe8\x02\x04\xd8\x76\x76\xd8\xc3\x1b\x15\
-\x05\x04\x03\x15\x1a\x92\x44\x1c\x24\xa8\x75\x00\x01\x00\x0b\x00\
-\x00\x02\x37\x02\x04\x00\x1a\x00\x8c\xba\x00\x17\x00\x1b\x00\x1c\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\
-\x02\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\
-\x00\x06\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x1a\x2f\x1b\
-\xb9\x00\x1a\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x13\x2f\
-\x1b\xb9\x00\x13\x00\x0e\x3e\x59\xb8\x00\x02\x10\xb9\x00\x01\x00\
-\x08\xf4\xba\x00\x18\x00\x02\x00\x1a\x11\x12\x39\xb8\x00\x18\x2f\
-\x41\x03\x00\xb0\x00\x18\x00\x01\x71\xb9\x00\x04\x00\x08\xf4\xba\
-\x00\x0b\x00\x04\x00\x18\x11\x12\x39\xb8\x00\x13\x10\xb9\x00\x10\
-\x00\x08\xf4\x30\x31\x13\x23\x35\x33\x15\x33\x37\x33\x07\x0e\x01\
-\x07\x15\x1e\x01\x1f\x01\x33\x15\x23\x22\x26\x2f\x01\x23\x15\x23\
-\xa1\x96\xe6\x60\x81\x53\x75\x0f\x1e\x12\x14\x1f\x0e\x4b\x3a\x3a\
-\x1a\x28\x16\x54\x60\x50\x01\xc0\x44\xd8\xd8\xc2\x1a\x17\x05\x04\
-\x03\x18\x1a\x8f\x44\x1e\x2a\xa0\xe8\x00\x00\x00\x02\x00\x02\x00\
-\x00\x02\x4a\x02\x04\x00\x1d\x00\x27\x00\x87\xba\x00\x11\x00\x28\
-\x00\x29\x11\x12\x39\xb8\x00\x11\x10\xb8\x00\x27\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x1a\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x1d\x2f\x1b\xb9\x00\x1d\x00\x0e\x3e\x59\
-\xb8\x00\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\x0e\x3e\
-\x59\xb8\x00\x1d\x10\xb9\x00\x00\x00\x08\xf4\xba\x00\x26\x00\x11\
-\x00\x07\x11\x12\x39\xb8\x00\x26\x2f\x41\x05\x00\x00\x00\x26\x00\
-\x10\x00\x26\x00\x02\x5d\xb9\x00\x09\x00\x08\xf4\xb8\x00\x07\x10\
-\xb9\x00\x13\x00\x0b\xf4\xb8\x00\x11\x10\xb9\x00\x27\x00\x08\xf4\
-\x30\x31\x37\x33\x3e\x03\x3d\x01\x33\x15\x33\x32\x16\x15\x14\x06\
-\x2b\x01\x11\x23\x15\x14\x0e\x02\x07\x0e\x01\x2b\x01\x25\x32\x36\
-\x3d\x01\x34\x26\x2b\x01\x15\x02\x31\x0e\x17\x0f\x08\xfe\x3a\x4f\
-\x54\x54\x4f\x84\x6c\x0b\x14\x1c\x10\x13\x2e\x1a\x0f\x01\x99\x2f\
-\x31\x31\x2f\x2e\x42\x13\x35\x49\x64\x44\x89\xbb\x56\x4e\x4e\x57\
-\x01\xc2\x49\x4a\x72\x53\x38\x10\x13\x0f\x42\x26\x28\x29\x28\x26\
-\xc5\x00\x00\x00\x01\x00\x54\xff\x74\x02\x3a\x02\x04\x00\x0f\x00\
-\x80\xba\x00\x0b\x00\x10\x00\x11\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x0e\x3e\x59\
-\xba\x00\x0d\x00\x00\x00\x0f\x11\x12\x39\xb8\x00\x0d\x2f\x41\x03\
-\x00\xb0\x00\x0d\x00\x01\x71\xb9\x00\x02\x00\x08\xf4\xb8\x00\x0b\
-\x10\xb9\x00\x06\x00\x08\xf4\xb8\x00\x0b\x10\xb8\x00\x09\xdc\x30\
-\x31\x13\x33\x15\x33\x35\x33\x11\x33\x15\x23\x35\x23\x35\x23\x15\
-\x23\x54\x50\xf1\x50\x55\x49\x5c\xf1\x50\x02\x04\xd8\xd8\xfe\x40\
-\xd0\x8c\xe8\xe8\x00\x00\x00\x00\x02\x00\x36\x00\x00\x02\x4a\x02\
-\x04\x00\x12\x00\x1c\x00\xa1\xba\x00\x0e\x00\x1d\x00\x1e\x11\x12\
-\x39\xb8\x00\x0e\x10\xb8\x00\x1c\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x12\x2f\x1b\xb9\x00\x12\x00\x0e\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\x0e\x3e\x59\xba\x00\
-\x10\x00\x12\x00\x00\x11\x12\x39\xb8\x00\x10\x2f\x41\x03\x00\xb0\
-\x00\x10\x00\x01\x71\xb9\x00\x02\x00\x08\xf4\xba\x00\x1b\x00\x0e\
-\x00\x04\x11\x12\x39\xb8\x00\x1b\x2f\x41\x05\x00\x00\x00\x1b\x00\
-\x10\x00\x1b\x00\x02\x5d\xb9\x00\x06\x00\x08\xf4\xb8\x00\x0e\x10\
-\xb9\x00\x1c\x00\x08\xf4\x30\x31\x13\x33\x15\x33\x35\x33\x15\x33\
-\x32\x16\x15\x14\x06\x2b\x01\x35\x23\x15\x23\x25\x32\x36\x3d\x01\
-\x34\x26\x2b\x01\x15\x36\x4a\xa3\x4a\x3a\x4f\x54\x54\x4f\x84\xa3\
-\x4a\x01\x65\x2f\x31\x31\x2f\x2e\x02\x04\xd9\xd9\xbb\x56\x4e\x4e\
-\x57\xe9\xe9\x42\x26\x28\x29\x28\x26\xc5\x00\x00\x01\x00\x36\x00\
-\x00\x02\x40\x02\x04\x00\x0d\x00\x78\xba\x00\x09\x00\x0e\x00\x0f\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\
-\x00\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\
-\x00\x04\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\
-\xb9\x00\x0d\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\
-\x1b\xb9\x00\x09\x00\x0e\x3e\x59\xba\x00\x0b\x00\x0d\x00\x00\x11\
-\x12\x39\xb8\x00\x0b\x2f\x41\x03\x00\xb0\x00\x0b\x00\x01\x71\xb9\
-\x00\x02\x00\x08\xf4\xb8\x00\x04\x10\xb9\x00\x07\x00\x08\xf4\x30\
-\x31\x13\x33\x15\x33\x35\x21\x15\x23\x11\x23\x35\x23\x15\x23\x36\
-\x50\xb5\x01\x05\xb5\x50\xb5\x50\x02\x04\xd8\xd8\x44\xfe\x40\xe8\
-\xe8\x00\x00\xff\xff\x00\x42\xff\xf4\x02\x16\x02\xd4\x02\x26\x00\
-\x15\x00\x00\x00\x06\x03\x08\x00\x00\x00\x00\x00\x03\x00\x42\xff\
-\xf4\x02\x16\x02\x10\x00\x13\x00\x1c\x00\x23\x00\x5f\xba\x00\x00\
-\x00\x24\x00\x25\x11\x12\x39\xb8\x00\x14\xd0\xb8\x00\x00\x10\xb8\
-\x00\x1d\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\
-\x0a\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\
-\x00\x00\x00\x0e\x3e\x59\xb9\x00\x14\x00\x08\xf4\xba\x00\x20\x00\
-\x14\x00\x0a\x11\x12\x39\xb8\x00\x20\x2f\xb9\x00\x19\x00\x08\xf4\
-\xb8\x00\x0a\x10\xb9\x00\x1d\x00\x08\xf4\x30\x31\x05\x22\x2e\x02\
-\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x0e\x02\x27\x32\x36\x3d\
-\x01\x21\x15\x14\x16\x13\x22\x06\x15\x21\x34\x26\x01\x2c\x36\x57\
-\x3d\x20\x20\x3d\x57\x36\x36\x57\x3d\x20\x20\x3d\x57\x36\x43\x52\
-\xfe\xd6\x52\x43\x43\x52\x01\x2a\x52\x0c\x26\x47\x63\x3e\x3d\x64\
-\x47\x26\x26\x47\x64\x3d\x3e\x63\x47\x26\x45\x50\x54\x06\x06\x54\
-\x50\x01\x92\x50\x54\x54\x50\xff\xff\x00\x42\xff\xf4\x02\x16\x02\
-\x10\x02\x06\x02\x64\x00\x00\x00\x01\x00\x54\xff\x74\x02\x04\x02\
-\x10\x00\x23\x00\x53\xba\x00\x0f\x00\x24\x00\x25\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb8\x00\x08\x10\xb9\x00\x0f\x00\x08\xf4\xb8\x00\x00\x10\
-\xb9\x00\x1a\x00\x08\xf4\xb8\x00\x00\x10\xb8\x00\x21\xd0\xb8\x00\
-\x00\x10\xb8\x00\x23\xdc\x30\x31\x05\x2e\x01\x35\x34\x3e\x02\x33\
-\x32\x16\x17\x07\x2e\x01\x23\x22\x0e\x02\x1d\x01\x14\x1e\x02\x33\
-\x32\x36\x37\x17\x0e\x01\x07\x15\x23\x01\x1a\x5f\x67\x20\x3c\x56\
-\x37\x4b\x5e\x16\x40\x0e\x41\x30\x23\x37\x26\x13\x13\x26\x38\x24\
-\x34\x44\x14\x39\x14\x4f\x3e\x49\x0a\x0c\x90\x70\x3d\x64\x47\x26\
-\x42\x35\x22\x28\x2c\x17\x2a\x3a\x22\x58\x22\x3a\x2a\x17\x30\x2a\
-\x27\x2e\x40\x08\x82\x00\x00\xff\xff\x00\x35\xff\x38\x02\x23\x02\
-\xc1\x02\x26\x00\x1f\x00\x00\x00\x06\x03\x06\x00\x00\x00\x00\xff\
-\xff\x00\x35\xff\x38\x02\x23\x02\xd4\x02\x26\x00\x1f\x00\x00\x00\
-\x06\x03\x08\x00\x00\x00\x00\xff\xff\x00\x35\xff\x38\x02\x23\x03\
-\x0a\x02\x26\x00\x1f\x00\x00\x00\x06\x03\x09\x00\x00\x00\x00\xff\
-\xff\x00\x35\xff\x38\x02\x23\x03\x00\x02\x26\x00\x1f\x00\x00\x00\
-\x06\x03\x0f\x00\x00\x00\x00\x00\x01\x00\x40\xff\x38\x02\x18\x02\
-\x04\x00\x0b\x00\x5d\xba\x00\x04\x00\x0c\x00\x0d\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1a\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x1a\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\
-\x10\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\
-\x00\x0e\x3e\x59\xb8\x00\x04\xd0\xb8\x00\x00\x10\xb8\x00\x09\xd0\
-\x30\x31\x21\x03\x33\x1f\x01\x33\x3f\x01\x33\x03\x15\x23\x01\x04\
-\xc4\x51\x4a\x50\x04\x50\x4a\x4f\xc4\x50\x02\x04\xca\xe0\xe0\xca\
-\xfd\xfc\xc8\x00\x01\x00\x40\xff\x38\x02\x18\x02\x04\x00\x11\x00\
-\x73\xba\x00\x07\x00\x12\x00\x13\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1a\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\x10\x3e\x59\
-\xb8\x00\x03\x10\xb9\x00\x00\x00\x08\xf4\xb8\x00\x03\x10\xb8\x00\
-\x07\xd0\xb8\x00\x03\x10\xb8\x00\x0c\xd0\xb8\x00\x00\x10\xb8\x00\
-\x0f\xd0\x30\x31\x05\x23\x35\x33\x03\x33\x1f\x01\x33\x3f\x01\x33\
-\x03\x33\x15\x23\x15\x23\x01\x04\x87\x87\xc4\x51\x4a\x50\x04\x50\
-\x4a\x4f\xc4\x87\x87\x50\x3e\x3e\x02\x04\xca\xe0\xe0\xca\xfd\xfc\
-\x3e\x8a\x00\x00\x01\x00\x3d\xff\x74\x02\x3f\x02\x04\x00\x15\x00\
-\x89\xba\x00\x03\x00\x16\x00\x17\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x1a\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\
-\xba\x00\x04\x00\x07\x00\x09\x11\x12\x39\xba\x00\x0c\x00\x09\x00\
-\x07\x11\x12\x39\xba\x00\x08\x00\x0c\x00\x04\x11\x12\x39\xb8\x00\
-\x08\x10\xb8\x00\x11\xd0\xb8\x00\x01\x10\xb9\x00\x12\x00\x08\xf4\
-\xb8\x00\x01\x10\xb8\x00\x15\xdc\x30\x31\x21\x23\x2f\x01\x23\x0f\
-\x01\x23\x13\x27\x33\x1f\x01\x33\x3f\x01\x33\x07\x17\x33\x15\x23\
-\x01\xf6\x3a\x57\x3b\x04\x39\x54\x5c\xc0\xbb\x60\x4e\x3e\x04\x3c\
-\x4d\x5c\xbd\x90\x55\x49\x79\x52\x52\x79\x01\x06\xfe\x6d\x56\x56\
-\x6d\xfd\xc3\xd0\x00\x00\x00\xff\xff\x00\x50\x00\x00\x01\xea\x02\
-\xd4\x02\x26\x02\x1c\x00\x00\x00\x06\x03\x08\xf2\x00\x00\x00\x00\
-\x01\x00\x4b\xff\x74\x02\x3a\x02\x04\x00\x18\x00\x86\xba\x00\x0f\
-\x00\x19\x00\x1a\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\
-\x2f\x1b\xb9\x00\x0a\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x13\x2f\x1b\xb9\x00\x13\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xba\x00\x0f\x00\x0a\
-\x00\x01\x11\x12\x39\xb8\x00\x0f\x2f\x41\x03\x00\x4f\x00\x0f\x00\
-\x01\x5d\x41\x05\x00\x0f\x00\x0f\x00\x1f\x00\x0f\x00\x02\x5d\xb9\
-\x00\x06\x00\x08\xf4\xba\x00\x03\x00\x06\x00\x0f\x11\x12\x39\xb8\
-\x00\x01\x10\xb9\x00\x15\x00\x08\xf4\xb8\x00\x01\x10\xb8\x00\x18\
-\xdc\x30\x31\x21\x23\x35\x23\x0e\x01\x23\x22\x26\x3d\x01\x33\x15\
-\x14\x16\x33\x32\x36\x3d\x01\x33\x11\x33\x15\x23\x01\xf1\x5c\x05\
-\x1c\x46\x38\x54\x57\x50\x36\x3d\x3c\x4b\x50\x55\x49\xed\x1f\x1f\
-\x4f\x50\xb6\xaf\x30\x2e\x1f\x20\xce\xfe\x40\xd0\x00\x00\x00\x00\
-\x01\x00\x50\x00\x00\x01\xea\x02\x04\x00\x18\x00\x90\xba\x00\x05\
-\x00\x19\x00\x1a\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0a\
-\x2f\x1b\xb9\x00\x0a\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x15\x2f\x1b\xb9\x00\x15\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x18\x2f\x1b\xb9\x00\x18\x00\x0e\x3e\x59\xba\x00\x0e\x00\x0a\
-\x00\x18\x11\x12\x39\xb8\x00\x0e\x2f\x41\x05\x00\x0f\x00\x0e\x00\
-\x1f\x00\x0e\x00\x02\x5d\x41\x03\x00\x4f\x00\x0e\x00\x01\x5d\xb9\
-\x00\x07\x00\x08\xf4\xba\x00\x00\x00\x0e\x00\x07\x11\x12\x39\xb8\
-\x00\x04\xd0\xb8\x00\x07\x10\xb8\x00\x06\xdc\xb8\x00\x0e\x10\xb8\
-\x00\x0f\xdc\xb8\x00\x0e\x10\xb8\x00\x11\xd0\x30\x31\x25\x23\x0e\
-\x01\x07\x15\x23\x35\x22\x3d\x01\x33\x15\x14\x17\x35\x33\x15\x3e\
-\x01\x3d\x01\x33\x11\x23\x01\x9a\x05\x12\x2e\x19\x3e\xae\x50\x5e\
-\x3e\x2a\x34\x50\x50\xec\x15\x1c\x06\x5c\x56\x9f\xb6\xaf\x58\x05\
-\x90\x90\x05\x1e\x1b\xce\xfd\xfc\x00\x00\x00\xff\xff\x00\x36\x00\
-\x00\x02\x22\x02\xd4\x02\x26\x02\x20\x00\x00\x00\x06\x03\x08\x00\
-\x00\x00\x00\xff\xff\x00\x43\xff\xf4\x02\x0c\x02\x10\x02\x06\x00\
-\x19\x00\x00\x00\x01\x00\x61\xff\x74\x01\xf7\x02\x04\x00\x0b\x00\
-\x56\xba\x00\x0a\x00\x0c\x00\x0d\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1a\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1a\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x0e\x3e\x59\xb9\
-\x00\x02\x00\x08\xf4\xb8\x00\x0b\x10\xb8\x00\x07\xd0\xb8\x00\x0b\
-\x10\xb8\x00\x09\xdc\x30\x31\x13\x33\x11\x33\x11\x33\x11\x23\x15\
-\x23\x35\x23\x61\x50\xf6\x50\xa6\x49\xa7\x02\x04\xfe\x40\x01\xc0\
-\xfd\xfc\x8c\x8c\x00\x00\x00\xff\xff\x00\x6a\x00\x00\x02\x22\x02\
-\xec\x02\x06\x00\x0f\x00\x00\xff\xff\x00\x6a\x00\x00\x02\x22\x02\
-\xd4\x02\x26\x01\x02\x00\x00\x00\x06\x03\x08\x20\x00\x00\x00\xff\
-\xff\x00\x5d\xff\x38\x01\xc7\x02\xec\x02\x06\x00\x10\x00\x00\x00\
-\x01\x00\x21\xff\x38\x01\xfc\x02\xe4\x00\x25\x00\xa0\xba\x00\x05\
-\x00\x26\x00\x27\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x11\
-\x2f\x1b\xb9\x00\x11\x00\x1e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x1d\x2f\x1b\xb9\x00\x1d\x00\x1a\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x25\x2f\x1b\xb9\x00\x25\x00\x10\x3e\x59\xb9\x00\x00\x00\
-\x08\xf4\x41\x07\x00\x00\x00\x1d\x00\x10\x00\x1d\x00\x20\x00\x1d\
-\x00\x03\x5d\xb8\x00\x1d\x10\xb9\x00\x05\x00\x08\xf4\xba\x00\x0f\
-\x00\x11\x00\x1d\x11\x12\x39\xb8\x00\x0f\x2f\xb9\x00\x0e\x00\x08\
-\xf4\xb8\x00\x0f\x10\xb8\x00\x13\xd0\xb8\x00\x0e\x10\xb8\x00\x16\
-\xd0\xba\x00\x18\x00\x05\x00\x0c\x11\x12\x39\x30\x31\x17\x33\x11\
-\x34\x26\x23\x22\x0e\x02\x15\x11\x23\x11\x23\x35\x33\x35\x33\x15\
-\x33\x15\x23\x15\x33\x3e\x03\x33\x32\x16\x15\x11\x14\x06\x2b\x01\
-\xb2\xfa\x3e\x3c\x18\x2e\x24\x16\x50\x41\x41\x50\x99\x99\x04\x08\
-\x18\x23\x30\x20\x51\x62\x37\x3b\xd8\x84\x01\xc1\x47\x45\x0c\x18\
-\x26\x19\xfe\x9a\x02\x60\x3e\x46\x46\x3e\xb0\x13\x23\x1a\x10\x67\
-\x5e\xfe\x63\x34\x42\x00\x00\xff\xff\x00\x21\x00\x00\x01\xfc\x02\
-\xe4\x02\x06\x01\x00\x00\x00\xff\xff\x00\x62\x00\x00\x01\xfc\x02\
-\xe4\x02\x06\x00\x0e\x00\x00\xff\xff\x00\x43\xff\xf4\x02\x15\x02\
-\x10\x02\x06\x00\xf7\x00\x00\xff\xff\x00\x1f\x00\x00\x02\x3a\x03\
-\x7e\x02\x26\x00\x21\x00\x00\x00\x06\x03\x3a\x00\x00\x00\x00\xff\
-\xff\x00\x1f\x00\x00\x02\x3a\x03\xaa\x02\x26\x00\x21\x00\x00\x00\
-\x06\x03\x41\x00\x00\x00\x00\xff\xff\x00\x14\x00\x00\x02\x30\x02\
-\xba\x02\x06\x01\x7c\x00\x00\xff\xff\x00\x84\x00\x00\x02\x0b\x03\
-\xb5\x02\x26\x02\x28\x00\x00\x00\x06\x03\x3c\x1b\x00\x00\x00\x00\
-\x01\x00\x84\x00\x00\x02\x0b\x03\x50\x00\x07\x00\x41\xba\x00\x06\
-\x00\x08\x00\x09\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\
-\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x07\x2f\x1b\xb9\x00\x07\x00\x0e\x3e\x59\xb8\x00\x00\x10\xb8\x00\
-\x02\xdc\xb8\x00\x00\x10\xb9\x00\x05\x00\x08\xf4\x30\x31\x13\x21\
-\x35\x33\x15\x21\x11\x23\x84\x01\x3a\x4d\xfe\xcd\x54\x02\xba\x96\
-\xdf\xfd\x8f\x00\x01\x00\x33\x00\x00\x02\x1d\x02\xba\x00\x0d\x00\
-\x6f\xba\x00\x09\x00\x0e\x00\x0f\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x0e\x3e\x59\xb8\x00\
-\x01\x10\xb9\x00\x04\x00\x0b\xf4\xba\x00\x0c\x00\x0a\x00\x01\x11\
-\x12\x39\xb8\x00\x0c\x2f\x41\x05\x00\x9f\x00\x0c\x00\xaf\x00\x0c\
-\x00\x02\x5d\x41\x03\x00\x7f\x00\x0c\x00\x01\x5d\xb9\x00\x0d\x00\
-\x0b\xf4\xb8\x00\x05\xd0\xb8\x00\x0c\x10\xb8\x00\x08\xd0\x30\x31\
-\x13\x11\x21\x15\x21\x15\x33\x15\x23\x11\x23\x11\x23\x35\x96\x01\
-\x87\xfe\xcd\xc6\xc6\x54\x63\x01\x90\x01\x2a\x49\xe1\x40\xfe\xb0\
-\x01\x50\x40\x00\x01\x00\x58\xff\x5c\x02\x1c\x02\xba\x00\x22\x00\
-\x83\xba\x00\x0a\x00\x23\x00\x24\x11\x12\x39\x00\xb8\x00\x22\x2f\
-\xb8\x00\x00\x45\x58\xb8\x00\x10\x2f\x1b\xb9\x00\x10\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x0e\
-\x3e\x59\x41\x03\x00\x00\x00\x22\x00\x01\x5d\xb8\x00\x22\x10\xb9\
-\x00\x00\x00\x0b\xf4\xb8\x00\x10\x10\xb9\x00\x13\x00\x0b\xf4\xba\
-\x00\x18\x00\x0f\x00\x13\x11\x12\x39\xb8\x00\x18\x2f\x41\x03\x00\
-\x0f\x00\x18\x00\x01\x5d\x41\x03\x00\x7f\x00\x18\x00\x01\x5d\x41\
-\x05\x00\x2f\x00\x18\x00\x3f\x00\x18\x00\x02\x5d\xb9\x00\x0a\x00\
-\x0b\xf4\x30\x31\x17\x33\x3e\x01\x3d\x01\x34\x2e\x02\x23\x22\x06\
-\x07\x11\x23\x11\x21\x15\x21\x15\x33\x3e\x01\x33\x32\x1e\x02\x1d\
-\x01\x14\x06\x2b\x01\xf2\xa3\x17\x1c\x0e\x21\x37\x28\x2d\x41\x20\
-\x54\x01\x87\xfe\xcd\x05\x1b\x47\x2a\x3e\x55\x35\x17\x59\x54\x7d\
-\x5b\x12\x48\x41\x58\x30\x43\x29\x13\x0c\x0c\xfe\xd1\x02\xba\x49\
-\xf8\x0b\x0c\x1e\x3e\x5d\x3f\x58\x78\x6c\x00\xff\xff\x00\x5a\x00\
-\x00\x02\x08\x03\xb5\x02\x26\x00\x25\x00\x00\x00\x06\x03\x3d\x05\
-\x00\x00\x00\xff\xff\x00\x5a\x00\x00\x02\x08\x03\x7e\x02\x26\x00\
-\x25\x00\x00\x00\x06\x03\x3a\x05\x00\x00\x00\xff\xff\x00\x5a\x00\
-\x00\x02\x08\x03\xaa\x02\x26\x00\x25\x00\x00\x00\x06\x03\x41\x05\
-\x00\x00\x00\x00\x01\x00\x43\xff\xf4\x02\x1d\x02\xc6\x00\x2a\x00\
-\x53\xba\x00\x11\x00\x2b\x00\x2c\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x17\x2f\x1b\xb9\x00\x17\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x11\x2f\x1b\xb9\x00\x11\x00\x0e\x3e\x59\xb9\x00\
-\x06\x00\x0b\xf4\xb8\x00\x17\x10\xb9\x00\x22\x00\x0b\xf4\xba\x00\
-\x29\x00\x06\x00\x17\x11\x12\x39\xb8\x00\x29\x2f\xb9\x00\x2a\x00\
-\x0b\xf4\x30\x31\x13\x15\x14\x1e\x02\x33\x32\x3e\x02\x37\x17\x0e\
-\x03\x23\x22\x26\x35\x34\x36\x33\x32\x1e\x02\x17\x07\x2e\x03\x23\
-\x22\x0e\x02\x1d\x01\x33\x15\x9c\x14\x29\x3f\x2b\x21\x2f\x21\x18\
-\x09\x48\x0d\x22\x33\x47\x31\x82\x7e\x7e\x82\x31\x47\x33\x22\x0d\
-\x48\x09\x18\x21\x2f\x21\x2b\x3f\x29\x14\xe7\x01\x3d\x19\x35\x55\
-\x3c\x21\x12\x1f\x29\x17\x21\x1d\x36\x2c\x1a\xbb\xae\xae\xbb\x1a\
-\x2c\x37\x1c\x21\x17\x29\x1f\x12\x21\x3c\x56\x34\x10\x49\x00\xff\
-\xff\x00\x02\x00\x00\x02\x56\x03\x7e\x02\x26\x02\x2b\x00\x00\x00\
-\x06\x03\x3a\x00\x00\x00\x00\xff\xff\x00\x02\x00\x00\x02\x56\x03\
-\xaa\x02\x26\x02\x2b\x00\x00\x00\x06\x03\x41\x00\x00\x00\x00\x00\
-\x01\xff\xf8\xff\x6a\x02\x7c\x02\xba\x00\x2b\x00\xf3\xba\x00\x04\
-\x00\x2c\x00\x2d\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x14\
-\x2f\x1b\xb9\x00\x14\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x18\x2f\x1b\xb9\x00\x18\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x1c\x2f\x1b\xb9\x00\x1c\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x0e\x3e\x59\xb8\x00\x00\x45\
-\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x0e\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xba\x00\
-\x07\x00\x09\x00\x14\x11\x12\x39\xb8\x00\x07\x2f\x41\x03\x00\xbf\
-\x00\x07\x00\x01\x5d\x41\x03\x00\x8f\x00\x07\x00\x01\x5d\xb8\x00\
-\x03\xd0\xb8\x00\x07\x10\xb9\x00\x16\x00\x0b\xf4\xba\x00\x10\x00\
-\x07\x00\x16\x11\x12\x39\xb8\x00\x1a\xd0\xba\x00\x21\x00\x03\x00\
-\x1a\x11\x12\x39\xb8\x00\x01\x10\xb9\x00\x28\x00\x0b\xf4\xb8\x00\
-\x01\x10\xb8\x00\x2b\xdc\x41\x03\x00\x8f\x00\x2b\x00\x01\x5d\x41\
-\x03\x00\xff\x00\x2b\x00\x01\x5d\x41\x03\x00\x1f\x00\x2b\x00\x01\
-\x5d\x41\x05\x00\x5f\x00\x2b\x00\x6f\x00\x2b\x00\x02\x71\x30\x31\
-\x21\x23\x03\x23\x11\x23\x11\x23\x03\x23\x13\x3e\x03\x37\x35\x2e\
-\x01\x27\x03\x33\x13\x33\x11\x33\x11\x33\x13\x33\x03\x0e\x01\x07\
-\x15\x1e\x03\x1f\x01\x33\x15\x23\x02\x31\x40\x65\x43\x52\x43\x66\
-\x56\x54\x08\x10\x11\x13\x0b\x15\x20\x0c\x4a\x52\x5a\x43\x52\x43\
-\x5b\x51\x4b\x0d\x1e\x15\x0b\x14\x12\x0f\x08\x3c\x4b\x4b\x01\x3e\
-\xfe\xc2\x01\x3e\xfe\xc2\x01\x09\x18\x20\x13\x0a\x02\x05\x05\x22\
-\x2b\x01\x03\xfe\xcc\x01\x34\xfe\xcc\x01\x34\xfe\xfe\x2c\x22\x05\
-\x05\x02\x0a\x14\x1f\x18\xc0\xdf\x00\x00\x00\xff\xff\x00\x28\xff\
-\xf4\x02\x09\x03\x7e\x02\x26\x02\x2c\x00\x00\x00\x06\x03\x3a\xf1\
-\x00\x00\x00\x00\x01\x00\x28\xff\x6a\x02\x09\x02\xc6\x00\x2e\x00\
-\x6d\xba\x00\x0d\x00\x2f\x00\x30\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x1d\x2f\x1b\xb9\x00\x1d\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\
-\x06\x00\x0b\xf4\xba\x00\x0f\x00\x1d\x00\x06\x11\x12\x39\xb8\x00\
-\x0f\x2f\xb9\x00\x0e\x00\x0b\xf4\xb8\x00\x1d\x10\xb9\x00\x16\x00\
-\x0b\xf4\xba\x00\x23\x00\x0f\x00\x0e\x11\x12\x39\xb8\x00\x00\x10\
-\xb8\x00\x2c\xd0\xb8\x00\x00\x10\xb8\x00\x2e\xdc\x30\x31\x17\x2e\
-\x01\x27\x37\x16\x33\x32\x36\x3d\x01\x34\x26\x2b\x01\x35\x33\x32\
-\x3d\x01\x34\x26\x23\x22\x06\x07\x27\x3e\x01\x33\x32\x16\x15\x14\
-\x06\x07\x15\x1e\x03\x15\x14\x06\x07\x15\x23\xf4\x47\x64\x21\x3d\
-\x4a\x6a\x45\x52\x46\x4a\x62\x5c\x87\x43\x42\x3a\x4a\x18\x3f\x24\
-\x69\x4e\x6e\x6f\x4c\x39\x1f\x36\x28\x18\x6a\x5e\x4d\x0a\x08\x42\
-\x2f\x32\x65\x42\x3d\x15\x33\x41\x49\x72\x15\x30\x3a\x2a\x24\x29\
-\x35\x38\x64\x54\x49\x4f\x09\x05\x04\x16\x28\x3b\x27\x55\x6e\x0b\
-\x8c\x00\x00\xff\xff\x00\x54\x00\x00\x02\x04\x02\xba\x02\x06\x00\
-\x29\x00\x00\xff\xff\x00\x50\x00\x00\x02\x08\x03\x7e\x02\x26\x02\
-\x2d\x00\x00\x00\x06\x03\x3a\x00\x00\x00\x00\xff\xff\x00\x50\x00\
-\x00\x02\x08\x03\xb5\x02\x26\x02\x2d\x00\x00\x00\x06\x03\x3d\x00\
-\x00\x00\x00\xff\xff\x00\x50\x00\x00\x02\x08\x03\x6b\x02\x26\x02\
-\x2d\x00\x00\x00\x06\x03\x38\x00\x00\x00\x00\xff\xff\x00\x50\x00\
-\x00\x02\x27\x03\xb5\x02\x26\x02\x2f\x00\x00\x00\x06\x03\x3c\xf3\
-\x00\x00\x00\x00\x01\x00\x48\xff\x6a\x02\x2f\x02\xba\x00\x19\x00\
-\xbb\xba\x00\x12\x00\x1a\x00\x1b\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\
-\xba\x00\x05\x00\x07\x00\x08\x11\x12\x39\xb8\x00\x05\x2f\x41\x03\
-\x00\x8f\x00\x05\x00\x01\x5d\x41\x03\x00\xbf\x00\x05\x00\x01\x5d\
-\xb9\x00\x0a\x00\x0b\xf4\xba\x00\x11\x00\x05\x00\x0a\x11\x12\x39\
-\xb8\x00\x00\x10\xb9\x00\x17\x00\x0b\xf4\xb8\x00\x07\x10\xb8\x00\
-\x19\xdc\x41\x03\x00\x8f\x00\x19\x00\x01\x5d\x41\x03\x00\xff\x00\
-\x19\x00\x01\x5d\x41\x03\x00\x1f\x00\x19\x00\x01\x5d\x41\x05\x00\
-\x5f\x00\x19\x00\x6f\x00\x19\x00\x02\x71\x30\x31\x21\x22\x26\x2f\
-\x01\x23\x11\x23\x11\x33\x11\x33\x13\x33\x03\x0e\x01\x07\x15\x1e\
-\x01\x1f\x01\x33\x15\x23\x01\xe2\x21\x2d\x11\x6c\x7b\x54\x54\x7b\
-\x94\x59\x85\x11\x1e\x12\x16\x1e\x12\x5a\x51\x4d\x24\x26\xf4\xfe\
-\xc2\x02\xba\xfe\xcc\x01\x34\xfe\xec\x23\x1b\x03\x05\x05\x1f\x29\
-\xca\xdf\x00\x00\x01\x00\x3c\x00\x00\x02\x3b\x02\xba\x00\x22\x00\
-\xa7\xba\x00\x1f\x00\x23\x00\x24\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x03\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x1b\x2f\x1b\xb9\x00\x1b\x00\x0e\x3e\x59\
-\xba\x00\x01\x00\x03\x00\x04\x11\x12\x39\xb8\x00\x01\x2f\x41\x03\
-\x00\x8f\x00\x01\x00\x01\x5d\x41\x03\x00\xbf\x00\x01\x00\x01\x5d\
-\xb9\x00\x06\x00\x0b\xf4\xb8\x00\x08\xdc\xb8\x00\x06\x10\xb8\x00\
-\x0a\xd0\xb8\x00\x01\x10\xb8\x00\x20\xd0\xba\x00\x11\x00\x0a\x00\
-\x20\x11\x12\x39\xb8\x00\x1b\x10\xb9\x00\x18\x00\x0b\xf4\xb8\x00\
-\x01\x10\xb8\x00\x22\xdc\x30\x31\x13\x23\x11\x23\x11\x33\x11\x33\
-\x35\x33\x15\x33\x13\x33\x03\x0e\x01\x07\x15\x1e\x03\x1f\x01\x33\
-\x15\x23\x22\x26\x2f\x01\x23\x15\x23\xc8\x38\x54\x54\x38\x42\x2f\
-\x8e\x59\x7f\x0f\x20\x12\x0b\x12\x0f\x10\x09\x55\x41\x3f\x1e\x2e\
-\x11\x66\x2f\x42\x01\x3e\xfe\xc2\x02\xba\xfe\xcc\x9a\x9a\x01\x34\
-\xfe\xed\x21\x1e\x03\x05\x02\x09\x12\x1c\x16\xc8\x49\x23\x27\xf4\
-\x9a\x00\x00\x00\x01\x00\x02\x00\x00\x02\x57\x02\xba\x00\x1a\x00\
-\x95\xba\x00\x17\x00\x1b\x00\x1c\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x1a\x2f\x1b\xb9\x00\x1a\x00\x0e\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\x0e\x3e\x59\
-\xb8\x00\x02\x10\xb9\x00\x01\x00\x0b\xf4\xba\x00\x18\x00\x02\x00\
-\x1a\x11\x12\x39\xb8\x00\x18\x2f\x41\x03\x00\x8f\x00\x18\x00\x01\
-\x5d\x41\x03\x00\xbf\x00\x18\x00\x01\x5d\xb9\x00\x04\x00\x0b\xf4\
-\xba\x00\x0b\x00\x04\x00\x18\x11\x12\x39\xb8\x00\x13\x10\xb9\x00\
-\x10\x00\x0b\xf4\x30\x31\x13\x23\x35\x33\x11\x33\x13\x33\x03\x0e\
-\x01\x07\x15\x1e\x01\x1f\x01\x33\x15\x23\x22\x26\x2f\x01\x23\x11\
-\x23\xa2\xa0\xf4\x65\x88\x59\x79\x11\x1d\x15\x16\x1d\x11\x52\x41\
-\x3f\x1d\x2f\x12\x5f\x65\x54\x02\x71\x49\xfe\xcc\x01\x34\xfe\xf1\
-\x24\x1d\x05\x05\x05\x1f\x28\xcb\x49\x25\x2d\xec\xfe\xc2\x00\x00\
-\x02\xff\xfe\x00\x00\x02\x56\x02\xba\x00\x1d\x00\x27\x00\x7a\xba\
-\x00\x1d\x00\x28\x00\x29\x11\x12\x39\xb8\x00\x1d\x10\xb8\x00\x27\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\
-\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\
-\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x1d\x2f\x1b\xb9\x00\
-\x1d\x00\x0e\x3e\x59\xb8\x00\x13\x10\xb9\x00\x01\x00\x0b\xf4\xb8\
-\x00\x0b\x10\xb9\x00\x0c\x00\x0b\xf4\xb8\x00\x1d\x10\xb9\x00\x27\
-\x00\x0b\xf4\xba\x00\x15\x00\x27\x00\x13\x11\x12\x39\xb8\x00\x15\
-\x2f\xb9\x00\x26\x00\x0b\xf4\x30\x31\x01\x23\x15\x14\x0e\x02\x07\
-\x0e\x01\x2b\x01\x35\x33\x3e\x03\x3d\x01\x21\x11\x33\x32\x16\x15\
-\x14\x06\x2b\x01\x37\x32\x36\x3d\x01\x34\x26\x2b\x01\x11\x01\x31\
-\x70\x09\x12\x1d\x13\x17\x32\x24\x0b\x2f\x13\x1a\x10\x07\x01\x12\
-\x10\x5e\x65\x65\x5e\x62\x62\x32\x3a\x3a\x32\x10\x02\x71\x58\x85\
-\xae\x6e\x3d\x13\x17\x11\x49\x13\x34\x64\xa6\x85\x9b\xfe\xe8\x6c\
-\x65\x65\x6c\x49\x35\x39\x34\x39\x35\xfe\xf0\x00\x01\x00\x50\xff\
-\x6a\x02\x3e\x02\xba\x00\x0f\x00\xb1\xba\x00\x01\x00\x10\x00\x11\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\
-\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\
-\x00\x0a\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\
-\xb9\x00\x05\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\
-\x1b\xb9\x00\x01\x00\x0e\x3e\x59\xba\x00\x03\x00\x05\x00\x06\x11\
-\x12\x39\xb8\x00\x03\x2f\x41\x03\x00\x8f\x00\x03\x00\x01\x5d\x41\
-\x03\x00\xbf\x00\x03\x00\x01\x5d\xb9\x00\x08\x00\x0b\xf4\xb8\x00\
-\x01\x10\xb9\x00\x0c\x00\x0b\xf4\xb8\x00\x01\x10\xb8\x00\x0f\xdc\
-\x41\x03\x00\x8f\x00\x0f\x00\x01\x5d\x41\x03\x00\xff\x00\x0f\x00\
-\x01\x5d\x41\x03\x00\x1f\x00\x0f\x00\x01\x5d\x41\x05\x00\x5f\x00\
-\x0f\x00\x6f\x00\x0f\x00\x02\x71\x30\x31\x21\x23\x11\x23\x11\x23\
-\x11\x33\x11\x33\x11\x33\x11\x33\x15\x23\x01\xf1\x52\xfb\x54\x54\
-\xfb\x54\x4b\x4d\x01\x3d\xfe\xc3\x02\xba\xfe\xcc\x01\x34\xfd\x8f\
-\xdf\x00\x00\x00\x02\x00\x30\x00\x00\x02\x56\x02\xba\x00\x12\x00\
-\x1c\x00\x9d\xba\x00\x12\x00\x1d\x00\x1e\x11\x12\x39\xb8\x00\x12\
-\x10\xb8\x00\x1c\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\
-\xb9\x00\x04\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\
-\x1b\xb9\x00\x08\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x03\
-\x2f\x1b\xb9\x00\x03\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x12\x2f\x1b\xb9\x00\x12\x00\x0e\x3e\x59\xba\x00\x01\x00\x03\x00\
-\x04\x11\x12\x39\xb8\x00\x01\x2f\x41\x03\x00\xbf\x00\x01\x00\x01\
-\x5d\x41\x03\x00\x8f\x00\x01\x00\x01\x5d\xb9\x00\x06\x00\x0b\xf4\
-\xb8\x00\x12\x10\xb9\x00\x1c\x00\x0b\xf4\xba\x00\x0a\x00\x1c\x00\
-\x08\x11\x12\x39\xb8\x00\x0a\x2f\xb9\x00\x1b\x00\x0b\xf4\x30\x31\
-\x01\x23\x11\x23\x11\x33\x11\x33\x11\x33\x11\x33\x32\x16\x15\x14\
-\x06\x2b\x01\x37\x32\x36\x3d\x01\x34\x26\x2b\x01\x11\x01\x1d\x9b\
-\x52\x52\x9b\x52\x24\x5e\x65\x65\x5e\x76\x76\x32\x3a\x3a\x32\x24\
-\x01\x3d\xfe\xc3\x02\xba\xfe\xcc\x01\x34\xfe\xe8\x6c\x65\x65\x6c\
-\x49\x35\x39\x34\x39\x35\xfe\xf0\x00\x00\x00\x00\x01\x00\x31\x00\
-\x00\x02\x4a\x02\xba\x00\x0d\x00\x81\xba\x00\x09\x00\x0e\x00\x0f\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\
-\x04\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\
-\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\
-\xb9\x00\x0d\x00\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\
-\x1b\xb9\x00\x09\x00\x0e\x3e\x59\xba\x00\x0b\x00\x0d\x00\x00\x11\
-\x12\x39\xb8\x00\x0b\x2f\x41\x03\x00\x8f\x00\x0b\x00\x01\x5d\x41\
-\x03\x00\xbf\x00\x0b\x00\x01\x5d\xb9\x00\x02\x00\x0b\xf4\xb8\x00\
-\x04\x10\xb9\x00\x07\x00\x0b\xf4\x30\x31\x13\x33\x11\x33\x11\x21\
-\x15\x23\x11\x23\x11\x23\x11\x23\x31\x54\xb6\x01\x0f\xbb\x54\xb6\
-\x54\x02\xba\xfe\xcc\x01\x34\x49\xfd\x8f\x01\x3d\xfe\xc3\x00\xff\
-\xff\x00\x38\xff\xf4\x02\x20\x03\x7e\x02\x26\x00\x2f\x00\x00\x00\
-\x06\x03\x3a\x00\x00\x00\x00\x00\x03\x00\x38\xff\xf4\x02\x20\x02\
-\xc6\x00\x13\x00\x20\x00\x2d\x00\x5f\xba\x00\x00\x00\x2e\x00\x2f\
-\x11\x12\x39\xb8\x00\x14\xd0\xb8\x00\x00\x10\xb8\x00\x28\xd0\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb9\x00\x14\x00\x0b\xf4\xba\x00\x21\x00\x14\x00\x0a\x11\
-\x12\x39\xb8\x00\x21\x2f\xb9\x00\x1b\x00\x0b\xf4\xb8\x00\x0a\x10\
-\xb9\x00\x28\x00\x0b\xf4\x30\x31\x05\x22\x2e\x02\x35\x34\x3e\x02\
-\x33\x32\x1e\x02\x15\x14\x0e\x02\x27\x32\x3e\x02\x3d\x01\x21\x15\
-\x14\x1e\x02\x03\x21\x35\x34\x2e\x02\x23\x22\x0e\x02\x15\x01\x2c\
-\x40\x5c\x3c\x1c\x1c\x3c\x5c\x40\x40\x5c\x3c\x1c\x1c\x3c\x5c\x40\
-\x2a\x3a\x26\x11\xfe\xca\x11\x26\x3a\x71\x01\x36\x11\x26\x3a\x2a\
-\x2a\x3a\x26\x11\x0c\x31\x5c\x86\x56\x55\x87\x5c\x31\x31\x5c\x87\
-\x55\x56\x86\x5c\x31\x49\x21\x3c\x55\x35\x19\x19\x35\x55\x3c\x21\
-\x01\x49\x10\x34\x56\x3c\x21\x21\x3c\x56\x34\xff\xff\x00\x38\xff\
-\xf4\x02\x20\x02\xc6\x02\x06\x02\x98\x00\x00\x00\x01\x00\x46\xff\
-\x6a\x02\x1a\x02\xc6\x00\x25\x00\x53\xba\x00\x00\x00\x26\x00\x27\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\
-\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\
-\x00\x00\x00\x0e\x3e\x59\xb8\x00\x06\x10\xb9\x00\x11\x00\x0b\xf4\
-\xb8\x00\x00\x10\xb9\x00\x18\x00\x0b\xf4\xb8\x00\x00\x10\xb8\x00\
-\x23\xd0\xb8\x00\x00\x10\xb8\x00\x25\xdc\x30\x31\x05\x2e\x01\x35\
-\x34\x36\x33\x32\x1e\x02\x17\x07\x2e\x03\x23\x22\x06\x1d\x01\x14\
-\x16\x33\x32\x3e\x02\x37\x17\x0e\x03\x07\x15\x23\x01\x1c\x6d\x69\
-\x7d\x80\x30\x46\x32\x22\x0d\x48\x09\x18\x21\x2d\x20\x53\x51\x51\
-\x53\x20\x2d\x21\x18\x09\x48\x0c\x1d\x2a\x38\x26\x4d\x09\x0e\xb7\
-\xa1\xaf\xba\x1a\x2c\x37\x1c\x21\x17\x29\x1f\x12\x7e\x69\x72\x69\
-\x7e\x12\x1f\x29\x17\x21\x1a\x31\x29\x1d\x05\x8d\x00\x00\x00\xff\
-\xff\x00\x2c\x00\x00\x02\x32\x03\x6b\x02\x26\x02\x38\x00\x00\x00\
-\x06\x03\x38\x00\x00\x00\x00\xff\xff\x00\x2c\x00\x00\x02\x32\x03\
-\x7e\x02\x26\x02\x38\x00\x00\x00\x06\x03\x3a\x00\x00\x00\x00\xff\
-\xff\x00\x2c\x00\x00\x02\x32\x03\xb4\x02\x26\x02\x38\x00\x00\x00\
-\x06\x03\x3b\x00\x00\x00\x00\xff\xff\x00\x2c\x00\x00\x02\x32\x03\
-\xaa\x02\x26\x02\x38\x00\x00\x00\x06\x03\x41\x00\x00\x00\x00\xff\
-\xff\x00\x11\x00\x00\x02\x47\x02\xba\x02\x06\x00\x39\x00\x00\x00\
-\x01\x00\x11\x00\x00\x02\x47\x02\xba\x00\x11\x00\x68\xba\x00\x04\
-\x00\x12\x00\x13\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x01\
-\x2f\x1b\xb9\x00\x01\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x07\x2f\x1b\xb9\x00\x07\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\
-\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\x0e\x3e\x59\xba\x00\x00\x00\x01\
-\x00\x0e\x11\x12\x39\xb8\x00\x00\x2f\xb8\x00\x04\xd0\xb8\x00\x00\
-\x10\xb8\x00\x09\xd0\xb8\x00\x00\x10\xb9\x00\x0f\x00\x08\xf4\xb8\
-\x00\x0c\xd0\x30\x31\x01\x03\x33\x1f\x01\x33\x3f\x01\x33\x03\x33\
-\x15\x23\x15\x23\x35\x23\x35\x01\x02\xf1\x60\x64\x55\x04\x57\x64\
-\x5e\xf1\x95\x95\x54\x95\x01\x12\x01\xa8\xb6\x9f\x9f\xb6\xfe\x58\
-\x40\xd2\xd2\x40\x00\x00\x00\x00\x01\x00\x14\xff\x6a\x02\x5d\x02\
-\xba\x00\x15\x00\xb1\xba\x00\x0d\x00\x16\x00\x17\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x1c\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\
-\x0e\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\
-\x00\x0e\x3e\x59\xba\x00\x04\x00\x0f\x00\x01\x11\x12\x39\xba\x00\
-\x0c\x00\x09\x00\x07\x11\x12\x39\xba\x00\x08\x00\x0c\x00\x03\x11\
-\x12\x39\xb8\x00\x08\x10\xb8\x00\x11\xd0\xb8\x00\x01\x10\xb9\x00\
-\x12\x00\x0b\xf4\xb8\x00\x01\x10\xb8\x00\x15\xdc\x41\x03\x00\x8f\
-\x00\x15\x00\x01\x5d\x41\x03\x00\xff\x00\x15\x00\x01\x5d\x41\x03\
-\x00\x1f\x00\x15\x00\x01\x5d\x41\x05\x00\x5f\x00\x15\x00\x6f\x00\
-\x15\x00\x02\x71\x30\x31\x21\x23\x2f\x01\x23\x0f\x01\x23\x13\x03\
-\x33\x1f\x01\x33\x3f\x01\x33\x03\x13\x33\x15\x23\x02\x10\x36\x54\
-\x5c\x04\x5f\x57\x5c\xe4\xd7\x5f\x51\x57\x04\x56\x54\x5c\xd8\xb2\
-\x51\x4d\x8d\x98\x98\x8d\x01\x64\x01\x56\x87\x8d\x8d\x87\xfe\xab\
-\xfe\xe4\xdf\xff\xff\x00\x3c\x00\x00\x02\x00\x03\x7e\x02\x26\x02\
-\x3c\x00\x00\x00\x06\x03\x3a\xf3\x00\x00\x00\x00\x01\x00\x35\xff\
-\x6a\x02\x3e\x02\xba\x00\x1c\x00\xa1\xba\x00\x13\x00\x1d\x00\x1e\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\
-\x0c\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x17\x2f\x1b\xb9\
-\x00\x17\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\
-\xb9\x00\x01\x00\x0e\x3e\x59\xba\x00\x13\x00\x0c\x00\x01\x11\x12\
-\x39\xb8\x00\x13\x2f\x41\x03\x00\xb0\x00\x13\x00\x01\x5d\xb9\x00\
-\x06\x00\x0b\xf4\xba\x00\x02\x00\x06\x00\x13\x11\x12\x39\xb8\x00\
-\x01\x10\xb9\x00\x19\x00\x0b\xf4\xb8\x00\x01\x10\xb8\x00\x1c\xdc\
-\x41\x03\x00\x8f\x00\x1c\x00\x01\x5d\x41\x03\x00\xff\x00\x1c\x00\
-\x01\x5d\x41\x03\x00\x1f\x00\x1c\x00\x01\x5d\x41\x05\x00\x5f\x00\
-\x1c\x00\x6f\x00\x1c\x00\x02\x71\x30\x31\x21\x23\x11\x23\x0e\x01\
-\x23\x22\x2e\x02\x3d\x01\x33\x15\x14\x1e\x02\x33\x32\x36\x37\x11\
-\x33\x11\x33\x15\x23\x01\xf1\x52\x05\x18\x44\x2d\x3d\x54\x34\x17\
-\x54\x0e\x21\x35\x27\x30\x3e\x1d\x54\x4b\x4d\x01\x13\x0b\x0c\x1e\
-\x3e\x5d\x3f\xc6\xc6\x30\x43\x29\x13\x0c\x0c\x01\x5d\xfd\x8f\xdf\
-\x00\x00\x00\x00\x01\x00\x3c\x00\x00\x02\x00\x02\xba\x00\x1c\x00\
-\x87\xba\x00\x1b\x00\x1d\x00\x1e\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x12\x2f\x1b\xb9\x00\x12\x00\x1c\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x15\x2f\x1b\xb9\x00\x15\x00\x0e\x3e\x59\xba\
-\x00\x0b\x00\x06\x00\x15\x11\x12\x39\xb8\x00\x0b\x2f\x41\x03\x00\
-\xb0\x00\x0b\x00\x01\x5d\xb9\x00\x00\x00\x0b\xf4\xb8\x00\x0b\x10\
-\xb8\x00\x0c\xdc\xb8\x00\x0b\x10\xb8\x00\x0e\xd0\xba\x00\x16\x00\
-\x0b\x00\x00\x11\x12\x39\xb8\x00\x00\x10\xb8\x00\x1a\xd0\xb8\x00\
-\x00\x10\xb8\x00\x1c\xdc\x30\x31\x25\x2e\x03\x3d\x01\x33\x15\x14\
-\x16\x17\x35\x33\x15\x3e\x01\x37\x11\x33\x11\x23\x11\x23\x0e\x01\
-\x07\x15\x23\x01\x00\x36\x4b\x2f\x14\x54\x31\x3f\x42\x1f\x32\x19\
-\x54\x54\x05\x15\x33\x1d\x42\xfd\x03\x21\x3e\x59\x3c\xc6\xc6\x56\
-\x51\x07\xa8\xa8\x02\x0b\x0a\x01\x5d\xfd\x46\x01\x13\x08\x0c\x02\
-\x8b\x00\x00\xff\xff\x00\x30\x00\x00\x02\x28\x03\x7e\x02\x26\x02\
-\x40\x00\x00\x00\x06\x03\x3a\x00\x00\x00\x00\xff\xff\x00\x2d\xff\
-\xf4\x02\x1e\x02\xc6\x02\x06\x00\x33\x00\x00\x00\x01\x00\x53\xff\
-\x6a\x02\x05\x02\xba\x00\x0b\x00\x7e\xba\x00\x00\x00\x0c\x00\x0d\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x02\x2f\x1b\xb9\x00\
-\x02\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\
-\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\
-\xb9\x00\x01\x00\x0e\x3e\x59\xb9\x00\x04\x00\x0b\xf4\xb8\x00\x01\
-\x10\xb8\x00\x09\xd0\xb8\x00\x01\x10\xb8\x00\x0b\xdc\x41\x03\x00\
-\x8f\x00\x0b\x00\x01\x5d\x41\x03\x00\xff\x00\x0b\x00\x01\x5d\x41\
-\x03\x00\x1f\x00\x0b\x00\x01\x5d\x41\x05\x00\x5f\x00\x0b\x00\x6f\
-\x00\x0b\x00\x02\x71\x30\x31\x21\x23\x11\x33\x11\x21\x11\x33\x11\
-\x23\x15\x23\x01\x06\xb3\x54\x01\x0a\x54\xb2\x4d\x02\xba\xfd\x8f\
-\x02\x71\xfd\x46\x96\x00\x00\xff\xff\x00\x54\x00\x00\x02\x04\x02\
-\xba\x02\x06\x00\x29\x00\x00\xff\xff\x00\x54\x00\x00\x02\x04\x03\
-\x7e\x02\x26\x00\x29\x00\x00\x00\x06\x03\x3a\x00\x00\x00\x00\xff\
-\xff\x00\x4a\xff\xf4\x01\xe0\x02\xba\x02\x06\x00\x2a\x00\x00\x00\
-\x01\x00\x0a\xff\x5c\x02\x28\x02\xba\x00\x1d\x00\x8d\xba\x00\x12\
-\x00\x1e\x00\x1f\x11\x12\x39\x00\xb8\x00\x1d\x2f\xb8\x00\x00\x45\
-\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x0e\x3e\x59\x41\x03\
-\x00\x00\x00\x1d\x00\x01\x5d\xb8\x00\x1d\x10\xb9\x00\x00\x00\x0b\
-\xf4\xba\x00\x15\x00\x0d\x00\x0a\x11\x12\x39\xb8\x00\x15\x2f\x41\
-\x03\x00\xb0\x00\x15\x00\x01\x5d\x41\x03\x00\x40\x00\x15\x00\x01\
-\x5d\x41\x03\x00\x80\x00\x15\x00\x01\x5d\xb9\x00\x05\x00\x0b\xf4\
-\xb8\x00\x0d\x10\xb9\x00\x0c\x00\x0b\xf4\xb8\x00\x10\xd0\xba\x00\
-\x11\x00\x15\x00\x05\x11\x12\x39\x30\x31\x17\x33\x11\x34\x26\x23\
-\x22\x06\x07\x11\x23\x11\x23\x35\x21\x15\x23\x15\x33\x3e\x01\x33\
-\x32\x16\x15\x11\x14\x06\x2b\x01\xfe\xd6\x32\x39\x1d\x39\x15\x54\
-\xa0\x01\x94\xa0\x05\x17\x38\x1a\x65\x57\x37\x3b\xb8\x5b\x01\x41\
-\x45\x42\x0b\x09\xfe\xa7\x02\x71\x49\x49\xce\x08\x0b\x6d\x63\xfe\
-\xec\x34\x42\x00\x01\x00\x0a\x00\x00\x02\x28\x02\xba\x00\x18\x00\
-\x87\xba\x00\x07\x00\x19\x00\x1a\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x02\x2f\x1b\xb9\x00\x02\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x18\x2f\x1b\xb9\x00\x18\x00\x0e\x3e\x59\xb8\x00\
-\x00\x45\x58\xb8\x00\x0f\x2f\x1b\xb9\x00\x0f\x00\x0e\x3e\x59\xb8\
-\x00\x02\x10\xb9\x00\x01\x00\x0b\xf4\xb8\x00\x05\xd0\xba\x00\x0a\
-\x00\x02\x00\x18\x11\x12\x39\xb8\x00\x0a\x2f\x41\x03\x00\x80\x00\
-\x0a\x00\x01\x5d\x41\x03\x00\x40\x00\x0a\x00\x01\x5d\x41\x03\x00\
-\xb0\x00\x0a\x00\x01\x5d\xb9\x00\x13\x00\x0b\xf4\xba\x00\x06\x00\
-\x0a\x00\x13\x11\x12\x39\x30\x31\x13\x23\x35\x21\x15\x23\x15\x33\
-\x3e\x01\x33\x32\x16\x1d\x01\x23\x35\x34\x26\x23\x22\x06\x07\x11\
-\x23\xaa\xa0\x01\x94\xa0\x05\x17\x38\x1a\x65\x57\x54\x32\x39\x1d\
-\x39\x15\x54\x02\x71\x49\x49\xce\x08\x0b\x6d\x63\xe6\xe6\x45\x42\
-\x0b\x09\xfe\xa7\x00\x00\x00\x00\x01\x00\x58\x00\x00\x02\x1c\x02\
-\xba\x00\x18\x00\x7d\xba\x00\x13\x00\x19\x00\x1a\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\xb9\x00\x18\x00\x0e\
-\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\
-\x0e\x3e\x59\xba\x00\x06\x00\x00\x00\x18\x11\x12\x39\xb8\x00\x06\
-\x2f\x41\x05\x00\xb0\x00\x06\x00\xc0\x00\x06\x00\x02\x5d\x41\x03\
-\x00\x80\x00\x06\x00\x01\x5d\x41\x03\x00\x40\x00\x06\x00\x01\x5d\
-\xb9\x00\x13\x00\x0b\xf4\xba\x00\x02\x00\x06\x00\x13\x11\x12\x39\
-\x30\x31\x13\x33\x11\x33\x3e\x01\x33\x32\x1e\x02\x1d\x01\x23\x35\
-\x34\x2e\x02\x23\x22\x06\x07\x11\x23\x58\x54\x05\x1b\x47\x2a\x3e\
-\x55\x35\x17\x54\x0e\x21\x37\x28\x2d\x41\x20\x54\x02\xba\xfe\xed\
-\x0b\x0c\x1e\x3e\x5d\x3f\xc6\xc6\x30\x43\x29\x13\x0c\x0c\xfe\xa3\
-\x00\x00\x00\xff\xff\x00\x38\xff\xf4\x02\x20\x02\xc6\x02\x06\x01\
-\x97\x00\x00\x00\x03\x00\x9b\x01\x43\x01\xbd\x02\xc0\x00\x0b\x00\
-\x19\x00\x27\x00\x5f\xba\x00\x00\x00\x28\x00\x29\x11\x12\x39\xb8\
-\x00\x0c\xd0\xb8\x00\x00\x10\xb8\x00\x1a\xd0\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x12\x3e\x59\xb9\x00\
-\x0c\x00\x03\xf4\xb8\x00\x06\x10\xb9\x00\x13\x00\x03\xf4\xba\x00\
-\x1a\x00\x06\x00\x00\x11\x12\x39\xb8\x00\x1a\x2f\xb9\x00\x21\x00\
-\x03\xf4\x30\x31\x01\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\
-\x27\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x37\x22\
-\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x01\x2c\x4b\x46\
-\x46\x4b\x4b\x46\x46\x4b\x2b\x23\x23\x2b\x2b\x23\x23\x2b\x11\x0c\
-\x0c\x11\x11\x0c\x0c\x01\x43\x63\x5c\x5b\x63\x63\x5b\x5c\x63\x33\
-\x3a\x31\x41\x31\x3a\x3a\x31\x41\x31\x3a\x6e\x0e\x0a\x0b\x0a\x0e\
-\x0e\x0a\x0b\x0a\x0e\x00\x00\x00\x01\x00\x9a\x01\x49\x01\xbe\x02\
-\xba\x00\x0a\x00\x5b\xba\x00\x02\x00\x0b\x00\x0c\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x12\
-\x3e\x59\xb9\x00\x01\x00\x03\xf4\xb8\x00\x07\x10\xb9\x00\x03\x00\
-\x03\xf4\xba\x00\x04\x00\x03\x00\x00\x11\x12\x39\xb8\x00\x04\x10\
-\xb9\x00\x05\x00\x03\xf4\xb8\x00\x01\x10\xb8\x00\x08\xd0\x30\x31\
-\x13\x35\x33\x11\x07\x27\x37\x33\x11\x33\x15\xb0\x6d\x6a\x19\x7e\
-\x44\x62\x01\x49\x32\x01\x09\x37\x2c\x41\xfe\xc1\x32\x00\x00\x00\
-\x01\x00\xa1\x01\x49\x01\xb6\x02\xc0\x00\x1b\x00\x57\xba\x00\x13\
-\x00\x1c\x00\x1d\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x13\
-\x2f\x1b\xb9\x00\x13\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x01\x2f\x1b\xb9\x00\x01\x00\x12\x3e\x59\xb9\x00\x1a\x00\x03\xf4\
-\xb8\x00\x02\xd0\xba\x00\x03\x00\x13\x00\x1a\x11\x12\x39\xb8\x00\
-\x13\x10\xb9\x00\x0a\x00\x03\xf4\xba\x00\x19\x00\x0a\x00\x01\x11\
-\x12\x39\x30\x31\x01\x21\x35\x37\x3e\x01\x3d\x01\x34\x26\x23\x22\
-\x06\x07\x27\x3e\x03\x33\x32\x16\x15\x14\x06\x0f\x01\x33\x01\xb6\
-\xfe\xf0\x82\x1d\x21\x21\x20\x23\x23\x08\x36\x06\x15\x21\x2e\x1e\
-\x3e\x42\x35\x2a\x61\xcd\x01\x49\x39\x69\x18\x2f\x1b\x06\x1a\x1f\
-\x22\x18\x14\x12\x20\x19\x0f\x3d\x30\x2c\x41\x20\x4b\x00\x00\x00\
-\x01\x00\x97\x01\x43\x01\xae\x02\xc0\x00\x2a\x00\x6e\xba\x00\x0e\
-\x00\x2b\x00\x2c\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0e\
-\x2f\x1b\xb9\x00\x0e\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x1b\x2f\x1b\xb9\x00\x1b\x00\x12\x3e\x59\xba\x00\x28\x00\x0e\x00\
-\x1b\x11\x12\x39\xb8\x00\x28\x2f\x41\x05\x00\x40\x00\x28\x00\x50\
-\x00\x28\x00\x02\x72\xb9\x00\x00\x00\x03\xf4\xb8\x00\x0e\x10\xb9\
-\x00\x07\x00\x03\xf4\xba\x00\x15\x00\x00\x00\x28\x11\x12\x39\xb8\
-\x00\x1b\x10\xb9\x00\x22\x00\x03\xf4\x30\x31\x01\x32\x36\x3d\x01\
-\x34\x26\x23\x22\x06\x07\x27\x3e\x01\x33\x32\x16\x15\x14\x06\x07\
-\x15\x1e\x01\x15\x14\x06\x23\x22\x26\x27\x37\x1e\x01\x33\x32\x36\
-\x3d\x01\x34\x2b\x01\x35\x01\x1a\x26\x25\x23\x1e\x1d\x28\x0e\x2b\
-\x11\x3d\x32\x39\x49\x2e\x20\x22\x32\x4d\x42\x37\x3e\x13\x2f\x0e\
-\x28\x23\x26\x27\x4d\x2d\x02\x22\x1d\x17\x04\x19\x1b\x18\x15\x22\
-\x19\x24\x32\x2d\x24\x2a\x07\x03\x06\x2c\x28\x31\x3b\x28\x1a\x22\
-\x16\x1c\x20\x1d\x06\x37\x33\x00\x02\x00\x93\x01\x49\x01\xc4\x02\
-\xba\x00\x0a\x00\x0e\x00\x6b\xba\x00\x04\x00\x0f\x00\x10\x11\x12\
-\x39\xb8\x00\x04\x10\xb8\x00\x0c\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x12\x3e\x59\xba\x00\x02\x00\
-\x00\x00\x04\x11\x12\x39\xb8\x00\x02\x2f\xb9\x00\x0d\x00\x03\xf4\
-\xba\x00\x03\x00\x0d\x00\x04\x11\x12\x39\xb8\x00\x06\xd0\xb8\x00\
-\x02\x10\xb8\x00\x09\xd0\xb8\x00\x04\x10\xb9\x00\x0b\x00\x03\xf4\
-\x30\x31\x01\x35\x23\x35\x37\x33\x15\x33\x15\x23\x15\x03\x23\x07\
-\x33\x01\x50\xbd\xa4\x55\x38\x38\x3c\x04\x82\x86\x01\x49\x48\x34\
-\xf5\xf9\x30\x48\x01\x38\xc0\x00\x01\x00\xa0\x01\x43\x01\xb3\x02\
-\xba\x00\x20\x00\x57\xba\x00\x13\x00\x21\x00\x22\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x1f\x2f\x1b\xb9\x00\x1f\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\x0c\x00\x12\
-\x3e\x59\xb8\x00\x1f\x10\xb9\x00\x01\x00\x03\xf4\xb8\x00\x0c\x10\
-\xb9\x00\x13\x00\x03\xf4\xba\x00\x06\x00\x1f\x00\x13\x11\x12\x39\
-\xb8\x00\x06\x2f\xb9\x00\x1a\x00\x03\xf4\x30\x31\x01\x23\x07\x33\
-\x3e\x01\x33\x32\x16\x15\x14\x06\x23\x22\x26\x27\x37\x1e\x01\x33\
-\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x07\x27\x37\x33\x01\x9f\xb3\
-\x0b\x04\x0e\x24\x22\x34\x46\x4b\x44\x35\x3d\x12\x2d\x0f\x26\x23\
-\x26\x26\x26\x26\x1a\x1f\x0b\x34\x0e\xe4\x02\x88\x85\x16\x1b\x3d\
-\x36\x38\x46\x28\x1a\x22\x16\x1c\x24\x20\x05\x20\x24\x12\x0b\x07\
-\xce\x00\x00\x00\x02\x00\xa1\x01\x43\x01\xbb\x02\xba\x00\x17\x00\
-\x25\x00\x57\xba\x00\x00\x00\x26\x00\x27\x11\x12\x39\xb8\x00\x18\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\
-\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\
-\x00\x12\x3e\x59\xb9\x00\x18\x00\x03\xf4\xba\x00\x12\x00\x08\x00\
-\x18\x11\x12\x39\xb8\x00\x12\x2f\xb9\x00\x1f\x00\x03\xf4\xba\x00\
-\x0f\x00\x1f\x00\x18\x11\x12\x39\x30\x31\x01\x22\x26\x35\x34\x3e\
-\x02\x37\x33\x0e\x03\x07\x17\x3e\x01\x33\x32\x16\x15\x14\x06\x27\
-\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x01\x2e\x43\
-\x4a\x1a\x2a\x33\x19\x54\x23\x36\x28\x1b\x07\x04\x0d\x2b\x26\x33\
-\x44\x4d\x40\x23\x29\x29\x23\x23\x29\x29\x01\x43\x4d\x43\x28\x46\
-\x3b\x2f\x0f\x17\x2a\x2c\x31\x1e\x01\x15\x20\x3d\x35\x38\x45\x30\
-\x22\x23\x05\x23\x22\x22\x23\x05\x23\x22\x00\x00\x01\x00\xa4\x01\
-\x49\x01\xb4\x02\xba\x00\x08\x00\x3d\xba\x00\x08\x00\x09\x00\x0a\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\
-\x05\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\
-\x00\x00\x00\x12\x3e\x59\xb8\x00\x05\x10\xb9\x00\x02\x00\x03\xf4\
-\xb8\x00\x04\xdc\x30\x31\x1b\x01\x23\x15\x23\x35\x21\x15\x03\xe1\
-\x94\x9b\x36\x01\x10\x90\x01\x49\x01\x3f\x44\x76\x34\xfe\xc3\x00\
-\x03\x00\x9c\x01\x43\x01\xbc\x02\xc0\x00\x19\x00\x23\x00\x31\x00\
-\x73\xba\x00\x00\x00\x32\x00\x33\x11\x12\x39\xb8\x00\x1a\xd0\xb8\
-\x00\x00\x10\xb8\x00\x24\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0d\
-\x2f\x1b\xb9\x00\x0d\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x00\x2f\x1b\xb9\x00\x00\x00\x12\x3e\x59\xb9\x00\x24\x00\x03\xf4\
-\xba\x00\x1a\x00\x0d\x00\x24\x11\x12\x39\xb8\x00\x1a\x2f\xb9\x00\
-\x2b\x00\x03\xf4\xba\x00\x07\x00\x1a\x00\x2b\x11\x12\x39\xba\x00\
-\x13\x00\x1a\x00\x2b\x11\x12\x39\xb8\x00\x0d\x10\xb9\x00\x1f\x00\
-\x03\xf4\x30\x31\x01\x22\x26\x35\x34\x36\x37\x35\x2e\x01\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\x07\x15\x1e\x01\x15\x14\x06\x27\x32\
-\x3d\x01\x34\x23\x22\x1d\x01\x14\x17\x32\x36\x3d\x01\x34\x26\x23\
-\x22\x06\x1d\x01\x14\x16\x01\x2c\x46\x4a\x2d\x23\x1e\x25\x44\x3f\
-\x3f\x44\x25\x1e\x24\x2c\x4a\x46\x45\x45\x45\x45\x26\x27\x27\x26\
-\x26\x27\x27\x01\x43\x3d\x2e\x24\x2d\x09\x04\x0a\x2b\x20\x2b\x34\
-\x34\x2b\x20\x2b\x0a\x04\x09\x2d\x24\x2e\x3d\xdc\x34\x09\x34\x34\
-\x09\x34\xac\x1e\x1b\x0c\x1b\x1e\x1e\x1b\x0c\x1b\x1e\x00\x00\x00\
-\x02\x00\x9d\x01\x49\x01\xb6\x02\xc0\x00\x17\x00\x25\x00\x5f\xba\
-\x00\x15\x00\x26\x00\x27\x11\x12\x39\xb8\x00\x15\x10\xb8\x00\x18\
-\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x15\x2f\x1b\xb9\x00\x15\x00\
-\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\
-\x00\x12\x3e\x59\xb8\x00\x15\x10\xb9\x00\x1f\x00\x03\xf4\xba\x00\
-\x0f\x00\x06\x00\x1f\x11\x12\x39\xb8\x00\x0f\x2f\xb9\x00\x18\x00\
-\x03\xf4\xba\x00\x0c\x00\x18\x00\x1f\x11\x12\x39\x30\x31\x01\x14\
-\x0e\x02\x07\x23\x3e\x03\x37\x27\x0e\x01\x23\x22\x26\x35\x34\x36\
-\x33\x32\x16\x07\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\
-\x16\x01\xb6\x1a\x29\x33\x19\x54\x22\x36\x28\x1b\x07\x04\x0c\x2b\
-\x26\x34\x43\x4c\x41\x42\x4a\x8d\x23\x29\x29\x23\x23\x29\x29\x02\
-\x30\x28\x46\x3b\x2f\x0f\x17\x2a\x2c\x31\x1e\x01\x16\x20\x3e\x35\
-\x38\x45\x4d\x73\x22\x23\x06\x23\x22\x22\x23\x06\x23\x22\x00\x00\
-\x03\x00\x9b\xff\xfa\x01\xbd\x01\x77\x00\x0b\x00\x19\x00\x27\x00\
-\x5f\xba\x00\x00\x00\x28\x00\x29\x11\x12\x39\xb8\x00\x0c\xd0\xb8\
-\x00\x00\x10\xb8\x00\x1a\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\
-\x2f\x1b\xb9\x00\x06\x00\x18\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\x0c\x00\x03\xf4\
-\xb8\x00\x06\x10\xb9\x00\x13\x00\x03\xf4\xba\x00\x1a\x00\x00\x00\
-\x06\x11\x12\x39\xb8\x00\x1a\x2f\xb9\x00\x21\x00\x03\xf4\x30\x31\
-\x05\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x27\x32\x36\x3d\
-\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x37\x22\x26\x3d\x01\x34\
-\x36\x33\x32\x16\x1d\x01\x14\x06\x01\x2c\x4b\x46\x46\x4b\x4b\x46\
-\x46\x4b\x2b\x23\x23\x2b\x2b\x23\x23\x2b\x11\x0c\x0c\x11\x11\x0c\
-\x0c\x06\x63\x5c\x5b\x63\x63\x5b\x5c\x63\x33\x3a\x31\x41\x31\x3a\
-\x3a\x31\x41\x31\x3a\x6e\x0e\x0a\x0b\x0a\x0e\x0e\x0a\x0b\x0a\x0e\
-\x00\x00\x00\x00\x01\x00\x9a\x00\x00\x01\xbe\x01\x71\x00\x0a\x00\
-\x5b\xba\x00\x02\x00\x0b\x00\x0c\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x18\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\
-\x01\x00\x03\xf4\xb8\x00\x07\x10\xb9\x00\x03\x00\x03\xf4\xba\x00\
-\x04\x00\x03\x00\x00\x11\x12\x39\xb8\x00\x04\x10\xb9\x00\x05\x00\
-\x03\xf4\xb8\x00\x01\x10\xb8\x00\x08\xd0\x30\x31\x33\x35\x33\x11\
-\x07\x27\x37\x33\x11\x33\x15\xb0\x6d\x6a\x19\x7e\x44\x62\x32\x01\
-\x09\x37\x2c\x41\xfe\xc1\x32\x00\x01\x00\xa1\x00\x00\x01\xb6\x01\
-\x77\x00\x1b\x00\x57\xba\x00\x13\x00\x1c\x00\x1d\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\x18\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x01\x2f\x1b\xb9\x00\x01\x00\x0e\
-\x3e\x59\xb9\x00\x1a\x00\x03\xf4\xb8\x00\x02\xd0\xba\x00\x03\x00\
-\x13\x00\x1a\x11\x12\x39\xb8\x00\x13\x10\xb9\x00\x0a\x00\x03\xf4\
-\xba\x00\x19\x00\x0a\x00\x01\x11\x12\x39\x30\x31\x29\x01\x35\x37\
-\x3e\x01\x3d\x01\x34\x26\x23\x22\x06\x07\x27\x3e\x03\x33\x32\x16\
-\x15\x14\x06\x0f\x01\x33\x01\xb6\xfe\xf0\x82\x1d\x21\x21\x20\x23\
-\x23\x08\x36\x06\x15\x21\x2e\x1e\x3e\x42\x35\x2a\x61\xcd\x39\x69\
-\x18\x30\x1a\x06\x1a\x1f\x22\x18\x14\x12\x20\x19\x0f\x3d\x30\x2c\
-\x41\x20\x4b\x00\x01\x00\x97\xff\xfa\x01\xae\x01\x77\x00\x2a\x00\
-\x64\xba\x00\x0e\x00\x2b\x00\x2c\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\x0e\x00\x18\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x1b\x2f\x1b\xb9\x00\x1b\x00\x0e\x3e\x59\xba\x00\
-\x28\x00\x0e\x00\x1b\x11\x12\x39\xb8\x00\x28\x2f\x41\x05\x00\x40\
-\x00\x28\x00\x50\x00\x28\x00\x02\x72\xb9\x00\x00\x00\x03\xf4\xb8\
-\x00\x0e\x10\xb9\x00\x07\x00\x03\xf4\xb8\x00\x1b\x10\xb9\x00\x22\
-\x00\x03\xf4\x30\x31\x25\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x07\
-\x27\x3e\x01\x33\x32\x16\x15\x14\x06\x07\x15\x1e\x01\x15\x14\x06\
-\x23\x22\x26\x27\x37\x1e\x01\x33\x32\x36\x3d\x01\x34\x2b\x01\x35\
-\x01\x1a\x26\x25\x23\x1e\x1d\x28\x0e\x2b\x11\x3d\x32\x39\x49\x2e\
-\x20\x22\x32\x4d\x42\x37\x3e\x13\x2f\x0e\x28\x23\x26\x27\x4d\x2d\
-\xd9\x1d\x17\x04\x19\x1b\x18\x15\x22\x19\x24\x32\x2d\x24\x2a\x07\
-\x03\x06\x2c\x28\x31\x3b\x28\x1a\x22\x16\x1c\x20\x1d\x06\x37\x33\
-\x00\x00\x00\x00\x02\x00\x93\x00\x00\x01\xc4\x01\x71\x00\x0a\x00\
-\x0e\x00\x6b\xba\x00\x04\x00\x0f\x00\x10\x11\x12\x39\xb8\x00\x04\
-\x10\xb8\x00\x0c\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\
-\xb9\x00\x05\x00\x18\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\
-\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xba\x00\x02\x00\x00\x00\x05\x11\
-\x12\x39\xb8\x00\x02\x2f\xb9\x00\x0d\x00\x03\xf4\xba\x00\x03\x00\
-\x0d\x00\x05\x11\x12\x39\xb8\x00\x06\xd0\xb8\x00\x02\x10\xb8\x00\
-\x09\xd0\xb8\x00\x05\x10\xb9\x00\x0b\x00\x03\xf4\x30\x31\x21\x35\
-\x23\x35\x37\x33\x15\x33\x15\x23\x15\x03\x23\x07\x33\x01\x50\xbd\
-\xa4\x55\x38\x38\x3c\x04\x82\x86\x48\x34\xf5\xf9\x30\x48\x01\x38\
-\xc0\x00\x00\x00\x01\x00\xa0\xff\xfa\x01\xb3\x01\x71\x00\x20\x00\
-\x57\xba\x00\x12\x00\x21\x00\x22\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x1e\x2f\x1b\xb9\x00\x1e\x00\x18\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0b\x2f\x1b\xb9\x00\x0b\x00\x0e\x3e\x59\xb8\x00\
-\x1e\x10\xb9\x00\x00\x00\x03\xf4\xb8\x00\x0b\x10\xb9\x00\x12\x00\
-\x03\xf4\xba\x00\x05\x00\x1e\x00\x12\x11\x12\x39\xb8\x00\x05\x2f\
-\xb9\x00\x19\x00\x03\xf4\x30\x31\x13\x07\x33\x3e\x01\x33\x32\x16\
-\x15\x14\x06\x23\x22\x26\x27\x37\x1e\x01\x33\x32\x36\x3d\x01\x34\
-\x26\x23\x22\x06\x07\x27\x37\x33\x15\xec\x0b\x04\x0e\x24\x22\x34\
-\x46\x4b\x44\x35\x3d\x12\x2d\x0f\x26\x23\x26\x26\x26\x26\x1a\x1f\
-\x0b\x34\x0e\xe4\x01\x3f\x85\x16\x1b\x3d\x36\x38\x46\x28\x1a\x22\
-\x16\x1c\x24\x20\x05\x20\x24\x12\x0b\x07\xce\x32\x00\x00\x00\x00\
-\x02\x00\xa1\xff\xfa\x01\xbb\x01\x71\x00\x17\x00\x25\x00\x57\xba\
-\x00\x00\x00\x26\x00\x27\x11\x12\x39\xb8\x00\x18\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x18\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\
-\xb9\x00\x18\x00\x03\xf4\xba\x00\x12\x00\x18\x00\x08\x11\x12\x39\
-\xb8\x00\x12\x2f\xb9\x00\x1f\x00\x03\xf4\xba\x00\x0f\x00\x1f\x00\
-\x18\x11\x12\x39\x30\x31\x05\x22\x26\x35\x34\x3e\x02\x37\x33\x0e\
-\x03\x07\x17\x3e\x01\x33\x32\x16\x15\x14\x06\x27\x32\x36\x3d\x01\
-\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x01\x2e\x43\x4a\x1a\x2a\x33\
-\x19\x54\x23\x36\x28\x1b\x07\x04\x0d\x2b\x26\x33\x44\x4d\x40\x23\
-\x29\x29\x23\x23\x29\x29\x06\x4d\x43\x28\x46\x3b\x2f\x0f\x17\x2a\
-\x2c\x31\x1e\x01\x15\x20\x3d\x35\x38\x45\x30\x22\x23\x05\x23\x22\
-\x22\x23\x05\x23\x22\x00\x00\x00\x01\x00\xa4\x00\x00\x01\xb4\x01\
-\x71\x00\x08\x00\x3d\xba\x00\x08\x00\x09\x00\x0a\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x05\x2f\x1b\xb9\x00\x05\x00\x18\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb8\x00\x05\x10\xb9\x00\x02\x00\x03\xf4\xb8\x00\x04\xdc\
-\x30\x31\x33\x13\x23\x15\x23\x35\x21\x15\x03\xe1\x94\x9b\x36\x01\
-\x10\x90\x01\x3f\x43\x75\x34\xfe\xc3\x00\x00\x00\x03\x00\x9c\xff\
-\xfa\x01\xbc\x01\x77\x00\x19\x00\x27\x00\x31\x00\x73\xba\x00\x00\
-\x00\x32\x00\x33\x11\x12\x39\xb8\x00\x1a\xd0\xb8\x00\x00\x10\xb8\
-\x00\x28\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\
-\x0d\x00\x18\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\
-\x00\x00\x00\x0e\x3e\x59\xb9\x00\x1a\x00\x03\xf4\xba\x00\x28\x00\
-\x0d\x00\x1a\x11\x12\x39\xb8\x00\x28\x2f\xb9\x00\x21\x00\x03\xf4\
-\xba\x00\x07\x00\x28\x00\x21\x11\x12\x39\xba\x00\x13\x00\x28\x00\
-\x21\x11\x12\x39\xb8\x00\x0d\x10\xb9\x00\x2d\x00\x03\xf4\x30\x31\
-\x05\x22\x26\x35\x34\x36\x37\x35\x2e\x01\x35\x34\x36\x33\x32\x16\
-\x15\x14\x06\x07\x15\x1e\x01\x15\x14\x06\x27\x32\x36\x3d\x01\x34\
-\x26\x23\x22\x06\x1d\x01\x14\x16\x37\x32\x3d\x01\x34\x23\x22\x1d\
-\x01\x14\x01\x2c\x46\x4a\x2d\x23\x1e\x25\x44\x3f\x3f\x44\x25\x1e\
-\x24\x2c\x4a\x46\x26\x27\x27\x26\x26\x27\x27\x26\x45\x45\x45\x06\
-\x3d\x2e\x24\x2d\x09\x04\x0a\x2b\x20\x2b\x34\x34\x2b\x20\x2b\x0a\
-\x04\x09\x2d\x24\x2e\x3d\x30\x1e\x1b\x0c\x1b\x1e\x1e\x1b\x0c\x1b\
-\x1e\xac\x34\x09\x34\x34\x09\x34\x00\x00\x00\x00\x02\x00\x9d\x00\
-\x00\x01\xb6\x01\x77\x00\x17\x00\x25\x00\x5f\xba\x00\x15\x00\x26\
-\x00\x27\x11\x12\x39\xb8\x00\x15\x10\xb8\x00\x18\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x15\x2f\x1b\xb9\x00\x15\x00\x18\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x0e\x3e\x59\
-\xb8\x00\x15\x10\xb9\x00\x1f\x00\x03\xf4\xba\x00\x0f\x00\x1f\x00\
-\x06\x11\x12\x39\xb8\x00\x0f\x2f\xb9\x00\x18\x00\x03\xf4\xba\x00\
-\x0c\x00\x18\x00\x1f\x11\x12\x39\x30\x31\x25\x14\x0e\x02\x07\x23\
-\x3e\x03\x37\x27\x0e\x01\x23\x22\x26\x35\x34\x36\x33\x32\x16\x07\
-\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x01\xb6\x1a\
-\x29\x33\x19\x54\x22\x36\x28\x1b\x07\x04\x0c\x2b\x26\x34\x43\x4c\
-\x41\x42\x4a\x8d\x23\x29\x29\x23\x23\x29\x29\xe7\x28\x46\x3b\x2f\
-\x0f\x17\x2a\x2c\x31\x1e\x01\x16\x20\x3e\x35\x38\x45\x4d\x73\x22\
-\x23\x06\x23\x22\x22\x23\x06\x23\x22\x00\x00\x00\x03\x00\xa8\x01\
-\x65\x01\xb0\x02\xc0\x00\x0b\x00\x19\x00\x27\x00\x82\xba\x00\x00\
-\x00\x28\x00\x29\x11\x12\x39\xb8\x00\x0c\xd0\xb8\x00\x00\x10\xb8\
-\x00\x1a\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\
-\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\
-\x00\x00\x00\x14\x3e\x59\xb9\x00\x0c\x00\x03\xf4\xb8\x00\x06\x10\
-\xb9\x00\x13\x00\x03\xf4\xba\x00\x1a\x00\x06\x00\x00\x11\x12\x39\
-\xb8\x00\x1a\x2f\x41\x03\x00\x4f\x00\x1a\x00\x01\x71\x41\x05\x00\
-\xef\x00\x1a\x00\xff\x00\x1a\x00\x02\x5d\x41\x05\x00\x0f\x00\x1a\
-\x00\x1f\x00\x1a\x00\x02\x71\xb9\x00\x21\x00\x03\xf4\x30\x31\x01\
-\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x27\x32\x36\x3d\x01\
-\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x37\x22\x26\x3d\x01\x34\x36\
-\x33\x32\x16\x1d\x01\x14\x06\x01\x2c\x45\x3f\x3f\x45\x45\x3f\x3f\
-\x45\x25\x1f\x1f\x25\x25\x1f\x1f\x25\x11\x0c\x0c\x11\x11\x0c\x0c\
-\x01\x65\x5b\x53\x52\x5b\x5b\x52\x53\x5b\x32\x32\x2b\x3d\x2b\x32\
-\x32\x2b\x3d\x2b\x32\x5f\x0e\x0a\x09\x0a\x0e\x0e\x0a\x09\x0a\x0e\
-\x00\x00\x00\x00\x01\x00\xaa\x01\x6b\x01\xad\x02\xba\x00\x0a\x00\
-\x5b\xba\x00\x01\x00\x0b\x00\x0c\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x14\x3e\x59\xb9\x00\
-\x00\x00\x03\xf4\xb8\x00\x06\x10\xb9\x00\x02\x00\x03\xf4\xba\x00\
-\x03\x00\x02\x00\x0a\x11\x12\x39\xb8\x00\x03\x10\xb9\x00\x04\x00\
-\x03\xf4\xb8\x00\x00\x10\xb8\x00\x07\xd0\x30\x31\x13\x33\x35\x07\
-\x27\x37\x33\x11\x33\x15\x23\xbd\x5e\x59\x18\x6c\x44\x53\xf0\x01\
-\x9d\xe6\x2d\x2c\x38\xfe\xe3\x32\x00\x00\x00\x00\x01\x00\xad\x01\
-\x6b\x01\xa9\x02\xc0\x00\x18\x00\x57\xba\x00\x0e\x00\x19\x00\x1a\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\
-\x0e\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\xb9\
-\x00\x18\x00\x14\x3e\x59\xb9\x00\x15\x00\x03\xf4\xb8\x00\x00\xd0\
-\xba\x00\x01\x00\x0e\x00\x15\x11\x12\x39\xb8\x00\x0e\x10\xb9\x00\
-\x07\x00\x03\xf4\xba\x00\x14\x00\x07\x00\x18\x11\x12\x39\x30\x31\
-\x13\x37\x36\x3d\x01\x34\x26\x23\x22\x06\x07\x27\x3e\x01\x33\x32\
-\x16\x15\x14\x06\x0f\x01\x33\x15\x23\xb3\x71\x36\x1b\x1a\x1a\x1f\
-\x0a\x35\x0b\x3d\x35\x39\x39\x35\x25\x4d\xb4\xf6\x01\xa5\x5a\x2b\
-\x2f\x05\x13\x1b\x1d\x1a\x16\x22\x33\x39\x28\x2a\x40\x1d\x3b\x32\
-\x00\x00\x00\x00\x01\x00\xa7\x01\x65\x01\xa3\x02\xc0\x00\x2a\x00\
-\x78\xba\x00\x1e\x00\x2b\x00\x2c\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x1e\x2f\x1b\xb9\x00\x1e\x00\x1c\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x14\x3e\x59\xb9\x00\
-\x07\x00\x03\xf4\xba\x00\x0e\x00\x1e\x00\x00\x11\x12\x39\xb8\x00\
-\x0e\x2f\x41\x03\x00\x4f\x00\x0e\x00\x01\x71\x41\x03\x00\x50\x00\
-\x0e\x00\x01\x72\x41\x03\x00\x30\x00\x0e\x00\x01\x72\xb9\x00\x11\
-\x00\x03\xf4\xb8\x00\x1e\x10\xb9\x00\x18\x00\x03\xf4\xba\x00\x24\
-\x00\x11\x00\x0e\x11\x12\x39\x30\x31\x01\x22\x26\x27\x37\x1e\x01\
-\x33\x32\x36\x3d\x01\x34\x26\x2b\x01\x35\x33\x32\x36\x3d\x01\x34\
-\x26\x23\x22\x07\x27\x3e\x01\x33\x32\x16\x15\x14\x06\x07\x15\x1e\
-\x01\x15\x14\x06\x01\x25\x34\x3a\x10\x2f\x0c\x23\x20\x1d\x21\x24\
-\x21\x23\x23\x20\x1f\x1e\x1a\x2f\x19\x2a\x12\x36\x2c\x36\x40\x29\
-\x1d\x20\x2c\x45\x01\x65\x2b\x1c\x21\x17\x1e\x1b\x17\x07\x17\x17\
-\x32\x18\x11\x07\x14\x18\x29\x22\x1a\x20\x2f\x28\x21\x27\x05\x04\
-\x05\x28\x23\x2d\x36\x00\x00\x00\x02\x00\xa4\x01\x6b\x01\xb3\x02\
-\xba\x00\x0a\x00\x0e\x00\x6b\xba\x00\x03\x00\x0f\x00\x10\x11\x12\
-\x39\xb8\x00\x03\x10\xb8\x00\x0d\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x03\x2f\x1b\xb9\x00\x03\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x14\x3e\x59\xba\x00\x01\x00\
-\x03\x00\x0a\x11\x12\x39\xb8\x00\x01\x2f\xb9\x00\x0e\x00\x03\xf4\
-\xba\x00\x02\x00\x0e\x00\x03\x11\x12\x39\xb8\x00\x05\xd0\xb8\x00\
-\x01\x10\xb8\x00\x08\xd0\xb8\x00\x03\x10\xb9\x00\x0d\x00\x03\xf4\
-\x30\x31\x01\x23\x35\x37\x33\x15\x33\x15\x23\x15\x23\x3d\x01\x23\
-\x07\x01\x47\xa3\x8e\x52\x2f\x2f\x3d\x03\x72\x01\xab\x3b\xd4\xdf\
-\x30\x40\x70\xaa\xaa\x00\x00\x00\x01\x00\xb2\x01\x65\x01\xac\x02\
-\xba\x00\x20\x00\x53\xba\x00\x0e\x00\x21\x00\x22\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x14\
-\x3e\x59\xb9\x00\x07\x00\x03\xf4\xba\x00\x1b\x00\x13\x00\x07\x11\
-\x12\x39\xb8\x00\x1b\x2f\xb9\x00\x0e\x00\x03\xf4\xb8\x00\x13\x10\
-\xb9\x00\x16\x00\x03\xf4\x30\x31\x01\x22\x26\x27\x37\x1e\x01\x33\
-\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x07\x27\x37\x33\x15\x23\x07\
-\x33\x3e\x01\x33\x32\x16\x15\x14\x06\x01\x2a\x32\x38\x0e\x2d\x0d\
-\x21\x1d\x1f\x23\x24\x1c\x17\x1c\x08\x35\x0d\xd0\xa0\x09\x05\x0b\
-\x20\x20\x2e\x3e\x44\x01\x65\x2a\x1b\x22\x16\x1e\x22\x1b\x03\x1a\
-\x1e\x12\x09\x08\xbd\x33\x75\x16\x1a\x36\x32\x33\x42\x00\x00\x00\
-\x02\x00\xad\x01\x65\x01\xad\x02\xba\x00\x17\x00\x25\x00\x57\xba\
-\x00\x00\x00\x26\x00\x27\x11\x12\x39\xb8\x00\x18\xd0\x00\xb8\x00\
-\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x1c\x3e\x59\xb8\
-\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x14\x3e\x59\
-\xb9\x00\x18\x00\x03\xf4\xba\x00\x12\x00\x08\x00\x18\x11\x12\x39\
-\xb8\x00\x12\x2f\xb9\x00\x1f\x00\x03\xf4\xba\x00\x0f\x00\x1f\x00\
-\x18\x11\x12\x39\x30\x31\x01\x22\x26\x35\x34\x3e\x02\x37\x33\x0e\
-\x03\x07\x17\x3e\x01\x33\x32\x16\x15\x14\x06\x27\x32\x36\x3d\x01\
-\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x01\x2d\x3c\x44\x17\x24\x2c\
-\x16\x57\x20\x33\x26\x1a\x06\x06\x0b\x29\x23\x2d\x3b\x45\x3b\x1d\
-\x24\x24\x1d\x1d\x24\x24\x01\x65\x48\x3c\x24\x40\x35\x2a\x0e\x16\
-\x28\x28\x2c\x19\x01\x14\x20\x38\x30\x33\x42\x30\x1f\x1b\x0b\x1b\
-\x1f\x1f\x1b\x0b\x1b\x1f\x00\x00\x01\x00\xb2\x01\x6b\x01\xa7\x02\
-\xba\x00\x08\x00\x3f\xba\x00\x07\x00\x09\x00\x0a\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x1c\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x14\
-\x3e\x59\xb8\x00\x04\x10\xb9\x00\x01\x00\x03\xf4\xb9\x00\x03\x00\
-\x08\xf4\x30\x31\x01\x23\x15\x23\x35\x33\x15\x03\x23\x01\x6a\x81\
-\x37\xf5\x7e\x40\x02\x86\x40\x74\x36\xfe\xe7\x00\x03\x00\xad\x01\
-\x65\x01\xab\x02\xc0\x00\x19\x00\x27\x00\x35\x00\x73\xba\x00\x00\
-\x00\x36\x00\x37\x11\x12\x39\xb8\x00\x1a\xd0\xb8\x00\x00\x10\xb8\
-\x00\x28\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\
-\x0d\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\
-\x00\x00\x00\x14\x3e\x59\xb9\x00\x28\x00\x03\xf4\xba\x00\x1a\x00\
-\x0d\x00\x28\x11\x12\x39\xb8\x00\x1a\x2f\xb9\x00\x2f\x00\x03\xf4\
-\xba\x00\x07\x00\x1a\x00\x2f\x11\x12\x39\xba\x00\x13\x00\x1a\x00\
-\x2f\x11\x12\x39\xb8\x00\x0d\x10\xb9\x00\x21\x00\x03\xf4\x30\x31\
-\x01\x22\x26\x35\x34\x36\x37\x35\x2e\x01\x35\x34\x36\x33\x32\x16\
-\x15\x14\x06\x07\x15\x1e\x01\x15\x14\x06\x27\x32\x36\x3d\x01\x34\
-\x26\x23\x22\x06\x1d\x01\x14\x16\x17\x32\x36\x3d\x01\x34\x26\x23\
-\x22\x06\x1d\x01\x14\x16\x01\x2c\x3e\x41\x28\x20\x1c\x24\x3e\x39\
-\x39\x3e\x24\x1c\x20\x28\x41\x3e\x1d\x1f\x1f\x1d\x1d\x1f\x1f\x1d\
-\x1f\x22\x22\x1f\x1f\x22\x22\x01\x65\x37\x2a\x22\x28\x08\x04\x09\
-\x26\x1d\x26\x32\x32\x26\x1d\x26\x09\x04\x08\x28\x22\x2a\x37\xc8\
-\x19\x15\x07\x15\x19\x19\x15\x07\x15\x19\x98\x1b\x17\x09\x17\x1b\
-\x1b\x17\x09\x17\x1b\x00\x00\x00\x02\x00\xab\x01\x6b\x01\xab\x02\
-\xc0\x00\x15\x00\x23\x00\x5f\xba\x00\x16\x00\x24\x00\x25\x11\x12\
-\x39\xb8\x00\x16\x10\xb8\x00\x0d\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x14\x3e\x59\xb8\x00\x0d\x10\
-\xb9\x00\x1d\x00\x03\xf4\xba\x00\x07\x00\x1d\x00\x00\x11\x12\x39\
-\xb8\x00\x07\x2f\xb9\x00\x16\x00\x03\xf4\xba\x00\x04\x00\x16\x00\
-\x1d\x11\x12\x39\x30\x31\x13\x3e\x01\x37\x27\x0e\x01\x23\x22\x26\
-\x35\x34\x36\x33\x32\x16\x15\x14\x0e\x02\x07\x27\x32\x36\x3d\x01\
-\x34\x26\x23\x22\x06\x1d\x01\x14\x16\xd7\x3f\x4e\x0c\x06\x0b\x29\
-\x23\x2d\x3b\x45\x3b\x3c\x44\x17\x24\x2c\x16\x03\x1d\x24\x24\x1d\
-\x1d\x24\x24\x01\x6b\x2b\x4d\x33\x01\x14\x20\x38\x30\x33\x42\x48\
-\x3c\x24\x40\x35\x2a\x0e\xa6\x1f\x1b\x0b\x1b\x1f\x1f\x1b\x0b\x1b\
-\x1f\x00\x00\x00\x03\x00\xa8\xff\xfa\x01\xb0\x01\x55\x00\x0b\x00\
-\x19\x00\x27\x00\x5f\xba\x00\x00\x00\x28\x00\x29\x11\x12\x39\xb8\
-\x00\x0c\xd0\xb8\x00\x00\x10\xb8\x00\x1a\xd0\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x16\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\
-\x0c\x00\x03\xf4\xb8\x00\x06\x10\xb9\x00\x13\x00\x03\xf4\xba\x00\
-\x1a\x00\x00\x00\x13\x11\x12\x39\xb8\x00\x1a\x2f\xb9\x00\x21\x00\
-\x03\xf4\x30\x31\x05\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\
-\x27\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x37\x22\
-\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x01\x2c\x45\x3f\
-\x3f\x45\x45\x3f\x3f\x45\x25\x1f\x1f\x25\x25\x1f\x1f\x25\x11\x0c\
-\x0c\x11\x11\x0c\x0c\x06\x5b\x53\x52\x5b\x5b\x52\x53\x5b\x32\x32\
-\x2b\x3d\x2b\x32\x32\x2b\x3d\x2b\x32\x5f\x0e\x0a\x09\x0a\x0e\x0e\
-\x0a\x09\x0a\x0e\x00\x00\x00\x00\x01\x00\xaa\x00\x00\x01\xad\x01\
-\x4f\x00\x0a\x00\x5b\xba\x00\x01\x00\x0b\x00\x0c\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\x06\x00\x16\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\x1b\xb9\x00\x0a\x00\x0e\
-\x3e\x59\xb9\x00\x00\x00\x03\xf4\xb8\x00\x06\x10\xb9\x00\x02\x00\
-\x03\xf4\xba\x00\x03\x00\x02\x00\x0a\x11\x12\x39\xb8\x00\x03\x10\
-\xb9\x00\x04\x00\x03\xf4\xb8\x00\x00\x10\xb8\x00\x07\xd0\x30\x31\
-\x37\x33\x35\x07\x27\x37\x33\x11\x33\x15\x23\xbd\x5e\x59\x18\x6c\
-\x44\x53\xf0\x32\xe6\x2d\x2c\x38\xfe\xe3\x32\x00\x01\x00\xad\x00\
-\x00\x01\xa9\x01\x55\x00\x18\x00\x57\xba\x00\x0e\x00\x19\x00\x1a\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\x00\
-\x0e\x00\x16\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x18\x2f\x1b\xb9\
-\x00\x18\x00\x0e\x3e\x59\xb9\x00\x15\x00\x03\xf4\xb8\x00\x00\xd0\
-\xba\x00\x01\x00\x0e\x00\x15\x11\x12\x39\xb8\x00\x0e\x10\xb9\x00\
-\x07\x00\x03\xf4\xba\x00\x14\x00\x07\x00\x18\x11\x12\x39\x30\x31\
-\x3f\x01\x36\x3d\x01\x34\x26\x23\x22\x06\x07\x27\x3e\x01\x33\x32\
-\x16\x15\x14\x06\x0f\x01\x33\x15\x23\xb3\x71\x36\x1b\x1a\x1a\x1f\
-\x0a\x35\x0b\x3d\x35\x39\x39\x35\x25\x4d\xb4\xf6\x3a\x5a\x2b\x2f\
-\x05\x13\x1b\x1d\x1a\x16\x22\x33\x39\x28\x2a\x40\x1d\x3b\x32\x00\
-\x01\x00\xa7\xff\xfa\x01\xa3\x01\x55\x00\x2a\x00\x78\xba\x00\x1e\
-\x00\x2b\x00\x2c\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x1e\
-\x2f\x1b\xb9\x00\x1e\x00\x16\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\x07\x00\x03\xf4\
-\xba\x00\x0e\x00\x1e\x00\x00\x11\x12\x39\xb8\x00\x0e\x2f\x41\x03\
-\x00\x4f\x00\x0e\x00\x01\x71\x41\x03\x00\x50\x00\x0e\x00\x01\x72\
-\x41\x03\x00\x30\x00\x0e\x00\x01\x72\xb9\x00\x11\x00\x03\xf4\xb8\
-\x00\x1e\x10\xb9\x00\x18\x00\x03\xf4\xba\x00\x24\x00\x11\x00\x0e\
-\x11\x12\x39\x30\x31\x05\x22\x26\x27\x37\x1e\x01\x33\x32\x36\x3d\
-\x01\x34\x26\x2b\x01\x35\x33\x32\x36\x3d\x01\x34\x26\x23\x22\x07\
-\x27\x3e\x01\x33\x32\x16\x15\x14\x06\x07\x15\x1e\x01\x15\x14\x06\
-\x01\x25\x34\x3a\x10\x2f\x0c\x23\x20\x1d\x21\x24\x21\x23\x23\x20\
-\x1f\x1e\x1a\x2f\x19\x2a\x12\x36\x2c\x36\x40\x29\x1d\x20\x2c\x45\
-\x06\x2b\x1c\x21\x17\x1e\x1b\x17\x07\x17\x17\x32\x18\x11\x07\x14\
-\x18\x29\x22\x1a\x20\x2f\x28\x21\x27\x05\x04\x05\x28\x23\x2d\x36\
-\x00\x00\x00\x00\x02\x00\xa4\x00\x00\x01\xb3\x01\x4f\x00\x0a\x00\
-\x0e\x00\x6b\xba\x00\x03\x00\x0f\x00\x10\x11\x12\x39\xb8\x00\x03\
-\x10\xb8\x00\x0d\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x04\x2f\x1b\
-\xb9\x00\x04\x00\x16\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0a\x2f\
-\x1b\xb9\x00\x0a\x00\x0e\x3e\x59\xba\x00\x01\x00\x04\x00\x0a\x11\
-\x12\x39\xb8\x00\x01\x2f\xb9\x00\x0e\x00\x03\xf4\xba\x00\x02\x00\
-\x0e\x00\x04\x11\x12\x39\xb8\x00\x05\xd0\xb8\x00\x01\x10\xb8\x00\
-\x08\xd0\xb8\x00\x04\x10\xb9\x00\x0c\x00\x03\xf4\x30\x31\x25\x23\
-\x35\x37\x33\x15\x33\x15\x23\x15\x23\x3d\x01\x23\x07\x01\x47\xa3\
-\x8e\x52\x2f\x2f\x3d\x03\x72\x40\x3b\xd4\xdf\x30\x40\x70\xaa\xaa\
-\x00\x00\x00\x00\x01\x00\xb2\xff\xfa\x01\xac\x01\x4f\x00\x20\x00\
-\x53\xba\x00\x0e\x00\x21\x00\x22\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x13\x2f\x1b\xb9\x00\x13\x00\x16\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\
-\x07\x00\x03\xf4\xba\x00\x1b\x00\x07\x00\x13\x11\x12\x39\xb8\x00\
-\x1b\x2f\xb9\x00\x0e\x00\x03\xf4\xb8\x00\x13\x10\xb9\x00\x16\x00\
-\x03\xf4\x30\x31\x05\x22\x26\x27\x37\x1e\x01\x33\x32\x36\x3d\x01\
-\x34\x26\x23\x22\x06\x07\x27\x37\x33\x15\x23\x07\x33\x3e\x01\x33\
-\x32\x16\x15\x14\x06\x01\x2a\x32\x38\x0e\x2d\x0d\x21\x1d\x1f\x23\
-\x24\x1c\x17\x1c\x08\x35\x0d\xd0\xa0\x09\x05\x0b\x20\x20\x2e\x3e\
-\x44\x06\x2a\x1b\x22\x16\x1e\x22\x1b\x03\x1a\x1e\x12\x09\x08\xbd\
-\x33\x75\x16\x1a\x36\x32\x33\x42\x00\x00\x00\x00\x02\x00\xad\xff\
-\xfa\x01\xad\x01\x4f\x00\x17\x00\x25\x00\x57\xba\x00\x00\x00\x26\
-\x00\x27\x11\x12\x39\xb8\x00\x18\xd0\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x08\x2f\x1b\xb9\x00\x08\x00\x16\x3e\x59\xb8\x00\x00\x45\x58\
-\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb9\x00\x18\x00\
-\x03\xf4\xba\x00\x12\x00\x18\x00\x08\x11\x12\x39\xb8\x00\x12\x2f\
-\xb9\x00\x1f\x00\x03\xf4\xba\x00\x0f\x00\x1f\x00\x18\x11\x12\x39\
-\x30\x31\x05\x22\x26\x35\x34\x3e\x02\x37\x33\x0e\x03\x07\x17\x3e\
-\x01\x33\x32\x16\x15\x14\x06\x27\x32\x36\x3d\x01\x34\x26\x23\x22\
-\x06\x1d\x01\x14\x16\x01\x2d\x3c\x44\x17\x24\x2c\x16\x57\x20\x33\
-\x26\x1a\x06\x06\x0b\x29\x23\x2d\x3b\x45\x3b\x1d\x24\x24\x1d\x1d\
-\x24\x24\x06\x48\x3c\x24\x40\x35\x2a\x0e\x16\x28\x28\x2c\x19\x01\
-\x14\x20\x38\x30\x33\x42\x30\x1f\x1b\x0b\x1b\x1f\x1f\x1b\x0b\x1b\
-\x1f\x00\x00\x00\x01\x00\xb2\x00\x00\x01\xa7\x01\x4f\x00\x08\x00\
-\x3d\xba\x00\x07\x00\x09\x00\x0a\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x04\x2f\x1b\xb9\x00\x04\x00\x16\x3e\x59\xb8\x00\x00\
-\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\x0e\x3e\x59\xb8\x00\
-\x04\x10\xb9\x00\x01\x00\x03\xf4\xb8\x00\x03\xdc\x30\x31\x01\x23\
-\x15\x23\x35\x33\x15\x03\x23\x01\x6a\x81\x37\xf5\x7e\x40\x01\x1b\
-\x40\x74\x36\xfe\xe7\x00\x00\x00\x03\x00\xad\xff\xfa\x01\xab\x01\
-\x55\x00\x19\x00\x27\x00\x35\x00\x73\xba\x00\x00\x00\x36\x00\x37\
-\x11\x12\x39\xb8\x00\x1a\xd0\xb8\x00\x00\x10\xb8\x00\x28\xd0\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\xb9\x00\x0d\x00\x16\x3e\
-\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x0e\
-\x3e\x59\xb9\x00\x28\x00\x03\xf4\xba\x00\x1a\x00\x28\x00\x0d\x11\
-\x12\x39\xb8\x00\x1a\x2f\xb9\x00\x2f\x00\x03\xf4\xba\x00\x07\x00\
-\x1a\x00\x2f\x11\x12\x39\xba\x00\x13\x00\x1a\x00\x2f\x11\x12\x39\
-\xb8\x00\x0d\x10\xb9\x00\x21\x00\x03\xf4\x30\x31\x05\x22\x26\x35\
-\x34\x36\x37\x35\x2e\x01\x35\x34\x36\x33\x32\x16\x15\x14\x06\x07\
-\x15\x1e\x01\x15\x14\x06\x27\x32\x36\x3d\x01\x34\x26\x23\x22\x06\
-\x1d\x01\x14\x16\x17\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\
-\x14\x16\x01\x2c\x3e\x41\x28\x20\x1c\x24\x3e\x39\x39\x3e\x24\x1c\
-\x20\x28\x41\x3e\x1d\x1f\x1f\x1d\x1d\x1f\x1f\x1d\x1f\x22\x22\x1f\
-\x1f\x22\x22\x06\x37\x2a\x22\x28\x08\x04\x09\x26\x1d\x26\x32\x32\
-\x26\x1d\x26\x09\x04\x08\x28\x22\x2a\x37\xc8\x19\x15\x07\x15\x19\
-\x19\x15\x07\x15\x19\x98\x1b\x17\x09\x17\x1b\x1b\x17\x09\x17\x1b\
-\x00\x00\x00\x00\x02\x00\xab\x00\x00\x01\xab\x01\x55\x00\x15\x00\
-\x23\x00\x5f\xba\x00\x16\x00\x24\x00\x25\x11\x12\x39\xb8\x00\x16\
-\x10\xb8\x00\x0d\xd0\x00\xb8\x00\x00\x45\x58\xb8\x00\x0d\x2f\x1b\
-\xb9\x00\x0d\x00\x16\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\
-\x1b\xb9\x00\x00\x00\x0e\x3e\x59\xb8\x00\x0d\x10\xb9\x00\x1d\x00\
-\x03\xf4\xba\x00\x07\x00\x00\x00\x1d\x11\x12\x39\xb8\x00\x07\x2f\
-\xb9\x00\x16\x00\x03\xf4\xba\x00\x04\x00\x16\x00\x1d\x11\x12\x39\
-\x30\x31\x33\x3e\x01\x37\x27\x0e\x01\x23\x22\x26\x35\x34\x36\x33\
-\x32\x16\x15\x14\x0e\x02\x07\x27\x32\x36\x3d\x01\x34\x26\x23\x22\
-\x06\x1d\x01\x14\x16\xd7\x3f\x4e\x0c\x06\x0b\x29\x23\x2d\x3b\x45\
-\x3b\x3c\x44\x17\x24\x2c\x16\x03\x1d\x24\x24\x1d\x1d\x24\x24\x2b\
-\x4d\x33\x01\x14\x20\x38\x30\x33\x42\x48\x3c\x24\x40\x35\x2a\x0e\
-\xa6\x1f\x1b\x0b\x1b\x1f\x1f\x1b\x0b\x1b\x1f\xff\xff\x00\x12\x00\
-\x00\x02\x46\x02\xba\x02\x27\x02\xc4\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xcf\x00\x96\x00\x00\xff\xff\x00\x12\xff\
-\xfa\x02\x46\x02\xba\x02\x27\x02\xc4\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd0\x00\x96\x00\x00\xff\xff\x00\x12\xff\
-\xfa\x02\x46\x02\xc0\x02\x27\x02\xc5\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd0\x00\x96\x00\x00\xff\xff\x00\x12\x00\
-\x00\x02\x49\x02\xba\x02\x27\x02\xc4\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd1\x00\x96\x00\x00\xff\xff\x00\x12\x00\
-\x00\x02\x49\x02\xc0\x02\x27\x02\xc6\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd1\x00\x96\x00\x00\xff\xff\x00\x12\xff\
-\xfa\x02\x46\x02\xba\x02\x27\x02\xc4\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd2\x00\x96\x00\x00\xff\xff\x00\x12\xff\
-\xfa\x02\x46\x02\xc0\x02\x27\x02\xc5\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd2\x00\x96\x00\x00\xff\xff\x00\x12\xff\
-\xfa\x02\x46\x02\xc0\x02\x27\x02\xc6\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd2\x00\x96\x00\x00\xff\xff\x00\x0f\xff\
-\xfa\x02\x46\x02\xba\x02\x27\x02\xc7\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd2\x00\x96\x00\x00\xff\xff\x00\x12\xff\
-\xfa\x02\x46\x02\xba\x02\x27\x02\xc4\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd3\x00\x96\x00\x00\xff\xff\x00\x12\xff\
-\xfa\x02\x46\x02\xba\x02\x27\x02\xc8\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd3\x00\x96\x00\x00\xff\xff\x00\x12\x00\
-\x00\x02\x46\x02\xba\x02\x27\x02\xc4\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd4\x00\x96\x00\x00\xff\xff\x00\x12\xff\
-\xfa\x02\x46\x02\xba\x02\x27\x02\xc4\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd5\x00\x96\x00\x00\xff\xff\x00\x12\xff\
-\xfa\x02\x46\x02\xc0\x02\x27\x02\xc6\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd5\x00\x96\x00\x00\xff\xff\x00\x12\xff\
-\xfa\x02\x46\x02\xba\x02\x27\x02\xc8\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd5\x00\x96\x00\x00\xff\xff\x00\x12\xff\
-\xfa\x02\x46\x02\xba\x02\x27\x02\xca\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd5\x00\x96\x00\x00\xff\xff\x00\x12\x00\
-\x00\x02\x46\x02\xba\x02\x27\x02\xc4\xff\x6b\x00\x00\x00\x26\x00\
-\x6b\x00\x00\x00\x07\x02\xd6\x00\x96\x00\x00\x00\x01\x00\x2e\x00\
-\x00\x02\x52\x02\xc8\x00\x09\x00\x2a\xba\x00\x08\x00\x0a\x00\x0b\
-\x11\x12\x39\x00\xb8\x00\x01\x2f\xb8\x00\x06\x2f\xb8\x00\x00\x45\
-\x58\xb8\x00\x09\x2f\x1b\xb9\x00\x09\x00\x0e\x3e\x59\xb8\x00\x03\
-\xd0\x30\x31\x13\x37\x1f\x01\x33\x37\x13\x17\x01\x23\x2e\x4c\x4a\
-\x4b\x05\x53\xa4\x47\xfe\xe8\x56\x01\xe4\x16\xc9\xd8\xd8\x01\x97\
-\x19\xfd\x51\x00\x01\x00\x32\x00\x0f\x02\x26\x02\xab\x00\x0b\x00\
-\x0c\xba\x00\x0a\x00\x0c\x00\x0d\x11\x12\x39\x30\x31\x37\x13\x03\
-\x37\x1b\x01\x17\x03\x13\x07\x0b\x01\x32\xcc\xcc\x3f\xbc\xba\x3f\
-\xcc\xcc\x3f\xbc\xba\x37\x01\x28\x01\x24\x28\xfe\xf1\x01\x0f\x28\
-\xfe\xd8\xfe\xdc\x28\x01\x0f\xfe\xf1\x00\x00\x00\x01\x00\x14\x00\
-\x8e\x02\x3c\x02\x2c\x00\x0e\x00\x17\xba\x00\x0c\x00\x0f\x00\x10\
-\x11\x12\x39\x00\xbb\x00\x08\x00\x02\x00\x05\x00\x04\x2b\x30\x31\
-\x13\x17\x0f\x01\x17\x37\x21\x15\x21\x27\x07\x1f\x01\x07\x27\xe3\
-\x30\x56\x32\x01\x60\x01\x50\xfe\xb0\x60\x01\x32\x56\x30\xcf\x02\
-\x2c\x30\x56\x2a\x03\x06\x44\x06\x03\x2a\x56\x30\xcf\x00\x00\x00\
-\x01\x00\x5d\x00\x00\x01\xfb\x02\xc6\x00\x0e\x00\x2f\xba\x00\x0e\
-\x00\x0f\x00\x10\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0e\
-\x2f\x1b\xb9\x00\x0e\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x07\x2f\x1b\xb9\x00\x07\x00\x0e\x3e\x59\x30\x31\x01\x07\x2f\x01\
-\x07\x17\x11\x23\x11\x37\x27\x0f\x01\x27\x37\x01\xfb\x30\x56\x2a\
-\x03\x06\x44\x06\x03\x2a\x56\x30\xcf\x01\xf7\x31\x57\x32\x01\x61\
-\xfe\x13\x01\xed\x61\x01\x32\x57\x31\xcf\x00\x00\x01\x00\x5d\xff\
-\xf4\x01\xfb\x02\xba\x00\x0e\x00\x2f\xba\x00\x0e\x00\x0f\x00\x10\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x06\x2f\x1b\xb9\x00\
-\x06\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x0e\x2f\x1b\xb9\
-\x00\x0e\x00\x0e\x3e\x59\x30\x31\x3f\x01\x1f\x01\x37\x27\x11\x33\
-\x11\x07\x17\x3f\x01\x17\x07\x5d\x30\x56\x2a\x03\x06\x44\x06\x03\
-\x2a\x56\x30\xcf\xc3\x31\x57\x32\x01\x61\x01\xed\xfe\x13\x61\x01\
-\x32\x57\x31\xcf\x00\x00\x00\x00\x01\x00\x1d\x00\x8e\x02\x45\x02\
-\x2c\x00\x0e\x00\x17\xba\x00\x01\x00\x0f\x00\x10\x11\x12\x39\x00\
-\xbb\x00\x07\x00\x02\x00\x06\x00\x04\x2b\x30\x31\x25\x27\x3f\x01\
-\x27\x07\x21\x35\x21\x17\x37\x2f\x01\x37\x17\x01\x76\x30\x56\x32\
-\x01\x60\xfe\xb0\x01\x50\x60\x01\x32\x56\x30\xcf\x8e\x30\x56\x2a\
-\x03\x06\x44\x06\x03\x2a\x56\x30\xcf\x00\x00\x00\x01\x00\x3b\x00\
-\x65\x02\x3c\x02\x66\x00\x0e\x00\x17\xba\x00\x01\x00\x0f\x00\x10\
-\x11\x12\x39\x00\xbb\x00\x00\x00\x02\x00\x02\x00\x04\x2b\x30\x31\
-\x01\x15\x23\x27\x07\x17\x01\x07\x01\x27\x07\x17\x15\x23\x11\x01\
-\x60\x7a\x41\x01\x48\x01\x50\x30\xfe\xb0\x40\x03\x06\x44\x02\x66\
-\x44\x06\x03\x40\xfe\xb0\x30\x01\x50\x48\x01\x41\x7a\x01\x25\x00\
-\x01\x00\x1c\x00\x65\x02\x1d\x02\x66\x00\x0e\x00\x17\xba\x00\x0c\
-\x00\x0f\x00\x10\x11\x12\x39\x00\xbb\x00\x0d\x00\x02\x00\x0c\x00\
-\x04\x2b\x30\x31\x01\x23\x35\x37\x27\x07\x01\x27\x01\x37\x27\x07\
-\x23\x35\x21\x02\x1d\x44\x06\x03\x40\xfe\xb0\x30\x01\x50\x48\x01\
-\x41\x7a\x01\x25\x01\x41\x7a\x41\x01\x48\xfe\xb0\x30\x01\x50\x40\
-\x03\x06\x44\x00\x01\x00\x3b\x00\x65\x02\x3c\x02\x66\x00\x0e\x00\
-\x17\xba\x00\x0d\x00\x0f\x00\x10\x11\x12\x39\x00\xbb\x00\x0b\x00\
-\x02\x00\x0e\x00\x04\x2b\x30\x31\x13\x33\x15\x07\x17\x37\x01\x17\
-\x01\x07\x17\x37\x33\x15\x21\x3b\x44\x06\x03\x40\x01\x50\x30\xfe\
-\xb0\x48\x01\x41\x7a\xfe\xdb\x01\x8a\x7a\x41\x01\x48\x01\x50\x30\
-\xfe\xb0\x40\x03\x06\x44\x00\x00\x01\x00\x1c\x00\x65\x02\x1d\x02\
-\x66\x00\x0e\x00\x17\xba\x00\x00\x00\x0f\x00\x10\x11\x12\x39\x00\
-\xbb\x00\x01\x00\x02\x00\x00\x00\x04\x2b\x30\x31\x37\x35\x33\x17\
-\x37\x27\x01\x37\x01\x17\x37\x27\x35\x33\x11\xf8\x7a\x41\x01\x48\
-\xfe\xb0\x30\x01\x50\x40\x03\x06\x44\x65\x44\x06\x03\x40\x01\x50\
-\x30\xfe\xb0\x48\x01\x41\x7a\xfe\xdb\x00\x00\x00\x01\x00\x29\x00\
-\x00\x02\x06\x02\xba\x00\x10\x00\x28\xba\x00\x0e\x00\x11\x00\x12\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\
-\x08\x00\x0e\x3e\x59\xbb\x00\x05\x00\x02\x00\x0a\x00\x04\x2b\x30\
-\x31\x13\x17\x0f\x01\x17\x37\x21\x11\x23\x11\x23\x27\x07\x1f\x01\
-\x07\x27\xf8\x30\x56\x32\x01\x60\x01\x05\x44\xc1\x60\x01\x32\x56\
-\x30\xcf\x02\xba\x30\x56\x2a\x03\x06\xfd\xf3\x01\xc9\x06\x03\x2a\
-\x56\x30\xcf\x00\x01\x00\x29\x00\x00\x02\x06\x02\xba\x00\x10\x00\
-\x28\xba\x00\x0e\x00\x11\x00\x12\x11\x12\x39\x00\xb8\x00\x00\x45\
-\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x1c\x3e\x59\xbb\x00\x05\
-\x00\x02\x00\x0a\x00\x04\x2b\x30\x31\x13\x17\x0f\x01\x17\x37\x33\
-\x11\x33\x11\x21\x27\x07\x1f\x01\x07\x27\xf8\x30\x56\x32\x01\x60\
-\xc1\x44\xfe\xfb\x60\x01\x32\x56\x30\xcf\x01\x9e\x30\x56\x2a\x03\
-\x06\x01\xc9\xfd\xf3\x06\x03\x2a\x56\x30\xcf\x00\x01\x00\x1d\x00\
-\x83\x02\x3e\x02\x74\x00\x10\x00\x17\xba\x00\x02\x00\x11\x00\x12\
-\x11\x12\x39\x00\xbb\x00\x06\x00\x02\x00\x09\x00\x04\x2b\x30\x31\
-\x01\x07\x2f\x01\x07\x17\x15\x21\x15\x21\x11\x37\x27\x0f\x01\x27\
-\x37\x01\xbb\x30\x56\x2a\x03\x06\x01\x30\xfe\x8c\x06\x03\x2a\x56\
-\x30\xcf\x01\xa5\x31\x57\x32\x01\x61\xd4\x44\x01\x18\x61\x01\x32\
-\x57\x31\xcf\x00\x01\x00\x1a\x00\x83\x02\x3b\x02\x74\x00\x10\x00\
-\x17\xba\x00\x0d\x00\x11\x00\x12\x11\x12\x39\x00\xbb\x00\x08\x00\
-\x02\x00\x07\x00\x04\x2b\x30\x31\x01\x07\x2f\x01\x07\x17\x11\x21\
-\x35\x21\x35\x37\x27\x0f\x01\x27\x37\x02\x3b\x30\x56\x2a\x03\x06\
-\xfe\x8c\x01\x30\x06\x03\x2a\x56\x30\xcf\x01\xa5\x31\x57\x32\x01\
-\x61\xfe\xe8\x44\xd4\x61\x01\x32\x57\x31\xcf\x00\x01\x00\x1d\x00\
-\x65\x02\x3e\x02\x56\x00\x10\x00\x17\xba\x00\x0d\x00\x11\x00\x12\
-\x11\x12\x39\x00\xbb\x00\x06\x00\x02\x00\x09\x00\x04\x2b\x30\x31\
-\x13\x37\x1f\x01\x37\x27\x11\x21\x15\x21\x15\x07\x17\x3f\x01\x17\
-\x07\x1d\x30\x56\x2a\x03\x06\x01\x74\xfe\xd0\x06\x03\x2a\x56\x30\
-\xcf\x01\x34\x31\x57\x32\x01\x61\x01\x18\x44\xd4\x61\x01\x32\x57\
-\x31\xcf\x00\x00\x01\x00\x1a\x00\x65\x02\x3b\x02\x56\x00\x10\x00\
-\x17\xba\x00\x02\x00\x11\x00\x12\x11\x12\x39\x00\xbb\x00\x08\x00\
-\x02\x00\x07\x00\x04\x2b\x30\x31\x13\x37\x1f\x01\x37\x27\x35\x21\
-\x35\x21\x11\x07\x17\x3f\x01\x17\x07\x9d\x30\x56\x2a\x03\x06\xfe\
-\xd0\x01\x74\x06\x03\x2a\x56\x30\xcf\x01\x34\x31\x57\x32\x01\x61\
-\xd4\x44\xfe\xe8\x61\x01\x32\x57\x31\xcf\x00\x00\x01\x00\x52\x00\
-\x00\x02\x2f\x02\xba\x00\x10\x00\x28\xba\x00\x01\x00\x11\x00\x12\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\
-\x08\x00\x0e\x3e\x59\xbb\x00\x09\x00\x02\x00\x06\x00\x04\x2b\x30\
-\x31\x01\x27\x3f\x01\x27\x07\x23\x11\x23\x11\x21\x17\x37\x2f\x01\
-\x37\x17\x01\x60\x30\x56\x32\x01\x60\xc1\x44\x01\x05\x60\x01\x32\
-\x56\x30\xcf\x01\x1c\x30\x56\x2a\x03\x06\xfe\x37\x02\x0d\x06\x03\
-\x2a\x56\x30\xcf\x00\x00\x00\x00\x01\x00\x52\x00\x00\x02\x2f\x02\
-\xba\x00\x10\x00\x28\xba\x00\x01\x00\x11\x00\x12\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x07\x2f\x1b\xb9\x00\x07\x00\x1c\x3e\
-\x59\xbb\x00\x09\x00\x02\x00\x06\x00\x04\x2b\x30\x31\x21\x27\x3f\
-\x01\x27\x07\x21\x11\x33\x11\x33\x17\x37\x2f\x01\x37\x17\x01\x60\
-\x30\x56\x32\x01\x60\xfe\xfb\x44\xc1\x60\x01\x32\x56\x30\xcf\x30\
-\x56\x2a\x03\x06\x02\x0d\xfe\x37\x06\x03\x2a\x56\x30\xcf\x00\xff\
-\xff\x00\x14\xff\xf5\x02\x45\x02\xc6\x02\x27\x02\xea\x00\x00\x00\
-\x9a\x00\x07\x02\xed\x00\x00\xff\x67\x00\x00\xff\xff\x00\x14\xff\
-\xf5\x02\x44\x02\xc6\x02\x27\x02\xed\xff\xff\x00\x9a\x00\x07\x02\
-\xea\x00\x00\xff\x67\x00\x00\x00\x01\x00\x00\x00\x8e\x02\x58\x02\
-\x2c\x00\x19\x00\x17\xba\x00\x17\x00\x1a\x00\x1b\x11\x12\x39\x00\
-\xbb\x00\x13\x00\x02\x00\x05\x00\x04\x2b\x30\x31\x13\x17\x0f\x01\
-\x17\x37\x33\x17\x37\x2f\x01\x37\x17\x07\x27\x3f\x01\x27\x07\x23\
-\x27\x07\x1f\x01\x07\x27\xcf\x31\x57\x32\x01\x61\xa6\x61\x01\x32\
-\x57\x31\xcf\xcf\x31\x57\x32\x01\x61\xa6\x61\x01\x32\x57\x31\xcf\
-\x02\x2c\x30\x56\x2a\x03\x06\x06\x03\x2a\x56\x30\xcf\xcf\x30\x56\
-\x2a\x03\x06\x06\x03\x2a\x56\x30\xcf\x00\x00\x00\x01\x00\x5d\xff\
-\xf4\x01\xfb\x02\xc6\x00\x19\x00\x2f\xba\x00\x19\x00\x1a\x00\x1b\
-\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x0c\x2f\x1b\xb9\x00\
-\x0c\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\x19\x2f\x1b\xb9\
-\x00\x19\x00\x0e\x3e\x59\x30\x31\x3f\x01\x1f\x01\x37\x27\x11\x37\
-\x27\x0f\x01\x27\x37\x17\x07\x2f\x01\x07\x17\x11\x07\x17\x3f\x01\
-\x17\x07\x5d\x30\x56\x2a\x03\x06\x06\x03\x2a\x56\x30\xcf\xcf\x30\
-\x56\x2a\x03\x06\x06\x03\x2a\x56\x30\xcf\xc3\x31\x57\x32\x01\x61\
-\x01\x20\x61\x01\x32\x57\x31\xcf\xcf\x31\x57\x32\x01\x61\xfe\xe0\
-\x61\x01\x32\x57\x31\xcf\x00\x00\x01\x00\x04\x00\x29\x02\x4b\x02\
-\x8e\x00\x24\x00\x17\xba\x00\x21\x00\x25\x00\x26\x11\x12\x39\x00\
-\xbb\x00\x0b\x00\x02\x00\x18\x00\x04\x2b\x30\x31\x3f\x01\x1f\x01\
-\x37\x27\x35\x34\x3e\x02\x33\x32\x1e\x02\x1d\x01\x23\x35\x34\x2e\
-\x02\x23\x22\x0e\x02\x1d\x01\x07\x17\x3f\x01\x17\x07\x04\x30\x56\
-\x2a\x03\x06\x1b\x34\x4d\x32\x2d\x4b\x36\x1e\x44\x15\x24\x32\x1d\
-\x25\x35\x21\x0f\x06\x03\x2a\x56\x30\xcf\xf8\x31\x57\x32\x01\x61\
-\xa3\x2e\x55\x40\x26\x1f\x37\x4e\x30\x0b\x0b\x21\x35\x27\x15\x1d\
-\x2f\x3c\x20\xa2\x61\x01\x32\x57\x31\xcf\x00\x00\x01\x00\x0e\x00\
-\x29\x02\x55\x02\x8e\x00\x24\x00\x17\xba\x00\x02\x00\x25\x00\x26\
-\x11\x12\x39\x00\xbb\x00\x18\x00\x02\x00\x0b\x00\x04\x2b\x30\x31\
-\x3f\x01\x1f\x01\x37\x27\x35\x34\x2e\x02\x23\x22\x0e\x02\x1d\x01\
-\x23\x35\x34\x3e\x02\x33\x32\x1e\x02\x1d\x01\x07\x17\x3f\x01\x17\
-\x07\xb7\x30\x56\x2a\x03\x06\x0f\x21\x35\x25\x1d\x32\x24\x15\x44\
-\x1e\x36\x4b\x2d\x32\x4d\x34\x1b\x06\x03\x2a\x56\x30\xcf\xf8\x31\
-\x57\x32\x01\x61\xa2\x20\x3c\x2f\x1d\x15\x27\x35\x21\x0b\x0b\x30\
-\x4e\x37\x1f\x26\x40\x55\x2e\xa3\x61\x01\x32\x57\x31\xcf\x00\x00\
-\x01\x00\x14\x00\x4d\x02\x44\x02\x6e\x00\x22\x00\x17\xba\x00\x20\
-\x00\x23\x00\x24\x11\x12\x39\x00\xbb\x00\x1c\x00\x02\x00\x05\x00\
-\x04\x2b\x30\x31\x13\x17\x0f\x01\x17\x37\x33\x32\x3e\x02\x35\x34\
-\x2e\x02\x23\x35\x32\x1e\x02\x15\x14\x0e\x02\x2b\x01\x27\x07\x1f\
-\x01\x07\x27\xe3\x31\x57\x32\x01\x61\x89\x1a\x30\x24\x16\x16\x24\
-\x30\x1a\x2a\x4a\x39\x21\x21\x39\x4a\x2a\x89\x61\x01\x32\x57\x31\
-\xcf\x01\xeb\x30\x56\x2a\x03\x06\x0e\x1c\x2d\x1f\x1f\x2d\x1c\x0e\
-\x44\x17\x2f\x46\x2e\x2f\x45\x2f\x17\x06\x03\x2a\x56\x30\xcf\x00\
-\x01\x00\x14\x00\x4d\x02\x44\x02\x6e\x00\x22\x00\x17\xba\x00\x01\
-\x00\x23\x00\x24\x11\x12\x39\x00\xbb\x00\x06\x00\x02\x00\x1b\x00\
-\x04\x2b\x30\x31\x25\x27\x3f\x01\x27\x07\x23\x22\x2e\x02\x35\x34\
-\x3e\x02\x33\x15\x22\x0e\x02\x15\x14\x1e\x02\x3b\x01\x17\x37\x2f\
-\x01\x37\x17\x01\x75\x31\x57\x32\x01\x61\x89\x2a\x4a\x39\x21\x21\
-\x39\x4a\x2a\x1a\x30\x24\x16\x16\x24\x30\x1a\x89\x61\x01\x32\x57\
-\x31\xcf\x4d\x30\x56\x2a\x03\x06\x17\x2f\x45\x2f\x2e\x46\x2f\x17\
-\x44\x0e\x1c\x2d\x1f\x1f\x2d\x1c\x0e\x06\x03\x2a\x56\x30\xcf\x00\
-\x01\x00\x1a\xff\xf4\x02\x3e\x02\xba\x00\x30\x00\x51\xba\x00\x0f\
-\x00\x31\x00\x32\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x00\
-\x2f\x1b\xb9\x00\x00\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x0f\x2f\x1b\xb9\x00\x0f\x00\x0e\x3e\x59\xb8\x00\x00\x10\xb9\x00\
-\x01\x00\x02\xf4\xb8\x00\x0f\x10\xb9\x00\x20\x00\x02\xf4\xba\x00\
-\x2f\x00\x01\x00\x20\x11\x12\x39\xb8\x00\x2f\x2f\x30\x31\x01\x15\
-\x23\x27\x07\x17\x1e\x03\x15\x14\x0e\x02\x23\x22\x2e\x02\x35\x34\
-\x36\x37\x17\x0e\x01\x15\x14\x1e\x02\x33\x32\x3e\x02\x35\x34\x2e\
-\x02\x2f\x01\x07\x17\x15\x23\x11\x02\x34\x73\x3d\x01\x28\x1b\x35\
-\x29\x1a\x27\x47\x65\x3e\x3c\x64\x4a\x29\x5b\x4a\x26\x42\x45\x1e\
-\x37\x4c\x2e\x2f\x4c\x35\x1d\x12\x20\x2c\x1b\x2b\x03\x05\x44\x02\
-\xba\x44\x05\x03\x21\x16\x36\x47\x5c\x3b\x45\x73\x53\x2e\x2b\x51\
-\x71\x47\x61\x9b\x2d\x31\x2a\x7b\x53\x39\x5b\x40\x22\x26\x44\x5b\
-\x36\x2d\x48\x3a\x31\x17\x24\x01\x39\x74\x01\x20\x00\x00\x00\x00\
-\x01\x00\x1a\xff\xf4\x02\x3e\x02\xba\x00\x30\x00\x51\xba\x00\x20\
-\x00\x31\x00\x32\x11\x12\x39\x00\xb8\x00\x00\x45\x58\xb8\x00\x2f\
-\x2f\x1b\xb9\x00\x2f\x00\x1c\x3e\x59\xb8\x00\x00\x45\x58\xb8\x00\
-\x20\x2f\x1b\xb9\x00\x20\x00\x0e\x3e\x59\xb8\x00\x2f\x10\xb9\x00\
-\x2e\x00\x02\xf4\xb8\x00\x20\x10\xb9\x00\x0f\x00\x02\xf4\xba\x00\
-\x01\x00\x2e\x00\x0f\x11\x12\x39\xb8\x00\x01\x2f\x30\x31\x01\x23\
-\x35\x37\x27\x07\x0e\x03\x15\x14\x1e\x02\x33\x32\x3e\x02\x35\x34\
-\x26\x27\x37\x1e\x01\x15\x14\x0e\x02\x23\x22\x2e\x02\x35\x34\x3e\
-\x02\x3f\x01\x27\x07\x23\x35\x21\x01\x44\x44\x05\x03\x2b\x1b\x2c\
-\x20\x12\x1d\x35\x4c\x2f\x2e\x4c\x37\x1e\x45\x42\x26\x4a\x5b\x29\
-\x4a\x64\x3c\x3e\x65\x47\x27\x1a\x29\x35\x1b\x28\x01\x3d\x73\x01\
-\x20\x01\x9a\x74\x39\x01\x24\x17\x31\x3a\x48\x2d\x36\x5b\x44\x26\
-\x22\x40\x5b\x39\x53\x7b\x2a\x31\x2d\x9b\x61\x47\x71\x51\x2b\x2e\
-\x53\x73\x45\x3b\x5c\x47\x36\x16\x21\x03\x05\x44\x00\x00\x00\x00\
-\x01\x00\x84\x02\x64\x01\xd4\x02\xd8\x00\x19\x00\x81\xba\x00\x03\
-\x00\x1a\x00\x1b\x11\x12\x39\x00\x7d\xb8\x00\x00\x2f\x18\x41\x03\
-\x00\x4f\x00\x00\x00\x01\x5d\x41\x03\x00\x2f\x00\x00\x00\x01\x5d\
-\x41\x03\x00\xcf\x00\x00\x00\x01\x5d\x41\x03\x00\x0f\x00\x00\x00\
-\x01\x5d\x41\x03\x00\x50\x00\x00\x00\x01\x71\x41\x03\x00\x30\x00\
-\x00\x00\x01\x71\xb8\x00\x06\xdc\xba\x00\x09\x00\x06\x00\x00\x11\
-\x12\x39\x7d\xb8\x00\x09\x2f\x18\xb8\x00\x06\x10\xb9\x00\x0d\x00\
-\x05\xf4\xb8\x00\x00\x10\xb9\x00\x13\x00\x05\xf4\xba\x00\x16\x00\
-\x0d\x00\x13\x11\x12\x39\x7c\xb8\x00\x16\x2f\x18\x30\x31\x01\x22\
-\x26\x27\x2e\x01\x23\x22\x06\x07\x27\x3e\x01\x33\x32\x16\x17\x1e\
-\x01\x33\x32\x36\x37\x17\x0e\x01\x01\x75\x1a\x26\x10\x18\x21\x0d\
-\x11\x1a\x0f\x21\x0e\x2e\x23\x1a\x26\x10\x18\x21\x0d\x11\x1a\x0f\
-\x21\x0e\x2e\x02\x64\x12\x08\x0d\x0b\x0e\x0d\x28\x14\x21\x12\x08\
-\x0d\x0b\x0e\x0d\x28\x14\x21\x00\x01\x00\x92\x02\x68\x01\xc6\x02\
-\xd4\x00\x19\x00\x78\xba\x00\x03\x00\x1a\x00\x1b\x11\x12\x39\x00\
-\x7d\xb8\x00\x00\x2f\x18\x41\x03\x00\xcf\x00\x00\x00\x01\x5d\x41\
-\x03\x00\x2f\x00\x00\x00\x01\x5d\x41\x03\x00\x0f\x00\x00\x00\x01\
-\x5d\x41\x03\x00\x50\x00\x00\x00\x01\x71\x41\x03\x00\x30\x00\x00\
-\x00\x01\x71\xb8\x00\x06\xdc\xba\x00\x09\x00\x06\x00\x00\x11\x12\
-\x39\x7d\xb8\x00\x09\x2f\x18\xb8\x00\x06\x10\xb9\x00\x0d\x00\x05\
-\xf4\xb8\x00\x00\x10\xb9\x00\x13\x00\x05\xf4\xba\x00\x16\x00\x0d\
-\x00\x13\x11\x12\x39\x7c\xb8\x00\x16\x2f\x18\x30\x31\x01\x22\x26\
-\x27\x2e\x01\x23\x22\x06\x07\x27\x3e\x01\x33\x32\x16\x17\x1e\x01\
-\x33\x32\x36\x37\x17\x0e\x01\x01\x6b\x17\x21\x0e\x13\x18\x0e\x10\
-\x1b\x0e\x21\x0e\x2d\x20\x17\x21\x0e\x13\x18\x0e\x10\x1b\x0e\x21\
-\x0e\x2d\x02\x68\x0f\x07\x0a\x0a\x0e\x0d\x28\x14\x21\x0f\x07\x0a\
-\x0a\x0e\x0d\x28\x14\x21\x00\x00\x01\x00\xa0\x02\x7d\x01\xb8\x02\
-\xc1\x00\x03\x00\x44\xba\x00\x03\x00\x04\x00\x05\x11\x12\x39\x00\
-\xb8\x00\x03\x2f\x41\x03\x00\x70\x00\x03\x00\x01\x71\x41\x03\x00\
-\xcf\x00\x03\x00\x01\x5d\x41\x03\x00\x30\x00\x03\x00\x01\x5d\x41\
-\x03\x00\xc0\x00\x03\x00\x01\x71\x41\x03\x00\x10\x00\x03\x00\x01\
-\x71\xb9\x00\x00\x00\x05\xf4\x30\x31\x13\x21\x15\x21\xa0\x01\x18\
-\xfe\xe8\x02\xc1\x44\x00\x00\x00\x01\x00\xed\x02\x64\x01\x6b\x02\
-\xda\x00\x0d\x00\x17\xba\x00\x00\x00\x0e\x00\x0f\x11\x12\x39\x00\
-\xbb\x00\x07\x00\x06\x00\x00\x00\x04\x2b\x30\x31\x01\x22\x26\x3d\
-\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x01\x2c\x23\x1c\x1c\x23\
-\x23\x1c\x1c\x02\x64\x1d\x16\x10\x16\x1d\x1d\x16\x10\x16\x1d\x00\
-\x02\x00\x96\x02\x6a\x01\xc2\x02\xd4\x00\x0d\x00\x1b\x00\x2d\xba\
-\x00\x0b\x00\x1c\x00\x1d\x11\x12\x39\xb8\x00\x0b\x10\xb8\x00\x11\
-\xd0\x00\xba\x00\x07\x00\x00\x00\x03\x2b\xb8\x00\x00\x10\xb8\x00\
-\x0e\xd0\xb8\x00\x07\x10\xb8\x00\x15\xd0\x30\x31\x13\x22\x26\x3d\
-\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x33\x22\x26\x3d\x01\x34\
-\x36\x33\x32\x16\x1d\x01\x14\x06\xcf\x1f\x1a\x1a\x1f\x1f\x1a\x1a\
-\x9b\x1f\x1a\x1a\x1f\x1f\x1a\x1a\x02\x6a\x1a\x14\x0e\x14\x1a\x1a\
-\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x00\x00\
-\x02\x00\xb3\x02\x4a\x01\xed\x03\x0a\x00\x03\x00\x07\x00\x38\xba\
-\x00\x03\x00\x08\x00\x09\x11\x12\x39\xb8\x00\x03\x10\xb8\x00\x05\
-\xd0\x00\xb8\x00\x00\x2f\x41\x03\x00\x2f\x00\x00\x00\x01\x5d\x41\
-\x03\x00\x0f\x00\x00\x00\x01\x5d\x41\x03\x00\x50\x00\x00\x00\x01\
-\x71\xb8\x00\x04\xd0\x30\x31\x13\x27\x37\x1f\x01\x27\x37\x17\xe3\
-\x30\x55\x45\x36\x30\x55\x45\x02\x4a\x16\xaa\x21\x9f\x16\xaa\x21\
-\x00\x00\x00\x00\x01\x00\xff\x02\x49\x01\x9d\x03\x0b\x00\x03\x00\
-\x23\xba\x00\x00\x00\x04\x00\x05\x11\x12\x39\x00\xb8\x00\x00\x2f\
-\x41\x03\x00\x2f\x00\x00\x00\x01\x5d\x41\x03\x00\x0f\x00\x00\x00\
-\x01\x5d\x30\x31\x01\x27\x37\x17\x01\x33\x34\x55\x49\x02\x49\x18\
-\xaa\x23\x00\x00\x01\x00\xbb\x02\x49\x01\x59\x03\x0b\x00\x03\x00\
-\x23\xba\x00\x03\x00\x04\x00\x05\x11\x12\x39\x00\xb8\x00\x03\x2f\
-\x41\x03\x00\x2f\x00\x03\x00\x01\x5d\x41\x03\x00\x0f\x00\x03\x00\
-\x01\x5d\x30\x31\x13\x37\x17\x07\xbb\x49\x55\x34\x02\xe8\x23\xaa\
-\x18\x00\x00\x00\x01\x00\x8b\x02\x4f\x01\xcd\x02\xfd\x00\x06\x00\
-\x42\xba\x00\x03\x00\x07\x00\x08\x11\x12\x39\x00\xb8\x00\x04\x2f\
-\x41\x03\x00\x0f\x00\x04\x00\x01\x5d\x41\x03\x00\x80\x00\x04\x00\
-\x01\x71\x41\x03\x00\x30\x00\x04\x00\x01\x71\xb8\x00\x02\xd0\xb8\
-\x00\x04\x10\xb8\x00\x06\xdc\xba\x00\x03\x00\x06\x00\x04\x11\x12\
-\x39\x30\x31\x01\x17\x07\x27\x07\x27\x37\x01\x5e\x6f\x2d\x75\x75\
-\x2b\x6f\x02\xfd\x8f\x1f\x75\x75\x1f\x8f\x00\x00\x01\x00\x8b\x02\
-\x57\x01\xcd\x03\x05\x00\x06\x00\x47\xba\x00\x03\x00\x07\x00\x08\
-\x11\x12\x39\x00\xb8\x00\x00\x2f\x41\x03\x00\x70\x00\x00\x00\x01\
-\x5d\x41\x03\x00\x0f\x00\x00\x00\x01\x5d\x41\x03\x00\x10\x00\x00\
-\x00\x01\x71\x41\x03\x00\xc0\x00\x00\x00\x01\x5d\xb8\x00\x02\xdc\
-\xba\x00\x03\x00\x02\x00\x00\x11\x12\x39\xb8\x00\x04\xd0\x30\x31\
-\x13\x27\x37\x17\x37\x17\x07\xfa\x6f\x2e\x75\x75\x2a\x6f\x02\x57\
-\x8f\x1f\x75\x75\x1f\x8f\x00\x00\x01\x00\x8b\x02\x53\x01\xcd\x03\
-\x00\x00\x17\x00\x29\xba\x00\x00\x00\x18\x00\x19\x11\x12\x39\x00\
-\xb8\x00\x00\x2f\x41\x03\x00\x0f\x00\x00\x00\x01\x5d\x41\x03\x00\
-\x70\x00\x00\x00\x01\x5d\xb9\x00\x0c\x00\x05\xf4\x30\x31\x01\x22\
-\x2e\x02\x27\x37\x17\x1e\x03\x33\x32\x3e\x02\x3f\x01\x17\x0e\x03\
-\x01\x2c\x28\x37\x25\x16\x07\x33\x15\x0c\x12\x13\x17\x11\x10\x18\
-\x13\x12\x0c\x15\x33\x07\x16\x25\x37\x02\x53\x1e\x2d\x35\x17\x16\
-\x22\x13\x1c\x12\x09\x09\x12\x1c\x13\x22\x16\x17\x35\x2d\x1e\x00\
-\x01\x00\x85\x02\x53\x01\xd3\x03\x00\x00\x11\x00\x20\xba\x00\x00\
-\x00\x12\x00\x13\x11\x12\x39\x00\xb8\x00\x00\x2f\x41\x03\x00\x0f\
-\x00\x00\x00\x01\x5d\xb9\x00\x09\x00\x05\xf4\x30\x31\x01\x22\x26\
-\x2f\x01\x37\x17\x1e\x01\x33\x32\x36\x3f\x01\x17\x07\x0e\x01\x01\
-\x2c\x33\x40\x18\x1c\x48\x28\x0b\x20\x0c\x0c\x20\x0b\x28\x48\x1c\
-\x18\x40\x02\x53\x2d\x30\x39\x17\x6a\x04\x02\x02\x04\x6a\x17\x39\
-\x30\x2d\x00\x00\x02\x00\xb8\x02\x40\x01\xa0\x03\x26\x00\x13\x00\
-\x21\x00\x4d\xba\x00\x00\x00\x22\x00\x23\x11\x12\x39\xb8\x00\x14\
-\xd0\x00\xb8\x00\x00\x2f\x41\x03\x00\x0f\x00\x00\x00\x01\x5d\x41\
-\x03\x00\x4f\x00\x00\x00\x01\x5d\x41\x03\x00\x2f\x00\x00\x00\x01\
-\x5d\x41\x03\x00\x20\x00\x00\x00\x01\x71\xb8\x00\x1b\xdc\xb9\x00\
-\x0a\x00\x03\xf4\xb8\x00\x00\x10\xb9\x00\x14\x00\x03\xf4\x30\x31\
-\x01\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x0e\x02\
-\x27\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x01\x2c\
-\x18\x2b\x1f\x12\x12\x1f\x2b\x18\x18\x2b\x1f\x12\x12\x1f\x2b\x18\
-\x1b\x1f\x1f\x1b\x1b\x1f\x1f\x02\x40\x11\x1f\x2a\x19\x19\x2a\x1f\
-\x11\x11\x1f\x2a\x19\x19\x2a\x1f\x11\x31\x1d\x1a\x16\x1a\x1d\x1d\
-\x1a\x16\x1a\x1d\x00\x00\x00\x00\x03\x00\xb8\x02\x36\x01\xa0\x03\
-\xbc\x00\x03\x00\x17\x00\x25\x00\x66\xba\x00\x04\x00\x26\x00\x27\
-\x11\x12\x39\xb8\x00\x04\x10\xb8\x00\x00\xd0\xb8\x00\x04\x10\xb8\
-\x00\x18\xd0\x00\xb8\x00\x04\x2f\x41\x03\x00\x0f\x00\x04\x00\x01\
-\x5d\x41\x03\x00\x6f\x00\x04\x00\x01\x5d\x41\x03\x00\x2f\x00\x04\
-\x00\x01\x5d\x41\x03\x00\x4f\x00\x04\x00\x01\x5d\x41\x03\x00\xcf\
-\x00\x04\x00\x01\x5d\xb8\x00\x1f\xdc\xb9\x00\x0e\x00\x03\xf4\xb8\
-\x00\x00\xdc\xb8\x00\x04\x10\xb9\x00\x18\x00\x03\xf4\x30\x31\x01\
-\x27\x37\x17\x03\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\
-\x14\x0e\x02\x27\x32\x36\x3d\x01\x34\x26\x23\x22\x06\x1d\x01\x14\
-\x16\x01\x37\x29\x4b\x3c\x69\x18\x2b\x1f\x12\x12\x1f\x2b\x18\x18\
-\x2b\x1f\x12\x12\x1f\x2b\x18\x1b\x1f\x1f\x1b\x1b\x1f\x1f\x03\x2e\
-\x1a\x74\x25\xfe\x9f\x11\x1f\x2a\x19\x19\x2a\x1f\x11\x11\x1f\x2a\
-\x19\x19\x2a\x1f\x11\x31\x1d\x1a\x16\x1a\x1d\x1d\x1a\x16\x1a\x1d\
-\x00\x00\x00\x00\x01\x00\xf3\x02\x4b\x01\x7c\x03\x08\x00\x03\x00\
-\x23\xba\x00\x00\x00\x04\x00\x05\x11\x12\x39\x00\xb8\x00\x03\x2f\
-\x41\x03\x00\x2f\x00\x03\x00\x01\x5d\x41\x03\x00\x0f\x00\x03\x00\
-\x01\x5d\x30\x31\x01\x33\x07\x23\x01\x3f\x3d\x1c\x6d\x03\x08\xbd\
-\x00\x00\x00\x00\x01\x00\xbe\x02\x27\x01\x2c\x02\xe4\x00\x03\x00\
-\x3e\xba\x00\x03\x00\x04\x00\x05\x11\x12\x39\x00\xb8\x00\x01\x2f\
-\x41\x03\x00\x2f\x00\x01\x00\x01\x5d\x41\x03\x00\x6f\x00\x01\x00\
-\x01\x5d\x41\x03\x00\x4f\x00\x01\x00\x01\x5d\x41\x03\x00\x8f\x00\
-\x01\x00\x01\x5d\x41\x03\x00\x0e\x00\x01\x00\x01\x5d\x30\x31\x13\
-\x23\x37\x33\xfb\x3d\x07\x67\x02\x27\xbd\x00\x00\x01\x00\xd5\xff\
-\x31\x01\xa7\x00\x14\x00\x1b\x00\x34\xba\x00\x0d\x00\x1c\x00\x1d\
-\x11\x12\x39\x00\xb8\x00\x10\x2f\xb8\x00\x14\xdc\x41\x07\x00\x0f\
-\x00\x14\x00\x1f\x00\x14\x00\x2f\x00\x14\x00\x03\x5d\xb8\x00\x0d\
-\xd0\xb8\x00\x07\xdc\xb9\x00\x00\x00\x03\xf4\x30\x31\x05\x22\x26\
-\x27\x37\x1e\x01\x33\x32\x36\x35\x34\x26\x2f\x01\x37\x33\x07\x17\
-\x36\x33\x32\x16\x15\x14\x0e\x02\x01\x38\x29\x2f\x0b\x26\x09\x1e\
-\x16\x13\x19\x1a\x2a\x1c\x13\x32\x10\x03\x13\x14\x1d\x27\x12\x1f\
-\x28\xcf\x1b\x0e\x29\x0b\x11\x0f\x10\x0e\x15\x06\x04\x61\x51\x03\
-\x06\x22\x20\x15\x20\x14\x0a\x00\x01\x00\x77\xff\x31\x01\x41\x00\
-\x13\x00\x16\x00\x24\xba\x00\x09\x00\x17\x00\x18\x11\x12\x39\x00\
-\xb8\x00\x00\x45\x58\xb8\x00\x00\x2f\x1b\xb9\x00\x00\x00\x10\x3e\
-\x59\xb9\x00\x11\x00\x03\xf4\x30\x31\x17\x22\x26\x35\x34\x36\x37\
-\x27\x37\x17\x0e\x03\x15\x14\x16\x33\x32\x37\x17\x0e\x01\xe4\x2e\
-\x3f\x3a\x39\x06\x41\x07\x27\x2d\x17\x06\x1a\x10\x1f\x15\x28\x0a\
-\x2d\xcf\x28\x28\x24\x3d\x1b\x0f\x07\x13\x18\x24\x1b\x14\x07\x15\
-\x10\x1a\x29\x11\x18\x00\x00\xff\xff\xff\x59\x02\x64\x00\xa9\x02\
-\xd8\x00\x07\x03\x04\xfe\xd5\x00\x00\x00\x00\xff\xff\xff\x75\x02\
-\x7d\x00\x8d\x02\xc1\x00\x07\x03\x06\xfe\xd5\x00\x00\x00\x00\xff\
-\xff\xff\xc2\x02\x64\x00\x40\x02\xda\x00\x07\x03\x07\xfe\xd5\x00\
-\x00\x00\x00\xff\xff\xff\x6b\x02\x6a\x00\x97\x02\xd4\x00\x07\x03\
-\x08\xfe\xd5\x00\x00\x00\x00\xff\xff\xff\x88\x02\x4a\x00\xc2\x03\
-\x0a\x00\x07\x03\x09\xfe\xd5\x00\x00\x00\x00\xff\xff\xff\xd4\x02\
-\x49\x00\x72\x03\x0b\x00\x07\x03\x0a\xfe\xd5\x00\x00\x00\x00\xff\
-\xff\xff\x90\x02\x49\x00\x2e\x03\x0b\x00\x07\x03\x0b\xfe\xd5\x00\
-\x00\x00\x00\xff\xff\xff\x60\x02\x4f\x00\xa2\x02\xfd\x00\x07\x03\
-\x0c\xfe\xd5\x00\x00\x00\x00\xff\xff\xff\x60\x02\x57\x00\xa2\x03\
-\x05\x00\x07\x03\x0d\xfe\xd5\x00\x00\x00\x00\xff\xff\xff\x60\x02\
-\x53\x00\xa2\x03\x00\x00\x07\x03\x0e\xfe\xd5\x00\x00\x00\x00\xff\
-\xff\xff\x8d\x02\x40\x00\x75\x03\x26\x00\x07\x03\x10\xfe\xd5\x00\
-\x00\x00\x00\x00\x01\xff\xac\x02\x41\x00\x5f\x02\xfd\x00\x0b\x00\
-\x61\x00\xb8\x00\x08\x2f\x41\x03\x00\xd0\x00\x08\x00\x01\x5d\x41\
-\x03\x00\x2f\x00\x08\x00\x01\x5d\x41\x05\x00\x9f\x00\x08\x00\xaf\
-\x00\x08\x00\x02\x5d\x41\x03\x00\x7f\x00\x08\x00\x01\x71\x41\x03\
-\x00\x0f\x00\x08\x00\x01\x5d\x41\x03\x00\xaf\x00\x08\x00\x01\x71\
-\x41\x03\x00\x00\x00\x08\x00\x01\x72\x41\x05\x00\xd0\x00\x08\x00\
-\xe0\x00\x08\x00\x02\x71\xb8\x00\x0b\xdc\xb9\x00\x00\x00\x05\xf4\
-\x30\x31\x03\x33\x32\x16\x15\x14\x06\x0f\x01\x27\x37\x23\x54\x6d\
-\x26\x20\x1a\x17\x18\x2e\x3a\x76\x02\xfd\x20\x17\x16\x34\x1d\x1e\
-\x17\x68\x00\xff\xff\xff\xc8\x02\x4b\x00\x51\x03\x08\x00\x07\x03\
-\x12\xfe\xd5\x00\x00\x00\x00\xff\xff\x00\x01\x02\x27\x00\x6f\x02\
-\xe4\x00\x07\x03\x13\xff\x43\x00\x00\x00\x00\x00\x01\xff\xb3\x01\
-\xcf\x00\x4d\x02\x74\x00\x08\x00\x20\x00\xb8\x00\x00\x45\x58\xb8\
-\x00\x05\x2f\x1b\xb9\x00\x05\x00\x1a\x3e\x59\xb8\x00\x03\xdc\xb8\
-\x00\x05\x10\xb8\x00\x07\xdc\x30\x31\x13\x14\x06\x2b\x01\x35\x33\
-\x35\x33\x4d\x19\x26\x5b\x53\x47\x02\x0e\x1a\x25\x35\x70\x00\xff\
-\xff\xff\xaa\xff\x31\x00\x7c\x00\x14\x00\x07\x03\x14\xfe\xd5\x00\
-\x00\x00\x00\x00\x01\xff\xc7\xff\x54\x00\x39\xff\xbe\x00\x0d\x00\
-\x0d\x00\xb8\x00\x07\x2f\xb9\x00\x00\x00\x06\xf4\x30\x31\x15\x22\
-\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x1f\x1a\x1a\x1f\
-\x1f\x1a\x1a\xac\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x00\x00\
-\x01\xff\xb0\xff\x05\x00\x39\xff\xc2\x00\x03\x00\x07\x00\xb8\x00\
-\x00\x2f\x30\x31\x07\x33\x07\x23\x34\x6d\x4c\x3d\x3e\xbd\x00\xff\
-\xff\xff\x4c\xff\x31\x00\x16\x00\x13\x00\x07\x03\x15\xfe\xd5\x00\
-\x00\x00\x00\x00\x02\xff\x5a\x02\x49\x00\xa6\x03\x85\x00\x13\x00\
-\x17\x00\x2c\x00\xb8\x00\x00\x2f\x41\x03\x00\xcf\x00\x00\x00\x01\
-\x5d\x41\x03\x00\x2f\x00\x00\x00\x01\x5d\x41\x03\x00\x0f\x00\x00\
-\x00\x01\x5d\xb9\x00\x0a\x00\x05\xf4\xb8\x00\x14\xdc\x30\x31\x03\
-\x22\x2e\x02\x27\x37\x17\x1e\x01\x33\x32\x36\x3f\x01\x17\x0e\x03\
-\x2f\x01\x37\x17\x01\x28\x38\x27\x17\x07\x2f\x15\x18\x29\x21\x21\
-\x29\x18\x15\x2f\x08\x19\x27\x38\x1f\x31\x55\x46\x02\x49\x1b\x29\
-\x31\x16\x17\x20\x24\x1e\x1e\x24\x20\x17\x18\x32\x28\x19\x7b\x17\
-\xaa\x22\x00\x00\x02\xff\x5a\x02\x49\x00\xa6\x03\x85\x00\x13\x00\
-\x17\x00\x2c\x00\xb8\x00\x00\x2f\x41\x03\x00\xcf\x00\x00\x00\x01\
-\x5d\x41\x03\x00\x2f\x00\x00\x00\x01\x5d\x41\x03\x00\x0f\x00\x00\
-\x00\x01\x5d\xb9\x00\x0a\x00\x05\xf4\xb8\x00\x17\xdc\x30\x31\x13\
-\x22\x2e\x02\x27\x37\x17\x1e\x01\x33\x32\x36\x3f\x01\x17\x0e\x03\
-\x03\x37\x17\x07\x01\x27\x38\x27\x19\x08\x2f\x15\x18\x29\x21\x21\
-\x29\x18\x15\x2f\x07\x17\x27\x38\x9a\x46\x55\x31\x02\x49\x19\x28\
-\x32\x18\x17\x20\x24\x1e\x1e\x24\x20\x17\x16\x31\x29\x1b\x01\x1a\
-\x22\xaa\x17\x00\x02\xff\x5a\x02\x49\x00\xa6\x03\x7a\x00\x13\x00\
-\x1f\x00\x36\x00\xb8\x00\x00\x2f\x41\x03\x00\xcf\x00\x00\x00\x01\
-\x5d\x41\x03\x00\x2f\x00\x00\x00\x01\x5d\x41\x03\x00\x0f\x00\x00\
-\x00\x01\x5d\xb9\x00\x0a\x00\x05\xf4\xb8\x00\x1c\xdc\xb8\x00\x1e\
-\xdc\xb9\x00\x15\x00\x05\xf4\x30\x31\x13\x22\x2e\x02\x27\x37\x17\
-\x1e\x01\x33\x32\x36\x3f\x01\x17\x0e\x03\x03\x33\x32\x16\x15\x14\
-\x06\x0f\x01\x27\x37\x23\x01\x27\x38\x27\x19\x08\x2f\x15\x18\x29\
-\x21\x21\x29\x18\x15\x2f\x07\x17\x27\x38\x7e\x5e\x26\x20\x1a\x17\
-\x18\x2e\x3a\x67\x02\x49\x19\x28\x32\x18\x17\x20\x24\x1e\x1e\x24\
-\x20\x17\x16\x31\x29\x1b\x01\x31\x20\x17\x16\x34\x1d\x1e\x17\x68\
-\x00\x00\x00\x00\x02\xff\x59\x02\x49\x00\xa7\x03\x71\x00\x13\x00\
-\x2d\x00\x68\x00\xb8\x00\x00\x2f\x41\x03\x00\xcf\x00\x00\x00\x01\
-\x5d\x41\x03\x00\x2f\x00\x00\x00\x01\x5d\x41\x03\x00\x0f\x00\x00\
-\x00\x01\x5d\xb9\x00\x0a\x00\x05\xf4\xb8\x00\x06\xdc\xb8\x00\x0e\
-\xd0\xb8\x00\x14\xdc\xb8\x00\x1a\xdc\xb9\x00\x21\x00\x05\xf4\xba\
-\x00\x1d\x00\x21\x00\x14\x11\x12\x39\x7d\xb8\x00\x1d\x2f\x18\xb8\
-\x00\x14\x10\xb9\x00\x27\x00\x05\xf4\xba\x00\x2a\x00\x21\x00\x14\
-\x11\x12\x39\x7c\xb8\x00\x2a\x2f\x18\x30\x31\x13\x22\x2e\x02\x27\
-\x37\x17\x1e\x01\x33\x32\x36\x3f\x01\x17\x0e\x03\x37\x22\x26\x27\
-\x2e\x01\x23\x22\x06\x07\x27\x3e\x01\x33\x32\x16\x17\x1e\x01\x33\
-\x32\x36\x37\x17\x0e\x01\x01\x27\x38\x27\x19\x08\x2f\x15\x18\x29\
-\x21\x21\x29\x18\x15\x2f\x07\x17\x27\x38\x1f\x1a\x26\x10\x18\x21\
-\x0d\x11\x1a\x0f\x1f\x0e\x2e\x23\x1a\x26\x10\x18\x21\x0d\x11\x1a\
-\x0f\x1f\x0e\x2e\x02\x49\x19\x28\x32\x18\x17\x20\x24\x1e\x1e\x24\
-\x20\x17\x16\x31\x29\x1b\xb8\x12\x08\x0d\x0b\x0e\x0d\x24\x14\x21\
-\x12\x08\x0d\x0b\x0e\x0d\x24\x14\x21\x00\x00\x00\x03\xff\x64\x02\
-\x55\x00\x9c\x03\x89\x00\x03\x00\x11\x00\x1f\x00\x2a\x00\xb8\x00\
-\x04\x2f\x41\x03\x00\x0f\x00\x04\x00\x01\x5d\xb9\x00\x0b\x00\x06\
-\xf4\xb8\x00\x00\xd0\xb8\x00\x04\x10\xb8\x00\x12\xd0\xb8\x00\x0b\
-\x10\xb8\x00\x19\xd0\x30\x31\x13\x27\x37\x17\x03\x22\x26\x3d\x01\
-\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x33\x22\x26\x3d\x01\x34\x36\
-\x33\x32\x16\x1d\x01\x14\x06\x0c\x31\x55\x46\xd9\x1f\x1a\x1a\x1f\
-\x1f\x1a\x1a\xa7\x1f\x1a\x1a\x1f\x1f\x1a\x1a\x02\xc8\x17\xaa\x22\
-\xfe\xee\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\
-\x1a\x1a\x14\x0e\x14\x1a\x00\x00\x03\xff\x60\x02\x55\x00\xa0\x03\
-\x87\x00\x06\x00\x14\x00\x22\x00\x2a\x00\xb8\x00\x07\x2f\x41\x03\
-\x00\x0f\x00\x07\x00\x01\x5d\xb9\x00\x0e\x00\x06\xf4\xb8\x00\x00\
-\xdc\xb8\x00\x07\x10\xb8\x00\x15\xd0\xb8\x00\x0e\x10\xb8\x00\x1c\
-\xd0\x30\x31\x03\x27\x37\x17\x37\x17\x0f\x01\x22\x26\x3d\x01\x34\
-\x36\x33\x32\x16\x1d\x01\x14\x06\x33\x22\x26\x3d\x01\x34\x36\x33\
-\x32\x16\x1d\x01\x14\x06\x2c\x74\x2a\x75\x75\x2c\x74\x8f\x1f\x1a\
-\x1a\x1f\x1f\x1a\x1a\xa7\x1f\x1a\x1a\x1f\x1f\x1a\x1a\x02\xd9\x90\
-\x1e\x73\x73\x1e\x90\x84\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\
-\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x00\x00\x03\xff\x64\x02\
-\x55\x00\x9c\x03\x89\x00\x03\x00\x11\x00\x1f\x00\x2a\x00\xb8\x00\
-\x04\x2f\x41\x03\x00\x0f\x00\x04\x00\x01\x5d\xb9\x00\x0b\x00\x06\
-\xf4\xb8\x00\x03\xd0\xb8\x00\x04\x10\xb8\x00\x12\xd0\xb8\x00\x0b\
-\x10\xb8\x00\x19\xd0\x30\x31\x03\x37\x17\x0f\x01\x22\x26\x3d\x01\
-\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x33\x22\x26\x3d\x01\x34\x36\
-\x33\x32\x16\x1d\x01\x14\x06\x76\x46\x55\x31\x57\x1f\x1a\x1a\x1f\
-\x1f\x1a\x1a\xa7\x1f\x1a\x1a\x1f\x1f\x1a\x1a\x03\x67\x22\xaa\x17\
-\x73\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\
-\x1a\x14\x0e\x14\x1a\x00\x00\x00\x02\xff\x60\x02\x45\x01\x04\x03\
-\x89\x00\x03\x00\x0a\x00\x37\x00\xb8\x00\x08\x2f\x41\x03\x00\x2f\
-\x00\x08\x00\x01\x5d\x41\x03\x00\x0f\x00\x08\x00\x01\x5d\xb8\x00\
-\x00\xdc\xb8\x00\x08\x10\xb8\x00\x06\xd0\xb8\x00\x08\x10\xb8\x00\
-\x0a\xdc\xba\x00\x07\x00\x08\x00\x0a\x11\x12\x39\x30\x31\x13\x27\
-\x37\x17\x07\x17\x07\x27\x07\x27\x37\x9a\x31\x55\x46\xd2\x6e\x2c\
-\x75\x75\x2a\x6e\x02\xc8\x17\xaa\x22\x74\x90\x1e\x77\x77\x1e\x90\
-\x00\x00\x00\x00\x02\xff\x61\x02\x48\x00\x9f\x03\x72\x00\x06\x00\
-\x1a\x00\x39\x00\xb8\x00\x04\x2f\x41\x03\x00\x2f\x00\x04\x00\x01\
-\x5d\x41\x03\x00\x0f\x00\x04\x00\x01\x5d\xb8\x00\x02\xd0\xb8\x00\
-\x04\x10\xb8\x00\x06\xdc\xba\x00\x03\x00\x04\x00\x06\x11\x12\x39\
-\xb8\x00\x07\xdc\xb9\x00\x11\x00\x05\xf4\x30\x31\x13\x17\x07\x27\
-\x07\x27\x3f\x01\x22\x2e\x02\x27\x37\x17\x1e\x01\x33\x32\x36\x3f\
-\x01\x17\x0e\x03\x2e\x70\x22\x7d\x7d\x20\x70\x2e\x26\x36\x25\x17\
-\x07\x2f\x14\x14\x2b\x1d\x1d\x2b\x14\x14\x2f\x07\x17\x25\x36\x02\
-\xd1\x67\x22\x57\x57\x22\x67\x18\x16\x21\x29\x12\x17\x1d\x1e\x12\
-\x12\x1e\x1d\x17\x12\x29\x21\x16\x00\x00\x00\x00\x02\xfe\xfc\x02\
-\x45\x00\xa0\x03\x89\x00\x03\x00\x0a\x00\x37\x00\xb8\x00\x08\x2f\
-\x41\x03\x00\x2f\x00\x08\x00\x01\x5d\x41\x03\x00\x0f\x00\x08\x00\
-\x01\x5d\xb8\x00\x03\xdc\xb8\x00\x08\x10\xb8\x00\x06\xd0\xb8\x00\
-\x08\x10\xb8\x00\x0a\xdc\xba\x00\x07\x00\x0a\x00\x08\x11\x12\x39\
-\x30\x31\x01\x37\x17\x07\x37\x17\x07\x27\x07\x27\x37\xfe\xfc\x46\
-\x55\x31\xcc\x6e\x2c\x75\x75\x2a\x6e\x03\x67\x22\xaa\x17\x2b\x90\
-\x1e\x77\x77\x1e\x90\x00\x00\x00\x02\xff\x60\x02\x45\x00\xe8\x03\
-\x7e\x00\x0b\x00\x12\x00\x49\x00\xb8\x00\x10\x2f\x41\x03\x00\x2f\
-\x00\x10\x00\x01\x5d\x41\x03\x00\x0f\x00\x10\x00\x01\x5d\xb8\x00\
-\x12\xdc\xba\x00\x0f\x00\x12\x00\x10\x11\x12\x39\xba\x00\x08\x00\
-\x12\x00\x0f\x11\x12\x39\x7c\xb8\x00\x08\x2f\x18\xb8\x00\x0b\xdc\
-\xb9\x00\x00\x00\x05\xf4\xb8\x00\x10\x10\xb8\x00\x0e\xd0\x30\x31\
-\x13\x33\x32\x16\x15\x14\x06\x0f\x01\x27\x37\x23\x07\x17\x07\x27\
-\x07\x27\x37\x35\x6d\x26\x20\x1a\x17\x18\x2e\x3a\x76\x03\x6e\x2c\
-\x75\x75\x2a\x6e\x03\x7e\x20\x17\x16\x34\x1d\x1e\x17\x68\x4e\x90\
-\x1e\x77\x77\x1e\x90\x00\x00\x00\x03\xff\x64\x02\x55\x00\x9c\x03\
-\x39\x00\x03\x00\x11\x00\x1f\x00\x30\x00\xb8\x00\x04\x2f\x41\x03\
-\x00\x0f\x00\x04\x00\x01\x5d\xb9\x00\x0b\x00\x06\xf4\xb8\x00\x03\
-\xdc\xb9\x00\x00\x00\x05\xf4\xb8\x00\x04\x10\xb8\x00\x12\xd0\xb8\
-\x00\x0b\x10\xb8\x00\x19\xd0\x30\x31\x03\x21\x15\x21\x17\x22\x26\
-\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x33\x22\x26\x3d\x01\
-\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x8c\x01\x18\xfe\xe8\x29\x1f\
-\x1a\x1a\x1f\x1f\x1a\x1a\xa7\x1f\x1a\x1a\x1f\x1f\x1a\x1a\x03\x39\
-\x44\xa0\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\
-\x1a\x1a\x14\x0e\x14\x1a\x00\x00\x02\xff\x59\x02\x45\x00\xa7\x03\
-\x7c\x00\x19\x00\x20\x00\x6b\x00\xb8\x00\x1e\x2f\x41\x03\x00\x2f\
-\x00\x1e\x00\x01\x5d\x41\x03\x00\x0f\x00\x1e\x00\x01\x5d\xb8\x00\
-\x20\xdc\xb8\x00\x0d\xdc\xb8\x00\x13\xdc\xb9\x00\x00\x00\x05\xf4\
-\xb8\x00\x0d\x10\xb9\x00\x06\x00\x05\xf4\xba\x00\x09\x00\x06\x00\
-\x00\x11\x12\x39\x7c\xb8\x00\x09\x2f\x18\xba\x00\x16\x00\x13\x00\
-\x0d\x11\x12\x39\x7d\xb8\x00\x16\x2f\x18\xb8\x00\x1e\x10\xb8\x00\
-\x1c\xd0\xba\x00\x1d\x00\x1e\x00\x20\x11\x12\x39\xb8\x00\x1d\x2f\
-\x30\x31\x03\x32\x16\x17\x1e\x01\x33\x32\x36\x37\x17\x0e\x01\x23\
-\x22\x26\x27\x2e\x01\x23\x22\x06\x07\x27\x3e\x01\x1f\x01\x07\x27\
-\x07\x27\x37\x48\x1a\x26\x10\x18\x21\x0d\x11\x1a\x0f\x1f\x0e\x2e\
-\x23\x1a\x26\x10\x18\x21\x0d\x11\x1a\x0f\x1f\x0e\x2e\x9d\x6e\x2c\
-\x75\x75\x2a\x6e\x03\x7c\x12\x08\x0d\x0b\x0e\x0d\x24\x14\x21\x12\
-\x08\x0d\x0b\x0e\x0d\x24\x14\x21\x93\x86\x1e\x6f\x6f\x1e\x86\x00\
-\x01\x00\x84\x03\x0e\x01\xd4\x03\x82\x00\x19\x00\x68\xba\x00\x03\
-\x00\x1a\x00\x1b\x11\x12\x39\x00\xb8\x00\x00\x2f\x41\x03\x00\xcf\
-\x00\x00\x00\x01\x5d\x41\x05\x00\x8f\x00\x00\x00\x9f\x00\x00\x00\
-\x02\x5d\x41\x03\x00\x00\x00\x00\x00\x01\x71\xb8\x00\x06\xdc\xba\
-\x00\x09\x00\x06\x00\x00\x11\x12\x39\x7d\xb8\x00\x09\x2f\x18\xb8\
-\x00\x06\x10\xb9\x00\x0d\x00\x05\xf4\xb8\x00\x00\x10\xb9\x00\x13\
-\x00\x05\xf4\xba\x00\x16\x00\x0d\x00\x13\x11\x12\x39\x7c\xb8\x00\
-\x16\x2f\x18\x30\x31\x01\x22\x26\x27\x2e\x01\x23\x22\x06\x07\x27\
-\x3e\x01\x33\x32\x16\x17\x1e\x01\x33\x32\x36\x37\x17\x0e\x01\x01\
-\x75\x1a\x26\x10\x18\x21\x0d\x11\x1a\x0f\x21\x0e\x2e\x23\x1a\x26\
-\x10\x18\x21\x0d\x11\x1a\x0f\x21\x0e\x2e\x03\x0e\x12\x08\x0d\x0b\
-\x0e\x0d\x28\x14\x21\x12\x08\x0d\x0b\x0e\x0d\x28\x14\x21\x00\x00\
-\x01\x00\x92\x03\x12\x01\xc6\x03\x7e\x00\x19\x00\x68\xba\x00\x03\
-\x00\x1a\x00\x1b\x11\x12\x39\x00\xb8\x00\x00\x2f\x41\x03\x00\xcf\
-\x00\x00\x00\x01\x5d\x41\x05\x00\x8f\x00\x00\x00\x9f\x00\x00\x00\
-\x02\x5d\x41\x03\x00\x00\x00\x00\x00\x01\x71\xb8\x00\x06\xdc\xba\
-\x00\x09\x00\x00\x00\x06\x11\x12\x39\x7d\xb8\x00\x09\x2f\x18\xb8\
-\x00\x06\x10\xb9\x00\x0d\x00\x05\xf4\xb8\x00\x00\x10\xb9\x00\x13\
-\x00\x05\xf4\xba\x00\x16\x00\x13\x00\x0d\x11\x12\x39\x7c\xb8\x00\
-\x16\x2f\x18\x30\x31\x01\x22\x26\x27\x2e\x01\x23\x22\x06\x07\x27\
-\x3e\x01\x33\x32\x16\x17\x1e\x01\x33\x32\x36\x37\x17\x0e\x01\x01\
-\x6b\x17\x21\x0e\x13\x18\x0e\x10\x1b\x0e\x21\x0e\x2d\x20\x17\x21\
-\x0e\x13\x18\x0e\x10\x1b\x0e\x21\x0e\x2d\x03\x12\x0f\x07\x0a\x0a\
-\x0e\x0d\x28\x14\x21\x0f\x07\x0a\x0a\x0e\x0d\x28\x14\x21\x00\x00\
-\x01\x00\xa0\x03\x27\x01\xb8\x03\x6b\x00\x03\x00\x43\xba\x00\x03\
-\x00\x04\x00\x05\x11\x12\x39\x00\xb8\x00\x03\x2f\x41\x05\x00\xd0\
-\x00\x03\x00\xe0\x00\x03\x00\x02\x5d\x41\x03\x00\x30\x00\x03\x00\
-\x01\x5d\x41\x05\x00\xc0\x00\x03\x00\xd0\x00\x03\x00\x02\x71\x41\
-\x03\x00\x30\x00\x03\x00\x01\x71\xb9\x00\x00\x00\x05\xf4\x30\x31\
-\x13\x21\x15\x21\xa0\x01\x18\xfe\xe8\x03\x6b\x44\x00\x00\x00\x00\
-\x01\x00\xed\x03\x0e\x01\x6b\x03\x84\x00\x0d\x00\x36\xba\x00\x00\
-\x00\x0e\x00\x0f\x11\x12\x39\x00\xb8\x00\x00\x2f\x41\x03\x00\x00\
-\x00\x00\x00\x01\x71\x41\x03\x00\xd0\x00\x00\x00\x01\x5d\x41\x05\
-\x00\x60\x00\x00\x00\x70\x00\x00\x00\x02\x5d\xb9\x00\x07\x00\x06\
-\xf4\x30\x31\x01\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\
-\x06\x01\x2c\x23\x1c\x1c\x23\x23\x1c\x1c\x03\x0e\x1d\x16\x10\x16\
-\x1d\x1d\x16\x10\x16\x1d\x00\x00\x02\x00\x96\x03\x14\x01\xc2\x03\
-\x7e\x00\x0d\x00\x1b\x00\x57\xba\x00\x0b\x00\x1c\x00\x1d\x11\x12\
-\x39\xb8\x00\x0b\x10\xb8\x00\x11\xd0\x00\xb8\x00\x00\x2f\x41\x05\
-\x00\x60\x00\x00\x00\x70\x00\x00\x00\x02\x5d\x41\x03\x00\xa0\x00\
-\x00\x00\x01\x5d\x41\x03\x00\x00\x00\x00\x00\x01\x71\x41\x03\x00\
-\x50\x00\x00\x00\x01\x71\xb9\x00\x07\x00\x06\xf4\xb8\x00\x00\x10\
-\xb8\x00\x0e\xd0\xb8\x00\x07\x10\xb8\x00\x15\xd0\x30\x31\x13\x22\
-\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x33\x22\x26\x3d\
-\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\xcf\x1f\x1a\x1a\x1f\x1f\
-\x1a\x1a\x9b\x1f\x1a\x1a\x1f\x1f\x1a\x1a\x03\x14\x1a\x14\x0e\x14\
-\x1a\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\
-\x00\x00\x00\x00\x02\x00\xb3\x02\xf4\x01\xed\x03\xb4\x00\x03\x00\
-\x07\x00\x2f\xba\x00\x03\x00\x08\x00\x09\x11\x12\x39\xb8\x00\x03\
-\x10\xb8\x00\x05\xd0\x00\xb8\x00\x00\x2f\x41\x03\x00\x2f\x00\x00\
-\x00\x01\x5d\x41\x03\x00\xd0\x00\x00\x00\x01\x5d\xb8\x00\x04\xd0\
-\x30\x31\x13\x27\x37\x1f\x01\x27\x37\x17\xe3\x30\x55\x45\x36\x30\
-\x55\x45\x02\xf4\x16\xaa\x21\x9f\x16\xaa\x21\x00\x01\x00\xff\x02\
-\xf3\x01\x9d\x03\xb5\x00\x03\x00\x23\xba\x00\x00\x00\x04\x00\x05\
-\x11\x12\x39\x00\xb8\x00\x00\x2f\x41\x03\x00\x2f\x00\x00\x00\x01\
-\x5d\x41\x03\x00\xd0\x00\x00\x00\x01\x5d\x30\x31\x01\x27\x37\x17\
-\x01\x33\x34\x55\x49\x02\xf3\x18\xaa\x23\x00\x00\x01\x00\xbb\x02\
-\xf3\x01\x59\x03\xb5\x00\x03\x00\x23\xba\x00\x03\x00\x04\x00\x05\
-\x11\x12\x39\x00\xb8\x00\x03\x2f\x41\x03\x00\x2f\x00\x03\x00\x01\
-\x5d\x41\x03\x00\xd0\x00\x03\x00\x01\x5d\x30\x31\x13\x37\x17\x07\
-\xbb\x49\x55\x34\x03\x92\x23\xaa\x18\x00\x00\x00\x01\x00\x8b\x02\
-\xf9\x01\xcd\x03\xa7\x00\x06\x00\x39\xba\x00\x03\x00\x07\x00\x08\
-\x11\x12\x39\x00\xb8\x00\x04\x2f\x41\x03\x00\x2f\x00\x04\x00\x01\
-\x5d\x41\x03\x00\xd0\x00\x04\x00\x01\x5d\xb8\x00\x02\xd0\xb8\x00\
-\x04\x10\xb8\x00\x06\xdc\xba\x00\x03\x00\x06\x00\x04\x11\x12\x39\
-\x30\x31\x01\x17\x07\x27\x07\x27\x37\x01\x5e\x6f\x2d\x75\x75\x2b\
-\x6f\x03\xa7\x8f\x1f\x75\x75\x1f\x8f\x00\x00\x00\x01\x00\x8b\x03\
-\x01\x01\xcd\x03\xaf\x00\x06\x00\x3d\xba\x00\x03\x00\x07\x00\x08\
-\x11\x12\x39\x00\xb8\x00\x00\x2f\x41\x03\x00\x60\x00\x00\x00\x01\
-\x5d\x41\x03\x00\x2f\x00\x00\x00\x01\x5d\x41\x03\x00\xd0\x00\x00\
-\x00\x01\x5d\x41\x03\x00\xa0\x00\x00\x00\x01\x5d\xb8\x00\x02\xdc\
-\xb8\x00\x04\xd0\x30\x31\x13\x27\x37\x17\x37\x17\x07\xfa\x6f\x2d\
-\x75\x75\x2b\x6f\x03\x01\x8f\x1f\x75\x75\x1f\x8f\x00\x00\x00\x00\
-\x01\x00\x8b\x02\xfd\x01\xcd\x03\xaa\x00\x17\x00\x3b\xba\x00\x00\
-\x00\x18\x00\x19\x11\x12\x39\x00\xb8\x00\x00\x2f\x41\x03\x00\xb8\
-\x00\x00\x00\x01\x5d\x41\x03\x00\x2f\x00\x00\x00\x01\x5d\x41\x03\
-\x00\xa0\x00\x00\x00\x01\x5d\x41\x03\x00\xd0\x00\x00\x00\x01\x5d\
-\xb9\x00\x0c\x00\x05\xf4\x30\x31\x01\x22\x2e\x02\x27\x37\x17\x1e\
-\x03\x33\x32\x3e\x02\x3f\x01\x17\x0e\x03\x01\x2c\x28\x37\x25\x16\
-\x07\x33\x15\x0c\x12\x13\x17\x11\x10\x18\x13\x12\x0c\x15\x33\x07\
-\x16\x25\x37\x02\xfd\x1e\x2d\x35\x17\x16\x22\x13\x1c\x12\x09\x09\
-\x12\x1c\x13\x22\x16\x17\x35\x2d\x1e\x00\x00\x00\x01\x00\x85\x02\
-\xfd\x01\xd3\x03\xaa\x00\x11\x00\x29\xba\x00\x00\x00\x12\x00\x13\
-\x11\x12\x39\x00\xb8\x00\x00\x2f\x41\x03\x00\x2f\x00\x00\x00\x01\
-\x5d\x41\x03\x00\xd0\x00\x00\x00\x01\x5d\xb9\x00\x09\x00\x05\xf4\
-\x30\x31\x01\x22\x26\x2f\x01\x37\x17\x1e\x01\x33\x32\x36\x3f\x01\
-\x17\x07\x0e\x01\x01\x2c\x33\x40\x18\x1c\x48\x28\x0b\x20\x0c\x0c\
-\x20\x0b\x28\x48\x1c\x18\x40\x02\xfd\x2d\x30\x39\x17\x6a\x04\x02\
-\x02\x04\x6a\x17\x39\x30\x2d\x00\x02\x00\xb8\x02\xea\x01\xa0\x03\
-\xd0\x00\x13\x00\x21\x00\x63\xba\x00\x00\x00\x22\x00\x23\x11\x12\
-\x39\xb8\x00\x14\xd0\x00\xb8\x00\x00\x2f\x41\x03\x00\x80\x00\x00\
-\x00\x01\x71\x41\x03\x00\x5f\x00\x00\x00\x01\x5d\x41\x03\x00\x9f\
-\x00\x00\x00\x01\x5d\x41\x05\x00\x1f\x00\x00\x00\x2f\x00\x00\x00\
-\x02\x5d\x41\x03\x00\x40\x00\x00\x00\x01\x71\x41\x03\x00\x00\x00\
-\x00\x00\x01\x71\xb8\x00\x1b\xdc\xb9\x00\x0a\x00\x03\xf4\xb8\x00\
-\x00\x10\xb9\x00\x14\x00\x03\xf4\x30\x31\x01\x22\x2e\x02\x35\x34\
-\x3e\x02\x33\x32\x1e\x02\x15\x14\x0e\x02\x27\x32\x36\x3d\x01\x34\
-\x26\x23\x22\x06\x1d\x01\x14\x16\x01\x2c\x18\x2b\x1f\x12\x12\x1f\
-\x2b\x18\x18\x2b\x1f\x12\x12\x1f\x2b\x18\x1b\x1f\x1f\x1b\x1b\x1f\
-\x1f\x02\xea\x11\x1f\x2a\x19\x19\x2a\x1f\x11\x11\x1f\x2a\x19\x19\
-\x2a\x1f\x11\x31\x1d\x1a\x16\x1a\x1d\x1d\x1a\x16\x1a\x1d\x00\x00\
-\x03\x00\xb8\x02\xe0\x01\xa0\x04\x5f\x00\x03\x00\x17\x00\x25\x00\
-\x61\xba\x00\x04\x00\x26\x00\x27\x11\x12\x39\xb8\x00\x04\x10\xb8\
-\x00\x00\xd0\xb8\x00\x04\x10\xb8\x00\x18\xd0\x00\xb8\x00\x04\x2f\
-\x41\x03\x00\x5f\x00\x04\x00\x01\x5d\x41\x03\x00\xcf\x00\x04\x00\
-\x01\x5d\x41\x05\x00\x1f\x00\x04\x00\x2f\x00\x04\x00\x02\x5d\x41\
-\x03\x00\x9f\x00\x04\x00\x01\x5d\xb8\x00\x1f\xdc\xb9\x00\x0e\x00\
-\x03\xf4\xb8\x00\x00\xdc\xb8\x00\x04\x10\xb9\x00\x18\x00\x03\xf4\
-\x30\x31\x01\x27\x37\x17\x03\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\
-\x1e\x02\x15\x14\x0e\x02\x27\x32\x36\x3d\x01\x34\x26\x23\x22\x06\
-\x1d\x01\x14\x16\x01\x3a\x2f\x49\x46\x6e\x18\x2b\x1f\x12\x12\x1f\
-\x2b\x18\x18\x2b\x1f\x12\x12\x1f\x2b\x18\x1b\x1f\x1f\x1b\x1b\x1f\
-\x1f\x03\xdb\x13\x71\x19\xfe\x9a\x11\x1f\x2a\x19\x19\x2a\x1f\x11\
-\x11\x1f\x2a\x19\x19\x2a\x1f\x11\x31\x1d\x1a\x16\x1a\x1d\x1d\x1a\
-\x16\x1a\x1d\x00\x01\xff\xac\x02\xeb\x00\x5f\x03\xa7\x00\x0b\x00\
-\x3d\x00\xb8\x00\x00\x45\x58\xb8\x00\x08\x2f\x1b\xb9\x00\x08\x00\
-\x1e\x3e\x59\x41\x03\x00\x9f\x00\x08\x00\x01\x5d\x41\x03\x00\x5f\
-\x00\x08\x00\x01\x5d\x41\x05\x00\x1f\x00\x08\x00\x2f\x00\x08\x00\
-\x02\x5d\xb8\x00\x0b\xdc\xb9\x00\x00\x00\x05\xf4\x30\x31\x03\x33\
-\x32\x16\x15\x14\x06\x0f\x01\x27\x37\x23\x54\x6d\x26\x20\x1a\x17\
-\x18\x2e\x3a\x76\x03\xa7\x20\x17\x16\x34\x1d\x1e\x17\x68\x00\x00\
-\x02\xff\x5a\x02\xf3\x00\xa6\x04\x2f\x00\x13\x00\x17\x00\x23\x00\
-\xb8\x00\x00\x2f\x41\x03\x00\x2f\x00\x00\x00\x01\x5d\x41\x03\x00\
-\xd0\x00\x00\x00\x01\x5d\xb9\x00\x0a\x00\x05\xf4\xb8\x00\x14\xdc\
-\x30\x31\x03\x22\x2e\x02\x27\x37\x17\x1e\x01\x33\x32\x36\x3f\x01\
-\x17\x0e\x03\x2f\x01\x37\x17\x01\x28\x38\x27\x17\x07\x2f\x15\x18\
-\x29\x21\x21\x29\x18\x15\x2f\x08\x19\x27\x38\x1f\x31\x55\x46\x02\
-\xf3\x1b\x29\x31\x16\x17\x20\x24\x1e\x1e\x24\x20\x17\x18\x32\x28\
-\x19\x7b\x17\xaa\x22\x00\x00\x00\x02\xff\x5a\x02\xf3\x00\xa6\x04\
-\x2f\x00\x13\x00\x17\x00\x23\x00\xb8\x00\x00\x2f\x41\x03\x00\x2f\
-\x00\x00\x00\x01\x5d\x41\x03\x00\xd0\x00\x00\x00\x01\x5d\xb9\x00\
-\x0a\x00\x05\xf4\xb8\x00\x17\xdc\x30\x31\x13\x22\x2e\x02\x27\x37\
-\x17\x1e\x01\x33\x32\x36\x3f\x01\x17\x0e\x03\x03\x37\x17\x07\x01\
-\x27\x38\x27\x19\x08\x2f\x15\x18\x29\x21\x21\x29\x18\x15\x2f\x07\
-\x17\x27\x38\x9a\x46\x55\x31\x02\xf3\x19\x28\x32\x18\x17\x20\x24\
-\x1e\x1e\x24\x20\x17\x16\x31\x29\x1b\x01\x1a\x22\xaa\x17\x00\x00\
-\x02\xff\x5a\x02\xf3\x00\xa6\x04\x24\x00\x0b\x00\x1f\x00\x2d\x00\
-\xb8\x00\x0c\x2f\x41\x03\x00\x2f\x00\x0c\x00\x01\x5d\x41\x03\x00\
-\xd0\x00\x0c\x00\x01\x5d\xb9\x00\x16\x00\x05\xf4\xb8\x00\x08\xdc\
-\xb8\x00\x0b\xdc\xb9\x00\x00\x00\x05\xf4\x30\x31\x03\x33\x32\x16\
-\x15\x14\x06\x0f\x01\x27\x37\x23\x17\x22\x2e\x02\x27\x37\x17\x1e\
-\x01\x33\x32\x36\x3f\x01\x17\x0e\x03\x55\x5e\x26\x20\x1a\x17\x18\
-\x2e\x3a\x67\x56\x27\x38\x27\x19\x08\x2f\x15\x18\x29\x21\x21\x29\
-\x18\x15\x2f\x07\x17\x27\x38\x04\x24\x20\x17\x16\x34\x1d\x1e\x17\
-\x68\xf4\x19\x28\x32\x18\x17\x20\x24\x1e\x1e\x24\x20\x17\x16\x31\
-\x29\x1b\x00\x00\x02\xff\x59\x02\xf3\x00\xa7\x04\x1b\x00\x19\x00\
-\x2d\x00\x63\x00\xb8\x00\x1a\x2f\x41\x03\x00\x2f\x00\x1a\x00\x01\
-\x5d\x41\x03\x00\xd0\x00\x1a\x00\x01\x5d\xb9\x00\x24\x00\x05\xf4\
-\xb8\x00\x20\xdc\xb8\x00\x28\xd0\xb8\x00\x00\xdc\xb8\x00\x06\xdc\
-\xba\x00\x09\x00\x00\x00\x06\x11\x12\x39\x7d\xb8\x00\x09\x2f\x18\
-\xb8\x00\x06\x10\xb9\x00\x0d\x00\x05\xf4\xb8\x00\x00\x10\xb9\x00\
-\x13\x00\x05\xf4\xba\x00\x16\x00\x0d\x00\x13\x11\x12\x39\x7c\xb8\
-\x00\x16\x2f\x18\x30\x31\x13\x22\x26\x27\x2e\x01\x23\x22\x06\x07\
-\x27\x3e\x01\x33\x32\x16\x17\x1e\x01\x33\x32\x36\x37\x17\x0e\x01\
-\x07\x22\x2e\x02\x27\x37\x17\x1e\x01\x33\x32\x36\x3f\x01\x17\x0e\
-\x03\x48\x1a\x26\x10\x18\x21\x0d\x11\x1a\x0f\x1f\x0e\x2e\x23\x1a\
-\x26\x10\x18\x21\x0d\x11\x1a\x0f\x1f\x0e\x2e\x6a\x27\x38\x27\x19\
-\x08\x2f\x15\x18\x29\x21\x21\x29\x18\x15\x2f\x07\x17\x27\x38\x03\
-\xab\x12\x08\x0d\x0b\x0e\x0d\x24\x14\x21\x12\x08\x0d\x0b\x0e\x0d\
-\x24\x14\x21\xb8\x19\x28\x32\x18\x17\x20\x24\x1e\x1e\x24\x20\x17\
-\x16\x31\x29\x1b\x00\x00\x00\x00\x03\xff\x64\x02\xff\x00\x9c\x04\
-\x33\x00\x03\x00\x11\x00\x1f\x00\x45\x00\xb8\x00\x04\x2f\x41\x03\
-\x00\xd0\x00\x04\x00\x01\x5d\x41\x03\x00\x2f\x00\x04\x00\x01\x5d\
-\x41\x03\x00\xa0\x00\x04\x00\x01\x5d\x41\x03\x00\x60\x00\x04\x00\
-\x01\x5d\xb9\x00\x0b\x00\x06\xf4\xb8\x00\x00\xd0\xb8\x00\x04\x10\
-\xb8\x00\x12\xd0\xb8\x00\x0b\x10\xb8\x00\x19\xd0\x30\x31\x13\x27\
-\x37\x17\x03\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\
-\x33\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x0c\x31\
-\x55\x46\xd9\x1f\x1a\x1a\x1f\x1f\x1a\x1a\xa7\x1f\x1a\x1a\x1f\x1f\
-\x1a\x1a\x03\x72\x17\xaa\x22\xfe\xee\x1a\x14\x0e\x14\x1a\x1a\x14\
-\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x00\x00\x00\
-\x03\xff\x60\x02\xff\x00\xa0\x04\x31\x00\x06\x00\x14\x00\x22\x00\
-\x45\x00\xb8\x00\x07\x2f\x41\x03\x00\xd0\x00\x07\x00\x01\x5d\x41\
-\x03\x00\x2f\x00\x07\x00\x01\x5d\x41\x03\x00\xa0\x00\x07\x00\x01\
-\x5d\x41\x03\x00\x60\x00\x07\x00\x01\x5d\xb9\x00\x0e\x00\x06\xf4\
-\xb8\x00\x00\xdc\xb8\x00\x07\x10\xb8\x00\x15\xd0\xb8\x00\x0e\x10\
-\xb8\x00\x1c\xd0\x30\x31\x03\x27\x37\x17\x37\x17\x0f\x01\x22\x26\
-\x3d\x01\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x33\x22\x26\x3d\x01\
-\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x2c\x74\x2c\x75\x75\x2a\x74\
-\x8f\x1f\x1a\x1a\x1f\x1f\x1a\x1a\xa7\x1f\x1a\x1a\x1f\x1f\x1a\x1a\
-\x03\x83\x90\x1e\x73\x73\x1e\x90\x84\x1a\x14\x0e\x14\x1a\x1a\x14\
-\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x00\x00\x00\
-\x03\xff\x64\x02\xff\x00\x9c\x04\x33\x00\x03\x00\x11\x00\x1f\x00\
-\x45\x00\xb8\x00\x04\x2f\x41\x03\x00\xd0\x00\x04\x00\x01\x5d\x41\
-\x03\x00\x2f\x00\x04\x00\x01\x5d\x41\x03\x00\xa0\x00\x04\x00\x01\
-\x5d\x41\x03\x00\x60\x00\x04\x00\x01\x5d\xb9\x00\x0b\x00\x06\xf4\
-\xb8\x00\x03\xd0\xb8\x00\x04\x10\xb8\x00\x12\xd0\xb8\x00\x0b\x10\
-\xb8\x00\x19\xd0\x30\x31\x03\x37\x17\x0f\x01\x22\x26\x3d\x01\x34\
-\x36\x33\x32\x16\x1d\x01\x14\x06\x33\x22\x26\x3d\x01\x34\x36\x33\
-\x32\x16\x1d\x01\x14\x06\x76\x46\x55\x31\x57\x1f\x1a\x1a\x1f\x1f\
-\x1a\x1a\xa7\x1f\x1a\x1a\x1f\x1f\x1a\x1a\x04\x11\x22\xaa\x17\x73\
-\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x1a\
-\x14\x0e\x14\x1a\x00\x00\x00\x00\x02\xff\x60\x02\xef\x01\x04\x04\
-\x33\x00\x03\x00\x0a\x00\x37\x00\xb8\x00\x08\x2f\x41\x03\x00\x2f\
-\x00\x08\x00\x01\x5d\x41\x03\x00\xd0\x00\x08\x00\x01\x5d\xb8\x00\
-\x00\xdc\xb8\x00\x08\x10\xb8\x00\x06\xd0\xb8\x00\x08\x10\xb8\x00\
-\x0a\xdc\xba\x00\x07\x00\x0a\x00\x08\x11\x12\x39\x30\x31\x13\x27\
-\x37\x17\x07\x17\x07\x27\x07\x27\x37\x9a\x31\x55\x46\xd2\x6e\x2c\
-\x75\x75\x2a\x6e\x03\x72\x17\xaa\x22\x74\x90\x1e\x77\x77\x1e\x90\
-\x00\x00\x00\x00\x02\xff\x61\x02\xf2\x00\x9f\x04\x1c\x00\x06\x00\
-\x1a\x00\x39\x00\xb8\x00\x04\x2f\x41\x03\x00\x2f\x00\x04\x00\x01\
-\x5d\x41\x03\x00\xd0\x00\x04\x00\x01\x5d\xb8\x00\x02\xd0\xb8\x00\
-\x04\x10\xb8\x00\x06\xdc\xba\x00\x03\x00\x06\x00\x04\x11\x12\x39\
-\xb8\x00\x07\xdc\xb9\x00\x11\x00\x05\xf4\x30\x31\x13\x17\x07\x27\
-\x07\x27\x3f\x01\x22\x2e\x02\x27\x37\x17\x1e\x01\x33\x32\x36\x3f\
-\x01\x17\x0e\x03\x2e\x70\x22\x7d\x7d\x20\x70\x2e\x26\x36\x25\x17\
-\x07\x2f\x14\x14\x2b\x1d\x1d\x2b\x14\x14\x2f\x07\x17\x25\x36\x03\
-\x7b\x67\x22\x57\x57\x22\x67\x18\x16\x21\x29\x12\x17\x1d\x1e\x12\
-\x12\x1e\x1d\x17\x12\x29\x21\x16\x00\x00\x00\x00\x02\xfe\xfc\x02\
-\xef\x00\xa0\x04\x33\x00\x03\x00\x0a\x00\x37\x00\xb8\x00\x08\x2f\
-\x41\x03\x00\x2f\x00\x08\x00\x01\x5d\x41\x03\x00\xd0\x00\x08\x00\
-\x01\x5d\xb8\x00\x03\xdc\xb8\x00\x08\x10\xb8\x00\x06\xd0\xb8\x00\
-\x08\x10\xb8\x00\x0a\xdc\xba\x00\x07\x00\x0a\x00\x08\x11\x12\x39\
-\x30\x31\x01\x37\x17\x07\x37\x17\x07\x27\x07\x27\x37\xfe\xfc\x46\
-\x55\x31\xcc\x6e\x2c\x75\x75\x2a\x6e\x04\x11\x22\xaa\x17\x2b\x90\
-\x1e\x77\x77\x1e\x90\x00\x00\x00\x02\xff\x60\x02\xef\x00\xe8\x04\
-\x28\x00\x0b\x00\x12\x00\x47\x00\xb8\x00\x10\x2f\xbb\x00\x0b\x00\
-\x05\x00\x00\x00\x04\x2b\x41\x03\x00\x2f\x00\x10\x00\x01\x5d\x41\
-\x03\x00\xd0\x00\x10\x00\x01\x5d\xb8\x00\x10\x10\xb8\x00\x12\xdc\
-\xba\x00\x08\x00\x12\x00\x10\x11\x12\x39\xb8\x00\x10\x10\xb8\x00\
-\x0e\xd0\xba\x00\x0f\x00\x12\x00\x10\x11\x12\x39\x30\x31\x13\x33\
-\x32\x16\x15\x14\x06\x0f\x01\x27\x37\x23\x07\x17\x07\x27\x07\x27\
-\x37\x35\x6d\x26\x20\x1a\x17\x18\x2e\x3a\x76\x03\x6e\x2c\x75\x75\
-\x2a\x6e\x04\x28\x20\x17\x16\x34\x1d\x1e\x17\x68\x4e\x90\x1e\x77\
-\x77\x1e\x90\x00\x03\xff\x64\x02\xff\x00\x9c\x03\xe3\x00\x03\x00\
-\x11\x00\x1f\x00\x42\x00\xb8\x00\x04\x2f\x41\x03\x00\x2f\x00\x04\
-\x00\x01\x5d\x41\x03\x00\xd0\x00\x04\x00\x01\x5d\x41\x03\x00\x60\
-\x00\x04\x00\x01\x5d\xb9\x00\x0b\x00\x06\xf4\xb8\x00\x03\xdc\xb9\
-\x00\x00\x00\x05\xf4\xb8\x00\x04\x10\xb8\x00\x12\xd0\xb8\x00\x0b\
-\x10\xb8\x00\x19\xd0\x30\x31\x03\x21\x15\x21\x17\x22\x26\x3d\x01\
-\x34\x36\x33\x32\x16\x1d\x01\x14\x06\x33\x22\x26\x3d\x01\x34\x36\
-\x33\x32\x16\x1d\x01\x14\x06\x8c\x01\x18\xfe\xe8\x29\x1f\x1a\x1a\
-\x1f\x1f\x1a\x1a\xa7\x1f\x1a\x1a\x1f\x1f\x1a\x1a\x03\xe3\x44\xa0\
-\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x1a\x14\x0e\x14\x1a\x1a\
-\x14\x0e\x14\x1a\x00\x00\x00\x00\x02\xff\x59\x02\xef\x00\xa7\x04\
-\x26\x00\x19\x00\x20\x00\x66\x00\xb8\x00\x1e\x2f\x41\x03\x00\x2f\
-\x00\x1e\x00\x01\x5d\x41\x03\x00\x0f\x00\x1e\x00\x01\x5d\x41\x03\
-\x00\xd0\x00\x1e\x00\x01\x5d\xb8\x00\x20\xdc\xb8\x00\x0d\xdc\xb8\
-\x00\x13\xdc\xb9\x00\x00\x00\x05\xf4\xb8\x00\x0d\x10\xb9\x00\x06\
-\x00\x05\xf4\xba\x00\x09\x00\x00\x00\x06\x11\x12\x39\x7c\xb8\x00\
-\x09\x2f\x18\xba\x00\x16\x00\x13\x00\x0d\x11\x12\x39\x7d\xb8\x00\
-\x16\x2f\x18\xb8\x00\x1e\x10\xb8\x00\x1c\xd0\x30\x31\x03\x32\x16\
-\x17\x1e\x01\x33\x32\x36\x37\x17\x0e\x01\x23\x22\x26\x27\x2e\x01\
-\x23\x22\x06\x07\x27\x3e\x01\x1f\x01\x07\x27\x07\x27\x37\x48\x1a\
-\x26\x10\x18\x21\x0d\x11\x1a\x0f\x1f\x0e\x2e\x23\x1a\x26\x10\x18\
-\x21\x0d\x11\x1a\x0f\x1f\x0e\x2e\x9d\x6e\x2c\x75\x75\x2a\x6e\x04\
-\x26\x12\x08\x0d\x0b\x0e\x0d\x24\x14\x21\x12\x08\x0d\x0b\x0e\x0d\
-\x24\x14\x21\x93\x86\x1e\x6f\x6f\x1e\x86\x00\x00\x00\x00\x27\x01\
-\xda\x00\x01\x00\x00\x00\x00\x00\x00\x00\x2d\x00\x00\x00\x01\x00\
-\x00\x00\x00\x00\x01\x00\x0d\x00\x2d\x00\x01\x00\x00\x00\x00\x00\
-\x02\x00\x07\x00\x3a\x00\x01\x00\x00\x00\x00\x00\x03\x00\x14\x00\
-\x41\x00\x01\x00\x00\x00\x00\x00\x04\x00\x0d\x00\x2d\x00\x01\x00\
-\x00\x00\x00\x00\x05\x00\x0b\x00\x55\x00\x01\x00\x00\x00\x00\x00\
-\x06\x00\x0b\x00\x60\x00\x01\x00\x00\x00\x00\x00\x07\x00\x51\x00\
-\x6b\x00\x01\x00\x00\x00\x00\x00\x08\x00\x0b\x00\xbc\x00\x01\x00\
-\x00\x00\x00\x00\x09\x00\x33\x00\xc7\x00\x01\x00\x00\x00\x00\x00\
-\x0b\x00\x19\x00\xfa\x00\x01\x00\x00\x00\x00\x00\x0c\x00\x12\x01\
-\x13\x00\x01\x00\x00\x00\x00\x00\x0d\x00\x90\x01\x25\x00\x01\x00\
-\x00\x00\x00\x00\x0e\x00\x1a\x01\xb5\x00\x01\x00\x00\x00\x00\x01\
-\x00\x00\x12\x01\xcf\x00\x01\x00\x00\x00\x00\x01\x01\x00\x12\x01\
-\xe1\x00\x01\x00\x00\x00\x00\x01\x02\x00\x13\x01\xf3\x00\x01\x00\
-\x00\x00\x00\x01\x03\x00\x11\x02\x06\x00\x01\x00\x00\x00\x00\x01\
-\x04\x00\x1a\x02\x17\x00\x03\x00\x01\x04\x09\x00\x00\x00\x5a\x02\
-\x31\x00\x03\x00\x01\x04\x09\x00\x01\x00\x1a\x02\x8b\x00\x03\x00\
-\x01\x04\x09\x00\x02\x00\x0e\x02\xa5\x00\x03\x00\x01\x04\x09\x00\
-\x03\x00\x28\x02\xb3\x00\x03\x00\x01\x04\x09\x00\x04\x00\x1a\x02\
-\x8b\x00\x03\x00\x01\x04\x09\x00\x05\x00\x16\x02\xdb\x00\x03\x00\
-\x01\x04\x09\x00\x06\x00\x16\x02\xf1\x00\x03\x00\x01\x04\x09\x00\
-\x07\x00\xa2\x03\x07\x00\x03\x00\x01\x04\x09\x00\x08\x00\x16\x03\
-\xa9\x00\x03\x00\x01\x04\x09\x00\x09\x00\x66\x03\xbf\x00\x03\x00\
-\x01\x04\x09\x00\x0b\x00\x32\x04\x25\x00\x03\x00\x01\x04\x09\x00\
-\x0c\x00\x24\x04\x57\x00\x03\x00\x01\x04\x09\x00\x0d\x01\x20\x04\
-\x7b\x00\x03\x00\x01\x04\x09\x00\x0e\x00\x34\x05\x9b\x00\x03\x00\
-\x01\x04\x09\x00\x13\x00\x74\x05\xcf\x00\x03\x00\x01\x04\x09\x01\
-\x00\x00\x24\x06\x43\x00\x03\x00\x01\x04\x09\x01\x01\x00\x24\x06\
-\x67\x00\x03\x00\x01\x04\x09\x01\x02\x00\x26\x06\x8b\x00\x03\x00\
-\x01\x04\x09\x01\x03\x00\x22\x06\xb1\x00\x03\x00\x01\x04\x09\x01\
-\x04\x00\x34\x06\xd3\x43\x6f\x70\x79\x72\x69\x67\x68\x74\x20\x32\
-\x30\x31\x37\x20\x49\x42\x4d\x20\x43\x6f\x72\x70\x2e\x20\x41\x6c\
-\x6c\x20\x72\x69\x67\x68\x74\x73\x20\x72\x65\x73\x65\x72\x76\x65\
-\x64\x2e\x49\x42\x4d\x20\x50\x6c\x65\x78\x20\x4d\x6f\x6e\x6f\x52\
-\x65\x67\x75\x6c\x61\x72\x32\x2e\x31\x3b\x49\x42\x4d\x20\x3b\x49\
-\x42\x4d\x50\x6c\x65\x78\x4d\x6f\x6e\x6f\x56\x65\x72\x73\x69\x6f\
-\x6e\x20\x32\x2e\x31\x49\x42\x4d\x50\x6c\x65\x78\x4d\x6f\x6e\x6f\
-\x49\x42\x4d\x20\x50\x6c\x65\x78\xa8\x20\x69\x73\x20\x61\x20\x74\
-\x72\x61\x64\x65\x6d\x61\x72\x6b\x20\x6f\x66\x20\x49\x42\x4d\x20\
-\x43\x6f\x72\x70\x2c\x20\x72\x65\x67\x69\x73\x74\x65\x72\x65\x64\
-\x20\x69\x6e\x20\x6d\x61\x6e\x79\x20\x6a\x75\x72\x69\x73\x64\x69\
-\x63\x74\x69\x6f\x6e\x73\x20\x77\x6f\x72\x6c\x64\x77\x69\x64\x65\
-\x2e\x42\x6f\x6c\x64\x20\x4d\x6f\x6e\x64\x61\x79\x4d\x69\x6b\x65\
-\x20\x41\x62\x62\x69\x6e\x6b\x2c\x20\x50\x61\x75\x6c\x20\x76\x61\
-\x6e\x20\x64\x65\x72\x20\x4c\x61\x61\x6e\x2c\x20\x50\x69\x65\x74\
-\x65\x72\x20\x76\x61\x6e\x20\x52\x6f\x73\x6d\x61\x6c\x65\x6e\x68\
-\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x62\x6f\x6c\x64\x6d\x6f\
-\x6e\x64\x61\x79\x2e\x63\x6f\x6d\x68\x74\x74\x70\x3a\x2f\x2f\x77\
-\x77\x77\x2e\x69\x62\x6d\x2e\x63\x6f\x6d\x54\x68\x69\x73\x20\x46\
-\x6f\x6e\x74\x20\x53\x6f\x66\x74\x77\x61\x72\x65\x20\x69\x73\x20\
-\x6c\x69\x63\x65\x6e\x73\x65\x64\x20\x75\x6e\x64\x65\x72\x20\x74\
-\x68\x65\x20\x53\x49\x4c\x20\x4f\x70\x65\x6e\x20\x46\x6f\x6e\x74\
-\x20\x4c\x69\x63\x65\x6e\x73\x65\x2c\x20\x56\x65\x72\x73\x69\x6f\
-\x6e\x20\x31\x2e\x31\x2e\x20\x54\x68\x69\x73\x20\x6c\x69\x63\x65\
-\x6e\x73\x65\x20\x69\x73\x20\x61\x76\x61\x69\x6c\x61\x62\x6c\x65\
-\x20\x77\x69\x74\x68\x20\x61\x20\x46\x41\x51\x20\x61\x74\x3a\x20\
-\x68\x74\x74\x70\x3a\x2f\x2f\x73\x63\x72\x69\x70\x74\x73\x2e\x73\
-\x69\x6c\x2e\x6f\x72\x67\x2f\x4f\x46\x4c\x68\x74\x74\x70\x3a\x2f\
-\x2f\x73\x63\x72\x69\x70\x74\x73\x2e\x73\x69\x6c\x2e\x6f\x72\x67\
-\x2f\x4f\x46\x4c\x73\x69\x6d\x70\x6c\x65\x20\x6c\x6f\x77\x65\x72\
-\x63\x61\x73\x65\x20\x61\x73\x69\x6d\x70\x6c\x65\x20\x6c\x6f\x77\
-\x65\x72\x63\x61\x73\x65\x20\x67\x73\x6c\x61\x73\x68\x65\x64\x20\
-\x6e\x75\x6d\x62\x65\x72\x20\x7a\x65\x72\x6f\x70\x6c\x61\x69\x6e\
-\x20\x6e\x75\x6d\x62\x65\x72\x20\x7a\x65\x72\x6f\x61\x6c\x74\x65\
-\x72\x6e\x61\x74\x65\x20\x6c\x6f\x77\x65\x72\x63\x61\x73\x65\x20\
-\x65\x73\x7a\x65\x74\x74\x00\x43\x00\x6f\x00\x70\x00\x79\x00\x72\
-\x00\x69\x00\x67\x00\x68\x00\x74\x00\x20\x00\x32\x00\x30\x00\x31\
-\x00\x37\x00\x20\x00\x49\x00\x42\x00\x4d\x00\x20\x00\x43\x00\x6f\
-\x00\x72\x00\x70\x00\x2e\x00\x20\x00\x41\x00\x6c\x00\x6c\x00\x20\
-\x00\x72\x00\x69\x00\x67\x00\x68\x00\x74\x00\x73\x00\x20\x00\x72\
-\x00\x65\x00\x73\x00\x65\x00\x72\x00\x76\x00\x65\x00\x64\x00\x2e\
-\x00\x49\x00\x42\x00\x4d\x00\x20\x00\x50\x00\x6c\x00\x65\x00\x78\
-\x00\x20\x00\x4d\x00\x6f\x00\x6e\x00\x6f\x00\x52\x00\x65\x00\x67\
-\x00\x75\x00\x6c\x00\x61\x00\x72\x00\x32\x00\x2e\x00\x31\x00\x3b\
-\x00\x49\x00\x42\x00\x4d\x00\x20\x00\x3b\x00\x49\x00\x42\x00\x4d\
-\x00\x50\x00\x6c\x00\x65\x00\x78\x00\x4d\x00\x6f\x00\x6e\x00\x6f\
-\x00\x56\x00\x65\x00\x72\x00\x73\x00\x69\x00\x6f\x00\x6e\x00\x20\
-\x00\x32\x00\x2e\x00\x31\x00\x49\x00\x42\x00\x4d\x00\x50\x00\x6c\
-\x00\x65\x00\x78\x00\x4d\x00\x6f\x00\x6e\x00\x6f\x00\x49\x00\x42\
-\x00\x4d\x00\x20\x00\x50\x00\x6c\x00\x65\x00\x78\x00\xae\x00\x20\
-\x00\x69\x00\x73\x00\x20\x00\x61\x00\x20\x00\x74\x00\x72\x00\x61\
-\x00\x64\x00\x65\x00\x6d\x00\x61\x00\x72\x00\x6b\x00\x20\x00\x6f\
-\x00\x66\x00\x20\x00\x49\x00\x42\x00\x4d\x00\x20\x00\x43\x00\x6f\
-\x00\x72\x00\x70\x00\x2c\x00\x20\x00\x72\x00\x65\x00\x67\x00\x69\
-\x00\x73\x00\x74\x00\x65\x00\x72\x00\x65\x00\x64\x00\x20\x00\x69\
-\x00\x6e\x00\x20\x00\x6d\x00\x61\x00\x6e\x00\x79\x00\x20\x00\x6a\
-\x00\x75\x00\x72\x00\x69\x00\x73\x00\x64\x00\x69\x00\x63\x00\x74\
-\x00\x69\x00\x6f\x00\x6e\x00\x73\x00\x20\x00\x77\x00\x6f\x00\x72\
-\x00\x6c\x00\x64\x00\x77\x00\x69\x00\x64\x00\x65\x00\x2e\x00\x42\
-\x00\x6f\x00\x6c\x00\x64\x00\x20\x00\x4d\x00\x6f\x00\x6e\x00\x64\
-\x00\x61\x00\x79\x00\x4d\x00\x69\x00\x6b\x00\x65\x00\x20\x00\x41\
-\x00\x62\x00\x62\x00\x69\x00\x6e\x00\x6b\x00\x2c\x00\x20\x00\x50\
-\x00\x61\x00\x75\x00\x6c\x00\x20\x00\x76\x00\x61\x00\x6e\x00\x20\
-\x00\x64\x00\x65\x00\x72\x00\x20\x00\x4c\x00\x61\x00\x61\x00\x6e\
-\x00\x2c\x00\x20\x00\x50\x00\x69\x00\x65\x00\x74\x00\x65\x00\x72\
-\x00\x20\x00\x76\x00\x61\x00\x6e\x00\x20\x00\x52\x00\x6f\x00\x73\
-\x00\x6d\x00\x61\x00\x6c\x00\x65\x00\x6e\x00\x68\x00\x74\x00\x74\
-\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x77\x00\x77\x00\x77\x00\x2e\
-\x00\x62\x00\x6f\x00\x6c\x00\x64\x00\x6d\x00\x6f\x00\x6e\x00\x64\
-\x00\x61\x00\x79\x00\x2e\x00\x63\x00\x6f\x00\x6d\x00\x68\x00\x74\
-\x00\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x77\x00\x77\x00\x77\
-\x00\x2e\x00\x69\x00\x62\x00\x6d\x00\x2e\x00\x63\x00\x6f\x00\x6d\
-\x00\x54\x00\x68\x00\x69\x00\x73\x00\x20\x00\x46\x00\x6f\x00\x6e\
-\x00\x74\x00\x20\x00\x53\x00\x6f\x00\x66\x00\x74\x00\x77\x00\x61\
-\x00\x72\x00\x65\x00\x20\x00\x69\x00\x73\x00\x20\x00\x6c\x00\x69\
-\x00\x63\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x64\x00\x20\x00\x75\
-\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x20\x00\x74\x00\x68\x00\x65\
-\x00\x20\x00\x53\x00\x49\x00\x4c\x00\x20\x00\x4f\x00\x70\x00\x65\
-\x00\x6e\x00\x20\x00\x46\x00\x6f\x00\x6e\x00\x74\x00\x20\x00\x4c\
-\x00\x69\x00\x63\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x2c\x00\x20\
-\x00\x56\x00\x65\x00\x72\x00\x73\x00\x69\x00\x6f\x00\x6e\x00\x20\
-\x00\x31\x00\x2e\x00\x31\x00\x2e\x00\x20\x00\x54\x00\x68\x00\x69\
-\x00\x73\x00\x20\x00\x6c\x00\x69\x00\x63\x00\x65\x00\x6e\x00\x73\
-\x00\x65\x00\x20\x00\x69\x00\x73\x00\x20\x00\x61\x00\x76\x00\x61\
-\x00\x69\x00\x6c\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x20\x00\x77\
-\x00\x69\x00\x74\x00\x68\x00\x20\x00\x61\x00\x20\x00\x46\x00\x41\
-\x00\x51\x00\x20\x00\x61\x00\x74\x00\x3a\x00\x20\x00\x68\x00\x74\
-\x00\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x73\x00\x63\x00\x72\
-\x00\x69\x00\x70\x00\x74\x00\x73\x00\x2e\x00\x73\x00\x69\x00\x6c\
-\x00\x2e\x00\x6f\x00\x72\x00\x67\x00\x2f\x00\x4f\x00\x46\x00\x4c\
-\x00\x68\x00\x74\x00\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x73\
-\x00\x63\x00\x72\x00\x69\x00\x70\x00\x74\x00\x73\x00\x2e\x00\x73\
-\x00\x69\x00\x6c\x00\x2e\x00\x6f\x00\x72\x00\x67\x00\x2f\x00\x4f\
-\x00\x46\x00\x4c\x00\x48\x00\x6f\x00\x77\x00\x20\x00\x72\x00\x61\
-\x00\x7a\x00\x6f\x00\x72\x00\x62\x00\x61\x00\x63\x00\x6b\x00\x2d\
-\x00\x6a\x00\x75\x00\x6d\x00\x70\x00\x69\x00\x6e\x00\x67\x00\x20\
-\x00\x66\x00\x72\x00\x6f\x00\x67\x00\x73\x00\x20\x00\x63\x00\x61\
-\x00\x6e\x00\x20\x00\x6c\x00\x65\x00\x76\x00\x65\x00\x6c\x00\x20\
-\x00\x73\x00\x69\x00\x78\x00\x20\x00\x70\x00\x69\x00\x71\x00\x75\
-\x00\x65\x00\x64\x00\x20\x00\x67\x00\x79\x00\x6d\x00\x6e\x00\x61\
-\x00\x73\x00\x74\x00\x73\x00\x21\x00\x73\x00\x69\x00\x6d\x00\x70\
-\x00\x6c\x00\x65\x00\x20\x00\x6c\x00\x6f\x00\x77\x00\x65\x00\x72\
-\x00\x63\x00\x61\x00\x73\x00\x65\x00\x20\x00\x61\x00\x73\x00\x69\
-\x00\x6d\x00\x70\x00\x6c\x00\x65\x00\x20\x00\x6c\x00\x6f\x00\x77\
-\x00\x65\x00\x72\x00\x63\x00\x61\x00\x73\x00\x65\x00\x20\x00\x67\
-\x00\x73\x00\x6c\x00\x61\x00\x73\x00\x68\x00\x65\x00\x64\x00\x20\
-\x00\x6e\x00\x75\x00\x6d\x00\x62\x00\x65\x00\x72\x00\x20\x00\x7a\
-\x00\x65\x00\x72\x00\x6f\x00\x70\x00\x6c\x00\x61\x00\x69\x00\x6e\
-\x00\x20\x00\x6e\x00\x75\x00\x6d\x00\x62\x00\x65\x00\x72\x00\x20\
-\x00\x7a\x00\x65\x00\x72\x00\x6f\x00\x61\x00\x6c\x00\x74\x00\x65\
-\x00\x72\x00\x6e\x00\x61\x00\x74\x00\x65\x00\x20\x00\x6c\x00\x6f\
-\x00\x77\x00\x65\x00\x72\x00\x63\x00\x61\x00\x73\x00\x65\x00\x20\
-\x00\x65\x00\x73\x00\x7a\x00\x65\x00\x74\x00\x74\x00\x00\x00\x00\
-\x02\x00\x00\x00\x00\x00\x00\xff\x74\x00\x3c\x00\x00\x00\x01\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\
-\x53\x00\x00\x00\x01\x01\x02\x00\x03\x00\x44\x01\x03\x00\x45\x00\
-\x46\x00\x47\x00\x48\x00\x49\x00\x4a\x01\x04\x01\x05\x00\x4b\x00\
-\x4c\x00\x4d\x00\x4e\x00\x4f\x00\x50\x00\x51\x00\x52\x00\x53\x00\
-\x54\x00\x55\x00\x56\x00\x57\x00\x58\x00\x59\x00\x5a\x00\x5b\x00\
-\x5c\x00\x5d\x00\x24\x00\x25\x00\x26\x00\x27\x00\x28\x00\x29\x00\
-\x2a\x00\x2b\x00\x2c\x00\x2d\x00\x2e\x00\x2f\x00\x30\x00\x31\x00\
-\x32\x00\x33\x00\x34\x00\x35\x00\x36\x00\x37\x00\x38\x00\x39\x00\
-\x3a\x00\x3b\x00\x3c\x00\x3d\x00\x13\x01\x06\x01\x07\x00\x14\x00\
-\x15\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a\x00\x1b\x00\x1c\x00\
-\x09\x00\x23\x00\x10\x01\x08\x00\xb2\x00\xb3\x00\x42\x00\x11\x00\
-\xab\x00\x1d\x00\x0f\x00\x1e\x00\x0a\x00\x05\x00\xb6\x00\xb7\x00\
-\xb4\x00\xb5\x00\xc4\x00\xc5\x00\xbe\x00\xbf\x00\xa9\x00\xaa\x00\
-\xa3\x00\x04\x00\xa2\x00\x22\x00\x0b\x00\x0c\x00\x3e\x00\x40\x00\
-\x5e\x00\x60\x00\x12\x00\x3f\x00\xbc\x00\x08\x00\xc6\x00\x5f\x00\
-\xe8\x00\x86\x00\x88\x00\x8b\x00\x8a\x00\x8c\x00\x9d\x00\x9e\x00\
-\x83\x00\x0d\x00\x82\x00\xc2\x00\x06\x00\x41\x00\x61\x00\x0e\x00\
-\xef\x00\x93\x00\xf0\x00\xb8\x00\x20\x00\xa7\x00\x8f\x00\x1f\x00\
-\x21\x00\x94\x00\x95\x00\xc3\x00\x87\x00\xb9\x00\xa4\x00\xa5\x00\
-\x9c\x00\x92\x01\x09\x01\x0a\x01\x0b\x00\x98\x00\x84\x01\x0c\x00\
-\xa6\x00\x85\x00\x07\x00\x96\x01\x0d\x01\x0e\x01\x0f\x01\x10\x01\
-\x11\x01\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\
-\x19\x01\x1a\x01\x1b\x01\x1c\x01\x1d\x01\x1e\x01\x1f\x00\xc0\x00\
-\xc1\x00\x69\x01\x20\x00\x6b\x00\x6c\x01\x21\x00\x6a\x01\x22\x01\
-\x23\x01\x24\x00\x6e\x01\x25\x00\x6d\x01\x26\x01\x27\x01\x28\x01\
-\x29\x01\x2a\x01\x2b\x01\x2c\x01\x2d\x01\x2e\x01\x2f\x01\x30\x01\
-\x31\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\
-\x39\x01\x3a\x01\x3b\x01\x3c\x01\x3d\x01\x3e\x01\x3f\x01\x40\x01\
-\x41\x01\x42\x01\x43\x01\x44\x01\x45\x00\xa0\x01\x46\x00\xfe\x01\
-\x00\x00\x6f\x01\x47\x01\x48\x01\x49\x01\x01\x00\xea\x00\x70\x01\
-\x4a\x01\x4b\x00\x72\x00\x73\x01\x4c\x01\x4d\x00\x71\x01\x4e\x01\
-\x4f\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\
-\x57\x00\xf9\x01\x58\x01\x59\x01\x5a\x01\x5b\x01\x5c\x01\x5d\x01\
-\x5e\x01\x5f\x01\x60\x00\xd7\x00\x74\x01\x61\x00\x76\x00\x77\x01\
-\x62\x00\x75\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\
-\x69\x01\x6a\x01\x6b\x01\x6c\x01\x6d\x01\x6e\x01\x6f\x01\x70\x01\
-\x71\x00\xe3\x01\x72\x01\x73\x01\x74\x00\x78\x01\x75\x01\x76\x00\
-\x79\x01\x77\x00\x7b\x00\x7c\x01\x78\x00\x7a\x01\x79\x01\x7a\x01\
-\x7b\x00\xa1\x01\x7c\x00\x7d\x01\x7d\x01\x7e\x01\x7f\x01\x80\x01\
-\x81\x01\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x00\xb1\x01\
-\x88\x01\x89\x01\x8a\x01\x8b\x00\xe5\x00\xfc\x01\x8c\x01\x8d\x00\
-\x89\x01\x8e\x01\x8f\x01\x90\x01\x91\x01\x92\x00\xee\x00\x7e\x01\
-\x93\x00\x80\x00\x81\x01\x94\x00\x7f\x01\x95\x01\x96\x01\x97\x01\
-\x98\x01\x99\x01\x9a\x01\x9b\x01\x9c\x01\x9d\x01\x9e\x01\x9f\x01\
-\xa0\x01\xa1\x01\xa2\x01\xa3\x01\xa4\x00\xec\x01\xa5\x00\xba\x01\
-\xa6\x01\xa7\x01\xa8\x01\xa9\x01\xaa\x00\xe7\x01\xab\x00\xc9\x01\
-\xac\x00\xc7\x00\x62\x01\xad\x00\xad\x01\xae\x01\xaf\x01\xb0\x00\
-\x63\x01\xb1\x00\xae\x01\xb2\x01\xb3\x01\xb4\x01\xb5\x01\xb6\x01\
-\xb7\x01\xb8\x01\xb9\x01\xba\x01\xbb\x00\x90\x01\xbc\x00\xfd\x00\
-\xff\x00\x64\x01\xbd\x01\xbe\x01\xbf\x01\xc0\x00\xe9\x00\x65\x01\
-\xc1\x01\xc2\x00\xc8\x00\xca\x01\xc3\x01\xc4\x00\xcb\x01\xc5\x01\
-\xc6\x01\xc7\x01\xc8\x01\xc9\x01\xca\x01\xcb\x01\xcc\x01\xcd\x01\
-\xce\x00\xf8\x01\xcf\x01\xd0\x01\xd1\x01\xd2\x01\xd3\x00\xcc\x01\
-\xd4\x00\xcd\x00\xce\x00\xfa\x01\xd5\x00\xcf\x01\xd6\x01\xd7\x01\
-\xd8\x01\xd9\x01\xda\x01\xdb\x01\xdc\x01\xdd\x01\xde\x01\xdf\x01\
-\xe0\x01\xe1\x01\xe2\x00\xe2\x01\xe3\x01\xe4\x01\xe5\x00\x66\x01\
-\xe6\x00\xd0\x01\xe7\x00\xd1\x00\x67\x01\xe8\x00\xd3\x01\xe9\x01\
-\xea\x01\xeb\x00\x91\x01\xec\x00\xaf\x01\xed\x01\xee\x01\xef\x01\
-\xf0\x01\xf1\x01\xf2\x01\xf3\x01\xf4\x01\xf5\x01\xf6\x01\xf7\x00\
-\xb0\x01\xf8\x01\xf9\x01\xfa\x01\xfb\x00\xe4\x00\xfb\x01\xfc\x01\
-\xfd\x01\xfe\x01\xff\x02\x00\x02\x01\x02\x02\x00\xed\x00\xd4\x02\
-\x03\x00\xd5\x00\x68\x02\x04\x00\xd6\x02\x05\x02\x06\x02\x07\x02\
-\x08\x02\x09\x02\x0a\x02\x0b\x02\x0c\x02\x0d\x02\x0e\x02\x0f\x02\
-\x10\x02\x11\x02\x12\x02\x13\x02\x14\x00\xeb\x02\x15\x02\x16\x00\
-\xbb\x02\x17\x02\x18\x02\x19\x02\x1a\x00\xe6\x02\x1b\x00\x97\x00\
-\xa8\x00\x9a\x00\x99\x00\x9f\x00\x9b\x02\x1c\x02\x1d\x02\x1e\x02\
-\x1f\x02\x20\x02\x21\x02\x22\x02\x23\x02\x24\x02\x25\x02\x26\x02\
-\x27\x02\x28\x02\x29\x02\x2a\x02\x2b\x02\x2c\x02\x2d\x02\x2e\x02\
-\x2f\x02\x30\x02\x31\x02\x32\x02\x33\x02\x34\x02\x35\x02\x36\x02\
-\x37\x02\x38\x02\x39\x02\x3a\x02\x3b\x02\x3c\x02\x3d\x02\x3e\x02\
-\x3f\x02\x40\x02\x41\x02\x42\x02\x43\x02\x44\x02\x45\x02\x46\x02\
-\x47\x02\x48\x02\x49\x02\x4a\x02\x4b\x02\x4c\x02\x4d\x02\x4e\x02\
-\x4f\x02\x50\x02\x51\x02\x52\x02\x53\x02\x54\x02\x55\x02\x56\x02\
-\x57\x02\x58\x02\x59\x02\x5a\x02\x5b\x02\x5c\x02\x5d\x02\x5e\x02\
-\x5f\x02\x60\x02\x61\x02\x62\x02\x63\x02\x64\x02\x65\x02\x66\x02\
-\x67\x02\x68\x02\x69\x02\x6a\x02\x6b\x02\x6c\x02\x6d\x02\x6e\x02\
-\x6f\x02\x70\x02\x71\x02\x72\x02\x73\x02\x74\x02\x75\x02\x76\x02\
-\x77\x02\x78\x02\x79\x02\x7a\x02\x7b\x02\x7c\x02\x7d\x02\x7e\x02\
-\x7f\x02\x80\x02\x81\x02\x82\x02\x83\x02\x84\x02\x85\x02\x86\x02\
-\x87\x02\x88\x02\x89\x02\x8a\x02\x8b\x02\x8c\x02\x8d\x02\x8e\x02\
-\x8f\x02\x90\x02\x91\x02\x92\x02\x93\x02\x94\x02\x95\x02\x96\x02\
-\x97\x02\x98\x02\x99\x02\x9a\x02\x9b\x02\x9c\x02\x9d\x02\x9e\x02\
-\x9f\x02\xa0\x02\xa1\x02\xa2\x02\xa3\x02\xa4\x02\xa5\x02\xa6\x02\
-\xa7\x02\xa8\x02\xa9\x02\xaa\x02\xab\x02\xac\x02\xad\x02\xae\x02\
-\xaf\x02\xb0\x02\xb1\x02\xb2\x02\xb3\x02\xb4\x02\xb5\x02\xb6\x02\
-\xb7\x02\xb8\x02\xb9\x02\xba\x02\xbb\x02\xbc\x02\xbd\x02\xbe\x02\
-\xbf\x02\xc0\x02\xc1\x02\xc2\x02\xc3\x02\xc4\x02\xc5\x02\xc6\x02\
-\xc7\x00\xf1\x00\xf2\x00\xf3\x02\xc8\x02\xc9\x02\xca\x02\xcb\x02\
-\xcc\x02\xcd\x02\xce\x02\xcf\x02\xd0\x02\xd1\x02\xd2\x02\xd3\x02\
-\xd4\x02\xd5\x02\xd6\x02\xd7\x02\xd8\x02\xd9\x02\xda\x02\xdb\x02\
-\xdc\x02\xdd\x02\xde\x02\xdf\x02\xe0\x02\xe1\x02\xe2\x02\xe3\x02\
-\xe4\x02\xe5\x02\xe6\x02\xe7\x02\xe8\x02\xe9\x02\xea\x02\xeb\x00\
-\xf4\x02\xec\x02\xed\x00\xf5\x00\xf6\x02\xee\x02\xef\x02\xf0\x02\
-\xf1\x02\xf2\x02\xf3\x02\xf4\x02\xf5\x02\xf6\x02\xf7\x02\xf8\x02\
-\xf9\x02\xfa\x02\xfb\x02\xfc\x02\xfd\x02\xfe\x02\xff\x03\x00\x03\
-\x01\x03\x02\x03\x03\x03\x04\x03\x05\x03\x06\x03\x07\x03\x08\x03\
-\x09\x03\x0a\x03\x0b\x03\x0c\x03\x0d\x03\x0e\x03\x0f\x03\x10\x03\
-\x11\x03\x12\x03\x13\x03\x14\x03\x15\x00\xd9\x03\x16\x00\xda\x00\
-\xdc\x00\x8e\x00\xdf\x00\x8d\x00\x43\x00\xd8\x00\xe1\x00\xdb\x03\
-\x17\x00\xdd\x03\x18\x03\x19\x03\x1a\x00\xde\x00\xe0\x03\x1b\x03\
-\x1c\x03\x1d\x03\x1e\x03\x1f\x03\x20\x03\x21\x03\x22\x03\x23\x03\
-\x24\x03\x25\x03\x26\x03\x27\x03\x28\x03\x29\x03\x2a\x03\x2b\x03\
-\x2c\x03\x2d\x03\x2e\x03\x2f\x03\x30\x03\x31\x03\x32\x03\x33\x03\
-\x34\x03\x35\x03\x36\x03\x37\x03\x38\x03\x39\x03\x3a\x03\x3b\x03\
-\x3c\x03\x3d\x03\x3e\x03\x3f\x03\x40\x03\x41\x03\x42\x03\x43\x03\
-\x44\x03\x45\x03\x46\x03\x47\x03\x48\x03\x49\x03\x4a\x03\x4b\x03\
-\x4c\x03\x4d\x03\x4e\x03\x4f\x03\x50\x03\x51\x03\x52\x03\x53\x03\
-\x54\x03\x55\x03\x56\x03\x57\x07\x75\x6e\x69\x30\x30\x30\x44\x07\
-\x61\x2e\x61\x6c\x74\x30\x31\x07\x67\x2e\x61\x6c\x74\x30\x31\x07\
-\x67\x2e\x61\x6c\x74\x30\x32\x0a\x7a\x65\x72\x6f\x2e\x61\x6c\x74\
-\x30\x31\x0a\x7a\x65\x72\x6f\x2e\x61\x6c\x74\x30\x32\x07\x75\x6e\
-\x69\x30\x30\x41\x44\x07\x75\x6e\x69\x32\x31\x32\x45\x07\x75\x6e\
-\x69\x32\x31\x31\x33\x07\x75\x6e\x69\x32\x31\x31\x36\x04\x45\x75\
-\x72\x6f\x07\x75\x6e\x69\x30\x45\x33\x46\x07\x75\x6e\x69\x32\x30\
-\x41\x31\x07\x75\x6e\x69\x32\x30\x41\x34\x07\x75\x6e\x69\x32\x30\
-\x41\x36\x07\x75\x6e\x69\x32\x30\x41\x38\x07\x75\x6e\x69\x32\x30\
-\x41\x39\x07\x75\x6e\x69\x32\x30\x41\x41\x07\x75\x6e\x69\x32\x30\
-\x41\x42\x07\x75\x6e\x69\x32\x30\x41\x44\x07\x75\x6e\x69\x32\x30\
-\x41\x45\x07\x75\x6e\x69\x32\x30\x42\x31\x07\x75\x6e\x69\x32\x30\
-\x42\x32\x07\x75\x6e\x69\x32\x30\x42\x34\x07\x75\x6e\x69\x32\x30\
-\x42\x35\x07\x75\x6e\x69\x32\x30\x42\x38\x07\x75\x6e\x69\x32\x30\
-\x42\x39\x07\x75\x6e\x69\x32\x30\x42\x41\x07\x75\x6e\x69\x32\x30\
-\x42\x44\x07\x75\x6e\x69\x32\x30\x42\x46\x06\x61\x62\x72\x65\x76\
-\x65\x07\x75\x6e\x69\x31\x45\x41\x31\x07\x75\x6e\x69\x31\x45\x41\
-\x33\x07\x61\x6d\x61\x63\x72\x6f\x6e\x07\x61\x6f\x67\x6f\x6e\x65\
-\x6b\x0a\x61\x72\x69\x6e\x67\x61\x63\x75\x74\x65\x07\x75\x6e\x69\
-\x31\x45\x41\x46\x07\x75\x6e\x69\x31\x45\x42\x37\x07\x75\x6e\x69\
-\x31\x45\x42\x31\x07\x75\x6e\x69\x31\x45\x42\x33\x07\x75\x6e\x69\
-\x31\x45\x42\x35\x07\x75\x6e\x69\x31\x45\x41\x35\x07\x75\x6e\x69\
-\x31\x45\x41\x44\x07\x75\x6e\x69\x31\x45\x41\x37\x07\x75\x6e\x69\
-\x31\x45\x41\x39\x07\x75\x6e\x69\x31\x45\x41\x42\x0c\x61\x61\x63\
-\x75\x74\x65\x2e\x61\x6c\x74\x30\x31\x0c\x61\x62\x72\x65\x76\x65\
-\x2e\x61\x6c\x74\x30\x31\x11\x61\x63\x69\x72\x63\x75\x6d\x66\x6c\
-\x65\x78\x2e\x61\x6c\x74\x30\x31\x0f\x61\x64\x69\x65\x72\x65\x73\
-\x69\x73\x2e\x61\x6c\x74\x30\x31\x0d\x75\x6e\x69\x31\x45\x41\x31\
-\x2e\x61\x6c\x74\x30\x31\x0c\x61\x67\x72\x61\x76\x65\x2e\x61\x6c\
-\x74\x30\x31\x0d\x75\x6e\x69\x31\x45\x41\x33\x2e\x61\x6c\x74\x30\
-\x31\x0d\x61\x6d\x61\x63\x72\x6f\x6e\x2e\x61\x6c\x74\x30\x31\x0d\
-\x61\x6f\x67\x6f\x6e\x65\x6b\x2e\x61\x6c\x74\x30\x31\x0b\x61\x72\
-\x69\x6e\x67\x2e\x61\x6c\x74\x30\x31\x10\x61\x72\x69\x6e\x67\x61\
-\x63\x75\x74\x65\x2e\x61\x6c\x74\x30\x31\x0c\x61\x74\x69\x6c\x64\
-\x65\x2e\x61\x6c\x74\x30\x31\x0d\x75\x6e\x69\x31\x45\x41\x46\x2e\
-\x61\x6c\x74\x30\x31\x0d\x75\x6e\x69\x31\x45\x42\x37\x2e\x61\x6c\
-\x74\x30\x31\x0d\x75\x6e\x69\x31\x45\x42\x31\x2e\x61\x6c\x74\x30\
-\x31\x0d\x75\x6e\x69\x31\x45\x42\x33\x2e\x61\x6c\x74\x30\x31\x0d\
-\x75\x6e\x69\x31\x45\x42\x35\x2e\x61\x6c\x74\x30\x31\x0d\x75\x6e\
-\x69\x31\x45\x41\x35\x2e\x61\x6c\x74\x30\x31\x0d\x75\x6e\x69\x31\
-\x45\x41\x44\x2e\x61\x6c\x74\x30\x31\x0d\x75\x6e\x69\x31\x45\x41\
-\x37\x2e\x61\x6c\x74\x30\x31\x0d\x75\x6e\x69\x31\x45\x41\x39\x2e\
-\x61\x6c\x74\x30\x31\x0d\x75\x6e\x69\x31\x45\x41\x42\x2e\x61\x6c\
-\x74\x30\x31\x07\x61\x65\x61\x63\x75\x74\x65\x0b\x63\x63\x69\x72\
-\x63\x75\x6d\x66\x6c\x65\x78\x0a\x63\x64\x6f\x74\x61\x63\x63\x65\
-\x6e\x74\x06\x64\x63\x61\x72\x6f\x6e\x06\x65\x62\x72\x65\x76\x65\
-\x06\x65\x63\x61\x72\x6f\x6e\x0a\x65\x64\x6f\x74\x61\x63\x63\x65\
-\x6e\x74\x07\x75\x6e\x69\x31\x45\x42\x39\x07\x75\x6e\x69\x31\x45\
-\x42\x42\x07\x65\x6d\x61\x63\x72\x6f\x6e\x07\x65\x6f\x67\x6f\x6e\
-\x65\x6b\x07\x75\x6e\x69\x31\x45\x42\x44\x07\x75\x6e\x69\x31\x45\
-\x42\x46\x07\x75\x6e\x69\x31\x45\x43\x37\x07\x75\x6e\x69\x31\x45\
-\x43\x31\x07\x75\x6e\x69\x31\x45\x43\x33\x07\x75\x6e\x69\x31\x45\
-\x43\x35\x07\x75\x6e\x69\x30\x32\x35\x39\x0b\x67\x63\x69\x72\x63\
-\x75\x6d\x66\x6c\x65\x78\x0c\x67\x63\x6f\x6d\x6d\x61\x61\x63\x63\
-\x65\x6e\x74\x0a\x67\x64\x6f\x74\x61\x63\x63\x65\x6e\x74\x0c\x67\
-\x62\x72\x65\x76\x65\x2e\x61\x6c\x74\x30\x31\x11\x67\x63\x69\x72\
-\x63\x75\x6d\x66\x6c\x65\x78\x2e\x61\x6c\x74\x30\x31\x12\x67\x63\
-\x6f\x6d\x6d\x61\x61\x63\x63\x65\x6e\x74\x2e\x61\x6c\x74\x30\x31\
-\x10\x67\x64\x6f\x74\x61\x63\x63\x65\x6e\x74\x2e\x61\x6c\x74\x30\
-\x31\x04\x68\x62\x61\x72\x0b\x68\x63\x69\x72\x63\x75\x6d\x66\x6c\
-\x65\x78\x06\x69\x62\x72\x65\x76\x65\x07\x75\x6e\x69\x31\x45\x43\
-\x42\x07\x75\x6e\x69\x31\x45\x43\x39\x07\x69\x6d\x61\x63\x72\x6f\
-\x6e\x07\x69\x6f\x67\x6f\x6e\x65\x6b\x06\x69\x74\x69\x6c\x64\x65\
-\x02\x69\x6a\x07\x69\x6a\x61\x63\x75\x74\x65\x07\x75\x6e\x69\x30\
-\x32\x33\x37\x06\x6a\x61\x63\x75\x74\x65\x0b\x6a\x63\x69\x72\x63\
-\x75\x6d\x66\x6c\x65\x78\x0c\x6b\x63\x6f\x6d\x6d\x61\x61\x63\x63\
-\x65\x6e\x74\x0c\x6b\x67\x72\x65\x65\x6e\x6c\x61\x6e\x64\x69\x63\
-\x06\x6c\x61\x63\x75\x74\x65\x06\x6c\x63\x61\x72\x6f\x6e\x0c\x6c\
-\x63\x6f\x6d\x6d\x61\x61\x63\x63\x65\x6e\x74\x04\x6c\x64\x6f\x74\
-\x06\x6e\x61\x63\x75\x74\x65\x06\x6e\x63\x61\x72\x6f\x6e\x0c\x6e\
-\x63\x6f\x6d\x6d\x61\x61\x63\x63\x65\x6e\x74\x0b\x6e\x61\x70\x6f\
-\x73\x74\x72\x6f\x70\x68\x65\x03\x65\x6e\x67\x06\x6f\x62\x72\x65\
-\x76\x65\x07\x75\x6e\x69\x31\x45\x43\x44\x07\x75\x6e\x69\x31\x45\
-\x43\x46\x0d\x6f\x68\x75\x6e\x67\x61\x72\x75\x6d\x6c\x61\x75\x74\
-\x07\x6f\x6d\x61\x63\x72\x6f\x6e\x0b\x6f\x73\x6c\x61\x73\x68\x61\
-\x63\x75\x74\x65\x05\x6f\x68\x6f\x72\x6e\x07\x75\x6e\x69\x31\x45\
-\x44\x42\x07\x75\x6e\x69\x31\x45\x45\x33\x07\x75\x6e\x69\x31\x45\
-\x44\x44\x07\x75\x6e\x69\x31\x45\x44\x46\x07\x75\x6e\x69\x31\x45\
-\x45\x31\x07\x75\x6e\x69\x31\x45\x44\x31\x07\x75\x6e\x69\x31\x45\
-\x44\x39\x07\x75\x6e\x69\x31\x45\x44\x33\x07\x75\x6e\x69\x31\x45\
-\x44\x35\x07\x75\x6e\x69\x31\x45\x44\x37\x06\x72\x61\x63\x75\x74\
-\x65\x06\x72\x63\x61\x72\x6f\x6e\x0c\x72\x63\x6f\x6d\x6d\x61\x61\
-\x63\x63\x65\x6e\x74\x06\x73\x61\x63\x75\x74\x65\x0b\x73\x63\x69\
-\x72\x63\x75\x6d\x66\x6c\x65\x78\x0c\x73\x63\x6f\x6d\x6d\x61\x61\
-\x63\x63\x65\x6e\x74\x10\x67\x65\x72\x6d\x61\x6e\x64\x62\x6c\x73\
-\x2e\x61\x6c\x74\x30\x31\x04\x74\x62\x61\x72\x06\x74\x63\x61\x72\
-\x6f\x6e\x07\x75\x6e\x69\x30\x31\x36\x33\x07\x75\x6e\x69\x30\x32\
-\x31\x42\x06\x75\x62\x72\x65\x76\x65\x07\x75\x6e\x69\x31\x45\x45\
-\x35\x07\x75\x6e\x69\x31\x45\x45\x37\x0d\x75\x68\x75\x6e\x67\x61\
-\x72\x75\x6d\x6c\x61\x75\x74\x07\x75\x6d\x61\x63\x72\x6f\x6e\x07\
-\x75\x6f\x67\x6f\x6e\x65\x6b\x05\x75\x72\x69\x6e\x67\x06\x75\x74\
-\x69\x6c\x64\x65\x05\x75\x68\x6f\x72\x6e\x07\x75\x6e\x69\x31\x45\
-\x45\x39\x07\x75\x6e\x69\x31\x45\x46\x31\x07\x75\x6e\x69\x31\x45\
-\x45\x42\x07\x75\x6e\x69\x31\x45\x45\x44\x07\x75\x6e\x69\x31\x45\
-\x45\x46\x06\x77\x61\x63\x75\x74\x65\x0b\x77\x63\x69\x72\x63\x75\
-\x6d\x66\x6c\x65\x78\x09\x77\x64\x69\x65\x72\x65\x73\x69\x73\x06\
-\x77\x67\x72\x61\x76\x65\x0b\x79\x63\x69\x72\x63\x75\x6d\x66\x6c\
-\x65\x78\x07\x75\x6e\x69\x31\x45\x46\x35\x06\x79\x67\x72\x61\x76\
-\x65\x07\x75\x6e\x69\x31\x45\x46\x37\x07\x75\x6e\x69\x31\x45\x46\
-\x39\x06\x7a\x61\x63\x75\x74\x65\x0a\x7a\x64\x6f\x74\x61\x63\x63\
-\x65\x6e\x74\x06\x41\x62\x72\x65\x76\x65\x07\x75\x6e\x69\x31\x45\
-\x41\x30\x07\x75\x6e\x69\x31\x45\x41\x32\x07\x41\x6d\x61\x63\x72\
-\x6f\x6e\x07\x41\x6f\x67\x6f\x6e\x65\x6b\x0a\x41\x72\x69\x6e\x67\
-\x61\x63\x75\x74\x65\x07\x75\x6e\x69\x31\x45\x41\x45\x07\x75\x6e\
-\x69\x31\x45\x42\x36\x07\x75\x6e\x69\x31\x45\x42\x30\x07\x75\x6e\
-\x69\x31\x45\x42\x32\x07\x75\x6e\x69\x31\x45\x42\x34\x07\x75\x6e\
-\x69\x31\x45\x41\x34\x07\x75\x6e\x69\x31\x45\x41\x43\x07\x75\x6e\
-\x69\x31\x45\x41\x36\x07\x75\x6e\x69\x31\x45\x41\x38\x07\x75\x6e\
-\x69\x31\x45\x41\x41\x07\x41\x45\x61\x63\x75\x74\x65\x0b\x43\x63\
-\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\x0a\x43\x64\x6f\x74\x61\x63\
-\x63\x65\x6e\x74\x06\x44\x63\x61\x72\x6f\x6e\x06\x44\x63\x72\x6f\
-\x61\x74\x06\x45\x62\x72\x65\x76\x65\x06\x45\x63\x61\x72\x6f\x6e\
-\x0a\x45\x64\x6f\x74\x61\x63\x63\x65\x6e\x74\x07\x75\x6e\x69\x31\
-\x45\x42\x38\x07\x75\x6e\x69\x31\x45\x42\x41\x07\x45\x6d\x61\x63\
-\x72\x6f\x6e\x07\x45\x6f\x67\x6f\x6e\x65\x6b\x07\x75\x6e\x69\x31\
-\x45\x42\x43\x07\x75\x6e\x69\x31\x45\x42\x45\x07\x75\x6e\x69\x31\
-\x45\x43\x36\x07\x75\x6e\x69\x31\x45\x43\x30\x07\x75\x6e\x69\x31\
-\x45\x43\x32\x07\x75\x6e\x69\x31\x45\x43\x34\x07\x75\x6e\x69\x30\
-\x31\x38\x46\x0b\x47\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\x0c\
-\x47\x63\x6f\x6d\x6d\x61\x61\x63\x63\x65\x6e\x74\x0a\x47\x64\x6f\
-\x74\x61\x63\x63\x65\x6e\x74\x04\x48\x62\x61\x72\x0b\x48\x63\x69\
-\x72\x63\x75\x6d\x66\x6c\x65\x78\x06\x49\x62\x72\x65\x76\x65\x07\
-\x75\x6e\x69\x31\x45\x43\x41\x07\x75\x6e\x69\x31\x45\x43\x38\x07\
-\x49\x6d\x61\x63\x72\x6f\x6e\x07\x49\x6f\x67\x6f\x6e\x65\x6b\x06\
-\x49\x74\x69\x6c\x64\x65\x02\x49\x4a\x07\x49\x4a\x61\x63\x75\x74\
-\x65\x06\x4a\x61\x63\x75\x74\x65\x0b\x4a\x63\x69\x72\x63\x75\x6d\
-\x66\x6c\x65\x78\x0c\x4b\x63\x6f\x6d\x6d\x61\x61\x63\x63\x65\x6e\
-\x74\x06\x4c\x61\x63\x75\x74\x65\x06\x4c\x63\x61\x72\x6f\x6e\x0c\
-\x4c\x63\x6f\x6d\x6d\x61\x61\x63\x63\x65\x6e\x74\x04\x4c\x64\x6f\
-\x74\x06\x4e\x61\x63\x75\x74\x65\x06\x4e\x63\x61\x72\x6f\x6e\x0c\
-\x4e\x63\x6f\x6d\x6d\x61\x61\x63\x63\x65\x6e\x74\x03\x45\x6e\x67\
-\x06\x4f\x62\x72\x65\x76\x65\x07\x75\x6e\x69\x31\x45\x43\x43\x07\
-\x75\x6e\x69\x31\x45\x43\x45\x0d\x4f\x68\x75\x6e\x67\x61\x72\x75\
-\x6d\x6c\x61\x75\x74\x07\x4f\x6d\x61\x63\x72\x6f\x6e\x0b\x4f\x73\
-\x6c\x61\x73\x68\x61\x63\x75\x74\x65\x05\x4f\x68\x6f\x72\x6e\x07\
-\x75\x6e\x69\x31\x45\x44\x41\x07\x75\x6e\x69\x31\x45\x45\x32\x07\
-\x75\x6e\x69\x31\x45\x44\x43\x07\x75\x6e\x69\x31\x45\x44\x45\x07\
-\x75\x6e\x69\x31\x45\x45\x30\x07\x75\x6e\x69\x31\x45\x44\x30\x07\
-\x75\x6e\x69\x31\x45\x44\x38\x07\x75\x6e\x69\x31\x45\x44\x32\x07\
-\x75\x6e\x69\x31\x45\x44\x34\x07\x75\x6e\x69\x31\x45\x44\x36\x06\
-\x52\x61\x63\x75\x74\x65\x06\x52\x63\x61\x72\x6f\x6e\x0c\x52\x63\
-\x6f\x6d\x6d\x61\x61\x63\x63\x65\x6e\x74\x06\x53\x61\x63\x75\x74\
-\x65\x0b\x53\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\x0c\x53\x63\
-\x6f\x6d\x6d\x61\x61\x63\x63\x65\x6e\x74\x07\x75\x6e\x69\x31\x45\
-\x39\x45\x04\x54\x62\x61\x72\x06\x54\x63\x61\x72\x6f\x6e\x07\x75\
-\x6e\x69\x30\x31\x36\x32\x07\x75\x6e\x69\x30\x32\x31\x41\x06\x55\
-\x62\x72\x65\x76\x65\x07\x75\x6e\x69\x31\x45\x45\x34\x07\x75\x6e\
-\x69\x31\x45\x45\x36\x0d\x55\x68\x75\x6e\x67\x61\x72\x75\x6d\x6c\
-\x61\x75\x74\x07\x55\x6d\x61\x63\x72\x6f\x6e\x07\x55\x6f\x67\x6f\
-\x6e\x65\x6b\x05\x55\x72\x69\x6e\x67\x06\x55\x74\x69\x6c\x64\x65\
-\x05\x55\x68\x6f\x72\x6e\x07\x75\x6e\x69\x31\x45\x45\x38\x07\x75\
-\x6e\x69\x31\x45\x46\x30\x07\x75\x6e\x69\x31\x45\x45\x41\x07\x75\
-\x6e\x69\x31\x45\x45\x43\x07\x75\x6e\x69\x31\x45\x45\x45\x06\x57\
-\x61\x63\x75\x74\x65\x0b\x57\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\
-\x78\x09\x57\x64\x69\x65\x72\x65\x73\x69\x73\x06\x57\x67\x72\x61\
-\x76\x65\x0b\x59\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\x07\x75\
-\x6e\x69\x31\x45\x46\x34\x06\x59\x67\x72\x61\x76\x65\x07\x75\x6e\
-\x69\x31\x45\x46\x36\x07\x75\x6e\x69\x31\x45\x46\x38\x06\x5a\x61\
-\x63\x75\x74\x65\x0a\x5a\x64\x6f\x74\x61\x63\x63\x65\x6e\x74\x07\
-\x75\x6e\x69\x30\x34\x33\x30\x0d\x75\x6e\x69\x30\x34\x33\x30\x2e\
-\x61\x6c\x74\x30\x31\x07\x75\x6e\x69\x30\x34\x33\x31\x07\x75\x6e\
-\x69\x30\x34\x33\x32\x07\x75\x6e\x69\x30\x34\x33\x33\x07\x75\x6e\
-\x69\x30\x34\x33\x34\x07\x75\x6e\x69\x30\x34\x33\x35\x07\x75\x6e\
-\x69\x30\x34\x33\x36\x07\x75\x6e\x69\x30\x34\x33\x37\x07\x75\x6e\
-\x69\x30\x34\x33\x38\x07\x75\x6e\x69\x30\x34\x33\x39\x07\x75\x6e\
-\x69\x30\x34\x33\x41\x07\x75\x6e\x69\x30\x34\x33\x42\x07\x75\x6e\
-\x69\x30\x34\x33\x43\x07\x75\x6e\x69\x30\x34\x33\x44\x07\x75\x6e\
-\x69\x30\x34\x33\x45\x07\x75\x6e\x69\x30\x34\x33\x46\x07\x75\x6e\
-\x69\x30\x34\x34\x30\x07\x75\x6e\x69\x30\x34\x34\x31\x07\x75\x6e\
-\x69\x30\x34\x34\x32\x07\x75\x6e\x69\x30\x34\x34\x33\x07\x75\x6e\
-\x69\x30\x34\x34\x34\x07\x75\x6e\x69\x30\x34\x34\x35\x07\x75\x6e\
-\x69\x30\x34\x34\x36\x07\x75\x6e\x69\x30\x34\x34\x37\x07\x75\x6e\
-\x69\x30\x34\x34\x38\x07\x75\x6e\x69\x30\x34\x34\x39\x07\x75\x6e\
-\x69\x30\x34\x34\x41\x07\x75\x6e\x69\x30\x34\x34\x42\x07\x75\x6e\
-\x69\x30\x34\x34\x43\x07\x75\x6e\x69\x30\x34\x34\x44\x07\x75\x6e\
-\x69\x30\x34\x34\x45\x07\x75\x6e\x69\x30\x34\x34\x46\x07\x75\x6e\
-\x69\x30\x34\x31\x30\x07\x75\x6e\x69\x30\x34\x31\x31\x07\x75\x6e\
-\x69\x30\x34\x31\x32\x07\x75\x6e\x69\x30\x34\x31\x33\x07\x75\x6e\
-\x69\x30\x34\x31\x34\x07\x75\x6e\x69\x30\x34\x31\x35\x07\x75\x6e\
-\x69\x30\x34\x31\x36\x07\x75\x6e\x69\x30\x34\x31\x37\x07\x75\x6e\
-\x69\x30\x34\x31\x38\x07\x75\x6e\x69\x30\x34\x31\x39\x07\x75\x6e\
-\x69\x30\x34\x31\x41\x07\x75\x6e\x69\x30\x34\x31\x42\x07\x75\x6e\
-\x69\x30\x34\x31\x43\x07\x75\x6e\x69\x30\x34\x31\x44\x07\x75\x6e\
-\x69\x30\x34\x31\x45\x07\x75\x6e\x69\x30\x34\x31\x46\x07\x75\x6e\
-\x69\x30\x34\x32\x30\x07\x75\x6e\x69\x30\x34\x32\x31\x07\x75\x6e\
-\x69\x30\x34\x32\x32\x07\x75\x6e\x69\x30\x34\x32\x33\x07\x75\x6e\
-\x69\x30\x34\x32\x34\x07\x75\x6e\x69\x30\x34\x32\x35\x07\x75\x6e\
-\x69\x30\x34\x32\x36\x07\x75\x6e\x69\x30\x34\x32\x37\x07\x75\x6e\
-\x69\x30\x34\x32\x38\x07\x75\x6e\x69\x30\x34\x32\x39\x07\x75\x6e\
-\x69\x30\x34\x32\x41\x07\x75\x6e\x69\x30\x34\x32\x42\x07\x75\x6e\
-\x69\x30\x34\x32\x43\x07\x75\x6e\x69\x30\x34\x32\x44\x07\x75\x6e\
-\x69\x30\x34\x32\x45\x07\x75\x6e\x69\x30\x34\x32\x46\x07\x75\x6e\
-\x69\x30\x34\x44\x33\x07\x75\x6e\x69\x30\x34\x44\x31\x0d\x75\x6e\
-\x69\x30\x34\x44\x33\x2e\x61\x6c\x74\x30\x31\x0d\x75\x6e\x69\x30\
-\x34\x44\x31\x2e\x61\x6c\x74\x30\x31\x07\x75\x6e\x69\x30\x34\x44\
-\x35\x07\x75\x6e\x69\x30\x34\x35\x33\x07\x75\x6e\x69\x30\x34\x39\
-\x31\x07\x75\x6e\x69\x30\x34\x39\x33\x07\x75\x6e\x69\x30\x34\x39\
-\x35\x07\x75\x6e\x69\x30\x34\x35\x30\x07\x75\x6e\x69\x30\x34\x35\
-\x31\x07\x75\x6e\x69\x30\x34\x44\x37\x07\x75\x6e\x69\x30\x34\x35\
-\x34\x07\x75\x6e\x69\x30\x34\x44\x44\x07\x75\x6e\x69\x30\x34\x43\
-\x32\x07\x75\x6e\x69\x30\x34\x39\x37\x07\x75\x6e\x69\x30\x34\x44\
-\x46\x07\x75\x6e\x69\x30\x34\x39\x39\x07\x75\x6e\x69\x30\x34\x43\
-\x46\x07\x75\x6e\x69\x30\x34\x45\x35\x07\x75\x6e\x69\x30\x34\x35\
-\x44\x07\x75\x6e\x69\x30\x34\x45\x33\x07\x75\x6e\x69\x30\x34\x35\
-\x43\x07\x75\x6e\x69\x30\x34\x39\x42\x07\x75\x6e\x69\x30\x34\x39\
-\x44\x07\x75\x6e\x69\x30\x34\x41\x31\x07\x75\x6e\x69\x30\x34\x35\
-\x39\x07\x75\x6e\x69\x30\x34\x41\x33\x07\x75\x6e\x69\x30\x34\x35\
-\x41\x07\x75\x6e\x69\x30\x34\x41\x35\x07\x75\x6e\x69\x30\x34\x45\
-\x37\x07\x75\x6e\x69\x30\x34\x37\x33\x07\x75\x6e\x69\x30\x34\x45\
-\x39\x07\x75\x6e\x69\x30\x34\x41\x42\x07\x75\x6e\x69\x30\x34\x45\
-\x46\x07\x75\x6e\x69\x30\x34\x46\x31\x07\x75\x6e\x69\x30\x34\x46\
-\x33\x07\x75\x6e\x69\x30\x34\x35\x45\x07\x75\x6e\x69\x30\x34\x41\
-\x46\x07\x75\x6e\x69\x30\x34\x42\x31\x07\x75\x6e\x69\x30\x34\x42\
-\x33\x07\x75\x6e\x69\x30\x34\x46\x35\x07\x75\x6e\x69\x30\x34\x42\
-\x37\x07\x75\x6e\x69\x30\x34\x42\x39\x07\x75\x6e\x69\x30\x34\x46\
-\x39\x07\x75\x6e\x69\x30\x34\x35\x35\x07\x75\x6e\x69\x30\x34\x35\
-\x46\x07\x75\x6e\x69\x30\x34\x35\x36\x07\x75\x6e\x69\x30\x34\x35\
-\x37\x07\x75\x6e\x69\x30\x34\x35\x38\x07\x75\x6e\x69\x30\x34\x35\
-\x32\x07\x75\x6e\x69\x30\x34\x35\x42\x07\x75\x6e\x69\x30\x34\x42\
-\x42\x07\x75\x6e\x69\x30\x34\x44\x39\x07\x75\x6e\x69\x30\x34\x44\
-\x32\x07\x75\x6e\x69\x30\x34\x44\x30\x07\x75\x6e\x69\x30\x34\x44\
-\x34\x07\x75\x6e\x69\x30\x34\x30\x33\x07\x75\x6e\x69\x30\x34\x39\
-\x30\x07\x75\x6e\x69\x30\x34\x39\x32\x07\x75\x6e\x69\x30\x34\x39\
-\x34\x07\x75\x6e\x69\x30\x34\x30\x30\x07\x75\x6e\x69\x30\x34\x30\
-\x31\x07\x75\x6e\x69\x30\x34\x44\x36\x07\x75\x6e\x69\x30\x34\x30\
-\x34\x07\x75\x6e\x69\x30\x34\x44\x43\x07\x75\x6e\x69\x30\x34\x43\
-\x31\x07\x75\x6e\x69\x30\x34\x39\x36\x07\x75\x6e\x69\x30\x34\x44\
-\x45\x07\x75\x6e\x69\x30\x34\x39\x38\x07\x75\x6e\x69\x30\x34\x43\
-\x30\x07\x75\x6e\x69\x30\x34\x45\x34\x07\x75\x6e\x69\x30\x34\x30\
-\x44\x07\x75\x6e\x69\x30\x34\x45\x32\x07\x75\x6e\x69\x30\x34\x30\
-\x43\x07\x75\x6e\x69\x30\x34\x39\x41\x07\x75\x6e\x69\x30\x34\x39\
-\x43\x07\x75\x6e\x69\x30\x34\x41\x30\x07\x75\x6e\x69\x30\x34\x30\
-\x39\x07\x75\x6e\x69\x30\x34\x41\x32\x07\x75\x6e\x69\x30\x34\x30\
-\x41\x07\x75\x6e\x69\x30\x34\x41\x34\x07\x75\x6e\x69\x30\x34\x45\
-\x36\x07\x75\x6e\x69\x30\x34\x37\x32\x07\x75\x6e\x69\x30\x34\x45\
-\x38\x07\x75\x6e\x69\x30\x34\x41\x41\x07\x75\x6e\x69\x30\x34\x45\
-\x45\x07\x75\x6e\x69\x30\x34\x46\x30\x07\x75\x6e\x69\x30\x34\x46\
-\x32\x07\x75\x6e\x69\x30\x34\x30\x45\x07\x75\x6e\x69\x30\x34\x41\
-\x45\x07\x75\x6e\x69\x30\x34\x42\x30\x07\x75\x6e\x69\x30\x34\x42\
-\x32\x07\x75\x6e\x69\x30\x34\x46\x34\x07\x75\x6e\x69\x30\x34\x42\
-\x36\x07\x75\x6e\x69\x30\x34\x42\x38\x07\x75\x6e\x69\x30\x34\x46\
-\x38\x07\x75\x6e\x69\x30\x34\x30\x35\x07\x75\x6e\x69\x30\x34\x30\
-\x46\x07\x75\x6e\x69\x30\x34\x30\x36\x07\x75\x6e\x69\x30\x34\x30\
-\x37\x07\x75\x6e\x69\x30\x34\x30\x38\x07\x75\x6e\x69\x30\x34\x30\
-\x32\x07\x75\x6e\x69\x30\x34\x30\x42\x07\x75\x6e\x69\x30\x34\x42\
-\x41\x07\x75\x6e\x69\x30\x34\x44\x38\x07\x75\x6e\x69\x32\x30\x37\
-\x30\x07\x75\x6e\x69\x32\x30\x37\x34\x07\x75\x6e\x69\x32\x30\x37\
-\x35\x07\x75\x6e\x69\x32\x30\x37\x36\x07\x75\x6e\x69\x32\x30\x37\
-\x37\x07\x75\x6e\x69\x32\x30\x37\x38\x07\x75\x6e\x69\x32\x30\x37\
-\x39\x07\x75\x6e\x69\x32\x30\x38\x30\x07\x75\x6e\x69\x32\x30\x38\
-\x31\x07\x75\x6e\x69\x32\x30\x38\x32\x07\x75\x6e\x69\x32\x30\x38\
-\x33\x07\x75\x6e\x69\x32\x30\x38\x34\x07\x75\x6e\x69\x32\x30\x38\
-\x35\x07\x75\x6e\x69\x32\x30\x38\x36\x07\x75\x6e\x69\x32\x30\x38\
-\x37\x07\x75\x6e\x69\x32\x30\x38\x38\x07\x75\x6e\x69\x32\x30\x38\
-\x39\x09\x7a\x65\x72\x6f\x2e\x6e\x75\x6d\x72\x08\x6f\x6e\x65\x2e\
-\x6e\x75\x6d\x72\x08\x74\x77\x6f\x2e\x6e\x75\x6d\x72\x0a\x74\x68\
-\x72\x65\x65\x2e\x6e\x75\x6d\x72\x09\x66\x6f\x75\x72\x2e\x6e\x75\
-\x6d\x72\x09\x66\x69\x76\x65\x2e\x6e\x75\x6d\x72\x08\x73\x69\x78\
-\x2e\x6e\x75\x6d\x72\x0a\x73\x65\x76\x65\x6e\x2e\x6e\x75\x6d\x72\
-\x0a\x65\x69\x67\x68\x74\x2e\x6e\x75\x6d\x72\x09\x6e\x69\x6e\x65\
-\x2e\x6e\x75\x6d\x72\x09\x7a\x65\x72\x6f\x2e\x64\x6e\x6f\x6d\x08\
-\x6f\x6e\x65\x2e\x64\x6e\x6f\x6d\x08\x74\x77\x6f\x2e\x64\x6e\x6f\
-\x6d\x0a\x74\x68\x72\x65\x65\x2e\x64\x6e\x6f\x6d\x09\x66\x6f\x75\
-\x72\x2e\x64\x6e\x6f\x6d\x09\x66\x69\x76\x65\x2e\x64\x6e\x6f\x6d\
-\x08\x73\x69\x78\x2e\x64\x6e\x6f\x6d\x0a\x73\x65\x76\x65\x6e\x2e\
-\x64\x6e\x6f\x6d\x0a\x65\x69\x67\x68\x74\x2e\x64\x6e\x6f\x6d\x09\
-\x6e\x69\x6e\x65\x2e\x64\x6e\x6f\x6d\x07\x75\x6e\x69\x32\x31\x35\
-\x33\x07\x75\x6e\x69\x32\x31\x35\x34\x07\x75\x6e\x69\x32\x31\x35\
-\x35\x07\x75\x6e\x69\x32\x31\x35\x36\x07\x75\x6e\x69\x32\x31\x35\
-\x37\x07\x75\x6e\x69\x32\x31\x35\x38\x07\x75\x6e\x69\x32\x31\x35\
-\x39\x07\x75\x6e\x69\x32\x31\x35\x41\x07\x75\x6e\x69\x32\x31\x35\
-\x30\x07\x75\x6e\x69\x32\x31\x35\x42\x07\x75\x6e\x69\x32\x31\x35\
-\x43\x07\x75\x6e\x69\x32\x31\x35\x44\x07\x75\x6e\x69\x32\x31\x35\
-\x45\x07\x75\x6e\x69\x32\x31\x35\x31\x07\x75\x6e\x69\x32\x37\x31\
-\x33\x07\x75\x6e\x69\x32\x37\x34\x43\x07\x75\x6e\x69\x32\x31\x39\
-\x30\x07\x75\x6e\x69\x32\x31\x39\x31\x07\x75\x6e\x69\x32\x31\x39\
-\x33\x07\x75\x6e\x69\x32\x31\x39\x32\x07\x75\x6e\x69\x32\x31\x39\
-\x36\x07\x75\x6e\x69\x32\x31\x39\x37\x07\x75\x6e\x69\x32\x31\x39\
-\x39\x07\x75\x6e\x69\x32\x31\x39\x38\x07\x75\x6e\x69\x32\x31\x42\
-\x30\x07\x75\x6e\x69\x32\x31\x42\x32\x07\x75\x6e\x69\x32\x42\x31\
-\x31\x07\x75\x6e\x69\x32\x42\x30\x46\x07\x75\x6e\x69\x32\x42\x31\
-\x30\x07\x75\x6e\x69\x32\x42\x30\x45\x07\x75\x6e\x69\x32\x31\x42\
-\x31\x07\x75\x6e\x69\x32\x31\x42\x33\x07\x75\x6e\x69\x32\x31\x43\
-\x36\x07\x75\x6e\x69\x32\x31\x43\x34\x07\x75\x6e\x69\x32\x31\x39\
-\x34\x07\x75\x6e\x69\x32\x31\x39\x35\x07\x75\x6e\x69\x32\x31\x42\
-\x36\x07\x75\x6e\x69\x32\x31\x42\x37\x07\x75\x6e\x69\x32\x31\x41\
-\x39\x07\x75\x6e\x69\x32\x31\x41\x41\x07\x75\x6e\x69\x32\x31\x42\
-\x41\x07\x75\x6e\x69\x32\x31\x42\x42\x0b\x74\x69\x6c\x64\x65\x2e\
-\x61\x6c\x74\x30\x31\x0a\x62\x72\x65\x76\x65\x2e\x63\x79\x72\x6c\
-\x09\x72\x69\x6e\x67\x61\x63\x75\x74\x65\x07\x75\x6e\x69\x30\x32\
-\x42\x42\x07\x75\x6e\x69\x30\x32\x42\x43\x07\x75\x6e\x69\x30\x33\
-\x30\x33\x07\x75\x6e\x69\x30\x33\x30\x34\x07\x75\x6e\x69\x30\x33\
-\x30\x37\x07\x75\x6e\x69\x30\x33\x30\x38\x07\x75\x6e\x69\x30\x33\
-\x30\x42\x07\x75\x6e\x69\x30\x33\x30\x31\x07\x75\x6e\x69\x30\x33\
-\x30\x30\x07\x75\x6e\x69\x30\x33\x30\x32\x07\x75\x6e\x69\x30\x33\
-\x30\x43\x07\x75\x6e\x69\x30\x33\x30\x36\x07\x75\x6e\x69\x30\x33\
-\x30\x41\x07\x75\x6e\x69\x30\x33\x30\x39\x07\x75\x6e\x69\x30\x33\
-\x31\x32\x07\x75\x6e\x69\x30\x33\x31\x35\x07\x75\x6e\x69\x30\x33\
-\x31\x42\x07\x75\x6e\x69\x30\x33\x32\x37\x07\x75\x6e\x69\x30\x33\
-\x32\x33\x07\x75\x6e\x69\x30\x33\x32\x36\x07\x75\x6e\x69\x30\x33\
-\x32\x38\x0a\x62\x72\x65\x76\x65\x61\x63\x75\x74\x65\x0a\x62\x72\
-\x65\x76\x65\x67\x72\x61\x76\x65\x09\x62\x72\x65\x76\x65\x68\x6f\
-\x6f\x6b\x0a\x62\x72\x65\x76\x65\x74\x69\x6c\x64\x65\x0d\x64\x69\
-\x65\x72\x65\x73\x69\x73\x61\x63\x75\x74\x65\x0d\x64\x69\x65\x72\
-\x65\x73\x69\x73\x63\x61\x72\x6f\x6e\x0d\x64\x69\x65\x72\x65\x73\
-\x69\x73\x67\x72\x61\x76\x65\x0f\x63\x69\x72\x63\x75\x6d\x66\x6c\
-\x65\x78\x61\x63\x75\x74\x65\x0f\x63\x69\x72\x63\x75\x6d\x66\x6c\
-\x65\x78\x62\x72\x65\x76\x65\x0f\x63\x69\x72\x63\x75\x6d\x66\x6c\
-\x65\x78\x67\x72\x61\x76\x65\x0e\x63\x69\x72\x63\x75\x6d\x66\x6c\
-\x65\x78\x68\x6f\x6f\x6b\x0e\x64\x69\x65\x72\x65\x73\x69\x73\x6d\
-\x61\x63\x72\x6f\x6e\x0f\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\
-\x74\x69\x6c\x64\x65\x0a\x74\x69\x6c\x64\x65\x2e\x63\x61\x73\x65\
-\x10\x74\x69\x6c\x64\x65\x2e\x61\x6c\x74\x30\x31\x2e\x63\x61\x73\
-\x65\x0b\x6d\x61\x63\x72\x6f\x6e\x2e\x63\x61\x73\x65\x0e\x64\x6f\
-\x74\x61\x63\x63\x65\x6e\x74\x2e\x63\x61\x73\x65\x0d\x64\x69\x65\
-\x72\x65\x73\x69\x73\x2e\x63\x61\x73\x65\x11\x68\x75\x6e\x67\x61\
-\x72\x75\x6d\x6c\x61\x75\x74\x2e\x63\x61\x73\x65\x0a\x61\x63\x75\
-\x74\x65\x2e\x63\x61\x73\x65\x0a\x67\x72\x61\x76\x65\x2e\x63\x61\
-\x73\x65\x0f\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\x2e\x63\x61\
-\x73\x65\x0a\x63\x61\x72\x6f\x6e\x2e\x63\x61\x73\x65\x0a\x62\x72\
-\x65\x76\x65\x2e\x63\x61\x73\x65\x0f\x62\x72\x65\x76\x65\x2e\x63\
-\x79\x72\x6c\x5f\x63\x61\x73\x65\x09\x72\x69\x6e\x67\x2e\x63\x61\
-\x73\x65\x0e\x72\x69\x6e\x67\x61\x63\x75\x74\x65\x2e\x63\x61\x73\
-\x65\x0c\x75\x6e\x69\x30\x33\x30\x39\x2e\x63\x61\x73\x65\x0f\x62\
-\x72\x65\x76\x65\x61\x63\x75\x74\x65\x2e\x63\x61\x73\x65\x0f\x62\
-\x72\x65\x76\x65\x67\x72\x61\x76\x65\x2e\x63\x61\x73\x65\x0e\x62\
-\x72\x65\x76\x65\x68\x6f\x6f\x6b\x2e\x63\x61\x73\x65\x0f\x62\x72\
-\x65\x76\x65\x74\x69\x6c\x64\x65\x2e\x63\x61\x73\x65\x12\x64\x69\
-\x65\x72\x65\x73\x69\x73\x61\x63\x75\x74\x65\x2e\x63\x61\x73\x65\
-\x12\x64\x69\x65\x72\x65\x73\x69\x73\x63\x61\x72\x6f\x6e\x2e\x63\
-\x61\x73\x65\x12\x64\x69\x65\x72\x65\x73\x69\x73\x67\x72\x61\x76\
-\x65\x2e\x63\x61\x73\x65\x14\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\
-\x78\x61\x63\x75\x74\x65\x2e\x63\x61\x73\x65\x14\x63\x69\x72\x63\
-\x75\x6d\x66\x6c\x65\x78\x62\x72\x65\x76\x65\x2e\x63\x61\x73\x65\
-\x14\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\x67\x72\x61\x76\x65\
-\x2e\x63\x61\x73\x65\x13\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\
-\x68\x6f\x6f\x6b\x2e\x63\x61\x73\x65\x13\x64\x69\x65\x72\x65\x73\
-\x69\x73\x6d\x61\x63\x72\x6f\x6e\x2e\x63\x61\x73\x65\x14\x63\x69\
-\x72\x63\x75\x6d\x66\x6c\x65\x78\x74\x69\x6c\x64\x65\x2e\x63\x61\
-\x73\x65\x07\x75\x6e\x69\x30\x30\x41\x30\x00\x00\x01\x00\x03\x00\
-\x08\x00\x0a\x00\x10\x00\x05\xff\xff\x00\x0f\x00\x01\x00\x00\x00\
-\x0c\x00\x00\x00\x00\x00\x00\x00\x02\x00\x1b\x00\x04\x00\x0f\x00\
-\x01\x00\x11\x00\x3a\x00\x01\x00\xae\x00\xaf\x00\x02\x00\xdc\x00\
-\xdc\x00\x01\x01\x02\x01\x02\x00\x01\x01\x0f\x01\x0f\x00\x01\x01\
-\x28\x01\x28\x00\x01\x01\x2b\x01\x2b\x00\x01\x01\x52\x01\x52\x00\
-\x01\x01\x7c\x01\x7c\x00\x01\x01\xc1\x01\xc1\x00\x01\x01\xc4\x01\
-\xc4\x00\x01\x01\xea\x01\xea\x00\x01\x02\x08\x02\x08\x00\x01\x02\
-\x0b\x02\x0d\x00\x01\x02\x0f\x02\x0f\x00\x01\x02\x1c\x02\x1c\x00\
-\x01\x02\x20\x02\x20\x00\x01\x02\x28\x02\x28\x00\x01\x02\x2b\x02\
-\x2d\x00\x01\x02\x2f\x02\x2f\x00\x01\x02\x38\x02\x38\x00\x01\x02\
-\x3c\x02\x3c\x00\x01\x02\x40\x02\x40\x00\x01\x03\x16\x03\x23\x00\
-\x03\x03\x25\x03\x35\x00\x03\x03\x44\x03\x51\x00\x03\x00\x00\x00\
-\x01\x00\x00\x00\x0a\x00\x42\x00\x7a\x00\x03\x44\x46\x4c\x54\x00\
-\x14\x63\x79\x72\x6c\x00\x20\x6c\x61\x74\x6e\x00\x2c\x00\x04\x00\
-\x00\x00\x00\xff\xff\x00\x01\x00\x00\x00\x04\x00\x00\x00\x00\xff\
-\xff\x00\x01\x00\x01\x00\x04\x00\x00\x00\x00\xff\xff\x00\x01\x00\
-\x02\x00\x03\x6d\x61\x72\x6b\x00\x14\x6d\x61\x72\x6b\x00\x20\x6d\
-\x61\x72\x6b\x00\x2c\x00\x00\x00\x04\x00\x00\x00\x01\x00\x02\x00\
-\x03\x00\x00\x00\x04\x00\x00\x00\x01\x00\x02\x00\x03\x00\x00\x00\
-\x04\x00\x00\x00\x01\x00\x02\x00\x03\x00\x04\x00\x0a\x00\x12\x00\
-\x1a\x00\x22\x00\x04\x00\x00\x00\x01\x00\x20\x00\x04\x00\x00\x00\
-\x01\x01\x22\x00\x04\x00\x00\x00\x01\x01\x7e\x00\x04\x00\x00\x00\
-\x01\x03\x42\x00\x01\x03\x74\x03\x7e\x00\x01\x00\x0c\x00\x1a\x00\
-\x03\x00\x00\x00\x7a\x00\x00\x00\x7a\x00\x00\x00\x7a\x00\x35\x00\
-\x72\x00\x78\x00\x7e\x00\x84\x00\x8a\x00\x90\x00\x96\x00\x84\x00\
-\x9c\x00\xa2\x00\xa8\x00\xa8\x00\x84\x00\xa8\x00\xae\x00\xb4\x00\
-\xba\x00\xc0\x00\xa8\x00\xa8\x00\xa8\x00\xc6\x00\xa8\x00\xa8\x00\
-\xcc\x00\x96\x00\xd2\x00\xd8\x00\xde\x00\xa8\x00\xa8\x00\xa8\x00\
-\xd2\x00\xe4\x00\xea\x00\xa8\x00\xa8\x00\xa8\x00\xde\x00\x96\x00\
-\xc0\x00\xa8\x00\xa8\x00\xa8\x00\xa8\x00\xa8\x00\xa8\x00\xa8\x00\
-\x9c\x00\xa8\x00\xc0\x00\xa8\x00\xa8\x00\x01\x00\x00\x00\x00\x00\
-\x01\x01\x1b\x00\x00\x00\x01\x01\x1f\x00\x00\x00\x01\x01\x3d\x00\
-\x00\x00\x01\x01\x2f\x00\x00\x00\x01\x01\x1a\x00\x00\x00\x01\x01\
-\x35\x00\x00\x00\x01\x01\x34\x00\x00\x00\x01\x01\x4c\x00\x00\x00\
-\x01\x01\x43\x00\x00\x00\x01\x01\x2c\x00\x00\x00\x01\x01\x0c\x00\
-\x00\x00\x01\x01\x26\x00\x00\x00\x01\x01\x77\x00\x00\x00\x01\x01\
-\x29\x00\x00\x00\x01\x01\xcc\x00\x00\x00\x01\x01\x3b\x00\x00\x00\
-\x01\x01\x15\x00\x00\x00\x01\x01\x31\x00\x00\x00\x01\x00\x84\x00\
-\x00\x00\x01\x01\x42\x00\x00\x00\x01\x01\x47\x00\x00\x00\x01\x02\
-\xb4\x02\xba\x00\x01\x00\x0c\x00\x12\x00\x01\x00\x00\x00\x1c\x00\
-\x0a\x00\x1c\x00\x22\x00\x28\x00\x2e\x00\x34\x00\x3a\x00\x40\x00\
-\x46\x00\x4c\x00\x2e\x00\x01\x00\x00\x00\x00\x00\x01\x02\x26\x00\
-\x00\x00\x01\x01\xf9\x00\x00\x00\x01\x01\x87\x00\x00\x00\x01\x02\
-\x22\x00\x00\x00\x01\x01\xf6\x00\x00\x00\x01\x02\x3a\x00\x00\x00\
-\x01\x02\x08\x00\x00\x00\x01\x02\x04\x00\x00\x00\x01\x01\x8a\x00\
-\x00\x00\x01\x02\x6e\x02\x84\x00\x01\x00\x0c\x00\xae\x00\x28\x00\
-\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\
-\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\
-\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\
-\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\
-\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\
-\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x18\x00\
-\x00\x01\x18\x00\x00\x01\x18\x00\x00\x01\x1e\x00\x00\x01\x1e\x00\
-\x00\x01\x1e\x00\x00\x01\x1e\x00\x00\x01\x1e\x00\x00\x01\x1e\x00\
-\x00\x01\x1e\x00\x00\x01\x1e\x00\x00\x01\x1e\x00\x00\x01\x1e\x00\
-\x00\x01\x1e\x00\x00\x01\x1e\x00\x00\x01\x1e\x00\x00\x01\x1e\x00\
-\x3a\x00\x82\x00\x88\x00\x8e\x00\x94\x00\x9a\x00\x88\x00\xa0\x00\
-\xa6\x00\xac\x00\xa0\x00\xb2\x00\xa0\x00\xb8\x00\xbe\x00\xc4\x00\
-\xca\x00\x9a\x00\xa0\x00\xa0\x00\xa0\x00\xa0\x00\xa0\x00\xac\x00\
-\xd0\x00\xd6\x00\xdc\x00\xe2\x00\xe8\x00\xee\x00\xac\x00\xac\x00\
-\xf4\x00\xf4\x00\xfa\x00\xac\x00\xac\x00\xac\x00\xac\x00\xac\x01\
-\x00\x01\x06\x00\xac\x00\xac\x00\xac\x00\xac\x00\xac\x00\xac\x00\
-\xac\x00\xa0\x01\x0c\x01\x12\x00\xa0\x00\xa0\x00\x9a\x01\x18\x00\
-\xac\x00\xac\x00\xac\x00\x01\x00\x00\x02\x04\x00\x01\x00\x00\x02\
-\xba\x00\x01\x01\x1b\x02\x04\x00\x01\x01\x1f\x02\x04\x00\x01\x01\
-\x39\x02\x04\x00\x01\x01\x2e\x02\x04\x00\x01\x01\x29\x02\x04\x00\
-\x01\x01\x2c\x02\x04\x00\x01\x00\x8a\x02\xba\x00\x01\x01\x2c\x02\
-\xba\x00\x01\x01\x2f\x02\x04\x00\x01\x01\x3d\x02\x04\x00\x01\x01\
-\x1a\x02\x04\x00\x01\x01\x61\x02\x04\x00\x01\x01\x2a\x02\x04\x00\
-\x01\x01\x27\x02\xba\x00\x01\x01\x48\x02\xba\x00\x01\x01\x15\x02\
-\xba\x00\x01\x01\x31\x02\xba\x00\x01\x01\x36\x02\xba\x00\x01\x01\
-\x32\x02\xba\x00\x01\x01\x39\x02\xba\x00\x01\x00\xa2\x02\xba\x00\
-\x01\x01\x34\x02\xba\x00\x01\x01\x2a\x02\xba\x00\x01\x01\x4c\x02\
-\x04\x00\x01\x01\x88\x02\x04\x00\x01\x01\x89\x02\xba\x00\x01\x01\
-\x1c\x01\x22\x00\x01\x00\x0c\x00\x12\x00\x01\x00\x00\x00\x10\x00\
-\x04\x00\x10\x00\x16\x00\x1c\x00\x22\x00\x01\x00\x00\x02\xe4\x00\
-\x01\x02\x37\x02\xe4\x00\x01\x01\xaa\x02\xe4\x00\x01\x01\x83\x02\
-\xf8\x00\x01\x01\x22\x02\xe4\x00\x02\x00\x01\x03\x25\x03\x27\x00\
-\x00\x00\x02\x00\x0a\x00\x04\x00\x0a\x00\x00\x00\x0e\x00\x0f\x00\
-\x07\x00\x11\x00\x15\x00\x09\x00\x18\x00\x30\x00\x0e\x00\x32\x00\
-\x3a\x00\x27\x01\x02\x01\x02\x00\x30\x01\x2b\x01\x2b\x00\x31\x01\
-\x52\x01\x52\x00\x32\x01\xc4\x01\xc4\x00\x33\x01\xea\x01\xea\x00\
-\x34\x00\x01\x00\x01\x03\x28\x00\x01\x00\x0a\x00\x04\x00\x05\x00\
-\x09\x00\x0f\x00\x1b\x00\x21\x00\x25\x00\x29\x00\x35\x01\x02\x00\
-\x02\x00\x03\x03\x16\x03\x22\x00\x00\x03\x29\x03\x35\x00\x0d\x03\
-\x44\x03\x51\x00\x1a\x00\x02\x00\x10\x00\x04\x00\x05\x00\x00\x00\
-\x07\x00\x07\x00\x02\x00\x09\x00\x09\x00\x03\x00\x0b\x00\x0e\x00\
-\x04\x00\x12\x00\x19\x00\x08\x00\x1b\x00\x3a\x00\x10\x00\xdc\x00\
-\xdc\x00\x30\x01\x02\x01\x02\x00\x31\x01\x0f\x01\x0f\x00\x32\x01\
-\x28\x01\x28\x00\x33\x01\x2b\x01\x2b\x00\x34\x01\x52\x01\x52\x00\
-\x35\x01\x7c\x01\x7c\x00\x36\x01\xc1\x01\xc1\x00\x37\x01\xc4\x01\
-\xc4\x00\x38\x01\xea\x01\xea\x00\x39\x00\x01\x00\x01\x03\x23\x00\
-\x01\x00\x04\x00\x08\x00\x12\x00\x1a\x00\x2c\x00\x01\x00\x00\x00\
-\x0a\x00\x96\x02\xc0\x00\x03\x44\x46\x4c\x54\x00\x14\x63\x79\x72\
-\x6c\x00\x3c\x6c\x61\x74\x6e\x00\x64\x00\x04\x00\x00\x00\x00\xff\
-\xff\x00\x0f\x00\x00\x00\x03\x00\x06\x00\x09\x00\x0c\x00\x0f\x00\
-\x12\x00\x15\x00\x18\x00\x1b\x00\x1e\x00\x21\x00\x24\x00\x27\x00\
-\x2a\x00\x04\x00\x00\x00\x00\xff\xff\x00\x0f\x00\x01\x00\x04\x00\
-\x07\x00\x0a\x00\x0d\x00\x10\x00\x13\x00\x16\x00\x19\x00\x1c\x00\
-\x1f\x00\x22\x00\x25\x00\x28\x00\x2b\x00\x04\x00\x00\x00\x00\xff\
-\xff\x00\x0f\x00\x02\x00\x05\x00\x08\x00\x0b\x00\x0e\x00\x11\x00\
-\x14\x00\x17\x00\x1a\x00\x1d\x00\x20\x00\x23\x00\x26\x00\x29\x00\
-\x2c\x00\x2d\x61\x61\x6c\x74\x01\x10\x61\x61\x6c\x74\x01\x18\x61\
-\x61\x6c\x74\x01\x20\x63\x63\x6d\x70\x01\x28\x63\x63\x6d\x70\x01\
-\x30\x63\x63\x6d\x70\x01\x38\x64\x6e\x6f\x6d\x01\x40\x64\x6e\x6f\
-\x6d\x01\x46\x64\x6e\x6f\x6d\x01\x4c\x66\x72\x61\x63\x01\x52\x66\
-\x72\x61\x63\x01\x58\x66\x72\x61\x63\x01\x5e\x6e\x75\x6d\x72\x01\
-\x64\x6e\x75\x6d\x72\x01\x6a\x6e\x75\x6d\x72\x01\x70\x6f\x72\x64\
-\x6e\x01\x76\x6f\x72\x64\x6e\x01\x7c\x6f\x72\x64\x6e\x01\x82\x73\
-\x61\x6c\x74\x01\x88\x73\x61\x6c\x74\x01\x8e\x73\x61\x6c\x74\x01\
-\x94\x73\x69\x6e\x66\x01\x9a\x73\x69\x6e\x66\x01\xa0\x73\x69\x6e\
-\x66\x01\xa6\x73\x73\x30\x31\x01\xac\x73\x73\x30\x31\x01\xb2\x73\
-\x73\x30\x31\x01\xb8\x73\x73\x30\x32\x01\xbe\x73\x73\x30\x32\x01\
-\xc4\x73\x73\x30\x32\x01\xca\x73\x73\x30\x33\x01\xd0\x73\x73\x30\
-\x33\x01\xd6\x73\x73\x30\x33\x01\xdc\x73\x73\x30\x34\x01\xe2\x73\
-\x73\x30\x34\x01\xe8\x73\x73\x30\x34\x01\xee\x73\x73\x30\x35\x01\
-\xf4\x73\x73\x30\x35\x01\xfa\x73\x73\x30\x35\x02\x00\x73\x75\x70\
-\x73\x02\x06\x73\x75\x70\x73\x02\x0c\x73\x75\x70\x73\x02\x12\x7a\
-\x65\x72\x6f\x02\x18\x7a\x65\x72\x6f\x02\x1e\x7a\x65\x72\x6f\x02\
-\x24\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\
-\x01\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\x00\x02\x00\
-\x03\x00\x00\x00\x02\x00\x02\x00\x03\x00\x00\x00\x02\x00\x02\x00\
-\x03\x00\x00\x00\x01\x00\x07\x00\x00\x00\x01\x00\x07\x00\x00\x00\
-\x01\x00\x07\x00\x00\x00\x01\x00\x05\x00\x00\x00\x01\x00\x05\x00\
-\x00\x00\x01\x00\x05\x00\x00\x00\x01\x00\x06\x00\x00\x00\x01\x00\
-\x06\x00\x00\x00\x01\x00\x06\x00\x00\x00\x01\x00\x04\x00\x00\x00\
-\x01\x00\x04\x00\x00\x00\x01\x00\x04\x00\x00\x00\x01\x00\x10\x00\
-\x00\x00\x01\x00\x10\x00\x00\x00\x01\x00\x10\x00\x00\x00\x01\x00\
-\x09\x00\x00\x00\x01\x00\x09\x00\x00\x00\x01\x00\x09\x03\xfa\x00\
-\x01\x00\x0b\x03\xf4\x00\x01\x00\x0b\x03\xee\x00\x01\x00\x0b\x04\
-\x26\x00\x01\x00\x0c\x04\x20\x00\x01\x00\x0c\x04\x1a\x00\x01\x00\
-\x0c\x04\x28\x00\x01\x00\x0d\x04\x22\x00\x01\x00\x0d\x04\x1c\x00\
-\x01\x00\x0d\x04\x20\x00\x01\x00\x0e\x04\x1a\x00\x01\x00\x0e\x04\
-\x14\x00\x01\x00\x0e\x04\x18\x00\x01\x00\x0f\x04\x12\x00\x01\x00\
-\x0f\x04\x0c\x00\x01\x00\x0f\x00\x00\x00\x01\x00\x08\x00\x00\x00\
-\x01\x00\x08\x00\x00\x00\x01\x00\x08\x00\x00\x00\x01\x00\x0a\x00\
-\x00\x00\x01\x00\x0a\x00\x00\x00\x01\x00\x0a\x00\x12\x00\x26\x00\
-\x2e\x00\x36\x00\x3e\x00\x4e\x00\x56\x00\x5e\x00\x66\x00\x6e\x00\
-\x76\x00\x7e\x00\x86\x00\x8e\x00\x96\x00\x9e\x00\xa6\x00\xae\x00\
-\xb6\x00\x01\x00\x00\x00\x01\x04\x0e\x00\x03\x00\x00\x00\x01\x04\
-\x7a\x00\x04\x00\x00\x00\x01\x00\x88\x00\x06\x00\x00\x00\x05\x00\
-\xfa\x01\x0c\x01\x1e\x01\x30\x01\x42\x00\x01\x00\x00\x00\x01\x01\
-\x44\x00\x04\x00\x00\x00\x01\x01\x46\x00\x01\x00\x00\x00\x01\x02\
-\xb0\x00\x01\x00\x00\x00\x01\x02\xc2\x00\x01\x00\x00\x00\x01\x02\
-\xd4\x00\x01\x00\x00\x00\x01\x02\xe6\x00\x01\x00\x00\x00\x01\x02\
-\xf8\x00\x01\x00\x00\x00\x01\x02\xfa\x00\x01\x00\x00\x00\x01\x03\
-\x30\x00\x01\x00\x00\x00\x01\x03\x3c\x00\x01\x00\x00\x00\x01\x03\
-\x3e\x00\x01\x00\x00\x00\x01\x03\x40\x00\x01\x00\x00\x00\x01\x03\
-\x3e\x00\x01\x00\x00\x00\x01\x04\x68\x00\x01\x04\x8a\x00\x03\x00\
-\x0c\x00\x2e\x00\x58\x00\x04\x00\x0a\x00\x10\x00\x16\x00\x1c\x03\
-\x34\x00\x02\x03\x17\x03\x2d\x00\x02\x03\x1b\x03\x2f\x00\x02\x03\
-\x1c\x03\x2e\x00\x02\x03\x1e\x00\x05\x00\x0c\x00\x12\x00\x18\x00\
-\x1e\x00\x24\x03\x35\x00\x02\x03\x16\x03\x30\x00\x02\x03\x1b\x03\
-\x32\x00\x02\x03\x1c\x03\x31\x00\x02\x03\x1f\x03\x33\x00\x02\x03\
-\x21\x00\x04\x00\x0a\x00\x10\x00\x16\x00\x1c\x03\x2c\x00\x02\x03\
-\x16\x03\x29\x00\x02\x03\x1b\x03\x2a\x00\x02\x03\x1c\x03\x2b\x00\
-\x02\x03\x21\x00\x03\x00\x01\x04\x1a\x00\x01\x04\x26\x00\x00\x00\
-\x01\x00\x00\x00\x11\x00\x03\x00\x01\x04\x1a\x00\x01\x04\x20\x00\
-\x00\x00\x01\x00\x00\x00\x11\x00\x03\x00\x00\x00\x01\x04\x14\x00\
-\x01\x04\x1a\x00\x01\x00\x00\x00\x11\x00\x03\x00\x00\x00\x01\x04\
-\x18\x00\x01\x04\x08\x00\x01\x00\x00\x00\x11\x00\x03\x00\x01\x04\
-\x0c\x00\x01\x04\x58\x00\x00\x00\x01\x00\x00\x00\x11\x00\x02\x04\
-\x56\x00\x02\x00\x75\x00\x76\x00\x01\x04\x54\x00\x06\x00\x12\x00\
-\xb4\x00\xde\x01\x1c\x01\x32\x01\x5c\x00\x10\x00\x22\x00\x2a\x00\
-\x32\x00\x3a\x00\x42\x00\x4a\x00\x52\x00\x5a\x00\x62\x00\x6a\x00\
-\x72\x00\x7a\x00\x82\x00\x8a\x00\x92\x00\x9a\x02\xd7\x00\x03\x00\
-\x69\x00\x3f\x02\xd8\x00\x03\x00\x69\x00\x40\x02\xda\x00\x03\x00\
-\x69\x00\x41\x02\xdc\x00\x03\x00\x69\x00\x42\x02\xe0\x00\x03\x00\
-\x69\x00\x43\x02\xe2\x00\x03\x00\x69\x00\x44\x02\xe3\x00\x03\x00\
-\x69\x00\x45\x02\xe7\x00\x03\x00\x69\x00\x46\x02\xd7\x00\x03\x00\
-\x6b\x00\x3f\x02\xd8\x00\x03\x00\x6b\x00\x40\x02\xda\x00\x03\x00\
-\x6b\x00\x41\x02\xdc\x00\x03\x00\x6b\x00\x42\x02\xe0\x00\x03\x00\
-\x6b\x00\x43\x02\xe2\x00\x03\x00\x6b\x00\x44\x02\xe3\x00\x03\x00\
-\x6b\x00\x45\x02\xe7\x00\x03\x00\x6b\x00\x46\x00\x04\x00\x0a\x00\
-\x12\x00\x1a\x00\x22\x02\xd9\x00\x03\x00\x69\x00\x40\x02\xdd\x00\
-\x03\x00\x69\x00\x42\x02\xd9\x00\x03\x00\x6b\x00\x40\x02\xdd\x00\
-\x03\x00\x6b\x00\x42\x00\x06\x00\x0e\x00\x16\x00\x1e\x00\x26\x00\
-\x2e\x00\x36\x02\xdb\x00\x03\x00\x69\x00\x41\x02\xde\x00\x03\x00\
-\x69\x00\x42\x02\xe4\x00\x03\x00\x69\x00\x45\x02\xdb\x00\x03\x00\
-\x6b\x00\x41\x02\xde\x00\x03\x00\x6b\x00\x42\x02\xe4\x00\x03\x00\
-\x6b\x00\x45\x00\x02\x00\x06\x00\x0e\x02\xdf\x00\x03\x00\x69\x00\
-\x42\x02\xdf\x00\x03\x00\x6b\x00\x42\x00\x04\x00\x0a\x00\x12\x00\
-\x1a\x00\x22\x02\xe1\x00\x03\x00\x69\x00\x43\x02\xe5\x00\x03\x00\
-\x69\x00\x45\x02\xe1\x00\x03\x00\x6b\x00\x43\x02\xe5\x00\x03\x00\
-\x6b\x00\x45\x00\x02\x00\x06\x00\x0e\x02\xe6\x00\x03\x00\x69\x00\
-\x45\x02\xe6\x00\x03\x00\x6b\x00\x45\x00\x02\x02\xf2\x00\x0a\x02\
-\xc3\x02\xc4\x02\xc5\x02\xc6\x02\xc7\x02\xc8\x02\xc9\x02\xca\x02\
-\xcb\x02\xcc\x00\x02\x02\xd8\x00\x0a\x02\xcd\x02\xce\x02\xcf\x02\
-\xd0\x02\xd1\x02\xd2\x02\xd3\x02\xd4\x02\xd5\x02\xd6\x00\x02\x02\
-\xbe\x00\x0a\x02\xaf\x02\xb0\x02\xb1\x02\xb2\x02\xb3\x02\xb4\x02\
-\xb5\x02\xb6\x02\xb7\x02\xb8\x00\x02\x02\xa4\x00\x0a\x02\xb9\x02\
-\xba\x02\xbb\x02\xbc\x02\xbd\x02\xbe\x02\xbf\x02\xc0\x02\xc1\x02\
-\xc2\x00\x01\x02\x9a\x00\x01\x00\x00\x01\x00\x00\x02\x02\x96\x00\
-\x1a\x00\x05\x00\xc6\x00\xc7\x00\xc8\x00\xc9\x00\xca\x00\xcb\x00\
-\xcc\x00\xcd\x00\xce\x00\xcf\x00\xd0\x00\xd1\x00\xd2\x00\xd3\x00\
-\xd4\x00\xd5\x00\xd6\x00\xd7\x00\xd8\x00\xd9\x00\xda\x00\xdb\x02\
-\x05\x02\x47\x02\x48\x00\x00\x01\x01\x00\x02\x02\x74\x00\x05\x00\
-\x0c\x00\xfc\x00\xfd\x00\xfe\x00\xff\x00\x00\x01\x02\x00\x01\x02\
-\x3e\x00\x01\x00\x00\x01\x03\x00\x01\x02\x34\x00\x02\x00\x00\x01\
-\x04\x00\x01\x02\x5a\x00\x01\x00\x02\x02\x5a\x00\x21\x00\x05\x00\
-\x0c\x00\x3d\x00\xc6\x00\xc7\x00\xc8\x00\xc9\x00\xca\x00\xcb\x00\
-\xcc\x00\xcd\x00\xce\x00\xcf\x00\xd0\x00\xd1\x00\xd2\x00\xd3\x00\
-\xd4\x00\xd5\x00\xd6\x00\xd7\x00\xd8\x00\xd9\x00\xda\x00\xdb\x00\
-\xfc\x00\xfd\x00\xfe\x00\xff\x01\x40\x02\x05\x02\x47\x02\x48\x00\
-\x02\x02\x46\x00\x37\x00\x05\x00\xc6\x00\xc7\x00\xc8\x00\xc9\x00\
-\xca\x00\xcb\x00\xcc\x00\xcd\x00\xce\x00\xcf\x00\xd0\x00\xd1\x00\
-\xd2\x00\xd3\x00\xd4\x00\xd5\x00\xd6\x00\xd7\x00\xd8\x00\xd9\x00\
-\xda\x00\xdb\x00\xfc\x00\xfd\x00\xfe\x00\xff\x01\x40\x02\x05\x02\
-\x47\x02\x48\x03\x38\x03\x39\x03\x3a\x03\x3b\x03\x3c\x03\x3d\x03\
-\x3e\x03\x3f\x03\x42\x03\x43\x03\x44\x03\x45\x03\x46\x03\x47\x03\
-\x48\x03\x49\x03\x4a\x03\x4b\x03\x4c\x03\x4d\x03\x4e\x03\x4f\x03\
-\x50\x03\x51\x00\x01\x02\x12\x00\x0d\x00\x20\x00\x26\x00\x30\x00\
-\x36\x00\x3c\x00\x42\x00\x48\x00\x4e\x00\x54\x00\x5a\x00\x60\x00\
-\x66\x00\x6e\x00\x02\x00\x0c\x00\x0d\x00\x04\x00\x3c\x00\x3d\x02\
-\xc3\x02\xcd\x00\x02\x02\xc4\x02\xce\x00\x02\x02\xc5\x02\xcf\x00\
-\x02\x02\xc6\x02\xd0\x00\x02\x02\xc7\x02\xd1\x00\x02\x02\xc8\x02\
-\xd2\x00\x02\x02\xc9\x02\xd3\x00\x02\x02\xca\x02\xd4\x00\x02\x02\
-\xcb\x02\xd5\x00\x02\x02\xcc\x02\xd6\x00\x03\x03\x05\x03\x36\x03\
-\x37\x00\x03\x03\x40\x03\x0f\x03\x41\x00\x02\x01\xba\x00\x12\x01\
-\x02\x01\x0f\x03\x23\x03\x44\x03\x22\x03\x45\x03\x46\x03\x47\x03\
-\x48\x03\x49\x03\x4a\x03\x4b\x03\x4c\x03\x4d\x03\x4e\x03\x4f\x03\
-\x50\x03\x51\x00\x01\x00\x03\x03\x19\x03\x1d\x03\x1f\x00\x01\x00\
-\x04\x00\x08\x00\x12\x00\x1a\x00\x2c\x00\x01\x00\x01\x03\x1e\x00\
-\x01\x00\x01\x00\x0b\x00\x01\x00\x01\x03\x27\x00\x01\x00\x01\x00\
-\x0f\x00\x02\x00\x02\x03\x16\x03\x24\x00\x00\x03\x29\x03\x35\x00\
-\x0f\x00\x01\x00\x01\x00\x10\x00\x02\x00\x0c\x00\x21\x00\x3a\x00\
-\x00\x01\x6e\x01\x6e\x00\x1a\x01\x7c\x01\x7c\x00\x1b\x01\x80\x01\
-\x80\x00\x1c\x01\x90\x01\x90\x00\x1d\x01\x97\x01\x97\x00\x1e\x01\
-\xa7\x01\xa7\x00\x1f\x01\xc1\x01\xc1\x00\x20\x01\xc4\x01\xc4\x00\
-\x21\x01\xcf\x01\xcf\x00\x22\x01\xe7\x01\xe7\x00\x23\x01\xea\x01\
-\xea\x00\x24\x00\x02\x00\x02\x03\x21\x03\x21\x00\x00\x03\x29\x03\
-\x35\x00\x01\x00\x01\x00\x02\x00\x04\x00\x15\x00\x02\x00\x02\x00\
-\x3e\x00\x42\x00\x00\x00\x44\x00\x44\x00\x05\x00\x02\x00\x02\x00\
-\x3b\x00\x3b\x00\x00\x00\x3e\x00\x46\x00\x01\x00\x01\x00\x01\x00\
-\x3b\x00\x02\x00\x04\x00\x04\x00\x04\x00\x00\x00\xb0\x00\xc5\x00\
-\x01\x02\x04\x02\x04\x00\x17\x02\x45\x02\x46\x00\x18\x00\x01\x00\
-\x05\x00\x0b\x00\xf8\x00\xf9\x00\xfa\x00\xfb\x00\x01\x00\x01\x01\
-\x3f\x00\x02\x00\x08\x00\x04\x00\x04\x00\x00\x00\x0b\x00\x0b\x00\
-\x01\x00\x3b\x00\x3b\x00\x02\x00\xb0\x00\xc5\x00\x03\x00\xf8\x00\
-\xfb\x00\x19\x01\x3f\x01\x3f\x00\x1d\x02\x04\x02\x04\x00\x1e\x02\
-\x45\x02\x46\x00\x1f\x00\x02\x00\x0a\x00\x04\x00\x04\x00\x00\x00\
-\xb0\x00\xc5\x00\x01\x00\xf8\x00\xfb\x00\x17\x01\x3f\x01\x3f\x00\
-\x1b\x02\x04\x02\x04\x00\x1c\x02\x45\x02\x46\x00\x1d\x03\x06\x03\
-\x0d\x00\x1f\x03\x10\x03\x11\x00\x27\x03\x21\x03\x21\x00\x29\x03\
-\x29\x03\x35\x00\x2a\x00\x01\x00\x0d\x00\x0b\x00\x3b\x00\x3e\x00\
-\x3f\x00\x40\x00\x41\x00\x42\x00\x43\x00\x44\x00\x45\x00\x46\x03\
-\x04\x03\x0e\x00\x02\x00\x05\x00\x0f\x00\x10\x00\x00\x03\x1e\x03\
-\x1e\x00\x02\x03\x21\x03\x21\x00\x03\x03\x27\x03\x27\x00\x04\x03\
-\x29\x03\x35\x00\x05\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\
-\x00\x00\x28\x00\x00\x00\x02\x64\x6c\x6e\x67\x00\x00\x00\x28\x00\
-\x00\x00\x09\x73\x6c\x6e\x67\x00\x00\x00\x31\x00\x00\x00\x09\x43\
-\x79\x72\x6c\x2c\x4c\x61\x74\x6e\x43\x79\x72\x6c\x2c\x4c\x61\x74\
-\x6e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-qt_resource_name = b"\
-\x00\x04\
-\x00\x06\xd6\x54\
-\x00\x66\
-\x00\x6f\x00\x6e\x00\x74\
-\x00\x11\
-\x06\xf9\x25\xa6\
-\x00\x52\
-\x00\x65\x00\x63\x00\x75\x00\x72\x00\x73\x00\x69\x00\x76\x00\x65\x00\x53\x00\x61\x00\x6e\x00\x73\x00\x2e\x00\x74\x00\x74\x00\x66\
-\
-\x00\x17\
-\x0f\x8b\xac\x66\
-\x00\x49\
-\x00\x42\x00\x4d\x00\x50\x00\x6c\x00\x65\x00\x78\x00\x4d\x00\x6f\x00\x6e\x00\x6f\x00\x2d\x00\x52\x00\x65\x00\x67\x00\x75\x00\x6c\
-\x00\x61\x00\x72\x00\x2e\x00\x74\x00\x74\x00\x66\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
-\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x0a\xf8\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x78\xae\x56\x07\xf2\
-\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x0a\xf8\
-\x00\x00\x01\x78\xae\x69\x2f\x80\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,185 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+
+from fontTools.ttLib import TTFont, TTLibError
+from fontTools.ttLib.sfnt import SFNTReader, SFNTWriter
+
+
+class MappedFile(object):
+    """Read-only file object over a shared memory map.  Each MappedFile has
+    its own position so that TTFont objects that are opened on the same map
+    read independently.  Reads copy the requested bytes only.  source is the
+    mapped file object when other processes can modify the file, reads past
+    its current size raise OSError (an access to the truncated pages of a
+    map terminates the process with SIGBUS)."""
+
+    def __init__(self, buffer, name=None, source=None):
+        self._buffer = buffer
+        self._position = 0
+        self.name = name
+        self._source = source
+
+    def read(self, size=-1):
+        start = self._position
+        end = len(self._buffer) if size is None or size < 0 else start + size
+        end = min(end, len(self._buffer))
+        if self._source is not None and end > start:
+            if os.fstat(self._source.fileno()).st_size < end:
+                raise OSError(
+                    f"{self.name} was truncated after it was opened.  "
+                    f"Load the font again."
+                )
+        data = self._buffer[start:end]
+        self._position = start + len(data)
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self._buffer)
+        self._position = max(offset, 0)
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def close(self):
+        # the map is owned by the FontSession
+        pass
+
+
+def map_file(f):
+    if os.fstat(f.fileno()).st_size == 0:
+        raise TTLibError("Not a TrueType or OpenType font (not enough data)")
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def get_file_stat(f):
+    """Returns the (modification time, size) of a file path or descriptor."""
+    stat = os.stat(f)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FontSession(object):
+    """Parses a font file once and shares the table data with the
+    data models and instance workers.  The source is memory mapped, table
+    data is paged in from the OS page cache on request and the mapped pages
+    are shared by all concurrent sessions on the same file.  The compiled
+    data of the last instance is retained for re-use at the same location."""
+
+    def __init__(self, fontpath):
+        self.fontpath = fontpath
+        # the source file remains open for the size checks of mapped reads
+        self._source_file = open(fontpath, "rb")
+        try:
+            source_map = map_file(self._source_file)
+        except Exception:
+            self._source_file.close()
+            raise
+        self.source_stat = get_file_stat(self._source_file.fileno())
+        # content hash of the source file for InstanceCache keys
+        self.source_hash = hashlib.sha256(source_map).hexdigest()
+        reader = SFNTReader(MappedFile(source_map, str(fontpath), self._source_file))
+        # the flavor is retained so that worker copies
+        # serialize to the same format as the source file
+        self.flavor = reader.flavor
+        self.flavorData = reader.flavorData
+        if self.flavor is None:
+            self._sfnt_map = source_map
+        else:
+            # decompress woff/woff2 table data one time.  All
+            # subsequent re-opens read the uncompressed sfnt
+            self._sfnt_map = self._decompress_to_sfnt(reader)
+            source_map.close()
+            # the decompressed data is in a private temporary file
+            self._source_file.close()
+            self._source_file = None
+        reader.close()
+        # shared, read-only TTFont used for font inspection
+        self.ttfont = self.new_ttfont()
+        # (axis location key, compiled sfnt data) of the last instance
+        self._instance = None
+        self._instance_lock = threading.Lock()
+
+    def _decompress_to_sfnt(self, reader):
+        # the uncompressed sfnt is written to an unnamed temporary
+        # file and mapped so that it is not held on the Python heap
+        with tempfile.TemporaryFile() as f:
+            tags = list(reader.keys())
+            writer = SFNTWriter(f, len(tags), reader.sfntVersion)
+            # raw table copies, tables are not decompiled here
+            for tag in tags:
+                writer[tag] = reader[tag]
+            writer.close()
+            f.flush()
+            return map_file(f)
+
+    def new_ttfont(self):
+        """Returns a private fontTools.ttLib.TTFont object that is re-opened
+        from the mapped source data.  Tables are decompiled on demand."""
+        # lazy=True skips the TTFont copy of the entire file into memory, the
+        # default table loading is restored after the table directory read
+        ttfont = TTFont(
+            MappedFile(self._sfnt_map, str(self.fontpath), self._source_file),
+            lazy=True,
+        )
+        ttfont.lazy = None
+        ttfont.flavor = self.flavor
+        ttfont.flavorData = self.flavorData
+        return ttfont
+
+    def get_instance_data(self, key):
+        """Returns the compiled sfnt data of the last instance when it was
+        instantiated at the axis location key, else None."""
+        with self._instance_lock:
+            if self._instance is not None and self._instance[0] == key:
+                return self._instance[1]
+        return None
+
+    def set_instance_data(self, key, data):
+        # only the last instance is retained
+        with self._instance_lock:
+            self._instance = (key, data)
+
+    def is_modified(self):
+        """Returns True when the source file was changed or removed after
+        the session parsed it."""
+        try:
+            return get_file_stat(self.fontpath) != self.source_stat
+        except OSError:
+            return True
+
+    def is_variable_font(self):
+        """Check for fvar table to validate that a font is a variable font"""
+        return "fvar" in self.ttfont
+
+    def get_fvar_table(self):
+        return self.ttfont["fvar"]
+
+    def get_name_table(self):
+        return self.ttfont["name"]
+
+    def get_os2_table(self):
+        return self.ttfont["OS/2"]
+
+    def get_head_table(self):
+        return self.ttfont["head"]
@@ -0,0 +1,178 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Glyph subsets of instance jobs.  The variable font is subset to the glyphs
+# of a unicode range or glyph name list before it is instanced so that the
+# instancer only processes the retained glyphs.  The gvar data of a glyph is
+# decompiled when the subsetter retains the glyph.  The subsetter uses the
+# pyftsubset default options except that every name record is retained for
+# the instancer and the name table edits and the .notdef outline is
+# retained.  This module must not import PyQt5.
+
+from fontTools.misc import sstruct
+from fontTools.subset import Options, Subsetter, parse_unicodes
+from fontTools.ttLib import newTable
+from fontTools.ttLib.tables import _g_v_a_r
+from fontTools.ttLib.tables import TupleVariation as tv
+
+
+class GlyphSubset(object):
+    def __init__(self, unicodes=None, glyphs=None):
+        # unicodes are a list of code points or a pyftsubset unicode
+        # range string, e.g., "U+0000-007F,U+20AC"
+        if isinstance(unicodes, str):
+            try:
+                unicodes = parse_unicodes(unicodes)
+            except ValueError:
+                raise ValueError(
+                    f"'{unicodes}' is not a valid unicode range.  Use "
+                    f"comma-separated U+XXXX code points and U+XXXX-YYYY ranges."
+                )
+        # glyphs are a list of glyph names or a comma-separated string
+        if isinstance(glyphs, str):
+            glyphs = glyphs.replace(",", " ").split()
+        self.unicodes = sorted(set(unicodes)) if unicodes else []
+        self.glyphs = sorted(set(glyphs)) if glyphs else []
+        if not self.unicodes and not self.glyphs:
+            raise ValueError("A glyph subset requires unicodes or glyph names.")
+
+    def __repr__(self):
+        return (
+            f"GlyphSubset(unicodes={format_unicodes(self.unicodes)!r}, "
+            f"glyphs={self.glyphs!r})"
+        )
+
+    def get_data(self):
+        return {"unicodes": format_unicodes(self.unicodes), "glyphs": list(self.glyphs)}
+
+
+def format_unicodes(unicodes):
+    """Returns the pyftsubset unicode range string of a sorted
+    list of code points, e.g., "U+0041-005A,U+20AC"."""
+    ranges = []
+    for codepoint in unicodes:
+        if ranges and codepoint == ranges[-1][1] + 1:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint])
+    return ",".join(
+        f"U+{start:04X}" if start == end else f"U+{start:04X}-{end:04X}"
+        for start, end in ranges
+    )
+
+
+class GlyphVariationReader(object):
+    """Decompiles the gvar TupleVariation lists of single glyphs.  A gvar
+    table decompile expands the variation data of every glyph in the font,
+    the reader only parses the table header and the requested glyph data."""
+
+    def __init__(self, ttfont):
+        self.ttfont = ttfont
+        self.axis_tags = (
+            [axis.axisTag for axis in ttfont["fvar"].axes] if "fvar" in ttfont else []
+        )
+        self._data = None
+        self._table = None
+        if "gvar" not in ttfont or not self.axis_tags:
+            return
+        if ttfont.reader is None or ttfont.isLoaded("gvar"):
+            # in-memory fonts, e.g., instances
+            self._table = ttfont["gvar"]
+            return
+        data = ttfont.reader["gvar"]
+        header_size = _g_v_a_r.GVAR_HEADER_SIZE
+        header = sstruct.unpack(_g_v_a_r.GVAR_HEADER_FORMAT, data[:header_size])
+        self._offsets = _g_v_a_r.table__g_v_a_r.decompileOffsets_(
+            data[header_size:],
+            tableFormat=(header["flags"] & 1),
+            glyphCount=header["glyphCount"],
+        )
+        self._shared_tuples = tv.decompileSharedTuples(
+            self.axis_tags,
+            header["sharedTupleCount"],
+            data,
+            header["offsetToSharedTuples"],
+        )
+        self._data_offset = header["offsetToGlyphVariationData"]
+        self._data = data
+        # glyph IDs of the source glyph order
+        self._glyph_ids = dict(ttfont.getReverseGlyphMap())
+
+    def get_variations(self, glyphname, point_count):
+        """Returns the list of TupleVariation of a glyph.  point_count
+        includes the four phantom points."""
+        if self._table is not None:
+            return self._table.variations.get(glyphname, [])
+        if self._data is None:
+            return []
+        gid = self._glyph_ids[glyphname]
+        start = self._data_offset + self._offsets[gid]
+        end = self._data_offset + self._offsets[gid + 1]
+        return _g_v_a_r.decompileGlyph_(
+            point_count, self._shared_tuples, self.axis_tags, self._data[start:end]
+        )
+
+
+class _LazyGlyphVariations(dict):
+    """gvar variations map that decompiles the variations of a glyph
+    on first access, e.g., when the subsetter retains the glyph."""
+
+    def __init__(self, reader, glyf, gvar):
+        super().__init__()
+        self.reader = reader
+        self.glyf = glyf
+        self.gvar = gvar
+
+    def __missing__(self, glyphname):
+        point_count = self.gvar.getNumPoints_(self.glyf[glyphname])
+        variations = self.reader.get_variations(glyphname, point_count)
+        self[glyphname] = variations
+        return variations
+
+
+def load_lazy_gvar(ttfont):
+    """Replaces the gvar table of a TrueType variable font that has not been
+    decompiled with a table that decompiles the variations of single glyphs
+    on request.  A gvar table decompile expands the data of every glyph."""
+    reader = GlyphVariationReader(ttfont)
+    gvar = newTable("gvar")
+    gvar.version = 1
+    gvar.reserved = 0
+    gvar.variations = _LazyGlyphVariations(reader, ttfont["glyf"], gvar)
+    ttfont["gvar"] = gvar
+
+
+def get_subset_options():
+    options = Options()
+    # the instancer reads the fvar and STAT name records and
+    # the name table edits read the family name records
+    options.name_IDs = ["*"]
+    options.name_languages = ["*"]
+    options.name_legacy = True
+    # the subsetter drops the .notdef gvar data with the outline and
+    # the instance would retain the default .notdef advance width
+    options.notdef_outline = True
+    return options
+
+
+def subset_variable_font(ttfont, glyph_subset):
+    """Subsets a variable font in place to the glyphs of a GlyphSubset and
+    their layout and composite glyph closure.  Only the gvar data of the
+    retained glyphs is decompiled."""
+    if "gvar" in ttfont and "glyf" in ttfont and not ttfont.isLoaded("gvar"):
+        load_lazy_gvar(ttfont)
+    subsetter = Subsetter(get_subset_options())
+    subsetter.populate(unicodes=glyph_subset.unicodes, glyphs=glyph_subset.glyphs)
+    subsetter.subset(ttfont)
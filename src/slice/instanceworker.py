@@ -14,20 +14,33 @@
 #    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
 
 import datetime
+import os
 import sys
+import time
 import traceback
+from contextlib import contextmanager
 
 from fontTools.misc.textTools import num2binary
-from fontTools.ttLib import sfnt
-from fontTools.ttLib.ttFont import TTFont
-from fontTools.varLib.instancer import instantiateVariableFont
 from PyQt5.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
 
+from .engine import (
+    NAME_RECORD_PLAT_ENC_LANG,
+    edit_bit_flags,
+    edit_name_table,
+    get_save_message,
+    new_instance_ttfont,
+    save_font,
+)
+from .progress import ProgressTracker, get_expected_time, get_stage_weights
+from .telemetry import get_peak_rss, get_telemetry_event
+
 
 class InstanceWorkerSignals(QObject):
     finished = pyqtSignal()  # no return type, only signal that complete
     error = pyqtSignal(str)  # returns the error message
     result = pyqtSignal(str)  # returns file path for the new file write
+    telemetry = pyqtSignal(dict)  # returns the job telemetry event
+    progress = pyqtSignal(dict)  # returns percent complete and ETA reports
 
 
 class InstanceWorker(QRunnable):
@@ -38,6 +51,13 @@ class InstanceWorker(QRunnable):
         axis_model=None,
         name_model=None,
         bit_model=None,
+        compression=None,
+        cache=None,
+        telemetry_log=None,
+        verbose=False,
+        job_history=None,
+        optimize="full",
+        subset=None,
     ):
         super().__init__()
         self.signals = InstanceWorkerSignals()
@@ -46,149 +66,192 @@ class InstanceWorker(QRunnable):
         self.axis_model = axis_model
         self.name_model = name_model
         self.bit_model = bit_model
+        # WOFF/WOFF2 CompressionProfile, None = default profile
+        self.compression = compression
+        # InstanceCache, None = no cache
+        self.cache = cache
+        # TelemetryLog, None = events are only emitted as signals
+        self.telemetry_log = telemetry_log
+        # print the instance reports to stdout
+        self.verbose = verbose
+        # telemetry events of previous jobs for the progress ETA
+        self.job_history = job_history if job_history else []
+        # OPTIMIZE_LEVELS name of the instancer optimizations
+        self.optimize = optimize
+        # GlyphSubset that the font is subset to before
+        # it is instanced, None = all glyphs
+        self.subset = subset
+        # ProgressTracker, replaced with a reporting tracker at run time
+        self.progress = ProgressTracker()
         self.ttfont = None
+        # ordered map of "stage": seconds
+        self.timings = {}
 
     @pyqtSlot()
     def run(self):
+        self.timings = {}
+        self.progress = self.get_progress_tracker()
+        cached = False
         try:
             # Debugging in stdout
-            print(f"\n\n{datetime.datetime.now()}")
-            # set class fontTools.ttLib.TTFont object
-            self.instantiate_ttfont()
-            # gen the static font instance from a variable font
-            self.instantiate_variable_font()
-            # edit name table records
-            self.edit_name_table()
-            # edit bit flags
-            self.edit_bit_flags()
-            # write to disk
-            # set fonttools to use zopfli compression on woff files
-            sfnt.USE_ZOPFLI = True
-            # sfnt.ZLIB_COMPRESSION_LEVEL = 9
-            self.ttfont.save(self.outpath)
+            if self.verbose:
+                print(f"\n\n{datetime.datetime.now()}")
+            cache_key = self.get_cache_key()
+            if cache_key:
+                with self.stage("cache", "checking the instance cache"):
+                    cached = self.cache.fetch(cache_key, self.outpath)
+            if cached:
+                if self.verbose:
+                    print(f"\nCopied the instance from the cache: {cache_key}")
+            else:
+                # set class fontTools.ttLib.TTFont object
+                with self.stage("parse", "reading the source font"):
+                    self.instantiate_ttfont()
+                # gen the static font instance from a variable font
+                with self.stage("instance", "instancing"):
+                    self.instantiate_variable_font()
+                # edit name table records
+                with self.stage("names", "editing name records"):
+                    self.edit_name_table()
+                # edit bit flags
+                with self.stage("bits", "editing bit flags"):
+                    self.edit_bit_flags()
+                # write to disk
+                with self.stage("save", get_save_message(self.ttfont.flavor)):
+                    save_font(self.ttfont, self.outpath, self.compression)
+                if cache_key:
+                    with self.stage("cache", "storing the instance in the cache"):
+                        self.cache.store(cache_key, self.outpath)
         except Exception as e:
+            self.emit_telemetry(error=e)
             self.signals.error.emit(f"{e}")
             sys.stderr.write(f"{traceback.format_exc()}\n")
         else:
+            self.progress.finish()
+            self.emit_telemetry(cached=cached)
             # returns the file out file path on success
             self.signals.result.emit(self.outpath)
 
         self.signals.finished.emit()
 
-    def instantiate_ttfont(self):
-        self.ttfont = TTFont(self.font_model.fontpath)
+    @contextmanager
+    def stage(self, name, message=None):
+        # accumulates the wall time of a named job stage
+        self.progress.start_stage(name, message)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + (
+                time.perf_counter() - start
+            )
 
-    def instantiate_variable_font(self):
-        axis_instance_data = self.axis_model.get_instance_data()
-        instantiateVariableFont(
-            self.ttfont, axis_instance_data, inplace=True, optimize=True
-        )
-        print("\nAXIS INSTANCE VALUES")
-        print(
-            f"Instantiated variable font with axis definitions:\n{axis_instance_data}"
+    def get_progress_tracker(self):
+        fontpath = self.font_model.fontpath
+        font_size = os.path.getsize(fontpath) if os.path.isfile(fontpath) else 0
+        return ProgressTracker(
+            self.signals.progress.emit,
+            get_stage_weights(self.job_history),
+            get_expected_time(self.job_history, font_size),
         )
 
-    def edit_name_table(self):
-        # string, nameID, platformID, platEncID, langID
-        name_record_plat_enc_lang = (3, 1, 1033)
-        name_instance_data = self.name_model.get_instance_data()
-        name_table = self.ttfont["name"]
-        # set 3, 1, 1033 name records (only!)
-        # mandatory writes
-        name_table.setName(name_instance_data["nameID1"], 1, *name_record_plat_enc_lang)
-        name_table.setName(name_instance_data["nameID2"], 2, *name_record_plat_enc_lang)
-        name_table.setName(name_instance_data["nameID3"], 3, *name_record_plat_enc_lang)
-        name_table.setName(name_instance_data["nameID4"], 4, *name_record_plat_enc_lang)
-        name_table.setName(name_instance_data["nameID6"], 6, *name_record_plat_enc_lang)
-
-        # optional writes
-        # Approach:
-        # (1) if user text data exists, write it
-        # (2) if user text data does not exist but record does, delete it
-        # (3) otherwise do nothing
-        if name_instance_data["nameID16"] != "":
-            name_table.setName(
-                name_instance_data["nameID16"], 16, *name_record_plat_enc_lang
-            )
-        elif name_table.getName(16, *name_record_plat_enc_lang):
-            name_table.removeNames(16, *name_record_plat_enc_lang)
+    def emit_telemetry(self, cached=False, error=None):
+        event = get_telemetry_event(
+            self.font_model.fontpath,
+            [self.outpath],
+            self.timings,
+            process_peak_rss=get_peak_rss(),
+            cached=cached,
+            error=error,
+        )
+        if self.telemetry_log:
+            try:
+                self.telemetry_log.write(event)
+            except OSError as e:
+                # a log write failure does not fail the instance job
+                sys.stderr.write(f"Telemetry log write failed: {e}\n")
+        self.signals.telemetry.emit(event)
 
-        if name_instance_data["nameID17"] != "":
-            name_table.setName(
-                name_instance_data["nameID17"], 17, *name_record_plat_enc_lang
-            )
-        elif name_table.getName(17, *name_record_plat_enc_lang):
-            name_table.removeNames(17, *name_record_plat_enc_lang)
+    def get_cache_key(self):
+        if self.cache is None:
+            return None
+        return self.cache.get_key(
+            self.font_model.get_session().source_hash,
+            self.axis_model.get_instance_data(),
+            self.name_model.get_instance_data(),
+            self.bit_model.get_os2_instance_data(),
+            self.bit_model.get_head_instance_data(),
+            None,
+            self.compression,
+            self.optimize,
+            self.subset,
+        )
 
-        if name_instance_data["nameID21"] != "":
-            name_table.setName(
-                name_instance_data["nameID21"], 21, *name_record_plat_enc_lang
-            )
-        elif name_table.getName(21, *name_record_plat_enc_lang):
-            name_table.removeNames(21, *name_record_plat_enc_lang)
+    def instantiate_ttfont(self):
+        # private copy of the source font that is re-opened
+        # from the parsed FontSession data, not the file path
+        self.ttfont = self.font_model.get_session().new_ttfont()
 
-        if name_instance_data["nameID22"] != "":
-            name_table.setName(
-                name_instance_data["nameID22"], 22, *name_record_plat_enc_lang
+    def instantiate_variable_font(self):
+        axis_instance_data = self.axis_model.get_instance_data()
+        # glyph and table progress is only collected when it is reported
+        progress = self.progress.update if self.progress.callback else None
+        # the session retains the last instance so that metadata-only
+        # edits at the same axis location skip the instancer
+        self.ttfont = new_instance_ttfont(
+            self.font_model.get_session(),
+            axis_instance_data,
+            progress,
+            self.ttfont,
+            self.optimize,
+            self.subset,
+        )
+        if self.verbose:
+            print("\nAXIS INSTANCE VALUES")
+            print(
+                f"Instantiated variable font with axis definitions:\n"
+                f"{axis_instance_data}"
             )
-        elif name_table.getName(22, *name_record_plat_enc_lang):
-            name_table.removeNames(22, *name_record_plat_enc_lang)
 
-        # update name table data
-        self.ttfont["name"] = name_table
+    def edit_name_table(self):
+        edit_name_table(self.ttfont, self.name_model.get_instance_data())
 
         # print name table report
-        print("\nNAME TABLE EDITS")
-        print("Name records at write time:\n")
-        print(f"nameID1: {self.ttfont['name'].getName(1, *name_record_plat_enc_lang)}")
-        print(f"nameID2: {self.ttfont['name'].getName(2, *name_record_plat_enc_lang)}")
-        print(f"nameID3: {self.ttfont['name'].getName(3, *name_record_plat_enc_lang)}")
-        print(f"nameID4: {self.ttfont['name'].getName(4, *name_record_plat_enc_lang)}")
-        print(f"nameID6: {self.ttfont['name'].getName(6, *name_record_plat_enc_lang)}")
-        print(
-            f"nameID16: {self.ttfont['name'].getName(16, *name_record_plat_enc_lang)}"
-        )
-        print(
-            f"nameID17: {self.ttfont['name'].getName(17, *name_record_plat_enc_lang)}"
-        )
-        print(
-            f"nameID21: {self.ttfont['name'].getName(21, *name_record_plat_enc_lang)}"
-        )
-        print(
-            f"nameID22: {self.ttfont['name'].getName(22, *name_record_plat_enc_lang)}"
-        )
+        if self.verbose:
+            print("\nNAME TABLE EDITS")
+            print("Name records at write time:\n")
+            for nameid in (1, 2, 3, 4, 6, 16, 17, 21, 22):
+                print(
+                    f"nameID{nameid}: "
+                    f"{self.ttfont['name'].getName(nameid, *NAME_RECORD_PLAT_ENC_LANG)}"
+                )
 
     def edit_bit_flags(self):
-        # edit the OS/2.fsSelection bit flag
         pre_os2_fsselection_int = self.ttfont["OS/2"].fsSelection
-        edited_os2_fsselection_int = self.bit_model.edit_os2_fsselection_bits(
-            pre_os2_fsselection_int
-        )
-        # edit OS/2.fsSelection in the TTFont attribute
-        self.ttfont["OS/2"].fsSelection = edited_os2_fsselection_int
-
-        # edit head.macstyle bit flag
         pre_head_macstyle_int = self.ttfont["head"].macStyle
-        edited_head_macstyle_int = self.bit_model.edit_head_macstyle_bits(
-            pre_head_macstyle_int
-        )
-        self.ttfont["head"].macStyle = edited_head_macstyle_int
+        # edit OS/2.fsSelection and head.macStyle in the TTFont attribute
+        edit_bit_flags(self.ttfont, self.bit_model)
 
         # bit flag debugging stdout report
-        print("\nBIT FLAGS")
-        print(
-            f"\nOS/2.fsSelection updated with the following data:\n"
-            f"{self.bit_model.get_os2_instance_data()}"
-        )
-        print(f"Pre OS/2.fsSelection:  {num2binary(pre_os2_fsselection_int, bits=16)}")
-        print(
-            f"Post OS/2.fsSelection: {num2binary(self.ttfont['OS/2'].fsSelection, bits=16)}"
-        )
-        print(
-            f"\nhead.macStyle bit flag updated with the following data:\n"
-            f"{self.bit_model.get_head_instance_data()}"
-        )
-        print(f"Pre head.macStyle:  {num2binary(pre_head_macstyle_int, bits=16)}")
-        print(
-            f"Post head.macStyle: {num2binary(self.ttfont['head'].macStyle, bits=16)}"
-        )
+        if self.verbose:
+            print("\nBIT FLAGS")
+            print(
+                f"\nOS/2.fsSelection updated with the following data:\n"
+                f"{self.bit_model.get_os2_instance_data()}"
+            )
+            print(
+                f"Pre OS/2.fsSelection:  {num2binary(pre_os2_fsselection_int, bits=16)}"
+            )
+            print(
+                f"Post OS/2.fsSelection: "
+                f"{num2binary(self.ttfont['OS/2'].fsSelection, bits=16)}"
+            )
+            print(
+                f"\nhead.macStyle bit flag updated with the following data:\n"
+                f"{self.bit_model.get_head_instance_data()}"
+            )
+            print(f"Pre head.macStyle:  {num2binary(pre_head_macstyle_int, bits=16)}")
+            print(
+                f"Post head.macStyle: "
+                f"{num2binary(self.ttfont['head'].macStyle, bits=16)}"
+            )
@@ -0,0 +1,179 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Persistent batch job manifest.  The manifest is a JSON-lines file of job
+# state records that are appended as jobs start, complete and fail, the
+# last record of a job defines its state.  Records hold the job spec, the
+# source font hash, the sha256 hash of each output file and the stage
+# timings.  A re-run of a manifest skips the completed jobs with unchanged
+# source fonts and output files.  This module must not import PyQt5.
+#
+# Manifest record format:
+#
+#   {
+#     "id": "<sha256 of the job spec>",
+#     "state": "running" | "done" | "failed",
+#     "time": "2021-06-01T12:00:00+00:00",
+#     "job": {"font": ..., "outpath": ..., "axes": {...}, "subset": ..., ...},
+#     "source": "<source font sha256>",
+#     "outputs": {"outpath": "<sha256>"},
+#     "timings": {"stage": seconds},
+#     "error": null
+#   }
+
+import hashlib
+import json
+import threading
+from datetime import datetime, timezone
+
+from .cache import hash_file, normalize_axis_data
+from .compression import CompressionProfile
+from .engine import SliceJob
+from .glyphsubset import GlyphSubset
+from .shards import get_shard_data
+from .telemetry import read_telemetry_log
+
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+def get_job_data(job):
+    """Returns a JSON serializable dict that defines a SliceJob."""
+    return {
+        "font": str(job.fontpath),
+        "outpath": str(job.outpath),
+        "axes": normalize_axis_data(job.axis_data),
+        "names": dict(job.name_data),
+        "os2_bits": dict(job.os2_bits),
+        "head_bits": dict(job.head_bits),
+        "compression": job.compression.get_data() if job.compression else None,
+        "flavors": list(job.flavors) if job.flavors else None,
+        "optimize": job.optimize,
+        "subset": job.subset.get_data() if job.subset else None,
+        "shards": get_shard_data(job.shards) if job.shards else None,
+    }
+
+
+def get_job_from_data(job_data):
+    """Returns the SliceJob of a get_job_data dict."""
+    compression_data = job_data.get("compression")
+    subset_data = job_data.get("subset")
+    return SliceJob(
+        job_data["font"],
+        job_data["outpath"],
+        {
+            axistag: tuple(value) if isinstance(value, list) else value
+            for axistag, value in job_data["axes"].items()
+        },
+        name_data=job_data.get("names"),
+        os2_bits=job_data.get("os2_bits"),
+        head_bits=job_data.get("head_bits"),
+        compression=(
+            CompressionProfile(**compression_data) if compression_data else None
+        ),
+        flavors=job_data.get("flavors"),
+        optimize=job_data.get("optimize", "full"),
+        subset=GlyphSubset(**subset_data) if subset_data else None,
+        shards=job_data.get("shards"),
+    )
+
+
+def get_job_id(job_data):
+    key = json.dumps(job_data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class JobManifest(object):
+    """Records batch job states in a JSON-lines manifest file and
+    identifies the jobs that a re-run must execute."""
+
+    def __init__(self, manifest_path):
+        self.manifest_path = manifest_path
+        self._lock = threading.Lock()
+        # job id : last record of the job
+        self.records = {}
+        # font path : sha256 hash, the source fonts are hashed once per run
+        self._source_hashes = {}
+        for record in read_telemetry_log(manifest_path):
+            if "id" in record and "state" in record:
+                self.records[record["id"]] = record
+
+    def get_source_hash(self, fontpath):
+        if fontpath not in self._source_hashes:
+            self._source_hashes[fontpath] = hash_file(fontpath)
+        return self._source_hashes[fontpath]
+
+    def get_jobs(self):
+        """Returns the SliceJob objects of the manifest in record order."""
+        return [get_job_from_data(record["job"]) for record in self.records.values()]
+
+    def get_state(self, job):
+        record = self.records.get(get_job_id(get_job_data(job)))
+        return record["state"] if record else None
+
+    def is_complete(self, job):
+        """Returns True when the job is done, the source font is unchanged and
+        every output file exists with the recorded hash."""
+        record = self.records.get(get_job_id(get_job_data(job)))
+        if record is None or record["state"] != JOB_DONE:
+            return False
+        try:
+            if record.get("source") != self.get_source_hash(job.fontpath):
+                return False
+            return bool(record["outputs"]) and all(
+                hash_file(outpath) == sha256
+                for outpath, sha256 in record["outputs"].items()
+            )
+        except OSError:
+            # missing source or output file
+            return False
+
+    def get_pending_jobs(self, jobs):
+        """Returns the jobs that are not complete."""
+        return [job for job in jobs if not self.is_complete(job)]
+
+    def write(self, job, state, result=None, error=None):
+        job_data = get_job_data(job)
+        record = {
+            "id": get_job_id(job_data),
+            "state": state,
+            "time": datetime.now(timezone.utc).isoformat(),
+            "job": job_data,
+            "source": None,
+            "outputs": {},
+            "timings": dict(result.timings) if result else {},
+            "error": str(error) if error else None,
+        }
+        if state == JOB_DONE:
+            record["source"] = self.get_source_hash(job.fontpath)
+            record["outputs"] = {
+                outpath: hash_file(outpath) for outpath in result.outpaths
+            }
+        line = json.dumps(record)
+        # single appended lines do not interleave across processes
+        with self._lock:
+            self.records[record["id"]] = record
+            with open(self.manifest_path, "a", encoding="utf-8") as f:
+                f.write(f"{line}\n")
+
+    def start(self, job):
+        self.write(job, JOB_RUNNING)
+
+    def finish(self, job, result):
+        self.write(job, JOB_DONE, result=result)
+
+    def fail(self, job, error):
+        self.write(job, JOB_FAILED, error=error)
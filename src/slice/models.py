@@ -13,10 +13,18 @@
 #    You should have received a copy of the GNU General Public License
 #    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
 
+import math
+import os
 import re
+import threading
 
-from fontTools.ttLib import TTFont
-from PyQt5.QtCore import QAbstractTableModel, Qt
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from .bitflags import FontBitFlagModel  # noqa: F401
+from .engine import get_named_instances
+from .fontinspect import FontInspector
+from .fontsession import FontSession
+from .preview import PreviewFont
 
 
 class SliceBaseTableModel(QAbstractTableModel):
@@ -88,8 +96,7 @@ class FontNameModel(SliceBaseTableModel):
         ]
 
     def load_font(self, font_model):
-        ttfont = TTFont(font_model.fontpath)
-        name = ttfont["name"]
+        name = font_model.get_inspector().get_name_table()
         plat_id = 3
         plat_enc_id = 1
         lang_id = 1033
@@ -183,6 +190,8 @@ class DesignAxisModel(SliceBaseTableModel):
         self.fvar_axes = {}
         self.fvar_name_map = {}
         self.ordered_axis_tags = []
+        # list of engine.NamedInstance for the fvar named instances
+        self.named_instances = []
         self._data = [
             ["", ""],
             ["", ""],
@@ -245,8 +254,8 @@ class DesignAxisModel(SliceBaseTableModel):
             return super().flags(index)
 
     def load_font(self, font_model):
-        ttfont = TTFont(font_model.fontpath)
-        fvar = ttfont["fvar"]
+        inspector = font_model.get_inspector()
+        fvar = inspector.get_fvar_table()
         # used to re-define the model data on each
         # new font load
         new_data = []
@@ -267,9 +276,17 @@ class DesignAxisModel(SliceBaseTableModel):
             # use the axisID to locate the axis name in the name table
             # if it does not exist, the getName method returns None
             self.fvar_name_map[axis.axisTag] = (
-                ttfont["name"].getName(axis.axisNameID, 3, 1, 1033).toUnicode()
+                inspector.get_name_table()
+                .getName(axis.axisNameID, 3, 1, 1033)
+                .toUnicode()
             )
 
+        try:
+            self.named_instances = get_named_instances(fvar, inspector.get_name_table())
+        except ValueError:
+            # named instances without name records are not exported
+            self.named_instances = []
+
         # set header with ordered axis tags
         self._v_header = self.ordered_axis_tags
         self._data = new_data
@@ -306,6 +323,28 @@ class DesignAxisModel(SliceBaseTableModel):
 
         return instance_data
 
+    def get_preview_location(self, edits=None):
+        """Returns a map of "axis_tag": float location for the preview.  edits
+        is an optional map of row : editor text for values that are being
+        typed.  Undefined, range, invalid, non-finite and out of range values
+        are at the axis default."""
+        edits = edits if edits else {}
+        location = {}
+        for x, axistag in enumerate(self.ordered_axis_tags):
+            axis_value = edits.get(x, self._data[x][1])
+            try:
+                value = float(axis_value)
+            except ValueError:
+                # partially typed or range values
+                continue
+            # float() accepts nan and inf
+            if not math.isfinite(value):
+                continue
+            minimum, _, maximum = self.fvar_axes[axistag]
+            if minimum <= value <= maximum:
+                location[axistag] = value
+        return location
+
     def parse_subspace_range(self, range_string, axistag):
         match = self.axis_range_regex.search(range_string)
 
@@ -407,50 +446,151 @@ class DesignAxisModel(SliceBaseTableModel):
                 return None
 
 
-class FontBitFlagModel(object):
-    def __init__(self, os2_dict, head_dict):
-        self._os2_dict = os2_dict
-        self._head_dict = head_dict
+class JobQueueModel(SliceBaseTableModel):
+    """Batch job queue table.  Each row is a SliceJob with the job status,
+    duration and output file size."""
 
-    def _set_bit(self, int_type, offset):
-        mask = 1 << offset
-        return int_type | mask
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    DONE = "Done"
+    CACHED = "Cached"
+    FAILED = "Failed"
 
-    def _clear_bit(self, int_type, offset):
-        mask = ~(1 << offset)
-        return int_type & mask
+    def __init__(self, *args):
+        SliceBaseTableModel.__init__(self, *args)
+        self.jobs = []
+        # job error messages by row, shown as tool tips
+        self.errors = {}
+        self._data = []
+        self._h_header = ["Output", "Axes", "Status", "Time", "Size"]
 
-    def _get_bit_offset_from_key(self, bitkey):
-        # dict key formatted as e.g., `bit0`
-        # grab the integer portion and cast to int
-        return int(bitkey.replace("bit", ""))
+    def data(self, index, role):
+        if role == Qt.ToolTipRole:
+            return self.errors.get(index.row())
+        return super().data(index, role)
 
-    def _edit_bits(self, integer, bit_dict):
-        for bitkey, is_set in bit_dict.items():
-            offset = self._get_bit_offset_from_key(bitkey)
-            if is_set:
-                integer = self._set_bit(integer, offset)
-            else:
-                integer = self._clear_bit(integer, offset)
-        return integer
+    def rowCount(self, index):
+        if index.isValid():
+            return 0
+        else:
+            return len(self._data)
 
-    def get_os2_instance_data(self):
-        return self._os2_dict
+    def columnCount(self, index):
+        if index.isValid():
+            return 0
+        else:
+            return len(self._h_header)
 
-    def get_head_instance_data(self):
-        return self._head_dict
+    def headerData(self, section, orientation, role):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._h_header[section]
+        elif orientation == Qt.Vertical and role == Qt.DisplayRole:
+            return str(section + 1)
+
+    def add_job(self, job):
+        row = len(self.jobs)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.jobs.append(job)
+        self._data.append(
+            [
+                os.path.basename(job.outpath),
+                self.format_axis_data(job.axis_data),
+                self.QUEUED,
+                "",
+                "",
+            ]
+        )
+        self.endInsertRows()
+        return row
+
+    def clear(self):
+        self.beginResetModel()
+        self.jobs = []
+        self.errors = {}
+        self._data = []
+        self.endResetModel()
+
+    def get_queued_jobs(self):
+        """Returns a list of (row, SliceJob) tuples for the jobs that have
+        not been executed."""
+        return [
+            (row, job)
+            for row, job in enumerate(self.jobs)
+            if self._data[row][2] == self.QUEUED
+        ]
 
-    def edit_os2_fsselection_bits(self, integer):
-        return self._edit_bits(integer, self._os2_dict)
+    def get_status(self, row):
+        return self._data[row][2]
 
-    def edit_head_macstyle_bits(self, integer):
-        return self._edit_bits(integer, self._head_dict)
+    def set_status(self, row, status, duration=None, size=None, error=None):
+        self._data[row][2] = status
+        self._data[row][3] = f"{duration:.2f} s" if duration is not None else ""
+        self._data[row][4] = self.format_size(size) if size is not None else ""
+        if error:
+            self.errors[row] = error
+        else:
+            self.errors.pop(row, None)
+        self.dataChanged.emit(self.index(row, 2), self.index(row, 4))
+
+    def format_axis_data(self, axis_data):
+        axis_strings = []
+        for axistag, value in axis_data.items():
+            if isinstance(value, (tuple, list)):
+                axis_strings.append(f"{axistag} {value[0]:g}:{value[1]:g}")
+            else:
+                axis_strings.append(f"{axistag} {value:g}")
+        return ", ".join(axis_strings)
+
+    def format_size(self, size):
+        if size < 1024:
+            return f"{size} B"
+        elif size < 1024 * 1024:
+            return f"{size / 1024:.1f} KB"
+        else:
+            return f"{size / 1024 / 1024:.1f} MB"
 
 
 class FontModel(object):
     def __init__(self, fontpath):
         self.fontpath = fontpath
+        self._inspector = None
+        self._session = None
+        self._preview_font = None
+        # the session is requested from the worker threads
+        self._session_lock = threading.Lock()
+
+    def get_inspector(self):
+        """Returns the FontInspector for the font path.  Only the table
+        directory and the tables that the UI displays are read."""
+        if self._inspector is None:
+            self._inspector = FontInspector(self.fontpath)
+        return self._inspector
+
+    def get_session(self):
+        """Returns the FontSession for the font path.  The font file is
+        parsed on the first call and shared by all subsequent calls until
+        the file is modified.  A modified file is parsed again, the mapped
+        data of the previous parse is not read after the file changes."""
+        with self._session_lock:
+            return self._get_session()
+
+    def _get_session(self):
+        # must be called with the session lock held
+        if self._session is None or self._session.is_modified():
+            self._session = FontSession(self.fontpath)
+            # the preview font is built from the previous parse
+            self._preview_font = None
+        return self._session
+
+    def get_preview_font(self):
+        """Returns the PreviewFont that draws the font at axis locations
+        without instancing.  Raises TTLibError for fonts without glyf outlines."""
+        with self._session_lock:
+            session = self._get_session()
+            if self._preview_font is None:
+                self._preview_font = PreviewFont(session.new_ttfont())
+            return self._preview_font
 
     def is_variable_font(self):
         """Check for fvar table to validate that a TTFont is a variable font"""
-        return "fvar" in TTFont(self.fontpath)
+        return self.get_inspector().is_variable_font()
@@ -0,0 +1,92 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Instancer optimization levels.  The fontTools instancer optimize option
+# only controls the gvar IUP delta optimization, the item variation store
+# (HVAR, MVAR, GDEF/GPOS) is always optimized.  The variation store
+# optimization is replaced with an identity mapping in the threads that
+# instantiate at the none and iup levels.  The VarStore.optimize patch only
+# applies the identity mapping to the calling thread and is removed after
+# the last instantiation that uses it.  This module must not import PyQt5.
+
+import threading
+from contextlib import contextmanager
+
+from fontTools.ttLib.tables import otTables
+from fontTools.varLib import varStore  # noqa: F401 defines VarStore.optimize
+
+# optimize level : (gvar IUP delta optimization, variation store optimization)
+OPTIMIZE_LEVELS = {
+    "none": (False, False),
+    "iup": (True, False),
+    "full": (True, True),
+}
+
+# True in the threads that skip the variation store optimization
+_optimize_local = threading.local()
+
+# the VarStore.optimize patch is installed while an instantiation
+# in any thread skips the variation store optimization
+_optimize_patch = {"count": 0}
+_optimize_lock = threading.Lock()
+
+
+def validate_optimize_level(level):
+    if level not in OPTIMIZE_LEVELS:
+        raise ValueError(
+            f"'{level}' is not a valid optimize level.  Use one of "
+            f"{', '.join(OPTIMIZE_LEVELS)}."
+        )
+    return level
+
+
+def get_identity_varidx_map(var_store):
+    """Returns a VarStore.optimize mapping that retains every variation index."""
+    return {
+        (major << 16) + minor: (major << 16) + minor
+        for major, var_data in enumerate(var_store.VarData)
+        for minor in range(len(var_data.Item))
+    }
+
+
+def _optimize_var_store(var_store, *args, **kwargs):
+    if getattr(_optimize_local, "identity", False):
+        return get_identity_varidx_map(var_store)
+    return _optimize_patch["optimize"](var_store, *args, **kwargs)
+
+
+@contextmanager
+def optimize_level(level="full"):
+    """Context manager that applies an optimize level to the instantiations
+    of the calling thread.  Yields the instantiateVariableFont optimize
+    argument.  Instantiations in other threads are not affected."""
+    iup, var_store = OPTIMIZE_LEVELS[validate_optimize_level(level)]
+    saved_identity = getattr(_optimize_local, "identity", False)
+    if not var_store:
+        with _optimize_lock:
+            if _optimize_patch["count"] == 0:
+                _optimize_patch["optimize"] = otTables.VarStore.optimize
+                otTables.VarStore.optimize = _optimize_var_store
+            _optimize_patch["count"] += 1
+    _optimize_local.identity = not var_store
+    try:
+        yield iup
+    finally:
+        _optimize_local.identity = saved_identity
+        if not var_store:
+            with _optimize_lock:
+                _optimize_patch["count"] -= 1
+                if _optimize_patch["count"] == 0:
+                    otTables.VarStore.optimize = _optimize_patch["optimize"]
@@ -0,0 +1,268 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Variable font glyph outlines at a design space location without
+# instancing.  The gvar deltas of the requested glyphs are decompiled on
+# first use and the deltas are scaled and added to the default outlines
+# for each location, the glyf and gvar tables are not modified.  Text is
+# laid out with the cmap and the varied advance widths, there is no
+# shaping.  Preview instances are static instances of the glyphs that
+# draw a sample text, the source is subset before it is instanced so that
+# the instancer only processes the sample glyphs.  This module must not
+# import PyQt5.
+
+import math
+
+from fontTools.misc.fixedTools import floatToFixedToFloat
+from fontTools.pens.transformPen import TransformPen
+from fontTools.ttLib import TTLibError, newTable
+from fontTools.ttLib.tables._g_l_y_f import Glyph, GlyphCoordinates
+from fontTools.varLib.iup import iup_delta
+from fontTools.varLib.models import normalizeValue, piecewiseLinearMap, supportScalar
+
+from .engine import instantiate_variable_font
+from .glyphsubset import GlyphVariationReader
+
+DEFAULT_PREVIEW_TEXT = "Hamburgefonstiv 0123456789"
+
+# tables of preview instances.  The other tables index removed
+# glyphs or are not used to draw the sample text
+PREVIEW_INSTANCE_TABLES = (
+    "head",
+    "hhea",
+    "maxp",
+    "OS/2",
+    "hmtx",
+    "cmap",
+    "loca",
+    "glyf",
+    "name",
+    "post",
+    "fvar",
+    "gvar",
+    "avar",
+    "MVAR",
+)
+
+
+class PreviewGlyph(object):
+    """The default outline, controls and decompiled deltas of one glyph."""
+
+    def __init__(self, coordinates, controls, variations):
+        # GlyphCoordinates with the four phantom points
+        self.coordinates = coordinates
+        self.controls = controls
+        # list of (axis support map, GlyphCoordinates deltas) tuples with
+        # the deltas of the points that are not referenced inferred
+        self.variations = variations
+
+    def get_coordinates(self, location):
+        """Returns the GlyphCoordinates at a normalized location."""
+        coordinates = GlyphCoordinates(self.coordinates)
+        for axes, deltas in self.variations:
+            scalar = supportScalar(location, axes)
+            if scalar:
+                coordinates += deltas * scalar
+        return coordinates
+
+
+class PreviewFont(object):
+    """Draws the glyphs of a TrueType variable font at design space locations.
+    ttfont is a private fontTools.ttLib.TTFont, e.g., FontSession.new_ttfont()."""
+
+    def __init__(self, ttfont):
+        if "glyf" not in ttfont:
+            raise TTLibError("The preview requires TrueType glyf outlines")
+        self.ttfont = ttfont
+        self.glyf = ttfont["glyf"]
+        self.metrics = ttfont["hmtx"].metrics
+        self.units_per_em = ttfont["head"].unitsPerEm
+        self.ascender = ttfont["hhea"].ascent
+        self.descender = ttfont["hhea"].descent
+        self.cmap = ttfont.getBestCmap() or {}
+        self.glyph_order = ttfont.getGlyphOrder()
+        self.fvar_axes = {}
+        self.axis_tags = []
+        if "fvar" in ttfont:
+            for axis in ttfont["fvar"].axes:
+                self.axis_tags.append(axis.axisTag)
+                self.fvar_axes[axis.axisTag] = (
+                    axis.minValue,
+                    axis.defaultValue,
+                    axis.maxValue,
+                )
+        self.avar_segments = ttfont["avar"].segments if "avar" in ttfont else {}
+        self.variation_reader = GlyphVariationReader(ttfont)
+        # glyph name : PreviewGlyph
+        self._glyphs = {}
+
+    def get_glyph(self, glyphname):
+        if glyphname not in self._glyphs:
+            coordinates, controls = self.glyf._getCoordinatesAndControls(
+                glyphname, self.metrics
+            )
+            variations = []
+            for variation in self.variation_reader.get_variations(
+                glyphname, len(coordinates)
+            ):
+                deltas = variation.coordinates
+                if None in deltas:
+                    deltas = iup_delta(deltas, coordinates, controls.endPts)
+                variations.append((variation.axes, GlyphCoordinates(deltas)))
+            self._glyphs[glyphname] = PreviewGlyph(coordinates, controls, variations)
+        return self._glyphs[glyphname]
+
+    def normalize_location(self, location):
+        """Returns the normalized (with avar) location of a map of "axis_tag":
+        user space value.  Values are clamped to the axis limits and quantized
+        to F2Dot14 like the instancer.  Undefined and non-finite values are
+        at the default."""
+        normalized = {}
+        for axistag, triple in self.fvar_axes.items():
+            # float() accepts nan and inf
+            if axistag not in location or not math.isfinite(location[axistag]):
+                continue
+            value = normalizeValue(location[axistag], triple)
+            if axistag in self.avar_segments:
+                value = piecewiseLinearMap(value, self.avar_segments[axistag])
+            normalized[axistag] = floatToFixedToFloat(value, 14)
+        return normalized
+
+    def get_glyph_name(self, character):
+        return self.cmap.get(ord(character), self.glyph_order[0])
+
+    def draw_glyph(self, glyphname, location, pen):
+        """Draws a glyph at a normalized location to a fontTools pen.
+        Returns the advance width."""
+        preview_glyph = self.get_glyph(glyphname)
+        coordinates = preview_glyph.get_coordinates(location)
+        controls = preview_glyph.controls
+        if controls.components is not None:
+            # the component offsets vary, the component
+            # outlines are drawn at the same location
+            glyph = self.glyf[glyphname]
+            for component, offset in zip(glyph.components, coordinates):
+                component_name, transform = component.getComponentInfo()
+                if hasattr(component, "x"):
+                    transform = tuple(transform[:4]) + tuple(offset)
+                self.draw_glyph(component_name, location, TransformPen(pen, transform))
+        elif controls.numberOfContours > 0:
+            outline = Glyph()
+            outline.numberOfContours = controls.numberOfContours
+            outline.coordinates = GlyphCoordinates(coordinates[:-4])
+            outline.endPtsOfContours = controls.endPts
+            outline.flags = controls.flags
+            outline.draw(pen, self.glyf)
+        # left and right phantom points
+        return coordinates[-3][0] - coordinates[-4][0]
+
+    def draw_text(self, text, location, pen):
+        """Draws a line of text at a user space location map of "axis_tag":
+        value to a fontTools pen.  Returns the advance width of the line."""
+        normalized = self.normalize_location(location)
+        x = 0
+        for character in text:
+            glyphname = self.get_glyph_name(character)
+            x += self.draw_glyph(
+                glyphname, normalized, TransformPen(pen, (1, 0, 0, 1, x, 0))
+            )
+        return x
+
+
+#
+# Preview instances
+#
+
+
+def get_text_glyphs(ttfont, text):
+    """Returns the set of glyph names that draw text: the cmap glyphs
+    of the characters, .notdef, and the composite glyph components."""
+    cmap = ttfont.getBestCmap() or {}
+    glyf = ttfont["glyf"]
+    glyphnames = {ttfont.getGlyphOrder()[0]}
+    pending = [cmap[ord(character)] for character in text if ord(character) in cmap]
+    while pending:
+        glyphname = pending.pop()
+        if glyphname in glyphnames:
+            continue
+        glyphnames.add(glyphname)
+        glyph = glyf[glyphname]
+        if glyph.isComposite():
+            pending.extend(component.glyphName for component in glyph.components)
+    return glyphnames
+
+
+def subset_preview_glyphs(ttfont, glyphnames):
+    """Removes the glyphs that are not in glyphnames from a TrueType variable
+    font in place.  Only the variation data of the retained glyphs is
+    decompiled.  The subset font holds the PREVIEW_INSTANCE_TABLES and is not
+    intended for distribution, e.g., layout and hinting tables are removed."""
+    if "glyf" not in ttfont:
+        raise TTLibError("The preview requires TrueType glyf outlines")
+    glyph_order = [
+        glyphname for glyphname in ttfont.getGlyphOrder() if glyphname in glyphnames
+    ]
+    for tag in ttfont.keys():
+        if tag != "GlyphOrder" and tag not in PREVIEW_INSTANCE_TABLES:
+            del ttfont[tag]
+
+    glyf = ttfont["glyf"]
+    hmtx = ttfont["hmtx"]
+    if "gvar" in ttfont:
+        # read before the glyph order changes
+        reader = GlyphVariationReader(ttfont)
+        gvar = newTable("gvar")
+        gvar.version = 1
+        gvar.reserved = 0
+        gvar.variations = {}
+        for glyphname in glyph_order:
+            coordinates, _ = glyf._getCoordinatesAndControls(glyphname, hmtx.metrics)
+            variations = reader.get_variations(glyphname, len(coordinates))
+            if variations:
+                gvar.variations[glyphname] = variations
+        ttfont["gvar"] = gvar
+
+    glyf.glyphs = {glyphname: glyf[glyphname] for glyphname in glyph_order}
+    glyf.glyphOrder = glyph_order
+    hmtx.metrics = {glyphname: hmtx.metrics[glyphname] for glyphname in glyph_order}
+    cmap = ttfont["cmap"]
+    # format 14 variation sequences are not used without shaping
+    cmap.tables = [table for table in cmap.tables if table.format != 14]
+    for table in cmap.tables:
+        table.cmap = {
+            codepoint: glyphname
+            for codepoint, glyphname in table.cmap.items()
+            if glyphname in glyphnames
+        }
+    # no glyph names
+    ttfont["post"].formatType = 3.0
+    ttfont["maxp"].numGlyphs = len(glyph_order)
+    ttfont.setGlyphOrder(glyph_order)
+
+
+def new_preview_instance(session, text, location, optimize="none"):
+    """Returns an in-memory static instance of the FontSession font with the
+    glyphs that draw text.  location is a map of "axis_tag": user space value,
+    values are clamped to the axis limits and undefined axes are pinned at
+    the default.  optimize is an OPTIMIZE_LEVELS name.  Raises TTLibError
+    for fonts without glyf outlines."""
+    ttfont = session.new_ttfont()
+    subset_preview_glyphs(ttfont, get_text_glyphs(ttfont, text))
+    axis_instance_data = {}
+    for axis in ttfont["fvar"].axes:
+        value = location.get(axis.axisTag, axis.defaultValue)
+        axis_instance_data[axis.axisTag] = min(max(value, axis.minValue), axis.maxValue)
+    instantiate_variable_font(ttfont, axis_instance_data, optimize=optimize)
+    return ttfont
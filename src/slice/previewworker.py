@@ -0,0 +1,84 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+import sys
+import traceback
+
+from fontTools.ttLib import TTLibError
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+
+from .preview import PreviewFont, new_preview_instance
+
+
+class PreviewFontWorkerSignals(QObject):
+    finished = pyqtSignal()  # no return type, only signal that complete
+    result = pyqtSignal(object)  # returns the PreviewFont or None
+
+
+class PreviewFontWorker(QRunnable):
+    """Builds the FontModel PreviewFont off of the GUI thread after a font
+    load.  The source font parse and the glyph outline reads do not delay
+    the display of the font tables.  Fonts without glyf outlines emit a
+    None result."""
+
+    def __init__(self, font_model):
+        super().__init__()
+        self.signals = PreviewFontWorkerSignals()
+        self.font_model = font_model
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            preview_font = self.font_model.get_preview_font()
+        except TTLibError:
+            # CFF fonts are loaded without a preview
+            preview_font = None
+        except Exception:
+            # the preview is optional, a failed build does not fail the load
+            sys.stderr.write(f"{traceback.format_exc()}\n")
+            preview_font = None
+        self.signals.result.emit(preview_font)
+        self.signals.finished.emit()
+
+
+class PreviewInstanceWorkerSignals(QObject):
+    finished = pyqtSignal()  # no return type, only signal that complete
+    result = pyqtSignal(object)  # returns the instance PreviewFont or None
+
+
+class PreviewInstanceWorker(QRunnable):
+    """Instantiates the sample text glyphs of the FontModel font at an axis
+    location off of the GUI thread.  The instancer waits on the instance
+    optimize lock while a batch or an instance job runs in the process.
+    A location that can not be instantiated emits a None result."""
+
+    def __init__(self, font_model, text, location):
+        super().__init__()
+        self.signals = PreviewInstanceWorkerSignals()
+        self.font_model = font_model
+        self.text = text
+        self.location = dict(location)
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            instance = new_preview_instance(
+                self.font_model.get_session(), self.text, self.location
+            )
+            preview_font = PreviewFont(instance)
+        except Exception:
+            preview_font = None
+        self.signals.result.emit(preview_font)
+        self.signals.finished.emit()
@@ -0,0 +1,289 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Determinate instance job progress.  Job stages are weighted by their
+# share of the job time in the telemetry event history and the instancer
+# reports progress per glyph and per variation table.  This module must
+# not import PyQt5.
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from fontTools.varLib import instancer
+
+from .telemetry import read_telemetry_tail
+
+# job stage : share of the total job time, used when there is no history
+DEFAULT_STAGE_WEIGHTS = {
+    "parse": 0.05,
+    "instance": 0.65,
+    "names": 0.01,
+    "bits": 0.01,
+    "save": 0.28,
+}
+
+# share of the instance stage that is spent in the glyf/gvar tables
+GVAR_SHARE = 0.85
+
+# instancer log message prefix : (instance stage progress, progress message)
+INSTANCER_STEPS = {
+    "Instantiating glyf/gvar": (0.0, "glyf/gvar"),
+    "Instantiating cvt/cvar": (GVAR_SHARE, "cvt/cvar"),
+    "Instantiating MVAR": (0.86, "MVAR"),
+    "Instantiating HVAR": (0.87, "HVAR"),
+    "Instantiating VVAR": (0.89, "VVAR"),
+    "Instantiating GDEF": (0.91, "GDEF/GPOS variation store"),
+    "Instantiating FeatureVariations": (0.95, "feature variations"),
+    "Instantiating avar": (0.97, "avar"),
+    "Instantiating STAT": (0.98, "STAT"),
+    "Instantiating fvar": (0.99, "fvar"),
+}
+
+# number of the most recent telemetry events that define the job history
+HISTORY_EVENT_COUNT = 200
+
+# progress state of the instancer_progress context of each thread
+_instancer_local = threading.local()
+
+# the instancer module patch is installed while instancer_progress contexts
+# are active in any thread.  It reports to the context of the calling
+# thread only, instancing in other threads passes through unreported
+_instancer_patch = {"count": 0}
+_instancer_lock = threading.Lock()
+
+
+#
+# Job history
+#
+
+
+def load_job_history(logpath):
+    """Returns the most recent successful, uncached job events in a
+    TelemetryLog file.  Missing or unreadable logs have no history."""
+    return [
+        event
+        for event in read_telemetry_tail(logpath, HISTORY_EVENT_COUNT)
+        if event.get("status") == "ok" and not event.get("cached")
+    ]
+
+
+def get_stage_weights(events):
+    """Returns the mean share of the job time per stage in the job history."""
+    totals = {stage: 0.0 for stage in DEFAULT_STAGE_WEIGHTS}
+    count = 0
+    for event in events:
+        timings = event.get("timings", {})
+        total_time = sum(timings.get(stage, 0.0) for stage in totals)
+        if total_time <= 0:
+            continue
+        for stage in totals:
+            totals[stage] += timings.get(stage, 0.0) / total_time
+        count += 1
+    if count == 0:
+        return dict(DEFAULT_STAGE_WEIGHTS)
+    return {stage: total / count for stage, total in totals.items()}
+
+
+def get_expected_time(events, font_size):
+    """Returns the expected job time in seconds for a source font file size
+    from the mean seconds per source byte in the job history, or None."""
+    rates = [
+        event["total_time"] / event["font_size"]
+        for event in events
+        if event.get("font_size")
+    ]
+    if not rates or not font_size:
+        return None
+    return sum(rates) / len(rates) * font_size
+
+
+#
+# Progress reports
+#
+
+
+class ProgressTracker(object):
+    """Converts job stage progress to percent complete and ETA reports.  The
+    callback receives a dict with percent, stage, message, elapsed and eta
+    (seconds, or None when unknown) keys.  Reports are only made when the
+    percent or message change.  A None callback makes no reports."""
+
+    def __init__(self, callback=None, stage_weights=None, expected_time=None):
+        self.callback = callback
+        self.stage_weights = (
+            stage_weights if stage_weights else dict(DEFAULT_STAGE_WEIGHTS)
+        )
+        # expected job time in seconds from the job history
+        self.expected_time = expected_time
+        self.start_time = time.perf_counter()
+        self.stage = None
+        # stage weight sum of the completed stages
+        self._completed = 0.0
+        self._last_report = None
+
+    def start_stage(self, stage, message=None):
+        if self.stage is not None:
+            self.finish_stage()
+        self.stage = stage
+        self.update(0.0, message if message else stage)
+
+    def finish_stage(self):
+        self._completed += self.stage_weights.get(self.stage, 0.0)
+        self.stage = None
+
+    def finish(self):
+        if self.stage is not None:
+            self.finish_stage()
+        self._report(1.0, "complete")
+
+    def update(self, fraction, message=None):
+        """Reports progress as a fraction (0.0 - 1.0) of the current stage."""
+        weight = self.stage_weights.get(self.stage, 0.0)
+        total_weight = sum(self.stage_weights.values())
+        done = (self._completed + weight * min(max(fraction, 0.0), 1.0)) / total_weight
+        if message is None and self._last_report:
+            message = self._last_report[1]
+        self._report(min(done, 1.0), message)
+
+    def get_eta(self, done, elapsed):
+        # the observed rate is more reliable than the history
+        # once a part of the job is complete
+        if done >= 0.1:
+            return elapsed * (1.0 - done) / done
+        if self.expected_time is not None:
+            return max(self.expected_time - elapsed, 0.0)
+        if done > 0:
+            return elapsed * (1.0 - done) / done
+        return None
+
+    def _report(self, done, message):
+        percent = int(done * 100)
+        if self.callback is None or (percent, message) == self._last_report:
+            return
+        self._last_report = (percent, message)
+        elapsed = time.perf_counter() - self.start_time
+        self.callback(
+            {
+                "percent": percent,
+                "stage": self.stage,
+                "message": message,
+                "elapsed": elapsed,
+                "eta": self.get_eta(done, elapsed),
+            }
+        )
+
+
+def format_progress(report):
+    eta = report["eta"]
+    eta_string = f"  ETA {eta:.0f}s" if eta is not None else ""
+    stage = f"{report['stage']}: " if report["stage"] else ""
+    return f"[{report['percent']:3d}%] {stage}{report['message']}{eta_string}"
+
+
+#
+# Instancer progress
+#
+
+
+class _InstancerProgress(object):
+    """Glyph and table progress of the instantiation in one thread."""
+
+    def __init__(self, callback, glyph_count):
+        self.callback = callback
+        self.glyph_count = glyph_count
+        self.processed = 0
+
+    def glyph(self):
+        self.processed += 1
+        self.callback(GVAR_SHARE * self.processed / self.glyph_count, "glyf/gvar")
+
+    def message(self, message):
+        for prefix, (fraction, step) in INSTANCER_STEPS.items():
+            if message.startswith(prefix):
+                self.callback(fraction, step)
+                break
+
+
+class _InstancerLogFilter(logging.Filter):
+    """Converts fontTools instancer table log messages to progress reports
+    of the thread that logs them."""
+
+    def __init__(self, level):
+        super().__init__()
+        # effective logger level before the progress reports
+        self.level = level
+
+    def filter(self, record):
+        # log records are handled in the thread that logs them
+        state = getattr(_instancer_local, "state", None)
+        if state is not None:
+            state.message(record.getMessage())
+        # the INFO level progress records are not passed
+        # to log handlers unless they were enabled before
+        return record.levelno >= self.level
+
+
+def _instantiate_glyph(*args, **kwargs):
+    _instancer_patch["instantiate_glyph"](*args, **kwargs)
+    state = getattr(_instancer_local, "state", None)
+    if state is not None:
+        state.glyph()
+
+
+def _install_instancer_patch():
+    with _instancer_lock:
+        if _instancer_patch["count"] == 0:
+            logger = logging.getLogger(instancer.__name__)
+            log_filter = _InstancerLogFilter(logger.getEffectiveLevel())
+            _instancer_patch.update(
+                level=logger.level,
+                filter=log_filter,
+                instantiate_glyph=getattr(instancer, "_instantiateGvarGlyph", None),
+            )
+            logger.addFilter(log_filter)
+            logger.setLevel(min(logger.getEffectiveLevel(), logging.INFO))
+            if _instancer_patch["instantiate_glyph"] is not None:
+                instancer._instantiateGvarGlyph = _instantiate_glyph
+        _instancer_patch["count"] += 1
+
+
+def _remove_instancer_patch():
+    with _instancer_lock:
+        _instancer_patch["count"] -= 1
+        if _instancer_patch["count"] == 0:
+            logger = logging.getLogger(instancer.__name__)
+            logger.removeFilter(_instancer_patch["filter"])
+            logger.setLevel(_instancer_patch["level"])
+            if _instancer_patch["instantiate_glyph"] is not None:
+                instancer._instantiateGvarGlyph = _instancer_patch["instantiate_glyph"]
+
+
+@contextmanager
+def instancer_progress(ttfont, callback):
+    """Context manager that reports instantiateVariableFont progress to
+    callback(fraction, message) per glyf/gvar glyph and per variation table.
+    Only the instancing in the calling thread is reported, instancing in
+    other threads runs concurrently and is not reported."""
+    state = _InstancerProgress(callback, len(ttfont.getGlyphOrder()))
+    saved_state = getattr(_instancer_local, "state", None)
+    _install_instancer_patch()
+    _instancer_local.state = state
+    try:
+        yield
+    finally:
+        _instancer_local.state = saved_state
+        _remove_instancer_patch()
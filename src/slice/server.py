@@ -0,0 +1,525 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Local HTTP slicing service.  Usage:
+#
+#   python -m slice.server FONT_DIR --port 8000 --cache-dir cache
+#
+#   GET /slice?font=Recursive-VF.ttf&wght=450&CASL=0.5&format=woff2
+#   GET /metrics
+#
+# /slice returns an instance of a font in FONT_DIR.  The query parameters
+# other than font, format (ttf, woff or woff2, default woff2), optimize
+# (none, iup or full) and unicodes (a glyph subset unicode range) are axis
+# locations in the axis editor syntax, e.g., wght=450 or wght=300:700.
+# Axes that are not defined remain variable.
+#
+# Identical concurrent requests are coalesced into one job.  The parsed
+# source fonts are kept resident in a least recently used FontSession pool,
+# and responses are served from an InstanceCache when --cache-dir is
+# defined.  With --workers > 1 jobs execute in a process pool with
+# process-resident FontSession objects (see batch.py).  /metrics returns
+# the request counts, queue depth and latency percentiles as JSON.  The
+# service binds to localhost by default.  This module must not import PyQt5.
+
+import argparse
+import json
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from .batch import run_pooled_job
+from .cache import DEFAULT_CACHE_SIZE, InstanceCache, normalize_axis_data
+from .engine import (
+    OUTPUT_FLAVORS,
+    SliceJob,
+    parse_axis_value,
+    run_job,
+    validate_axis_data,
+)
+from .fontinspect import FontInspector
+from .fontsession import FontSession
+from .glyphsubset import GlyphSubset
+from .optimize import OPTIMIZE_LEVELS
+
+DEFAULT_PORT = 8000
+DEFAULT_FORMAT = "woff2"
+# number of parsed source fonts that remain resident
+DEFAULT_MAX_SESSIONS = 8
+# number of the most recent request latencies in the metrics
+LATENCY_SAMPLE_COUNT = 1000
+
+# /slice query parameters that are not axis tags
+SLICE_PARAMETERS = ("font", "format", "optimize", "unicodes")
+
+# output flavor : Content-Type
+CONTENT_TYPES = {
+    "ttf": "font/ttf",
+    "woff": "font/woff",
+    "woff2": "font/woff2",
+}
+
+
+class ServiceError(Exception):
+    """A request error with the HTTP status code of the response."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class SliceResponse(object):
+    def __init__(self, data, flavor, cached=False, coalesced=False):
+        self.data = data
+        self.flavor = flavor
+        # True when the instance was copied from the InstanceCache
+        self.cached = cached
+        # True when the request waited on an identical request's job
+        self.coalesced = coalesced
+
+    def get_content_type(self):
+        return CONTENT_TYPES[self.flavor]
+
+
+def get_percentile(sorted_values, percent):
+    if not sorted_values:
+        return None
+    index = min(int(len(sorted_values) * percent / 100), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class SliceService(object):
+    """Executes slice requests for the fonts in a font directory.  Identical
+    concurrent requests share one job.  cache is an optional InstanceCache.
+    max_workers > 1 executes jobs in a process pool."""
+
+    def __init__(
+        self,
+        font_dir,
+        cache=None,
+        max_workers=1,
+        max_sessions=DEFAULT_MAX_SESSIONS,
+    ):
+        self.font_dir = Path(font_dir).resolve()
+        self.cache = cache
+        self.max_workers = max(max_workers, 1)
+        self.max_sessions = max_sessions
+        if self.max_workers > 1:
+            # worker processes keep their FontSession objects resident.  The
+            # processes are spawned, a fork of the request threads that hold
+            # the session, coalescing and fontTools patch locks is not safe
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self._lock = threading.Lock()
+        # font path : FontSession in least to most recently used order
+        self._sessions = OrderedDict()
+        # request key : Future of the SliceResponse of the executing job
+        self._pending = {}
+        # metrics
+        self.requests = 0
+        self.errors = 0
+        self.coalesced = 0
+        self.jobs = 0
+        self.cache_hits = 0
+        self.waiting = 0
+        self._latencies = deque(maxlen=LATENCY_SAMPLE_COUNT)
+        self._job_times = deque(maxlen=LATENCY_SAMPLE_COUNT)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    #
+    # FontSession pool
+    #
+
+    def get_session(self, fontpath):
+        """Returns the resident FontSession for a font path.  The font is
+        parsed again after the file is modified.  The least recently used
+        session is released when the pool is full."""
+        with self._lock:
+            session = self._sessions.pop(fontpath, None)
+            if session is not None and not session.is_modified():
+                self._sessions[fontpath] = session
+                return session
+        # the parse is not serialized across fonts
+        session = FontSession(fontpath)
+        # shared tables are decompiled before the session is shared by threads
+        session.get_fvar_table()
+        session.get_name_table()
+        with self._lock:
+            # another thread may have parsed the same font
+            resident = self._sessions.pop(fontpath, None)
+            if resident is not None and not resident.is_modified():
+                session = resident
+            self._sessions[fontpath] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def preload(self, fontnames):
+        """Parses fonts into the FontSession pool before the first request.
+        Worker processes parse each font on first use."""
+        for fontname in fontnames:
+            fontpath = self.get_font_path(fontname)
+            if self.max_workers == 1:
+                self.get_session(fontpath)
+
+    #
+    # Requests
+    #
+
+    def get_font_path(self, fontname):
+        """Returns the path of a font file in the font directory.  Paths
+        outside of the font directory are not served."""
+        if not fontname:
+            raise ServiceError(400, "The font query parameter is required.")
+        fontpath = (self.font_dir / fontname).resolve()
+        if self.font_dir not in fontpath.parents or not fontpath.is_file():
+            raise ServiceError(404, f"'{fontname}' is not a served font.")
+        return str(fontpath)
+
+    def get_job_parameters(self, query):
+        """Returns (font path, axis data, flavor, optimize, GlyphSubset or None)
+        from a map of /slice query parameters."""
+        fontpath = self.get_font_path(query.get("font"))
+        flavor = query.get("format", DEFAULT_FORMAT)
+        if flavor not in OUTPUT_FLAVORS:
+            raise ServiceError(
+                400,
+                f"'{flavor}' is not one of the {', '.join(OUTPUT_FLAVORS)} formats.",
+            )
+        optimize = query.get("optimize", "full")
+        if optimize not in OPTIMIZE_LEVELS:
+            raise ServiceError(
+                400,
+                f"'{optimize}' is not one of the {', '.join(OPTIMIZE_LEVELS)} "
+                f"optimize levels.",
+            )
+        try:
+            subset = GlyphSubset(query["unicodes"]) if query.get("unicodes") else None
+            axis_data = {
+                axistag: parse_axis_value(value, axistag)
+                for axistag, value in query.items()
+                if axistag not in SLICE_PARAMETERS
+            }
+        except ValueError as e:
+            raise ServiceError(400, str(e))
+        return fontpath, axis_data, flavor, optimize, subset
+
+    def validate_location(self, fontpath, axis_data):
+        """Raises a 400 ServiceError when the axis data are not valid for
+        the font.  Job errors after this validation are server errors."""
+        try:
+            if self.max_workers > 1:
+                # the sessions are resident in the worker processes, only
+                # the table directory and the fvar table are read here
+                fvar = FontInspector(fontpath).get_fvar_table()
+            else:
+                fvar = self.get_session(fontpath).get_fvar_table()
+        except KeyError:
+            raise ServiceError(400, f"'{Path(fontpath).name}' is not a variable font.")
+        except Exception as e:
+            raise ServiceError(500, f"The font could not be read: {e}")
+        try:
+            validate_axis_data(axis_data, fvar)
+        except ValueError as e:
+            raise ServiceError(400, str(e))
+
+    def get_request_key(self, fontpath, axis_data, flavor, optimize, subset):
+        return json.dumps(
+            {
+                "font": fontpath,
+                "axes": normalize_axis_data(axis_data),
+                "format": flavor,
+                "optimize": optimize,
+                "subset": subset.get_data() if subset else None,
+            },
+            sort_keys=True,
+        )
+
+    def slice(self, query):
+        """Returns the SliceResponse for a map of /slice query parameters.
+        Raises ServiceError for invalid requests and failed jobs."""
+        start = time.perf_counter()
+        with self._lock:
+            self.requests += 1
+        try:
+            parameters = self.get_job_parameters(query)
+            self.validate_location(*parameters[:2])
+            key = self.get_request_key(*parameters)
+            with self._lock:
+                self.waiting += 1
+                future = self._pending.get(key)
+                coalesced = future is not None
+                if coalesced:
+                    self.coalesced += 1
+                else:
+                    future = Future()
+                    self._pending[key] = future
+            try:
+                if not coalesced:
+                    try:
+                        self.submit(key, future, *parameters)
+                    except Exception as e:
+                        # the coalesced requests do not wait on a job that
+                        # was not submitted
+                        with self._lock:
+                            del self._pending[key]
+                        future.set_exception(
+                            ServiceError(500, f"The slice job was not submitted: {e}")
+                        )
+                response = future.result()
+            finally:
+                with self._lock:
+                    self.waiting -= 1
+        except ServiceError:
+            with self._lock:
+                self.errors += 1
+            raise
+        with self._lock:
+            self._latencies.append(time.perf_counter() - start)
+        if coalesced:
+            return SliceResponse(
+                response.data, response.flavor, response.cached, coalesced=True
+            )
+        return response
+
+    def submit(self, key, future, fontpath, axis_data, flavor, optimize, subset):
+        """Executes the job of a request and sets the SliceResponse (or the
+        ServiceError) of the shared request future."""
+        outdir = tempfile.mkdtemp(prefix="slice-")
+        job = SliceJob(
+            fontpath,
+            str(Path(outdir) / Path(fontpath).name),
+            axis_data,
+            flavors=[flavor],
+            optimize=optimize,
+            subset=subset,
+        )
+        try:
+            if self.max_workers > 1:
+                job_future = self.executor.submit(run_pooled_job, job, self.cache)
+            else:
+                job_future = self.executor.submit(self.run_job, job)
+        except Exception:
+            shutil.rmtree(outdir, ignore_errors=True)
+            raise
+
+        def finish(job_future):
+            try:
+                result = job_future.result()
+                with open(result.outpaths[0], "rb") as f:
+                    response = SliceResponse(f.read(), flavor, result.cached)
+                with self._lock:
+                    self.jobs += 1
+                    self.cache_hits += int(result.cached)
+                    self._job_times.append(result.get_total_time())
+            except Exception as e:
+                # the request parameters are validated before submission
+                error = ServiceError(500, f"The slice job failed: {e}")
+            else:
+                error = None
+            finally:
+                shutil.rmtree(outdir, ignore_errors=True)
+                # requests that arrive after this point start a new job
+                with self._lock:
+                    del self._pending[key]
+            if error is None:
+                future.set_result(response)
+            else:
+                future.set_exception(error)
+
+        job_future.add_done_callback(finish)
+
+    def run_job(self, job):
+        return run_job(job, self.get_session(job.fontpath), self.cache)
+
+    #
+    # Metrics
+    #
+
+    def get_metrics(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            job_times = sorted(self._job_times)
+            pending_jobs = len(self._pending)
+            metrics = {
+                "requests": self.requests,
+                "errors": self.errors,
+                "coalesced": self.coalesced,
+                "jobs": self.jobs,
+                "cache_hits": self.cache_hits,
+                # requests that wait on a response
+                "waiting_requests": self.waiting,
+                # jobs that wait on a free worker
+                "queue_depth": max(pending_jobs - self.max_workers, 0),
+                "active_jobs": min(pending_jobs, self.max_workers),
+                "sessions": list(self._sessions),
+            }
+        for name, values in (("latency", latencies), ("job_time", job_times)):
+            metrics[name] = {
+                "count": len(values),
+                "mean": sum(values) / len(values) if values else None,
+                "p50": get_percentile(values, 50),
+                "p95": get_percentile(values, 95),
+                "max": values[-1] if values else None,
+            }
+        if self.cache is not None:
+            metrics["cache"] = self.cache.get_stats()
+        return metrics
+
+
+#
+# HTTP server
+#
+
+
+class SliceRequestHandler(BaseHTTPRequestHandler):
+    server_version = "Slice"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/slice":
+            query = dict(parse_qsl(url.query))
+            try:
+                response = self.server.service.slice(query)
+            except ServiceError as e:
+                self.send_json(e.status, {"error": str(e)})
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", response.get_content_type())
+            self.send_header("Content-Length", str(len(response.data)))
+            self.send_header("X-Slice-Cache", "hit" if response.cached else "miss")
+            self.send_header("X-Slice-Coalesced", str(int(response.coalesced)))
+            self.end_headers()
+            self.wfile.write(response.data)
+        elif url.path == "/metrics":
+            self.send_json(200, self.server.service.get_metrics())
+        else:
+            self.send_json(404, {"error": f"'{url.path}' is not a service endpoint."})
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class SliceHTTPServer(ThreadingHTTPServer):
+    """Serves a SliceService, one thread per connection."""
+
+    daemon_threads = True
+
+    def __init__(self, service, host="127.0.0.1", port=DEFAULT_PORT, verbose=False):
+        super().__init__((host, port), SliceRequestHandler)
+        self.service = service
+        self.verbose = verbose
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog="sliceserver",
+        description="Local HTTP variable font slicing service",
+    )
+    parser.add_argument("font_dir", help="directory of the served fonts")
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="bind address (default: 127.0.0.1, localhost only)",
+    )
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"port (default: {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "--cache-dir", help="instance cache directory (default: no cache)"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+        help="instance cache size limit in MB (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="number of worker processes (default: 1, in-process jobs)",
+    )
+    parser.add_argument(
+        "--max-sessions",
+        type=int,
+        default=DEFAULT_MAX_SESSIONS,
+        help="number of parsed source fonts that remain resident "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        metavar="FONT",
+        help="parse a font in FONT_DIR at startup, repeat for multiple fonts",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="write a request log to stderr"
+    )
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    try:
+        cache = None
+        if args.cache_dir:
+            cache = InstanceCache(args.cache_dir, args.cache_size * 1024 * 1024)
+        service = SliceService(args.font_dir, cache, args.workers, args.max_sessions)
+        service.preload(args.preload)
+        server = SliceHTTPServer(service, args.host, args.port, args.verbose)
+    except (OSError, ServiceError) as e:
+        sys.stderr.write(f"[ERROR] {e}\n")
+        return 1
+
+    host, port = server.server_address[:2]
+    print(f"Serving {service.font_dir} on http://{host}:{port}/slice")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
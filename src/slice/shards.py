@@ -0,0 +1,183 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Unicode range shards of an instance for web font delivery.  An instance
+# is split into one font file per unicode range shard and a CSS file with
+# one @font-face rule per shard.  The unicode-range descriptor of a rule
+# lists the code points of the shard that the font maps.  Shards that the
+# font does not map are not written.  This module must not import PyQt5.
+
+from io import BytesIO
+from pathlib import Path
+
+from fontTools.subset import parse_unicodes
+from fontTools.ttLib import TTFont
+
+from .glyphsubset import GlyphSubset, format_unicodes, subset_variable_font
+
+# shard name : unicode range.  The Latin, Cyrillic, Greek and Vietnamese
+# ranges follow the Google Fonts CSS API subsets, the CJK shards are the
+# Unicode blocks of each script
+UNICODE_RANGE_SHARDS = {
+    "latin": (
+        "U+0000-00FF,U+0131,U+0152-0153,U+02BB-02BC,U+02C6,U+02DA,U+02DC,"
+        "U+0304,U+0308,U+0329,U+2000-206F,U+2074,U+20AC,U+2122,U+2191,U+2193,"
+        "U+2212,U+2215,U+FEFF,U+FFFD"
+    ),
+    "latin-ext": (
+        "U+0100-02AF,U+0304,U+0308,U+0329,U+1E00-1E9F,U+1EF2-1EFF,U+2020,"
+        "U+20A0-20AB,U+20AD-20C0,U+2113,U+2C60-2C7F,U+A720-A7FF"
+    ),
+    "vietnamese": (
+        "U+0102-0103,U+0110-0111,U+0128-0129,U+0168-0169,U+01A0-01A1,"
+        "U+01AF-01B0,U+0300-0301,U+0303-0304,U+0308-0309,U+0323,U+0329,"
+        "U+1EA0-1EF9,U+20AB"
+    ),
+    "cyrillic": "U+0301,U+0400-045F,U+0490-0491,U+04B0-04B1,U+2116",
+    "cyrillic-ext": (
+        "U+0460-052F,U+1C80-1C88,U+20B4,U+2DE0-2DFF,U+A640-A69F,U+FE2E-FE2F"
+    ),
+    "greek": "U+0370-0377,U+037A-037F,U+0384-038A,U+038C,U+038E-03A1,U+03A3-03FF",
+    "greek-ext": "U+1F00-1FFF",
+    "cjk-symbols": "U+2E80-2FDF,U+3000-303F,U+3190-319F,U+FE30-FE4F,U+FF00-FFEF",
+    "kana": "U+3040-30FF,U+31F0-31FF",
+    "hangul": "U+1100-11FF,U+3130-318F,U+A960-A97F,U+AC00-D7AF,U+D7B0-D7FF",
+    "cjk-ext-a": "U+3400-4DBF",
+    "cjk-unified": "U+4E00-9FFF",
+    "cjk-compatibility": "U+F900-FAFF",
+}
+
+# output flavor : CSS src format() hint
+CSS_FORMATS = {
+    "woff2": "woff2",
+    "woff": "woff",
+    "ttf": "truetype",
+}
+
+
+def get_shard_ranges(shards):
+    """Returns an ordered map of shard name : sorted code point list.  shards
+    is a list of UNICODE_RANGE_SHARDS names ("all" for every shard) or a map
+    of shard name : unicode range string or code point list."""
+    if isinstance(shards, str):
+        shards = list(UNICODE_RANGE_SHARDS) if shards == "all" else shards.split(",")
+    if not isinstance(shards, dict):
+        names = [name.strip() for name in shards]
+        for name in names:
+            if name not in UNICODE_RANGE_SHARDS:
+                raise ValueError(
+                    f"'{name}' is not a unicode range shard.  Use one of "
+                    f"{', '.join(UNICODE_RANGE_SHARDS)}."
+                )
+        shards = {name: UNICODE_RANGE_SHARDS[name] for name in names}
+    if not shards:
+        raise ValueError("A shard job requires at least one unicode range shard.")
+
+    shard_ranges = {}
+    for name, unicodes in shards.items():
+        if isinstance(unicodes, str):
+            try:
+                unicodes = parse_unicodes(unicodes)
+            except ValueError:
+                raise ValueError(
+                    f"'{unicodes}' is not a valid unicode range for the {name} shard."
+                )
+        shard_ranges[name] = sorted(set(unicodes))
+    return shard_ranges
+
+
+def get_shard_data(shard_ranges):
+    """Returns the JSON serializable map of shard name : unicode range string."""
+    return {name: format_unicodes(unicodes) for name, unicodes in shard_ranges.items()}
+
+
+def get_shard_outpath(outpath, name, flavor):
+    """Returns the shard file path, e.g., Recursive-Bold.latin.woff2 for
+    the Recursive-Bold.ttf out path and the latin shard."""
+    suffix = ".ttf" if flavor == "ttf" else f".{flavor}"
+    outpath = Path(outpath)
+    return str(outpath.with_name(f"{outpath.stem}.{name}{suffix}"))
+
+
+def get_css_path(outpath):
+    return str(Path(outpath).with_suffix(".css"))
+
+
+def get_shard_codepoints(cmap, unicodes):
+    """Returns the shard code points that the font maps."""
+    return [codepoint for codepoint in unicodes if codepoint in cmap]
+
+
+def subset_shard(sfnt_data, unicodes):
+    """Returns a TTFont of the glyphs of unicodes and their layout and
+    composite glyph closure from the compiled sfnt data of an instance.
+    The gvar data of partial instances is only decompiled for the
+    retained glyphs."""
+    ttfont = TTFont(BytesIO(sfnt_data), recalcTimestamp=False)
+    subset_variable_font(ttfont, GlyphSubset(unicodes))
+    return ttfont
+
+
+def get_css_font_properties(ttfont, axis_data):
+    """Returns the (font-family, font-weight, font-style) @font-face
+    descriptor values of an instance."""
+    name_table = ttfont["name"]
+    family_name = name_table.getDebugName(16) or name_table.getDebugName(1) or ""
+
+    weight = axis_data.get("wght")
+    if weight is None and "fvar" in ttfont:
+        # the weight axis remains variable
+        weight = next(
+            (
+                (axis.minValue, axis.maxValue)
+                for axis in ttfont["fvar"].axes
+                if axis.axisTag == "wght"
+            ),
+            None,
+        )
+    if weight is None:
+        font_weight = f"{ttfont['OS/2'].usWeightClass}"
+    elif isinstance(weight, tuple):
+        font_weight = f"{min(weight):g} {max(weight):g}"
+    else:
+        font_weight = f"{weight:g}"
+
+    # OS/2.fsSelection bit 0 is the ITALIC bit
+    font_style = "italic" if ttfont["OS/2"].fsSelection & 1 else "normal"
+    return family_name, font_weight, font_style
+
+
+def format_font_face_rule(
+    name, family_name, font_weight, font_style, sources, unicodes
+):
+    """Returns the @font-face rule of a shard.  sources is a list of
+    (file name, output flavor) tuples."""
+    src = ",\n       ".join(
+        f'url("{filename}") format("{CSS_FORMATS[flavor]}")'
+        for filename, flavor in sources
+    )
+    family_name = family_name.replace('"', '\\"')
+    unicode_range = format_unicodes(unicodes).replace(",", ", ")
+    return (
+        f"/* {name} */\n"
+        f"@font-face {{\n"
+        f'  font-family: "{family_name}";\n'
+        f"  font-style: {font_style};\n"
+        f"  font-weight: {font_weight};\n"
+        f"  font-display: swap;\n"
+        f"  src: {src};\n"
+        f"  unicode-range: {unicode_range};\n"
+        f"}}\n"
+    )
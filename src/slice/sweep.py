@@ -0,0 +1,235 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Cartesian axis location sweeps.  A sweep spec expands to one static
+# location SliceJob per grid point.  Locations are clamped to the fvar axis
+# limits and grid points that normalize (with avar) to the same F2Dot14
+# coordinates are executed once.  Jobs are generated lazily.  This module
+# must not import PyQt5.
+#
+# Sweep spec JSON format:
+#
+#   {
+#     "font": "Recursive-VF.ttf",
+#     "outdir": "sweep",
+#     "axes": {
+#       "wght": {"start": 300, "stop": 1000, "step": 50},
+#       "CASL": [0, 0.5, 1]
+#     },
+#     "flavors": ["ttf", "woff2"],
+#     "compression": {"woff": "zopfli", "zopfli_iterations": 15, "brotli_quality": 11},
+#     "optimize": "full",
+#     "subset": {"unicodes": "U+0000-007F"}
+#   }
+#
+# "stop" is inclusive.  Axes that are not defined in the sweep remain
+# variable.  "flavors", "compression", "optimize" and "subset" are optional.
+
+import itertools
+import json
+import os
+from pathlib import Path
+
+from fontTools.misc.fixedTools import otRound
+from fontTools.varLib.models import normalizeValue, piecewiseLinearMap
+
+from .compression import CompressionProfile
+from .engine import SliceJob, read_sfnt_version
+from .fontinspect import FontInspector
+from .glyphsubset import GlyphSubset
+from .telemetry import read_telemetry_log
+
+# results log file name in the sweep output directory
+SWEEP_LOG_NAME = "sweep.jsonl"
+
+
+class SweepSpec(object):
+    def __init__(
+        self,
+        fontpath,
+        outdir,
+        axes,
+        compression=None,
+        flavors=None,
+        optimize=None,
+        subset=None,
+    ):
+        self.fontpath = fontpath
+        self.outdir = outdir
+        # map of "axis_tag": list of values or {"start", "stop", "step"} range
+        self.axes = axes
+        # WOFF/WOFF2 CompressionProfile, None = default profile
+        self.compression = compression
+        # list of OUTPUT_FLAVORS names, None = source font flavor
+        self.flavors = flavors
+        # OPTIMIZE_LEVELS name, None = full optimization
+        self.optimize = optimize
+        # GlyphSubset of the instances, None = all glyphs
+        self.subset = subset
+
+    def get_log_path(self):
+        return str(Path(self.outdir) / SWEEP_LOG_NAME)
+
+
+def load_sweep_spec(specpath):
+    """Returns a SweepSpec from a JSON sweep spec file.  Relative
+    paths are resolved from the sweep spec file directory."""
+    specpath = Path(specpath)
+    with open(specpath) as f:
+        spec = json.load(f)
+
+    spec_dir = specpath.parent
+    compression_data = spec.get("compression")
+    subset_data = spec.get("subset")
+    return SweepSpec(
+        str(spec_dir / spec["font"]),
+        str(spec_dir / spec["outdir"]),
+        spec["axes"],
+        compression=CompressionProfile(**compression_data)
+        if compression_data
+        else None,
+        flavors=spec.get("flavors"),
+        optimize=spec.get("optimize"),
+        subset=GlyphSubset(**subset_data) if subset_data else None,
+    )
+
+
+def expand_axis_values(axistag, definition):
+    """Returns the list of axis values in a sweep axis definition."""
+    if isinstance(definition, dict):
+        try:
+            start = float(definition["start"])
+            stop = float(definition["stop"])
+            step = float(definition["step"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(
+                f"The {axistag} sweep range requires numeric start, stop, and "
+                f"step values."
+            )
+        if step <= 0:
+            raise ValueError(f"The {axistag} sweep step must be greater than zero.")
+        # the count avoids accumulated float error at the inclusive stop
+        count = int((stop - start) / step + 1e-9) + 1
+        # the rounding removes the float error of decimal steps, e.g., 0.1 * 3
+        # is 0.30000000000000004, which would be in the file name
+        return [round(start + step * x, 10) for x in range(max(count, 0))]
+
+    try:
+        return [float(value) for value in definition]
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"The {axistag} sweep values must be a list of numbers or a "
+            f"start, stop, and step range."
+        )
+
+
+def get_location_key(location, fvar_axes, avar_segments):
+    """Returns the F2Dot14 normalized coordinates of a location, the
+    design space position that the instancer uses."""
+    key = []
+    for axistag, value in sorted(location.items()):
+        normalized = normalizeValue(value, fvar_axes[axistag])
+        if axistag in avar_segments:
+            normalized = piecewiseLinearMap(normalized, avar_segments[axistag])
+        key.append((axistag, otRound(normalized * (1 << 14))))
+    return tuple(key)
+
+
+def iter_sweep_locations(sweep, inspector):
+    """Generator that yields the unique clamped locations of a sweep as
+    maps of "axis_tag": float location in sweep axis order."""
+    fvar_axes = {
+        axis.axisTag: (axis.minValue, axis.defaultValue, axis.maxValue)
+        for axis in inspector.get_fvar_table().axes
+    }
+    avar_segments = (
+        inspector.get_table("avar").segments if "avar" in inspector.reader else {}
+    )
+    axis_values = []
+    for axistag, definition in sweep.axes.items():
+        if axistag not in fvar_axes:
+            raise ValueError(f"'{axistag}' is not an axis in {sweep.fontpath}.")
+        minimum, _, maximum = fvar_axes[axistag]
+        values = [
+            min(max(value, minimum), maximum)
+            for value in expand_axis_values(axistag, definition)
+        ]
+        if not values:
+            raise ValueError(f"The {axistag} sweep does not define axis values.")
+        axis_values.append(values)
+
+    seen = set()
+    for values in itertools.product(*axis_values):
+        location = dict(zip(sweep.axes, values))
+        key = get_location_key(location, fvar_axes, avar_segments)
+        if key not in seen:
+            seen.add(key)
+            yield location
+
+
+def format_axis_value(value):
+    """Returns the shortest string that round-trips to the axis value so
+    that distinct sweep locations do not share a file name, e.g., 300 or
+    300.0000001 (the 'g' format rounds to 6 significant digits)."""
+    short = f"{value:g}"
+    return short if float(short) == value else repr(float(value))
+
+
+def get_sweep_outpath(sweep, location):
+    """Returns the instance file path for a sweep location,
+    e.g., OUTDIR/Recursive-VF-wght300-CASL0.5.ttf"""
+    fontpath = Path(sweep.fontpath)
+    location_string = "-".join(
+        f"{axistag}{format_axis_value(value)}" for axistag, value in location.items()
+    )
+    return str(
+        Path(sweep.outdir) / f"{fontpath.stem}-{location_string}{fontpath.suffix}"
+    )
+
+
+def load_completed_outpaths(logpath):
+    """Returns the set of out paths that a sweep results log records as
+    successfully written and that exist on disk."""
+    return {
+        outpath
+        for event in read_telemetry_log(logpath)
+        if event.get("status") == "ok"
+        for outpath in event.get("outpaths", [])
+        if os.path.isfile(outpath)
+    }
+
+
+def iter_sweep_jobs(sweep, completed=None):
+    """Generator that yields a SliceJob for each unique sweep location.
+    Jobs with all of their out paths in the completed set are skipped."""
+    completed = completed if completed else set()
+    inspector = FontInspector(sweep.fontpath)
+    sfnt_version = read_sfnt_version(sweep.fontpath)
+    for location in iter_sweep_locations(sweep, inspector):
+        job = SliceJob(
+            sweep.fontpath,
+            get_sweep_outpath(sweep, location),
+            location,
+            compression=sweep.compression,
+            flavors=sweep.flavors,
+            optimize=sweep.optimize if sweep.optimize else "full",
+            subset=sweep.subset,
+        )
+        if job.flavors:
+            outpaths = [outpath for outpath, _ in job.get_outputs(sfnt_version)]
+        else:
+            outpaths = [job.outpath]
+        if not all(outpath in completed for outpath in outpaths):
+            yield job
@@ -0,0 +1,142 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+# Structured instance job telemetry events and the JSON-lines event log.
+# This module must not import PyQt5.
+
+import json
+import os
+import sys
+import threading
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+
+def get_peak_rss():
+    """Returns the peak resident set size in bytes over the lifetime of the
+    current process, or None on platforms that do not report it.  It is
+    not a per-job measure: a job reports the largest peak of the jobs that
+    the process executed before it."""
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def get_output_sizes(outpaths):
+    return {
+        outpath: os.path.getsize(outpath)
+        for outpath in outpaths
+        if os.path.isfile(outpath)
+    }
+
+
+def get_telemetry_event(
+    fontpath, outpaths, timings, process_peak_rss=None, cached=False, error=None
+):
+    """Returns a JSON serializable dict that describes one instance job."""
+    return {
+        "time": datetime.now(timezone.utc).isoformat(),
+        "font": str(fontpath),
+        # source font file size in bytes for job time estimates
+        "font_size": os.path.getsize(fontpath) if os.path.isfile(fontpath) else None,
+        "outpaths": [str(outpath) for outpath in outpaths],
+        "status": "error" if error else "ok",
+        "error": str(error) if error else None,
+        "cached": cached,
+        # ordered map of "stage": seconds
+        "timings": dict(timings),
+        "total_time": sum(timings.values()),
+        # lifetime peak RSS of the process that executed the job
+        "process_peak_rss": process_peak_rss,
+        # map of "outpath": bytes, empty for failed jobs
+        "output_sizes": get_output_sizes(outpaths) if not error else {},
+    }
+
+
+def read_telemetry_log(logpath):
+    """Generator that yields the events in a TelemetryLog file.  Missing or
+    unreadable logs have no events and partial lines are skipped."""
+    try:
+        f = open(logpath, encoding="utf-8")
+    except (OSError, TypeError):
+        return
+    with f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # partial line from an interrupted write
+                continue
+
+
+def read_telemetry_tail(logpath, count, block_size=64 * 1024):
+    """Returns the events in the last count lines of a TelemetryLog file.
+    The file is read in blocks from the end so that the read time does not
+    grow with the log size.  Missing or unreadable logs have no events and
+    partial lines are skipped."""
+    try:
+        f = open(logpath, "rb")
+    except (OSError, TypeError):
+        return []
+    with f:
+        position = f.seek(0, os.SEEK_END)
+        data = b""
+        # count + 1 line breaks delimit the last count complete lines
+        while position > 0 and data.count(b"\n") <= count:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            data = f.read(size) + data
+    lines = data.splitlines()
+    if position > 0:
+        # the first line starts before the blocks that were read
+        lines = lines[1:]
+    events = []
+    for line in lines[-count:]:
+        try:
+            events.append(json.loads(line))
+        except ValueError:
+            # partial line from an interrupted write
+            continue
+    return events
+
+
+class TelemetryLog(object):
+    """Appends telemetry events to a JSON-lines file, one event per line.
+    A log with a max_size in bytes is rotated to a single LOGPATH.1 backup
+    file when it exceeds the size, None = the log is not rotated."""
+
+    def __init__(self, logpath, max_size=None):
+        self.logpath = logpath
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    def write(self, event):
+        # keys are not sorted to retain the stage order
+        line = json.dumps(event)
+        # single appended lines do not interleave across processes
+        with self._lock:
+            with open(self.logpath, "a", encoding="utf-8") as f:
+                f.write(f"{line}\n")
+                size = f.tell()
+            if self.max_size is not None and size > self.max_size:
+                os.replace(self.logpath, f"{self.logpath}.1")
@@ -14,7 +14,7 @@
 #    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
 from fontTools import __version__ as fonttools_version
 from PyQt5.QtCore import QDir, Qt
-from PyQt5.QtGui import QFont, QFontDatabase, QIcon, QImage, QPixmap
+from PyQt5.QtGui import QIcon, QImage, QPixmap
 from PyQt5.QtWidgets import (
     QDesktopWidget,
     QDialog,
@@ -29,6 +29,7 @@ from PyQt5.QtWidgets import (
 )
 
 from ..imageresources import *
+from .fonts import get_recursive_font
 
 
 class SliceOpenFileDialog(QFileDialog):
@@ -87,6 +88,29 @@ class SliceSaveFileDialog(QFileDialog):
         return self.file_path
 
 
+class SliceOpenDirectoryDialog(QFileDialog):
+    def __init__(self, root_directory=None):
+        QFileDialog.__init__(self)
+        self.directory_path = None
+        self.root_directory = root_directory if root_directory else QDir.homePath()
+
+        self.setWindowTitle("Select Directory")
+        self.setWindowIcon(QIcon(":/img/slice-icon.svg"))
+
+        directory_path = self.getExistingDirectory(
+            self,
+            "Select Directory",
+            self.root_directory,
+            options=self.Options() | QFileDialog.ShowDirsOnly,
+        )
+
+        if directory_path:
+            self.directory_path = directory_path
+
+    def get_directory_path(self):
+        return self.directory_path
+
+
 class SliceAboutDialog(QDialog):
     def __init__(self, version):
         QDialog.__init__(self)
@@ -109,9 +133,7 @@ class SliceAboutDialog(QDialog):
 
         title = QLabel("Slice")
 
-        recursive_id = QFontDatabase.addApplicationFont(":/font/RecursiveSans.ttf")
-        font_family = QFontDatabase.applicationFontFamilies(recursive_id)[0]
-        recursive = QFont(font_family)
+        recursive = get_recursive_font()
         recursive.setPointSize(30)
         title.setFont(recursive)
 
@@ -165,7 +187,7 @@ class SliceAboutDialog(QDialog):
 
 
 class SliceProgressDialog(QWidget):
-    def __init__(self, close_signal):
+    def __init__(self, close_signal, progress_signal=None):
         QWidget.__init__(self)
 
         layout = QVBoxLayout()
@@ -185,8 +207,19 @@ class SliceProgressDialog(QWidget):
 
         self.setLayout(layout)
         close_signal.connect(self.close_progress_dialog)
+        # the bar is indeterminate until the first progress report
+        if progress_signal is not None:
+            progress_signal.connect(self.update_progress)
         self.show()
 
+    def update_progress(self, report):
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(report["percent"])
+        message = f"Slicing: {report['message']}"
+        if report["eta"] is not None:
+            message += f" (about {report['eta']:.0f} s left)"
+        self.message.setText(message)
+
     def close_progress_dialog(self):
         self.message.setText("Complete")
         self.progress_bar.setRange(0, 1)
@@ -0,0 +1,43 @@
+# This file is part of Slice.
+#
+#    Slice is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Slice is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+from PyQt5.QtGui import QFont, QFontDatabase
+
+# UI font files are package data (and PyInstaller bundle data)
+UI_FONT_DIR = Path(__file__).resolve().parent.parent / "resources" / "fonts"
+
+# map of font file name : registered font family name
+_ui_font_families = {}
+
+
+def get_ui_font(filename):
+    """Returns a QFont for an application UI font file.  The file is read and
+    registered with the QFontDatabase on the first request, not at import."""
+    if filename not in _ui_font_families:
+        font_id = QFontDatabase.addApplicationFont(str(UI_FONT_DIR / filename))
+        if font_id == -1:
+            raise IOError(f"Unable to load the UI font {UI_FONT_DIR / filename}")
+        _ui_font_families[filename] = QFontDatabase.applicationFontFamilies(font_id)[0]
+    return QFont(_ui_font_families[filename])
+
+
+def get_recursive_font():
+    return get_ui_font("RecursiveSans-Slice_mod.subset.ttf")
+
+
+def get_ibmplex_mono_font():
+    return get_ui_font("IBMPlexMono-Regular.ttf")
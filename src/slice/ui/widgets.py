@@ -13,7 +13,23 @@
 #    You should have received a copy of the GNU General Public License
 #    along with Slice.  If not, see <https://www.gnu.org/licenses/>.
 
-from PyQt5.QtWidgets import QLineEdit, QSizePolicy
+import time
+
+from fontTools.pens.qtPen import QtPen
+from PyQt5.QtCore import QRectF, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QPainter, QPainterPath
+from PyQt5.QtWidgets import (
+    QLineEdit,
+    QSizePolicy,
+    QStyledItemDelegate,
+    QWidget,
+)
+
+from ..previewworker import PreviewInstanceWorker
+
+# axis editor changes are collected for this interval
+# before the preview outlines are rebuilt
+PREVIEW_DEBOUNCE_MS = 20
 
 
 class DragDropLineEdit(QLineEdit):
@@ -42,3 +58,154 @@ class DragDropLineEdit(QLineEdit):
         self.setText(file_path)
         # call the parent method to load font on UI
         self.parent.load_font(file_path)
+
+
+class AxisValueDelegate(QStyledItemDelegate):
+    """Axis editor item delegate that reports the editor text
+    as it is typed, before the value is committed to the model."""
+
+    # returns the model row and the editor text
+    valueEdited = pyqtSignal(int, str)
+    # returns the model row when the editor closes
+    editingFinished = pyqtSignal(int)
+
+    def createEditor(self, parent, option, index):
+        editor = super().createEditor(parent, option, index)
+        if isinstance(editor, QLineEdit):
+            row = index.row()
+            editor.textEdited.connect(lambda text: self.valueEdited.emit(row, text))
+            editor.destroyed.connect(lambda: self.editingFinished.emit(row))
+        return editor
+
+
+class PreviewWidget(QWidget):
+    """Renders a line of sample text with a PreviewFont at an axis location.
+    Location and text changes are debounced and the glyph outlines are
+    built one time per change, paint events only draw the built path.
+    With use_instance, the text is drawn from a preview instance of the
+    FontModel font that holds the instancer outlines of the sample glyphs.
+    The instances are built one at a time by a PreviewInstanceWorker, the
+    changes during a build are built when it finishes."""
+
+    def __init__(self, *args):
+        QWidget.__init__(self, *args)
+        self.preview_font = None
+        # FontModel of the preview instances.  The FontSession is requested
+        # per build so that a modified font file is parsed again
+        self.font_model = None
+        self.use_instance = False
+        # PreviewFont of the last outline build
+        self.drawn_font = None
+        self.text = ""
+        # map of "axis_tag": float location
+        self.location = {}
+        self.path = QPainterPath()
+        # advance width of the text in font units
+        self.advance = 0
+        # seconds spent on the last outline build
+        self.build_time = 0.0
+        # PreviewInstanceWorker of the instance build in progress
+        self.instance_worker = None
+        # incremented on each build so that the instance of an outdated
+        # text or location is built again
+        self._build_count = 0
+        self._build_start = 0.0
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self.timer.timeout.connect(self.build_path)
+        self.setMinimumHeight(90)
+        self.setSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.Fixed)
+
+    def set_preview_font(self, preview_font):
+        self.preview_font = preview_font
+        self.schedule_update()
+
+    def set_font_model(self, font_model):
+        self.font_model = font_model
+        self.schedule_update()
+
+    def set_use_instance(self, use_instance):
+        self.use_instance = use_instance
+        self.schedule_update()
+
+    def set_text(self, text):
+        self.text = text
+        self.schedule_update()
+
+    def set_location(self, location):
+        self.location = location
+        self.schedule_update()
+
+    def schedule_update(self):
+        # restarts the interval on each change
+        self.timer.start()
+
+    def build_path(self):
+        self._build_count += 1
+        self._build_start = time.perf_counter()
+        if (
+            self.preview_font is not None
+            and self.text
+            and self.use_instance
+            and self.font_model is not None
+        ):
+            if self.instance_worker is None:
+                self.start_instance_worker()
+            return
+        self.draw_path(self.preview_font, self.location)
+
+    def start_instance_worker(self):
+        self.instance_worker = PreviewInstanceWorker(
+            self.font_model, self.text, self.location
+        )
+        self.instance_worker.build_count = self._build_count
+        self.instance_worker.signals.result.connect(self._instance_worker_result)
+        QThreadPool.globalInstance().start(self.instance_worker)
+
+    def _instance_worker_result(self, instance_font):
+        worker, self.instance_worker = self.instance_worker, None
+        if worker is None or worker.build_count != self._build_count:
+            # the text, location or font changed during the build
+            self.build_path()
+            return
+        # the instance is static, it is drawn at the default location
+        self.draw_path(instance_font, {})
+
+    def draw_path(self, font, location):
+        path = QPainterPath()
+        # TrueType outlines use the non-zero winding rule
+        path.setFillRule(Qt.WindingFill)
+        pen = QtPen(None, path=path)
+        self.advance = 0
+        try:
+            if font is not None and self.text:
+                self.advance = font.draw_text(self.text, location, pen)
+        except Exception:
+            # an exception in a Qt slot aborts the application, a location
+            # that can not be drawn clears the preview
+            font = None
+            self.advance = 0
+            pen = QtPen(None, path=QPainterPath())
+        self.drawn_font = font
+        self.path = pen.path
+        self.build_time = time.perf_counter() - self._build_start
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), self.palette().base())
+        if self.drawn_font is None or self.path.isEmpty():
+            painter.end()
+            return
+        margin = 10
+        font = self.drawn_font
+        line_height = font.ascender - font.descender
+        scale = (self.height() - 2 * margin) / line_height
+        painter.setClipRect(QRectF(self.rect()))
+        painter.translate(margin, margin + font.ascender * scale)
+        # font units are y-up
+        painter.scale(scale, -scale)
+        painter.fillPath(self.path, self.palette().text())
+        painter.end()
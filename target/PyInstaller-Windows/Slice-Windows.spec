@@ -33,7 +33,7 @@ block_cipher = None
 a = Analysis([Path(MAIN_MODULE_PATH).resolve()],
              pathex=[Path('target/PyInstaller-Windows').resolve()],
              binaries=[],
-             datas=[],
+             datas=[(str(Path("src/slice/resources/fonts").resolve()), "slice/resources/fonts")],
              hiddenimports=[],
              hookspath=[],
              runtime_hooks=[],
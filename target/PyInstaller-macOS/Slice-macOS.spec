@@ -38,7 +38,7 @@ block_cipher = None
 a = Analysis([Path(MAIN_MODULE_PATH).resolve()],
              pathex=[Path('target/PyInstaller-macOS').resolve()],
              binaries=[],
-             datas=[],
+             datas=[(str(Path("src/slice/resources/fonts").resolve()), "slice/resources/fonts")],
              hiddenimports=[],
              excludes=[],
              win_no_prefer_redirects=False,
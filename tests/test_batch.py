@@ -0,0 +1,145 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from fontTools.ttLib import TTFont
+
+from slice import batch
+from slice.batch import get_process_session, run_jobs
+from slice.engine import SliceJob, SliceResult
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def get_jobs(tmpdir):
+    return [
+        SliceJob(
+            get_font_path(),
+            str(tmpdir.join(f"test-{weight}-{casual}.ttf")),
+            {"wght": float(weight), "CASL": float(casual)},
+        )
+        for weight in (300, 600, 900)
+        for casual in (0, 1)
+    ]
+
+
+def test_get_process_session_is_resident():
+    session = get_process_session(get_font_path())
+    assert get_process_session(get_font_path()) is session
+    assert batch._process_sessions[get_font_path()] is session
+
+
+def test_get_process_session_reparses_modified_fonts(tmpdir, monkeypatch):
+    monkeypatch.setattr(batch, "_process_sessions", {})
+    fontpath = tmpdir.join("test.ttf")
+    fontpath.write_binary(Path(get_font_path()).read_bytes())
+    session = get_process_session(str(fontpath))
+    fontpath.write_binary(Path(get_font_path()).read_bytes() + b"\0")
+    assert get_process_session(str(fontpath)) is not session
+
+
+def test_get_process_session_releases_least_recently_used(tmpdir, monkeypatch):
+    monkeypatch.setattr(batch, "_process_sessions", {})
+    monkeypatch.setattr(batch, "MAX_PROCESS_SESSIONS", 2)
+    fontpaths = []
+    for name in ("a.ttf", "b.ttf", "c.ttf"):
+        fontpaths.append(str(tmpdir.join(name)))
+        tmpdir.join(name).write_binary(Path(get_font_path()).read_bytes())
+    get_process_session(fontpaths[0])
+    get_process_session(fontpaths[1])
+    get_process_session(fontpaths[0])
+    get_process_session(fontpaths[2])
+    assert list(batch._process_sessions) == [fontpaths[0], fontpaths[2]]
+
+
+def test_run_jobs_process_pool(tmpdir):
+    jobs = get_jobs(tmpdir)
+    completed = list(run_jobs(jobs, max_workers=2))
+    assert len(completed) == len(jobs)
+    for job, result, error in completed:
+        assert error is None
+        assert type(result) is SliceResult
+        assert result.outpath == job.outpath
+        axis_tags = [axis.axisTag for axis in TTFont(job.outpath)["fvar"].axes]
+        assert "wght" not in axis_tags
+        assert "CASL" not in axis_tags
+
+
+def test_run_jobs_serial(tmpdir):
+    jobs = get_jobs(tmpdir)[:2]
+    completed = list(run_jobs(jobs, max_workers=1))
+    assert [job for job, _, _ in completed] == jobs
+    assert all(error is None for _, _, error in completed)
+
+
+def test_run_jobs_reports_errors(tmpdir):
+    jobs = get_jobs(tmpdir)[:1] + [
+        SliceJob(get_font_path(), str(tmpdir.join("fail.ttf")), {"wdth": 100.0})
+    ]
+    completed = list(run_jobs(jobs, max_workers=2))
+    errors = [(job, error) for job, _, error in completed if error]
+    assert len(errors) == 1
+    assert errors[0][0].outpath == str(tmpdir.join("fail.ttf"))
+    assert type(errors[0][1]) is ValueError
+
+
+def test_run_jobs_on_start(tmpdir):
+    jobs = get_jobs(tmpdir)
+    started = []
+    completed = []
+    for job, _, error in run_jobs(jobs, max_workers=2, on_start=started.append):
+        assert error is None
+        completed.append(job)
+        # at most max_workers jobs execute at one time
+        assert len(started) - len(completed) <= 2
+    assert sorted(started, key=jobs.index) == jobs
+    assert len(completed) == len(jobs)
+
+
+def test_run_jobs_close_skips_queued_jobs(tmpdir):
+    jobs = get_jobs(tmpdir)
+    started = []
+    generator = run_jobs(jobs, max_workers=2, on_start=started.append)
+    next(generator)
+    generator.close()
+    assert len(started) == 3
+    assert not os.path.exists(jobs[-1].outpath)
+
+
+def test_run_jobs_lazy_iterable(tmpdir):
+    jobs = get_jobs(tmpdir)
+    read = []
+
+    def iter_jobs():
+        for job in jobs:
+            read.append(job)
+            yield job
+
+    generator = run_jobs(iter_jobs(), max_workers=2)
+    next(generator)
+    # jobs are read as the pool requests them
+    assert len(read) < len(jobs)
+    assert len(list(generator)) == len(jobs) - 1
+    assert list(run_jobs(iter([]), max_workers=2)) == []
+
+
+def test_run_jobs_is_canceled(tmpdir):
+    jobs = get_jobs(tmpdir)
+    completed = []
+    for job, result, error in run_jobs(
+        jobs, max_workers=1, is_canceled=lambda: len(completed) == 2
+    ):
+        completed.append(job)
+    assert completed == jobs[:2]
+    assert not os.path.exists(jobs[2].outpath)
+
+
+def test_run_jobs_executor(tmpdir):
+    jobs = get_jobs(tmpdir)[:4]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        completed = list(run_jobs(jobs, max_workers=2, executor=executor))
+        assert [error for _, _, error in completed] == [None] * len(jobs)
+        # the long-lived pool is not shut down
+        assert executor.submit(os.getpid).result() != os.getpid()
@@ -0,0 +1,113 @@
+import json
+from pathlib import Path
+
+from fontTools.ttLib import TTFont
+from PyQt5.QtCore import pyqtBoundSignal
+
+from slice.batchworker import BatchWorker, BatchWorkerSignals
+from slice.engine import SliceJob, SliceResult
+from slice.telemetry import TelemetryLog
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def get_queue_jobs(tmpdir, count=4):
+    # queue rows are not required to start at 0
+    return [
+        (
+            row + 10,
+            SliceJob(
+                get_font_path(),
+                str(tmpdir.join(f"instance-{row}.ttf")),
+                {"wght": 300.0 + 100 * row},
+            ),
+        )
+        for row in range(count)
+    ]
+
+
+def run_batch_worker(worker):
+    emitted = {"started": [], "result": [], "error": [], "finished": 0}
+    worker.signals.started.connect(emitted["started"].append)
+    worker.signals.result.connect(
+        lambda row, result: emitted["result"].append((row, result))
+    )
+    worker.signals.error.connect(
+        lambda row, error: emitted["error"].append((row, error))
+    )
+
+    def finished():
+        emitted["finished"] += 1
+
+    worker.signals.finished.connect(finished)
+    worker.run()
+    return emitted
+
+
+def test_batch_worker_signals_instantiation():
+    bws = BatchWorkerSignals()
+    assert type(bws.finished) is pyqtBoundSignal
+    assert type(bws.started) is pyqtBoundSignal
+    assert type(bws.error) is pyqtBoundSignal
+    assert type(bws.result) is pyqtBoundSignal
+
+
+def test_batch_worker_run(tmpdir):
+    jobs = get_queue_jobs(tmpdir)
+    logpath = str(tmpdir.join("telemetry.jsonl"))
+    worker = BatchWorker(jobs, max_workers=2, telemetry_log=TelemetryLog(logpath))
+    emitted = run_batch_worker(worker)
+    assert emitted["finished"] == 1
+    assert emitted["error"] == []
+    assert sorted(emitted["started"]) == [10, 11, 12, 13]
+    assert sorted(row for row, _ in emitted["result"]) == [10, 11, 12, 13]
+    for row, result in emitted["result"]:
+        assert type(result) is SliceResult
+        assert result.outpath == dict(jobs)[row].outpath
+        assert "wght" not in [
+            axis.axisTag for axis in TTFont(result.outpath)["fvar"].axes
+        ]
+    with open(logpath) as f:
+        events = [json.loads(line) for line in f]
+    assert len(events) == 4
+    assert all(event["status"] == "ok" for event in events)
+
+
+def test_batch_worker_error(tmpdir):
+    jobs = get_queue_jobs(tmpdir, 1) + [
+        (20, SliceJob(get_font_path(), str(tmpdir.join("fail.ttf")), {"wdth": 100.0}))
+    ]
+    emitted = run_batch_worker(BatchWorker(jobs, max_workers=1))
+    assert [row for row, _ in emitted["result"]] == [10]
+    assert len(emitted["error"]) == 1
+    assert emitted["error"][0][0] == 20
+    assert "wdth" in emitted["error"][0][1]
+    assert emitted["finished"] == 1
+
+
+def test_batch_worker_cancel(tmpdir):
+    jobs = get_queue_jobs(tmpdir)
+    worker = BatchWorker(jobs, max_workers=1)
+    # stop the queue after the first job
+    worker.signals.result.connect(lambda row, result: worker.cancel())
+    emitted = run_batch_worker(worker)
+    assert emitted["started"] == [10]
+    assert [row for row, _ in emitted["result"]] == [10]
+    assert emitted["finished"] == 1
+    assert not Path(jobs[1][1].outpath).exists()
+
+
+def test_batch_worker_cancel_pooled(tmpdir):
+    jobs = get_queue_jobs(tmpdir, count=6)
+    worker = BatchWorker(jobs, max_workers=2)
+    worker.signals.result.connect(lambda row, result: worker.cancel())
+    emitted = run_batch_worker(worker)
+    # every started job reports its result, no job starts after the cancel
+    assert len(emitted["started"]) < len(jobs)
+    assert sorted(row for row, _ in emitted["result"]) == sorted(emitted["started"])
+    assert emitted["error"] == []
+    assert emitted["finished"] == 1
+    for row, job in jobs:
+        assert Path(job.outpath).exists() is (row in emitted["started"])
@@ -0,0 +1,163 @@
+import os
+from pathlib import Path
+
+from fontTools.ttLib import TTFont
+
+from slice.cache import InstanceCache, hash_file, normalize_axis_data
+from slice.compression import CompressionProfile
+from slice.engine import SliceJob, run_job
+from slice.fontsession import FontSession
+from slice.glyphsubset import GlyphSubset
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def get_cache_key(
+    cache, axis_data, flavor=None, compression=None, optimize="full", subset=None
+):
+    return cache.get_key(
+        "abc123",
+        axis_data,
+        {},
+        {"bit0": False},
+        {"bit0": False},
+        flavor,
+        compression,
+        optimize,
+        subset,
+    )
+
+
+def test_hash_file_matches_session_hash():
+    assert hash_file(get_font_path()) == FontSession(get_font_path()).source_hash
+
+
+def test_normalize_axis_data():
+    assert normalize_axis_data({"wght": 700, "slnt": (0, -15)}) == {
+        "wght": 700.0,
+        "slnt": [-15.0, 0.0],
+    }
+
+
+def test_cache_key_normalization(tmpdir):
+    cache = InstanceCache(str(tmpdir))
+    key = get_cache_key(cache, {"wght": 700, "slnt": [0, -15]})
+    assert key == get_cache_key(cache, {"slnt": (-15.0, 0.0), "wght": 700.0})
+    assert key != get_cache_key(cache, {"wght": 701, "slnt": [0, -15]})
+    assert key != get_cache_key(cache, {"wght": 700, "slnt": [0, -15]}, "woff2")
+    assert key != get_cache_key(
+        cache, {"wght": 700, "slnt": [0, -15]}, None, CompressionProfile("zlib-9")
+    )
+    assert key != get_cache_key(
+        cache, {"wght": 700, "slnt": [0, -15]}, None, None, "none"
+    )
+    subset_key = get_cache_key(
+        cache, {"wght": 700, "slnt": [0, -15]}, subset=GlyphSubset("U+0061-0062")
+    )
+    assert key != subset_key
+    assert subset_key == get_cache_key(
+        cache, {"wght": 700, "slnt": [0, -15]}, subset=GlyphSubset([0x62, 0x61])
+    )
+
+
+def test_cache_fetch_and_store(tmpdir):
+    cache = InstanceCache(os.path.join(str(tmpdir), "cache"))
+    source = os.path.join(str(tmpdir), "source.bin")
+    outpath = os.path.join(str(tmpdir), "out.bin")
+    with open(source, "wb") as f:
+        f.write(b"instance data")
+
+    assert cache.fetch("key", outpath) is False
+    assert not os.path.exists(outpath)
+    cache.store("key", source)
+    assert cache.contains("key")
+    assert cache.fetch("key", outpath) is True
+    with open(outpath, "rb") as f:
+        assert f.read() == b"instance data"
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+    assert stats["size"] == len(b"instance data")
+
+
+def test_cache_lru_eviction(tmpdir):
+    cache = InstanceCache(os.path.join(str(tmpdir), "cache"), max_size=25)
+    source = os.path.join(str(tmpdir), "source.bin")
+    outpath = os.path.join(str(tmpdir), "out.bin")
+    with open(source, "wb") as f:
+        f.write(b"0123456789")
+
+    cache.store("a", source)
+    cache.store("b", source)
+    # define an explicit use order, "b" is least recently used
+    os.utime(cache.get_path("b"), (1, 1))
+    os.utime(cache.get_path("a"), (2, 2))
+    cache.store("c", source)
+
+    assert cache.contains("a")
+    assert not cache.contains("b")
+    assert cache.contains("c")
+    assert cache.fetch("b", outpath) is False
+    assert cache.get_stats()["size"] <= 25
+
+
+def test_run_job_cache_hit(tmpdir):
+    cache = InstanceCache(os.path.join(str(tmpdir), "cache"))
+    outpath = os.path.join(str(tmpdir), "Recursive-Bold.ttf")
+    job = SliceJob(get_font_path(), outpath, {"wght": 700.0, "slnt": 0.0})
+
+    result = run_job(job, cache=cache)
+    assert result.cached is False
+    assert "instance" in result.timings
+    assert cache.get_stats()["entries"] == 1
+    os.remove(outpath)
+
+    result = run_job(job, cache=cache)
+    assert result.cached is True
+    assert list(result.timings) == ["cache"]
+    assert cache.hits == 1
+    assert cache.misses == 1
+    axis_tags = [axis.axisTag for axis in TTFont(outpath)["fvar"].axes]
+    assert "wght" not in axis_tags
+
+
+def test_run_job_cache_multiple_flavors(tmpdir):
+    cache = InstanceCache(os.path.join(str(tmpdir), "cache"))
+    outpath = os.path.join(str(tmpdir), "Recursive-Bold.ttf")
+    job = SliceJob(
+        get_font_path(),
+        outpath,
+        {"wght": 700.0, "slnt": 0.0},
+        flavors=["ttf", "woff"],
+    )
+    session = FontSession(get_font_path())
+
+    result = run_job(job, session, cache)
+    assert result.cached is False
+    assert cache.get_stats()["entries"] == 2
+
+    # the session and sessionless cache keys match
+    result = run_job(job, cache=cache)
+    assert result.cached is True
+    assert sorted(result.outpaths) == sorted(
+        os.path.join(str(tmpdir), f"Recursive-Bold.{ext}") for ext in ("ttf", "woff")
+    )
+    assert TTFont(result.outpaths[1]).flavor == "woff"
+
+
+def test_run_job_cache_miss_on_changed_names(tmpdir):
+    cache = InstanceCache(os.path.join(str(tmpdir), "cache"))
+    outpath = os.path.join(str(tmpdir), "Recursive-Bold.ttf")
+    job = SliceJob(get_font_path(), outpath, {"wght": 700.0, "slnt": 0.0})
+    run_job(job, cache=cache)
+
+    job.name_data = {"nameID1": "Recursive Bold"}
+    result = run_job(job, cache=cache)
+    assert result.cached is False
+    assert TTFont(outpath)["name"].getName(1, 3, 1, 1033).toUnicode() == (
+        "Recursive Bold"
+    )
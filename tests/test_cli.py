@@ -0,0 +1,302 @@
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+from fontTools.ttLib import TTFont
+import pytest
+
+from slice import batch
+from slice.cli import main
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def test_cli_single_instance(tmpdir, capsys):
+    outpath = str(tmpdir.join("test.ttf"))
+    exit_code = main(
+        [
+            get_font_path(),
+            "-o",
+            outpath,
+            "--axis",
+            "wght=700",
+            "--axis",
+            "slnt=-15:0",
+            "--name",
+            "1=Slice Test",
+            "--os2-bit",
+            "5",
+        ]
+    )
+    assert exit_code == 0
+    # per-instance timing report
+    stdout = capsys.readouterr().out
+    assert outpath in stdout
+    assert "instance" in stdout
+    assert "total" in stdout
+
+    ttfont = TTFont(outpath)
+    assert "wght" not in [axis.axisTag for axis in ttfont["fvar"].axes]
+    assert ttfont["name"].getName(1, 3, 1, 1033).toUnicode() == "Slice Test"
+
+
+def test_cli_spec(tmpdir):
+    specpath = tmpdir.join("jobs.json")
+    specpath.write(
+        '{"font": "%s", "instances": ['
+        '{"outpath": "a.ttf", "axes": {"wght": 400}},'
+        '{"outpath": "b.ttf", "axes": {"wght": 800}}'
+        "]}" % get_font_path()
+    )
+    assert main(["--spec", str(specpath)]) == 0
+    for outpath in (tmpdir.join("a.ttf"), tmpdir.join("b.ttf")):
+        assert "wght" not in [
+            axis.axisTag for axis in TTFont(str(outpath))["fvar"].axes
+        ]
+
+
+def test_cli_invalid_axis_definition(tmpdir, capsys):
+    outpath = str(tmpdir.join("test.ttf"))
+    # wght default axis value is not in the range
+    assert main([get_font_path(), "-o", outpath, "--axis", "wght=500:700"]) == 1
+    assert "[ERROR]" in capsys.readouterr().err
+    assert not Path(outpath).exists()
+
+
+def test_cli_does_not_import_pyqt5():
+    code = "import sys, slice.cli; sys.exit('PyQt5' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_cli_compression_options(tmpdir):
+    fontpath = str(Path("tests/assets/fonts/Recursive-VF.subset.woff").resolve())
+    sizes = {}
+    for method in ("zlib-fast", "zopfli"):
+        outpath = str(tmpdir.join(f"{method}.woff"))
+        args = [fontpath, "-o", outpath, "--axis", "wght=700"]
+        assert main(args + ["--woff-compression", method]) == 0
+        assert TTFont(outpath).flavor == "woff"
+        sizes[method] = Path(outpath).stat().st_size
+    assert sizes["zopfli"] < sizes["zlib-fast"]
+
+
+def test_cli_invalid_compression_option(tmpdir, capsys):
+    outpath = str(tmpdir.join("test.woff2"))
+    args = [get_font_path(), "-o", outpath, "--axis", "wght=700"]
+    assert main(args + ["--brotli-quality", "20"]) == 1
+    assert "[ERROR]" in capsys.readouterr().err
+
+
+def test_cli_multiple_formats(tmpdir, capsys):
+    outpath = str(tmpdir.join("test.ttf"))
+    args = [get_font_path(), "-o", outpath, "--axis", "wght=700"]
+    assert main(args + ["--format", "woff", "--format", "woff2"]) == 0
+    stdout = capsys.readouterr().out
+    for flavor in ("woff", "woff2"):
+        assert str(tmpdir.join(f"test.{flavor}")) in stdout
+        assert TTFont(str(tmpdir.join(f"test.{flavor}"))).flavor == flavor
+    # the out path is only written when the ttf format is requested
+    assert not Path(outpath).exists()
+
+
+def test_cli_cache(tmpdir, capsys):
+    outpath = str(tmpdir.join("test.ttf"))
+    argv = [
+        get_font_path(),
+        "-o",
+        outpath,
+        "--axis",
+        "wght=700",
+        "--cache-dir",
+        str(tmpdir.join("cache")),
+    ]
+    assert main(argv) == 0
+    assert "cache: 0 hits, 1 misses, 1 entries" in capsys.readouterr().out
+    assert main(argv) == 0
+    out = capsys.readouterr().out
+    assert "(cached)" in out
+    assert "cache: 1 hits, 0 misses, 1 entries" in out
+
+
+def test_cli_telemetry_log(tmpdir):
+    logpath = str(tmpdir.join("telemetry.jsonl"))
+    outpath = str(tmpdir.join("test.ttf"))
+    argv = [get_font_path(), "-o", outpath, "--axis", "wght=700"]
+    assert main(argv + ["--telemetry-log", logpath]) == 0
+    assert main(argv + ["--axis", "bogus=1", "--telemetry-log", logpath]) == 1
+    with open(logpath) as f:
+        events = [json.loads(line) for line in f]
+    assert [event["status"] for event in events] == ["ok", "error"]
+    assert list(events[0]["timings"]) == ["parse", "instance", "names", "bits", "save"]
+    assert events[0]["output_sizes"][outpath] > 0
+
+
+def test_cli_progress(tmpdir, capsys, monkeypatch):
+    # a new process session, resident sessions retain the last instance
+    monkeypatch.setattr(batch, "_process_sessions", {})
+    outpath = str(tmpdir.join("test.ttf"))
+    assert (
+        main([get_font_path(), "-o", outpath, "--axis", "wght=700", "--progress"]) == 0
+    )
+    err = capsys.readouterr().err
+    assert "instance: glyf/gvar" in err
+    assert "[100%] complete" in err
+
+
+def test_cli_named_instances(tmpdir, capsys):
+    outdir = tmpdir.join("instances")
+    assert (
+        main([get_font_path(), "-o", str(outdir), "--named-instances", "-w", "2"]) == 0
+    )
+    outpaths = sorted(Path(str(outdir)).iterdir())
+    assert len(outpaths) == 64
+    ttfont = TTFont(str(outdir.join("RecursiveMonoLnr-LightItalic.ttf")))
+    assert "fvar" not in ttfont
+    assert ttfont["name"].getName(6, 3, 1, 1033).toUnicode() == (
+        "RecursiveMonoLnr-LightItalic"
+    )
+    assert ttfont["name"].getName(2, 3, 1, 1033).toUnicode() == "Italic"
+    assert ttfont["OS/2"].fsSelection & 1
+
+
+def test_cli_named_instances_rejects_axis_data(tmpdir, capsys):
+    with pytest.raises(SystemExit):
+        main(
+            [
+                get_font_path(),
+                "-o",
+                str(tmpdir),
+                "--named-instances",
+                "--axis",
+                "wght=700",
+            ]
+        )
+    assert "--named-instances" in capsys.readouterr().err
+
+
+def test_cli_sweep_resumes(tmpdir, capsys):
+    specpath = tmpdir.join("sweep.json")
+    specpath.write(
+        json.dumps(
+            {
+                "font": get_font_path(),
+                "outdir": "sweep",
+                "axes": {"wght": {"start": 300, "stop": 700, "step": 400}},
+            }
+        )
+    )
+    assert main(["--sweep", str(specpath), "-w", "1"]) == 0
+    outdir = tmpdir.join("sweep")
+    assert outdir.join("Recursive-VF.subset-wght300.ttf").check()
+    assert outdir.join("Recursive-VF.subset-wght700.ttf").check()
+    with open(str(outdir.join("sweep.jsonl"))) as f:
+        assert len(f.readlines()) == 2
+    # an interrupted sweep only executes the missing jobs
+    outdir.join("Recursive-VF.subset-wght700.ttf").remove()
+    capsys.readouterr()
+    assert main(["--sweep", str(specpath), "-w", "1"]) == 0
+    out = capsys.readouterr().out
+    assert "wght700" in out
+    assert "wght300" not in out
+    assert outdir.join("Recursive-VF.subset-wght700.ttf").check()
+    assert main(["--sweep", str(specpath)]) == 0
+    assert "all jobs are complete" in capsys.readouterr().out
+
+
+def test_cli_sweep_streams_jobs(tmpdir, capsys, monkeypatch):
+    specpath = tmpdir.join("sweep.json")
+    specpath.write(
+        json.dumps(
+            {
+                "font": get_font_path(),
+                "outdir": str(tmpdir.join("sweep")),
+                "axes": {"wght": {"start": 300, "stop": 900, "step": 200}},
+            }
+        )
+    )
+    submitted = []
+
+    def run_jobs(jobs, *args, **kwargs):
+        # the sweep is not expanded before the batch starts
+        assert not isinstance(jobs, list)
+        for job, result, error in batch.run_jobs(jobs, *args, **kwargs):
+            submitted.append(job)
+            yield job, result, error
+
+    monkeypatch.setattr("slice.cli.run_jobs", run_jobs)
+    assert main(["--sweep", str(specpath), "-w", "1", "--progress"]) == 0
+    assert len(submitted) == 4
+    err = capsys.readouterr().err
+    assert "[4] jobs complete" in err
+
+
+def test_cli_sweep_rejects_font(tmpdir, capsys):
+    with pytest.raises(SystemExit):
+        main([get_font_path(), "--sweep", str(tmpdir.join("sweep.json"))])
+    assert "--sweep" in capsys.readouterr().err
+
+
+def test_cli_manifest_resumes(tmpdir, capsys):
+    manifest_path = str(tmpdir.join("manifest.jsonl"))
+    outpath = tmpdir.join("test.ttf")
+    argv = [get_font_path(), "-o", str(outpath), "--axis", "wght=700"]
+    assert main(argv + ["--manifest", manifest_path]) == 0
+    with open(manifest_path) as f:
+        states = [json.loads(line)["state"] for line in f]
+    assert states == ["running", "done"]
+    capsys.readouterr()
+    assert main(argv + ["--manifest", manifest_path]) == 0
+    out = capsys.readouterr().out
+    assert "manifest: 1 of 1 jobs are complete" in out
+    assert str(outpath) not in out
+    # a changed output file is re-written from the manifest job spec
+    outpath.write_binary(b"changed")
+    assert main(["--manifest", manifest_path]) == 0
+    assert str(outpath) in capsys.readouterr().out
+    assert "wght" not in [axis.axisTag for axis in TTFont(str(outpath))["fvar"].axes]
+
+
+def test_cli_optimize(tmpdir):
+    sizes = {}
+    for level in ("none", "full"):
+        outpath = str(tmpdir.join(f"{level}.ttf"))
+        argv = [get_font_path(), "-o", outpath, "--axis", "wght=650"]
+        assert main(argv + ["--optimize", level]) == 0
+        sizes[level] = Path(outpath).stat().st_size
+    assert sizes["none"] > sizes["full"]
+
+
+def test_cli_glyph_subset(tmpdir):
+    outpath = str(tmpdir.join("subset.ttf"))
+    argv = [get_font_path(), "-o", outpath, "--axis", "wght=650"]
+    assert main(argv + ["--glyphs", ".notdef"]) == 0
+    assert len(TTFont(outpath).getGlyphOrder()) == 1
+    assert main(argv + ["--unicodes", "U+0061"]) == 0
+    assert list(TTFont(outpath).getBestCmap()) == [0x61]
+
+
+def test_cli_shards(tmpdir):
+    outpath = str(tmpdir.join("shard.ttf"))
+    argv = [get_font_path(), "-o", outpath, "--axis", "wght=650"]
+    argv += ["--shards", "latin,cyrillic", "--shard", "a=U+0061"]
+    assert main(argv + ["--format", "woff2", "--format", "ttf"]) == 0
+    assert tmpdir.join("shard.latin.woff2").check()
+    assert tmpdir.join("shard.a.ttf").check()
+    # the font does not map cyrillic code points
+    assert not tmpdir.join("shard.cyrillic.woff2").check()
+    assert "unicode-range: U+0061;" in tmpdir.join("shard.css").read()
+
+
+def test_cli_invalid_shard(tmpdir, capsys):
+    argv = [get_font_path(), "-o", str(tmpdir.join("shard.ttf"))]
+    assert main(argv + ["--shards", "klingon"]) == 1
+    assert "not a unicode range shard" in capsys.readouterr().err
+
+
+def test_cli_invalid_unicodes(tmpdir, capsys):
+    argv = [get_font_path(), "-o", str(tmpdir.join("subset.ttf"))]
+    assert main(argv + ["--unicodes", "U+ZZZZ"]) == 1
+    assert "not a valid unicode range" in capsys.readouterr().err
@@ -0,0 +1,123 @@
+import threading
+import zlib
+from pathlib import Path
+
+from fontTools.ttLib import TTFont, sfnt, woff2
+import pytest
+
+from slice.compression import CompressionProfile, compression_profile
+from slice.engine import SliceJob, run_job
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def save_flavor(outpath, flavor, profile):
+    ttfont = TTFont(get_font_path())
+    ttfont.flavor = flavor
+    with compression_profile(profile):
+        ttfont.save(outpath)
+    return Path(outpath).stat().st_size
+
+
+def test_compression_profile_default():
+    profile = CompressionProfile()
+    assert profile.woff == "zopfli"
+    assert profile.zopfli_iterations == 15
+    assert profile.brotli_quality == 11
+    assert profile.get_data() == {
+        "woff": "zopfli",
+        "zopfli_iterations": 15,
+        "brotli_quality": 11,
+    }
+
+
+def test_compression_profile_invalid_values():
+    with pytest.raises(ValueError):
+        CompressionProfile(woff="gzip")
+    with pytest.raises(ValueError):
+        CompressionProfile(zopfli_iterations=0)
+    with pytest.raises(ValueError):
+        CompressionProfile(brotli_quality=12)
+
+
+def test_compression_profile_context_restores_globals():
+    saved_compress = sfnt.compress
+    saved_brotli = woff2.brotli
+    with compression_profile(CompressionProfile("zopfli", 5, 4)):
+        assert sfnt.compress is not saved_compress
+        assert woff2.brotli is not saved_brotli
+        with compression_profile(CompressionProfile("zlib-fast")):
+            assert sfnt.compress is not saved_compress
+        assert sfnt.compress is not saved_compress
+    assert sfnt.compress is saved_compress
+    assert woff2.brotli is saved_brotli
+
+
+def test_compression_profile_is_thread_local():
+    data = Path(get_font_path()).read_bytes()
+    results = {}
+
+    def compress():
+        results["thread"] = sfnt.compress(data, 6)
+
+    with compression_profile(CompressionProfile("zlib-fast")):
+        thread = threading.Thread(target=compress)
+        thread.start()
+        thread.join()
+        results["profile"] = sfnt.compress(data, 6)
+    # threads without a profile compress with the fontTools defaults
+    assert results["thread"] == zlib.compress(data, 6)
+    assert results["profile"] == zlib.compress(data, 1)
+
+
+def test_compression_profiles_write_concurrently(tmpdir):
+    profiles = [CompressionProfile(brotli_quality=q) for q in (0, 11)]
+    expected = [
+        save_flavor(str(tmpdir.join(f"serial-{x}.woff2")), "woff2", profile)
+        for x, profile in enumerate(profiles)
+    ]
+    barrier = threading.Barrier(len(profiles))
+    sizes = {}
+
+    def write(x, profile):
+        barrier.wait()
+        sizes[x] = save_flavor(str(tmpdir.join(f"{x}.woff2")), "woff2", profile)
+
+    threads = [
+        threading.Thread(target=write, args=(x, profile))
+        for x, profile in enumerate(profiles)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [sizes[x] for x in range(len(profiles))] == expected
+
+
+def test_compression_profile_woff_sizes(tmpdir):
+    fast = save_flavor(
+        str(tmpdir.join("fast.woff")), "woff", CompressionProfile("zlib-fast")
+    )
+    zopfli = save_flavor(str(tmpdir.join("zopfli.woff")), "woff", CompressionProfile())
+    assert zopfli < fast
+    assert TTFont(str(tmpdir.join("fast.woff"))).flavor == "woff"
+
+
+def test_compression_profile_woff2_brotli_quality(tmpdir):
+    low = save_flavor(
+        str(tmpdir.join("low.woff2")), "woff2", CompressionProfile(brotli_quality=0)
+    )
+    high = save_flavor(
+        str(tmpdir.join("high.woff2")), "woff2", CompressionProfile(brotli_quality=11)
+    )
+    assert high < low
+    assert "glyf" in TTFont(str(tmpdir.join("low.woff2")))
+
+
+def test_run_job_compression_is_not_process_global(tmpdir):
+    saved_use_zopfli = sfnt.USE_ZOPFLI
+    outpath = str(tmpdir.join("test.ttf"))
+    run_job(SliceJob(get_font_path(), outpath, {"wght": 500.0}))
+    assert sfnt.USE_ZOPFLI is saved_use_zopfli
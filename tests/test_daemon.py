@@ -0,0 +1,161 @@
+import io
+import os
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+from fontTools.ttLib import TTFont
+
+from slice import batch, client
+from slice.daemon import SliceDaemon, remove_stale_socket
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets"
+)
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+@pytest.fixture
+def daemon(tmpdir):
+    daemon = SliceDaemon(str(tmpdir.join("slice.sock")))
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+    daemon.shutdown()
+    daemon.server_close()
+
+
+def run_command(daemon, argv):
+    """Returns the (exit status, stdout, stderr) of a daemon command."""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    status = client.run_command(argv, daemon.server_address, stdout, stderr)
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+def test_daemon_socket_permissions(daemon):
+    assert os.stat(daemon.server_address).st_mode & 0o777 == 0o600
+
+
+def test_daemon_runs_commands(daemon, tmpdir, monkeypatch):
+    monkeypatch.setattr(batch, "_process_sessions", {})
+    fontpath = get_font_path()
+    # relative paths are resolved from the client working directory
+    monkeypatch.chdir(tmpdir)
+    cwd = os.getcwd()
+    status, stdout, _ = run_command(
+        daemon, [fontpath, "-o", "test-700.ttf", "--axis", "wght=700"]
+    )
+    assert status == 0
+    assert "test-700.ttf" in stdout
+    assert "wght" not in [axis.axisTag for axis in TTFont("test-700.ttf")["fvar"].axes]
+    session = batch._process_sessions[fontpath]
+
+    status, _, _ = run_command(
+        daemon, [fontpath, "-o", "test-300.ttf", "--axis", "wght=300"]
+    )
+    assert status == 0
+    assert tmpdir.join("test-300.ttf").check()
+    # the parsed source remains resident across commands
+    assert batch._process_sessions[fontpath] is session
+    assert daemon.commands == 2
+    assert os.getcwd() == cwd
+
+
+def test_daemon_command_errors(daemon, tmpdir):
+    status, _, stderr = run_command(daemon, ["--bogus"])
+    assert status == 2
+    assert "unrecognized arguments" in stderr
+    status, _, stderr = run_command(
+        daemon,
+        [get_font_path(), "-o", str(tmpdir.join("a.ttf")), "--axis", "wdth=100"],
+    )
+    assert status == 1
+    assert "wdth" in stderr
+    # the daemon continues to serve commands
+    status, stdout, _ = run_command(daemon, ["--help"])
+    assert status == 0
+    assert "usage" in stdout
+
+
+def test_daemon_stop(tmpdir):
+    socket_path = str(tmpdir.join("slice.sock"))
+    daemon = SliceDaemon(socket_path)
+    thread = threading.Thread(target=daemon.serve_forever)
+    thread.start()
+    assert client.stop_daemon(socket_path) == 0
+    thread.join(10)
+    assert not thread.is_alive()
+    daemon.server_close()
+    assert not os.path.exists(socket_path)
+
+
+def test_remove_stale_socket(daemon, tmpdir):
+    with pytest.raises(OSError, match="already running"):
+        remove_stale_socket(daemon.server_address)
+    stale_path = str(tmpdir.join("stale.sock"))
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(stale_path)
+    remove_stale_socket(stale_path)
+    assert not os.path.exists(stale_path)
+
+
+def test_client_runs_without_daemon(tmpdir, monkeypatch, capsys):
+    monkeypatch.setenv(client.SOCKET_ENVIRONMENT_VARIABLE, str(tmpdir.join("no.sock")))
+    outpath = str(tmpdir.join("test.ttf"))
+    assert client.main([get_font_path(), "-o", outpath, "--axis", "wght=500"]) == 0
+    assert Path(outpath).is_file()
+    assert "test.ttf" in capsys.readouterr().out
+
+
+def test_daemon_process_pool(tmpdir, monkeypatch):
+    daemon = SliceDaemon(str(tmpdir.join("slice.sock")), max_workers=2)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    executor = daemon.executor
+    submitted = []
+    saved_submit = executor.submit
+
+    def submit(*args):
+        submitted.append(args[0])
+        return saved_submit(*args)
+
+    monkeypatch.setattr(executor, "submit", submit)
+    fontpath = get_font_path()
+    for name, weights in (("a", (300, 400)), ("b", (500, 600))):
+        # the workers start in the working directory of the first command
+        monkeypatch.chdir(tmpdir.mkdir(name))
+        instances = ",".join(
+            '{"outpath": "%d.ttf", "axes": {"wght": %d}}' % (w, w) for w in weights
+        )
+        tmpdir.join(name, "jobs.json").write(
+            '{"font": "%s", "instances": [%s]}' % (fontpath, instances)
+        )
+        status, _, stderr = run_command(daemon, ["--spec", "jobs.json", "-w", "2"])
+        assert status == 0, stderr
+    # the commands share the long-lived pool
+    assert daemon.executor is executor
+    assert submitted == [batch.run_pooled_job_from] * 4
+    # the workers resolve relative paths from the client working directory
+    for name, weight in (("a", 300), ("a", 400), ("b", 500), ("b", 600)):
+        assert tmpdir.join(name, f"{weight}.ttf").check()
+    daemon.shutdown()
+    daemon.server_close()
+    assert daemon.executor is None
+
+
+def test_daemon_socket_directory(tmpdir, monkeypatch):
+    monkeypatch.setattr(client.tempfile, "gettempdir", lambda: str(tmpdir))
+    monkeypatch.delenv(client.SOCKET_ENVIRONMENT_VARIABLE, raising=False)
+    daemon = SliceDaemon()
+    socket_dir = os.path.dirname(daemon.server_address)
+    assert os.stat(socket_dir).st_mode & 0o777 == 0o700
+    daemon.server_close()
+    # a directory that other users can access is refused
+    os.chmod(socket_dir, 0o755)
+    with pytest.raises(OSError, match="only be accessible"):
+        SliceDaemon()
@@ -0,0 +1,355 @@
+from pathlib import Path
+
+from fontTools.ttLib import TTFont
+import pytest
+
+from slice import engine
+from slice.engine import (
+    SliceJob,
+    SliceResult,
+    get_instance_key,
+    get_name_instance_data,
+    get_named_instance_jobs,
+    get_named_instance_name_data,
+    get_named_instances,
+    instantiate_variable_font,
+    load_job_spec,
+    new_instance_ttfont,
+    parse_axis_value,
+    run_job,
+    validate_axis_data,
+)
+from slice.fontsession import FontSession
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def get_font_path_woff2():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.woff2").resolve())
+
+
+def bit_is_set(int_type, offset):
+    mask = 1 << offset
+    return (int_type & mask) != 0
+
+
+def test_parse_axis_value_location():
+    assert parse_axis_value(400, "wght") == 400.0
+    assert parse_axis_value("400.5", "wght") == 400.5
+
+
+def test_parse_axis_value_range():
+    assert parse_axis_value("300:700", "wght") == (300.0, 700.0)
+    assert parse_axis_value([700, 300], "wght") == (300.0, 700.0)
+    assert parse_axis_value(" -15 : 0 ", "slnt") == (-15.0, 0.0)
+
+
+def test_parse_axis_value_invalid():
+    # the error reports the value as it was written
+    with pytest.raises(ValueError, match="^'bogus' is not a valid wght axis value"):
+        parse_axis_value("bogus", "wght")
+    with pytest.raises(ValueError, match="^'1:2:3' is not a valid wght axis value"):
+        parse_axis_value("1:2:3", "wght")
+    with pytest.raises(ValueError, match=r"^'\[1, 2, 3\]' is not"):
+        parse_axis_value([1, 2, 3], "wght")
+
+
+def test_validate_axis_data():
+    fvar = FontSession(get_font_path()).get_fvar_table()
+    validate_axis_data({"wght": 500.0, "slnt": (-10.0, 0.0)}, fvar)
+    with pytest.raises(ValueError):
+        validate_axis_data({"wdth": 100.0}, fvar)
+    # wght default = 300
+    with pytest.raises(ValueError):
+        validate_axis_data({"wght": (400.0, 700.0)}, fvar)
+
+
+def test_get_name_instance_data():
+    name_data = get_name_instance_data(FontSession(get_font_path()).get_name_table())
+    assert name_data["nameID1"] == "Recursive Sans Linear Light"
+    assert name_data["nameID16"] == ""
+    assert len(name_data) == 9
+
+
+def get_font_path_static():
+    return str(Path("tests/assets/fonts/Recursive-Sliced.subset.ttf").resolve())
+
+
+def test_get_named_instances():
+    session = FontSession(get_font_path())
+    named_instances = get_named_instances(
+        session.get_fvar_table(), session.get_name_table()
+    )
+    assert len(named_instances) == len(session.get_fvar_table().instances)
+    named_instance = named_instances[1]
+    assert named_instance.subfamily_name == "Mono Linear Light Italic"
+    assert named_instance.postscript_name == "RecursiveMonoLnr-LightItalic"
+    assert named_instance.coordinates == {
+        "MONO": 1.0,
+        "CASL": 0.0,
+        "wght": 300.0,
+        "slnt": -15.0,
+        "CRSV": 1.0,
+    }
+    assert named_instance.name_data["nameID1"] == (
+        "Recursive Sans Linear Light Mono Linear Light"
+    )
+    assert named_instance.name_data["nameID2"] == "Italic"
+    assert named_instance.name_data["nameID17"] == "Mono Linear Light Italic"
+    assert named_instance.os2_bits == {"bit0": True}
+    assert named_instance.head_bits == {"bit1": True}
+
+
+def test_get_named_instance_name_data_ribbi():
+    name_table = FontSession(get_font_path()).get_name_table()
+    name_data = get_named_instance_name_data(name_table, "Bold", "Family-Bold")
+    assert name_data == {
+        "nameID1": "Recursive Sans Linear Light",
+        "nameID2": "Bold",
+        "nameID3": "1.077;Family-Bold",
+        "nameID4": "Recursive Sans Linear Light Bold",
+        "nameID6": "Family-Bold",
+        "nameID16": "",
+        "nameID17": "",
+        "nameID21": "",
+        "nameID22": "",
+    }
+
+
+def test_get_named_instance_jobs(tmpdir):
+    jobs = get_named_instance_jobs(get_font_path(), str(tmpdir))
+    assert len(jobs) == 64
+    assert jobs[1].outpath == str(tmpdir.join("RecursiveMonoLnr-LightItalic.ttf"))
+    assert jobs[1].os2_bits == {
+        "bit0": True,
+        "bit5": False,
+        "bit6": False,
+        "bit8": False,
+    }
+    assert jobs[1].head_bits == {"bit0": False, "bit1": True}
+    # output paths are unique
+    assert len({job.outpath for job in jobs}) == len(jobs)
+
+
+def test_get_named_instance_jobs_static_font(tmpdir):
+    with pytest.raises(ValueError):
+        get_named_instance_jobs(get_font_path_static(), str(tmpdir))
+
+
+def test_slice_job_bit_defaults():
+    job = SliceJob("in.ttf", "out.ttf", {}, os2_bits={"bit5": True})
+    assert job.os2_bits == {"bit0": False, "bit5": True, "bit6": False, "bit8": False}
+    assert job.head_bits == {"bit0": False, "bit1": False}
+    assert job.name_data == {}
+
+
+def test_run_job(tmpdir):
+    outpath = str(tmpdir.join("test.ttf"))
+    job = SliceJob(
+        get_font_path(),
+        outpath,
+        {"wght": 700.0, "slnt": (-15.0, 0.0)},
+        name_data={"nameID1": "Slice Test", "nameID17": "Bold"},
+        os2_bits={"bit5": True},
+        head_bits={"bit0": True},
+    )
+    result = run_job(job)
+    assert type(result) is SliceResult
+    assert result.outpath == outpath
+    assert list(result.timings) == ["parse", "instance", "names", "bits", "save"]
+    assert result.get_total_time() > 0
+
+    ttfont = TTFont(outpath)
+    axis_tags = [axis.axisTag for axis in ttfont["fvar"].axes]
+    assert "wght" not in axis_tags
+    assert "slnt" in axis_tags
+    assert ttfont["name"].getName(1, 3, 1, 1033).toUnicode() == "Slice Test"
+    # source font value when the record is not defined
+    assert ttfont["name"].getName(6, 3, 1, 1033).toUnicode() == (
+        "Recursive-SansLinearLight"
+    )
+    assert ttfont["name"].getName(17, 3, 1, 1033).toUnicode() == "Bold"
+    assert bit_is_set(ttfont["OS/2"].fsSelection, 5) is True
+    assert bit_is_set(ttfont["OS/2"].fsSelection, 6) is False
+    assert bit_is_set(ttfont["head"].macStyle, 0) is True
+
+
+def test_run_job_static_font(tmpdir):
+    job = SliceJob(get_font_path_static(), str(tmpdir.join("test.ttf")), {"wght": 700})
+    with pytest.raises(ValueError, match="is not a variable font"):
+        run_job(job)
+
+
+def test_run_job_shared_session_woff2(tmpdir):
+    session = FontSession(get_font_path_woff2())
+    for weight in (400.0, 800.0):
+        outpath = str(tmpdir.join(f"test-{weight}.woff2"))
+        run_job(SliceJob(get_font_path_woff2(), outpath, {"wght": weight}), session)
+        ttfont = TTFont(outpath)
+        assert ttfont.flavor == "woff2"
+        assert "wght" not in [axis.axisTag for axis in ttfont["fvar"].axes]
+
+
+def test_get_instance_key():
+    assert get_instance_key({"wght": 700, "slnt": [0, -15]}) == get_instance_key(
+        {"slnt": (-15.0, 0.0), "wght": 700.0}
+    )
+    assert get_instance_key({"wght": 700}) != get_instance_key({"wght": 400})
+
+
+def test_new_instance_ttfont_reuses_last_instance(monkeypatch):
+    session = FontSession(get_font_path_woff2())
+    calls = []
+
+    def instantiate(ttfont, axis_instance_data, *args):
+        calls.append(axis_instance_data)
+        instantiate_variable_font(ttfont, axis_instance_data, *args)
+
+    monkeypatch.setattr(engine, "instantiate_variable_font", instantiate)
+    ttfont1 = new_instance_ttfont(session, {"wght": 700.0})
+    ttfont1["name"].setName("Edited", 1, 3, 1, 1033)
+    ttfont2 = new_instance_ttfont(session, {"wght": 700})
+    assert len(calls) == 1
+    # private copies in the source flavor
+    assert ttfont2 is not ttfont1
+    assert ttfont2["name"].getName(1, 3, 1, 1033).toUnicode() != "Edited"
+    assert ttfont2.flavor == "woff2"
+    assert "wght" not in [axis.axisTag for axis in ttfont2["fvar"].axes]
+    # only the last location is retained
+    new_instance_ttfont(session, {"wght": 400.0})
+    new_instance_ttfont(session, {"wght": 700.0})
+    assert len(calls) == 3
+
+
+def test_run_job_metadata_edit_matches_full_run(tmpdir):
+    session = FontSession(get_font_path())
+    for name in ("First", "Second"):
+        job = SliceJob(
+            get_font_path(),
+            str(tmpdir.join(f"{name}.ttf")),
+            {"wght": 700.0},
+            name_data={"nameID1": name},
+            os2_bits={"bit5": True},
+        )
+        result = run_job(job, session)
+    # the second job re-used the first instance
+    full_outpath = str(tmpdir.join("full.ttf"))
+    job.outpath = full_outpath
+    run_job(job)
+    reused = TTFont(result.outpath)
+    full = TTFont(full_outpath)
+    assert reused["name"].getName(1, 3, 1, 1033).toUnicode() == "Second"
+    assert bit_is_set(reused["OS/2"].fsSelection, 5) is True
+    assert sorted(reused.keys()) == sorted(full.keys())
+    for tag in reused.keys():
+        # the head table differs by the modified timestamp
+        if tag not in ("GlyphOrder", "head"):
+            assert reused.getTableData(tag) == full.getTableData(tag), tag
+
+
+def test_load_job_spec(tmpdir):
+    specpath = tmpdir.join("jobs.json")
+    specpath.write(
+        '{"font": "%s", "instances": ['
+        '{"outpath": "bold.ttf", "axes": {"wght": 700, "slnt": [-15, 0]},'
+        ' "names": {"1": "Bold", "nameID2": "Regular"}, "os2_bits": {"bit5": true}},'
+        '{"outpath": "light.ttf", "axes": {"wght": "300:500"}}'
+        "]}" % get_font_path()
+    )
+    jobs = load_job_spec(str(specpath))
+    assert len(jobs) == 2
+    assert jobs[0].fontpath == get_font_path()
+    assert jobs[0].outpath == str(tmpdir.join("bold.ttf"))
+    assert jobs[0].axis_data == {"wght": 700.0, "slnt": (-15.0, 0.0)}
+    assert jobs[0].name_data == {"nameID1": "Bold", "nameID2": "Regular"}
+    assert jobs[0].os2_bits["bit5"] is True
+    assert jobs[1].axis_data == {"wght": (300.0, 500.0)}
+    assert jobs[0].optimize == "full"
+
+
+def test_load_job_spec_optimize(tmpdir):
+    specpath = tmpdir.join("jobs.json")
+    specpath.write(
+        '{"font": "%s", "instances": ['
+        '{"outpath": "a.ttf", "axes": {"wght": 700}, "optimize": "iup"},'
+        '{"outpath": "b.ttf", "axes": {"wght": 300}}'
+        "]}" % get_font_path()
+    )
+    jobs = load_job_spec(str(specpath), optimize="none")
+    assert [job.optimize for job in jobs] == ["iup", "none"]
+
+
+def test_load_job_spec_subset(tmpdir):
+    specpath = tmpdir.join("jobs.json")
+    specpath.write(
+        '{"font": "%s", "subset": {"unicodes": "U+0061"}, "instances": ['
+        '{"outpath": "a.ttf", "axes": {"wght": 700},'
+        ' "subset": {"glyphs": ["a.italic"]}},'
+        '{"outpath": "b.ttf", "axes": {"wght": 300}}'
+        "]}" % get_font_path()
+    )
+    jobs = load_job_spec(str(specpath))
+    assert jobs[0].subset.glyphs == ["a.italic"]
+    assert jobs[0].subset.unicodes == []
+    assert jobs[1].subset.unicodes == [0x61]
+
+
+def test_load_job_spec_shards(tmpdir):
+    specpath = tmpdir.join("jobs.json")
+    specpath.write(
+        '{"font": "%s", "shards": ["latin"], "instances": ['
+        '{"outpath": "a.ttf", "axes": {"wght": 700},'
+        ' "shards": {"basic": "U+0000-007F"}},'
+        '{"outpath": "b.ttf", "axes": {"wght": 300}}'
+        "]}" % get_font_path()
+    )
+    jobs = load_job_spec(str(specpath))
+    assert list(jobs[0].shards) == ["basic"]
+    assert jobs[0].shards["basic"] == list(range(0x80))
+    assert list(jobs[1].shards) == ["latin"]
+
+
+def test_slice_job_invalid_flavor():
+    with pytest.raises(ValueError):
+        SliceJob("in.ttf", "out.ttf", {}, flavors=["eot"])
+
+
+def test_slice_job_invalid_optimize_level():
+    with pytest.raises(ValueError):
+        SliceJob("in.ttf", "out.ttf", {}, optimize="fast")
+
+
+def test_slice_job_get_outputs():
+    job = SliceJob("in.ttf", "/out/test.ttf", {}, flavors=["ttf", "woff", "woff2"])
+    assert job.get_outputs() == [
+        (str(Path("/out/test.ttf")), None),
+        (str(Path("/out/test.woff")), "woff"),
+        (str(Path("/out/test.woff2")), "woff2"),
+    ]
+    assert job.get_outputs("OTTO")[0] == (str(Path("/out/test.otf")), None)
+
+
+def test_run_job_multiple_flavors(tmpdir):
+    outpath = str(tmpdir.join("test.ttf"))
+    job = SliceJob(
+        get_font_path_woff2(),
+        outpath,
+        {"wght": 700.0},
+        name_data={"nameID1": "Slice Test"},
+        flavors=["ttf", "woff", "woff2"],
+    )
+    result = run_job(job)
+    assert result.outpath == outpath
+    assert result.outpaths == [
+        outpath,
+        str(tmpdir.join("test.woff")),
+        str(tmpdir.join("test.woff2")),
+    ]
+    for path, flavor in zip(result.outpaths, (None, "woff", "woff2")):
+        ttfont = TTFont(path)
+        assert ttfont.flavor == flavor
+        assert "wght" not in [axis.axisTag for axis in ttfont["fvar"].axes]
+        assert ttfont["name"].getName(1, 3, 1, 1033).toUnicode() == "Slice Test"
+        assert len(ttfont["glyf"]) == len(TTFont(outpath)["glyf"])
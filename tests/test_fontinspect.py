@@ -0,0 +1,118 @@
+from pathlib import Path
+
+from fontTools.ttLib import TTFont, TTLibError
+from fontTools.ttLib.woff2 import woff2DirectorySize
+import pytest
+
+from slice import fontinspect
+from slice.fontinspect import (
+    WOFF2_DIRECTORY_ENTRY_MAX_SIZE,
+    FontInspector,
+    InspectionReader,
+)
+from slice.fontsession import FontSession
+
+
+def get_font_path(extension="ttf"):
+    return str(Path(f"tests/assets/fonts/Recursive-VF.subset.{extension}").resolve())
+
+
+def get_font_path_static():
+    return str(Path("tests/assets/fonts/Recursive-Sliced.subset.ttf").resolve())
+
+
+@pytest.mark.parametrize("extension", ["ttf", "woff", "woff2"])
+def test_inspection_reader_directory(extension):
+    reader = InspectionReader(get_font_path(extension))
+    ttfont = TTFont(get_font_path(extension))
+    assert sorted(reader.keys()) == sorted(ttfont.reader.keys())
+    assert reader.sfntVersion == ttfont.sfntVersion
+    assert reader.flavor == ttfont.flavor
+    # table data is only read on request
+    assert reader._data == {}
+
+
+@pytest.mark.parametrize("extension", ["ttf", "woff", "woff2"])
+def test_inspection_reader_table_data(extension):
+    reader = InspectionReader(get_font_path(extension))
+    ttfont = FontSession(get_font_path(extension)).ttfont
+    for tag in ("name", "fvar", "OS/2", "head"):
+        assert reader[tag] == ttfont.getTableData(tag)
+    assert "glyf" not in reader._data
+    assert "gvar" not in reader._data
+
+
+def test_inspection_reader_woff2_transformed_table():
+    reader = InspectionReader(get_font_path("woff2"))
+    with pytest.raises(TTLibError):
+        reader["glyf"]
+
+
+def test_inspection_reader_woff2_directory_read(tmpdir, monkeypatch):
+    reads = []
+
+    class RecordedFile(object):
+        def __init__(self, f):
+            self.f = f
+
+        def read(self, size=-1):
+            data = self.f.read(size)
+            reads.append(len(data))
+            return data
+
+        def __getattr__(self, name):
+            return getattr(self.f, name)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            self.f.close()
+
+    monkeypatch.setattr(
+        fontinspect, "open", lambda *args: RecordedFile(open(*args)), raising=False
+    )
+    reader = InspectionReader(get_font_path("woff2"))
+    monkeypatch.undo()
+    # the signature, the header and the directory, not the compressed data
+    max_directory_size = reader.numTables * WOFF2_DIRECTORY_ENTRY_MAX_SIZE
+    assert sum(reads) <= 4 + woff2DirectorySize + max_directory_size
+    assert sum(reads) < reader.length
+
+    # the directory of a truncated file is read, table reads fail
+    fontpath = tmpdir.join("truncated.woff2")
+    with open(get_font_path("woff2"), "rb") as f:
+        fontpath.write_binary(f.read(reader._woff2_stream_start))
+    truncated = InspectionReader(str(fontpath))
+    assert sorted(truncated.keys()) == sorted(reader.keys())
+    with pytest.raises(TTLibError):
+        truncated["name"]
+
+
+def test_inspection_reader_invalid_file(tmpdir):
+    fontpath = str(tmpdir.join("bogus.ttf"))
+    with open(fontpath, "wb") as f:
+        f.write(b"bogus data that is not a font file")
+    with pytest.raises(TTLibError):
+        InspectionReader(fontpath)
+
+
+@pytest.mark.parametrize("extension", ["ttf", "woff", "woff2"])
+def test_font_inspector_tables(extension):
+    inspector = FontInspector(get_font_path(extension))
+    session = FontSession(get_font_path(extension))
+    assert inspector.is_variable_font() is True
+    assert [axis.axisTag for axis in inspector.get_fvar_table().axes] == [
+        axis.axisTag for axis in session.get_fvar_table().axes
+    ]
+    assert inspector.get_name_table().getName(1, 3, 1, 1033).toUnicode() == (
+        session.get_name_table().getName(1, 3, 1, 1033).toUnicode()
+    )
+    assert inspector.get_os2_table().usWeightClass == 300
+    assert inspector.get_head_table().unitsPerEm == 1000
+    # decompiled tables are shared across calls
+    assert inspector.get_name_table() is inspector.get_name_table()
+
+
+def test_font_inspector_static_font():
+    assert FontInspector(get_font_path_static()).is_variable_font() is False
@@ -0,0 +1,100 @@
+from pathlib import Path
+
+from PyQt5.QtCore import pyqtBoundSignal
+
+from slice.fontloadworker import FontLoadWorker, FontLoadWorkerSignals
+
+
+def get_font_path(extension="ttf"):
+    return str(Path(f"tests/assets/fonts/Recursive-VF.subset.{extension}").resolve())
+
+
+def get_font_path_static():
+    return str(Path("tests/assets/fonts/Recursive-Sliced.subset.ttf").resolve())
+
+
+def run_font_load_worker(worker):
+    emitted = {"progress": [], "result": [], "error": [], "finished": 0}
+    worker.signals.progress.connect(
+        lambda percent, message: emitted["progress"].append((percent, message))
+    )
+    worker.signals.result.connect(
+        lambda font_model: emitted["result"].append(font_model)
+    )
+    worker.signals.error.connect(
+        lambda message, details: emitted["error"].append((message, details))
+    )
+
+    def finished():
+        emitted["finished"] += 1
+
+    worker.signals.finished.connect(finished)
+    worker.run()
+    return emitted
+
+
+def test_font_load_worker_signals_instantiation():
+    flws = FontLoadWorkerSignals()
+    assert type(flws.finished) is pyqtBoundSignal
+    assert type(flws.error) is pyqtBoundSignal
+    assert type(flws.result) is pyqtBoundSignal
+    assert type(flws.progress) is pyqtBoundSignal
+
+
+def test_font_load_worker_result():
+    for extension in ("ttf", "woff", "woff2"):
+        worker = FontLoadWorker(get_font_path(extension))
+        emitted = run_font_load_worker(worker)
+        assert emitted["error"] == []
+        assert emitted["finished"] == 1
+        assert emitted["result"] == [worker.font_model]
+        # the displayed tables are decompiled in the worker
+        inspector = worker.font_model.get_inspector()
+        assert "name" in inspector.ttfont.tables
+        assert "fvar" in inspector.ttfont.tables
+        # the preview font is built after the result in a PreviewFontWorker
+        assert worker.font_model._session is None
+        assert worker.font_model._preview_font is None
+        percents = [percent for percent, _ in emitted["progress"]]
+        assert percents == sorted(percents)
+        assert percents[-1] == 100
+
+
+def test_font_load_worker_static_font():
+    emitted = run_font_load_worker(FontLoadWorker(get_font_path_static()))
+    assert emitted["result"] == []
+    assert emitted["finished"] == 1
+    assert len(emitted["error"]) == 1
+    assert "variable font" in emitted["error"][0][0]
+
+
+def test_font_load_worker_missing_file(tmpdir):
+    emitted = run_font_load_worker(FontLoadWorker(str(tmpdir.join("missing.ttf"))))
+    assert emitted["result"] == []
+    assert emitted["finished"] == 1
+    assert len(emitted["error"]) == 1
+    assert "missing.ttf" in emitted["error"][0][1]
+
+
+def test_font_load_worker_cancel():
+    worker = FontLoadWorker(get_font_path())
+    worker.cancel()
+    assert worker.is_canceled() is True
+    emitted = run_font_load_worker(worker)
+    assert emitted["result"] == []
+    assert emitted["error"] == []
+    assert emitted["progress"] == []
+    assert emitted["finished"] == 1
+
+
+def test_font_load_worker_cancel_during_load():
+    worker = FontLoadWorker(get_font_path())
+    # a second font load cancels the first one mid-load
+    worker.signals.progress.connect(
+        lambda percent, message: worker.cancel() if percent == 40 else None
+    )
+    emitted = run_font_load_worker(worker)
+    assert emitted["result"] == []
+    assert emitted["error"] == []
+    assert [percent for percent, _ in emitted["progress"]] == [10, 40]
+    assert emitted["finished"] == 1
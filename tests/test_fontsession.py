@@ -0,0 +1,179 @@
+from pathlib import Path
+
+from fontTools.ttLib import TTFont, TTLibError
+import pytest
+
+from slice.fontsession import FontSession, MappedFile
+from slice.models import FontModel
+
+#
+# Utilities
+#
+
+
+def get_font_path_vf():
+    return Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve()
+
+
+def get_font_path_vf_woff():
+    return Path("tests/assets/fonts/Recursive-VF.subset.woff").resolve()
+
+
+def get_font_path_vf_woff2():
+    return Path("tests/assets/fonts/Recursive-VF.subset.woff2").resolve()
+
+
+def get_font_path_static():
+    return Path("tests/assets/fonts/Recursive-Sliced.subset.ttf").resolve()
+
+
+# ~~~~~~~~~~~
+#
+# Tests
+#
+# ~~~~~~~~~~~
+
+
+def test_font_session_default():
+    fs = FontSession(get_font_path_vf())
+    assert fs.fontpath == get_font_path_vf()
+    assert fs.flavor is None
+    assert type(fs.ttfont) is TTFont
+
+
+def test_font_session_is_variable_font():
+    assert FontSession(get_font_path_vf()).is_variable_font() is True
+    assert FontSession(get_font_path_vf_woff()).is_variable_font() is True
+    assert FontSession(get_font_path_vf_woff2()).is_variable_font() is True
+    assert FontSession(get_font_path_static()).is_variable_font() is False
+
+
+def test_font_session_table_getters():
+    fs = FontSession(get_font_path_vf())
+    axis_tags = [axis.axisTag for axis in fs.get_fvar_table().axes]
+    assert axis_tags == ["MONO", "CASL", "wght", "slnt", "CRSV"]
+    assert fs.get_name_table().getName(1, 3, 1, 1033).toUnicode() == (
+        "Recursive Sans Linear Light"
+    )
+    assert fs.get_os2_table().fsSelection == fs.ttfont["OS/2"].fsSelection
+    assert fs.get_head_table().macStyle == fs.ttfont["head"].macStyle
+
+
+def test_font_session_compressed_flavors_are_retained():
+    for fontpath, flavor in (
+        (get_font_path_vf_woff(), "woff"),
+        (get_font_path_vf_woff2(), "woff2"),
+    ):
+        fs = FontSession(fontpath)
+        assert fs.flavor == flavor
+        ttfont = fs.new_ttfont()
+        assert ttfont.flavor == flavor
+        # table data matches a direct file parse
+        direct = TTFont(fontpath)
+        assert ttfont["glyf"].keys() == direct["glyf"].keys()
+        assert ttfont["fvar"].axes[2].maxValue == direct["fvar"].axes[2].maxValue
+
+
+def test_font_session_new_ttfont_is_private_copy():
+    fs = FontSession(get_font_path_vf())
+    ttfont1 = fs.new_ttfont()
+    ttfont2 = fs.new_ttfont()
+    assert ttfont1 is not ttfont2
+    assert ttfont1 is not fs.ttfont
+    ttfont1["OS/2"].fsSelection = 0xFFFF
+    assert ttfont2["OS/2"].fsSelection != 0xFFFF
+    assert fs.ttfont["OS/2"].fsSelection != 0xFFFF
+
+
+def test_font_model_session_is_shared():
+    fm = FontModel(get_font_path_vf())
+    session = fm.get_session()
+    assert type(session) is FontSession
+    assert fm.get_session() is session
+
+
+def test_mapped_file_read_seek():
+    mf = MappedFile(b"0123456789")
+    assert mf.read(4) == b"0123"
+    assert mf.tell() == 4
+    assert mf.read() == b"456789"
+    assert mf.read(2) == b""
+    mf.seek(-3, 2)
+    assert mf.read(1) == b"7"
+    mf.seek(2, 1)
+    assert mf.tell() == 10
+    mf.seek(1)
+    assert mf.read(2) == b"12"
+
+
+def test_mapped_file_positions_are_independent():
+    data = b"0123456789"
+    mf1 = MappedFile(data)
+    mf2 = MappedFile(data)
+    mf1.seek(5)
+    assert mf2.read(2) == b"01"
+    assert mf1.read(2) == b"56"
+
+
+def test_font_session_source_is_memory_mapped():
+    fs = FontSession(get_font_path_vf())
+    ttfont = fs.new_ttfont()
+    # tables are read from the shared map, not an in-memory file copy
+    assert type(ttfont.reader.file) is MappedFile
+    assert ttfont.lazy is None
+    with open(get_font_path_vf(), "rb") as f:
+        assert fs._sfnt_map[:] == f.read()
+
+
+def test_font_session_empty_file(tmpdir):
+    fontpath = tmpdir.join("empty.ttf")
+    fontpath.write_binary(b"")
+    with pytest.raises(TTLibError):
+        FontSession(str(fontpath))
+
+
+def test_font_session_retains_last_instance_data():
+    fs = FontSession(get_font_path_vf())
+    assert fs.get_instance_data("a") is None
+    fs.set_instance_data("a", b"data")
+    assert fs.get_instance_data("a") == b"data"
+    fs.set_instance_data("b", b"other")
+    assert fs.get_instance_data("a") is None
+    assert fs.get_instance_data("b") == b"other"
+
+
+def test_font_session_is_modified(tmpdir):
+    fontpath = tmpdir.join("test.ttf")
+    fontpath.write_binary(get_font_path_vf().read_bytes())
+    fs = FontSession(str(fontpath))
+    assert fs.is_modified() is False
+    fontpath.write_binary(get_font_path_vf().read_bytes() + b"\0")
+    assert fs.is_modified() is True
+    fontpath.remove()
+    assert fs.is_modified() is True
+
+
+def test_font_session_truncated_source(tmpdir):
+    fontpath = tmpdir.join("test.ttf")
+    fontpath.write_binary(get_font_path_vf().read_bytes())
+    fs = FontSession(str(fontpath))
+    ttfont = fs.new_ttfont()
+    # the file is truncated in place under the live session map
+    with open(str(fontpath), "r+b") as f:
+        f.truncate(1024)
+    # reads of the truncated pages raise instead of terminating the process
+    with pytest.raises(OSError, match="truncated"):
+        ttfont["gvar"]
+    with pytest.raises(OSError, match="truncated"):
+        fs.new_ttfont()["glyf"]
+    assert fs.is_modified() is True
+
+
+def test_font_session_compressed_source_is_not_checked(tmpdir):
+    fontpath = tmpdir.join("test.woff2")
+    fontpath.write_binary(get_font_path_vf_woff2().read_bytes())
+    fs = FontSession(str(fontpath))
+    with open(str(fontpath), "r+b") as f:
+        f.truncate(0)
+    # the tables are read from the decompressed copy of the source
+    assert "wght" in [axis.axisTag for axis in fs.new_ttfont()["fvar"].axes]
@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import pytest
+from fontTools.ttLib import TTFont
+
+from slice.engine import SliceJob, run_job
+from slice.fontsession import FontSession
+from slice.glyphsubset import (
+    GlyphSubset,
+    GlyphVariationReader,
+    format_unicodes,
+    load_lazy_gvar,
+    subset_variable_font,
+)
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def test_glyph_subset_parses_unicode_ranges():
+    subset = GlyphSubset("U+0061-0063,U+20AC, U+0041")
+    assert subset.unicodes == [0x41, 0x61, 0x62, 0x63, 0x20AC]
+    assert subset.glyphs == []
+    assert GlyphSubset([0x62, 0x61, 0x61]).unicodes == [0x61, 0x62]
+
+
+def test_glyph_subset_parses_glyph_names():
+    assert GlyphSubset(glyphs="b, a,c").glyphs == ["a", "b", "c"]
+    assert GlyphSubset(glyphs=["a.italic", "a"]).glyphs == ["a", "a.italic"]
+
+
+def test_glyph_subset_data_round_trip():
+    subset = GlyphSubset("U+0041-005A,U+0061", ["fi"])
+    assert subset.get_data() == {"unicodes": "U+0041-005A,U+0061", "glyphs": ["fi"]}
+    restored = GlyphSubset(**subset.get_data())
+    assert restored.unicodes == subset.unicodes
+    assert restored.glyphs == subset.glyphs
+
+
+def test_glyph_subset_invalid_definitions():
+    with pytest.raises(ValueError):
+        GlyphSubset()
+    with pytest.raises(ValueError):
+        GlyphSubset("U+ZZZZ")
+
+
+def test_format_unicodes():
+    assert format_unicodes([]) == ""
+    assert format_unicodes([0x41]) == "U+0041"
+    assert format_unicodes([0x41, 0x42, 0x43, 0x1F600]) == "U+0041-0043,U+1F600"
+
+
+def test_glyph_variation_reader():
+    ttfont = TTFont(get_font_path(), lazy=True)
+    reader = GlyphVariationReader(ttfont)
+    gvar = TTFont(get_font_path())["gvar"]
+    point_count = gvar.getNumPoints_(ttfont["glyf"]["a"])
+    # same variations as a gvar table decompile
+    assert reader.get_variations("a", point_count) == gvar.variations["a"]
+
+
+def test_lazy_gvar_decompiles_retained_glyphs(monkeypatch):
+    decompiled = []
+    get_variations = GlyphVariationReader.get_variations
+
+    def record_variations(self, glyphname, point_count):
+        decompiled.append(glyphname)
+        return get_variations(self, glyphname, point_count)
+
+    monkeypatch.setattr(GlyphVariationReader, "get_variations", record_variations)
+    ttfont = FontSession(get_font_path()).new_ttfont()
+    load_lazy_gvar(ttfont)
+    assert decompiled == []
+    subset_variable_font(ttfont, GlyphSubset(glyphs=[".notdef"]))
+    assert decompiled == [".notdef"]
+    assert ttfont.getGlyphOrder() == [".notdef"]
+    assert list(ttfont["gvar"].variations) == [".notdef"]
+
+
+def test_subset_variable_font_retains_names():
+    ttfont = FontSession(get_font_path()).new_ttfont()
+    name_ids = {record.nameID for record in ttfont["name"].names}
+    subset_variable_font(ttfont, GlyphSubset("U+0061"))
+    assert "a" in ttfont.getGlyphOrder()
+    # the fvar and STAT name records are retained for the instancer
+    assert {record.nameID for record in ttfont["name"].names} == name_ids
+
+
+def test_run_job_subset_matches_subset_after_instance(tmpdir):
+    axis_data = {"MONO": 0.0, "CASL": 0.5, "wght": 800.0, "slnt": -10.0, "CRSV": 0.5}
+    subset_path = str(tmpdir.join("subset.ttf"))
+    run_job(
+        SliceJob(get_font_path(), subset_path, axis_data, subset=GlyphSubset("U+0061"))
+    )
+    full_path = str(tmpdir.join("full.ttf"))
+    run_job(SliceJob(get_font_path(), full_path, axis_data))
+
+    subset_font = TTFont(subset_path)
+    full_font = TTFont(full_path)
+    assert "fvar" not in subset_font
+    assert list(subset_font.getBestCmap()) == [0x61]
+    # glyph names are not retained, the glyphs are compared by glyph ID
+    assert len(subset_font.getGlyphOrder()) <= len(full_font.getGlyphOrder())
+    glyphname = subset_font.getBestCmap()[0x61]
+    assert (
+        subset_font["glyf"][glyphname].coordinates == full_font["glyf"]["a"].coordinates
+    )
+    assert subset_font["hmtx"][glyphname] == full_font["hmtx"]["a"]
+    assert subset_font["hmtx"][".notdef"] == full_font["hmtx"][".notdef"]
+
+
+def test_run_job_subset_is_not_the_retained_instance(tmpdir):
+    session = FontSession(get_font_path())
+    axis_data = {"wght": 800.0}
+    run_job(SliceJob(get_font_path(), str(tmpdir.join("full.ttf")), axis_data), session)
+    outpath = str(tmpdir.join("subset.ttf"))
+    subset = GlyphSubset(glyphs=[".notdef"])
+    run_job(SliceJob(get_font_path(), outpath, axis_data, subset=subset), session)
+    assert len(TTFont(outpath).getGlyphOrder()) == 1
@@ -1,3 +1,5 @@
+import json
+import os
 from pathlib import Path
 
 from fontTools.ttLib import TTFont
@@ -5,8 +7,10 @@ import pytest
 
 from PyQt5.QtCore import pyqtBoundSignal
 
+from slice.glyphsubset import GlyphSubset
 from slice.instanceworker import InstanceWorker, InstanceWorkerSignals
 from slice.models import FontModel, FontBitFlagModel, DesignAxisModel, FontNameModel
+from slice.telemetry import TelemetryLog
 
 
 def bit_is_set(int_type, offset):
@@ -69,6 +73,7 @@ def test_instanceworker_signals_instantiation():
     assert type(iws.finished) is pyqtBoundSignal
     assert type(iws.error) is pyqtBoundSignal
     assert type(iws.result) is pyqtBoundSignal
+    assert type(iws.telemetry) is pyqtBoundSignal
 
 
 def test_instanceworker_class_default(tmpdir):
@@ -1453,3 +1458,95 @@ def test_instanceworker_edit_bit_flags_woff2(tmpdir):
     assert bit_is_set(fs_sel2, 8) is False
     assert bit_is_set(head2, 0) is False
     assert bit_is_set(head2, 1) is False
+
+
+def get_run_instance_worker(outpath, **kwargs):
+    font_model = get_font_model()
+    axis_model = DesignAxisModel()
+    axis_model.load_font(font_model)
+    axis_model._data[2][1] = "700"
+    name_model = FontNameModel()
+    name_model.load_font(font_model)
+    bit_model = FontBitFlagModel(
+        get_os2_default_dict_false(), get_head_default_dict_false()
+    )
+    return InstanceWorker(
+        outpath, font_model, axis_model, name_model, bit_model, **kwargs
+    )
+
+
+def test_instanceworker_run_telemetry(tmpdir, capsys):
+    outpath = str(tmpdir.join("test.ttf"))
+    logpath = str(tmpdir.join("telemetry.jsonl"))
+    iw = get_run_instance_worker(outpath, telemetry_log=TelemetryLog(logpath))
+    events = []
+    iw.signals.telemetry.connect(events.append)
+    iw.run()
+
+    assert len(events) == 1
+    event = events[0]
+    assert event["status"] == "ok"
+    assert list(event["timings"]) == ["parse", "instance", "names", "bits", "save"]
+    assert event["output_sizes"] == {outpath: os.path.getsize(outpath)}
+    with open(logpath) as f:
+        assert json.loads(f.readline())["outpaths"] == [outpath]
+    # stdout reports are off by default
+    assert capsys.readouterr().out == ""
+
+
+def test_instanceworker_run_telemetry_error(tmpdir):
+    outpath = str(tmpdir.join("missing_dir", "test.ttf"))
+    iw = get_run_instance_worker(outpath)
+    events = []
+    errors = []
+    iw.signals.telemetry.connect(events.append)
+    iw.signals.error.connect(errors.append)
+    iw.run()
+
+    assert len(errors) == 1
+    assert events[0]["status"] == "error"
+    assert events[0]["error"] == errors[0]
+
+
+def test_instanceworker_run_verbose(tmpdir, capsys):
+    iw = get_run_instance_worker(str(tmpdir.join("test.ttf")), verbose=True)
+    iw.run()
+    out = capsys.readouterr().out
+    assert "AXIS INSTANCE VALUES" in out
+    assert "NAME TABLE EDITS" in out
+    assert "BIT FLAGS" in out
+
+
+def test_instanceworker_run_progress(tmpdir):
+    iw = get_run_instance_worker(str(tmpdir.join("test.ttf")))
+    reports = []
+    iw.signals.progress.connect(reports.append)
+    iw.run()
+    percents = [report["percent"] for report in reports]
+    assert percents == sorted(percents)
+    assert percents[-1] == 100
+    assert "glyf/gvar" in [report["message"] for report in reports]
+
+
+def test_instanceworker_run_name_edit_reuses_instance(tmpdir):
+    outpath = str(tmpdir.join("test.ttf"))
+    iw = get_run_instance_worker(outpath)
+    iw.run()
+    # a name record edit at the same axis location
+    iw.name_model._data[0][0] = "Edited"
+    reports = []
+    iw.signals.progress.connect(reports.append)
+    iw.run()
+    assert "glyf/gvar" not in [report["message"] for report in reports]
+    ttfont = TTFont(outpath)
+    assert ttfont["name"].getName(1, 3, 1, 1033).toUnicode() == "Edited"
+
+
+def test_instanceworker_run_glyph_subset(tmpdir):
+    outpath = str(tmpdir.join("test.ttf"))
+    iw = get_run_instance_worker(outpath, subset=GlyphSubset(glyphs=[".notdef"]))
+    reports = []
+    iw.signals.progress.connect(reports.append)
+    iw.run()
+    assert len(TTFont(outpath).getGlyphOrder()) == 1
+    assert "subsetting glyphs" in [report["message"] for report in reports]
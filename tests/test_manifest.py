@@ -0,0 +1,118 @@
+import json
+from pathlib import Path
+
+from slice.compression import CompressionProfile
+from slice.engine import SliceJob, run_job
+from slice.glyphsubset import GlyphSubset
+from slice.manifest import (
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_RUNNING,
+    JobManifest,
+    get_job_data,
+    get_job_from_data,
+    get_job_id,
+)
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def get_job(tmpdir, weight=700.0):
+    return SliceJob(
+        get_font_path(),
+        str(tmpdir.join(f"test-{weight:g}.ttf")),
+        {"wght": weight, "slnt": (-15.0, 0.0)},
+        name_data={"nameID1": "Test"},
+        os2_bits={"bit5": True},
+        compression=CompressionProfile("zlib-fast"),
+        flavors=["ttf", "woff"],
+        optimize="iup",
+        subset=GlyphSubset("U+0061", ["a.italic"]),
+    )
+
+
+def test_job_data_round_trip(tmpdir):
+    job = get_job(tmpdir)
+    job_data = get_job_data(job)
+    # serializable as JSON
+    job_data = json.loads(json.dumps(job_data))
+    restored = get_job_from_data(job_data)
+    assert restored.axis_data == job.axis_data
+    assert restored.name_data == job.name_data
+    assert restored.os2_bits == job.os2_bits
+    assert restored.compression.get_data() == job.compression.get_data()
+    assert restored.flavors == job.flavors
+    assert restored.optimize == "iup"
+    assert restored.subset.get_data() == job.subset.get_data()
+    assert restored.shards is None
+
+
+def test_job_data_round_trip_shards(tmpdir):
+    job = get_job(tmpdir)
+    job.shards = {"basic": list(range(0x80)), "euro": [0x20AC]}
+    job_data = get_job_data(job)
+    assert job_data["shards"] == {"basic": "U+0000-007F", "euro": "U+20AC"}
+    restored = get_job_from_data(json.loads(json.dumps(job_data)))
+    assert restored.shards == job.shards
+    assert get_job_id(get_job_data(restored)) == get_job_id(get_job_data(job))
+
+
+def test_get_job_id_differs_by_spec(tmpdir):
+    job_ids = {
+        get_job_id(get_job_data(get_job(tmpdir, weight))) for weight in (300.0, 700.0)
+    }
+    assert len(job_ids) == 2
+
+
+def test_manifest_records_job_states(tmpdir):
+    manifest_path = str(tmpdir.join("manifest.jsonl"))
+    manifest = JobManifest(manifest_path)
+    job = get_job(tmpdir)
+    assert manifest.get_state(job) is None
+    manifest.start(job)
+    assert manifest.get_state(job) == JOB_RUNNING
+    result = run_job(job)
+    manifest.finish(job, result)
+    assert manifest.get_state(job) == JOB_DONE
+    assert manifest.is_complete(job)
+
+    # the last record defines the state after a reload
+    manifest = JobManifest(manifest_path)
+    assert manifest.get_state(job) == JOB_DONE
+    assert manifest.is_complete(job)
+    record = list(manifest.records.values())[0]
+    assert sorted(record["outputs"]) == sorted(result.outpaths)
+    assert list(record["timings"]) == list(result.timings)
+    assert [j.outpath for j in manifest.get_jobs()] == [job.outpath]
+
+
+def test_manifest_redoes_failed_and_changed_jobs(tmpdir):
+    manifest = JobManifest(str(tmpdir.join("manifest.jsonl")))
+    done, failed, missing, changed, running, new = [
+        get_job(tmpdir, weight) for weight in (300.0, 400.0, 500.0, 600.0, 700.0, 800.0)
+    ]
+    for job in (done, missing, changed):
+        manifest.finish(job, run_job(job))
+    manifest.fail(failed, ValueError("bad"))
+    manifest.start(running)
+    Path(missing.get_outputs()[1][0]).unlink()
+    with open(changed.get_outputs()[0][0], "ab") as f:
+        f.write(b"\0")
+
+    manifest = JobManifest(str(tmpdir.join("manifest.jsonl")))
+    assert manifest.get_state(failed) == JOB_FAILED
+    jobs = [done, failed, missing, changed, running, new]
+    assert manifest.get_pending_jobs(jobs) == [failed, missing, changed, running, new]
+
+
+def test_manifest_skips_partial_lines(tmpdir):
+    manifest_path = str(tmpdir.join("manifest.jsonl"))
+    manifest = JobManifest(manifest_path)
+    job = get_job(tmpdir)
+    manifest.finish(job, run_job(job))
+    with open(manifest_path, "a") as f:
+        f.write('{"id": "partial')
+    assert JobManifest(manifest_path).is_complete(job)
+    assert JobManifest(str(tmpdir.join("missing.jsonl"))).records == {}
@@ -440,3 +440,40 @@ def test_designaxis_model_get_axis_name_string(qtbot):
 
     # not a known (to this application) axis tag
     assert model.get_axis_name_string("ZXYJ") is None
+
+
+def test_designaxis_model_named_instances(qtbot):
+    model = DesignAxisModel()
+    assert model.named_instances == []
+    model.load_font(get_font_model_woff2())
+    assert len(model.named_instances) == 64
+    assert model.named_instances[0].postscript_name == "RecursiveMonoLnr-Light"
+    assert model.named_instances[0].coordinates["wght"] == 300.0
+
+
+def test_designaxis_model_get_preview_location(qtbot):
+    tableview = QTableView()
+    model = DesignAxisModel()
+    tableview.setModel(model)
+    qtbot.addWidget(tableview)
+    model.load_font(get_font_model())
+
+    # undefined axes are at the default location
+    assert model.get_preview_location() == {}
+
+    model._data[2][1] = "800"
+    model._data[3][1] = "-15:0"
+    model.layoutChanged.emit()
+    # range values are not a preview location
+    assert model.get_preview_location() == {"wght": 800.0}
+
+    # values that are being typed take precedence over the model data
+    assert model.get_preview_location({2: "650", 1: "0.5"}) == {
+        "CASL": 0.5,
+        "wght": 650.0,
+    }
+    # partially typed values
+    assert model.get_preview_location({2: "-"}) == {}
+    # non-finite and out of range values are at the axis default
+    for text in ("nan", "inf", "-inf", "65", "1001"):
+        assert model.get_preview_location({2: text}) == {}
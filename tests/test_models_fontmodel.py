@@ -1,5 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import time
 
+import pytest
+from fontTools.ttLib import TTFont, TTLibError
+
+from slice.engine import SliceJob, run_job
+from slice.fontsession import FontSession
 from slice.models import FontModel
 
 #
@@ -78,3 +85,55 @@ def test_font_model_is_variable_font_true_with_string():
 def test_font_model_is_variable_font_false_with_string():
     fm = FontModel(get_font_string_static())
     assert fm.is_variable_font() is False
+
+
+def write_renamed_font(sourcepath, outpath, family_name):
+    # the new name changes the file size and content
+    ttfont = TTFont(sourcepath)
+    ttfont["name"].setName(family_name, 1, 3, 1, 0x409)
+    ttfont.save(outpath)
+
+
+def test_font_model_get_session_threads(monkeypatch):
+    sessions = []
+
+    def new_session(fontpath):
+        # widens the window between the cache check and the cache update
+        time.sleep(0.05)
+        sessions.append(FontSession(fontpath))
+        return sessions[-1]
+
+    monkeypatch.setattr("slice.models.FontSession", new_session)
+    fm = FontModel(get_font_path_vf())
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: fm.get_session(), range(4)))
+    # the font is parsed once and the session is shared by all threads
+    assert len(sessions) == 1
+    assert all(session is sessions[0] for session in results)
+
+
+def test_font_model_get_session_reparses_modified_font(tmpdir):
+    fontpath = str(tmpdir.join("test.ttf"))
+    write_renamed_font(get_font_path_vf(), fontpath, "Before")
+    fm = FontModel(fontpath)
+    session = fm.get_session()
+    preview_font = fm.get_preview_font()
+    assert fm.get_session() is session
+
+    write_renamed_font(get_font_path_vf(), fontpath, "After Rewrite")
+    new_session = fm.get_session()
+    assert new_session is not session
+    assert new_session.source_hash != session.source_hash
+    assert new_session.get_name_table().getDebugName(1) == "After Rewrite"
+    assert fm.get_preview_font() is not preview_font
+
+    # slices the rewritten font
+    outpath = str(tmpdir.join("instance.ttf"))
+    run_job(SliceJob(fontpath, outpath, {"wght": 700.0}), fm.get_session())
+    assert TTFont(outpath)["name"].getDebugName(1) == "After Rewrite"
+
+    # a truncated file is not read from the previous map
+    with open(fontpath, "wb"):
+        pass
+    with pytest.raises(TTLibError):
+        fm.get_session()
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+from PyQt5.QtCore import Qt
+
+from slice.engine import SliceJob
+from slice.models import JobQueueModel
+
+#
+# Utilities
+#
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def get_job(outpath="/tmp/instance.ttf", axis_data=None):
+    return SliceJob(
+        get_font_path(),
+        outpath,
+        axis_data if axis_data else {"wght": 400.0, "CASL": (0.0, 1.0)},
+    )
+
+
+# ~~~~~~~~~~~~~~~
+#
+# Tests
+#
+# ~~~~~~~~~~~~~~~
+
+
+def test_jobqueue_model_default(qtbot, qtmodeltester):
+    model = JobQueueModel()
+    assert model.jobs == []
+    assert model.get_queued_jobs() == []
+    qtmodeltester.check(model)
+
+
+def test_jobqueue_model_add_job(qtbot, qtmodeltester):
+    model = JobQueueModel()
+    job1 = get_job("/tmp/instance-1.ttf")
+    job2 = get_job("/tmp/instance-2.ttf", {"wght": 700.0})
+    assert model.add_job(job1) == 0
+    assert model.add_job(job2) == 1
+    assert model.get_data() == [
+        ["instance-1.ttf", "wght 400, CASL 0:1", "Queued", "", ""],
+        ["instance-2.ttf", "wght 700", "Queued", "", ""],
+    ]
+    assert model.get_queued_jobs() == [(0, job1), (1, job2)]
+    assert model.headerData(2, Qt.Horizontal, Qt.DisplayRole) == "Status"
+    assert model.headerData(1, Qt.Vertical, Qt.DisplayRole) == "2"
+    qtmodeltester.check(model)
+
+
+def test_jobqueue_model_set_status(qtbot, qtmodeltester):
+    model = JobQueueModel()
+    for x in range(3):
+        model.add_job(get_job(f"/tmp/instance-{x}.ttf"))
+    model.set_status(0, JobQueueModel.RUNNING)
+    model.set_status(1, JobQueueModel.DONE, duration=1.234, size=2048)
+    model.set_status(2, JobQueueModel.FAILED, duration=0.5, error="bad axis")
+    assert model.get_data()[0][2:] == ["Running", "", ""]
+    assert model.get_data()[1][2:] == ["Done", "1.23 s", "2.0 KB"]
+    assert model.get_data()[2][2:] == ["Failed", "0.50 s", ""]
+    assert model.get_status(2) == JobQueueModel.FAILED
+    assert model.data(model.index(2, 0), Qt.ToolTipRole) == "bad axis"
+    assert model.data(model.index(1, 0), Qt.ToolTipRole) is None
+    # only jobs that were not executed are queued
+    assert model.get_queued_jobs() == []
+    qtmodeltester.check(model)
+
+
+def test_jobqueue_model_clear(qtbot, qtmodeltester):
+    model = JobQueueModel()
+    model.add_job(get_job())
+    model.set_status(0, JobQueueModel.FAILED, error="bad axis")
+    model.clear()
+    assert model.jobs == []
+    assert model.errors == {}
+    assert model.rowCount(model.index(-1, -1)) == 0
+    qtmodeltester.check(model)
+
+
+def test_jobqueue_model_format_size():
+    model = JobQueueModel()
+    assert model.format_size(512) == "512 B"
+    assert model.format_size(1536) == "1.5 KB"
+    assert model.format_size(3 * 1024 * 1024) == "3.0 MB"
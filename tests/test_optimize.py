@@ -0,0 +1,105 @@
+import threading
+from io import BytesIO
+from pathlib import Path
+
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables import otTables
+import pytest
+
+from slice.engine import instantiate_variable_font
+from slice.fontsession import FontSession
+from slice.optimize import (
+    OPTIMIZE_LEVELS,
+    get_identity_varidx_map,
+    optimize_level,
+    validate_optimize_level,
+)
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def get_instance(axis_data, level):
+    ttfont = FontSession(get_font_path()).new_ttfont()
+    instantiate_variable_font(ttfont, axis_data, optimize=level)
+    buf = BytesIO()
+    ttfont.save(buf)
+    buf.seek(0)
+    return TTFont(buf)
+
+
+def test_validate_optimize_level():
+    for level in OPTIMIZE_LEVELS:
+        assert validate_optimize_level(level) == level
+    with pytest.raises(ValueError):
+        validate_optimize_level("fast")
+
+
+def test_optimize_level_restores_var_store_optimize():
+    saved_optimize = otTables.VarStore.optimize
+    with optimize_level("none") as iup:
+        assert iup is False
+        assert otTables.VarStore.optimize is not saved_optimize
+    assert otTables.VarStore.optimize is saved_optimize
+    with optimize_level("iup") as iup:
+        assert iup is True
+        assert otTables.VarStore.optimize is not saved_optimize
+    with optimize_level("full") as iup:
+        assert iup is True
+        assert otTables.VarStore.optimize is saved_optimize
+    assert otTables.VarStore.optimize is saved_optimize
+
+
+def test_optimize_level_is_thread_local(monkeypatch):
+    monkeypatch.setattr(otTables.VarStore, "optimize", lambda self: "optimized")
+    var_store = TTFont(get_font_path())["HVAR"].table.VarStore
+    results = []
+
+    def optimize():
+        results.append(var_store.optimize())
+
+    with optimize_level("none"):
+        thread = threading.Thread(target=optimize)
+        thread.start()
+        thread.join()
+        optimize()
+        # an instantiation in a thread at the full level runs concurrently
+        with optimize_level("full"):
+            optimize()
+    assert results[0] == "optimized"
+    assert results[1] == get_identity_varidx_map(var_store)
+    assert results[2] == "optimized"
+
+
+def test_get_identity_varidx_map():
+    ttfont = TTFont(get_font_path())
+    var_store = ttfont["HVAR"].table.VarStore
+    mapping = get_identity_varidx_map(var_store)
+    assert len(mapping) == sum(len(var_data.Item) for var_data in var_store.VarData)
+    assert all(key == value for key, value in mapping.items())
+
+
+def test_optimize_levels_trade_size():
+    sizes = {}
+    for level in OPTIMIZE_LEVELS:
+        ttfont = get_instance({"wght": 650.0}, level)
+        assert "wght" not in [axis.axisTag for axis in ttfont["fvar"].axes]
+        sizes[level] = len(ttfont.reader.file.getvalue())
+    assert sizes["none"] > sizes["iup"] >= sizes["full"]
+
+
+@pytest.mark.parametrize("level", ["none", "iup"])
+def test_optimize_levels_match_full_instance(level):
+    # the remaining axes are pinned to compare the instance output
+    location = {"MONO": 1.0, "CASL": 0.5, "slnt": -10.0, "CRSV": 1.0}
+    instances = []
+    for partial_level in (level, "full"):
+        partial = get_instance({"wght": 650.0}, partial_level)
+        instantiate_variable_font(partial, location)
+        buf = BytesIO()
+        partial.save(buf)
+        buf.seek(0)
+        instances.append(TTFont(buf))
+    for tag in ("glyf", "hmtx", "GDEF", "GPOS"):
+        assert instances[0].getTableData(tag) == instances[1].getTableData(tag), tag
@@ -0,0 +1,175 @@
+from pathlib import Path
+
+import pytest
+from fontTools.pens.recordingPen import RecordingPen
+from fontTools.ttLib import TTFont, TTLibError
+from fontTools.ttLib.tables._g_l_y_f import Glyph, GlyphComponent
+from fontTools.varLib import instancer
+
+from slice.fontsession import FontSession
+from slice.preview import (
+    PREVIEW_INSTANCE_TABLES,
+    PreviewFont,
+    get_text_glyphs,
+    new_preview_instance,
+    subset_preview_glyphs,
+)
+
+
+def get_font_path(extension="ttf"):
+    return str(Path(f"tests/assets/fonts/Recursive-VF.subset.{extension}").resolve())
+
+
+def get_preview_font(fontpath=None):
+    ttfont = TTFont(fontpath if fontpath else get_font_path(), lazy=True)
+    return PreviewFont(ttfont)
+
+
+def get_points(recording):
+    return [point for _, args in recording.value for point in args if point is not None]
+
+
+def test_preview_font_normalize_location():
+    preview_font = get_preview_font()
+    assert preview_font.normalize_location({}) == {}
+    assert preview_font.normalize_location({"wght": 300}) == {"wght": 0.0}
+    assert preview_font.normalize_location({"wght": 1000}) == {"wght": 1.0}
+    # clamped to the axis limits
+    assert preview_font.normalize_location({"wght": 2000}) == {"wght": 1.0}
+    assert preview_font.normalize_location({"slnt": -15}) == {"slnt": -1.0}
+    # not an fvar axis
+    assert preview_font.normalize_location({"ZZZZ": 1}) == {}
+    # non-finite values are at the default
+    assert preview_font.normalize_location({"wght": float("nan")}) == {}
+    assert preview_font.normalize_location({"wght": float("inf")}) == {}
+
+
+def test_preview_font_draw_text_matches_instancer():
+    for location in ({"wght": 300}, {"wght": 800, "CASL": 0.5, "slnt": -10}):
+        preview_font = get_preview_font()
+        pen = RecordingPen()
+        advance = preview_font.draw_text("a", location, pen)
+
+        instance = instancer.instantiateVariableFont(
+            TTFont(get_font_path()), dict(location)
+        )
+        instance_pen = RecordingPen()
+        instance.getGlyphSet()["a"].draw(instance_pen)
+
+        # the instancer rounds the coordinates to integers
+        points = get_points(pen)
+        instance_points = get_points(instance_pen)
+        assert len(points) == len(instance_points)
+        for (x, y), (instance_x, instance_y) in zip(points, instance_points):
+            assert abs(x - instance_x) <= 0.5
+            assert abs(y - instance_y) <= 0.5
+        assert round(advance) == instance["hmtx"]["a"][0]
+
+
+def test_preview_font_draw_text_advance():
+    preview_font = get_preview_font()
+    location = {"wght": 1000}
+    advance = preview_font.draw_text("a", location, RecordingPen())
+    assert preview_font.draw_text("aaa", location, RecordingPen()) == advance * 3
+    # the outlines of the second glyph are offset by the first advance
+    pen = RecordingPen()
+    preview_font.draw_text("aa", location, pen)
+    points = get_points(pen)
+    half = len(points) // 2
+    assert points[half][0] == pytest.approx(points[0][0] + advance)
+
+
+def test_preview_font_unmapped_character():
+    preview_font = get_preview_font()
+    # characters that are not in the cmap are drawn with .notdef
+    assert preview_font.get_glyph_name("a") == "a"
+    assert preview_font.get_glyph_name("Z") == preview_font.glyph_order[0]
+    preview_font.draw_text("Z", {"wght": 500}, RecordingPen())
+
+
+def test_preview_font_composite_glyph(tmpdir):
+    ttfont = TTFont(get_font_path())
+    # the tables are decompiled before the glyph order changes
+    glyf, gvar, hmtx = ttfont["glyf"], ttfont["gvar"], ttfont["hmtx"]
+    component = GlyphComponent()
+    component.glyphName = "a"
+    component.x, component.y = 100, 0
+    component.flags = 0
+    composite = Glyph()
+    composite.numberOfContours = -1
+    composite.components = [component]
+    glyf["a.offset"] = composite
+    hmtx.metrics["a.offset"] = hmtx.metrics["a"]
+    ttfont.setGlyphOrder(glyf.glyphOrder)
+    gvar.variations["a.offset"] = []
+    fontpath = str(tmpdir.join("composite.ttf"))
+    ttfont.save(fontpath)
+
+    preview_font = get_preview_font(fontpath)
+    normalized = preview_font.normalize_location({"wght": 1000})
+    pen = RecordingPen()
+    composite_pen = RecordingPen()
+    advance = preview_font.draw_glyph("a", normalized, pen)
+    composite_advance = preview_font.draw_glyph("a.offset", normalized, composite_pen)
+    assert composite_advance == advance
+    for (x, y), (composite_x, composite_y) in zip(
+        get_points(pen), get_points(composite_pen)
+    ):
+        assert composite_x == pytest.approx(x + 100)
+        assert composite_y == pytest.approx(y)
+
+
+def test_preview_font_requires_glyf():
+    ttfont = TTFont(get_font_path())
+    del ttfont["glyf"]
+    with pytest.raises(TTLibError):
+        PreviewFont(ttfont)
+
+
+def test_get_text_glyphs():
+    ttfont = TTFont(get_font_path())
+    assert get_text_glyphs(ttfont, "") == {".notdef"}
+    # characters that are not in the cmap are not drawn
+    assert get_text_glyphs(ttfont, "aaZ") == {".notdef", "a"}
+
+
+def test_subset_preview_glyphs():
+    ttfont = TTFont(get_font_path(), lazy=True)
+    ttfont.lazy = None
+    subset_preview_glyphs(ttfont, {".notdef", "a"})
+    assert ttfont.getGlyphOrder() == [".notdef", "a"]
+    assert set(ttfont.keys()) - {"GlyphOrder"} <= set(PREVIEW_INSTANCE_TABLES)
+    assert "GSUB" not in ttfont
+    assert set(ttfont["gvar"].variations) <= {".notdef", "a"}
+    assert ttfont.getBestCmap() == {ord("a"): "a"}
+
+
+def test_new_preview_instance_matches_instancer():
+    session = FontSession(get_font_path())
+    location = {"wght": 800, "CASL": 0.5, "slnt": -10}
+    instance = new_preview_instance(session, "a", location)
+    assert instance.getGlyphOrder() == [".notdef", "a"]
+    assert "fvar" not in instance
+    assert "gvar" not in instance
+
+    # undefined axes are pinned at the default
+    axis_data = {
+        axis.axisTag: location.get(axis.axisTag, axis.defaultValue)
+        for axis in session.get_fvar_table().axes
+    }
+    full_instance = instancer.instantiateVariableFont(
+        TTFont(get_font_path()), axis_data
+    )
+    assert instance["glyf"]["a"].coordinates == full_instance["glyf"]["a"].coordinates
+    assert instance["hmtx"]["a"] == full_instance["hmtx"]["a"]
+    # drawn at the default location
+    assert PreviewFont(instance).draw_text("a", {}, RecordingPen()) == (
+        full_instance["hmtx"]["a"][0]
+    )
+
+
+def test_new_preview_instance_clamps_location():
+    session = FontSession(get_font_path())
+    instance = new_preview_instance(session, "a", {"wght": 5000})
+    heavy_instance = new_preview_instance(session, "a", {"wght": 1000})
+    assert instance["glyf"]["a"].coordinates == heavy_instance["glyf"]["a"].coordinates
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+from fontTools.ttLib import TTLibError
+from PyQt5.QtCore import pyqtBoundSignal
+
+import slice.previewworker
+from slice.models import FontModel
+from slice.preview import PreviewFont
+from slice.previewworker import (
+    PreviewFontWorker,
+    PreviewFontWorkerSignals,
+    PreviewInstanceWorker,
+)
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def run_preview_font_worker(worker):
+    emitted = {"result": [], "finished": 0}
+    worker.signals.result.connect(lambda font: emitted["result"].append(font))
+
+    def finished():
+        emitted["finished"] += 1
+
+    worker.signals.finished.connect(finished)
+    worker.run()
+    return emitted
+
+
+def test_preview_font_worker_signals_instantiation():
+    pfws = PreviewFontWorkerSignals()
+    assert type(pfws.finished) is pyqtBoundSignal
+    assert type(pfws.result) is pyqtBoundSignal
+
+
+def test_preview_font_worker_result():
+    font_model = FontModel(get_font_path())
+    emitted = run_preview_font_worker(PreviewFontWorker(font_model))
+    assert emitted["finished"] == 1
+    assert emitted["result"] == [font_model._preview_font]
+    assert emitted["result"][0] is not None
+
+
+def test_preview_font_worker_without_outlines(monkeypatch):
+    font_model = FontModel(get_font_path())
+
+    def get_preview_font():
+        raise TTLibError("no glyf table")
+
+    monkeypatch.setattr(font_model, "get_preview_font", get_preview_font)
+    emitted = run_preview_font_worker(PreviewFontWorker(font_model))
+    assert emitted["result"] == [None]
+    assert emitted["finished"] == 1
+
+
+def test_preview_instance_worker_result():
+    font_model = FontModel(get_font_path())
+    emitted = run_preview_font_worker(
+        PreviewInstanceWorker(font_model, "a", {"wght": 700})
+    )
+    assert emitted["finished"] == 1
+    preview_font = emitted["result"][0]
+    assert isinstance(preview_font, PreviewFont)
+    # the instance is static
+    assert "fvar" not in preview_font.ttfont
+
+
+def test_preview_instance_worker_error(monkeypatch):
+    def new_preview_instance(*args):
+        raise ValueError("invalid location")
+
+    monkeypatch.setattr(
+        slice.previewworker, "new_preview_instance", new_preview_instance
+    )
+    font_model = FontModel(get_font_path())
+    emitted = run_preview_font_worker(
+        PreviewInstanceWorker(font_model, "a", {"wght": 700})
+    )
+    assert emitted["result"] == [None]
+    assert emitted["finished"] == 1
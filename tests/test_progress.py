@@ -0,0 +1,180 @@
+import json
+import logging
+import threading
+from pathlib import Path
+
+from fontTools.varLib import instancer
+
+from slice.engine import SliceJob, run_job
+from slice.fontsession import FontSession
+from slice.progress import (
+    DEFAULT_STAGE_WEIGHTS,
+    ProgressTracker,
+    format_progress,
+    get_expected_time,
+    get_stage_weights,
+    instancer_progress,
+    load_job_history,
+)
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def get_history_event(timings, font_size=1000, status="ok", cached=False):
+    return {
+        "status": status,
+        "cached": cached,
+        "timings": timings,
+        "total_time": sum(timings.values()),
+        "font_size": font_size,
+    }
+
+
+def test_load_job_history(tmpdir):
+    logpath = str(tmpdir.join("telemetry.jsonl"))
+    with open(logpath, "w") as f:
+        f.write(json.dumps(get_history_event({"parse": 1.0})) + "\n")
+        f.write(json.dumps(get_history_event({"parse": 2.0}, status="error")) + "\n")
+        f.write(json.dumps(get_history_event({"cache": 0.1}, cached=True)) + "\n")
+        # interrupted write
+        f.write('{"status": "o')
+    events = load_job_history(logpath)
+    assert len(events) == 1
+    assert events[0]["timings"] == {"parse": 1.0}
+
+
+def test_load_job_history_missing_log(tmpdir):
+    assert load_job_history(str(tmpdir.join("missing.jsonl"))) == []
+    assert load_job_history(None) == []
+
+
+def test_get_stage_weights():
+    assert get_stage_weights([]) == DEFAULT_STAGE_WEIGHTS
+    events = [
+        get_history_event({"parse": 1.0, "instance": 2.0, "save": 1.0}),
+        get_history_event({"parse": 0.0, "instance": 3.0, "save": 1.0}),
+    ]
+    weights = get_stage_weights(events)
+    assert weights["parse"] == 0.125
+    assert weights["instance"] == 0.625
+    assert weights["save"] == 0.25
+    assert weights["names"] == 0.0
+
+
+def test_get_expected_time():
+    events = [
+        get_history_event({"instance": 1.0}, font_size=1000),
+        get_history_event({"instance": 3.0}, font_size=1000),
+    ]
+    assert get_expected_time(events, 2000) == 4.0
+    assert get_expected_time([], 2000) is None
+    assert get_expected_time(events, 0) is None
+
+
+def test_progress_tracker_reports():
+    reports = []
+    tracker = ProgressTracker(
+        reports.append, {"parse": 0.25, "instance": 0.5, "save": 0.25}
+    )
+    tracker.start_stage("parse", "reading")
+    tracker.start_stage("instance", "instancing")
+    tracker.update(0.5)
+    # unchanged percent and message are not reported
+    tracker.update(0.501)
+    tracker.update(0.5, "HVAR")
+    tracker.start_stage("save")
+    tracker.finish()
+
+    assert [(r["percent"], r["stage"], r["message"]) for r in reports] == [
+        (0, "parse", "reading"),
+        (25, "instance", "instancing"),
+        (50, "instance", "instancing"),
+        (50, "instance", "HVAR"),
+        (75, "save", "save"),
+        (100, None, "complete"),
+    ]
+    assert reports[-1]["eta"] == 0.0
+
+
+def test_progress_tracker_eta_from_history():
+    reports = []
+    tracker = ProgressTracker(reports.append, expected_time=60.0)
+    tracker.start_stage("parse")
+    assert 59.0 < reports[0]["eta"] <= 60.0
+    assert ProgressTracker(reports.append).get_eta(0.0, 1.0) is None
+    # observed rate after 10% of the job
+    assert tracker.get_eta(0.5, 10.0) == 10.0
+
+
+def test_progress_tracker_without_callback():
+    tracker = ProgressTracker()
+    tracker.start_stage("parse")
+    tracker.update(0.5)
+    tracker.finish()
+
+
+def test_format_progress():
+    report = {"percent": 42, "stage": "instance", "message": "HVAR", "eta": 3.4}
+    assert format_progress(report) == "[ 42%] instance: HVAR  ETA 3s"
+    report["eta"] = None
+    assert format_progress(report) == "[ 42%] instance: HVAR"
+
+
+def test_instancer_progress():
+    ttfont = FontSession(get_font_path()).new_ttfont()
+    logger = logging.getLogger("fontTools.varLib.instancer")
+    saved_level = logger.level
+    saved_instantiate_glyph = instancer._instantiateGvarGlyph
+    reports = []
+    with instancer_progress(ttfont, lambda *report: reports.append(report)):
+        instancer.instantiateVariableFont(ttfont, {"wght": 700}, inplace=True)
+
+    messages = [message for _, message in reports]
+    assert "glyf/gvar" in messages
+    assert "HVAR" in messages
+    assert "fvar" in messages
+    fractions = [fraction for fraction, _ in reports]
+    assert fractions == sorted(fractions)
+    # patches are restored
+    assert logger.level == saved_level
+    assert instancer._instantiateGvarGlyph is saved_instantiate_glyph
+    assert not logger.filters
+
+
+def test_instancer_progress_reports_the_calling_thread():
+    ttfont = FontSession(get_font_path()).new_ttfont()
+    reports = []
+
+    def instantiate():
+        other = FontSession(get_font_path()).new_ttfont()
+        instancer.instantiateVariableFont(other, {"wght": 300}, inplace=True)
+
+    with instancer_progress(ttfont, lambda *report: reports.append(report)):
+        # the instancing of another thread is not reported to this context
+        thread = threading.Thread(target=instantiate)
+        thread.start()
+        thread.join()
+        assert reports == []
+        instancer.instantiateVariableFont(ttfont, {"wght": 700}, inplace=True)
+    glyph_reports = [report for report in reports if report[1] == "glyf/gvar"]
+    # one start report and one report per glyph
+    assert len(glyph_reports) == len(ttfont.getGlyphOrder()) + 1
+
+
+def test_run_job_progress(tmpdir):
+    job = SliceJob(
+        get_font_path(),
+        str(tmpdir.join("test.ttf")),
+        {"wght": 700.0},
+        flavors=["ttf", "woff2"],
+    )
+    reports = []
+    run_job(job, progress=ProgressTracker(reports.append))
+    percents = [report["percent"] for report in reports]
+    assert percents == sorted(percents)
+    assert percents[-1] == 100
+    stages = {report["stage"] for report in reports}
+    assert {"parse", "instance", "names", "bits", "save"} <= stages
+    assert "wrote test.woff2" in [report["message"] for report in reports]
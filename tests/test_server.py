@@ -0,0 +1,278 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from fontTools.ttLib import TTFont
+
+import slice.server
+from slice.cache import InstanceCache
+from slice.server import ServiceError, SliceHTTPServer, SliceService
+
+
+def get_font_dir():
+    return str(Path("tests/assets/fonts").resolve())
+
+
+def get_font_name():
+    return "Recursive-VF.subset.ttf"
+
+
+@pytest.fixture
+def server(tmpdir):
+    service = SliceService(get_font_dir(), InstanceCache(str(tmpdir.join("cache"))))
+    # port 0 binds a free localhost port
+    server = SliceHTTPServer(service, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def get_url(server, path):
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}{path}"
+
+
+def http_get(server, path):
+    """Returns the (status, headers, body) of a localhost GET request."""
+    try:
+        with urllib.request.urlopen(get_url(server, path), timeout=30) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def test_server_slice(server):
+    status, headers, body = http_get(
+        server, f"/slice?font={get_font_name()}&wght=450&format=woff2"
+    )
+    assert status == 200
+    assert headers["Content-Type"] == "font/woff2"
+    assert headers["X-Slice-Cache"] == "miss"
+    ttfont = TTFont(BytesIO(body))
+    assert ttfont.flavor == "woff2"
+    # the undefined slnt, CASL, CRSV and MONO axes remain variable
+    assert "wght" not in [axis.axisTag for axis in ttfont["fvar"].axes]
+
+    status, headers, cached_body = http_get(
+        server, f"/slice?font={get_font_name()}&wght=450.0&format=woff2"
+    )
+    assert status == 200
+    assert headers["X-Slice-Cache"] == "hit"
+    assert cached_body == body
+
+
+def test_server_slice_formats(server):
+    status, headers, body = http_get(
+        server, f"/slice?font={get_font_name()}&wght=700&slnt=-15:0&format=ttf"
+    )
+    assert status == 200
+    assert headers["Content-Type"] == "font/ttf"
+    axes = {axis.axisTag: axis for axis in TTFont(BytesIO(body))["fvar"].axes}
+    assert "wght" not in axes
+    assert (axes["slnt"].minValue, axes["slnt"].maxValue) == (-15.0, 0.0)
+
+
+def test_server_errors(server):
+    for path, expected_status in (
+        ("/slice?wght=450", 400),
+        ("/slice?font=missing.ttf", 404),
+        (f"/slice?font=../fonts/{get_font_name()}", 200),
+        ("/slice?font=../../setup.py", 404),
+        (f"/slice?font={get_font_name()}&format=otf", 400),
+        (f"/slice?font={get_font_name()}&optimize=max", 400),
+        (f"/slice?font={get_font_name()}&wght=heavy", 400),
+        (f"/slice?font={get_font_name()}&wdth=100", 400),
+        ("/instances", 404),
+    ):
+        status, headers, body = http_get(server, path)
+        assert status == expected_status, path
+        if status != 200:
+            assert headers["Content-Type"] == "application/json"
+            assert json.loads(body)["error"]
+
+
+def test_server_metrics(server):
+    http_get(server, f"/slice?font={get_font_name()}&wght=450")
+    http_get(server, f"/slice?font={get_font_name()}&wght=450")
+    http_get(server, "/slice?font=missing.ttf")
+    status, headers, body = http_get(server, "/metrics")
+    assert status == 200
+    metrics = json.loads(body)
+    assert metrics["requests"] == 3
+    assert metrics["errors"] == 1
+    assert metrics["jobs"] == 2
+    assert metrics["cache_hits"] == 1
+    assert metrics["queue_depth"] == 0
+    assert metrics["waiting_requests"] == 0
+    assert metrics["latency"]["count"] == 2
+    assert metrics["latency"]["p95"] >= metrics["latency"]["p50"] > 0
+    assert metrics["cache"]["entries"] == 1
+    assert metrics["sessions"] == [str(Path(get_font_dir()) / get_font_name())]
+
+
+def test_service_coalesces_identical_requests(monkeypatch):
+    release = threading.Event()
+    calls = []
+    saved_run_job = slice.server.run_job
+
+    def blocking_run_job(job, session=None, cache=None):
+        calls.append(job)
+        release.wait(30)
+        return saved_run_job(job, session, cache)
+
+    monkeypatch.setattr(slice.server, "run_job", blocking_run_job)
+    service = SliceService(get_font_dir())
+    query = {"font": get_font_name(), "wght": "450", "format": "woff"}
+    responses = []
+
+    def request():
+        responses.append(service.slice(dict(query)))
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for _ in range(300):
+        if service.get_metrics()["waiting_requests"] == 4:
+            break
+        time.sleep(0.01)
+    metrics = service.get_metrics()
+    assert metrics["waiting_requests"] == 4
+    assert metrics["active_jobs"] == 1
+    # a different location waits on the worker
+    other = threading.Thread(target=service.slice, args=(dict(query, wght="500"),))
+    other.start()
+    for _ in range(300):
+        if service.get_metrics()["queue_depth"] == 1:
+            break
+        time.sleep(0.01)
+    assert service.get_metrics()["queue_depth"] == 1
+    release.set()
+    for thread in threads + [other]:
+        thread.join(30)
+    service.close()
+
+    assert len(calls) == 2
+    assert len(responses) == 4
+    assert len({response.data for response in responses}) == 1
+    assert sorted(response.coalesced for response in responses) == [
+        False,
+        True,
+        True,
+        True,
+    ]
+    metrics = service.get_metrics()
+    assert metrics["coalesced"] == 3
+    assert metrics["jobs"] == 2
+    assert metrics["waiting_requests"] == 0
+
+
+def test_service_reparses_modified_font(tmpdir):
+    fontpath = tmpdir.join("test.ttf")
+    for family_name in ("Before", "After Rewrite"):
+        ttfont = TTFont(str(Path(get_font_dir()) / get_font_name()))
+        ttfont["name"].setName(family_name, 1, 3, 1, 0x409)
+        ttfont.save(str(fontpath))
+        if family_name == "Before":
+            service = SliceService(str(tmpdir), InstanceCache(str(tmpdir.join("c"))))
+            session = service.get_session(str(fontpath))
+        response = service.slice({"font": "test.ttf", "wght": "450", "format": "ttf"})
+        instance = TTFont(BytesIO(response.data))
+        assert instance["name"].getDebugName(1) == family_name
+        # the rewritten source is a cache miss
+        assert response.cached is False
+    assert service.get_session(str(fontpath)) is not session
+    service.close()
+
+
+def test_service_session_pool(tmpdir):
+    font_path = Path(get_font_dir()) / get_font_name()
+    for name in ("a.ttf", "b.ttf"):
+        tmpdir.join(name).write_binary(font_path.read_bytes())
+    service = SliceService(str(tmpdir), max_sessions=1)
+    service.preload(["a.ttf"])
+    session = service.get_session(str(tmpdir.join("a.ttf")))
+    assert service.get_session(str(tmpdir.join("a.ttf"))) is session
+    service.slice({"font": "b.ttf", "wght": "450"})
+    # the least recently used session is released
+    assert service.get_metrics()["sessions"] == [str(tmpdir.join("b.ttf"))]
+    with pytest.raises(ServiceError) as excinfo:
+        service.preload(["c.ttf"])
+    assert excinfo.value.status == 404
+    service.close()
+
+
+def test_service_submit_error(monkeypatch):
+    service = SliceService(get_font_dir())
+    query = {"font": get_font_name(), "wght": "450"}
+    release = threading.Event()
+    errors = []
+
+    def failed_submit(*args):
+        release.wait(30)
+        raise RuntimeError("the executor is shut down")
+
+    def request():
+        try:
+            service.slice(dict(query))
+        except ServiceError as e:
+            errors.append(e.status)
+
+    monkeypatch.setattr(service, "submit", failed_submit)
+    threads = [threading.Thread(target=request) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for _ in range(300):
+        if service.get_metrics()["waiting_requests"] == 2:
+            break
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(30)
+    # the coalesced request does not wait on the unsubmitted job
+    assert errors == [500, 500]
+    assert service._pending == {}
+
+    monkeypatch.undo()
+    assert service.slice(dict(query)).data
+    service.close()
+
+
+def test_service_job_error(monkeypatch):
+    def failed_run_job(job, session=None, cache=None):
+        raise ValueError("unexpected job error")
+
+    monkeypatch.setattr(slice.server, "run_job", failed_run_job)
+    service = SliceService(get_font_dir())
+    with pytest.raises(ServiceError) as excinfo:
+        service.slice({"font": get_font_name(), "wght": "450"})
+    # only the request validation errors are client errors
+    assert excinfo.value.status == 500
+    assert service._pending == {}
+    service.close()
+
+
+def test_service_static_font(tmpdir):
+    font_path = Path(get_font_dir()) / "Recursive-Sliced.subset.ttf"
+    tmpdir.join("static.ttf").write_binary(font_path.read_bytes())
+    for max_workers in (1, 2):
+        service = SliceService(str(tmpdir), max_workers=max_workers)
+        with pytest.raises(ServiceError) as excinfo:
+            service.slice({"font": "static.ttf", "wght": "450"})
+        assert excinfo.value.status == 400
+        service.close()
+
+
+def test_service_process_pool():
+    service = SliceService(get_font_dir(), max_workers=2)
+    response = service.slice({"font": get_font_name(), "wght": "450", "format": "ttf"})
+    axes = [axis.axisTag for axis in TTFont(BytesIO(response.data))["fvar"].axes]
+    assert "wght" not in axes
+    service.close()
@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import pytest
+from fontTools.ttLib import TTFont
+
+from slice.engine import SliceJob, run_job
+from slice.fontsession import FontSession
+from slice.shards import (
+    UNICODE_RANGE_SHARDS,
+    format_font_face_rule,
+    get_css_font_properties,
+    get_css_path,
+    get_shard_data,
+    get_shard_outpath,
+    get_shard_ranges,
+)
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def test_get_shard_ranges_names():
+    shard_ranges = get_shard_ranges("latin, cyrillic")
+    assert list(shard_ranges) == ["latin", "cyrillic"]
+    assert 0x61 in shard_ranges["latin"]
+    assert 0x0410 in shard_ranges["cyrillic"]
+    assert shard_ranges["latin"] == sorted(shard_ranges["latin"])
+    assert list(get_shard_ranges("all")) == list(UNICODE_RANGE_SHARDS)
+    assert list(get_shard_ranges(["greek"])) == ["greek"]
+
+
+def test_get_shard_ranges_custom():
+    shard_ranges = get_shard_ranges({"basic": "U+0061-0063", "euro": [0x20AC, 0x20AC]})
+    assert shard_ranges == {"basic": [0x61, 0x62, 0x63], "euro": [0x20AC]}
+    assert get_shard_data(shard_ranges) == {"basic": "U+0061-0063", "euro": "U+20AC"}
+
+
+def test_get_shard_ranges_invalid():
+    with pytest.raises(ValueError, match="not a unicode range shard"):
+        get_shard_ranges("latin,klingon")
+    with pytest.raises(ValueError, match="not a valid unicode range"):
+        get_shard_ranges({"basic": "U+ZZZZ"})
+    with pytest.raises(ValueError, match="at least one"):
+        get_shard_ranges({})
+
+
+def test_get_shard_paths():
+    assert get_shard_outpath("out/Test-Bold.ttf", "latin", "woff2") == str(
+        Path("out/Test-Bold.latin.woff2")
+    )
+    assert get_shard_outpath("out/Test-Bold.woff2", "kana", "ttf") == str(
+        Path("out/Test-Bold.kana.ttf")
+    )
+    assert get_css_path("out/Test-Bold.ttf") == str(Path("out/Test-Bold.css"))
+
+
+def test_format_font_face_rule():
+    rule = format_font_face_rule(
+        "basic",
+        "Test",
+        "700",
+        "normal",
+        [("Test.basic.woff2", "woff2"), ("Test.basic.ttf", "ttf")],
+        [0x61, 0x62, 0x63, 0x20AC],
+    )
+    assert 'font-family: "Test";' in rule
+    assert "font-weight: 700;" in rule
+    assert 'url("Test.basic.woff2") format("woff2")' in rule
+    assert 'url("Test.basic.ttf") format("truetype")' in rule
+    assert "unicode-range: U+0061-0063, U+20AC;" in rule
+
+
+def test_get_css_font_properties():
+    ttfont = TTFont(get_font_path())
+    family_name, font_weight, _ = get_css_font_properties(ttfont, {"wght": 650.0})
+    assert family_name == ttfont["name"].getDebugName(1)
+    assert font_weight == "650"
+    # the weight axis remains variable
+    _, font_weight, _ = get_css_font_properties(ttfont, {})
+    assert font_weight == "300 1000"
+
+
+def test_run_job_shards(tmpdir):
+    outpath = str(tmpdir.join("Test.ttf"))
+    job = SliceJob(
+        get_font_path(),
+        outpath,
+        {"wght": 700.0},
+        shards={"a": [0x61], "ab": [0x61, 0x62], "none": [0x0410]},
+    )
+    result = run_job(job, FontSession(get_font_path()))
+    assert result.outpaths == [
+        str(tmpdir.join("Test.a.woff2")),
+        str(tmpdir.join("Test.ab.woff2")),
+        str(tmpdir.join("Test.css")),
+    ]
+    # shards that the font does not map are not written
+    assert not tmpdir.join("Test.none.woff2").check()
+    shard = TTFont(str(tmpdir.join("Test.a.woff2")))
+    assert shard.flavor == "woff2"
+    assert list(shard.getBestCmap()) == [0x61]
+    css = tmpdir.join("Test.css").read()
+    assert css.count("@font-face") == 2
+    assert 'src: url("Test.a.woff2") format("woff2");' in css
+    # the unicode-range lists the mapped code points
+    assert "unicode-range: U+0061;" in css
+    assert "U+0062" not in css
+    assert "font-weight: 700;" in css
+
+
+def test_run_job_shards_unmapped(tmpdir):
+    job = SliceJob(
+        get_font_path(),
+        str(tmpdir.join("Test.ttf")),
+        {"wght": 700.0},
+        shards=["cyrillic"],
+    )
+    with pytest.raises(ValueError, match="does not map"):
+        run_job(job)
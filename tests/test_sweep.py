@@ -0,0 +1,156 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from slice.fontinspect import FontInspector
+from slice.sweep import (
+    SweepSpec,
+    expand_axis_values,
+    get_sweep_outpath,
+    iter_sweep_jobs,
+    iter_sweep_locations,
+    load_completed_outpaths,
+    load_sweep_spec,
+)
+from slice.telemetry import TelemetryLog, get_telemetry_event
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
+
+
+def get_sweep(tmpdir, axes, flavors=None):
+    return SweepSpec(get_font_path(), str(tmpdir), axes, flavors=flavors)
+
+
+def test_expand_axis_values_list():
+    assert expand_axis_values("wght", [300, 400.5]) == [300.0, 400.5]
+
+
+def test_expand_axis_values_range():
+    assert expand_axis_values("wght", {"start": 300, "stop": 500, "step": 50}) == [
+        300.0,
+        350.0,
+        400.0,
+        450.0,
+        500.0,
+    ]
+    # the stop value is included without float error
+    casual_values = expand_axis_values("CASL", {"start": 0, "stop": 1, "step": 0.1})
+    assert len(casual_values) == 11
+    assert casual_values[3] == 0.3
+    assert expand_axis_values("wght", {"start": 500, "stop": 300, "step": 50}) == []
+
+
+def test_expand_axis_values_invalid():
+    with pytest.raises(ValueError):
+        expand_axis_values("wght", {"start": 300, "stop": 500, "step": 0})
+    with pytest.raises(ValueError):
+        expand_axis_values("wght", {"start": 300, "stop": 500})
+    with pytest.raises(ValueError):
+        expand_axis_values("wght", ["bold"])
+
+
+def test_iter_sweep_locations_cartesian(tmpdir):
+    sweep = get_sweep(tmpdir, {"wght": [300, 700], "CASL": [0, 0.5, 1]})
+    locations = list(iter_sweep_locations(sweep, FontInspector(get_font_path())))
+    assert len(locations) == 6
+    assert locations[0] == {"wght": 300.0, "CASL": 0.0}
+    assert locations[-1] == {"wght": 700.0, "CASL": 1.0}
+
+
+def test_iter_sweep_locations_clamps_and_deduplicates(tmpdir):
+    # wght 200 and 1100 clamp to the 300 - 1000 axis limits
+    sweep = get_sweep(tmpdir, {"wght": [200, 300, 1000, 1100]})
+    locations = list(iter_sweep_locations(sweep, FontInspector(get_font_path())))
+    assert locations == [{"wght": 300.0}, {"wght": 1000.0}]
+
+
+def test_iter_sweep_locations_deduplicates_after_avar(tmpdir):
+    # the flat avar slnt segment maps -15 and -14.5 to the same coordinate
+    sweep = get_sweep(tmpdir, {"slnt": [-15, -14.5, -10]})
+    locations = list(iter_sweep_locations(sweep, FontInspector(get_font_path())))
+    assert locations == [{"slnt": -15.0}, {"slnt": -10.0}]
+
+
+def test_iter_sweep_locations_invalid_axis(tmpdir):
+    sweep = get_sweep(tmpdir, {"wdth": [100]})
+    with pytest.raises(ValueError):
+        list(iter_sweep_locations(sweep, FontInspector(get_font_path())))
+
+
+def test_get_sweep_outpath(tmpdir):
+    sweep = get_sweep(tmpdir, {})
+    assert get_sweep_outpath(sweep, {"wght": 300.0, "CASL": 0.5}) == str(
+        tmpdir.join("Recursive-VF.subset-wght300-CASL0.5.ttf")
+    )
+    # locations that differ beyond 6 significant digits have distinct paths
+    assert get_sweep_outpath(sweep, {"wght": 300.0001}) != get_sweep_outpath(
+        sweep, {"wght": 300.0002}
+    )
+    assert get_sweep_outpath(sweep, {"wght": 1234567.0}) == str(
+        tmpdir.join("Recursive-VF.subset-wght1234567.0.ttf")
+    )
+
+
+def test_iter_sweep_jobs_skips_completed(tmpdir):
+    sweep = get_sweep(tmpdir, {"wght": [300, 700]})
+    jobs = list(iter_sweep_jobs(sweep))
+    assert [job.axis_data for job in jobs] == [{"wght": 300.0}, {"wght": 700.0}]
+    jobs = list(iter_sweep_jobs(sweep, {jobs[0].outpath}))
+    assert [job.axis_data for job in jobs] == [{"wght": 700.0}]
+
+
+def test_iter_sweep_jobs_skips_completed_flavors(tmpdir):
+    sweep = get_sweep(tmpdir, {"wght": [300]}, flavors=["woff", "woff2"])
+    job = list(iter_sweep_jobs(sweep))[0]
+    woff, woff2 = [outpath for outpath, _ in job.get_outputs()]
+    # all formats of a job must be written
+    assert len(list(iter_sweep_jobs(sweep, {woff}))) == 1
+    assert list(iter_sweep_jobs(sweep, {woff, woff2})) == []
+
+
+def test_load_completed_outpaths(tmpdir):
+    logpath = str(tmpdir.join("sweep.jsonl"))
+    written = tmpdir.join("written.ttf")
+    written.write_binary(b"font")
+    log = TelemetryLog(logpath)
+    log.write(get_telemetry_event(get_font_path(), [str(written)], {"save": 0.1}))
+    log.write(
+        get_telemetry_event(
+            get_font_path(), [str(tmpdir.join("failed.ttf"))], {}, error="failed"
+        )
+    )
+    # logged as written but since deleted
+    log.write(
+        get_telemetry_event(get_font_path(), [str(tmpdir.join("deleted.ttf"))], {})
+    )
+    with open(logpath, "a") as f:
+        f.write('{"status": "ok", "outp')
+    assert load_completed_outpaths(logpath) == {str(written)}
+    assert load_completed_outpaths(str(tmpdir.join("missing.jsonl"))) == set()
+
+
+def test_load_sweep_spec(tmpdir):
+    specpath = tmpdir.join("sweep.json")
+    specpath.write(
+        json.dumps(
+            {
+                "font": get_font_path(),
+                "outdir": "out",
+                "axes": {"wght": {"start": 300, "stop": 400, "step": 100}},
+                "flavors": ["woff2"],
+                "compression": {"woff": "zlib-fast"},
+                "subset": {"unicodes": "U+0061"},
+            }
+        )
+    )
+    sweep = load_sweep_spec(str(specpath))
+    assert sweep.subset.unicodes == [0x61]
+    assert all(job.subset is sweep.subset for job in iter_sweep_jobs(sweep))
+    assert sweep.fontpath == get_font_path()
+    assert sweep.outdir == str(tmpdir.join("out"))
+    assert sweep.flavors == ["woff2"]
+    assert sweep.compression.woff == "zlib-fast"
+    assert sweep.get_log_path() == str(tmpdir.join("out", "sweep.jsonl"))
@@ -0,0 +1,105 @@
+import json
+import os
+import sys
+
+from slice.telemetry import (
+    TelemetryLog,
+    get_output_sizes,
+    get_peak_rss,
+    get_telemetry_event,
+    read_telemetry_log,
+    read_telemetry_tail,
+)
+
+
+def test_get_peak_rss():
+    peak_rss = get_peak_rss()
+    if sys.platform == "win32":
+        assert peak_rss is None
+    else:
+        # more than 1 MB in a Python interpreter
+        assert peak_rss > 1024 * 1024
+
+
+def test_get_output_sizes(tmpdir):
+    outpath = str(tmpdir.join("test.ttf"))
+    with open(outpath, "wb") as f:
+        f.write(b"1234")
+    missing = str(tmpdir.join("missing.ttf"))
+    assert get_output_sizes([outpath, missing]) == {outpath: 4}
+
+
+def test_get_telemetry_event(tmpdir):
+    outpath = str(tmpdir.join("test.ttf"))
+    with open(outpath, "wb") as f:
+        f.write(b"1234")
+    event = get_telemetry_event(
+        "font.ttf", [outpath], {"parse": 0.25, "instance": 0.5}, process_peak_rss=2048
+    )
+    assert event["font"] == "font.ttf"
+    assert event["status"] == "ok"
+    assert event["error"] is None
+    assert event["cached"] is False
+    assert list(event["timings"]) == ["parse", "instance"]
+    assert event["total_time"] == 0.75
+    assert event["process_peak_rss"] == 2048
+    assert event["output_sizes"] == {outpath: 4}
+    # serializable as JSON
+    json.dumps(event)
+
+
+def test_get_telemetry_event_error():
+    event = get_telemetry_event("font.ttf", ["out.ttf"], {}, error=ValueError("bad"))
+    assert event["status"] == "error"
+    assert event["error"] == "bad"
+    assert event["output_sizes"] == {}
+
+
+def test_telemetry_log(tmpdir):
+    logpath = str(tmpdir.join("telemetry.jsonl"))
+    log = TelemetryLog(logpath)
+    log.write(get_telemetry_event("a.ttf", [], {"parse": 0.1}))
+    log.write(get_telemetry_event("b.ttf", [], {"parse": 0.2}))
+    with open(logpath) as f:
+        events = [json.loads(line) for line in f]
+    assert [event["font"] for event in events] == ["a.ttf", "b.ttf"]
+
+
+def test_read_telemetry_log(tmpdir):
+    logpath = str(tmpdir.join("telemetry.jsonl"))
+    log = TelemetryLog(logpath)
+    log.write(get_telemetry_event("a.ttf", [], {"parse": 0.1}))
+    with open(logpath, "a") as f:
+        f.write('{"font": "partial')
+    assert [event["font"] for event in read_telemetry_log(logpath)] == ["a.ttf"]
+    assert list(read_telemetry_log(str(tmpdir.join("missing.jsonl")))) == []
+
+
+def test_read_telemetry_tail(tmpdir):
+    logpath = str(tmpdir.join("telemetry.jsonl"))
+    log = TelemetryLog(logpath)
+    for i in range(50):
+        log.write(get_telemetry_event(f"{i}.ttf", [], {"parse": 0.1}))
+    # blocks that split lines
+    events = read_telemetry_tail(logpath, 10, block_size=100)
+    assert [event["font"] for event in events] == [f"{i}.ttf" for i in range(40, 50)]
+    events = read_telemetry_tail(logpath, 100, block_size=100)
+    assert len(events) == 50
+    with open(logpath, "a") as f:
+        f.write('{"font": "partial')
+    events = read_telemetry_tail(logpath, 2)
+    assert [event["font"] for event in events] == ["49.ttf"]
+    assert read_telemetry_tail(str(tmpdir.join("missing.jsonl")), 10) == []
+
+
+def test_telemetry_log_rotates(tmpdir):
+    logpath = str(tmpdir.join("telemetry.jsonl"))
+    log = TelemetryLog(logpath, max_size=2000)
+    for i in range(20):
+        log.write(get_telemetry_event(f"{i}.ttf", [], {"parse": 0.1}))
+        # the log is rotated by the write that exceeds the size
+        assert not os.path.isfile(logpath) or os.path.getsize(logpath) <= 2000
+    events = list(read_telemetry_log(f"{logpath}.1")) + list(
+        read_telemetry_log(logpath)
+    )
+    assert events[-1]["font"] == "19.ttf"
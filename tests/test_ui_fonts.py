@@ -0,0 +1,27 @@
+from PyQt5.QtGui import QFont
+
+from slice.ui import fonts
+from slice.ui.fonts import get_ibmplex_mono_font, get_recursive_font, get_ui_font
+
+
+def test_ui_font_files_exist():
+    assert (fonts.UI_FONT_DIR / "RecursiveSans-Slice_mod.subset.ttf").is_file()
+    assert (fonts.UI_FONT_DIR / "IBMPlexMono-Regular.ttf").is_file()
+
+
+def test_ui_fonts_load_on_request(qtbot):
+    ibmplex = get_ibmplex_mono_font()
+    assert type(ibmplex) is QFont
+    assert ibmplex.family() == "IBM Plex Mono"
+    assert "IBMPlexMono-Regular.ttf" in fonts._ui_font_families
+    assert type(get_recursive_font()) is QFont
+
+
+def test_ui_fonts_register_once(qtbot, monkeypatch):
+    get_ibmplex_mono_font()
+
+    def fail(*args):
+        raise AssertionError("font file registered twice")
+
+    monkeypatch.setattr(fonts.QFontDatabase, "addApplicationFont", fail)
+    assert get_ui_font("IBMPlexMono-Regular.ttf").family() == "IBM Plex Mono"
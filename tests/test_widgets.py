@@ -1,7 +1,17 @@
+from pathlib import Path
+
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtTest import QTest
 
-from slice.ui.widgets import DragDropLineEdit
+from fontTools.ttLib import TTFont
+
+from slice.models import FontModel
+from slice.preview import PreviewFont
+from slice.ui.widgets import PREVIEW_DEBOUNCE_MS, DragDropLineEdit, PreviewWidget
+
+
+def get_font_path():
+    return str(Path("tests/assets/fonts/Recursive-VF.subset.ttf").resolve())
 
 
 def test_drag_drop_line_edit(qtbot):
@@ -22,3 +32,108 @@ def test_drag_drop_line_edit(qtbot):
     assert widget2.text() == ""
     QTest.keyClicks(widget2, "test")
     assert widget2.text() == "test"
+
+
+def test_preview_widget(qtbot):
+    widget = PreviewWidget()
+    qtbot.addWidget(widget)
+    widget.resize(400, 100)
+    # no font loaded
+    widget.set_text("aaa")
+    widget.build_path()
+    assert widget.path.isEmpty() is True
+    assert widget.advance == 0
+
+    widget.set_preview_font(PreviewFont(TTFont(get_font_path(), lazy=True)))
+    widget.set_location({"wght": 300})
+    widget.build_path()
+    assert widget.path.isEmpty() is False
+    assert widget.advance > 0
+    widget.show()
+    widget.repaint()
+
+
+def test_preview_widget_debounce(qtbot):
+    widget = PreviewWidget()
+    qtbot.addWidget(widget)
+    widget.set_preview_font(PreviewFont(TTFont(get_font_path(), lazy=True)))
+    widget.set_text("a")
+    builds = []
+    widget.timer.timeout.connect(lambda: builds.append(dict(widget.location)))
+    # a burst of location changes builds the outlines one time
+    for weight in range(300, 1001, 100):
+        widget.set_location({"wght": weight})
+    qtbot.wait(PREVIEW_DEBOUNCE_MS * 5)
+    assert builds == [{"wght": 1000}]
+    assert widget.path.isEmpty() is False
+
+
+def test_preview_widget_instance(qtbot):
+    widget = PreviewWidget()
+    qtbot.addWidget(widget)
+    widget.set_preview_font(PreviewFont(TTFont(get_font_path(), lazy=True)))
+    widget.set_text("a")
+    widget.set_location({"wght": 900})
+    widget.build_path()
+    advance = widget.advance
+    path = widget.path
+
+    # drawn from a preview instance at the same location
+    widget.set_font_model(FontModel(get_font_path()))
+    widget.set_use_instance(True)
+    widget.build_path()
+    # the instance is built in a worker thread
+    qtbot.waitUntil(lambda: widget.instance_worker is None, timeout=30000)
+    assert widget.drawn_font is not widget.preview_font
+    assert widget.advance == round(advance)
+    assert widget.path.isEmpty() is False
+    assert abs(widget.path.boundingRect().width() - path.boundingRect().width()) <= 1
+
+
+def test_preview_widget_invalid_location(qtbot, monkeypatch):
+    widget = PreviewWidget()
+    qtbot.addWidget(widget)
+    preview_font = PreviewFont(TTFont(get_font_path(), lazy=True))
+    widget.set_preview_font(preview_font)
+    widget.set_text("a")
+    widget.set_location({"wght": float("nan")})
+    widget.build_path()
+    assert widget.path.isEmpty() is False
+
+    def draw_text(*args):
+        raise ValueError("invalid location")
+
+    # a location that can not be drawn clears the preview
+    monkeypatch.setattr(preview_font, "draw_text", draw_text)
+    widget.build_path()
+    assert widget.path.isEmpty() is True
+    assert widget.drawn_font is None
+    assert widget.advance == 0
+
+
+def test_preview_widget_instance_change_during_build(qtbot):
+    widget = PreviewWidget()
+    qtbot.addWidget(widget)
+    widget.set_preview_font(PreviewFont(TTFont(get_font_path(), lazy=True)))
+    widget.set_font_model(FontModel(get_font_path()))
+    widget.set_use_instance(True)
+    widget.set_text("a")
+    widget.set_location({"wght": 300})
+    widget.build_path()
+    worker = widget.instance_worker
+    assert worker is not None
+    # a location change during the build does not start a second build
+    widget.set_location({"wght": 1000})
+    widget.build_path()
+    assert widget.instance_worker is worker
+    qtbot.waitUntil(
+        lambda: widget.instance_worker is None and widget.drawn_font is not None,
+        timeout=30000,
+    )
+    bold_width = widget.path.boundingRect().width()
+
+    widget.set_use_instance(False)
+    widget.set_location({"wght": 1000})
+    widget.build_path()
+    # the outdated wght=300 instance is replaced by the wght=1000 instance
+    assert abs(widget.path.boundingRect().width() - bold_width) <= 1